@@ -27,7 +27,7 @@ Hash determinism:
 - Folder name uses 12-char short hash
 """
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
 from datetime import datetime
 
 from src.utils.datetime_utils import utc_now
@@ -73,6 +73,8 @@ STANDARD_FILES = {
     "pipeline_signature": "pipeline_signature.json",
     "events": "events.jsonl",  # Event log (JSON Lines format)
     "returns": "returns.json",  # Phase 4: Time-based analytics
+    "robustness": "robustness.json",  # Optional: Monte Carlo / bootstrap post-processor
+    "profile": "profile.json",  # Optional: per-phase timings (backtest run --profile)
     # Phase 3.2: Parquet is primary format for tabular artifacts
     "trades": "trades.parquet",
     "equity": "equity.parquet",
@@ -95,6 +97,8 @@ OPTIONAL_FILES = {
     "account_curve.parquet",
     "preflight_report.json",  # Optional when CLI runs its own preflight
     "returns.json",  # Phase 4: Time-based analytics (may not exist for short backtests)
+    "robustness.json",  # Written by the robustness post-processor on request
+    "profile.json",  # Written when the run is profiled (--profile / TRADE_PROFILE=1)
 }
 
 
@@ -992,6 +996,8 @@ class ResultsSummary:
     # Metadata
     artifact_path: str = ""
     run_duration_seconds: float = 0.0
+    peak_rss_mb: float | None = None  # Process peak resident memory (None: unsupported OS)
+    streaming: bool = False  # Memory-mapped feeds (backtest run --streaming)
     
     # Gate D required fields (for artifact validation)
     play_hash: str = ""
@@ -1103,6 +1109,8 @@ class ResultsSummary:
             # Metadata
             "artifact_path": self.artifact_path,
             "run_duration_seconds": round(self.run_duration_seconds, 2),
+            "peak_rss_mb": round(self.peak_rss_mb, 1) if self.peak_rss_mb is not None else None,
+            "streaming": self.streaming,
             # Gate D required fields
             "play_hash": self.play_hash,
             "pipeline_version": self.pipeline_version,
@@ -1151,6 +1159,24 @@ class ResultsSummary:
         """Write summary to JSON file (atomic: temp + replace)."""
         from src.utils.helpers import atomic_write_text
         atomic_write_text(path, json.dumps(self.to_dict(), indent=2, sort_keys=True))
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "ResultsSummary":
+        """
+        Rebuild a summary from its to_dict() form (e.g. a stored result.json).
+
+        Values are as written (rounded by to_dict()); unknown keys are ignored.
+        """
+        known = {f.name for f in fields(cls)}
+        kwargs = {k: v for k, v in data.items() if k in known}
+        kwargs["window_start"] = datetime.fromisoformat(data["window_start"])
+        kwargs["window_end"] = datetime.fromisoformat(data["window_end"])
+        return cls(**kwargs)
+
+    @classmethod
+    def load_json(cls, path: Path) -> "ResultsSummary":
+        """Load summary from a result.json file."""
+        return cls.from_dict(json.loads(path.read_text()))
     
     def print_summary(self) -> None:
         """Print comprehensive summary to console."""
@@ -1250,6 +1276,8 @@ class ResultsSummary:
         print(f"  Fees:        {self.total_fees_usdt:.2f} USDT")
         print("-" * 60)
         print(f"  Artifacts:   {self.artifact_path}")
+        if self.peak_rss_mb is not None:
+            print(f"  Peak RSS:    {self.peak_rss_mb:.0f} MB" + (" (streaming)" if self.streaming else ""))
         if self.play_hash or self.trades_hash or self.run_hash:
             print(f"  Play Hash:   {self.play_hash[:8] if self.play_hash else '--'}")
             print(f"  Trades Hash: {self.trades_hash[:8] if self.trades_hash else '--'}")
@@ -1268,6 +1296,8 @@ def compute_results_summary(
     equity_curve: list[dict[str, Any]],
     artifact_path: str = "",
     run_duration_seconds: float = 0.0,
+    peak_rss_mb: float | None = None,
+    streaming: bool = False,
     # Gate D required fields
     play_hash: str = "",
     pipeline_version: str = "",
@@ -1301,6 +1331,8 @@ def compute_results_summary(
         equity_curve: List of equity point dicts with equity field
         artifact_path: Path to artifact folder
         run_duration_seconds: Run duration
+        peak_rss_mb: Peak resident memory of the run's process in MB
+        streaming: Whether the run used memory-mapped (streamed) feeds
         play_hash: Play hash for determinism tracking
         pipeline_version: Pipeline version string
         resolved_play_path: Path where Play was loaded from
@@ -1321,6 +1353,8 @@ def compute_results_summary(
         run_id=run_id,
         artifact_path=artifact_path,
         run_duration_seconds=run_duration_seconds,
+        peak_rss_mb=peak_rss_mb,
+        streaming=streaming,
         play_hash=play_hash,
         pipeline_version=pipeline_version,
         resolved_play_path=resolved_play_path,
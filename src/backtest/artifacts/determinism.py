@@ -261,6 +261,7 @@ def verify_determinism_rerun(
         end=window_end,
         sync=sync,
         plays_dir=plays_dir,
+        use_cache=False,  # determinism check must actually re-execute
     )
     
     if not rerun_result.success:
@@ -0,0 +1,221 @@
+"""
+Run-result cache for identical backtests.
+
+A backtest is fully determined by its input hash (InputHashComponents: play
+hash, symbols, TFs, window, model versions), the data it reads and the engine
+code. When all three match an earlier successful run, the runner returns that
+run's artifact folder (result.json, trades.parquet, equity.parquet) instead of
+executing again.
+
+Cache key:
+- input_hash: InputHashComponents.compute_full_hash()
+- data fingerprint: SyntheticCandles.data_hash, or
+  HistoricalDataStore.data_fingerprint() for DuckDB runs
+- engine code version: sha256 over the import closure of the runner/engine
+  modules plus config/*.yml and numpy/pandas versions
+- run params not in the input hash (exact window timestamps, structure backend)
+
+Index: ``<artifacts_dir>/.result_cache.json`` maps artifact folder -> key,
+size and last use. Total size is bounded (BACKTEST_RESULT_CACHE_MAX_MB,
+default 2048); least-recently-used folders are deleted first. Only folders
+recorded in the index are ever evicted.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import platform
+import shutil
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+import pandas as pd
+
+from src.config.constants import PROJECT_ROOT
+from src.utils.helpers import atomic_write_text
+from src.utils.logger import get_module_logger
+from src.utils.source_hash import hash_file, source_version
+
+from .artifact_standards import STANDARD_FILES, ResultsSummary
+from .parquet_writer import read_parquet
+
+logger = get_module_logger(__name__)
+
+RESULT_CACHE_INDEX_FILE = ".result_cache.json"
+
+# Bump when the key recipe or index layout changes
+RESULT_CACHE_VERSION = 1
+
+DEFAULT_RESULT_CACHE_MAX_MB = 2048
+
+# Entry points of a backtest run; their import closure is the engine code version
+ENGINE_ENTRY_MODULES = ("src.backtest.runner", "src.backtest.engine_factory")
+
+_CACHED_FILES = (STANDARD_FILES["result"], STANDARD_FILES["trades"], STANDARD_FILES["equity"])
+
+_engine_code_version: str | None = None
+
+
+def engine_code_version() -> str:
+    """Hash of the engine source closure, shared config and numeric libraries (memoized)."""
+    global _engine_code_version
+    if _engine_code_version is None:
+        import numpy as np
+
+        config_dir = PROJECT_ROOT / "config"
+        config_files = sorted(config_dir.glob("*.yml")) if config_dir.exists() else []
+        parts = {
+            "sources": source_version(ENGINE_ENTRY_MODULES),
+            "config": {p.name: hash_file(p) for p in config_files},
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "pandas": pd.__version__,
+        }
+        serialized = json.dumps(parts, sort_keys=True)
+        _engine_code_version = hashlib.sha256(serialized.encode("utf-8")).hexdigest()
+    return _engine_code_version
+
+
+def compute_result_cache_key(
+    input_hash: str,
+    data_fingerprint: str,
+    params: dict[str, Any] | None = None,
+) -> str:
+    """
+    Cache key for a run.
+
+    Args:
+        input_hash: InputHashComponents full hash.
+        data_fingerprint: Content fingerprint of the candles/funding/OI read.
+        params: Run parameters not covered by input_hash (JSON-serializable).
+    """
+    parts = {
+        "version": RESULT_CACHE_VERSION,
+        "input_hash": input_hash,
+        "data": data_fingerprint,
+        "engine": engine_code_version(),
+        "params": params or {},
+    }
+    serialized = json.dumps(parts, sort_keys=True, default=str)
+    return hashlib.sha256(serialized.encode("utf-8")).hexdigest()
+
+
+@dataclass
+class CachedRun:
+    """Stored outputs of an earlier identical run."""
+    artifact_path: Path
+    summary: ResultsSummary
+    trades: pd.DataFrame
+    equity: pd.DataFrame
+
+
+def _folder_size(path: Path) -> int:
+    total = 0
+    for p in path.rglob("*"):
+        try:
+            if p.is_file():
+                total += p.stat().st_size
+        except OSError:
+            pass
+    return total
+
+
+class RunResultCache:
+    """
+    LRU index of cached run folders under an artifacts directory.
+
+    The index is re-read before every update and written atomically, so
+    concurrent runs (parallel backtests) can at worst drop each other's
+    newest entry, never corrupt the index.
+    """
+
+    def __init__(self, base_dir: Path, max_bytes: int | None = None):
+        self.base_dir = Path(base_dir)
+        self.index_path = self.base_dir / RESULT_CACHE_INDEX_FILE
+        if max_bytes is None:
+            max_mb = float(os.environ.get("BACKTEST_RESULT_CACHE_MAX_MB", DEFAULT_RESULT_CACHE_MAX_MB))
+            max_bytes = int(max_mb * 1024 * 1024)
+        self.max_bytes = max_bytes
+
+    # ── Index I/O ──
+
+    def _load(self) -> dict[str, dict[str, Any]]:
+        try:
+            raw = json.loads(self.index_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+        if raw.get("version") != RESULT_CACHE_VERSION:
+            return {}
+        return raw.get("entries", {})
+
+    def _save(self, entries: dict[str, dict[str, Any]]) -> None:
+        data = {"version": RESULT_CACHE_VERSION, "entries": entries}
+        try:
+            atomic_write_text(self.index_path, json.dumps(data, indent=2, sort_keys=True))
+        except OSError as e:
+            logger.debug("Result cache index write failed: %s", e)
+
+    def _folder(self, rel: str) -> Path:
+        return self.base_dir / rel
+
+    # ── Public API ──
+
+    def lookup(self, key: str) -> CachedRun | None:
+        """Return the stored run for ``key``, or None (stale entries are dropped)."""
+        entries = self._load()
+        for rel, entry in entries.items():
+            if entry.get("key") != key:
+                continue
+            folder = self._folder(rel)
+            try:
+                if not all((folder / name).is_file() for name in _CACHED_FILES):
+                    raise FileNotFoundError(folder)
+                cached = CachedRun(
+                    artifact_path=folder,
+                    summary=ResultsSummary.load_json(folder / STANDARD_FILES["result"]),
+                    trades=read_parquet(folder / STANDARD_FILES["trades"]),
+                    equity=read_parquet(folder / STANDARD_FILES["equity"]),
+                )
+            except (OSError, ValueError, KeyError) as e:
+                logger.debug("Dropping stale result cache entry %s: %s", rel, e)
+                entries.pop(rel)
+                self._save(entries)
+                return None
+            entry["last_used"] = time.time()
+            self._save(entries)
+            return cached
+        return None
+
+    def store(self, key: str, artifact_path: Path) -> None:
+        """Record a successful run folder under ``key``, then enforce the size bound."""
+        artifact_path = Path(artifact_path)
+        try:
+            rel = str(artifact_path.resolve().relative_to(self.base_dir.resolve()))
+        except ValueError:
+            logger.debug("Run folder %s is outside %s; not cached", artifact_path, self.base_dir)
+            return
+        entries = self._load()
+        entries[rel] = {
+            "key": key,
+            "last_used": time.time(),
+            "size_bytes": _folder_size(artifact_path),
+        }
+        self._evict(entries, keep=rel)
+        self._save(entries)
+
+    def _evict(self, entries: dict[str, dict[str, Any]], keep: str) -> None:
+        """Delete least-recently-used folders until the total fits max_bytes."""
+        total = sum(int(e.get("size_bytes", 0)) for e in entries.values())
+        for rel in sorted(entries, key=lambda r: entries[r].get("last_used", 0.0)):
+            if total <= self.max_bytes:
+                break
+            if rel == keep:
+                continue
+            total -= int(entries[rel].get("size_bytes", 0))
+            entries.pop(rel)
+            shutil.rmtree(self._folder(rel), ignore_errors=True)
+            logger.info("Result cache: evicted %s", rel)
@@ -20,11 +20,21 @@ Usage:
     # result.low_tf_feed, result.med_tf_feed, result.high_tf_feed
     # result.exec_feed  # property that resolves based on exec role
     # result.sim_exchange, result.incremental_state, result.prepared_frame
+
+Several builders can share one SharedDataCache (portfolio backtests): Plays
+with identical data requirements reuse the same read-only FeedStores, and
+1m quote feeds are shared per symbol and window. SimulatedExchange and
+structure state are always built per Play.
+
+streaming=True builds the feeds through engine_stream_prep instead:
+memory-mapped columns paged by a FeedPager under memory_budget_mb
+(result.feed_pager). Streaming builds are never shared.
 """
 
 from dataclasses import dataclass
 from datetime import datetime
-from typing import TYPE_CHECKING
+from time import perf_counter_ns
+from typing import TYPE_CHECKING, Any
 
 from .engine_data_prep import (
     PreparedFrame,
@@ -40,10 +50,13 @@ from .engine_feed_builder import (
     build_quote_feed_impl,
     build_market_data_arrays_impl,
 )
+from .engine_stream_prep import build_streaming_quote_feed_impl, prepare_streaming_feeds_impl
+from .runtime.feed_paging import DEFAULT_MEMORY_BUDGET_MB, FeedPager
 from .runtime.feed_store import FeedStore, MultiTFFeedStore
 from .sim.exchange import SimulatedExchange
 from .system_config import SystemConfig
 from src.structures.state import MultiTFIncrementalState, TFIncrementalState
+from src.utils.profiler import active_profiler, profile_span
 
 if TYPE_CHECKING:
     from .play.play import Play
@@ -82,12 +95,83 @@ class DataBuildResult:
     multi_tf_mode: bool
     tf_mapping: dict[str, str]  # {low_tf, med_tf, high_tf -> TF string, exec -> role}
 
+    # Streaming mode: pages the memory-mapped feeds as the runner steps
+    feed_pager: FeedPager | None = None
+
     @property
     def exec_feed(self) -> FeedStore:
         """Resolved exec feed based on exec role pointer."""
         return self.multi_tf_feed_store.exec_feed
 
 
+@dataclass
+class _SharedFeeds:
+    """Read-only feed components reusable across Plays."""
+
+    low_tf_feed: FeedStore
+    med_tf_feed: FeedStore | None
+    high_tf_feed: FeedStore | None
+    resolved_exec_feed: FeedStore
+    quote_feed: FeedStore | None
+    multi_tf_feed_store: MultiTFFeedStore
+    prepared_frame: PreparedFrame
+    multi_tf_frames: MultiTFPreparedFrames | None
+    feed_pager: FeedPager | None = None
+
+
+class SharedDataCache:
+    """
+    Feed cache shared by several DataBuilders in one process.
+
+    FeedStores are never written during a backtest run, so Plays whose
+    data requirements match (symbol, TF mapping, window, warmup, feature
+    specs, data source) can step on the same arrays. Keys are exact: any
+    difference in indicator specs or warmup builds separate feeds, which
+    keeps every Play's results identical to a standalone run.
+    """
+
+    def __init__(self) -> None:
+        self._feeds: dict[tuple, _SharedFeeds] = {}
+        self._quote_feeds: dict[tuple, FeedStore | None] = {}
+        self._synthetic: dict[tuple, Any] = {}
+        self.feed_hits = 0
+        self.feed_misses = 0
+        self.quote_hits = 0
+        self.quote_misses = 0
+
+    def get_synthetic_provider(self, key: tuple, factory) -> Any:
+        """Return the synthetic provider for key, creating it via factory() once."""
+        provider = self._synthetic.get(key)
+        if provider is None:
+            provider = factory()
+            self._synthetic[key] = provider
+        return provider
+
+    @property
+    def unique_feeds(self) -> int:
+        return len(self._feeds)
+
+    def to_dict(self) -> dict[str, int]:
+        return {
+            "unique_feed_sets": len(self._feeds),
+            "feed_hits": self.feed_hits,
+            "feed_misses": self.feed_misses,
+            "unique_quote_feeds": len(self._quote_feeds),
+            "quote_hits": self.quote_hits,
+            "quote_misses": self.quote_misses,
+        }
+
+
+def _feature_specs_key(specs_by_role: dict | None) -> tuple:
+    """Order-insensitive, hashable signature of feature specs per role."""
+    if not specs_by_role:
+        return ()
+    return tuple(sorted(
+        (role, tuple(sorted(repr(spec) for spec in specs)))
+        for role, specs in specs_by_role.items()
+    ))
+
+
 class DataBuilder:
     """
     Standalone data preparation builder.
@@ -104,6 +188,8 @@ class DataBuilder:
             play=play,
             tf_mapping=tf_mapping,
             synthetic_provider=synthetic_provider,
+            structure_backend="incremental",  # or "vectorized"
+            streaming=False,  # True: memory-mapped feeds under memory_budget_mb
         )
         result = builder.build()
     """
@@ -115,14 +201,45 @@ class DataBuilder:
         play: "Play",
         tf_mapping: dict[str, str],
         synthetic_provider: "SyntheticDataProvider | None" = None,
+        structure_backend: str = "incremental",
+        shared_cache: SharedDataCache | None = None,
+        streaming: bool = False,
+        memory_budget_mb: int = DEFAULT_MEMORY_BUDGET_MB,
     ):
+        from ..structures.vectorized import STRUCTURE_BACKENDS
+
+        if structure_backend not in STRUCTURE_BACKENDS:
+            raise ValueError(
+                f"Unknown structure backend: '{structure_backend}'\n"
+                "\n"
+                f"Fix: Use one of {', '.join(STRUCTURE_BACKENDS)}."
+            )
         self.config = config
         self.window = window
         self.play = play
         self.tf_mapping = tf_mapping
         self.synthetic_provider = synthetic_provider
+        self.structure_backend = structure_backend
+        self.shared_cache = shared_cache
+        self.streaming = streaming
+        self.memory_budget_mb = memory_budget_mb
         self._logger = None
 
+    def _feeds_key(self) -> tuple:
+        """Everything the feed build reads; equal keys build equal feeds."""
+        config = self.config
+        return (
+            config.symbol,
+            config.tf,
+            tuple(sorted(self.tf_mapping.items())),
+            self.window.start,
+            self.window.end,
+            tuple(sorted((config.warmup_bars_by_role or {}).items())),
+            _feature_specs_key(config.feature_specs_by_role),
+            config.data_build.env,
+            id(self.synthetic_provider) if self.synthetic_provider is not None else None,
+        )
+
     def build(self) -> DataBuildResult:
         """
         Build all data components for backtest.
@@ -144,10 +261,75 @@ class DataBuilder:
             tf_mapping["med_tf"] != low_tf_str
         )
 
+        # Steps 1-4: frames, FeedStores, quote feed, market data (shareable)
+        shared = self.shared_cache
+        if self.streaming:
+            # Mapped feeds belong to this run's pager: never shared
+            feeds = self._build_streaming_feeds(config, tf_mapping, multi_tf_mode)
+        elif shared is None:
+            feeds = self._build_feeds(config, tf_mapping, multi_tf_mode)
+        else:
+            feeds_key = self._feeds_key()
+            cached = shared._feeds.get(feeds_key)
+            if cached is None:
+                shared.feed_misses += 1
+                feeds = self._build_feeds(config, tf_mapping, multi_tf_mode)
+                shared._feeds[feeds_key] = feeds
+            else:
+                shared.feed_hits += 1
+                feeds = cached
+
+        prepared_frame = feeds.prepared_frame
+        multi_tf_frames = feeds.multi_tf_frames
+        multi_tf_feed_store = feeds.multi_tf_feed_store
+        low_tf_feed = feeds.low_tf_feed
+        med_tf_feed = feeds.med_tf_feed
+        high_tf_feed = feeds.high_tf_feed
+        resolved_exec_feed = feeds.resolved_exec_feed
+        quote_feed = feeds.quote_feed
+
+        # Step 5: Build SimulatedExchange
+        with profile_span("prep.sim_exchange"):
+            sim_exchange = self._build_sim_exchange(config)
+
+        # Step 6: Build incremental state for structures
+        with profile_span("prep.structures"):
+            incremental_state = self._build_incremental_state(config, tf_mapping)
+            if incremental_state is not None and self.structure_backend == "vectorized":
+                self._apply_vectorized_structures(
+                    incremental_state, tf_mapping, resolved_exec_feed, med_tf_feed, high_tf_feed
+                )
+
+        return DataBuildResult(
+            low_tf_feed=low_tf_feed,
+            med_tf_feed=med_tf_feed,
+            high_tf_feed=high_tf_feed,
+            quote_feed=quote_feed,
+            multi_tf_feed_store=multi_tf_feed_store,
+            sim_exchange=sim_exchange,
+            incremental_state=incremental_state,
+            prepared_frame=prepared_frame,
+            multi_tf_frames=multi_tf_frames,
+            warmup_bars=prepared_frame.warmup_bars,
+            sim_start_idx=prepared_frame.sim_start_index,
+            multi_tf_mode=multi_tf_mode,
+            tf_mapping=tf_mapping,
+            feed_pager=feeds.feed_pager,
+        )
+
+    def _build_feeds(
+        self,
+        config: SystemConfig,
+        tf_mapping: dict[str, str],
+        multi_tf_mode: bool,
+    ) -> _SharedFeeds:
+        """Steps 1-4 of build(): frames, FeedStores, quote feed, market data."""
         # Step 1: Prepare data frames (load data, compute indicators)
         prepared_frame: PreparedFrame
         multi_tf_frames: MultiTFPreparedFrames | None = None
 
+        prof = active_profiler()
+        t = perf_counter_ns() if prof is not None else 0
         if multi_tf_mode:
             multi_tf_frames = prepare_multi_tf_frames_impl(
                 config=config,
@@ -183,64 +365,140 @@ class DataBuilder:
                 logger=self._logger,
                 synthetic_provider=self.synthetic_provider,
             )
+        if prof is not None:
+            prof.lap("prep.frames", t)
 
         # Step 2: Build FeedStores (3-feed + exec role system)
-        multi_tf_feed_store, resolved_exec_feed, high_tf_feed, med_tf_feed = build_feed_stores_impl(
-            config=config,
-            tf_mapping=tf_mapping,
-            multi_tf_mode=multi_tf_mode,
-            multi_tf_frames=multi_tf_frames,
-            prepared_frame=prepared_frame,
-            data=prepared_frame.df,
-            logger=self._logger,
-        )
+        with profile_span("prep.feeds"):
+            multi_tf_feed_store, resolved_exec_feed, high_tf_feed, med_tf_feed = build_feed_stores_impl(
+                config=config,
+                tf_mapping=tf_mapping,
+                multi_tf_mode=multi_tf_mode,
+                multi_tf_frames=multi_tf_frames,
+                prepared_frame=prepared_frame,
+                data=prepared_frame.df,
+                logger=self._logger,
+            )
 
         # Extract low_tf_feed from multi_tf_feed_store
         low_tf_feed = multi_tf_feed_store.low_tf_feed
 
         # Step 3: Build quote feed (1m data)
-        quote_feed = self._build_quote_feed(config, prepared_frame)
+        with profile_span("prep.quote_feed"):
+            quote_feed = self._build_quote_feed(config, prepared_frame)
 
         # Step 4: Build market data (funding, OI) into exec feed
         # Skip DuckDB access for synthetic runs (no funding/OI data available)
         if self.synthetic_provider is None:
-            self._build_market_data(config, prepared_frame, resolved_exec_feed)
-
-        # Step 5: Build SimulatedExchange
-        sim_exchange = self._build_sim_exchange(config)
-
-        # Step 6: Build incremental state for structures
-        incremental_state = self._build_incremental_state(config, tf_mapping)
+            with profile_span("prep.market_data"):
+                self._build_market_data(config, prepared_frame, resolved_exec_feed)
 
-        return DataBuildResult(
+        return _SharedFeeds(
             low_tf_feed=low_tf_feed,
             med_tf_feed=med_tf_feed,
             high_tf_feed=high_tf_feed,
+            resolved_exec_feed=resolved_exec_feed,
             quote_feed=quote_feed,
             multi_tf_feed_store=multi_tf_feed_store,
-            sim_exchange=sim_exchange,
-            incremental_state=incremental_state,
             prepared_frame=prepared_frame,
             multi_tf_frames=multi_tf_frames,
-            warmup_bars=prepared_frame.warmup_bars,
-            sim_start_idx=prepared_frame.sim_start_index,
-            multi_tf_mode=multi_tf_mode,
-            tf_mapping=tf_mapping,
         )
 
+    def _build_streaming_feeds(
+        self,
+        config: SystemConfig,
+        tf_mapping: dict[str, str],
+        multi_tf_mode: bool,
+    ) -> _SharedFeeds:
+        """_build_feeds() over memory-mapped feeds paged by a FeedPager."""
+        pager = FeedPager(self.memory_budget_mb)
+
+        with profile_span("prep.frames"):
+            prepared_frame, multi_tf_feed_store = prepare_streaming_feeds_impl(
+                config=config,
+                window=self.window,
+                tf_mapping=tf_mapping,
+                multi_tf_mode=multi_tf_mode,
+                pager=pager,
+                logger=self._logger,
+                synthetic_provider=self.synthetic_provider,
+            )
+        resolved_exec_feed = multi_tf_feed_store.exec_feed
+
+        with profile_span("prep.quote_feed"):
+            quote_feed = build_streaming_quote_feed_impl(
+                symbol=config.symbol,
+                window_start=prepared_frame.requested_start,
+                window_end=prepared_frame.requested_end,
+                warmup_bars_1m=self._warmup_bars_1m(config, prepared_frame),
+                pager=pager,
+                data_env=config.data_build.env,
+                logger=self._logger,
+                synthetic_provider=self.synthetic_provider,
+            )
+
+        if self.synthetic_provider is None:
+            with profile_span("prep.market_data"):
+                self._build_market_data(config, prepared_frame, resolved_exec_feed)
+
+        assert resolved_exec_feed.close_ms is not None, "streamed feeds index by close_ms"
+        pager.set_exec(resolved_exec_feed.close_ms, resolved_exec_feed.tf)
+
+        return _SharedFeeds(
+            low_tf_feed=multi_tf_feed_store.low_tf_feed,
+            med_tf_feed=multi_tf_feed_store.med_tf_feed,
+            high_tf_feed=multi_tf_feed_store.high_tf_feed,
+            resolved_exec_feed=resolved_exec_feed,
+            quote_feed=quote_feed,
+            multi_tf_feed_store=multi_tf_feed_store,
+            prepared_frame=prepared_frame,
+            multi_tf_frames=None,
+            feed_pager=pager,
+        )
+
+    @staticmethod
+    def _warmup_bars_1m(config: SystemConfig, prepared_frame: PreparedFrame) -> int:
+        """1m warmup matching the exec TF warmup."""
+        from .runtime.timeframe import tf_duration
+
+        tf_minutes = tf_duration(config.resolved_exec_tf).total_seconds() / 60
+        return int(prepared_frame.warmup_bars * tf_minutes)
+
     def _build_quote_feed(
         self,
         config: SystemConfig,
         prepared_frame: PreparedFrame,
     ) -> FeedStore | None:
         """Build 1m quote feed for mark price proxy."""
-        from .runtime.timeframe import tf_duration
-
         # Compute 1m warmup (match exec TF warmup in 1m bars)
-        exec_tf = config.resolved_exec_tf
-        tf_minutes = tf_duration(exec_tf).total_seconds() / 60
-        warmup_bars_1m = int(prepared_frame.warmup_bars * tf_minutes)
+        warmup_bars_1m = self._warmup_bars_1m(config, prepared_frame)
+
+        shared = self.shared_cache
+        quote_key = (
+            config.symbol,
+            prepared_frame.requested_start,
+            prepared_frame.requested_end,
+            warmup_bars_1m,
+            config.data_build.env,
+            id(self.synthetic_provider) if self.synthetic_provider is not None else None,
+        )
+        if shared is not None and quote_key in shared._quote_feeds:
+            shared.quote_hits += 1
+            return shared._quote_feeds[quote_key]
 
+        quote_feed = self._load_quote_feed(config, prepared_frame, warmup_bars_1m)
+        if shared is not None:
+            shared.quote_misses += 1
+            shared._quote_feeds[quote_key] = quote_feed
+        return quote_feed
+
+    def _load_quote_feed(
+        self,
+        config: SystemConfig,
+        prepared_frame: PreparedFrame,
+        warmup_bars_1m: int,
+    ) -> FeedStore | None:
+        """Load 1m data and build the quote feed."""
         # Load 1m data
         df_1m = load_1m_data_impl(
             symbol=config.symbol,
@@ -316,6 +574,29 @@ class DataBuilder:
             risk_profile=config.risk_profile,
         )
 
+    def _apply_vectorized_structures(
+        self,
+        incremental_state: MultiTFIncrementalState,
+        tf_mapping: dict[str, str],
+        exec_feed: FeedStore,
+        med_tf_feed: FeedStore | None,
+        high_tf_feed: FeedStore | None,
+    ) -> None:
+        """Swap eligible structure detectors for precomputed vectorized outputs."""
+        from ..structures.vectorized import apply_vectorized_backend
+
+        feeds_by_tf: dict[str, FeedStore] = {}
+        if high_tf_feed is not None and "high_tf" in tf_mapping:
+            feeds_by_tf[tf_mapping["high_tf"]] = high_tf_feed
+        if med_tf_feed is not None and "med_tf" in tf_mapping:
+            feeds_by_tf[tf_mapping["med_tf"]] = med_tf_feed
+        feeds_by_tf[incremental_state.exec_tf] = exec_feed
+
+        switched = apply_vectorized_backend(incremental_state, feeds_by_tf)
+        if self._logger is not None:
+            summary = "; ".join(f"{tf}: {', '.join(keys)}" for tf, keys in switched.items())
+            self._logger.info(f"Vectorized structure backend: {summary or 'no eligible structures'}")
+
     def _build_incremental_state(
         self,
         config: SystemConfig,
@@ -254,6 +254,23 @@ def _apply_indicators_to_frame(
     )
 
 
+def _sim_start_columns(config: SystemConfig) -> list[str]:
+    """
+    Exec indicator columns that must be valid for the simulation to start.
+
+    Uses required_indicators from YAML (not all expanded outputs) to avoid
+    issues with mutually exclusive outputs like PSAR long/short or
+    SuperTrend long/short; falls back to every non-runtime-only output.
+    """
+    # SystemConfig.required_indicators_by_role and feature_specs_by_role are always defined
+    if config.required_indicators_by_role.get('exec'):
+        return list(config.required_indicators_by_role['exec'])
+    if config.feature_specs_by_role:
+        exec_specs = config.feature_specs_by_role.get('exec', [])
+        return get_validity_check_columns_from_specs(exec_specs)
+    return []  # Will fail validation
+
+
 def _compute_sim_start(
     df: pd.DataFrame,
     config: SystemConfig,
@@ -268,17 +285,8 @@ def _compute_sim_start(
     Returns:
         (sim_start_ts, sim_start_idx)
     """
-    # Get required indicator columns
-    if config.required_indicators_by_role.get('exec'):
-        required_cols = list(config.required_indicators_by_role['exec'])
-    elif config.feature_specs_by_role:
-        exec_specs = config.feature_specs_by_role.get('exec', [])
-        required_cols = get_validity_check_columns_from_specs(exec_specs)
-    else:
-        required_cols = []
-
     # Find first valid bar
-    first_valid_idx = find_first_valid_bar(df, required_cols)
+    first_valid_idx = find_first_valid_bar(df, _sim_start_columns(config))
     if first_valid_idx < 0:
         raise ValueError(
             f"No valid bars found for {config.symbol} {config.tf}. "
@@ -341,6 +349,163 @@ def _compute_sim_start(
     return sim_start_ts, sim_start_idx
 
 
+def _get_multi_tf_warmup_config(config: SystemConfig, multi_tf_mode: bool) -> tuple[int, int]:
+    """
+    Get multi-TF warmup configuration from SystemConfig.
+
+    Returns:
+        (warmup_bars, max_lookback)
+    """
+    # Use Preflight-computed warmup (CANONICAL source via warmup_bars_by_role)
+    # Engine MUST NOT compute warmup - FAIL LOUD if not set
+    warmup_bars_by_role = getattr(config, 'warmup_bars_by_role', {})
+    if not warmup_bars_by_role or 'exec' not in warmup_bars_by_role:
+        raise ValueError(
+            "MISSING_WARMUP_CONFIG: warmup_bars_by_role['exec'] not set for multi-TF mode. "
+            "Preflight gate must run first to compute warmup requirements. "
+            "Check that Preflight passed and Runner wired computed_warmup_requirements to SystemConfig."
+        )
+    warmup_bars = warmup_bars_by_role['exec']
+
+    # HighTF warmup - required for multi-TF mode, optional for single-TF
+    #
+    # FIX: Single-TF strategies only define warmup_bars_by_role['exec'].
+    # They don't have separate HighTF/MedTF roles, so 'high_tf' key won't exist.
+    # However, multi_tf_mode is False for single-TF, and all TF mappings
+    # point to the same timeframe (e.g., {'high_tf': '15m', 'med_tf': '15m', 'low_tf': '15m'}).
+    #
+    # Solution: Only require 'high_tf' warmup when actually in multi-TF mode.
+    # For single-TF, fall back to exec warmup (which covers all roles since
+    # they're all the same timeframe).
+    if 'high_tf' not in warmup_bars_by_role:
+        if multi_tf_mode:
+            # True multi-TF mode: high_tf warmup is required
+            raise ValueError(
+                "MISSING_WARMUP_CONFIG: warmup_bars_by_role['high_tf'] not set for multi-TF mode. "
+                "Preflight gate must compute warmup for HighTF role. "
+                "Check Play has high_tf TF config with warmup declared."
+            )
+        else:
+            # Single-TF mode: all roles map to same TF, use exec warmup
+            # No high_tf key needed - compute_data_window uses warmup_bars_by_role directly
+            pass
+
+    # max_lookback is the raw max warmup from specs (for indicator validation only)
+    # SystemConfig.feature_specs_by_role is always defined (default: empty dict)
+    exec_specs = config.feature_specs_by_role.get('exec', [])
+    max_lookback = get_warmup_from_specs(exec_specs) if exec_specs else 0
+
+    return warmup_bars, max_lookback
+
+
+def _specs_for_tf(config: SystemConfig, tf: str) -> list:
+    """
+    FeatureSpecs computed on a multi-TF frame.
+
+    feature_specs_by_role is keyed by TF string (e.g., "4h") NOT role
+    (e.g., "high_tf"): TF-specific specs first, then exec for
+    non-TF-specific features.
+    """
+    # SystemConfig.feature_specs_by_role is always defined (default: empty dict)
+    if not config.feature_specs_by_role:
+        raise ValueError(
+            f"No feature_specs_by_role in config for TF {tf}. "
+            "Play with declared FeatureSpecs is required."
+        )
+    return config.feature_specs_by_role.get(tf) or \
+        config.feature_specs_by_role.get('exec', [])
+
+
+def _compute_multi_tf_sim_start(
+    exec_tf_frame: pd.DataFrame,
+    config: SystemConfig,
+    tf_by_role: dict[str, str],
+    requested_start: datetime,
+    logger,
+) -> tuple[datetime, int]:
+    """
+    Compute multi-TF simulation start timestamp and ExecTF index.
+
+    Returns:
+        (sim_start_ts, sim_start_idx)
+    """
+    exec_tf = tf_by_role['exec']
+
+    # Find first valid bar in the exec frame where all indicators are ready
+    first_valid_idx = find_first_valid_bar(exec_tf_frame, _sim_start_columns(config))
+    if first_valid_idx < 0:
+        raise ValueError(
+            f"No valid bars found for {config.symbol} {exec_tf}. "
+            f"All indicator columns have NaN values."
+        )
+
+    first_valid_ts = exec_tf_frame.iloc[first_valid_idx]["timestamp"]
+
+    # Simulation starts at max(first_valid_bar, requested_start)
+    if first_valid_ts >= requested_start:
+        sim_start_ts = first_valid_ts
+        sim_start_idx = first_valid_idx
+    else:
+        mask = exec_tf_frame["timestamp"] >= requested_start
+        if not mask.any():
+            raise ValueError(
+                f"No data found at or after requested window start {requested_start}."
+            )
+        sim_start_idx = mask.idxmax()
+        sim_start_ts = exec_tf_frame.iloc[sim_start_idx]["timestamp"]
+
+    # =====================================================================
+    # DELAY BARS: Apply delay-only evaluation offset (closed-candle aligned)
+    # =====================================================================
+    # For multi-TF mode, compute max eval_start across all roles
+    delay_bars_by_role = getattr(config, 'delay_bars_by_role', {})
+
+    # Compute eval_start per role and take max
+    max_eval_start_ts = sim_start_ts
+    for role in ("exec", "low_tf", "med_tf", "high_tf"):
+        role_tf = tf_by_role[role]
+        delay_bars = delay_bars_by_role.get(role, 0)
+        if delay_bars > 0:
+            aligned_start = ceil_to_tf_close(sim_start_ts, role_tf)
+            delay_offset = tf_duration(role_tf) * delay_bars
+            role_eval_start = aligned_start + delay_offset
+            if role_eval_start > max_eval_start_ts:
+                max_eval_start_ts = role_eval_start
+
+    if max_eval_start_ts > sim_start_ts:
+        # Find the bar index at or after max_eval_start_ts
+        eval_mask = exec_tf_frame["timestamp"] >= max_eval_start_ts
+        if not eval_mask.any():
+            raise ValueError(
+                f"Not enough data for delay offset: eval would start at {max_eval_start_ts}, "
+                f"but data ends at {exec_tf_frame['timestamp'].iloc[-1]}."
+            )
+        eval_start_idx = eval_mask.idxmax()
+        eval_start_ts_actual = exec_tf_frame.iloc[eval_start_idx]["timestamp"]
+
+        logger.info(
+            f"Delay offset applied (multi-TF): "
+            f"sim_start={sim_start_ts} -> eval_start={eval_start_ts_actual}"
+        )
+
+        sim_start_ts = eval_start_ts_actual
+        sim_start_idx = eval_start_idx
+
+    # Validate enough data for simulation
+    sim_bars = len(exec_tf_frame) - sim_start_idx
+    if sim_bars < 10:
+        raise ValueError(
+            f"Insufficient simulation bars: got {sim_bars} bars after warm-up."
+        )
+
+    logger.info(
+        f"Multi-TF simulation start: {sim_start_ts} (bar {sim_start_idx}), "
+        f"{sim_bars} ExecTF bars available"
+    )
+
+    return sim_start_ts, sim_start_idx
+
+
 # =============================================================================
 # Main Prepare Function
 # =============================================================================
@@ -467,44 +632,7 @@ def prepare_multi_tf_frames_impl(
     exec_role = tf_mapping["exec"]  # "low_tf", "med_tf", or "high_tf"
     exec_tf = tf_mapping[exec_role]  # Resolve exec role to actual TF string
 
-    # Use Preflight-computed warmup (CANONICAL source via warmup_bars_by_role)
-    # Engine MUST NOT compute warmup - FAIL LOUD if not set
-    warmup_bars_by_role = getattr(config, 'warmup_bars_by_role', {})
-    if not warmup_bars_by_role or 'exec' not in warmup_bars_by_role:
-        raise ValueError(
-            "MISSING_WARMUP_CONFIG: warmup_bars_by_role['exec'] not set for multi-TF mode. "
-            "Preflight gate must run first to compute warmup requirements. "
-            "Check that Preflight passed and Runner wired computed_warmup_requirements to SystemConfig."
-        )
-    warmup_bars = warmup_bars_by_role['exec']
-
-    # HighTF warmup - required for multi-TF mode, optional for single-TF
-    #
-    # FIX: Single-TF strategies only define warmup_bars_by_role['exec'].
-    # They don't have separate HighTF/MedTF roles, so 'high_tf' key won't exist.
-    # However, multi_tf_mode is False for single-TF, and all TF mappings
-    # point to the same timeframe (e.g., {'high_tf': '15m', 'med_tf': '15m', 'low_tf': '15m'}).
-    #
-    # Solution: Only require 'high_tf' warmup when actually in multi-TF mode.
-    # For single-TF, fall back to exec warmup (which covers all roles since
-    # they're all the same timeframe).
-    if 'high_tf' not in warmup_bars_by_role:
-        if multi_tf_mode:
-            # True multi-TF mode: high_tf warmup is required
-            raise ValueError(
-                "MISSING_WARMUP_CONFIG: warmup_bars_by_role['high_tf'] not set for multi-TF mode. "
-                "Preflight gate must compute warmup for HighTF role. "
-                "Check Play has high_tf TF config with warmup declared."
-            )
-        else:
-            # Single-TF mode: all roles map to same TF, use exec warmup
-            # No high_tf key needed - compute_data_window uses warmup_bars_by_role directly
-            pass
-
-    # max_lookback is the raw max warmup from specs (for indicator validation only)
-    # SystemConfig.feature_specs_by_role is always defined (default: empty dict)
-    exec_specs = config.feature_specs_by_role.get('exec', [])
-    max_lookback = get_warmup_from_specs(exec_specs) if exec_specs else 0
+    warmup_bars, max_lookback = _get_multi_tf_warmup_config(config, multi_tf_mode)
 
     # Compute data window using centralized utility
     tf_by_role = {
@@ -516,7 +644,7 @@ def prepare_multi_tf_frames_impl(
     data_window = compute_data_window(
         window_start=window.start,
         window_end=window.end,
-        warmup_bars_by_role=warmup_bars_by_role,
+        warmup_bars_by_role=config.warmup_bars_by_role,
         tf_by_role=tf_by_role,
     )
     data_start = data_window.data_start
@@ -572,26 +700,9 @@ def prepare_multi_tf_frames_impl(
         df = df.sort_values("timestamp").reset_index(drop=True)
 
         # Apply indicators from Play FeatureSpecs for this TF
-        # Map TF back to role (low_tf/med_tf/high_tf) to get correct specs
-        tf_role = None
-        for role, role_tf in tf_mapping.items():
-            if role_tf == tf:
-                tf_role = role
-                break
-
-        # SystemConfig.feature_specs_by_role is always defined (default: empty dict)
-        # Note: feature_specs_by_role is keyed by TF string (e.g., "4h") NOT role (e.g., "high_tf")
-        if config.feature_specs_by_role:
-            # Try TF-specific specs first (e.g., "4h"), then exec for non-TF-specific features
-            specs = config.feature_specs_by_role.get(tf) or \
-                    config.feature_specs_by_role.get('exec', [])
-            if specs:
-                df = apply_feature_spec_indicators(df, specs)
-        else:
-            raise ValueError(
-                f"No feature_specs_by_role in config for TF {tf}. "
-                "Play with declared FeatureSpecs is required."
-            )
+        specs = _specs_for_tf(config, tf)
+        if specs:
+            df = apply_feature_spec_indicators(df, specs)
 
         # Add ts_close column for close detection
         tf_delta = tf_duration(tf)
@@ -610,88 +721,8 @@ def prepare_multi_tf_frames_impl(
     # Get the ExecTF frame for simulation stepping
     exec_tf_frame = frames[exec_tf]
 
-    # Find first valid bar in low_tf where all indicators are ready
-    # Use required_indicators from YAML (not all expanded outputs) to avoid
-    # issues with mutually exclusive outputs like PSAR long/short or SuperTrend long/short
-    # SystemConfig.required_indicators_by_role and feature_specs_by_role are always defined
-    if config.required_indicators_by_role.get('exec'):
-        required_cols = list(config.required_indicators_by_role['exec'])
-    elif config.feature_specs_by_role:
-        # Fallback to expanding all feature_specs if no required_indicators declared
-        exec_specs = config.feature_specs_by_role.get('exec', [])
-        required_cols = get_validity_check_columns_from_specs(exec_specs)
-    else:
-        required_cols = []  # Will fail validation
-
-    first_valid_idx = find_first_valid_bar(exec_tf_frame, required_cols)
-
-    if first_valid_idx < 0:
-        raise ValueError(
-            f"No valid bars found for {config.symbol} {exec_tf}. "
-            f"All indicator columns have NaN values."
-        )
-
-    first_valid_ts = exec_tf_frame.iloc[first_valid_idx]["timestamp"]
-
-    # Simulation starts at max(first_valid_bar, requested_start)
-    if first_valid_ts >= requested_start:
-        sim_start_ts = first_valid_ts
-        sim_start_idx = first_valid_idx
-    else:
-        mask = exec_tf_frame["timestamp"] >= requested_start
-        if not mask.any():
-            raise ValueError(
-                f"No data found at or after requested window start {requested_start}."
-            )
-        sim_start_idx = mask.idxmax()
-        sim_start_ts = exec_tf_frame.iloc[sim_start_idx]["timestamp"]
-
-    # =====================================================================
-    # DELAY BARS: Apply delay-only evaluation offset (closed-candle aligned)
-    # =====================================================================
-    # For multi-TF mode, compute max eval_start across all roles
-    delay_bars_by_role = getattr(config, 'delay_bars_by_role', {})
-
-    # Compute eval_start per role and take max
-    max_eval_start_ts = sim_start_ts
-    for role, role_tf in [("exec", exec_tf), ("low_tf", low_tf), ("med_tf", med_tf), ("high_tf", high_tf)]:
-        delay_bars = delay_bars_by_role.get(role, 0)
-        if delay_bars > 0:
-            aligned_start = ceil_to_tf_close(sim_start_ts, role_tf)
-            delay_offset = tf_duration(role_tf) * delay_bars
-            role_eval_start = aligned_start + delay_offset
-            if role_eval_start > max_eval_start_ts:
-                max_eval_start_ts = role_eval_start
-
-    if max_eval_start_ts > sim_start_ts:
-        # Find the bar index at or after max_eval_start_ts
-        eval_mask = exec_tf_frame["timestamp"] >= max_eval_start_ts
-        if not eval_mask.any():
-            raise ValueError(
-                f"Not enough data for delay offset: eval would start at {max_eval_start_ts}, "
-                f"but data ends at {exec_tf_frame['timestamp'].iloc[-1]}."
-            )
-        eval_start_idx = eval_mask.idxmax()
-        eval_start_ts_actual = exec_tf_frame.iloc[eval_start_idx]["timestamp"]
-
-        logger.info(
-            f"Delay offset applied (multi-TF): "
-            f"sim_start={sim_start_ts} -> eval_start={eval_start_ts_actual}"
-        )
-
-        sim_start_ts = eval_start_ts_actual
-        sim_start_idx = eval_start_idx
-
-    # Validate enough data for simulation
-    sim_bars = len(exec_tf_frame) - sim_start_idx
-    if sim_bars < 10:
-        raise ValueError(
-            f"Insufficient simulation bars: got {sim_bars} bars after warm-up."
-        )
-
-    logger.info(
-        f"Multi-TF simulation start: {sim_start_ts} (bar {sim_start_idx}), "
-        f"{sim_bars} ExecTF bars available"
+    sim_start_ts, sim_start_idx = _compute_multi_tf_sim_start(
+        exec_tf_frame, config, tf_by_role, requested_start, logger
     )
 
     # Create and return result
@@ -15,14 +15,17 @@ from pathlib import Path
 from collections.abc import Callable
 from typing import Any, TYPE_CHECKING, cast
 
+from ..utils.profiler import profile_span
+
 if TYPE_CHECKING:
-    from .data_builder import DataBuilder
+    from .data_builder import DataBuilder, SharedDataCache
     from .types import BacktestResult
     from .play import Play
     from .feature_registry import FeatureRegistry
     from .runtime.types import RuntimeSnapshot
     from .runtime.snapshot_view import RuntimeSnapshotView
     from ..core.risk_manager import Signal
+    from ..engine.runners.backtest_runner import BacktestResult as RunnerBacktestResult
     from ..forge.validation.synthetic_provider import SyntheticDataProvider
     from ..forge.validation.synthetic_data import PatternType
 
@@ -60,6 +63,10 @@ def create_engine_from_play(
     window_name: str = "run",
     data_env: str = "backtest",
     use_synthetic: bool = True,
+    structure_backend: str = "incremental",
+    shared_cache: "SharedDataCache | None" = None,
+    streaming: bool = False,
+    memory_budget_mb: int | None = None,
 ):
     """
     Create a PlayEngine from a Play with pre-built backtest components.
@@ -81,6 +88,15 @@ def create_engine_from_play(
         synthetic_provider: Optional SyntheticDataProvider for DB-free validation
         window_name: Window name for engine config (default: "run")
         data_env: Data environment ("backtest", "live") - determines DuckDB file
+        structure_backend: "incremental" (reference) or "vectorized" (precomputed
+            structure outputs for eligible detectors, see src/structures/vectorized.py)
+        shared_cache: Optional SharedDataCache so engines built for several Plays
+            reuse FeedStores (and synthetic data) with identical requirements
+        streaming: Stream the data window into memory-mapped feeds paged under
+            memory_budget_mb (see src/backtest/engine_stream_prep.py); results
+            are identical to an in-memory run
+        memory_budget_mb: Resident budget for streamed feeds (default:
+            DEFAULT_MEMORY_BUDGET_MB)
 
     Returns:
         PlayEngine with pre-built FeedStores, SimulatedExchange, and incremental state
@@ -89,6 +105,7 @@ def create_engine_from_play(
         ValueError: If Play is missing required sections (account)
     """
     from .data_builder import DataBuilder
+    from .runtime.feed_paging import DEFAULT_MEMORY_BUDGET_MB
     from .system_config import (
         SystemConfig,
         RiskProfileConfig,
@@ -268,15 +285,26 @@ def create_engine_from_play(
         required_tfs.add("1m")
 
         # Generate synthetic candles with auto-computed bars
-        candles = generate_synthetic_candles(
-            symbol=symbol,
-            timeframes=sorted(required_tfs),
-            bars_per_tf=synthetic_bars,
-            seed=42,
-            pattern=cast("PatternType", play.validation.pattern),
-            align_multi_tf=True,
-        )
-        synthetic_provider = SyntheticCandlesProvider(candles)
+        pattern = play.validation.pattern
+
+        def _make_provider():
+            candles = generate_synthetic_candles(
+                symbol=symbol,
+                timeframes=sorted(required_tfs),
+                bars_per_tf=synthetic_bars,
+                seed=42,
+                pattern=cast("PatternType", pattern),
+                align_multi_tf=True,
+            )
+            return SyntheticCandlesProvider(candles)
+
+        if shared_cache is not None:
+            synthetic_provider = shared_cache.get_synthetic_provider(
+                (symbol, tuple(sorted(required_tfs)), synthetic_bars, pattern, 42),
+                _make_provider,
+            )
+        else:
+            synthetic_provider = _make_provider()
 
     # Handle window defaults for synthetic provider mode
     if synthetic_provider is not None and (window_start is None or window_end is None):
@@ -356,6 +384,10 @@ def create_engine_from_play(
         play=play,
         tf_mapping=tf_mapping,
         synthetic_provider=synthetic_provider,
+        structure_backend=structure_backend,
+        shared_cache=shared_cache,
+        streaming=streaming,
+        memory_budget_mb=memory_budget_mb or DEFAULT_MEMORY_BUDGET_MB,
     )
     build_result = builder.build()
 
@@ -371,22 +403,24 @@ def create_engine_from_play(
     # Create unified PlayEngine with pre-built components via GATE 4 factory
     from src.engine.factory import create_backtest_engine as create_unified_engine
 
-    engine = create_unified_engine(
-        play=play,
-        feed_store=feed_store,
-        sim_exchange=sim_exchange,
-        high_tf_feed=high_tf_feed,
-        med_tf_feed=med_tf_feed,
-        quote_feed=quote_feed,
-        tf_mapping=tf_mapping,
-        incremental_state=incremental_state,
-        on_snapshot=on_snapshot,
-    )
+    with profile_span("prep.engine"):
+        engine = create_unified_engine(
+            play=play,
+            feed_store=feed_store,
+            sim_exchange=sim_exchange,
+            high_tf_feed=high_tf_feed,
+            med_tf_feed=med_tf_feed,
+            quote_feed=quote_feed,
+            tf_mapping=tf_mapping,
+            incremental_state=incremental_state,
+            on_snapshot=on_snapshot,
+        )
 
     # Store Play and config references for run_engine_with_play()
     engine._play = play
     engine._prepared_frame = build_result.prepared_frame  # type: ignore[attr-defined]  # For sim_start_idx access
     engine._multi_tf_mode = multi_tf_mode  # type: ignore[attr-defined]
+    engine._feed_pager = build_result.feed_pager  # type: ignore[attr-defined]  # Streaming runs only
 
     return engine
 
@@ -446,13 +480,31 @@ def run_engine_with_play(
     Returns:
         PlayBacktestResult with trades, equity curve, and metrics
     """
-    from .execution_validation import compute_play_hash
+    runner = build_backtest_runner(engine)
+
+    # Run the backtest via unified runner
+    backtest_result = runner.run()
+
+    return play_result_from_backtest(engine, play, backtest_result)
+
+
+def build_backtest_runner(
+    engine,
+    signal_gate: "Callable[[Signal], bool] | None" = None,
+):
+    """
+    Create a BacktestRunner over the engine's pre-built components.
+
+    Args:
+        engine: PlayEngine (created via create_engine_from_play)
+        signal_gate: Optional pre-execution signal check (see BacktestRunner)
+
+    Returns:
+        BacktestRunner ready to run() or begin()/step()/finish()
+    """
     from ..engine.runners import BacktestRunner
     from ..engine.adapters.backtest import BacktestDataProvider
 
-    # Import here to avoid circular import
-    PlayBacktestResult = _get_play_result_class()
-
     # Extract pre-built components from engine
     # FeedStore and SimulatedExchange were set up in create_engine_from_play()
     data_provider = engine._data_provider
@@ -465,15 +517,26 @@ def run_engine_with_play(
         sim_start_idx = engine._prepared_frame.sim_start_index
 
     # Create BacktestRunner with pre-built components
-    runner = BacktestRunner(
+    return BacktestRunner(
         engine=engine,
         feed_store=feed_store,
         sim_exchange=sim_exchange,
         sim_start_idx=sim_start_idx,
+        signal_gate=signal_gate,
+        feed_pager=getattr(engine, "_feed_pager", None),
     )
 
-    # Run the backtest via unified runner
-    backtest_result = runner.run()
+
+def play_result_from_backtest(
+    engine,
+    play: "Play",
+    backtest_result: "RunnerBacktestResult",
+) -> "PlayBacktestResult":
+    """Convert a runner BacktestResult to PlayBacktestResult."""
+    from .execution_validation import compute_play_hash
+
+    # Import here to avoid circular import
+    PlayBacktestResult = _get_play_result_class()
 
     # Use play_hash from engine if set (runner pipeline), otherwise compute
     play_hash = engine._play_hash or compute_play_hash(play)
@@ -23,6 +23,7 @@ from typing import TYPE_CHECKING, cast
 from .runtime.feed_store import (
     FeedStore, MultiTFFeedStore, _datetime_to_epoch_ms, _np_dt64_to_epoch_ms,
 )
+from .runtime.alignment import last_at_or_before, timestamps_to_ms
 from .runtime.quote_state import QuoteState
 from .indicators import get_required_indicator_columns_from_specs
 
@@ -359,36 +360,17 @@ def build_market_data_arrays_impl(
         # Sort funding events by timestamp
         funding_sorted = _sort_by_timestamp(funding_df)
 
-        # Convert funding timestamps to epoch ms for O(1) lookup
-        funding_ts_ms_to_rate: dict[int, float] = {}
-        for _, row in funding_sorted.iterrows():
-            dt = _to_naive_datetime(cast(datetime | np.datetime64 | pd.Timestamp, row["timestamp"]))
-            ts_ms = _datetime_to_epoch_ms(dt)
-            funding_ts_ms_to_rate[ts_ms] = float(row["funding_rate"])
-            funding_settlement_times.add(ts_ms)
-
-        # For each exec bar, find the last funding rate at or before ts_close
-        # Also mark which bars are funding settlement times
-        last_rate = 0.0
-        funding_idx = 0
-        funding_timestamps = funding_sorted["timestamp"].values
-        funding_rates = funding_sorted["funding_rate"].values
-
-        for i in range(n_bars):
-            # Get exec bar ts_close (normalized to tz-naive)
-            ts_close_dt = _to_naive_datetime(exec_feed.ts_close[i])
-
-            # Advance through funding events up to ts_close
-            while funding_idx < len(funding_timestamps):
-                funding_ts = _to_naive_datetime(cast(datetime | np.datetime64 | pd.Timestamp, funding_timestamps[funding_idx]))
-
-                if funding_ts <= ts_close_dt:
-                    last_rate = float(funding_rates[funding_idx])
-                    funding_idx += 1
-                else:
-                    break
-
-            funding_rate_arr[i] = last_rate
+        # Convert funding timestamps to epoch ms (settlement set for O(1) hot loop check)
+        funding_ts_ms = timestamps_to_ms(funding_sorted["timestamp"].values)
+        funding_settlement_times.update(int(ms) for ms in funding_ts_ms)
+
+        # For each exec bar, take the last funding rate at or before ts_close
+        # (0.0 before the first event)
+        exec_close_ms = timestamps_to_ms(exec_feed.ts_close)
+        funding_rates = funding_sorted["funding_rate"].to_numpy(dtype=np.float64)
+        last_idx = last_at_or_before(exec_close_ms, funding_ts_ms)
+        has_rate = last_idx >= 0
+        funding_rate_arr[has_rate] = funding_rates[last_idx[has_rate]]
 
         logger.info(
             f"Built funding rate array: {n_bars} bars, "
@@ -404,26 +386,11 @@ def build_market_data_arrays_impl(
         oi_sorted = _sort_by_timestamp(oi_df)
 
         # For each exec bar, forward-fill from last OI at or before ts_close
-        last_oi = 0.0
-        oi_idx = 0
-        oi_timestamps = oi_sorted["timestamp"].values
-        oi_values = oi_sorted["open_interest"].values
-
-        for i in range(n_bars):
-            # Get exec bar ts_close (normalized to tz-naive)
-            ts_close_dt = _to_naive_datetime(exec_feed.ts_close[i])
-
-            # Advance through OI records up to ts_close
-            while oi_idx < len(oi_timestamps):
-                oi_ts = _to_naive_datetime(cast(datetime | np.datetime64 | pd.Timestamp, oi_timestamps[oi_idx]))
-
-                if oi_ts <= ts_close_dt:
-                    last_oi = float(oi_values[oi_idx])
-                    oi_idx += 1
-                else:
-                    break
-
-            open_interest_arr[i] = last_oi
+        oi_ts_ms = timestamps_to_ms(oi_sorted["timestamp"].values)
+        oi_values = oi_sorted["open_interest"].to_numpy(dtype=np.float64)
+        last_idx = last_at_or_before(timestamps_to_ms(exec_feed.ts_close), oi_ts_ms)
+        has_oi = last_idx >= 0
+        open_interest_arr[has_oi] = oi_values[last_idx[has_oi]]
 
         logger.info(
             f"Built open interest array: {n_bars} bars, "
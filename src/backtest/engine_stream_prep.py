@@ -0,0 +1,454 @@
+"""
+Streaming data preparation for memory-bounded backtests.
+
+Builds the same FeedStores as engine_data_prep + engine_feed_builder
+without holding whole DataFrames in memory:
+
+- OHLCV is read in range queries of STREAM_CHUNK_BARS bars and appended
+  to memory-mapped columns (runtime/feed_paging.ColumnSpill)
+- Features are computed one FeatureSpec at a time, and each output column
+  is spilled before the next spec runs
+- FeedStores index the mapped columns through close_ms (no per-bar Python
+  dicts or sets), and a FeedPager keeps only a trailing window of them
+  resident while the backtest steps
+
+Every indicator still sees the whole series: recursive indicators (EMA,
+RMA, ...) cannot be recomputed bit-for-bit from overlapping chunks, so
+only the storage changes. Trades, equity and their hashes are identical
+to an in-memory run (debug streaming-parity).
+
+Runtime-only indicator columns (anchored VWAP / volume profile) stay
+in-memory arrays: the engine writes them while it steps.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import TYPE_CHECKING, cast
+
+import numpy as np
+import pandas as pd
+
+from .engine_data_prep import (
+    PreparedFrame,
+    _compute_data_windows,
+    _compute_multi_tf_sim_start,
+    _compute_sim_start,
+    _get_multi_tf_warmup_config,
+    _get_warmup_config,
+    _sim_start_columns,
+    _specs_for_tf,
+    _validate_inputs,
+)
+from .indicators import (
+    RUNTIME_ONLY_INDICATORS,
+    apply_feature_spec,
+    get_required_indicator_columns_from_specs,
+)
+from .runtime.feed_paging import STREAM_CHUNK_BARS, ColumnSpill, FeedPager
+from .runtime.feed_store import FeedStore, MultiTFFeedStore
+from .runtime.timeframe import tf_duration
+from .runtime.windowing import compute_data_window
+from .system_config import SystemConfig
+from ..config.constants import DataEnv
+from ..data.historical_data_store import get_historical_store
+from ..utils.logger import get_module_logger
+from ..utils.profiler import profile_span
+
+if TYPE_CHECKING:
+    from .types import WindowConfig
+    from src.forge.validation.synthetic_provider import SyntheticDataProvider
+
+
+@dataclass
+class _StreamedBars:
+    """OHLCV columns of one feed (memory-mapped)."""
+    ts_open: np.ndarray
+    ts_close: np.ndarray
+    open: np.ndarray
+    high: np.ndarray
+    low: np.ndarray
+    close: np.ndarray
+    volume: np.ndarray
+    close_ms: np.ndarray
+
+    @property
+    def length(self) -> int:
+        return self.close_ms.shape[0]
+
+    def input_frame(self) -> pd.DataFrame:
+        """Indicator input frame (the columns store.get_ohlcv() returns)."""
+        return pd.DataFrame({
+            "timestamp": self.ts_open,
+            "open": self.open,
+            "high": self.high,
+            "low": self.low,
+            "close": self.close,
+            "volume": self.volume,
+        })
+
+
+def _ohlcv_chunks(
+    symbol: str,
+    tf: str,
+    start: datetime,
+    end: datetime,
+    store,
+    synthetic_provider: "SyntheticDataProvider | None",
+    quotes: bool = False,
+) -> Iterator[pd.DataFrame]:
+    """OHLCV of [start, end] in ascending range queries (overlapping at the edges)."""
+    if synthetic_provider is not None:
+        # Synthetic candles are generated in memory: one slice
+        if quotes:
+            df = synthetic_provider.get_1m_quotes(symbol=symbol, start=start, end=end)
+        else:
+            df = synthetic_provider.get_ohlcv(symbol=symbol, tf=tf, start=start, end=end)
+        yield df.sort_values("timestamp").reset_index(drop=True)
+        return
+
+    span = tf_duration(tf) * STREAM_CHUNK_BARS
+    cursor = start
+    while True:
+        chunk_end = min(cursor + span, end)
+        yield store.get_ohlcv(symbol=symbol, tf=tf, start=cursor, end=chunk_end)
+        if chunk_end >= end:
+            return
+        cursor = chunk_end
+
+
+def _spill_ohlcv(
+    chunks: Iterator[pd.DataFrame],
+    symbol: str,
+    tf: str,
+    spill: ColumnSpill,
+    missing: str,
+) -> _StreamedBars:
+    """
+    Append OHLCV chunks to mapped columns.
+
+    Rows at or before the last written bar (chunk overlap) are dropped.
+
+    Raises:
+        ValueError: If no bars were loaded (message: missing) or timestamps
+            are not strictly increasing
+    """
+    delta = np.timedelta64(int(tf_duration(tf).total_seconds()), "s")
+    writers = None
+    last_ms: int | None = None
+    for chunk in chunks:
+        if chunk is None or chunk.empty:
+            continue
+        ts_open: np.ndarray = np.asarray(chunk["timestamp"].values)
+        ts_close = ts_open + delta
+        close_ms = ts_close.astype("datetime64[ms]").astype(np.int64)
+        if last_ms is not None:
+            new = close_ms > last_ms
+            chunk, ts_open, ts_close, close_ms = chunk.loc[new], ts_open[new], ts_close[new], close_ms[new]
+            if close_ms.shape[0] == 0:
+                continue
+        steps = np.diff(close_ms)
+        if steps.size and steps.min() <= 0:
+            bad = int(np.argmax(steps <= 0)) + 1
+            raise ValueError(
+                f"{symbol} {tf} bars are not strictly increasing at {pd.Timestamp(ts_open[bad])} "
+                f"(duplicate or unsorted timestamps)\n"
+                f"\n"
+                f"Fix: python trade_cli.py data heal --symbol {symbol}"
+            )
+        if writers is None:
+            writers = {
+                "ts_open": spill.writer(ts_open.dtype),
+                "ts_close": spill.writer(ts_close.dtype),
+                "open": spill.writer(np.float64),
+                "high": spill.writer(np.float64),
+                "low": spill.writer(np.float64),
+                "close": spill.writer(np.float64),
+                "volume": spill.writer(np.float64),
+                "close_ms": spill.writer(np.int64),
+            }
+        writers["ts_open"].append(ts_open)
+        writers["ts_close"].append(ts_close)
+        for col in ("open", "high", "low", "close", "volume"):
+            writers[col].append(np.asarray(chunk[col].values))
+        writers["close_ms"].append(close_ms)
+        last_ms = int(close_ms[-1])
+
+    if writers is None:
+        raise ValueError(missing)
+    return _StreamedBars(**{name: writer.finish() for name, writer in writers.items()})
+
+
+def _spill_features(
+    bars: _StreamedBars,
+    specs: list,
+    keep: set[str],
+    spill: ColumnSpill,
+) -> dict[str, np.ndarray]:
+    """
+    Compute specs over the full series one at a time; keep the listed columns.
+
+    Kept columns are spilled as float64 (the dtype FeedStore.from_dataframe
+    uses), except runtime-only indicators, which stay writable in memory.
+    """
+    frame = bars.input_frame()
+    columns: dict[str, np.ndarray] = {}
+    for spec in specs:
+        with profile_span(f"prep.frames.indicators.{spec.output_key}"):
+            out = pd.DataFrame(index=frame.index)
+            apply_feature_spec(frame, spec, out=out)
+            runtime_only = spec.indicator_type in RUNTIME_ONLY_INDICATORS
+            for col in out.columns:
+                if col in keep:
+                    values = out[col].values.astype(np.float64)
+                    columns[col] = values if runtime_only else spill.write(values)
+    # Start the run from an empty resident set
+    spill.release_all()
+    return columns
+
+
+def _feed_store(
+    bars: _StreamedBars,
+    tf: str,
+    symbol: str,
+    indicator_columns: list[str],
+    computed: dict[str, np.ndarray],
+) -> FeedStore:
+    """FeedStore over streamed columns (indicators in indicator_columns order)."""
+    return FeedStore(
+        tf=tf,
+        symbol=symbol,
+        ts_open=bars.ts_open,
+        ts_close=bars.ts_close,
+        open=bars.open,
+        high=bars.high,
+        low=bars.low,
+        close=bars.close,
+        volume=bars.volume,
+        indicators={col: computed[col] for col in indicator_columns if col in computed},
+        close_ms=bars.close_ms,
+        length=bars.length,
+    )
+
+
+def _sim_start_frame(bars: _StreamedBars, columns: dict[str, np.ndarray], required: list[str]) -> pd.DataFrame:
+    """Timestamps plus the sim-start validity columns (the small PreparedFrame df)."""
+    frame = pd.DataFrame({"timestamp": bars.ts_open})
+    for col in required:
+        if col in columns:
+            frame[col] = columns[col]
+    return frame
+
+
+def prepare_streaming_feeds_impl(
+    config: SystemConfig,
+    window: "WindowConfig",
+    tf_mapping: dict[str, str],
+    multi_tf_mode: bool,
+    pager: FeedPager,
+    logger=None,
+    synthetic_provider: "SyntheticDataProvider | None" = None,
+) -> tuple[PreparedFrame, MultiTFFeedStore]:
+    """
+    Load, compute and spill all feeds of a backtest (streaming mode).
+
+    Same data window, features, feed columns and simulation start as
+    prepare_backtest_frame_impl / prepare_multi_tf_frames_impl followed by
+    build_feed_stores_impl. Every feed is registered with pager.
+
+    Args:
+        config: System configuration
+        window: Window configuration with start/end dates
+        tf_mapping: Dict with low_tf, med_tf, high_tf, exec keys
+        multi_tf_mode: Whether this is true multi-TF mode
+        pager: FeedPager that will page the feeds during the run
+        logger: Optional logger instance
+        synthetic_provider: Optional synthetic data provider
+
+    Returns:
+        (prepared_frame, multi_tf_feed_store); prepared_frame.df holds only
+        timestamps and the sim-start validity columns of the exec TF
+
+    Raises:
+        ValueError: If data is missing or invalid
+    """
+    if logger is None:
+        logger = get_module_logger(__name__)
+
+    _validate_inputs(config, logger)
+    store = None if synthetic_provider else get_historical_store(env=cast(DataEnv, config.data_build.env))
+    data_source = "SYNTHETIC" if synthetic_provider else "DuckDB"
+    specs_by_role = config.feature_specs_by_role
+    required_cols = _sim_start_columns(config)
+
+    low_tf = tf_mapping["low_tf"]
+    med_tf = tf_mapping["med_tf"]
+    high_tf = tf_mapping["high_tf"]
+    exec_role = tf_mapping["exec"]
+    exec_tf = tf_mapping[exec_role]
+    tf_by_role = {"exec": exec_tf, "low_tf": low_tf, "med_tf": med_tf, "high_tf": high_tf}
+
+    if multi_tf_mode:
+        warmup_bars, max_lookback = _get_multi_tf_warmup_config(config, multi_tf_mode)
+        data_start = compute_data_window(
+            window_start=window.start,
+            window_end=window.end,
+            warmup_bars_by_role=config.warmup_bars_by_role,
+            tf_by_role=tf_by_role,
+        ).data_start
+        requested_start, requested_end = window.start, window.end
+        # Feed columns per TF, as in build_feed_stores_impl
+        feed_tfs = {low_tf: specs_by_role.get(low_tf, specs_by_role.get('exec', []))}
+        if med_tf != low_tf:
+            feed_tfs[med_tf] = specs_by_role.get(med_tf, [])
+        if high_tf != med_tf and high_tf != low_tf:
+            feed_tfs[high_tf] = specs_by_role.get(high_tf, [])
+    else:
+        warmup_bars, max_lookback, exec_specs = _get_warmup_config(config)
+        if not exec_specs:
+            raise ValueError(
+                "No feature_specs_by_role in config. "
+                "Play with declared FeatureSpecs is required."
+            )
+        data_start, _, requested_start, requested_end = _compute_data_windows(
+            config, window, config.warmup_bars_by_role
+        )
+        exec_tf = config.tf
+        feed_tfs = {exec_tf: exec_specs}
+
+    logger.info(
+        f"Streaming data [{data_source}]: {config.symbol} {', '.join(sorted(feed_tfs))} "
+        f"from {data_start} to {requested_end} (warmup: {warmup_bars} bars on {exec_tf}, "
+        f"budget: {pager.memory_budget_mb} MB)"
+    )
+
+    feeds: dict[str, FeedStore] = {}
+    sim_frame: pd.DataFrame | None = None
+    for tf in sorted(feed_tfs):
+        spill = ColumnSpill()
+        with profile_span("prep.frames.load"):
+            bars = _spill_ohlcv(
+                _ohlcv_chunks(config.symbol, tf, data_start, requested_end, store, synthetic_provider),
+                config.symbol,
+                tf,
+                spill,
+                missing=(
+                    f"No {'synthetic ' if synthetic_provider else ''}data found for {config.symbol} {tf} "
+                    f"from {data_start} to {requested_end}. "
+                    + ("Generate synthetic data with required timeframes." if synthetic_provider
+                       else "Run data sync first.")
+                ),
+            )
+        feed_cols = get_required_indicator_columns_from_specs(feed_tfs[tf])
+        keep = set(feed_cols)
+        if tf == exec_tf:
+            keep.update(required_cols)
+        specs = _specs_for_tf(config, tf) if multi_tf_mode else feed_tfs[tf]
+        computed = _spill_features(bars, specs, keep, spill)
+        feeds[tf] = _feed_store(bars, tf, config.symbol, feed_cols, computed)
+        pager.add(bars.close_ms, spill, tf)
+        if tf == exec_tf:
+            sim_frame = _sim_start_frame(bars, computed, required_cols)
+        logger.debug(f"Streamed {bars.length} bars for {tf} ({spill.nbytes / (1024 * 1024):.1f} MB mapped)")
+
+    assert sim_frame is not None, "exec TF must be one of the streamed feeds"
+    if multi_tf_mode:
+        sim_start_ts, sim_start_idx = _compute_multi_tf_sim_start(
+            sim_frame, config, tf_by_role, requested_start, logger
+        )
+        loaded_start, loaded_end = requested_start, requested_end
+    else:
+        sim_start_ts, sim_start_idx = _compute_sim_start(
+            sim_frame, config, requested_start, requested_end, warmup_bars, logger
+        )
+        loaded_start = sim_frame["timestamp"].iloc[0]
+        loaded_end = sim_frame["timestamp"].iloc[-1]
+
+    low_tf_feed = feeds[low_tf] if multi_tf_mode else feeds[exec_tf]
+    multi_tf_feed_store = MultiTFFeedStore(
+        low_tf_feed=low_tf_feed,
+        med_tf_feed=feeds.get(med_tf) if multi_tf_mode and med_tf != low_tf else None,
+        high_tf_feed=feeds.get(high_tf) if multi_tf_mode and high_tf not in (med_tf, low_tf) else None,
+        tf_mapping=tf_mapping,
+        exec_role=exec_role,
+    )
+
+    prepared_frame = PreparedFrame(
+        df=sim_frame,
+        full_df=sim_frame,
+        warmup_bars=warmup_bars,
+        max_indicator_lookback=max_lookback,
+        requested_start=requested_start,
+        requested_end=requested_end,
+        loaded_start=loaded_start,
+        loaded_end=loaded_end,
+        simulation_start=sim_start_ts,
+        sim_start_index=sim_start_idx,
+    )
+    return prepared_frame, multi_tf_feed_store
+
+
+def build_streaming_quote_feed_impl(
+    symbol: str,
+    window_start: datetime,
+    window_end: datetime,
+    warmup_bars_1m: int,
+    pager: FeedPager,
+    data_env: str = "live",
+    logger=None,
+    synthetic_provider: "SyntheticDataProvider | None" = None,
+) -> FeedStore:
+    """
+    Stream the 1m quote feed (load_1m_data_impl + build_quote_feed_impl).
+
+    Args:
+        symbol: Trading symbol
+        window_start: Backtest window start
+        window_end: Backtest window end
+        warmup_bars_1m: Number of 1m warmup bars to load before window_start
+        pager: FeedPager that will page the feed during the run
+        data_env: Data environment ("live")
+        logger: Optional logger instance
+        synthetic_provider: Optional synthetic data provider
+
+    Returns:
+        1m FeedStore over memory-mapped OHLCV
+
+    Raises:
+        ValueError: If no 1m data is found
+    """
+    if logger is None:
+        logger = get_module_logger(__name__)
+
+    store = None if synthetic_provider else get_historical_store(env=cast(DataEnv, data_env))
+    extended_start = window_start - timedelta(minutes=warmup_bars_1m)
+    if synthetic_provider:
+        missing = (
+            f"No synthetic 1m data found for {symbol} from {extended_start} to {window_end}. "
+            f"Generate synthetic data with '1m' timeframe."
+        )
+    else:
+        missing = (
+            f"No 1m data found for {symbol} from {extended_start} to {window_end}. "
+            f"Run: python trade_cli.py data sync-range --symbol {symbol} --tf 1m "
+            f"--start {extended_start.strftime('%Y-%m-%d')} --end {window_end.strftime('%Y-%m-%d')}"
+        )
+
+    spill = ColumnSpill()
+    bars = _spill_ohlcv(
+        _ohlcv_chunks(symbol, "1m", extended_start, window_end, store, synthetic_provider, quotes=True),
+        symbol,
+        "1m",
+        spill,
+        missing,
+    )
+    spill.release_all()
+    pager.add(bars.close_ms, spill, "1m")
+
+    logger.info(
+        "Streamed quote feed: %s 1m bars for %s (%.1f MB mapped)",
+        bars.length, symbol, spill.nbytes / (1024 * 1024),
+    )
+    return _feed_store(bars, "1m", symbol, [], {})
@@ -1019,6 +1019,15 @@ class PlaySignalEvaluator:
         if play.setups:
             self._blocks_executor._evaluator.set_setup_cache(play.setups)
 
+        # Compiled closures for the per-bar path; the interpreter above stays
+        # the reference for evaluate_with_trace() and metadata resolution
+        from .rules.closure_compiler import CompiledBlocks, compile_blocks, rule_compiler_enabled
+        self._compiled_actions: CompiledBlocks | None = None
+        if play.actions and rule_compiler_enabled():
+            self._compiled_actions = compile_blocks(
+                play.actions, play.setups, play.feature_registry
+            )
+
     def evaluate(
         self,
         snapshot: "SnapshotView",
@@ -1195,7 +1204,10 @@ class PlaySignalEvaluator:
             EvaluationResult with decision and details
         """
         # Execute all actions
-        intents = self._blocks_executor.execute(self.play.actions, snapshot)
+        if self._compiled_actions is not None:
+            intents = self._compiled_actions.execute(snapshot)
+        else:
+            intents = self._blocks_executor.execute(self.play.actions, snapshot)
 
         # Map intents to decision
         for intent in intents:
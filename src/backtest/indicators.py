@@ -8,6 +8,7 @@ The engine uses only values available at or before the current bar (no look-ahea
 """
 
 import pandas as pd
+from time import perf_counter_ns
 from typing import TYPE_CHECKING, cast
 
 if TYPE_CHECKING:
@@ -15,6 +16,7 @@ if TYPE_CHECKING:
 
 from . import indicator_vendor as vendor
 from .indicator_registry import get_registry
+from ..utils.profiler import active_profiler
 
 
 # NOTE: No default indicator columns — all indicators must be explicitly requested
@@ -91,69 +93,13 @@ def apply_feature_spec_indicators(
         DataFrame with added indicator columns
     """
     df = df.copy()
-    
+    prof = active_profiler()
+
     for spec in feature_specs:
-        ind_type = spec.indicator_type.lower()
-        output_key = spec.output_key
-        params = spec.params
-        
-        # Get input source - FAIL LOUD if not declared
-        if not hasattr(spec, 'input_source') or spec.input_source is None:
-            raise ValueError(
-                f"MISSING_INPUT_SOURCE: Indicator '{output_key}' has no input_source. "
-                "All FeatureSpecs MUST declare input_source explicitly."
-            )
-        
-        # Convert enum to string value
-        input_source = spec.input_source
-        if hasattr(input_source, 'value'):
-            input_col = input_source.value  # Enum -> string
-        else:
-            input_col = str(input_source).lower()
-        
-        # Handle synthetic sources (hlc3, ohlc4) - compute on demand
-        if input_col == 'hlc3':
-            if 'hlc3' not in df.columns:
-                df['hlc3'] = (df['high'] + df['low'] + df['close']) / 3
-        elif input_col == 'ohlc4':
-            if 'ohlc4' not in df.columns:
-                df['ohlc4'] = (df['open'] + df['high'] + df['low'] + df['close']) / 4
-        
-        # FAIL LOUD if column doesn't exist
-        if input_col not in df.columns:
-            raise ValueError(
-                f"INVALID_INPUT_SOURCE: Indicator '{output_key}' requests input_source='{input_col}' "
-                f"but column not found. Available: {list(df.columns)}"
-            )
-        
-        # Apply indicator via compute_indicator() - the ONLY path for all indicators
-        try:
-            # Get ts_open for VWAP (requires DatetimeIndex for session boundaries)
-            ts_open = df.get("ts_open") if "ts_open" in df.columns else df.get("timestamp")
-            result = vendor.compute_indicator(
-                ind_type,
-                close=cast(pd.Series, df[input_col]),  # Use input_col, not always "close"
-                high=cast(pd.Series, df["high"]),
-                low=cast(pd.Series, df["low"]),
-                open_=cast(pd.Series, df["open"]),
-                volume=df.get("volume"),
-                ts_open=ts_open,  # For VWAP session boundaries
-                **params
-            )
-
-            if isinstance(result, dict):
-                # Multi-output: add each output as separate column
-                for name, series in result.items():
-                    df[f"{output_key}_{name}"] = series
-            elif isinstance(result, pd.Series):
-                # Single-output: add directly
-                df[output_key] = result
-        except Exception as e:
-            # FAIL LOUD - indicator computation failures must be surfaced
-            raise ValueError(
-                f"INDICATOR_COMPUTATION_FAILED: {ind_type} (output_key={output_key}) failed: {e}. "
-                f"Check params={params} and input_source={input_col}."
-            ) from e
+        t = perf_counter_ns() if prof is not None else 0
+        apply_feature_spec(df, spec)
+        if prof is not None:
+            prof.lap(f"prep.frames.indicators.{spec.output_key}", t)
 
     # Verbose: warn once per indicator that has NaN past warmup
     from src.utils.debug import is_verbose_enabled, verbose_log
@@ -168,6 +114,88 @@ def apply_feature_spec_indicators(
     return df
 
 
+def apply_feature_spec(
+    df: pd.DataFrame,
+    spec: "FeatureSpec",
+    out: pd.DataFrame | None = None,
+) -> None:
+    """
+    Compute one FeatureSpec on df and assign its output column(s) to out.
+
+    Outputs are assigned like DataFrame columns (index-aligned), to df itself
+    unless another frame is given. Synthetic inputs (hlc3, ohlc4) are added
+    to df on first use.
+
+    Args:
+        df: OHLCV DataFrame (input columns)
+        spec: FeatureSpec to compute
+        out: Frame receiving the outputs (default: df); must share df's index
+    """
+    if out is None:
+        out = df
+    ind_type = spec.indicator_type.lower()
+    output_key = spec.output_key
+    params = spec.params
+
+    # Get input source - FAIL LOUD if not declared
+    if not hasattr(spec, 'input_source') or spec.input_source is None:
+        raise ValueError(
+            f"MISSING_INPUT_SOURCE: Indicator '{output_key}' has no input_source. "
+            "All FeatureSpecs MUST declare input_source explicitly."
+        )
+
+    # Convert enum to string value
+    input_source = spec.input_source
+    if hasattr(input_source, 'value'):
+        input_col = input_source.value  # Enum -> string
+    else:
+        input_col = str(input_source).lower()
+
+    # Handle synthetic sources (hlc3, ohlc4) - compute on demand
+    if input_col == 'hlc3':
+        if 'hlc3' not in df.columns:
+            df['hlc3'] = (df['high'] + df['low'] + df['close']) / 3
+    elif input_col == 'ohlc4':
+        if 'ohlc4' not in df.columns:
+            df['ohlc4'] = (df['open'] + df['high'] + df['low'] + df['close']) / 4
+
+    # FAIL LOUD if column doesn't exist
+    if input_col not in df.columns:
+        raise ValueError(
+            f"INVALID_INPUT_SOURCE: Indicator '{output_key}' requests input_source='{input_col}' "
+            f"but column not found. Available: {list(df.columns)}"
+        )
+
+    # Apply indicator via compute_indicator() - the ONLY path for all indicators
+    try:
+        # Get ts_open for VWAP (requires DatetimeIndex for session boundaries)
+        ts_open = df.get("ts_open") if "ts_open" in df.columns else df.get("timestamp")
+        result = vendor.compute_indicator(
+            ind_type,
+            close=cast(pd.Series, df[input_col]),  # Use input_col, not always "close"
+            high=cast(pd.Series, df["high"]),
+            low=cast(pd.Series, df["low"]),
+            open_=cast(pd.Series, df["open"]),
+            volume=df.get("volume"),
+            ts_open=ts_open,  # For VWAP session boundaries
+            **params
+        )
+
+        if isinstance(result, dict):
+            # Multi-output: add each output as separate column
+            for name, series in result.items():
+                out[f"{output_key}_{name}"] = series
+        elif isinstance(result, pd.Series):
+            # Single-output: add directly
+            out[output_key] = result
+    except Exception as e:
+        # FAIL LOUD - indicator computation failures must be surfaced
+        raise ValueError(
+            f"INDICATOR_COMPUTATION_FAILED: {ind_type} (output_key={output_key}) failed: {e}. "
+            f"Check params={params} and input_source={input_col}."
+        ) from e
+
+
 def get_required_indicator_columns_from_specs(feature_specs: list) -> list[str]:
     """
     Get list of ALL indicator columns from FeatureSpecs.
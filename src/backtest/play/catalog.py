@@ -0,0 +1,293 @@
+"""
+Play catalog index and compiled-Play cache.
+
+Catalog: a persistent play_id -> file index per plays root, stored as
+``<cache_dir>/catalog-<root hash>.json`` with (mtime_ns, size, sha256) per
+YAML file. Lookups stat only the indexed file; the tree is walked again only
+on a miss or when that file changed, and only files whose (mtime_ns, size)
+changed are re-hashed.
+
+Compiled cache: the Play built from a YAML file (normalized conditions,
+parsed DSL, validated feature registry) is pickled under
+``<cache_dir>/compiled/<code version>/<content sha256>.pkl``. The code
+version hashes the import closure of src.backtest.play (see
+src/utils/source_hash.py) plus config/*.yml, so editing any module a
+compiled Play can depend on invalidates every entry; older version folders
+are deleted when a new one is created. The closure version is memoized in
+``<cache_dir>/code-version.json`` on the (mtime_ns, size) of its files, so
+a cold process checks it with stat calls instead of re-parsing the closure.
+
+Cache dir: data/play_cache (override with PLAY_CACHE_DIR). Set
+PLAY_CACHE_DISABLE=1 to parse every load from YAML.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import pickle
+import platform
+import shutil
+import threading
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from src.config.constants import PROJECT_ROOT
+from src.utils.helpers import atomic_write_bytes, atomic_write_text
+from src.utils.logger import get_module_logger
+from src.utils.source_hash import hash_file, persisted_source_version
+
+if TYPE_CHECKING:
+    from .play import Play
+
+logger = get_module_logger(__name__)
+
+# Bump when the index layout or pickled payload changes
+PLAY_CACHE_VERSION = 1
+
+DEFAULT_PLAY_CACHE_DIR = PROJECT_ROOT / "data" / "play_cache"
+
+PLAY_EXTENSIONS = (".yml", ".yaml")
+
+# Entry modules whose import closure determines what Play.from_dict builds
+PLAY_SOURCE_MODULES = ("src.backtest.play",)
+
+
+def get_play_cache_dir() -> Path:
+    """Return the play cache directory (PLAY_CACHE_DIR env override)."""
+    return Path(os.getenv("PLAY_CACHE_DIR", str(DEFAULT_PLAY_CACHE_DIR)))
+
+
+def play_cache_enabled() -> bool:
+    """False when PLAY_CACHE_DISABLE is set to a truthy value."""
+    return os.getenv("PLAY_CACHE_DISABLE", "").strip().lower() not in ("1", "true", "yes")
+
+
+def play_code_version() -> str:
+    """Hash of the Play-building import closure, config/*.yml and Python version."""
+    digest = hashlib.sha256()
+    digest.update(f"{PLAY_CACHE_VERSION}:{platform.python_version()}".encode("ascii"))
+    memo_path = get_play_cache_dir() / "code-version.json"
+    digest.update(persisted_source_version(PLAY_SOURCE_MODULES, memo_path).encode("ascii"))
+    config_dir = PROJECT_ROOT / "config"
+    if config_dir.exists():
+        for path in sorted(config_dir.glob("*.yml")):
+            digest.update(str(path.relative_to(PROJECT_ROOT)).encode("utf-8"))
+            digest.update(hash_file(path).encode("ascii"))
+    return digest.hexdigest()
+
+
+# ── Catalog ──────────────────────────────────────────────────────────
+
+
+def _precedence(rel: str) -> tuple[bool, bool, str]:
+    """Sort key matching load_play's search order: .yml first, root level first."""
+    path = Path(rel)
+    return (path.suffix != ".yml", len(path.parts) > 1, rel)
+
+
+class PlayCatalog:
+    """
+    Persistent play_id -> path index for one plays root.
+
+    ``files`` maps the root-relative path of every play YAML to
+    (mtime_ns, size, sha256). Duplicate ids resolve like load_play's search:
+    a .yml file beats a .yaml file, a root-level file beats a nested one,
+    then the lexicographically first path wins.
+    """
+
+    def __init__(self, root: Path, index_path: Path | None = None):
+        self.root = Path(root)
+        self.index_path = index_path
+        self._files: dict[str, tuple[int, int, str]] = {}
+        self._ids: dict[str, str] = {}
+        self._lock = threading.Lock()
+        self._load()
+
+    # ── Index I/O ──
+
+    def _load(self) -> None:
+        if self.index_path is None:
+            return
+        try:
+            raw = json.loads(self.index_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return
+        if raw.get("version") != PLAY_CACHE_VERSION or raw.get("root") != str(self.root.resolve()):
+            return
+        self._files = {rel: (int(m), int(s), str(h)) for rel, (m, s, h) in raw.get("files", {}).items()}
+        self._rebuild_ids()
+
+    def _save(self) -> None:
+        if self.index_path is None:
+            return
+        data = {
+            "version": PLAY_CACHE_VERSION,
+            "root": str(self.root.resolve()),
+            "files": {rel: list(entry) for rel, entry in sorted(self._files.items())},
+        }
+        try:
+            atomic_write_text(self.index_path, json.dumps(data, indent=1))
+        except OSError as e:
+            logger.debug("Play catalog write failed: %s", e)
+
+    def _rebuild_ids(self) -> None:
+        ids: dict[str, str] = {}
+        for rel in sorted(self._files, key=_precedence):
+            ids.setdefault(Path(rel).stem, rel)
+        self._ids = ids
+
+    # ── Refresh ──
+
+    def refresh(self) -> None:
+        """Walk the root; re-hash only files whose (mtime_ns, size) changed."""
+        with self._lock:
+            files: dict[str, tuple[int, int, str]] = {}
+            changed = False
+            if self.root.exists():
+                for dirpath, _dirnames, filenames in os.walk(self.root):
+                    for name in filenames:
+                        if not name.endswith(PLAY_EXTENSIONS):
+                            continue
+                        path = Path(dirpath) / name
+                        try:
+                            stat = path.stat()
+                        except OSError:
+                            continue
+                        rel = path.relative_to(self.root).as_posix()
+                        old = self._files.get(rel)
+                        if old is not None and old[:2] == (stat.st_mtime_ns, stat.st_size):
+                            files[rel] = old
+                            continue
+                        files[rel] = (stat.st_mtime_ns, stat.st_size, hash_file(path))
+                        changed = True
+            if changed or files.keys() != self._files.keys():
+                self._files = files
+                self._rebuild_ids()
+                self._save()
+
+    def _current(self, play_id: str) -> tuple[Path, str] | None:
+        """Indexed (path, sha256) for play_id if the file is unchanged on disk."""
+        rel = self._ids.get(play_id)
+        if rel is None:
+            return None
+        path = self.root / rel
+        try:
+            stat = path.stat()
+        except OSError:
+            return None
+        mtime_ns, size, sha = self._files[rel]
+        if (stat.st_mtime_ns, stat.st_size) != (mtime_ns, size):
+            return None
+        return path, sha
+
+    # ── Public API ──
+
+    def resolve(self, play_id: str) -> tuple[Path, str] | None:
+        """Return (path, content sha256) for play_id, or None if no such file."""
+        found = self._current(play_id)
+        if found is None:
+            self.refresh()
+            found = self._current(play_id)
+        return found
+
+    def play_ids(self) -> list[str]:
+        """Sorted ids of every play file under the root (refreshes first)."""
+        self.refresh()
+        return sorted(self._ids)
+
+
+_catalogs: dict[Path, PlayCatalog] = {}
+_catalogs_lock = threading.Lock()
+
+
+def get_play_catalog(root: Path) -> PlayCatalog:
+    """Process-wide catalog for a plays root, backed by the on-disk index when caching is enabled."""
+    key = Path(root).resolve()
+    with _catalogs_lock:
+        catalog = _catalogs.get(key)
+        if catalog is None:
+            index_path = None
+            if play_cache_enabled():
+                root_hash = hashlib.sha256(str(key).encode("utf-8")).hexdigest()[:16]
+                index_path = get_play_cache_dir() / f"catalog-{root_hash}.json"
+            catalog = PlayCatalog(key, index_path)
+            _catalogs[key] = catalog
+        return catalog
+
+
+# ── Compiled Play cache ──────────────────────────────────────────────
+
+
+class CompiledPlayCache:
+    """
+    Pickled Play objects keyed by YAML content hash under one code version.
+
+    Payloads are kept in memory as bytes so every load returns a fresh Play
+    (callers may mutate their copy without affecting later loads).
+    """
+
+    def __init__(self, base_dir: Path, code_version: str):
+        self.base_dir = Path(base_dir)
+        self.version_dir = self.base_dir / code_version[:16]
+        self._memory: dict[str, bytes] = {}
+        self._pruned = False
+
+    def _path(self, content_hash: str) -> Path:
+        return self.version_dir / f"{content_hash}.pkl"
+
+    def get(self, content_hash: str) -> "Play | None":
+        payload = self._memory.get(content_hash)
+        if payload is None:
+            try:
+                payload = self._path(content_hash).read_bytes()
+            except OSError:
+                return None
+        try:
+            play = pickle.loads(payload)
+        except Exception as e:  # corrupt or written by incompatible code
+            logger.debug("Dropping unreadable compiled play %s: %s", content_hash[:12], e)
+            self._memory.pop(content_hash, None)
+            self._path(content_hash).unlink(missing_ok=True)
+            return None
+        self._memory[content_hash] = payload
+        return play
+
+    def put(self, content_hash: str, play: "Play") -> None:
+        try:
+            payload = pickle.dumps(play, protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception as e:
+            logger.debug("Play %s not cacheable: %s", play.id, e)
+            return
+        self._memory[content_hash] = payload
+        try:
+            self._prune_old_versions()
+            atomic_write_bytes(self._path(content_hash), payload)
+        except OSError as e:
+            logger.debug("Compiled play write failed: %s", e)
+
+    def _prune_old_versions(self) -> None:
+        """Delete version folders left behind by earlier code versions (once per process)."""
+        if self._pruned:
+            return
+        self._pruned = True
+        if not self.base_dir.exists():
+            return
+        for entry in self.base_dir.iterdir():
+            if entry.is_dir() and entry != self.version_dir:
+                shutil.rmtree(entry, ignore_errors=True)
+
+
+_compiled_cache: CompiledPlayCache | None = None
+
+
+def get_compiled_play_cache() -> CompiledPlayCache | None:
+    """Process-wide compiled-Play cache, or None when PLAY_CACHE_DISABLE is set."""
+    global _compiled_cache
+    if not play_cache_enabled():
+        return None
+    if _compiled_cache is None:
+        _compiled_cache = CompiledPlayCache(get_play_cache_dir() / "compiled", play_code_version())
+    return _compiled_cache
+
@@ -14,6 +14,7 @@ Design principles:
 - Any timeframe: Features can use low_tf/med_tf/high_tf (exec points to one)
 """
 
+import hashlib
 from dataclasses import dataclass, field
 from enum import Enum
 from pathlib import Path
@@ -1070,13 +1071,23 @@ class Play:
 # Default Play directory -- all plays live under plays/ (including plays/validation/)
 from ...config.constants import PROJECT_ROOT
 
+from .catalog import get_compiled_play_cache, get_play_catalog
+
 PLAYS_DIR = PROJECT_ROOT / "plays"
 
 
+# libyaml's parser when available; constructs the same objects as SafeLoader
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
 def load_play(play_id: str, base_dir: Path | None = None) -> Play:
     """
     Load an Play from YAML file.
 
+    The file is located through the plays catalog index and the built Play
+    is served from the compiled-Play cache when the YAML content and the
+    Play-building code are unchanged (see catalog.py).
+
     Args:
         play_id: Identifier (filename without .yml)
         base_dir: Optional base directory
@@ -1084,43 +1095,32 @@ def load_play(play_id: str, base_dir: Path | None = None) -> Play:
     Returns:
         Validated Play instance
     """
-    # Search all known Play directories
-    if base_dir:
-        search_paths = [base_dir]
-    else:
-        search_paths = [PLAYS_DIR]
-
-    path = None
-    for search_path in search_paths:
-        if not search_path.exists():
-            continue
-        for ext in (".yml", ".yaml"):
-            # First try direct match (flat directories)
-            candidate = search_path / f"{play_id}{ext}"
-            if candidate.exists():
-                path = candidate
-                break
-            # Then try recursive search (tier subdirectories)
-            matches = list(search_path.rglob(f"{play_id}{ext}"))
-            if matches:
-                path = matches[0]
-                break
-        if path:
-            break
-
-    if not path:
-        available = list_plays()
+    catalog = get_play_catalog(base_dir or PLAYS_DIR)
+    found = catalog.resolve(play_id)
+    if found is None:
+        available = catalog.play_ids()
         raise FileNotFoundError(
             f"Play '{play_id}' not found in plays/. Available: {available[:20]}..."
         )
+    path, content_hash = found
 
-    with open(path, "r", encoding="utf-8") as f:
-        raw = yaml.safe_load(f)
+    cache = get_compiled_play_cache()
+    if cache is not None:
+        cached = cache.get(content_hash)
+        if cached is not None:
+            return cached
+
+    data = path.read_bytes()
+    raw = yaml.load(data, Loader=_YAML_LOADER)
 
     if not raw:
         raise ValueError(f"Empty or invalid YAML in {path}")
 
-    return Play.from_dict(raw)
+    play = Play.from_dict(raw)
+    if cache is not None:
+        # Key by the bytes actually parsed (the file may change under the index)
+        cache.put(hashlib.sha256(data).hexdigest(), play)
+    return play
 
 
 def list_plays(base_dir: Path | None = None, recursive: bool = True) -> list[str]:
@@ -1133,23 +1133,23 @@ def list_plays(base_dir: Path | None = None, recursive: bool = True) -> list[str
     Returns:
         Sorted list of Play IDs (filenames without extension)
     """
-    if base_dir:
-        search_paths = [base_dir]
-    else:
-        search_paths = [PLAYS_DIR]
-
-    cards = set()
-    for search_path in search_paths:
-        if not search_path.exists():
-            continue
-        for ext in ("*.yml", "*.yaml"):
-            # Use rglob for recursive search (tier subdirectories)
-            glob_fn = search_path.rglob if recursive else search_path.glob
-            for path in glob_fn(ext):
-                if path.stem.startswith("_") and not path.stem.startswith("_V"):
-                    continue
-                cards.add(path.stem)
+    search_path = base_dir or PLAYS_DIR
+    if not search_path.exists():
+        return []
 
+    if recursive:
+        ids = get_play_catalog(search_path).play_ids()
+    else:
+        ids = [
+            path.stem
+            for ext in ("*.yml", "*.yaml")
+            for path in search_path.glob(ext)
+        ]
+
+    cards = {
+        play_id for play_id in ids
+        if not (play_id.startswith("_") and not play_id.startswith("_V"))
+    }
     return sorted(cards)
 
 
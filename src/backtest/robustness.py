@@ -0,0 +1,454 @@
+"""
+Monte Carlo / bootstrap robustness analysis of a finished backtest.
+
+Post-processor over a run's trades and equity curve. Resamples the run
+thousands of times and reports confidence intervals for max drawdown,
+Sharpe, CAGR and final equity, plus the probability of ruin.
+
+Methods:
+- trade_shuffle:   permute the order of realized trade PnLs (path risk:
+                   same trades, different sequence -> drawdown/ruin spread)
+- block_bootstrap: block bootstrap of per-bar equity returns (keeps
+                   short-range autocorrelation within a block). Blocks wrap
+                   around the series end. block_lengths="fixed" (default)
+                   uses blocks of exactly block_size bars (circular block
+                   bootstrap); "geometric" draws lengths with mean
+                   block_size (stationary bootstrap, Politis & Romano 1994)
+- random_skip:     drop each trade independently with probability skip_prob
+                   (missed fills, downtime)
+
+All resamples are evaluated as 2-D NumPy arrays (rows = resamples) in
+fixed-size chunks, so memory stays bounded. Each chunk has its own seed
+spawned from RobustnessConfig.seed, so results are identical for any
+worker count. workers > 1 spreads chunks over processes.
+
+Units follow metrics.py: drawdown and CAGR are DECIMALS (0.25 = 25%).
+Trade-based Sharpe is per trade, annualized by trades per year;
+block-bootstrap Sharpe is per bar, annualized by bars per year
+(same formula as metrics._compute_sharpe).
+
+This module is pure math plus RobustnessReport.write_json().
+"""
+
+from __future__ import annotations
+
+import json
+import math
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+from .metrics import get_bars_per_year
+
+ROBUSTNESS_FILE = "robustness.json"
+
+ROBUSTNESS_METHODS = ("trade_shuffle", "block_bootstrap", "random_skip")
+BLOCK_LENGTHS = ("fixed", "geometric")
+
+# Upper bound on elements per (resamples x path length) chunk array
+_CHUNK_ELEMENTS = 2_000_000
+
+_METRIC_NAMES = ("max_drawdown", "sharpe", "cagr", "final_equity")
+
+
+@dataclass
+class RobustnessConfig:
+    """Parameters for run_robustness_analysis()."""
+    resamples: int = 10_000
+    methods: tuple[str, ...] = ROBUSTNESS_METHODS
+    block_size: int | None = None   # None = ceil(sqrt(n_returns))
+    block_lengths: str = "fixed"    # "fixed" (circular) or "geometric" (stationary)
+    skip_prob: float = 0.10         # random_skip: P(trade dropped)
+    ruin_fraction: float = 0.50     # ruin = equity touches <= fraction * initial
+    confidence: float = 0.90        # two-sided CI level
+    seed: int = 42
+    workers: int = 1
+
+    def __post_init__(self) -> None:
+        unknown = [m for m in self.methods if m not in ROBUSTNESS_METHODS]
+        if unknown:
+            raise ValueError(
+                f"Unknown robustness method(s) {unknown}. Valid: {list(ROBUSTNESS_METHODS)}"
+            )
+        if self.resamples < 1:
+            raise ValueError(f"resamples must be >= 1, got {self.resamples}")
+        if not 0.0 <= self.skip_prob < 1.0:
+            raise ValueError(f"skip_prob must be in [0, 1), got {self.skip_prob}")
+        if not 0.0 < self.confidence < 1.0:
+            raise ValueError(f"confidence must be in (0, 1), got {self.confidence}")
+        if not 0.0 <= self.ruin_fraction < 1.0:
+            raise ValueError(f"ruin_fraction must be in [0, 1), got {self.ruin_fraction}")
+        if self.block_size is not None and self.block_size < 1:
+            raise ValueError(f"block_size must be >= 1, got {self.block_size}")
+        if self.block_lengths not in BLOCK_LENGTHS:
+            raise ValueError(
+                f"Unknown block_lengths '{self.block_lengths}'. Valid: {list(BLOCK_LENGTHS)}"
+            )
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "resamples": self.resamples,
+            "methods": list(self.methods),
+            "block_size": self.block_size,
+            "block_lengths": self.block_lengths,
+            "skip_prob": self.skip_prob,
+            "ruin_fraction": self.ruin_fraction,
+            "confidence": self.confidence,
+            "seed": self.seed,
+        }
+
+
+@dataclass
+class MetricDistribution:
+    """Observed value and resampled distribution summary for one metric."""
+    observed: float
+    mean: float
+    p50: float
+    ci_low: float
+    ci_high: float
+
+    def to_dict(self) -> dict[str, float]:
+        return {
+            "observed": round(self.observed, 6),
+            "mean": round(self.mean, 6),
+            "p50": round(self.p50, 6),
+            "ci_low": round(self.ci_low, 6),
+            "ci_high": round(self.ci_high, 6),
+        }
+
+
+@dataclass
+class MethodResult:
+    """Result of one resampling method."""
+    method: str
+    resamples: int
+    metrics: dict[str, MetricDistribution] = field(default_factory=dict)
+    ruin_probability: float = 0.0
+    params: dict[str, Any] = field(default_factory=dict)
+    skipped_reason: str | None = None
+
+    def to_dict(self) -> dict[str, Any]:
+        if self.skipped_reason is not None:
+            return {"method": self.method, "skipped": self.skipped_reason}
+        return {
+            "method": self.method,
+            "resamples": self.resamples,
+            "params": self.params,
+            "metrics": {k: v.to_dict() for k, v in self.metrics.items()},
+            "ruin_probability": round(self.ruin_probability, 6),
+        }
+
+
+@dataclass
+class RobustnessReport:
+    """All method results for one run (written as robustness.json)."""
+    config: RobustnessConfig
+    tf: str
+    initial_equity: float
+    trades_count: int
+    total_bars: int
+    methods: list[MethodResult] = field(default_factory=list)
+    duration_seconds: float = 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "config": self.config.to_dict(),
+            "tf": self.tf,
+            "initial_equity": self.initial_equity,
+            "trades_count": self.trades_count,
+            "total_bars": self.total_bars,
+            "duration_seconds": round(self.duration_seconds, 3),
+            "methods": {m.method: m.to_dict() for m in self.methods},
+        }
+
+    def write_json(self, path: Path) -> None:
+        """Write report to JSON file (atomic: temp + replace)."""
+        from src.utils.helpers import atomic_write_text
+        atomic_write_text(path, json.dumps(self.to_dict(), indent=2, sort_keys=True))
+
+
+# =============================================================================
+# Batched path metrics (rows = resamples)
+# =============================================================================
+
+def _max_drawdown(equity: np.ndarray, initial_equity: float) -> np.ndarray:
+    """Max drawdown (decimal) per row; the initial equity counts as the first peak."""
+    peaks = np.maximum.accumulate(equity, axis=1)
+    np.maximum(peaks, initial_equity, out=peaks)
+    return ((peaks - equity) / peaks).max(axis=1)
+
+
+def _cagr(final_equity: np.ndarray, initial_equity: float, years: float) -> np.ndarray:
+    """Geometric CAGR per row (-1.0 on total loss), as metrics._compute_cagr."""
+    if years <= 0 or initial_equity <= 0:
+        return np.zeros_like(final_equity)
+    ratio = np.maximum(final_equity / initial_equity, 0.0)
+    with np.errstate(divide="ignore"):
+        cagr = np.power(ratio, 1.0 / years) - 1.0
+    return np.where(final_equity <= 0, -1.0, cagr)
+
+
+def _sharpe(returns: np.ndarray, mask: np.ndarray | None, periods_per_year: np.ndarray | float) -> np.ndarray:
+    """Annualized Sharpe per row over masked entries (population std, rf = 0)."""
+    if mask is None:
+        count = np.full(returns.shape[0], returns.shape[1], dtype=np.float64)
+        mean = returns.mean(axis=1)
+        std = returns.std(axis=1)
+    else:
+        count = mask.sum(axis=1).astype(np.float64)
+        safe = np.maximum(count, 1.0)
+        mean = np.where(mask, returns, 0.0).sum(axis=1) / safe
+        dev = np.where(mask, returns - mean[:, None], 0.0)
+        std = np.sqrt((dev * dev).sum(axis=1) / safe)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        sharpe = mean / std * np.sqrt(periods_per_year)
+    return np.where((std > 0) & (count >= 2), sharpe, 0.0)
+
+
+def _trade_path_metrics(
+    pnl: np.ndarray,
+    keep: np.ndarray | None,
+    initial_equity: float,
+    years: float,
+    ruin_level: float,
+) -> dict[str, np.ndarray]:
+    """Metrics for rows of trade PnL sequences applied additively to initial equity."""
+    equity = initial_equity + np.cumsum(pnl, axis=1)
+    before = np.empty_like(equity)
+    before[:, 0] = initial_equity
+    before[:, 1:] = equity[:, :-1]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        returns = np.where(before > 0, pnl / before, 0.0)
+    trades = pnl.shape[1] if keep is None else keep.sum(axis=1)
+    per_year = np.asarray(trades, dtype=np.float64) / years if years > 0 else 0.0
+    final = equity[:, -1]
+    return {
+        "max_drawdown": _max_drawdown(equity, initial_equity),
+        "sharpe": _sharpe(returns, keep, per_year),
+        "cagr": _cagr(final, initial_equity, years),
+        "final_equity": final,
+        "ruined": equity.min(axis=1) <= ruin_level,
+    }
+
+
+def _return_path_metrics(
+    returns: np.ndarray,
+    initial_equity: float,
+    years: float,
+    bars_per_year: int,
+    ruin_level: float,
+) -> dict[str, np.ndarray]:
+    """Metrics for rows of per-bar simple returns compounded from initial equity."""
+    equity = initial_equity * np.cumprod(1.0 + returns, axis=1)
+    final = equity[:, -1]
+    return {
+        "max_drawdown": _max_drawdown(equity, initial_equity),
+        "sharpe": _sharpe(returns, None, float(bars_per_year)),
+        "cagr": _cagr(final, initial_equity, years),
+        "final_equity": final,
+        "ruined": equity.min(axis=1) <= ruin_level,
+    }
+
+
+# =============================================================================
+# Chunk workers (module-level for ProcessPoolExecutor spawn)
+# =============================================================================
+
+def _run_chunk(
+    method: str,
+    rows: int,
+    seed_seq: np.random.SeedSequence,
+    data: np.ndarray,
+    params: dict[str, Any],
+) -> dict[str, np.ndarray]:
+    """Resample ``rows`` paths for one method and return their per-row metrics."""
+    rng = np.random.default_rng(seed_seq)
+    n = data.shape[0]
+    initial_equity = params["initial_equity"]
+    years = params["years"]
+    ruin_level = params["ruin_level"]
+
+    if method == "trade_shuffle":
+        order = rng.permuted(np.tile(np.arange(n), (rows, 1)), axis=1)
+        return _trade_path_metrics(data[order], None, initial_equity, years, ruin_level)
+
+    if method == "random_skip":
+        keep = rng.random((rows, n)) >= params["skip_prob"]
+        pnl = np.where(keep, data, 0.0)
+        return _trade_path_metrics(pnl, keep, initial_equity, years, ruin_level)
+
+    block = params["block_size"]
+    if params["block_lengths"] == "geometric":
+        # Stationary bootstrap: each bar starts a new block with p = 1/block,
+        # so lengths are geometric with mean block
+        positions = np.arange(n)
+        new_block = rng.random((rows, n)) < 1.0 / block
+        new_block[:, 0] = True
+        block_start = np.maximum.accumulate(np.where(new_block, positions, 0), axis=1)
+        starts = rng.integers(0, n, size=(rows, n))
+        idx = (np.take_along_axis(starts, block_start, axis=1) + positions - block_start) % n
+        resampled = data[idx]
+    else:
+        # Circular block bootstrap: fixed-length blocks
+        n_blocks = -(-n // block)
+        starts = rng.integers(0, n, size=(rows, n_blocks))
+        idx = (starts[:, :, None] + np.arange(block)) % n
+        resampled = data[idx.reshape(rows, n_blocks * block)[:, :n]]
+    return _return_path_metrics(resampled, initial_equity, years, params["bars_per_year"], ruin_level)
+
+
+def _chunk_plan(resamples: int, width: int) -> list[int]:
+    """Row counts per chunk; depends only on resamples and path width."""
+    rows = max(1, _CHUNK_ELEMENTS // max(width, 1))
+    plan = [rows] * (resamples // rows)
+    if resamples % rows:
+        plan.append(resamples % rows)
+    return plan
+
+
+def _distribution(observed: float, values: np.ndarray, confidence: float) -> MetricDistribution:
+    alpha = (1.0 - confidence) / 2.0
+    low, mid, high = np.quantile(values, [alpha, 0.5, 1.0 - alpha])
+    return MetricDistribution(
+        observed=float(observed),
+        mean=float(values.mean()),
+        p50=float(mid),
+        ci_low=float(low),
+        ci_high=float(high),
+    )
+
+
+def _run_method(
+    method: str,
+    data: np.ndarray,
+    params: dict[str, Any],
+    config: RobustnessConfig,
+    seed_seq: np.random.SeedSequence,
+    pool: ProcessPoolExecutor | None,
+) -> dict[str, np.ndarray]:
+    """Run all chunks of one method (optionally in a process pool) and concatenate."""
+    plan = _chunk_plan(config.resamples, data.shape[0])
+    seeds = seed_seq.spawn(len(plan))
+    if pool is None:
+        parts = [_run_chunk(method, rows, s, data, params) for rows, s in zip(plan, seeds)]
+    else:
+        futures = [pool.submit(_run_chunk, method, rows, s, data, params) for rows, s in zip(plan, seeds)]
+        parts = [f.result() for f in futures]
+    return {key: np.concatenate([p[key] for p in parts]) for key in parts[0]}
+
+
+# =============================================================================
+# Entry point
+# =============================================================================
+
+def run_robustness_analysis(
+    trade_pnl: np.ndarray | list[float],
+    equity: np.ndarray | list[float],
+    initial_equity: float,
+    tf: str,
+    config: RobustnessConfig | None = None,
+) -> RobustnessReport:
+    """
+    Resample a finished run and summarize the spread of its outcomes.
+
+    Args:
+        trade_pnl: Realized net PnL per closed trade (USDT), in trade order.
+        equity: Per-bar equity curve (USDT), in bar order.
+        initial_equity: Starting equity (USDT).
+        tf: Exec timeframe (annualization).
+        config: Resampling parameters (defaults: 10k resamples, all methods).
+
+    Returns:
+        RobustnessReport (call write_json() to persist as robustness.json).
+    """
+    import time
+
+    config = config or RobustnessConfig()
+    start = time.perf_counter()
+
+    pnl = np.asarray(trade_pnl, dtype=np.float64)
+    eq = np.asarray(equity, dtype=np.float64)
+    if initial_equity <= 0:
+        raise ValueError(f"initial_equity must be > 0, got {initial_equity}")
+
+    bars_per_year = get_bars_per_year(tf)
+    total_bars = int(eq.shape[0])
+    years = total_bars / bars_per_year
+    ruin_level = config.ruin_fraction * initial_equity
+
+    # Per-bar returns (as metrics._compute_returns: skip non-positive prior equity)
+    prev, curr = eq[:-1], eq[1:]
+    bar_returns = curr[prev > 0] / prev[prev > 0] - 1.0
+
+    block_size = config.block_size or max(1, math.ceil(math.sqrt(max(bar_returns.shape[0], 1))))
+    params = {
+        "initial_equity": float(initial_equity),
+        "years": years,
+        "ruin_level": ruin_level,
+        "bars_per_year": bars_per_year,
+        "skip_prob": config.skip_prob,
+        "block_size": block_size,
+        "block_lengths": config.block_lengths,
+    }
+
+    report = RobustnessReport(
+        config=config,
+        tf=tf,
+        initial_equity=float(initial_equity),
+        trades_count=int(pnl.shape[0]),
+        total_bars=total_bars,
+    )
+
+    # Observed values use the same batched formulas on the original sequence
+    observed_trades = (
+        _trade_path_metrics(pnl[None, :], None, initial_equity, years, ruin_level)
+        if pnl.shape[0] else None
+    )
+    observed_bars = (
+        _return_path_metrics(bar_returns[None, :], initial_equity, years, bars_per_year, ruin_level)
+        if bar_returns.shape[0] else None
+    )
+
+    method_seeds: dict[str, np.random.SeedSequence] = dict(
+        zip(ROBUSTNESS_METHODS, np.random.SeedSequence(config.seed).spawn(len(ROBUSTNESS_METHODS)))
+    )
+    pool = ProcessPoolExecutor(max_workers=config.workers) if config.workers > 1 else None
+    try:
+        for method in config.methods:
+            is_trade_method = method != "block_bootstrap"
+            data = pnl if is_trade_method else bar_returns
+            observed = observed_trades if is_trade_method else observed_bars
+            if observed is None or data.shape[0] < 2:
+                what = "trades" if is_trade_method else "equity bars"
+                report.methods.append(MethodResult(
+                    method=method, resamples=0,
+                    skipped_reason=f"needs at least 2 {what}, got {data.shape[0]}",
+                ))
+                continue
+
+            samples = _run_method(method, data, params, config, method_seeds[method], pool)
+            result = MethodResult(
+                method=method,
+                resamples=config.resamples,
+                ruin_probability=float(samples["ruined"].mean()),
+                params=(
+                    {"block_size": block_size, "block_lengths": config.block_lengths}
+                    if method == "block_bootstrap"
+                    else {"skip_prob": config.skip_prob} if method == "random_skip"
+                    else {}
+                ),
+            )
+            for name in _METRIC_NAMES:
+                result.metrics[name] = _distribution(
+                    float(observed[name][0]), samples[name], config.confidence,
+                )
+            report.methods.append(result)
+    finally:
+        if pool is not None:
+            pool.shutdown()
+
+    report.duration_seconds = time.perf_counter() - start
+    return report
@@ -0,0 +1,866 @@
+"""
+Closure compiler for DSL expression trees.
+
+The interpreter (evaluation/ExprEvaluator) walks the AST on every bar:
+isinstance dispatch per node, a shifted copy of the subtree per window
+offset, a registry lookup per feature reference and an EvalResult with
+formatted strings per condition. This module turns each Expr into nested
+closures once, when the signal evaluator is built for a Play:
+
+- operators, literals, tolerances and window offsets are fixed at compile
+  time (one closure variant per comparison operator)
+- feature references on FeedStore columns bind to (TF context, array) on
+  first use and then read ``array[current_idx - offset]`` directly
+- window operators pass an extra offset down instead of rebuilding the
+  subtree with shift_expr()
+- no EvalResult or reason string is built; the result is a tri-state
+
+Tri-state results:
+    True   condition met
+    False  condition not met (invertible by NOT)
+    None   error outcome (missing value, type mismatch, ...): not met,
+           and propagated unchanged through NOT, like the interpreter's
+           error ReasonCodes
+
+The interpreter stays the reference implementation: execute_with_trace(),
+the dashboard's signal proximity and every reason string come from it.
+Semantics mirror ExprEvaluator exactly, including missing-value handling,
+declared-INT coercion, short-circuit order and which failures NOT inverts.
+References the compiler has no direct route for (structures, last/mark
+price, market data, dotted structure paths) go through the snapshot's
+get_feature_value() just as the interpreter does.
+
+Set RULE_COMPILER_DISABLE=1 to evaluate every bar with the interpreter.
+
+Usage:
+    compiled = compile_blocks(play.actions, play.setups, play.feature_registry)
+    intents = compiled.execute(snapshot)
+"""
+
+from __future__ import annotations
+
+import os
+from collections.abc import Callable
+from operator import attrgetter
+from typing import TYPE_CHECKING, Any
+
+from .dsl_nodes import (
+    ACTION_TF_MINUTES,
+    CROSSOVER_OPERATORS,
+    AllExpr,
+    AnyExpr,
+    ArithmeticExpr,
+    Cond,
+    CountTrue,
+    CountTrueDuration,
+    Expr,
+    FeatureRef,
+    HoldsFor,
+    HoldsForDuration,
+    ListValue,
+    NotExpr,
+    OccurredWithin,
+    OccurredWithinDuration,
+    RangeValue,
+    ScalarValue,
+    SetupRef,
+)
+from .evaluation.boolean_ops import _ERROR_REASONS
+from .evaluation.resolve import infer_value_type
+from .types import EvalResult, RefValue, ValueType
+from ..runtime.timeframe import tf_minutes
+
+if TYPE_CHECKING:
+    from ..feature_registry import FeatureRegistry
+    from ..runtime.snapshot_view import RuntimeSnapshotView
+    from .strategy_blocks import Block, Intent
+
+# (snapshot, extra_offset) -> True / False / None (error)
+CompiledExpr = Callable[["RuntimeSnapshotView", int], "bool | None"]
+
+# ((when, emit) per case, else_emit) per block
+_CompiledBlock = tuple[tuple[tuple[CompiledExpr, tuple["Intent", ...]], ...], "tuple[Intent, ...] | None"]
+
+_INF = float("inf")
+
+# Feature ids / indicator keys the snapshot resolves outside FeedStore columns
+_SPECIAL_KEYS = frozenset({"last_price", "mark_price", "funding_rate", "open_interest"})
+_OHLCV_KEYS = frozenset({"open", "high", "low", "close", "volume"})
+
+_CTX_GETTERS = {
+    "exec": attrgetter("exec_ctx"),
+    "low_tf": attrgetter("low_tf_ctx"),
+    "med_tf": attrgetter("med_tf_ctx"),
+    "high_tf": attrgetter("high_tf_ctx"),
+}
+
+_NUMERIC_TYPES = (ValueType.INT, ValueType.FLOAT, ValueType.NUMERIC)
+_DISCRETE_TYPES = (ValueType.BOOL, ValueType.INT, ValueType.ENUM, ValueType.STRING)
+
+_MISSING = RefValue.missing("compiled")
+_UNBOUND = object()
+
+
+def rule_compiler_enabled() -> bool:
+    """False when RULE_COMPILER_DISABLE is set to a truthy value."""
+    return os.getenv("RULE_COMPILER_DISABLE", "").strip().lower() not in ("1", "true", "yes")
+
+
+def eval_outcome(result: EvalResult) -> bool | None:
+    """Map an interpreter EvalResult to the compiler's tri-state."""
+    if result.ok:
+        return True
+    if result.reason in _ERROR_REASONS:
+        return None
+    return False
+
+
+def _const(value: bool | None) -> CompiledExpr:
+    def fn(snap, k):
+        return value
+    return fn
+
+
+# =============================================================================
+# Operands
+# =============================================================================
+
+def _is_feed_ref(feature_id: str, registry: "FeatureRegistry | None") -> bool:
+    """True if get_feature_value() resolves this id to a FeedStore column read."""
+    if feature_id in _SPECIAL_KEYS or "." in feature_id:
+        return False
+    if registry is not None:
+        feature = registry.get_or_none(feature_id)
+        if feature is not None and feature.is_structure:
+            return False
+    return True
+
+
+def _typed_ref(ref: FeatureRef) -> Callable[[Any, int], RefValue]:
+    """RefValue getter with resolve_ref() semantics (any reference kind)."""
+    feature_id = ref.feature_id
+    field = ref.field
+    type_field = field or "value"
+    offset = ref.offset
+    path = f"{feature_id}.{field}"
+
+    def get(snap, k):
+        try:
+            value = snap.get_feature_value(feature_id=feature_id, field=field, offset=offset + k)
+            declared = snap.get_feature_output_type(feature_id, type_field)
+            return RefValue.from_resolved_with_declared_type(value, path, declared)
+        except (KeyError, AttributeError):
+            return _MISSING
+    return get
+
+
+def _numeric_adaptor(typed: Callable[[Any, int], RefValue]) -> Callable[[Any, int], Any]:
+    """Number getter over a RefValue getter: None if missing or non-numeric."""
+    def get(snap, k):
+        rv = typed(snap, k)
+        vt = rv.value_type
+        if vt is ValueType.FLOAT:
+            return float(rv.value)
+        if vt in _NUMERIC_TYPES:
+            return rv.value
+        return None
+    return get
+
+
+def _feed_ref(ref: FeatureRef) -> Callable[[Any, int], Any]:
+    """
+    Number getter bound to a FeedStore column: float, or None if missing.
+
+    The (TF context, indicator key) route is resolved by the snapshot's own
+    _indicator_key_and_role() once per feature registry, and the array once
+    per FeedStore object (live snapshots rebuild their feeds each bar).
+    Snapshots without that API fall back to get_feature_value().
+    """
+    feature_id = ref.feature_id
+    field = ref.field
+    offset = ref.offset
+    fallback = _numeric_adaptor(_typed_ref(ref))
+
+    bound_registry: Any = _UNBOUND
+    ctx_getter: Callable[[Any], Any] | None = None
+    key = ""
+    bound_feed: Any = None
+    arr: Any = None
+    length = 0
+
+    def get(snap, k):
+        nonlocal bound_registry, ctx_getter, key, bound_feed, arr, length
+        try:
+            registry = snap._feature_registry
+        except AttributeError:
+            return fallback(snap, k)
+        if registry is not bound_registry:
+            bound_registry = registry
+            bound_feed = None
+            ctx_getter = None
+            if _is_feed_ref(feature_id, registry):
+                key, role = snap._indicator_key_and_role(feature_id, field)
+                if key not in _SPECIAL_KEYS:
+                    ctx_getter = _CTX_GETTERS.get(role)
+        if ctx_getter is None:
+            return fallback(snap, k)
+        ctx = ctx_getter(snap)
+        feed = ctx.feed
+        if feed is not bound_feed:
+            bound_feed = feed
+            arr = getattr(feed, key) if key in _OHLCV_KEYS else feed.indicators.get(key)
+            length = feed.length
+        i = ctx.current_idx - offset - k
+        if arr is None or i < 0 or i >= length:
+            return None
+        v = float(arr[i])
+        if -_INF < v < _INF:
+            return v
+        return None
+    return get
+
+
+def _arith_add(left, right) -> Callable[[Any, int], Any]:
+    def get(snap, k):
+        a = left(snap, k)
+        if a is None:
+            return None
+        b = right(snap, k)
+        if b is None:
+            return None
+        r = a + b
+        return r if -_INF < r < _INF else None
+    return get
+
+
+def _arith_sub(left, right) -> Callable[[Any, int], Any]:
+    def get(snap, k):
+        a = left(snap, k)
+        if a is None:
+            return None
+        b = right(snap, k)
+        if b is None:
+            return None
+        r = a - b
+        return r if -_INF < r < _INF else None
+    return get
+
+
+def _arith_mul(left, right) -> Callable[[Any, int], Any]:
+    def get(snap, k):
+        a = left(snap, k)
+        if a is None:
+            return None
+        b = right(snap, k)
+        if b is None:
+            return None
+        r = a * b
+        return r if -_INF < r < _INF else None
+    return get
+
+
+def _arith_div(left, right) -> Callable[[Any, int], Any]:
+    def get(snap, k):
+        a = left(snap, k)
+        if a is None:
+            return None
+        b = right(snap, k)
+        if b is None or b == 0:
+            return None
+        r = a / b
+        return r if -_INF < r < _INF else None
+    return get
+
+
+def _arith_mod(left, right) -> Callable[[Any, int], Any]:
+    def get(snap, k):
+        a = left(snap, k)
+        if a is None:
+            return None
+        b = right(snap, k)
+        if b is None or b == 0:
+            return None
+        r = a % b
+        return r if -_INF < r < _INF else None
+    return get
+
+
+def _arith_unknown(left, right) -> Callable[[Any, int], Any]:
+    def get(snap, k):
+        return None
+    return get
+
+
+# Number-only arithmetic per operator, with evaluate_arithmetic() semantics
+_ARITH_FAST = {
+    "+": _arith_add,
+    "-": _arith_sub,
+    "*": _arith_mul,
+    "/": _arith_div,
+    "%": _arith_mod,
+}
+
+
+def _arith_fast(op: str, left, right) -> Callable[[Any, int], Any]:
+    """Number-only arithmetic with evaluate_arithmetic() semantics."""
+    return _ARITH_FAST.get(op, _arith_unknown)(left, right)
+
+
+def _fast_number(node: Any, registry: "FeatureRegistry | None") -> Callable[[Any, int], Any] | None:
+    """
+    Number getter for operands made only of FeedStore columns, numeric
+    literals and arithmetic; None if any leaf needs RefValue semantics.
+    """
+    if isinstance(node, FeatureRef):
+        return _feed_ref(node) if _is_feed_ref(node.feature_id, registry) else None
+    if isinstance(node, ScalarValue):
+        if infer_value_type(node.value) in (ValueType.INT, ValueType.FLOAT):
+            value = node.value
+            return lambda snap, k: value
+        return None
+    if isinstance(node, ArithmeticExpr):
+        left = _fast_number(node.left, registry)
+        right = _fast_number(node.right, registry) if left is not None else None
+        if left is None or right is None:
+            return None
+        return _arith_fast(node.op, left, right)
+    return None
+
+
+def _typed(node: Any) -> Callable[[Any, int], RefValue]:
+    """RefValue getter for any operand (generic path)."""
+    if isinstance(node, FeatureRef):
+        return _typed_ref(node)
+    if isinstance(node, ScalarValue):
+        literal = RefValue(value=node.value, value_type=infer_value_type(node.value), path="literal")
+        return lambda snap, k: literal
+    if isinstance(node, ArithmeticExpr):
+        return _typed_arith(node)
+    return lambda snap, k: _MISSING
+
+
+def _typed_arith(arith: ArithmeticExpr) -> Callable[[Any, int], RefValue]:
+    """RefValue arithmetic mirroring evaluate_arithmetic()."""
+    left = _typed(arith.left)
+    right = _typed(arith.right)
+    op = arith.op
+
+    def get(snap, k):
+        lv = left(snap, k)
+        if lv.is_missing:
+            return _MISSING
+        rv = right(snap, k)
+        if rv.is_missing:
+            return _MISSING
+        a = lv.value
+        b = rv.value
+        try:
+            if op == "+":
+                result = a + b
+            elif op == "-":
+                result = a - b
+            elif op == "*":
+                result = a * b
+            elif op == "/":
+                if b == 0:
+                    return _MISSING
+                result = a / b
+            elif op == "%":
+                if b == 0:
+                    return _MISSING
+                result = a % b
+            else:
+                return _MISSING
+        except (TypeError, ZeroDivisionError):
+            return _MISSING
+        return RefValue(value=result, value_type=infer_value_type(result), path="arithmetic")
+    return get
+
+
+def _number(node: Any, registry: "FeatureRegistry | None") -> Callable[[Any, int], Any]:
+    """Number getter for a numeric-operator side: fast path or RefValue adaptor."""
+    fast = _fast_number(node, registry)
+    if fast is not None:
+        return fast
+    return _numeric_adaptor(_typed(node))
+
+
+# =============================================================================
+# Conditions
+# =============================================================================
+
+def _cmp_gt(lhs, rhs) -> CompiledExpr:
+    def fn(snap, k):
+        a = lhs(snap, k)
+        if a is None:
+            return None
+        b = rhs(snap, k)
+        if b is None:
+            return None
+        return a > b
+    return fn
+
+
+def _cmp_lt(lhs, rhs) -> CompiledExpr:
+    def fn(snap, k):
+        a = lhs(snap, k)
+        if a is None:
+            return None
+        b = rhs(snap, k)
+        if b is None:
+            return None
+        return a < b
+    return fn
+
+
+def _cmp_ge(lhs, rhs) -> CompiledExpr:
+    def fn(snap, k):
+        a = lhs(snap, k)
+        if a is None:
+            return None
+        b = rhs(snap, k)
+        if b is None:
+            return None
+        return a >= b
+    return fn
+
+
+def _cmp_le(lhs, rhs) -> CompiledExpr:
+    def fn(snap, k):
+        a = lhs(snap, k)
+        if a is None:
+            return None
+        b = rhs(snap, k)
+        if b is None:
+            return None
+        return a <= b
+    return fn
+
+
+_COMPARE = {
+    ">": _cmp_gt,
+    "<": _cmp_lt,
+    ">=": _cmp_ge,
+    "<=": _cmp_le,
+}
+
+
+def _compare(op: str, lhs, rhs) -> CompiledExpr:
+    return _COMPARE[op](lhs, rhs)
+
+
+def _near_invalid(lhs, rhs) -> CompiledExpr:
+    # INVALID_TOLERANCE after both sides resolve
+    def fn(snap, k):
+        if lhs(snap, k) is None:
+            return None
+        rhs(snap, k)
+        return None
+    return fn
+
+
+def _near_abs(lhs, rhs, tolerance: float) -> CompiledExpr:
+    def fn(snap, k):
+        a = lhs(snap, k)
+        if a is None:
+            return None
+        b = rhs(snap, k)
+        if b is None:
+            return None
+        return abs(a - b) <= tolerance
+    return fn
+
+
+def _near_pct(lhs, rhs, tolerance: float) -> CompiledExpr:
+    def fn(snap, k):
+        a = lhs(snap, k)
+        if a is None:
+            return None
+        b = rhs(snap, k)
+        if b is None or b == 0:
+            return None
+        return abs(a - b) / abs(b) <= tolerance
+    return fn
+
+
+def _near(op: str, lhs, rhs, tolerance: float | None) -> CompiledExpr:
+    if tolerance is None or tolerance < 0:
+        return _near_invalid(lhs, rhs)
+    if op == "near_abs":
+        return _near_abs(lhs, rhs, tolerance)
+    return _near_pct(lhs, rhs, tolerance)  # near_pct
+
+
+def _discrete(op: str, lhs, rhs) -> CompiledExpr:
+    """== / != over RefValues with eval_eq()/eval_neq() type rules."""
+    negate = op == "!="
+
+    def fn(snap, k):
+        lv = lhs(snap, k)
+        if lv.is_missing:
+            return None
+        rv = rhs(snap, k)
+        if rv.is_missing:
+            return None
+        if lv.value_type is ValueType.FLOAT or rv.value_type is ValueType.FLOAT:
+            return None
+        if lv.value_type not in _DISCRETE_TYPES:
+            return None
+        a = lv.value
+        b = rv.value
+        if isinstance(a, str) and isinstance(b, str):
+            equal = a.upper() == b.upper()
+        else:
+            equal = bool(a == b)
+        return equal is not negate
+    return fn
+
+
+def _compile_crossover(cond: Cond, registry: "FeatureRegistry | None") -> CompiledExpr:
+    lhs_ref = cond.lhs
+    rhs = cond.rhs
+    above = cond.op == "cross_above"
+
+    if not isinstance(lhs_ref, FeatureRef):
+        lhs_typed = _typed(lhs_ref)
+
+        def arith_lhs(snap, k):
+            lhs_typed(snap, k)
+            return None
+        return arith_lhs
+
+    fast_curr = _fast_number(lhs_ref, registry)
+    fast_rhs = _fast_number(rhs, registry) if isinstance(rhs, (FeatureRef, ScalarValue)) else None
+    if fast_curr is not None and fast_rhs is not None:
+        lhs_prev = _feed_ref(lhs_ref.shifted(1))
+        rhs_prev = _feed_ref(rhs.shifted(1)) if isinstance(rhs, FeatureRef) else fast_rhs
+        lhs_curr = fast_curr
+        rhs_curr = fast_rhs
+
+        def fast_cross(snap, k):
+            lc = lhs_curr(snap, k)
+            if lc is None:
+                return None
+            lp = lhs_prev(snap, k)
+            if lp is None:
+                return None
+            rc = rhs_curr(snap, k)
+            if rc is None:
+                return None
+            rp = rhs_prev(snap, k)
+            if rp is None:
+                return None
+            if above:
+                return lp <= rp and lc > rc
+            return lp >= rp and lc < rc
+        return fast_cross
+
+    # RefValue path: missing checks only, raw values compared (eval_crossover)
+    t_lhs_curr = _typed_ref(lhs_ref)
+    t_lhs_prev = _typed_ref(lhs_ref.shifted(1))
+    if isinstance(rhs, ScalarValue):
+        literal = rhs.value
+
+        def literal_cross(snap, k):
+            lc = t_lhs_curr(snap, k)
+            if lc.is_missing:
+                return None
+            lp = t_lhs_prev(snap, k)
+            if lp.is_missing:
+                return None
+            if above:
+                return bool(lp.value <= literal and lc.value > literal)
+            return bool(lp.value >= literal and lc.value < literal)
+        return literal_cross
+    if isinstance(rhs, FeatureRef):
+        t_rhs_curr = _typed_ref(rhs)
+        t_rhs_prev = _typed_ref(rhs.shifted(1))
+
+        def ref_cross(snap, k):
+            lc = t_lhs_curr(snap, k)
+            if lc.is_missing:
+                return None
+            lp = t_lhs_prev(snap, k)
+            if lp.is_missing:
+                return None
+            rc = t_rhs_curr(snap, k)
+            if rc.is_missing:
+                return None
+            rp = t_rhs_prev(snap, k)
+            if rp.is_missing:
+                return None
+            if above:
+                return bool(lp.value <= rp.value and lc.value > rc.value)
+            return bool(lp.value >= rp.value and lc.value < rc.value)
+        return ref_cross
+
+    def unsupported_rhs(snap, k):
+        if t_lhs_curr(snap, k).is_missing:
+            return None
+        t_lhs_prev(snap, k)
+        return None
+    return unsupported_rhs
+
+
+def _compile_cond(cond: Cond, registry: "FeatureRegistry | None") -> CompiledExpr:
+    lhs = cond.lhs
+    rhs = cond.rhs
+    op = cond.op
+
+    if not isinstance(lhs, (FeatureRef, ArithmeticExpr)):
+        return _const(None)
+
+    if op in CROSSOVER_OPERATORS:
+        return _compile_crossover(cond, registry)
+
+    # RangeValue / ListValue select between / in regardless of op (eval_cond)
+    if isinstance(rhs, RangeValue):
+        value = _number(lhs, registry)
+        low, high = rhs.low, rhs.high
+
+        def between(snap, k):
+            a = value(snap, k)
+            if a is None:
+                return None
+            return low <= a <= high
+        return between
+
+    if isinstance(rhs, ListValue):
+        typed = _typed(lhs)
+        values = rhs.values
+
+        def in_list(snap, k):
+            lv = typed(snap, k)
+            if lv.is_missing:
+                return None
+            if lv.value_type is ValueType.FLOAT or lv.value_type not in _DISCRETE_TYPES:
+                return None
+            return lv.value in values
+        return in_list
+
+    if not isinstance(rhs, (ScalarValue, FeatureRef, ArithmeticExpr)):
+        typed = _typed(lhs)
+
+        def unknown_rhs(snap, k):
+            typed(snap, k)
+            return None
+        return unknown_rhs
+
+    if op in (">", "<", ">=", "<="):
+        return _compare(op, _number(lhs, registry), _number(rhs, registry))
+    if op in ("near_abs", "near_pct"):
+        return _near(op, _number(lhs, registry), _number(rhs, registry), cond.tolerance)
+    if op in ("==", "!="):
+        return _discrete(op, _typed(lhs), _typed(rhs))
+
+    # UNKNOWN_OPERATOR after both sides resolve
+    lhs_typed = _typed(lhs)
+    rhs_typed = _typed(rhs)
+
+    def unknown_op(snap, k):
+        if lhs_typed(snap, k).is_missing:
+            return None
+        rhs_typed(snap, k)
+        return None
+    return unknown_op
+
+
+# =============================================================================
+# Boolean / window / setup nodes
+# =============================================================================
+
+def _compile_all(children: list[CompiledExpr]) -> CompiledExpr:
+    if len(children) == 2:
+        first, second = children
+
+        def all2(snap, k):
+            r = first(snap, k)
+            if r is not True:
+                return r
+            return second(snap, k)
+        return all2
+
+    def all_n(snap, k):
+        for child in children:
+            r = child(snap, k)
+            if r is not True:
+                return r
+        return True
+    return all_n
+
+
+def _compile_any(children: list[CompiledExpr]) -> CompiledExpr:
+    def any_n(snap, k):
+        last = False  # empty any(): CONDITION_FAILED
+        for child in children:
+            r = child(snap, k)
+            if r is True:
+                return True
+            last = r
+        return last
+    return any_n
+
+
+def _compile_not(child: CompiledExpr) -> CompiledExpr:
+    def not_fn(snap, k):
+        r = child(snap, k)
+        if r is None:
+            return None
+        return not r
+    return not_fn
+
+
+def _offset_scale(anchor_tf: str | None) -> int:
+    if anchor_tf:
+        return tf_minutes(anchor_tf) // ACTION_TF_MINUTES
+    return 1
+
+
+def _holds_for(child: CompiledExpr, bars: int, scale: int) -> CompiledExpr:
+    steps = tuple(i * scale for i in range(bars))
+
+    def fn(snap, k):
+        for step in steps:
+            if child(snap, k + step) is not True:
+                return False
+        return True
+    return fn
+
+
+def _occurred_within(child: CompiledExpr, bars: int, scale: int) -> CompiledExpr:
+    steps = tuple(i * scale for i in range(bars))
+
+    def fn(snap, k):
+        for step in steps:
+            if child(snap, k + step) is True:
+                return True
+        return False
+    return fn
+
+
+def _count_true(child: CompiledExpr, bars: int, scale: int, min_true: int) -> CompiledExpr:
+    steps = tuple(i * scale for i in range(bars))
+
+    def fn(snap, k):
+        count = 0
+        for step in steps:
+            if child(snap, k + step) is True:
+                count += 1
+                if count >= min_true:
+                    return True
+        return count >= min_true
+    return fn
+
+
+class _Compiler:
+    """Recursive Expr -> closure translation for one Play."""
+
+    def __init__(self, setups: dict[str, Expr] | None, registry: "FeatureRegistry | None"):
+        self._setups = dict(setups or {})
+        self._registry = registry
+        self._setup_stack: set[str] = set()
+
+    def compile(self, expr: Expr) -> CompiledExpr:
+        registry = self._registry
+        if isinstance(expr, Cond):
+            return _compile_cond(expr, registry)
+        if isinstance(expr, AllExpr):
+            return _compile_all([self.compile(c) for c in expr.children])
+        if isinstance(expr, AnyExpr):
+            return _compile_any([self.compile(c) for c in expr.children])
+        if isinstance(expr, NotExpr):
+            return _compile_not(self.compile(expr.child))
+        if isinstance(expr, HoldsFor):
+            return _holds_for(self.compile(expr.expr), expr.bars, _offset_scale(expr.anchor_tf))
+        if isinstance(expr, OccurredWithin):
+            return _occurred_within(self.compile(expr.expr), expr.bars, _offset_scale(expr.anchor_tf))
+        if isinstance(expr, CountTrue):
+            return _count_true(
+                self.compile(expr.expr), expr.bars, _offset_scale(expr.anchor_tf), expr.min_true
+            )
+        if isinstance(expr, HoldsForDuration):
+            return _holds_for(self.compile(expr.expr), expr.to_bars(ACTION_TF_MINUTES), 1)
+        if isinstance(expr, OccurredWithinDuration):
+            return _occurred_within(self.compile(expr.expr), expr.to_bars(ACTION_TF_MINUTES), 1)
+        if isinstance(expr, CountTrueDuration):
+            return _count_true(
+                self.compile(expr.expr), expr.to_bars(ACTION_TF_MINUTES), 1, expr.min_true
+            )
+        if isinstance(expr, SetupRef):
+            return self._compile_setup(expr.setup_id)
+        return _const(None)
+
+    def _compile_setup(self, setup_id: str) -> CompiledExpr:
+        # Unknown and circular references are INTERNAL_ERROR in the interpreter.
+        # Each reference is compiled inline so a cycle breaks at the same edge.
+        if setup_id in self._setup_stack or setup_id not in self._setups:
+            return _const(None)
+        self._setup_stack.add(setup_id)
+        try:
+            inner = self.compile(self._setups[setup_id])
+        finally:
+            self._setup_stack.discard(setup_id)
+
+        # shift_expr() leaves SetupRef unshifted: always evaluate at offset 0
+        def setup(snap, k):
+            return inner(snap, 0)
+        return setup
+
+
+def compile_expr(
+    expr: Expr,
+    setups: dict[str, Expr] | None = None,
+    registry: "FeatureRegistry | None" = None,
+) -> CompiledExpr:
+    """
+    Compile an expression tree into a tri-state closure.
+
+    Args:
+        expr: Expression to compile
+        setups: Setup expressions for SetupRef nodes (Play.setups)
+        registry: Feature registry used to route references (Play.feature_registry)
+
+    Returns:
+        fn(snapshot, extra_offset) -> True / False / None (error)
+    """
+    return _Compiler(setups, registry).compile(expr)
+
+
+class CompiledBlocks:
+    """
+    Strategy blocks with pre-compiled case conditions.
+
+    Same first-match semantics and output as StrategyBlocksExecutor.execute().
+    """
+
+    __slots__ = ("_blocks",)
+
+    def __init__(self, blocks: list[_CompiledBlock]):
+        self._blocks = blocks
+
+    def execute(self, snapshot: "RuntimeSnapshotView") -> list["Intent"]:
+        """Execute all blocks and collect emitted intents."""
+        intents: list[Intent] = []
+        for cases, else_emit in self._blocks:
+            for when, emit in cases:
+                if when(snapshot, 0) is True:
+                    intents.extend(emit)
+                    break
+            else:
+                if else_emit:
+                    intents.extend(else_emit)
+        return intents
+
+
+def compile_blocks(
+    blocks: list["Block"],
+    setups: dict[str, Expr] | None = None,
+    registry: "FeatureRegistry | None" = None,
+) -> CompiledBlocks:
+    """Compile every case condition of a Play's action blocks."""
+    compiler = _Compiler(setups, registry)
+    compiled: list[_CompiledBlock] = []
+    for block in blocks:
+        cases = tuple((compiler.compile(case.when), case.emit) for case in block.cases)
+        compiled.append((cases, block.else_emit))
+    return CompiledBlocks(compiled)
@@ -0,0 +1,413 @@
+"""
+Vectorized entry pre-screen for Play action blocks.
+
+Most bars of a selective play are flat, have no working orders and fail
+every entry condition, yet the bar loop still builds a snapshot and walks
+the DSL tree for each of them. This module compiles the entry cases of a
+Play's action blocks into a whole-run boolean candidate mask with NumPy:
+
+    mask[i] == False  ->  no entry case can match on exec bar i
+
+The engine skips rule evaluation on such bars while flat with no open
+orders (PlayEngine.process_bar); every other bar is evaluated as before,
+so trades are identical.
+
+Soundness:
+- Conditions whose operands are exec-aligned FeedStore columns (OHLCV and
+  exec-feed indicators, any offset, arithmetic, crossovers, bar/duration
+  windows) are evaluated exactly, mirroring ExprEvaluator semantics
+  including missing values, short-circuit reason propagation and NOT.
+- Everything else (structures, last/mark price, forward-filled med/high TF
+  features, ==/!=/in) is "unknown" and contributes True to the upper bound.
+- A block whose else branch emits an entry makes every bar a candidate.
+
+Usage:
+    prescreen = compile_entry_prescreen(
+        play.actions, play.setups, resolve_column, n_bars,
+        allows_long=True, allows_short=True,
+    )
+    if not prescreen.mask[bar_idx]:
+        ...  # entry cannot fire on this bar
+"""
+
+from __future__ import annotations
+
+import math
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+from typing import Any
+
+import numpy as np
+
+from ..runtime.timeframe import tf_minutes
+from .dsl_nodes import (
+    ACTION_TF_MINUTES,
+    CROSSOVER_OPERATORS,
+    AllExpr,
+    AnyExpr,
+    ArithmeticExpr,
+    Cond,
+    CountTrue,
+    CountTrueDuration,
+    Expr,
+    FeatureRef,
+    HoldsFor,
+    HoldsForDuration,
+    NotExpr,
+    OccurredWithin,
+    OccurredWithinDuration,
+    RangeValue,
+    ScalarValue,
+    SetupRef,
+    WindowExpr,
+)
+
+# (feature_id, field) -> array with one value per exec bar, or None if the
+# reference is not a plain exec-aligned column.
+ColumnResolver = Callable[[str, str], "np.ndarray | None"]
+
+ENTRY_ACTIONS = ("entry_long", "entry_short")
+
+
+@dataclass
+class EntryPrescreen:
+    """Candidate mask for entry evaluation plus compile statistics."""
+    mask: np.ndarray          # bool per exec bar; True = an entry may fire
+    entry_cases: int          # cases that emit an allowed entry intent
+    exact_cases: int          # of those, compiled without unknown leaves
+
+    @property
+    def total_bars(self) -> int:
+        return int(self.mask.shape[0])
+
+    @property
+    def candidate_bars(self) -> int:
+        return int(np.count_nonzero(self.mask))
+
+    @property
+    def screens_anything(self) -> bool:
+        """False when every bar is a candidate (the pre-screen is useless)."""
+        return self.candidate_bars < self.total_bars
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "total_bars": self.total_bars,
+            "candidate_bars": self.candidate_bars,
+            "entry_cases": self.entry_cases,
+            "exact_cases": self.exact_cases,
+        }
+
+
+class _Vec:
+    """
+    Compiled node over all bars.
+
+    upper: bars where the node may evaluate ok (sound upper bound)
+    ok/err: exact ok flags and "error reason" flags (errors propagate
+        through NOT unchanged); None when the node has unknown leaves
+    """
+    __slots__ = ("upper", "ok", "err")
+
+    def __init__(self, upper: np.ndarray, ok: np.ndarray | None = None, err: np.ndarray | None = None):
+        self.upper = upper
+        self.ok = ok
+        self.err = err
+
+    @property
+    def exact(self) -> bool:
+        return self.ok is not None
+
+
+class _PrescreenCompiler:
+    """Compiles Expr trees into _Vec results over n_bars exec bars."""
+
+    def __init__(self, resolve_column: ColumnResolver, n_bars: int, setups: dict[str, Expr]):
+        self._resolve_column = resolve_column
+        self._n = n_bars
+        self._setups = setups
+        self._setup_stack: set[str] = set()
+        self._columns: dict[tuple[str, str], np.ndarray | None] = {}
+        self._true = np.ones(n_bars, dtype=bool)
+        self._false = np.zeros(n_bars, dtype=bool)
+
+    # ── Leaves ──
+
+    def _unknown(self) -> _Vec:
+        return _Vec(self._true)
+
+    def _exact(self, ok: np.ndarray, err: np.ndarray) -> _Vec:
+        return _Vec(ok, ok, err)
+
+    def _column(self, feature_id: str, field: str) -> np.ndarray | None:
+        key = (feature_id, field)
+        if key not in self._columns:
+            arr = self._resolve_column(feature_id, field)
+            if arr is not None:
+                arr = np.asarray(arr, dtype=np.float64)
+                if arr.shape[0] != self._n:
+                    arr = None
+            self._columns[key] = arr
+        return self._columns[key]
+
+    def _ref(self, ref: FeatureRef, offset: int) -> tuple[np.ndarray, np.ndarray] | None:
+        """Values and validity of a FeatureRef at every bar (snapshot.get_feature semantics)."""
+        arr = self._column(ref.feature_id, ref.field)
+        if arr is None:
+            return None
+        shift = ref.offset + offset
+        if shift == 0:
+            values = arr
+        else:
+            values = np.full(self._n, np.nan)
+            if shift < self._n:
+                values[shift:] = arr[: self._n - shift]
+        return values, np.isfinite(values)
+
+    def _operand(self, node: Any, offset: int) -> tuple[np.ndarray, np.ndarray] | None:
+        """Numeric operand (FeatureRef, ScalarValue or ArithmeticExpr), or None if unknown."""
+        if isinstance(node, FeatureRef):
+            return self._ref(node, offset)
+        if isinstance(node, ScalarValue):
+            value = node.value
+            if isinstance(value, bool) or not isinstance(value, (int, float)):
+                return None
+            if not math.isfinite(value):
+                return None
+            return np.full(self._n, float(value)), self._true
+        if isinstance(node, ArithmeticExpr):
+            left = self._operand(node.left, offset)
+            right = self._operand(node.right, offset)
+            if left is None or right is None:
+                return None
+            (lv, lok), (rv, rok) = left, right
+            valid = lok & rok
+            with np.errstate(all="ignore"):
+                if node.op == "+":
+                    result = lv + rv
+                elif node.op == "-":
+                    result = lv - rv
+                elif node.op == "*":
+                    result = lv * rv
+                elif node.op == "/":
+                    valid = valid & (rv != 0)
+                    result = lv / rv
+                elif node.op == "%":
+                    valid = valid & (rv != 0)
+                    result = np.mod(lv, rv)
+                else:
+                    return None
+            return result, valid & np.isfinite(result)
+        return None
+
+    # ── Conditions ──
+
+    def _cond(self, cond: Cond, offset: int) -> _Vec:
+        if cond.op in CROSSOVER_OPERATORS:
+            return self._crossover(cond, offset)
+
+        lhs = self._operand(cond.lhs, offset)
+        if lhs is None:
+            return self._unknown()
+        lv, lok = lhs
+
+        rhs_node = cond.rhs
+        if isinstance(rhs_node, RangeValue):
+            with np.errstate(invalid="ignore"):
+                hit = (lv >= rhs_node.low) & (lv <= rhs_node.high)
+            return self._exact(lok & hit, ~lok)
+
+        if cond.op not in (">", ">=", "<", "<=", "near_abs", "near_pct"):
+            return self._unknown()
+        rhs = self._operand(rhs_node, offset)
+        if rhs is None:
+            return self._unknown()
+        rv, rok = rhs
+        valid = lok & rok
+
+        with np.errstate(all="ignore"):
+            if cond.op == ">":
+                hit = lv > rv
+            elif cond.op == ">=":
+                hit = lv >= rv
+            elif cond.op == "<":
+                hit = lv < rv
+            elif cond.op == "<=":
+                hit = lv <= rv
+            elif cond.op == "near_abs":
+                if cond.tolerance is None or cond.tolerance < 0:
+                    return self._unknown()
+                hit = np.abs(lv - rv) <= cond.tolerance
+            else:  # near_pct
+                if cond.tolerance is None or cond.tolerance < 0:
+                    return self._unknown()
+                valid = valid & (rv != 0)
+                hit = np.abs(lv - rv) / np.abs(rv) <= cond.tolerance
+        return self._exact(valid & hit, ~valid)
+
+    def _crossover(self, cond: Cond, offset: int) -> _Vec:
+        if not isinstance(cond.lhs, FeatureRef):
+            return self._exact(self._false, self._true)  # INTERNAL_ERROR at runtime
+        lhs_curr = self._ref(cond.lhs, offset)
+        lhs_prev = self._ref(cond.lhs, offset + 1)
+        if lhs_curr is None or lhs_prev is None:
+            return self._unknown()
+
+        if isinstance(cond.rhs, ScalarValue):
+            rhs_curr = self._operand(cond.rhs, offset)
+            rhs_prev = rhs_curr
+        elif isinstance(cond.rhs, FeatureRef):
+            rhs_curr = self._ref(cond.rhs, offset)
+            rhs_prev = self._ref(cond.rhs, offset + 1)
+        else:
+            return self._unknown()
+        if rhs_curr is None or rhs_prev is None:
+            return self._unknown()
+
+        valid = lhs_curr[1] & lhs_prev[1] & rhs_curr[1] & rhs_prev[1]
+        with np.errstate(invalid="ignore"):
+            if cond.op == "cross_above":
+                hit = (lhs_prev[0] <= rhs_prev[0]) & (lhs_curr[0] > rhs_curr[0])
+            else:
+                hit = (lhs_prev[0] >= rhs_prev[0]) & (lhs_curr[0] < rhs_curr[0])
+        return self._exact(valid & hit, ~valid)
+
+    # ── Boolean and window nodes ──
+
+    def _all(self, children: Iterable[_Vec]) -> _Vec:
+        upper: np.ndarray = self._true
+        ok: np.ndarray = self._true
+        err: np.ndarray = self._false
+        exact = True
+        for child in children:
+            if exact and child.ok is not None and child.err is not None:
+                # First failing child's reason wins (short-circuit)
+                err = err | (ok & child.err)
+                ok = ok & child.ok
+            else:
+                exact = False
+            upper = upper & child.upper
+        return self._exact(ok, err) if exact else _Vec(upper)
+
+    def _any(self, children: Iterable[_Vec]) -> _Vec:
+        upper: np.ndarray = self._false
+        ok: np.ndarray = self._false
+        err: np.ndarray = self._false
+        exact = True
+        for child in children:
+            if exact and child.ok is not None and child.err is not None:
+                # When nothing passes, the last failure's reason is returned
+                ok = ok | child.ok
+                err = child.err
+            else:
+                exact = False
+            upper = upper | child.upper
+        return self._exact(ok, err & ~ok) if exact else _Vec(upper)
+
+    def _window_offsets(self, expr: WindowExpr) -> range:
+        if isinstance(expr, (HoldsFor, OccurredWithin, CountTrue)):
+            scale = 1
+            if expr.anchor_tf:
+                scale = tf_minutes(expr.anchor_tf) // ACTION_TF_MINUTES
+            return range(0, expr.bars * scale, scale)
+        return range(expr.to_bars(ACTION_TF_MINUTES))
+
+    def _window(self, expr: WindowExpr, offset: int) -> _Vec:
+        offsets = self._window_offsets(expr)
+        children = (self.compile(expr.expr, offset + o) for o in offsets)
+        if isinstance(expr, (HoldsFor, HoldsForDuration)):
+            combined = self._all(children)
+        elif isinstance(expr, (OccurredWithin, OccurredWithinDuration)):
+            combined = self._any(children)
+        else:
+            count = np.zeros(self._n, dtype=np.int32)
+            upper_count = np.zeros(self._n, dtype=np.int32)
+            exact = True
+            for child in children:
+                upper_count += child.upper
+                if child.ok is not None:
+                    count += child.ok
+                else:
+                    exact = False
+            if exact:
+                return self._exact(count >= expr.min_true, self._false)
+            return _Vec(upper_count >= expr.min_true)
+        # Window operators never return an error reason
+        if combined.ok is not None:
+            return self._exact(combined.ok, self._false)
+        return combined
+
+    def compile(self, expr: Expr, offset: int = 0) -> _Vec:
+        """Compile an expression, shifted by ``offset`` bars (as shift_expr would)."""
+        if isinstance(expr, Cond):
+            return self._cond(expr, offset)
+        if isinstance(expr, AllExpr):
+            return self._all(self.compile(c, offset) for c in expr.children)
+        if isinstance(expr, AnyExpr):
+            return self._any(self.compile(c, offset) for c in expr.children)
+        if isinstance(expr, NotExpr):
+            child = self.compile(expr.child, offset)
+            if child.ok is None or child.err is None:
+                return self._unknown()
+            return self._exact(~child.err & ~child.ok, child.err)
+        if isinstance(expr, (HoldsFor, OccurredWithin, CountTrue,
+                             HoldsForDuration, OccurredWithinDuration, CountTrueDuration)):
+            return self._window(expr, offset)
+        if isinstance(expr, SetupRef):
+            # shift_expr leaves SetupRef unshifted; unknown/circular setups are errors
+            setup_id = expr.setup_id
+            if setup_id in self._setup_stack or setup_id not in self._setups:
+                return self._exact(self._false, self._true)
+            self._setup_stack.add(setup_id)
+            try:
+                return self.compile(self._setups[setup_id], 0)
+            finally:
+                self._setup_stack.discard(setup_id)
+        return self._unknown()
+
+
+def compile_entry_prescreen(
+    blocks: Iterable[Any],
+    setups: dict[str, Expr] | None,
+    resolve_column: ColumnResolver,
+    n_bars: int,
+    allows_long: bool = True,
+    allows_short: bool = True,
+) -> EntryPrescreen:
+    """
+    Compile the entry cases of action blocks into a candidate mask.
+
+    Args:
+        blocks: Play action blocks (strategy_blocks.Block)
+        setups: Play setup expressions (setup_id -> Expr)
+        resolve_column: Maps (feature_id, field) to an exec-aligned array or None
+        n_bars: Number of exec bars
+        allows_long: Position policy allows long entries
+        allows_short: Position policy allows short entries
+
+    Returns:
+        EntryPrescreen; mask[i] is False only if no entry case can match at bar i
+    """
+    allowed = set()
+    if allows_long:
+        allowed.add("entry_long")
+    if allows_short:
+        allowed.add("entry_short")
+
+    compiler = _PrescreenCompiler(resolve_column, n_bars, dict(setups or {}))
+    mask = np.zeros(n_bars, dtype=bool)
+    entry_cases = 0
+    exact_cases = 0
+
+    for block in blocks:
+        if block.else_emit and any(i.action in allowed for i in block.else_emit):
+            mask[:] = True
+        for case in block.cases:
+            if not any(i.action in allowed for i in case.emit):
+                continue
+            entry_cases += 1
+            compiled = compiler.compile(case.when)
+            if compiled.exact:
+                exact_cases += 1
+            mask |= compiled.upper
+
+    return EntryPrescreen(mask=mask, entry_cases=entry_cases, exact_cases=exact_cases)
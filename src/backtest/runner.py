@@ -22,10 +22,15 @@ Enforces all gates before and after the run:
    - Prints console summary
    - Writes result.json
 
+5. Profile (RunnerConfig.profile or TRADE_PROFILE=1)
+   - Writes profile.json with per-phase timings (src/utils/profiler.py)
+   - RunnerConfig.profile_alloc / TRADE_PROFILE=alloc add per-phase
+     allocations, GC and retained memory per component (tracemalloc)
+
 If any gate fails, the runner stops and returns a failure status.
 """
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from datetime import datetime
 
 from src.utils.datetime_utils import datetime_to_epoch_ms
@@ -70,13 +75,23 @@ from .execution_validation import (
     compute_play_hash,
 )
 from .logging import RunLogger, set_run_logger
+from .runtime.feed_paging import DEFAULT_MEMORY_BUDGET_MB
 from src.utils.logger import get_module_logger
+from src.utils.profiler import (
+    peak_rss_mb,
+    profile_alloc_by_env,
+    profile_enabled_by_env,
+    profile_span,
+    profiling,
+    write_profile,
+)
 
 logger = get_module_logger(__name__)
 
 if TYPE_CHECKING:
     from ..forge.validation.synthetic_provider import SyntheticDataProvider
     from ..forge.validation.synthetic_data import PatternType
+    from .artifacts.result_cache import CachedRun
 
 
 class GateFailure(Exception):
@@ -236,33 +251,23 @@ def _resolve_window(play: Play, config: "RunnerConfig") -> None:
         )
 
 
-def _create_artifact_setup(
+def _build_input_components(
     play: Play,
     config: "RunnerConfig",
     synthetic_provider: "SyntheticDataProvider | None",
-) -> tuple[Path, str, str, str, InputHashComponents, RunManifest]:
-    """
-    Create artifact path config, compute hashes, create manifest.
-
-    Returns: (artifact_path, run_id, play_hash, data_source_id, input_components, manifest)
-    """
-    play_hash = compute_play_hash(play)
-    exec_tf = play.exec_tf
-    tf_ctx = sorted(play.feature_registry.get_all_tfs())
-
-    # Window must be resolved before artifact setup
-    assert config.window_start is not None, "window_start must be set before artifact setup"
-    assert config.window_end is not None, "window_end must be set before artifact setup"
+) -> InputHashComponents:
+    """Build the input hash components that identify a run (window must be resolved)."""
+    assert config.window_start is not None, "window_start must be set before hashing inputs"
+    assert config.window_end is not None, "window_end must be set before hashing inputs"
 
     # Determine data source ID
     data_source_id = "synthetic" if synthetic_provider is not None else f"duckdb_{config.data_env}"
 
-    # Build input hash components
-    input_components = InputHashComponents(
-        play_hash=play_hash,
+    return InputHashComponents(
+        play_hash=compute_play_hash(play),
         symbols=list(play.symbol_universe),
-        tf_exec=exec_tf,
-        tf_ctx=tf_ctx,
+        tf_exec=play.exec_tf,
+        tf_ctx=sorted(play.feature_registry.get_all_tfs()),
         window_start=config.window_start.strftime("%Y-%m-%d"),
         window_end=config.window_end.strftime("%Y-%m-%d"),
         fee_model_version="1.0.0",
@@ -275,6 +280,28 @@ def _create_artifact_setup(
         seed=None,
     )
 
+
+def _create_artifact_setup(
+    play: Play,
+    config: "RunnerConfig",
+    synthetic_provider: "SyntheticDataProvider | None",
+) -> tuple[Path, str, str, str, InputHashComponents, RunManifest]:
+    """
+    Create artifact path config, compute hashes, create manifest.
+
+    Returns: (artifact_path, run_id, play_hash, data_source_id, input_components, manifest)
+    """
+    # Window must be resolved before artifact setup
+    assert config.window_start is not None, "window_start must be set before artifact setup"
+    assert config.window_end is not None, "window_end must be set before artifact setup"
+
+    # Build input hash components
+    input_components = _build_input_components(play, config, synthetic_provider)
+    play_hash = input_components.play_hash
+    exec_tf = input_components.tf_exec
+    tf_ctx = input_components.tf_ctx
+    data_source_id = input_components.data_source_id
+
     # Compute hashes
     full_hash = input_components.compute_full_hash()
     short_hash = input_components.compute_short_hash()
@@ -336,6 +363,44 @@ def _create_artifact_setup(
     return artifact_path, run_id, play_hash, data_source_id, input_components, manifest
 
 
+def _result_cache_key(
+    play: Play,
+    config: "RunnerConfig",
+    synthetic_provider: "SyntheticDataProvider | None",
+) -> str | None:
+    """
+    Run-result cache key, or None when this run must not use the cache.
+
+    Needs a data fingerprint: the synthetic provider's data hash, or
+    config.data_fingerprint supplied by the caller for DuckDB runs.
+    Snapshot runs always execute (snapshots need the live engine frames),
+    as do streaming runs (they exist to exercise the bounded-memory pager,
+    and the key does not cover streaming or memory_budget_mb).
+    """
+    if not config.use_result_cache or config.emit_snapshots or config.streaming:
+        return None
+    if synthetic_provider is not None:
+        data_fingerprint = getattr(synthetic_provider, "data_hash", None)
+    else:
+        data_fingerprint = config.data_fingerprint
+    if not data_fingerprint:
+        return None
+
+    from .artifacts.result_cache import compute_result_cache_key
+
+    assert config.window_start is not None and config.window_end is not None
+    components = _build_input_components(play, config, synthetic_provider)
+    return compute_result_cache_key(
+        components.compute_full_hash(),
+        data_fingerprint,
+        {
+            "window_start": config.window_start.isoformat(),
+            "window_end": config.window_end.isoformat(),
+            "structure_backend": config.structure_backend,
+        },
+    )
+
+
 def _run_preflight_gate(
     ctx: _RunContext,
 ) -> PreflightReport | None:
@@ -498,15 +563,19 @@ def _execute_backtest(
 
     # Create engine and run
     # use_synthetic=True only when a synthetic_provider was explicitly set up
-    engine = create_engine_from_play(
-        play=ctx.play,
-        window_start=ctx.config.window_start,
-        window_end=ctx.config.window_end,
-        warmup_by_tf=ctx.preflight_warmup_by_role,
-        synthetic_provider=synthetic_provider,
-        data_env=ctx.config.data_env,
-        use_synthetic=(synthetic_provider is not None),
-    )
+    with profile_span("prep"):
+        engine = create_engine_from_play(
+            play=ctx.play,
+            window_start=ctx.config.window_start,
+            window_end=ctx.config.window_end,
+            warmup_by_tf=ctx.preflight_warmup_by_role,
+            synthetic_provider=synthetic_provider,
+            data_env=ctx.config.data_env,
+            use_synthetic=(synthetic_provider is not None),
+            structure_backend=ctx.config.structure_backend,
+            streaming=ctx.config.streaming,
+            memory_budget_mb=ctx.config.memory_budget_mb,
+        )
     engine.set_play_hash(ctx.play_hash)
 
     from src.utils.logging_config import bind_engine_context, clear_engine_context
@@ -533,7 +602,7 @@ def _execute_backtest(
 
 
 def _write_backtest_journal(ctx: _RunContext) -> None:
-    """Write backtest events to events.jsonl in the artifact folder."""
+    """Write backtest events to the artifact folder's journal (events.jsonl by default)."""
     if ctx.artifact_path is None or not ctx.trades:
         return
 
@@ -561,6 +630,8 @@ def _write_backtest_journal(ctx: _RunContext) -> None:
             entry_price=entry_price, exit_price=exit_price, pnl=pnl, reason=reason,
         )
 
+    journal.close()
+
 
 def _write_trade_artifacts(ctx: _RunContext) -> int | None:
     """
@@ -656,6 +727,8 @@ def _write_results_summary(ctx: _RunContext) -> ResultsSummary:
         equity_curve=ctx.equity_curve,
         artifact_path=str(ctx.artifact_path),
         run_duration_seconds=run_duration,
+        peak_rss_mb=peak_rss_mb(),
+        streaming=ctx.config.streaming,
         play_hash=ctx.play_hash,
         pipeline_version=PIPELINE_VERSION,
         resolved_play_path=resolved_play_path,
@@ -872,6 +945,26 @@ class RunnerConfig:
 
     # Data environment (backtest, live) - determines which DuckDB to use
     data_env: DataEnv = "backtest"
+
+    # Structure backend ("incremental" reference, or "vectorized" precompute)
+    structure_backend: str = "incremental"
+
+    # Streaming: memory-mapped feeds paged under memory_budget_mb instead of
+    # whole in-memory frames (see engine_stream_prep.py); same results
+    streaming: bool = False
+    memory_budget_mb: int = DEFAULT_MEMORY_BUDGET_MB
+
+    # Run-result cache: reuse an identical earlier run (see artifacts/result_cache.py).
+    # DuckDB runs also need data_fingerprint (HistoricalDataStore.data_fingerprint);
+    # synthetic runs use the provider's data hash.
+    use_result_cache: bool = False
+    data_fingerprint: str | None = None
+
+    # Per-phase profiling: writes profile.json to the artifact folder and
+    # bypasses the result cache (TRADE_PROFILE=1 enables it for every run)
+    profile: bool = False
+    # Also trace allocations per phase (implies profile; TRADE_PROFILE=alloc)
+    profile_alloc: bool = False
     
     def load_play(self) -> Play:
         """Load the Play if not already loaded."""
@@ -903,6 +996,13 @@ class RunnerResult:
     error_message: str | None = None
     gate_failed: str | None = None
 
+    # Set when the result came from the run-result cache (summary, trades, equity)
+    cache_hit: bool = False
+    cached_run: "CachedRun | None" = None
+
+    # Set when the run was profiled (profile.json in the artifact folder)
+    profile_path: Path | None = None
+
     def to_dict(self) -> dict[str, Any]:
         """Convert to dict for serialization."""
         return {
@@ -914,6 +1014,8 @@ class RunnerResult:
             "summary": self.summary.to_dict() if self.summary else None,
             "error_message": self.error_message,
             "gate_failed": self.gate_failed,
+            "cache_hit": self.cache_hit,
+            "profile_path": str(self.profile_path) if self.profile_path else None,
         }
 
 
@@ -934,6 +1036,28 @@ def run_backtest_with_gates(
     Returns:
         RunnerResult with success status and all gate results
     """
+    if not (config.profile or config.profile_alloc or profile_enabled_by_env()):
+        return _run_backtest_with_gates(config, synthetic_provider)
+
+    # Profiled runs always execute: a cached result has nothing to time
+    alloc = config.profile_alloc or profile_alloc_by_env()
+    config = replace(config, profile=True, profile_alloc=alloc, use_result_cache=False)
+    play_id = config.play_id or (config.play.id if config.play else "")
+    with profiling(alloc=alloc, play_id=play_id) as prof:
+        result = _run_backtest_with_gates(config, synthetic_provider)
+    assert prof is not None
+    if result.success and result.artifact_path is not None:
+        prof.meta.update(run_id=result.run_id, bars=result.summary.total_bars if result.summary else None)
+        result.profile_path = write_profile(prof, result.artifact_path / STANDARD_FILES["profile"])
+        logger.info("Profile written to: %s", result.profile_path)
+    return result
+
+
+def _run_backtest_with_gates(
+    config: RunnerConfig,
+    synthetic_provider: "SyntheticDataProvider | None" = None,
+) -> RunnerResult:
+    """run_backtest_with_gates() body (profiling is set up by the caller)."""
     # Initialize context and result
     ctx = _RunContext(
         config=config,
@@ -944,6 +1068,13 @@ def run_backtest_with_gates(
     result = ctx.result
 
     try:
+        if config.streaming and config.emit_snapshots:
+            raise ValueError(
+                "Snapshot emission needs the in-memory indicator frames; streaming runs do not keep them\n"
+                "\n"
+                "Fix: drop --emit-snapshots or --streaming"
+            )
+
         # Phase 1: Load Play and setup synthetic data
         ctx.play = config.load_play()
         synthetic_provider = _setup_synthetic_provider(ctx.play, config, synthetic_provider)
@@ -957,6 +1088,25 @@ def run_backtest_with_gates(
         ctx.symbol = ctx.play.symbol_universe[0]
         ctx.exec_tf = ctx.play.exec_tf
 
+        # Phase 3b: Run-result cache (same inputs, data and engine code)
+        result_cache = None
+        cache_key = _result_cache_key(ctx.play, config, synthetic_provider)
+        if cache_key is not None:
+            from .artifacts.result_cache import RunResultCache
+
+            result_cache = RunResultCache(config.base_output_dir)
+            cached = result_cache.lookup(cache_key)
+            if cached is not None:
+                logger.info("Result cache hit: %s", cached.artifact_path)
+                result.success = True
+                result.cache_hit = True
+                result.run_id = cached.summary.run_id
+                result.artifact_path = cached.artifact_path
+                result.summary = cached.summary
+                result.cached_run = cached
+                cached.summary.print_summary()
+                return result
+
         # Phase 4: Create artifact setup (hashes, paths, manifest)
         (
             ctx.artifact_path,
@@ -983,10 +1133,12 @@ def run_backtest_with_gates(
         ctx.run_logger.info("Run started", play_id=ctx.play.id, symbol=ctx.symbol, tf=ctx.exec_tf)
 
         # Phase 6: Run preflight gate
-        _run_preflight_gate(ctx)
+        with profile_span("gates.preflight"):
+            _run_preflight_gate(ctx)
 
         # Phase 7: Run indicator requirements gate
-        _run_indicator_gate(ctx.play, result)
+        with profile_span("gates.indicators"):
+            _run_indicator_gate(ctx.play, result)
 
         # Phase 8: Get warmup configuration
         ctx.preflight_warmup_by_role, ctx.preflight_delay_by_role = _get_warmup_config(
@@ -1009,17 +1161,21 @@ def run_backtest_with_gates(
                     pass  # Unknown classification — non-terminal
 
         # Phase 9c: Write backtest journal (events.jsonl)
-        _write_backtest_journal(ctx)
+        with profile_span("artifacts.journal"):
+            _write_backtest_journal(ctx)
 
         # Phase 10: Write trade artifacts
-        eval_start_ts_ms = _write_trade_artifacts(ctx)
+        with profile_span("artifacts.trades"):
+            eval_start_ts_ms = _write_trade_artifacts(ctx)
 
         # Phase 11: Write results summary
-        summary = _write_results_summary(ctx)
+        with profile_span("artifacts.summary"):
+            summary = _write_results_summary(ctx)
         result.summary = summary
 
         # Phase 12: Write pipeline signature
-        _write_pipeline_signature(ctx)
+        with profile_span("artifacts.signature"):
+            _write_pipeline_signature(ctx)
 
         # Phase 13: Update manifest with eval_start_ts_ms
         ctx.manifest.eval_start_ts_ms = eval_start_ts_ms
@@ -1027,16 +1183,20 @@ def run_backtest_with_gates(
         ctx.manifest.write_json(ctx.artifact_path / "run_manifest.json")
 
         # Phase 14: Run artifact validation gate
-        _run_artifact_validation(ctx)
+        with profile_span("artifacts.validation"):
+            _run_artifact_validation(ctx)
 
         # Phase 14b: Log artifact path at INFO
         logger.info("Artifacts written to: %s", ctx.artifact_path)
 
         # Phase 15: Emit snapshots (if requested)
-        _emit_snapshots(ctx)
+        with profile_span("artifacts.snapshots"):
+            _emit_snapshots(ctx)
 
         # Phase 16: Success
         result.success = True
+        if result_cache is not None and cache_key is not None:
+            result_cache.store(cache_key, ctx.artifact_path)
         ctx.run_logger.finalize(
             net_pnl=summary.net_pnl_usdt if summary else None,
             trades_count=summary.trades_count if summary else None,
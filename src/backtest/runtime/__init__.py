@@ -17,6 +17,7 @@ Submodules:
 - windowing: Load window computation
 - snapshot_view: View-based snapshot (performance)
 - feed_store: Precomputed array storage
+- feed_paging: Memory-mapped feed columns and pager (streaming runs)
 - cache: Multi-timeframe feature caching
 - quote_state: 1m price feed for px.last/px.mark
 
@@ -37,6 +38,8 @@ from .types import (
 )
 
 from .feed_store import FeedStore, MultiTFFeedStore
+from .feed_paging import ColumnSpill, FeedPager, DEFAULT_MEMORY_BUDGET_MB
+from .alignment import AlignmentTable, build_alignment_table
 from .snapshot_view import RuntimeSnapshotView, TFContext
 from src.indicators.metadata import (
     IndicatorMetadata,
@@ -93,6 +96,11 @@ __all__ = [
     # View-based (performance)
     "FeedStore",
     "MultiTFFeedStore",
+    "ColumnSpill",
+    "FeedPager",
+    "DEFAULT_MEMORY_BUDGET_MB",
+    "AlignmentTable",
+    "build_alignment_table",
     "RuntimeSnapshotView",
     "TFContext",
     # Indicator metadata (provenance tracking)
@@ -0,0 +1,196 @@
+"""
+Precomputed multi-timeframe alignment table for the backtest loop.
+
+Built once per run from the FeedStores, the table turns every per-bar
+timestamp lookup into an array index:
+
+    exec_idx -> low_tf_idx / med_tf_idx / high_tf_idx   TF bar closing at the
+                                                         exec close, -1 if none
+    exec_idx -> quote_start / quote_end                  1m bars inside the exec
+                                                         bar (inclusive)
+    exec_idx -> funding_idx                              last funding settlement
+                                                         at or before the close
+
+The TF columns hold exact close matches, not forward-filled values:
+TFIndexManager keeps the forward-fill state (and its "changed" flags) and
+only replaces FeedStore.get_idx_at_ts_close() with a column read. The 1m
+columns reproduce FeedStore.get_1m_indices_for_exec() including its edge
+cases (no 1m bar after the exec open -> (len-1, len-1); none at or before
+the exec close -> (0, 0)).
+
+Open interest needs no column: build_market_data_arrays() already
+forward-fills it onto the exec index, using last_at_or_before() below.
+
+All timestamps are epoch ms of UTC-naive closes, so DST transitions and
+data gaps are plain integer comparisons: a gap in a higher TF leaves its
+column at -1 (forward-fill holds the previous bar), a gap in 1m data
+narrows or empties the quote range exactly as the bisect version does.
+
+Parity against the timestamp lookups: python trade_cli.py debug alignment
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from .feed_store import _datetime_to_epoch_ms, _np_dt64_to_epoch_ms
+
+if TYPE_CHECKING:
+    from .feed_store import FeedStore
+
+
+def timestamps_to_ms(values) -> np.ndarray:
+    """Epoch ms (int64) of a datetime64 array or a sequence of datetimes."""
+    arr = np.asarray(values)
+    if arr.dtype.kind == "M":
+        return arr.astype("datetime64[ms]").astype(np.int64)
+    return np.fromiter(
+        (
+            _np_dt64_to_epoch_ms(v) if isinstance(v, np.datetime64) else _datetime_to_epoch_ms(v)
+            for v in arr
+        ),
+        dtype=np.int64,
+        count=len(arr),
+    )
+
+
+def last_at_or_before(times_ms: np.ndarray, events_ms: np.ndarray) -> np.ndarray:
+    """
+    Index of the last event at or before each time (-1 if none).
+
+    events_ms must be sorted ascending; equal timestamps resolve to the
+    last one, like a forward scan that keeps the latest event.
+    """
+    return (np.searchsorted(events_ms, times_ms, side="right") - 1).astype(np.int32)
+
+
+def _close_index(feed: "FeedStore") -> tuple[np.ndarray, np.ndarray]:
+    """(sorted close epoch ms, feed index of each) of a FeedStore."""
+    if feed.close_ms is not None:
+        return feed.close_ms, np.arange(feed.close_ms.shape[0], dtype=np.int32)
+    sorted_ms = np.asarray(feed._sorted_close_ms, dtype=np.int64)
+    to_idx = np.fromiter(
+        (feed.ts_close_ms_to_idx[ms] for ms in feed._sorted_close_ms),
+        dtype=np.int32,
+        count=sorted_ms.size,
+    )
+    return sorted_ms, to_idx
+
+
+def _exact_close_idx(exec_close_ms: np.ndarray, feed: "FeedStore") -> np.ndarray:
+    """Index of the feed bar closing exactly at each exec close (-1 if none)."""
+    sorted_ms, to_idx = _close_index(feed)
+    if sorted_ms.size == 0:
+        return np.full(exec_close_ms.shape[0], -1, dtype=np.int32)
+    pos = np.searchsorted(sorted_ms, exec_close_ms, side="left")
+    pos_c = np.minimum(pos, sorted_ms.size - 1)
+    hit = (pos < sorted_ms.size) & (sorted_ms[pos_c] == exec_close_ms)
+    return np.where(hit, to_idx[pos_c], -1).astype(np.int32)
+
+
+def _quote_ranges(
+    exec_open_ms: np.ndarray,
+    exec_close_ms: np.ndarray,
+    quote_feed: "FeedStore",
+) -> tuple[np.ndarray, np.ndarray]:
+    """Vectorized FeedStore.get_1m_indices_for_exec() for every exec bar."""
+    n = exec_close_ms.shape[0]
+    sorted_ms, to_idx = _close_index(quote_feed)
+    count = sorted_ms.size
+    if count == 0:
+        # get_1m_indices_for_exec: start_pos >= 0 == len -> (length-1, length-1)
+        last = quote_feed.length - 1
+        return np.full(n, last, dtype=np.int32), np.full(n, last, dtype=np.int32)
+    start_pos = np.searchsorted(sorted_ms, exec_open_ms, side="right")
+    end_pos = np.searchsorted(sorted_ms, exec_close_ms, side="right")
+    start = to_idx[np.minimum(start_pos, count - 1)]
+    end = to_idx[np.maximum(end_pos - 1, 0)]
+    # No 1m close at or before the exec close: (0, 0)
+    before_start = end_pos == 0
+    start = np.where(before_start, 0, start)
+    end = np.where(before_start, 0, end)
+    # No 1m close after the exec open (checked first): (len-1, len-1)
+    past_end = start_pos >= count
+    last = quote_feed.length - 1
+    start = np.where(past_end, last, start)
+    end = np.where(past_end, last, end)
+    return start.astype(np.int32), end.astype(np.int32)
+
+
+@dataclass(slots=True)
+class AlignmentTable:
+    """
+    Per-exec-bar indices into the other feeds (contiguous int32 columns).
+
+    Columns are None when the corresponding feed or data is absent.
+    """
+    exec_close_ms: np.ndarray
+    low_tf_idx: np.ndarray | None = None
+    med_tf_idx: np.ndarray | None = None
+    high_tf_idx: np.ndarray | None = None
+    quote_start: np.ndarray | None = None
+    quote_end: np.ndarray | None = None
+    funding_idx: np.ndarray | None = None
+
+    @property
+    def length(self) -> int:
+        return int(self.exec_close_ms.shape[0])
+
+    def quote_range(self, exec_idx: int) -> tuple[int, int]:
+        """(start_1m_idx, end_1m_idx) inclusive, same as get_1m_indices_for_exec()."""
+        if self.quote_start is None or self.quote_end is None:
+            raise ValueError("AlignmentTable has no quote feed columns")
+        return int(self.quote_start[exec_idx]), int(self.quote_end[exec_idx])
+
+    def forward_filled(self, role: str) -> np.ndarray:
+        """
+        Forward-filled index of a TF role per exec bar, as TFIndexManager
+        reports it when stepped over every exec bar from 0 (starts at 0).
+        """
+        col = {"low_tf": self.low_tf_idx, "med_tf": self.med_tf_idx, "high_tf": self.high_tf_idx}.get(role)
+        if col is None:
+            raise ValueError(f"AlignmentTable has no column for role '{role}'")
+        pos = np.where(col >= 0, np.arange(col.shape[0]), -1)
+        np.maximum.accumulate(pos, out=pos)
+        return np.where(pos >= 0, col[np.maximum(pos, 0)], 0).astype(np.int32)
+
+
+def build_alignment_table(
+    exec_feed: "FeedStore",
+    low_tf_feed: "FeedStore | None" = None,
+    med_tf_feed: "FeedStore | None" = None,
+    high_tf_feed: "FeedStore | None" = None,
+    quote_feed: "FeedStore | None" = None,
+) -> AlignmentTable:
+    """
+    Build the alignment table for one run.
+
+    Args:
+        exec_feed: Feed the engine steps on (exec_idx indexes this feed)
+        low_tf_feed: low_tf FeedStore (for exec roles med_tf / high_tf)
+        med_tf_feed: med_tf FeedStore, None if same as low_tf
+        high_tf_feed: high_tf FeedStore, None if same as med_tf / low_tf
+        quote_feed: 1m FeedStore for sub-loop and fill ranges
+
+    Returns:
+        AlignmentTable with one row per exec bar
+    """
+    exec_close_ms = timestamps_to_ms(exec_feed.ts_close)
+    table = AlignmentTable(exec_close_ms=exec_close_ms)
+    if low_tf_feed is not None:
+        table.low_tf_idx = _exact_close_idx(exec_close_ms, low_tf_feed)
+    if med_tf_feed is not None:
+        table.med_tf_idx = _exact_close_idx(exec_close_ms, med_tf_feed)
+    if high_tf_feed is not None:
+        table.high_tf_idx = _exact_close_idx(exec_close_ms, high_tf_feed)
+    if quote_feed is not None and quote_feed.length > 0:
+        exec_open_ms = timestamps_to_ms(exec_feed.ts_open)
+        table.quote_start, table.quote_end = _quote_ranges(exec_open_ms, exec_close_ms, quote_feed)
+    if exec_feed.funding_settlement_times:
+        settlements = np.fromiter(sorted(exec_feed.funding_settlement_times), dtype=np.int64)
+        table.funding_idx = last_at_or_before(exec_close_ms, settlements)
+    return table
+
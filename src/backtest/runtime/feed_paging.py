@@ -0,0 +1,239 @@
+"""
+Memory-mapped FeedStore columns and a resident-memory pager.
+
+Streaming backtests (backtest run --streaming) do not keep FeedStore
+arrays on the heap. ColumnSpill writes every column of a feed to an
+anonymous temp file and maps it back read-only; the arrays index exactly
+like in-memory ones and the OS loads pages on first access. The temp
+files have no name on disk and disappear with the last mapping.
+
+FeedPager bounds how much of that data stays resident. The exec cursor
+moves forward only, so as it advances the pager drops the pages of every
+feed that closed more than a trailing window ago (madvise MADV_DONTNEED).
+The window is sized so that all feeds together fit the memory budget:
+
+    window_ms = 3/4 * budget / sum(row_bytes / tf_ms)   (per feed)
+
+Releases run every window/3 of exec time, so resident feed data peaks at
+about the budget. A released page is read back from the file if an older
+bar is accessed again: paging is a residency hint, results never depend
+on it.
+
+Platforms without madvise (Windows) keep the mapping but skip releases;
+clean mapped pages are still evicted by the OS under memory pressure.
+"""
+
+from __future__ import annotations
+
+import mmap
+import tempfile
+from pathlib import Path
+
+import numpy as np
+
+from .timeframe import tf_duration
+from ...utils.logger import get_module_logger
+
+logger = get_module_logger(__name__)
+
+# Resident budget for mapped feed data (backtest run --memory-budget-mb)
+DEFAULT_MEMORY_BUDGET_MB = 256
+
+# Bars per OHLCV range query while streaming a feed in
+STREAM_CHUNK_BARS = 100_000
+
+_PAGE = mmap.PAGESIZE
+_CAN_RELEASE = hasattr(mmap, "MADV_DONTNEED") and hasattr(mmap.mmap, "madvise")
+
+
+def _release(mm: mmap.mmap, start: int, end: int) -> None:
+    """Drop the resident pages of mm that lie in bytes [start, end)."""
+    start -= start % _PAGE
+    if end < len(mm):
+        end -= end % _PAGE  # keep the page the next row starts on
+    else:
+        end = len(mm)
+    if end > start:
+        mm.madvise(mmap.MADV_DONTNEED, start, end - start)
+
+
+class ColumnWriter:
+    """Append-only column file; finish() maps it back as a read-only array."""
+
+    def __init__(self, spill: "ColumnSpill", dtype: np.dtype | type | str) -> None:
+        self._spill = spill
+        self.dtype = np.dtype(dtype)
+        self.length = 0
+        self._file = tempfile.TemporaryFile(prefix="trade_feed_", dir=spill.directory)
+
+    def append(self, values: np.ndarray) -> None:
+        arr = np.ascontiguousarray(values, dtype=self.dtype)
+        self._file.write(arr.view(np.uint8).data)  # datetime64 has no buffer protocol
+        self.length += arr.shape[0]
+
+    def finish(self) -> np.ndarray:
+        return self._spill._map(self._file, self.dtype, self.length)
+
+
+class ColumnSpill:
+    """
+    Read-only memory-mapped columns of one feed.
+
+    All columns of a spill hold one value per feed bar, so row_bytes (sum of
+    item sizes) is the mapped size of one bar.
+
+    Attributes:
+        directory: Temp directory of the column files (None: system default)
+        nbytes: Mapped bytes across all columns
+        row_bytes: Mapped bytes per bar across all columns
+    """
+
+    def __init__(self, directory: Path | str | None = None) -> None:
+        self.directory = str(directory) if directory is not None else None
+        self.nbytes = 0
+        self.row_bytes = 0
+        self._maps: list[tuple[mmap.mmap, int]] = []
+
+    def writer(self, dtype: np.dtype | type | str) -> ColumnWriter:
+        """Open a column to be written in chunks."""
+        return ColumnWriter(self, dtype)
+
+    def write(self, values: np.ndarray) -> np.ndarray:
+        """Spill a whole column and return its read-only mapped array."""
+        writer = self.writer(values.dtype)
+        writer.append(values)
+        return writer.finish()
+
+    def _map(self, file, dtype: np.dtype, length: int) -> np.ndarray:
+        try:
+            if length == 0:
+                return np.empty(0, dtype=dtype)
+            file.flush()
+            mm = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        finally:
+            file.close()
+        self._maps.append((mm, dtype.itemsize))
+        self.nbytes += len(mm)
+        self.row_bytes += dtype.itemsize
+        return np.frombuffer(mm, dtype=dtype, count=length)
+
+    def release_rows(self, start: int, end: int) -> None:
+        """Drop resident pages holding rows [start, end) of every column."""
+        if not _CAN_RELEASE or end <= start:
+            return
+        for mm, itemsize in self._maps:
+            _release(mm, start * itemsize, end * itemsize)
+
+    def release_all(self) -> None:
+        """Drop every resident page of these columns."""
+        if not _CAN_RELEASE:
+            return
+        for mm, _ in self._maps:
+            _release(mm, 0, len(mm))
+
+
+class _PagedFeed:
+    """One feed under a FeedPager."""
+
+    __slots__ = ("close_ms", "spill", "tf", "released")
+
+    def __init__(self, close_ms: np.ndarray, spill: ColumnSpill, tf: str) -> None:
+        self.close_ms = close_ms
+        self.spill = spill
+        self.tf = tf
+        self.released = 0  # rows [0, released) already dropped
+
+
+class FeedPager:
+    """
+    Keeps the mapped pages of streamed feeds resident only near the exec cursor.
+
+    Usage:
+        pager = FeedPager(memory_budget_mb=256)
+        pager.add(low_tf_feed.close_ms, low_tf_spill, low_tf_feed.tf)
+        pager.add(quote_feed.close_ms, quote_spill, "1m")
+        pager.set_exec(exec_feed.close_ms, exec_feed.tf)
+        for bar_idx in ...:
+            ...
+            pager.advance(bar_idx)
+
+    Attributes:
+        memory_budget_mb: Resident budget for all mapped feed data
+        window_ms: Trailing window kept resident (0 until set_exec)
+        releases: Number of release passes so far
+    """
+
+    def __init__(self, memory_budget_mb: int = DEFAULT_MEMORY_BUDGET_MB) -> None:
+        if memory_budget_mb <= 0:
+            raise ValueError(
+                f"memory_budget_mb must be > 0, got {memory_budget_mb}\n"
+                f"\n"
+                f"Fix: --memory-budget-mb {DEFAULT_MEMORY_BUDGET_MB}"
+            )
+        self.memory_budget_mb = memory_budget_mb
+        self.window_ms = 0
+        self.releases = 0
+        self._feeds: list[_PagedFeed] = []
+        self._exec_close_ms: np.ndarray | None = None
+        self._stride = 1
+        self._next_idx = 0
+        self._started = False
+
+    def add(self, close_ms: np.ndarray, spill: ColumnSpill, tf: str) -> None:
+        """Register a feed: its ts_close epoch ms, its columns and its timeframe."""
+        self._feeds.append(_PagedFeed(close_ms, spill, tf))
+
+    @property
+    def mapped_bytes(self) -> int:
+        return sum(feed.spill.nbytes for feed in self._feeds)
+
+    @property
+    def active(self) -> bool:
+        """False when everything fits the budget or madvise is unavailable."""
+        return self._exec_close_ms is not None and self.window_ms > 0
+
+    def set_exec(self, close_ms: np.ndarray, tf: str) -> None:
+        """Set the feed the cursor steps on and size the resident window."""
+        self._exec_close_ms = close_ms
+        budget = self.memory_budget_mb * 1024 * 1024
+        if not _CAN_RELEASE or self.mapped_bytes <= budget:
+            self.window_ms = 0
+            self._next_idx = close_ms.shape[0]
+            return
+        bytes_per_ms = sum(
+            feed.spill.row_bytes / (tf_duration(feed.tf).total_seconds() * 1000)
+            for feed in self._feeds
+        )
+        exec_tf_ms = tf_duration(tf).total_seconds() * 1000
+        self.window_ms = max(int(budget * 3 / 4 / bytes_per_ms), int(exec_tf_ms))
+        self._stride = max(1, int(self.window_ms / 3 / exec_tf_ms))
+        self._next_idx = 0
+        logger.info(
+            "Feed pager: %.1f MB mapped, budget %d MB, resident window %.1f days",
+            self.mapped_bytes / (1024 * 1024), self.memory_budget_mb, self.window_ms / 86_400_000,
+        )
+
+    def release_all(self) -> None:
+        """Drop every resident page of every feed."""
+        for feed in self._feeds:
+            feed.spill.release_all()
+
+    def advance(self, exec_idx: int) -> None:
+        """Release pages of bars closed a full window before exec bar exec_idx (no-op before set_exec)."""
+        exec_close_ms = self._exec_close_ms
+        if exec_close_ms is None or exec_idx < self._next_idx:
+            return
+        self._next_idx = exec_idx + self._stride
+        self.releases += 1
+        if not self._started:
+            # Data prep, the prescreen and the alignment table read whole
+            # columns; start the run from an empty resident set
+            self._started = True
+            self.release_all()
+            return
+        cutoff = int(exec_close_ms[exec_idx]) - self.window_ms
+        for feed in self._feeds:
+            row = int(np.searchsorted(feed.close_ms, cutoff, side="right"))
+            if row > feed.released:
+                feed.spill.release_rows(feed.released, row)
+                feed.released = row
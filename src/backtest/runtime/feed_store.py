@@ -93,6 +93,10 @@ class FeedStore:
         
         # O(1) ts_close->index mapping (epoch ms -> array index)
         ts_close_ms_to_idx: Dict of epoch_ms (int) -> index (int)
+
+        # Array-indexed close lookups (streaming backtests)
+        close_ms: Sorted int64 epoch ms of ts_close; when set, the three
+            lookup structures above stay empty and lookups binary-search it
     """
     tf: str
     symbol: str
@@ -130,6 +134,10 @@ class FeedStore:
     # Built once in __post_init__, used by get_last_closed_idx_at_or_before()
     _sorted_close_ms: list[int] = field(default_factory=list)
 
+    # Strictly increasing ts_close epoch ms (int64), replaces the three
+    # per-bar Python structures above for memory-mapped (streamed) feeds
+    close_ms: np.ndarray | None = None
+
     # Length
     length: int = 0
 
@@ -159,6 +167,8 @@ class FeedStore:
         
         for name, arr in self.indicators.items():
             assert len(arr) == self.length, f"indicator {name} length mismatch"
+        if self.close_ms is not None:
+            assert len(self.close_ms) == self.length, "close_ms length mismatch"
         
         # Metadata coverage check (if metadata is provided, it must match indicators)
         if self.indicator_metadata:
@@ -198,6 +208,8 @@ class FeedStore:
     
     def is_close_at(self, ts: datetime) -> bool:
         """Check if ts is a close timestamp for this TF."""
+        if self.close_ms is not None:
+            return self.get_idx_at_ts_close(ts) is not None
         return ts in self.close_ts_set
     
     def get_idx_at_ts_close(self, ts: datetime) -> int | None:
@@ -217,6 +229,10 @@ class FeedStore:
             ts_ms = _np_dt64_to_epoch_ms(ts)
         else:
             ts_ms = _datetime_to_epoch_ms(ts)
+        close_ms = self.close_ms
+        if close_ms is not None:
+            pos = int(np.searchsorted(close_ms, ts_ms, side="left"))
+            return pos if pos < close_ms.shape[0] and close_ms[pos] == ts_ms else None
         return self.ts_close_ms_to_idx.get(ts_ms)
 
     def get_last_closed_idx_at_or_before(self, ts: datetime) -> int | None:
@@ -232,6 +248,10 @@ class FeedStore:
         Returns:
             Array index of last closed bar, or None if none found
         """
+        if self.close_ms is not None:
+            pos = int(np.searchsorted(self.close_ms, self._ts_to_ms(ts), side="right"))
+            return pos - 1 if pos > 0 else None
+
         if not self._sorted_close_ms:
             return None
 
@@ -289,6 +309,15 @@ class FeedStore:
         open_ms = self._ts_to_ms(exec_ts_open)
         close_ms = self._ts_to_ms(exec_ts_close)
 
+        if self.close_ms is not None:
+            start_pos = int(np.searchsorted(self.close_ms, open_ms, side="right"))
+            if start_pos >= self.length:
+                return (self.length - 1, self.length - 1)
+            end_pos = int(np.searchsorted(self.close_ms, close_ms, side="right"))
+            if end_pos == 0:
+                return (0, 0)
+            return (start_pos, end_pos - 1)
+
         # Find first 1m bar whose ts_close > exec_ts_open
         start_pos = bisect.bisect_right(self._sorted_close_ms, open_ms)
         if start_pos >= len(self._sorted_close_ms):
@@ -928,6 +928,11 @@ class RuntimeSnapshotView:
                         return None
                 return value
 
+        indicator_key, tf_role = self._indicator_key_and_role(feature_id, field)
+        return self.get_feature(indicator_key, tf_role=tf_role, offset=offset)
+
+    def _indicator_key_and_role(self, feature_id: str, field: str | None) -> tuple[str, str]:
+        """Map a non-structure feature reference to its FeedStore key and TF role."""
         # Build the indicator key dynamically
         # - Single-output indicators: field is None/empty/"value" -> key = feature_id
         #   ("value" is the DSL default field for single-output indicators)
@@ -965,7 +970,54 @@ class RuntimeSnapshotView:
                     tf_role = "low_tf"
                 # else: fallback to exec (which is alias to one of the above)
 
-        return self.get_feature(indicator_key, tf_role=tf_role, offset=offset)
+        return indicator_key, tf_role
+
+    def exec_aligned_column(self, feature_id: str, field: str | None = None) -> np.ndarray | None:
+        """
+        Whole-run array behind a feature reference, if it is indexed by exec_idx.
+
+        Used by the entry pre-screen (src/backtest/rules/prescreen.py) to
+        evaluate conditions for every bar at once. Returns None for anything
+        whose per-bar value is not a plain exec-feed lookup: last/mark price,
+        market data, structures, or indicators on a forward-filled
+        med/high TF feed.
+
+        Args:
+            feature_id: Feature ID as used in the DSL
+            field: Optional multi-output field
+
+        Returns:
+            Array with one value per exec bar (NaN = missing), or None
+        """
+        if feature_id in ("last_price", "mark_price", "funding_rate", "open_interest"):
+            return None
+        if "." in feature_id:
+            return None
+        if self._feature_registry is not None:
+            feature = self._feature_registry.get_or_none(feature_id)
+            if feature is not None and feature.is_structure:
+                return None
+
+        indicator_key, tf_role = self._indicator_key_and_role(feature_id, field)
+        ctx = self._ctx_for_role(tf_role)
+        if ctx is None or ctx is not self.exec_ctx:
+            return None
+
+        feed = ctx.feed
+        if indicator_key in ("open", "high", "low", "close", "volume"):
+            return getattr(feed, indicator_key)
+        return feed.indicators.get(indicator_key)
+
+    def _ctx_for_role(self, tf_role: str) -> TFContext | None:
+        if tf_role == "exec":
+            return self.exec_ctx
+        if tf_role == "low_tf":
+            return self.low_tf_ctx
+        if tf_role == "med_tf":
+            return self.med_tf_ctx
+        if tf_role == "high_tf":
+            return self.high_tf_ctx
+        return None
 
     # =========================================================================
     # Staleness (for multi-TF forward-fill validation)
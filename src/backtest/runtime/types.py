@@ -85,7 +85,7 @@ class HistoryConfig:
 DEFAULT_HISTORY_CONFIG = HistoryConfig()
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Bar:
     """
     Single OHLCV bar with explicit open/close timestamps.
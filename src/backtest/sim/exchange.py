@@ -16,12 +16,16 @@ Tool-calling pipeline (in process_bar):
 4. ledger: update(fills, funding, prices) -> LedgerUpdate
 5. liquidation: check(ledger_state, prices) -> LiquidationResult
 6. metrics: record(step_result) -> MetricsUpdate
+
+Idle bars (no position, empty order book) stop after pricing: only the
+ledger's flat mark-to-market runs and a reused empty StepResult is returned.
 """
 
 from __future__ import annotations
 
 from dataclasses import dataclass
 from datetime import datetime
+from time import perf_counter_ns
 from typing import TYPE_CHECKING
 
 from .types import (
@@ -47,7 +51,7 @@ from .types import (
 )
 from .ledger import Ledger, LedgerConfig
 from .pricing import PriceModel, PriceModelConfig, SpreadModel, SpreadConfig, IntrabarPath
-from .pricing.intrabar_path import check_tp_sl_1m
+from .pricing.intrabar_path import check_tp_sl_1m_range
 from .execution import ExecutionModel, ExecutionModelConfig, SlippageConfig
 from .funding import FundingModel
 from .liquidation import LiquidationModel
@@ -55,6 +59,7 @@ from .metrics import ExchangeMetrics, ExchangeMetricsSnapshot
 from .constraints import Constraints, ConstraintConfig
 
 from ..types import Trade
+from ...utils.profiler import active_profiler
 
 if TYPE_CHECKING:
     from ..system_config import RiskProfileConfig
@@ -154,6 +159,8 @@ class SimulatedExchange:
         self._current_ts: datetime | None = None
         self._current_bar_index: int = 0
         self._last_mark_price: float | None = None  # Track last mark price for position queries
+        # Reused by process_bar() on idle bars (flat, empty book); see _idle_step()
+        self._idle_step_result: StepResult | None = None
 
         # Phase 4: Snapshot readiness context (set by engine each bar)
         self._current_snapshot_ready: bool = True
@@ -184,31 +191,31 @@ class SimulatedExchange:
     
     @property
     def cash_balance_usdt(self) -> float:
-        return self._ledger.state.cash_balance_usdt
+        return self._ledger.cash_balance_usdt
     
     @property
     def unrealized_pnl_usdt(self) -> float:
-        return self._ledger.state.unrealized_pnl_usdt
+        return self._ledger.unrealized_pnl_usdt
     
     @property
     def equity_usdt(self) -> float:
-        return self._ledger.state.equity_usdt
+        return self._ledger.equity_usdt
     
     @property
     def used_margin_usdt(self) -> float:
-        return self._ledger.state.used_margin_usdt
+        return self._ledger.used_margin_usdt
     
     @property
     def free_margin_usdt(self) -> float:
-        return self._ledger.state.free_margin_usdt
+        return self._ledger.free_margin_usdt
     
     @property
     def available_balance_usdt(self) -> float:
-        return self._ledger.state.available_balance_usdt
+        return self._ledger.available_balance_usdt
     
     @property
     def maintenance_margin(self) -> float:
-        return self._ledger.state.maintenance_margin_usdt
+        return self._ledger.maintenance_margin_usdt
     
     # Config properties (for test compatibility)
     @property
@@ -235,7 +242,7 @@ class SimulatedExchange:
     @property
     def total_fees_paid(self) -> float:
         """Total fees paid (from ledger, single source of truth)."""
-        return self._ledger.state.total_fees_paid
+        return self._ledger.total_fees_paid
 
     @property
     def last_mark_price(self) -> float | None:
@@ -645,23 +652,19 @@ class SimulatedExchange:
         # 1. Use 1m granular check if available
         if quote_feed is not None and exec_1m_range is not None:
             start_1m, end_1m = exec_1m_range
-            bars_1m = []
-            for i in range(start_1m, min(end_1m + 1, quote_feed.length)):
-                bars_1m.append((
-                    float(quote_feed.open[i]),
-                    float(quote_feed.high[i]),
-                    float(quote_feed.low[i]),
-                    float(quote_feed.close[i]),
-                ))
-
-            if bars_1m:
+            end_excl = min(end_1m + 1, quote_feed.length)
+
+            if end_excl > start_1m:
                 position_side = "long" if self.position.side == OrderSide.LONG else "short"
-                result_1m = check_tp_sl_1m(
+                result_1m = check_tp_sl_1m_range(
                     position_side=position_side,
                     entry_price=self.position.entry_price,
                     take_profit=self.position.take_profit,
                     stop_loss=self.position.stop_loss,
-                    bars_1m=bars_1m,
+                    high=quote_feed.high,
+                    low=quote_feed.low,
+                    start=start_1m,
+                    end=end_excl,
                     tp_trigger_by=self.position.tp_trigger_by,
                     sl_trigger_by=self.position.sl_trigger_by,
                     prices=prices,
@@ -724,7 +727,7 @@ class SimulatedExchange:
 
         # Compute projected equity at this mark price
         projected_unrealized_pnl = self.position.unrealized_pnl(mark_price)
-        projected_equity = self._ledger.state.cash_balance_usdt + projected_unrealized_pnl
+        projected_equity = self._ledger.cash_balance_usdt + projected_unrealized_pnl
 
         # Check maintenance margin threshold (includes fee-to-close)
         assert self._fee_rate is not None
@@ -785,24 +788,44 @@ class SimulatedExchange:
             atr_value: Optional ATR value for ATR-based trailing stops
 
         Returns:
-            StepResult with mark_price, fills, and all step events
+            StepResult with mark_price, fills, and all step events.
+            On idle bars (no position, empty order book) this is a shared
+            result object that is overwritten by the next idle bar.
         """
         ts_open = bar.ts_open
         step_time = bar.ts_close
         self._current_ts = step_time
-        fills: list[Fill] = []
+
+        # Per-step timing (None unless profiling, see src/utils/profiler.py)
+        prof = active_profiler()
+        t = perf_counter_ns() if prof is not None else 0
 
         # 1. Compute prices (mark price is single source of truth)
         spread = self._spread_model.get_spread(bar)
         prices = self._price_model.get_prices(bar, spread)
         mark_price = prices.mark_price
         self._last_mark_price = mark_price
+        if prof is not None:
+            t = prof.lap("runner.fills.exchange.prices", t)
+
+        # Idle fast path: with no position and nothing on the book, steps 2-9
+        # cannot produce fills, funding, exits or a liquidation.
+        if self.position is None and self._order_book.is_empty:
+            if prof is None:
+                return self._idle_step(step_time, mark_price, prices)
+            result = self._idle_step(step_time, mark_price, prices)
+            prof.lap("runner.fills.exchange.idle", t)
+            return result
+
+        fills: list[Fill] = []
 
         # 2. Apply funding events
         prev_ts = prev_bar.ts_close if prev_bar else None
         funding_result = self._apply_funding_events(
             funding_events, prev_ts, step_time, mark_price
         )
+        if prof is not None:
+            t = prof.lap("runner.fills.exchange.funding", t)
 
         # Steps 3-6: Exit processing order matches Bybit's live behavior.
         #
@@ -818,14 +841,20 @@ class SimulatedExchange:
         # 3. Process order book (pending limit/stop entries)
         order_book_fills = self._process_order_book(bar, quote_feed, exec_1m_range, prices=prices)
         fills.extend(order_book_fills)
+        if prof is not None:
+            t = prof.lap("runner.fills.exchange.order_book", t)
 
         # 4. Update dynamic stops (before TP/SL check so trailing/BE
         #    adjustments apply to this bar's trigger evaluation)
         self._update_dynamic_stops(mark_price, trailing_config, break_even_config, atr_value)
+        if prof is not None:
+            t = prof.lap("runner.fills.exchange.dynamic_stops", t)
 
         # 5. Check TP/SL exits (exchange-side, highest priority)
         tpsl_trades, tpsl_fills = self._check_tp_sl_exits(bar, ts_open, quote_feed, exec_1m_range, prices=prices)
         fills.extend(tpsl_fills)
+        if prof is not None:
+            t = prof.lap("runner.fills.exchange.tp_sl", t)
 
         # 6. Process pending close (signal exits — only if TP/SL didn't
         #    already close the position)
@@ -837,11 +866,15 @@ class SimulatedExchange:
 
         # 8. Update ledger with mark price (must precede liquidation check
         #    so unrealized PnL and margin are current)
-        self._ledger.update_for_mark_price(self.position, mark_price)
+        self._ledger.mark_to_market(self.position, mark_price)
+        if prof is not None:
+            t = prof.lap("runner.fills.exchange.close_and_ledger", t)
 
         # 9. Check liquidation (uses up-to-date ledger state from step 8)
         liq_trades, liq_fills, liq_result = self._check_liquidation(bar, mark_price, step_time, prices)
         fills.extend(liq_fills)
+        if prof is not None:
+            t = prof.lap("runner.fills.exchange.liquidation", t)
 
         step_result = StepResult(
             timestamp=step_time,
@@ -857,8 +890,39 @@ class SimulatedExchange:
 
         # Record exchange-side metrics (slippage, fees, fills, liquidations)
         self._exchange_metrics.record_step(step_result)
+        if prof is not None:
+            prof.lap("runner.fills.exchange.metrics", t)
 
         return step_result
+
+    def _idle_step(
+        self,
+        step_time: datetime,
+        mark_price: float,
+        prices: "PriceSnapshot",
+    ) -> StepResult:
+        """
+        Finish a bar with no position and an empty order book.
+
+        Funding and exits need a position and the order book is empty, so
+        only the ledger's mark-to-market (with no position) remains. An empty
+        StepResult records nothing in ExchangeMetrics, so recording is skipped
+        and one result object is reused instead of allocating per bar.
+        """
+        self._ledger.mark_to_market(None, mark_price)
+
+        result = self._idle_step_result
+        if result is None:
+            result = StepResult(
+                timestamp=step_time,
+                mark_price_source=self._mark_source,
+            )
+            self._idle_step_result = result
+        result.timestamp = step_time
+        result.ts_close = step_time
+        result.mark_price = mark_price
+        result.prices = prices
+        return result
     
     def _process_order_book(
         self,
@@ -1345,7 +1409,7 @@ class SimulatedExchange:
             "position": self.position.to_dict() if self.position else None,
             "entries_disabled": self.entries_disabled,
             "total_trades": len(self.trades),
-            "total_fees_paid": self._ledger.state.total_fees_paid,
+            "total_fees_paid": self._ledger.total_fees_paid,
         }
 
     def update_trailing_stop(
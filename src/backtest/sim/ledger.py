@@ -115,6 +115,40 @@ class Ledger:
             maintenance_margin_usdt=self._maintenance_margin_usdt,
             total_fees_paid=self._total_fees_paid,
         )
+
+    # Scalar reads (no LedgerState allocation; the exchange reads these per bar)
+
+    @property
+    def cash_balance_usdt(self) -> float:
+        return self._cash_balance_usdt
+
+    @property
+    def unrealized_pnl_usdt(self) -> float:
+        return self._unrealized_pnl_usdt
+
+    @property
+    def equity_usdt(self) -> float:
+        return self._equity_usdt
+
+    @property
+    def used_margin_usdt(self) -> float:
+        return self._used_margin_usdt
+
+    @property
+    def free_margin_usdt(self) -> float:
+        return self._free_margin_usdt
+
+    @property
+    def available_balance_usdt(self) -> float:
+        return self._available_balance_usdt
+
+    @property
+    def maintenance_margin_usdt(self) -> float:
+        return self._maintenance_margin_usdt
+
+    @property
+    def total_fees_paid(self) -> float:
+        return self._total_fees_paid
     
     def check_invariants(self) -> list[str]:
         """
@@ -182,6 +216,19 @@ class Ledger:
         Returns:
             LedgerUpdate with current state
         """
+        self.mark_to_market(position, mark_price)
+        return LedgerUpdate(
+            state=self.state,
+            realized_pnl=0.0,
+            fees_paid=0.0,
+            funding_paid=0.0,
+        )
+    
+    def mark_to_market(self, position: Position | None, mark_price: float) -> None:
+        """
+        Same state change as update_for_mark_price() without building a
+        LedgerUpdate / LedgerState (per-bar hot path).
+        """
         if position is None:
             self._unrealized_pnl_usdt = 0.0
             self._used_margin_usdt = 0.0
@@ -212,13 +259,6 @@ class Ledger:
 
         self._recompute_derived()
 
-        return LedgerUpdate(
-            state=self.state,
-            realized_pnl=0.0,
-            fees_paid=0.0,
-            funding_paid=0.0,
-        )
-    
     def apply_entry_fee(self, fee: float) -> None:
         """
         Apply entry fee (deduct from cash balance).
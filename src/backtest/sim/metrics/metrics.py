@@ -12,6 +12,7 @@ These are exchange/execution metrics only.
 Strategy-level metrics are computed separately in engine.
 """
 
+from array import array
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Any
@@ -90,9 +91,9 @@ class ExchangeMetrics:
     
     def _reset(self) -> None:
         """Reset all metrics to zero."""
-        # Slippage tracking
-        self._slippage_amounts: list[float] = []  # USD amounts
-        self._slippage_bps_list: list[float] = []
+        # Slippage tracking (packed float64 columns, one entry per fill)
+        self._slippage_amounts = array("d")  # USD amounts
+        self._slippage_bps_list = array("d")
         
         # Fee tracking
         self._entry_fees = 0.0
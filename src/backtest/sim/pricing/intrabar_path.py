@@ -19,6 +19,8 @@ Tie-break rules:
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 
+import numpy as np
+
 from ..types import Bar, PricePoint, PriceSnapshot, OrderSide, FillReason, TriggerSource
 
 
@@ -262,6 +264,45 @@ class IntrabarPath:
             return bar.close
 
 
+def _check_tp_sl_snapshot(
+    is_long: bool,
+    take_profit: float | None,
+    stop_loss: float | None,
+    tp_trigger_by: TriggerSource,
+    sl_trigger_by: TriggerSource,
+    prices: PriceSnapshot | None,
+) -> tuple[str, int, float] | None:
+    """Check the single mark/index point of non-LAST triggers (reported as bar 0)."""
+    if prices is None:
+        return None
+
+    # Check SL on mark/index (single point, not per-1m)
+    if sl_trigger_by != TriggerSource.LAST_PRICE and stop_loss is not None:
+        sl_price = (prices.mark_price if sl_trigger_by == TriggerSource.MARK_PRICE
+                    else prices.index_price)
+        if is_long and sl_price <= stop_loss:
+            return ("stop_loss", 0, stop_loss)
+        if not is_long and sl_price >= stop_loss:
+            return ("stop_loss", 0, stop_loss)
+
+    # Check TP on mark/index (single point, not per-1m)
+    if tp_trigger_by != TriggerSource.LAST_PRICE and take_profit is not None:
+        tp_price = (prices.mark_price if tp_trigger_by == TriggerSource.MARK_PRICE
+                    else prices.index_price)
+        if is_long and tp_price >= take_profit:
+            return ("take_profit", 0, take_profit)
+        if not is_long and tp_price <= take_profit:
+            return ("take_profit", 0, take_profit)
+
+    return None
+
+
+def _first_hit(mask: np.ndarray) -> int:
+    """Index of the first True in mask, -1 if none."""
+    idx = int(mask.argmax())
+    return idx if mask[idx] else -1
+
+
 def check_tp_sl_1m(
     position_side: str,
     entry_price: float,
@@ -304,30 +345,12 @@ def check_tp_sl_1m(
         return None
 
     is_long = position_side.lower() == "long"
-
-    # For non-LAST triggers, check the single mark/index point first.
-    # If triggered, report as bar_idx=0 (earliest possible timing).
     sl_uses_last = sl_trigger_by == TriggerSource.LAST_PRICE
     tp_uses_last = tp_trigger_by == TriggerSource.LAST_PRICE
 
-    if prices is not None:
-        # Check SL on mark/index (single point, not per-1m)
-        if not sl_uses_last and stop_loss is not None:
-            sl_price = (prices.mark_price if sl_trigger_by == TriggerSource.MARK_PRICE
-                        else prices.index_price)
-            if is_long and sl_price <= stop_loss:
-                return ("stop_loss", 0, stop_loss)
-            if not is_long and sl_price >= stop_loss:
-                return ("stop_loss", 0, stop_loss)
-
-        # Check TP on mark/index (single point, not per-1m)
-        if not tp_uses_last and take_profit is not None:
-            tp_price = (prices.mark_price if tp_trigger_by == TriggerSource.MARK_PRICE
-                        else prices.index_price)
-            if is_long and tp_price >= take_profit:
-                return ("take_profit", 0, take_profit)
-            if not is_long and tp_price <= take_profit:
-                return ("take_profit", 0, take_profit)
+    hit = _check_tp_sl_snapshot(is_long, take_profit, stop_loss, tp_trigger_by, sl_trigger_by, prices)
+    if hit is not None:
+        return hit
 
     # For LAST_PRICE triggers (or fallback), iterate 1m bars
     if not sl_uses_last and not tp_uses_last:
@@ -350,3 +373,63 @@ def check_tp_sl_1m(
 
     return None
 
+
+def check_tp_sl_1m_range(
+    position_side: str,
+    entry_price: float,
+    take_profit: float | None,
+    stop_loss: float | None,
+    high: np.ndarray,
+    low: np.ndarray,
+    start: int,
+    end: int,
+    tp_trigger_by: TriggerSource = TriggerSource.LAST_PRICE,
+    sl_trigger_by: TriggerSource = TriggerSource.LAST_PRICE,
+    prices: PriceSnapshot | None = None,
+) -> tuple[str, int, float] | None:
+    """check_tp_sl_1m() over a slice of the 1m high/low arrays.
+
+    Same result as check_tp_sl_1m() with bars_1m built from
+    [start, end) of the quote feed, without building the tuple list:
+    the first SL and TP hit indices are found with vectorized compares
+    and SL wins ties (conservative tie-break).
+
+    Args:
+        high: 1m high array (FeedStore.high)
+        low: 1m low array (FeedStore.low)
+        start: First 1m index (inclusive)
+        end: Last 1m index (exclusive, clamped by the caller)
+
+    Returns:
+        Tuple of (reason, hit_bar_idx, exit_price) or None if no hit;
+        hit_bar_idx is relative to start
+    """
+    if (take_profit is None and stop_loss is None) or end <= start:
+        return None
+
+    is_long = position_side.lower() == "long"
+    sl_uses_last = sl_trigger_by == TriggerSource.LAST_PRICE and stop_loss is not None
+    tp_uses_last = tp_trigger_by == TriggerSource.LAST_PRICE and take_profit is not None
+
+    hit = _check_tp_sl_snapshot(is_long, take_profit, stop_loss, tp_trigger_by, sl_trigger_by, prices)
+    if hit is not None:
+        return hit
+    if not sl_uses_last and not tp_uses_last:
+        return None
+
+    sl_idx = -1
+    if sl_uses_last:
+        sl_idx = _first_hit(low[start:end] <= stop_loss if is_long else high[start:end] >= stop_loss)
+    tp_idx = -1
+    if tp_uses_last:
+        # TP can only win strictly before the first SL hit
+        tp_end = end if sl_idx < 0 else start + sl_idx
+        if tp_end > start:
+            tp_idx = _first_hit(high[start:tp_end] >= take_profit if is_long else low[start:tp_end] <= take_profit)
+
+    # A hit index is only set when its level is not None
+    if tp_idx >= 0 and take_profit is not None:
+        return ("take_profit", tp_idx, take_profit)
+    if sl_idx >= 0 and stop_loss is not None:
+        return ("stop_loss", sl_idx, stop_loss)
+    return None
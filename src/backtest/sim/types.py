@@ -9,6 +9,7 @@ Provides all shared types, enums, events, and snapshots:
 
 Type design principles:
 - Immutable where possible (frozen dataclasses)
+- Slotted: created per order / fill / bar, so no per-instance __dict__
 - Explicit naming with "_usdt" suffix for all monetary values
 - Serializable (to_dict methods)
 
@@ -119,7 +120,7 @@ from ..runtime.types import Bar
 # Order
 # ─────────────────────────────────────────────────────────────────────────────
 
-@dataclass
+@dataclass(slots=True)
 class Order:
     """
     Order waiting to be filled.
@@ -215,7 +216,7 @@ class Order:
 # Position
 # ─────────────────────────────────────────────────────────────────────────────
 
-@dataclass
+@dataclass(slots=True)
 class Position:
     """
     Currently open position.
@@ -304,7 +305,7 @@ class Position:
 # Fill
 # ─────────────────────────────────────────────────────────────────────────────
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Fill:
     """
     Record of an order fill.
@@ -346,7 +347,7 @@ class Fill:
 # Events
 # ─────────────────────────────────────────────────────────────────────────────
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class FundingEvent:
     """
     Funding rate event.
@@ -368,7 +369,7 @@ class FundingEvent:
         }
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class LiquidationEvent:
     """
     Liquidation event.
@@ -405,7 +406,7 @@ class LiquidationEvent:
 # Price Snapshot
 # ─────────────────────────────────────────────────────────────────────────────
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PriceSnapshot:
     """
     Point-in-time price state.
@@ -445,7 +446,7 @@ class PriceSnapshot:
 # Intrabar Path
 # ─────────────────────────────────────────────────────────────────────────────
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PricePoint:
     """
     Single point in intrabar price path.
@@ -471,7 +472,7 @@ class PricePoint:
 # Result Types
 # ─────────────────────────────────────────────────────────────────────────────
 
-@dataclass
+@dataclass(slots=True)
 class Rejection:
     """Order rejection record."""
     order_id: OrderId
@@ -491,7 +492,7 @@ class Rejection:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class FillResult:
     """Result of order execution within a bar."""
     fills: list[Fill] = field(default_factory=list)
@@ -506,7 +507,7 @@ class FillResult:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class FundingResult:
     """Result of funding application."""
     funding_pnl: float = 0.0
@@ -519,7 +520,7 @@ class FundingResult:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class LiquidationResult:
     """Result of liquidation check."""
     liquidated: bool = False
@@ -538,7 +539,7 @@ class LiquidationResult:
 # Ledger State
 # ─────────────────────────────────────────────────────────────────────────────
 
-@dataclass
+@dataclass(slots=True)
 class LedgerState:
     """
     Complete ledger state at a point in time.
@@ -573,7 +574,7 @@ class LedgerState:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class LedgerUpdate:
     """Result of ledger update after fills/funding."""
     state: LedgerState
@@ -594,7 +595,7 @@ class LedgerUpdate:
 # Step Result
 # ─────────────────────────────────────────────────────────────────────────────
 
-@dataclass
+@dataclass(slots=True)
 class StepResult:
     """
     Result of processing a single bar.
@@ -26,6 +26,8 @@ def setup_argparse() -> argparse.Namespace:
       backtest data-fix    Fix data gaps/coverage
       backtest list        List available Plays
 
+      bench                Offline performance benchmarks vs stored baseline
+
       debug math-parity    Per-play real-data math verification
       debug snapshot-plumbing  Snapshot field correctness
       debug determinism    Compare two specific run hashes
@@ -77,6 +79,7 @@ Examples:
     _setup_backtest_subcommands(subparsers)
     _setup_play_subcommands(subparsers)
     _setup_validate_subcommand(subparsers)
+    _setup_bench_subcommand(subparsers)
     _setup_debug_subcommands(subparsers)
     _setup_account_subcommands(subparsers)
     _setup_position_subcommands(subparsers)
@@ -121,6 +124,13 @@ def _setup_backtest_subcommands(subparsers) -> None:
     from src.forge.validation import PATTERN_GENERATORS
     run_parser.add_argument("--synthetic-pattern", choices=list(PATTERN_GENERATORS.keys()), default=None, help="Override pattern from play's validation.pattern")
     run_parser.add_argument("--trace", action="store_true", default=False, dest="engine_trace", help="Enable verbose engine tracing (bar OHLCV, signal results, position changes)")
+    run_parser.add_argument("--structure-backend", choices=["incremental", "vectorized"], default="incremental", help="Structure backend: incremental (reference, default) or vectorized (precompute eligible structures per TF)")
+    run_parser.add_argument("--no-cache", action="store_true", help="Always execute; ignore stored results of identical earlier runs (same inputs, data and engine code)")
+    run_parser.add_argument("--robustness", type=int, default=None, metavar="N", help="After the run, write robustness.json from N Monte Carlo/bootstrap resamples per method")
+    run_parser.add_argument("--profile", action="store_true", help="Time each engine/runner phase; writes profile.json to the artifact folder and prints a flame-style summary (implies --no-cache)")
+    run_parser.add_argument("--profile-alloc", action="store_true", help="Like --profile, plus tracemalloc allocations per phase, GC pauses and retained memory per source file (slower)")
+    run_parser.add_argument("--streaming", action="store_true", help="Stream the data window into memory-mapped feeds paged under --memory-budget-mb (multi-year 1m runs); identical results")
+    run_parser.add_argument("--memory-budget-mb", type=int, default=None, metavar="MB", help="Resident budget for streamed feed data (default: 256; with --streaming)")
 
     # backtest preflight
     preflight_parser = backtest_subparsers.add_parser("preflight", help="Run preflight check without executing")
@@ -163,6 +173,40 @@ def _setup_backtest_subcommands(subparsers) -> None:
     datafix_parser.add_argument("--heal", action="store_true", help="Run full heal after sync")
     datafix_parser.add_argument("--json", action="store_true", dest="json_output", help="Output results as JSON")
 
+    # backtest robustness (post-processor over a finished run)
+    robustness_parser = backtest_subparsers.add_parser(
+        "robustness",
+        help="Monte Carlo / bootstrap robustness analysis of a finished run (writes robustness.json)"
+    )
+    robustness_parser.add_argument("--run-dir", required=True, help="Run artifact folder (contains result.json, trades.parquet, equity.parquet)")
+    robustness_parser.add_argument("--resamples", type=int, default=10_000, help="Resamples per method (default: 10000)")
+    robustness_parser.add_argument("--methods", nargs="+", choices=["trade_shuffle", "block_bootstrap", "random_skip"], default=None, help="Methods to run (default: all)")
+    robustness_parser.add_argument("--block-size", type=int, default=None, help="Block length for block_bootstrap (default: ceil(sqrt(bars)))")
+    robustness_parser.add_argument("--block-lengths", choices=["fixed", "geometric"], default="fixed", help="block_bootstrap block lengths: fixed (circular) or geometric with mean --block-size (stationary bootstrap)")
+    robustness_parser.add_argument("--skip-prob", type=float, default=0.10, help="Per-trade drop probability for random_skip (default: 0.10)")
+    robustness_parser.add_argument("--ruin-fraction", type=float, default=0.50, help="Ruin when equity touches <= fraction of initial equity (default: 0.50)")
+    robustness_parser.add_argument("--confidence", type=float, default=0.90, help="Confidence interval level (default: 0.90)")
+    robustness_parser.add_argument("--seed", type=int, default=42, help="Random seed (default: 42)")
+    robustness_parser.add_argument("--workers", type=int, default=1, help="Worker processes (default: 1; results identical for any count)")
+    robustness_parser.add_argument("--json", action="store_true", dest="json_output", help="Output results as JSON")
+
+    # backtest portfolio (many plays, one shared clock)
+    portfolio_parser = backtest_subparsers.add_parser(
+        "portfolio",
+        help="Run several Plays in one pass on a shared clock with a portfolio ledger"
+    )
+    portfolio_parser.add_argument("--play", action="append", dest="plays", required=True, help="Play identifier (repeat for each play)")
+    portfolio_parser.add_argument("--dir", dest="plays_dir", help="Override Play directory")
+    portfolio_parser.add_argument("--data-env", choices=["live"], default="live", help="Data environment (default: live)")
+    portfolio_parser.add_argument("--start", help="Window start (YYYY-MM-DD or YYYY-MM-DD HH:MM)")
+    portfolio_parser.add_argument("--end", help="Window end (YYYY-MM-DD or YYYY-MM-DD HH:MM)")
+    portfolio_parser.add_argument("--synthetic", action="store_true", help="Use synthetic data from each play's validation: block")
+    portfolio_parser.add_argument("--max-positions", type=int, default=None, help="Portfolio-wide open position cap (new entries vetoed at the cap)")
+    portfolio_parser.add_argument("--max-exposure", type=float, default=None, dest="max_exposure_usdt", help="Portfolio-wide notional exposure cap in USDT")
+    portfolio_parser.add_argument("--max-im-rate", type=float, default=None, help="Portfolio-wide initial margin rate cap (0-1)")
+    portfolio_parser.add_argument("--out", dest="output_path", help="Write full result (with portfolio equity curve) to this JSON file")
+    portfolio_parser.add_argument("--json", action="store_true", dest="json_output", help="Output results as JSON")
+
     # backtest list
     list_parser = backtest_subparsers.add_parser("list", help="List available Plays")
     list_parser.add_argument("--dir", dest="plays_dir", help="Override Plays directory")
@@ -289,6 +333,11 @@ def _setup_validate_subcommand(subparsers) -> None:
         default=600,
         help="Per-gate timeout in seconds for concurrent stages (default: 600)."
     )
+    validate_parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Reuse stored passes for gates/plays whose inputs (source, play YAML, config, registries) are unchanged (.validate_cache.json)"
+    )
     validate_parser.add_argument(
         "--json",
         action="store_true",
@@ -302,6 +351,42 @@ def _setup_validate_subcommand(subparsers) -> None:
     )
 
 
+def _setup_bench_subcommand(subparsers) -> None:
+    """Set up bench subcommand for standing performance benchmarks."""
+    # Keep in sync with src/forge/bench (not imported here: pulls in the forge package)
+    scenarios = ["backtest", "indicators", "mad", "bank", "structures", "history", "dsl", "live", "live_e2e", "checkpoint", "duckdb"]
+
+    bench_parser = subparsers.add_parser(
+        "bench",
+        help="Offline performance benchmarks with baseline regression checks"
+    )
+    bench_parser.add_argument(
+        "--scenario",
+        action="append",
+        dest="scenarios",
+        choices=scenarios,
+        help="Scenario to run (repeatable, default: all)"
+    )
+    bench_parser.add_argument("--quick", action="store_true", help="Reduced workload for smoke runs")
+    bench_parser.add_argument("--out", help="Report JSON path (default: backtests/_bench/bench_<timestamp>.json)")
+    bench_parser.add_argument("--baseline", help="Baseline JSON to compare with (default: backtests/_bench/baseline.json if present)")
+    bench_parser.add_argument("--save-baseline", action="store_true", help="Store this run as the baseline")
+    bench_parser.add_argument(
+        "--threshold",
+        type=float,
+        default=None,
+        help="Regression threshold in percent (default: 10; backtest/live/checkpoint/duckdb metrics use wider built-in bands)"
+    )
+    bench_parser.add_argument(
+        "--metric-threshold",
+        action="append",
+        dest="metric_thresholds",
+        metavar="PREFIX=PCT",
+        help="Threshold for metrics starting with PREFIX, e.g. live.=30 (repeatable)"
+    )
+    bench_parser.add_argument("--json", action="store_true", dest="json_output", help="Output results as JSON")
+
+
 def _setup_debug_subcommands(subparsers) -> None:
     """Set up debug subcommand for diagnostic tools."""
     debug_parser = subparsers.add_parser("debug", help="Diagnostic tools (math-parity, snapshot, determinism, metrics)")
@@ -335,6 +420,55 @@ def _setup_debug_subcommands(subparsers) -> None:
     plumbing_parser.add_argument("--no-strict", action="store_false", dest="strict", help="Continue after mismatches")
     plumbing_parser.add_argument("--json", action="store_true", dest="json_output", help="Output as JSON")
 
+    # debug rule-compiler
+    rule_compiler_parser = debug_subparsers.add_parser(
+        "rule-compiler",
+        help="Compiled vs interpreted rule evaluation parity + per-bar benchmark"
+    )
+    rule_compiler_parser.add_argument("--play", action="append", dest="plays", help="Play identifier (repeatable, default: core validation plays)")
+    rule_compiler_parser.add_argument("--max-snapshots", type=int, default=3000, help="Evaluated snapshots per play (default: 3000)")
+    rule_compiler_parser.add_argument("--json", action="store_true", dest="json_output", help="Output as JSON")
+
+    # debug alignment
+    alignment_parser = debug_subparsers.add_parser(
+        "alignment",
+        help="Precomputed multi-TF alignment table vs per-bar timestamp lookups (parity + timing)"
+    )
+    alignment_parser.add_argument("--play", action="append", dest="plays", help="Play identifier (repeatable, default: core validation plays)")
+    alignment_parser.add_argument("--no-synthetic", action="store_false", dest="synthetic", help="Skip the synthetic DST / gap / boundary cases")
+    alignment_parser.add_argument("--json", action="store_true", dest="json_output", help="Output as JSON")
+
+    # debug prearm-replay
+    prearm_parser = debug_subparsers.add_parser(
+        "prearm-replay",
+        help="Offline live replay with order pre-arming off vs on (identical orders + latency)"
+    )
+    prearm_parser.add_argument("--play", action="append", dest="plays", help="Single-TF play identifier (repeatable, default: BENCH_001_simple)")
+    prearm_parser.add_argument("--candles", type=int, default=1000, help="Exec candles per run (default: 1000)")
+    prearm_parser.add_argument("--forming-updates", type=int, default=2, help="Forming klines before each close (default: 2)")
+    prearm_parser.add_argument("--order-latency-ms", type=float, default=0.0, help="Simulated order REST round trip (default: 0)")
+    prearm_parser.add_argument("--query-latency-ms", type=float, default=0.0, help="Simulated round trip of other REST calls (default: 0)")
+    prearm_parser.add_argument("--json", action="store_true", dest="json_output", help="Output as JSON")
+
+    # debug checkpoint-restore
+    checkpoint_parser = debug_subparsers.add_parser(
+        "checkpoint-restore",
+        help="Offline warm restart check: checkpoint restore + replay vs uninterrupted run and cold warmup"
+    )
+    checkpoint_parser.add_argument("--play", action="append", dest="plays", help="Single-TF play identifier (repeatable, default: BENCH_001_simple, BENCH_004_structures)")
+    checkpoint_parser.add_argument("--candles", type=int, default=250, help="Closed candles after warmup; checkpoint taken halfway (default: 250)")
+    checkpoint_parser.add_argument("--json", action="store_true", dest="json_output", help="Output as JSON")
+
+    # debug streaming-parity
+    streaming_parser = debug_subparsers.add_parser(
+        "streaming-parity",
+        help="Streaming backtest (memory-mapped, paged feeds) vs in-memory run: identical trades, equity and hashes"
+    )
+    streaming_parser.add_argument("--play", action="append", dest="plays", help="Play identifier (repeatable, default: BENCH_001_simple, BENCH_002_multi_tf)")
+    streaming_parser.add_argument("--bars", type=int, default=1500, help="Synthetic bars per timeframe (default: 1500)")
+    streaming_parser.add_argument("--memory-budget-mb", type=int, default=1, help="Streaming memory budget; small so the pager is exercised (default: 1)")
+    streaming_parser.add_argument("--json", action="store_true", dest="json_output", help="Output as JSON")
+
     # debug determinism
     determinism_parser = debug_subparsers.add_parser(
         "determinism",
@@ -548,6 +682,7 @@ def _setup_data_subcommands(subparsers) -> None:
     sync_parser.add_argument("--start", help="Start date (YYYY-MM-DD) — overrides --period")
     sync_parser.add_argument("--end", help="End date (YYYY-MM-DD) — overrides --period")
     sync_parser.add_argument("--heal", action="store_true", help="Run heal after sync")
+    sync_parser.add_argument("--derive", action="store_true", help="Fetch only 1m from the API and derive higher timeframes locally")
     sync_parser.add_argument("--json", action="store_true", dest="json_output", help="Output as JSON")
 
     # data info
@@ -582,6 +717,18 @@ def _setup_data_subcommands(subparsers) -> None:
     heal_parser.add_argument("--symbol", help="Symbol to heal (omit for all)")
     heal_parser.add_argument("--json", action="store_true", dest="json_output", help="Output as JSON")
 
+    # data audit-derived
+    audit_derived_parser = data_subparsers.add_parser("audit-derived", help="Compare 1m-derived bars against native bars")
+    audit_derived_parser.add_argument("--symbol", required=True, help="Symbol to audit")
+    audit_derived_parser.add_argument("--tf", help="Comma-separated timeframes (default: all derivable)")
+    audit_derived_parser.add_argument("--source", choices=["api", "db"], default="api", help="Native bars from Bybit (api) or natively synced DuckDB rows (db)")
+    audit_derived_parser.add_argument("--bars", type=int, default=200, help="Most recent closed bars compared per timeframe (default: 200)")
+    audit_derived_parser.add_argument("--json", action="store_true", dest="json_output", help="Output as JSON")
+
+    # data serve
+    serve_parser = data_subparsers.add_parser("serve", help="Run the local data service (owns the DuckDB file; other processes connect to it)")
+    serve_parser.add_argument("--env", choices=["backtest", "live"], default="backtest", help="Data environment to serve (default: backtest)")
+
     # data vacuum
     vacuum_parser = data_subparsers.add_parser("vacuum", help="Vacuum the DuckDB database")
     vacuum_parser.add_argument("--json", action="store_true", dest="json_output", help="Output as JSON")
@@ -74,6 +74,10 @@ class DashboardState:
     orders_failed: int = 0
     uptime_seconds: float = 0.0
     last_candle_ts: str = ""
+    latency_p50_ms: float = 0.0  # candle close -> end of processing (exec TF)
+    latency_p99_ms: float = 0.0
+    order_ack_p50_ms: float = 0.0  # candle close -> REST order response
+    order_ack_p99_ms: float = 0.0
     runner_state: str = "STARTING"
     engine_phase: str = "CREATED"
     is_paused: bool = False
@@ -179,6 +183,14 @@ def refresh_account(
         state.uptime_seconds = stats.duration_seconds
         if stats.last_candle_ts:
             state.last_candle_ts = stats.last_candle_ts.strftime("%H:%M:%S")
+        total = stats.latency.get("total")
+        if total is not None:
+            state.latency_p50_ms = float(total["p50_ms"])
+            state.latency_p99_ms = float(total["p99_ms"])
+        order_ack = stats.latency.get("to_order_ack")
+        if order_ack is not None:
+            state.order_ack_p50_ms = float(order_ack["p50_ms"])
+            state.order_ack_p99_ms = float(order_ack["p99_ms"])
         state.runner_state = runner.state.value.upper()
         state.is_paused = runner.is_paused
         state.errors = list(stats.errors[-3:])
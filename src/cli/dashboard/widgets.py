@@ -347,6 +347,12 @@ def build_stats_text(state: DashboardState) -> Text:
     if state.orders_failed:
         t.append("  Err ", style="dim")
         t.append(f"{state.orders_failed}", style="bold red")
+    if state.latency_p50_ms or state.latency_p99_ms:
+        t.append("  Lat ", style="dim")
+        t.append(f"{state.latency_p50_ms:.1f}/{state.latency_p99_ms:.1f}ms", style="white")
+    if state.order_ack_p50_ms or state.order_ack_p99_ms:
+        t.append("  Ack ", style="dim")
+        t.append(f"{state.order_ack_p50_ms:.0f}/{state.order_ack_p99_ms:.0f}ms", style="white")
     t.append("  Up ", style="dim")
     t.append(_fmt_uptime(state.uptime_seconds), style="white")
     if state.last_candle_ts:
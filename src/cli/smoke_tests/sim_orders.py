@@ -8,18 +8,27 @@ Tests all order types in the SimulatedExchange:
 - Stop limit orders (trigger + limit fill)
 - Reduce-only orders
 - Order book management (cancel, cancel_all)
+- Idle-bar fast path (flat, empty book) + bars/sec micro-benchmark
+- Allocation-lean hot path: slotted value types, array-range 1m TP/SL
+  parity, ledger scalar reads, bytes allocated per in-position bar
 
 These tests use synthetic bar data and run entirely in-memory.
 """
 
+import time
+import tracemalloc
 from datetime import datetime, timedelta
+
+import numpy as np
 from rich.console import Console
 from rich.panel import Panel
 from rich.table import Table
 
 from src.backtest.sim.exchange import SimulatedExchange
+from src.backtest.sim.pricing.intrabar_path import check_tp_sl_1m, check_tp_sl_1m_range
 from src.backtest.sim.types import (
-    Bar, OrderType, OrderSide, TimeInForce, TriggerDirection
+    Bar, Fill, Order, OrderType, OrderSide, Position, PriceSnapshot, StepResult,
+    TimeInForce, TriggerDirection, TriggerSource,
 )
 
 console = Console()
@@ -65,6 +74,12 @@ def run_sim_orders_smoke(verbose: bool = False) -> int:
     # Test 8: Order amendment
     failures += _test_amend_order(verbose)
 
+    # Test 9: Idle-bar fast path
+    failures += _test_idle_fast_path(verbose)
+
+    # Test 10: Allocation-lean hot path
+    failures += _test_allocation_lean_path(verbose)
+
     console.print()
     if failures == 0:
         console.print("[bold green]v ALL SIMULATOR ORDER TESTS PASSED[/]")
@@ -657,5 +672,201 @@ def _test_amend_order(verbose: bool) -> int:
     return failures
 
 
+def _idle_bars(count: int, start: datetime) -> list[Bar]:
+    """Hourly bars oscillating around 40000 (never near +-10%)."""
+    bars = []
+    for i in range(count):
+        close = 40000.0 + (100.0 if i % 2 else -100.0)
+        ts_open = start + timedelta(hours=i)
+        bars.append(Bar(
+            symbol="BTCUSDT",
+            tf="1h",
+            ts_open=ts_open,
+            ts_close=ts_open + timedelta(hours=1),
+            open=40000.0,
+            high=40200.0,
+            low=39800.0,
+            close=close,
+            volume=1000.0,
+        ))
+    return bars
+
+
+def _bars_per_sec(ex: SimulatedExchange, bars: list[Bar]) -> float:
+    t0 = time.perf_counter()
+    prev = None
+    for bar in bars:
+        ex.process_bar(bar, prev)
+        prev = bar
+    elapsed = time.perf_counter() - t0
+    return len(bars) / elapsed if elapsed > 0 else float("inf")
+
+
+def _test_idle_fast_path(verbose: bool) -> int:
+    """Test the idle-bar fast path and benchmark flat vs in-position bars."""
+    console.print("[bold]Section 9: Idle-Bar Fast Path[/]")
+    failures = 0
+    start = datetime(2024, 1, 1, 0, 0)
+    bar1, bar2, bar3 = _idle_bars(3, start)
+
+    # Test 9a: flat + empty book -> empty result, ledger marked flat
+    ex = SimulatedExchange("BTCUSDT", 10000.0)
+    result1 = ex.process_bar(bar1)
+    ok = (
+        not result1.fills
+        and result1.mark_price == bar1.close
+        and result1.ts_close == bar1.ts_close
+        and result1.prices is not None
+        and ex.equity_usdt == 10000.0
+        and ex.used_margin_usdt == 0.0
+        and ex.last_mark_price == bar1.close
+    )
+    if ok:
+        console.print("  [green]OK[/] Idle bar: no fills, mark price and ledger current")
+    else:
+        console.print("  [red]FAIL[/] Idle bar result or ledger state wrong")
+        failures += 1
+
+    # Test 9b: the idle result object is reused and refreshed
+    result2 = ex.process_bar(bar2, bar1)
+    if result2 is result1 and result2.mark_price == bar2.close and result2.timestamp == bar2.ts_close:
+        console.print("  [green]OK[/] Idle StepResult reused and refreshed per bar")
+    else:
+        console.print("  [red]FAIL[/] Idle StepResult not reused or stale")
+        failures += 1
+
+    # Test 9c: a resting order or an open position takes the full path
+    ex.submit_limit_order(side="long", size_usdt=100.0, limit_price=30000.0)
+    result3 = ex.process_bar(bar3, bar2)
+    if result3 is not result1 and len(ex.get_open_orders()) == 1:
+        console.print("  [green]OK[/] Resting order disables the fast path")
+    else:
+        console.print("  [red]FAIL[/] Fast path taken with a resting order")
+        failures += 1
+
+    ex2 = SimulatedExchange("BTCUSDT", 10000.0)
+    ex2.submit_order("long", 1000.0, timestamp=start)
+    ex2.process_bar(bar1)
+    pos_result = ex2.process_bar(bar2, bar1)
+    if ex2.position is not None and pos_result.fills == [] and ex2.unrealized_pnl_usdt != 0.0:
+        console.print("  [green]OK[/] Open position marked to market on full path")
+    else:
+        console.print("  [red]FAIL[/] Position not marked to market")
+        failures += 1
+
+    # Micro-benchmark: bars/sec flat vs in position (informational)
+    bench_bars = _idle_bars(5000, start + timedelta(hours=3))
+    flat_rate = _bars_per_sec(SimulatedExchange("BTCUSDT", 10000.0), bench_bars)
+    ex3 = SimulatedExchange("BTCUSDT", 10000.0)
+    ex3.submit_order("long", 1000.0, timestamp=start)
+    ex3.process_bar(bar1)
+    in_pos_rate = _bars_per_sec(ex3, bench_bars)
+    if ex3.position is None:
+        console.print("  [red]FAIL[/] Benchmark position closed unexpectedly")
+        failures += 1
+    console.print(
+        f"  [dim]process_bar: flat {flat_rate:,.0f} bars/s, "
+        f"in position {in_pos_rate:,.0f} bars/s "
+        f"({flat_rate / in_pos_rate:.1f}x)[/]"
+    )
+
+    console.print()
+    return failures
+
+
+def _test_allocation_lean_path(verbose: bool) -> int:
+    """Slotted types, 1m TP/SL range parity, ledger reads, bytes per bar."""
+    console.print("[bold]Section 10: Allocation-Lean Hot Path[/]")
+    failures = 0
+    start = datetime(2024, 1, 1, 0, 0)
+
+    # Test 10a: per-bar / per-fill value types carry no instance __dict__
+    unslotted = [
+        cls.__name__
+        for cls in (Bar, Order, Position, Fill, PriceSnapshot, StepResult)
+        if "__slots__" not in cls.__dict__
+    ]
+    if not unslotted:
+        console.print("  [green]OK[/] Bar, Order, Position, Fill, PriceSnapshot, StepResult are slotted")
+    else:
+        console.print(f"  [red]FAIL[/] Not slotted: {', '.join(unslotted)}")
+        failures += 1
+
+    # Test 10b: array-range TP/SL check matches the tuple-list reference
+    rng = np.random.default_rng(7)
+    mismatches = 0
+    cases = 0
+    for _ in range(400):
+        n = int(rng.integers(1, 40))
+        mid = 100.0 + np.cumsum(rng.normal(0.0, 0.4, n))
+        high = mid + rng.uniform(0.0, 0.5, n)
+        low = mid - rng.uniform(0.0, 0.5, n)
+        bars_1m = [(float(m), float(h), float(lo), float(m)) for m, h, lo in zip(mid, high, low)]
+        last = float(mid[-1])
+        prices = PriceSnapshot(
+            timestamp=start, mark_price=last, last_price=last, index_price=last,
+            mid_price=last, bid_price=last, ask_price=last, spread=0.0,
+        )
+        for side in ("long", "short"):
+            sign = 1.0 if side == "long" else -1.0
+            tp = 100.0 + sign * float(rng.uniform(0.0, 3.0))
+            sl = 100.0 - sign * float(rng.uniform(0.0, 3.0))
+            for take_profit, stop_loss in ((tp, sl), (tp, None), (None, sl)):
+                for trigger in (TriggerSource.LAST_PRICE, TriggerSource.MARK_PRICE):
+                    args = (side, 100.0, take_profit, stop_loss)
+                    kwargs = {"tp_trigger_by": TriggerSource.LAST_PRICE, "sl_trigger_by": trigger, "prices": prices}
+                    expected = check_tp_sl_1m(*args, bars_1m=bars_1m, **kwargs)
+                    observed = check_tp_sl_1m_range(*args, high=high, low=low, start=0, end=n, **kwargs)
+                    cases += 1
+                    if expected != observed:
+                        mismatches += 1
+                        if verbose:
+                            console.print(f"    [dim]{args} {trigger}: {expected} != {observed}[/]")
+    if mismatches == 0:
+        console.print(f"  [green]OK[/] check_tp_sl_1m_range matches check_tp_sl_1m ({cases:,} cases)")
+    else:
+        console.print(f"  [red]FAIL[/] check_tp_sl_1m_range differs in {mismatches}/{cases} cases")
+        failures += 1
+
+    # Test 10c: ledger scalar reads agree with the LedgerState snapshot
+    bars = _idle_bars(2001, start)
+    ex = SimulatedExchange("BTCUSDT", 10000.0)
+    ex.submit_order("long", 1000.0, timestamp=start)
+    ex.process_bar(bars[0])
+    ex.process_bar(bars[1], bars[0])
+    state = ex._ledger.state
+    ok = (
+        ex.position is not None
+        and ex.equity_usdt == state.equity_usdt
+        and ex.used_margin_usdt == state.used_margin_usdt
+        and ex.maintenance_margin == state.maintenance_margin_usdt
+        and ex.available_balance_usdt == state.available_balance_usdt
+    )
+    if ok:
+        console.print("  [green]OK[/] Ledger scalar reads match LedgerState")
+    else:
+        console.print("  [red]FAIL[/] Ledger scalar reads differ from LedgerState")
+        failures += 1
+
+    # Bytes allocated per in-position bar (informational)
+    tracemalloc.start()
+    tracemalloc.reset_peak()
+    before = tracemalloc.get_traced_memory()[0]
+    prev = bars[1]
+    for bar in bars[2:]:
+        ex.process_bar(bar, prev)
+        prev = bar
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    per_bar = (current - before) / (len(bars) - 2)
+    console.print(
+        f"  [dim]process_bar in position: {per_bar:,.1f} B/bar retained, "
+        f"{peak - before:,} B transient peak over {len(bars) - 2:,} bars[/]"
+    )
+
+    console.print()
+    return failures
+
+
 # Export for CLI integration
 __all__ = ["run_sim_orders_smoke"]
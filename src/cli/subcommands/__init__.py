@@ -12,13 +12,21 @@ from src.cli.subcommands.backtest import (
     handle_backtest_list,
     handle_backtest_normalize,
     handle_backtest_normalize_batch,
+    handle_backtest_robustness,
+    handle_backtest_portfolio,
 )
 from src.cli.subcommands.debug import (
     handle_debug_math_parity,
     handle_debug_snapshot_plumbing,
+    handle_debug_rule_compiler,
+    handle_debug_alignment,
+    handle_debug_prearm_replay,
+    handle_debug_checkpoint_restore,
+    handle_debug_streaming_parity,
     handle_debug_determinism,
     handle_debug_metrics,
 )
+from src.cli.subcommands.bench import handle_bench
 from src.cli.subcommands.play import (
     handle_play_run,
     handle_play_status,
@@ -63,6 +71,8 @@ from src.cli.subcommands.data import (
     handle_data_summary,
     handle_data_query,
     handle_data_heal,
+    handle_data_audit_derived,
+    handle_data_serve,
     handle_data_vacuum,
     handle_data_delete,
 )
@@ -94,11 +104,20 @@ __all__ = [
     "handle_backtest_list",
     "handle_backtest_normalize",
     "handle_backtest_normalize_batch",
+    "handle_backtest_robustness",
+    "handle_backtest_portfolio",
     # Debug
     "handle_debug_math_parity",
     "handle_debug_snapshot_plumbing",
+    "handle_debug_rule_compiler",
+    "handle_debug_alignment",
+    "handle_debug_prearm_replay",
+    "handle_debug_checkpoint_restore",
+    "handle_debug_streaming_parity",
     "handle_debug_determinism",
     "handle_debug_metrics",
+    # Bench
+    "handle_bench",
     # Play
     "handle_play_run",
     "handle_play_status",
@@ -141,6 +160,8 @@ __all__ = [
     "handle_data_summary",
     "handle_data_query",
     "handle_data_heal",
+    "handle_data_audit_derived",
+    "handle_data_serve",
     "handle_data_vacuum",
     "handle_data_delete",
     # Market
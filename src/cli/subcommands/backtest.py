@@ -21,6 +21,7 @@ def _handle_synthetic_backtest_run(args) -> int:
     import yaml
     from src.backtest.play import load_play, Play
     from src.backtest.runner import run_backtest_with_gates, RunnerConfig
+    from src.backtest.runtime.feed_paging import DEFAULT_MEMORY_BUDGET_MB
     from src.backtest.execution_validation import compute_synthetic_bars
     from src.forge.validation import generate_synthetic_candles
     from src.forge.validation.synthetic_data import PatternType
@@ -104,10 +105,20 @@ def _handle_synthetic_backtest_run(args) -> int:
         plays_dir=plays_dir,
         skip_preflight=True,
         auto_sync_missing_data=False,
+        structure_backend=args.structure_backend,
+        use_result_cache=not args.no_cache,
+        profile=args.profile,
+        profile_alloc=args.profile_alloc,
+        streaming=args.streaming,
+        memory_budget_mb=args.memory_budget_mb or DEFAULT_MEMORY_BUDGET_MB,
     )
 
     result = run_backtest_with_gates(config, synthetic_provider=provider)
 
+    robustness_result = None
+    if result.success and result.artifact_path and getattr(args, "robustness", None):
+        robustness_result = _run_robustness(result.artifact_path, args.robustness)
+
     if getattr(args, "json_output", False):
         output = {
             "status": "pass" if result.success else "fail",
@@ -147,6 +158,10 @@ def _handle_synthetic_backtest_run(args) -> int:
                     "run_hash": s.run_hash,
                 }
                 output["artifact_path"] = s.artifact_path
+        if robustness_result is not None:
+            output["robustness"] = robustness_result.data if robustness_result.success else {"error": robustness_result.error}
+        if result.profile_path is not None:
+            output["profile_path"] = str(result.profile_path)
         print(json.dumps(output, indent=2, default=str))
         return 0 if result.success else 1
 
@@ -154,6 +169,12 @@ def _handle_synthetic_backtest_run(args) -> int:
         console.print(f"\n[bold green]OK Synthetic backtest complete[/]")
         if result.summary:
             console.print(f"[dim]Trades: {result.summary.trades_count} | PnL: {result.summary.net_pnl_usdt:.2f} USDT[/]")
+        if result.profile_path is not None:
+            from src.utils.profiler import load_profile
+            _print_profile(load_profile(result.profile_path), result.profile_path)
+        if robustness_result is not None:
+            _print_robustness(robustness_result)
+            return 0 if robustness_result.success else 1
         return 0
     else:
         console.print(f"\n[bold red]FAIL {result.error_message}[/]")
@@ -194,8 +215,22 @@ def handle_backtest_run(args) -> int:
         emit_snapshots=args.emit_snapshots,
         sync=args.sync,
         validate_artifacts_after=args.validate,
+        structure_backend=args.structure_backend,
+        use_cache=not args.no_cache,
+        profile=args.profile,
+        profile_alloc=args.profile_alloc,
+        streaming=args.streaming,
+        memory_budget_mb=args.memory_budget_mb,
     )
 
+    if result.success and result.data and result.data.get("artifact_dir") and args.robustness:
+        robustness_result = _run_robustness(Path(result.data["artifact_dir"]), args.robustness)
+        result.data["robustness"] = (
+            robustness_result.data if robustness_result.success else {"error": robustness_result.error}
+        )
+        if not args.json_output:
+            _print_robustness(robustness_result)
+
     if args.json_output:
         return _json_result(result)
 
@@ -205,9 +240,139 @@ def handle_backtest_run(args) -> int:
     rc = _print_result(result)
     if result.success and result.data and "artifact_dir" in result.data:
         console.print(f"[dim]Artifacts: {result.data['artifact_dir']}[/]")
+    if result.data and result.data.get("profile"):
+        _print_profile(result.data["profile"], result.data["profile_path"])
     return rc
 
 
+def _print_profile(profile: dict, path) -> None:
+    """Print the flame-style per-phase summary of a profiled run."""
+    from rich.markup import escape
+    from src.utils.profiler import format_alloc_summary, format_profile_summary
+
+    bars = profile.get("meta", {}).get("bars")
+    console.print(f"\n[bold]Profile[/] ({profile['wall_seconds']:.2f}s wall" + (f", {bars:,} bars)" if bars else ")"))
+    for line in format_profile_summary(profile):
+        console.print(escape(line), highlight=False, soft_wrap=True)
+    alloc_lines = format_alloc_summary(profile)
+    if alloc_lines:
+        console.print("\n[bold]Allocations[/] (tracemalloc; timings above include its overhead)")
+        for line in alloc_lines:
+            console.print(escape(line), highlight=False, soft_wrap=True)
+    console.print(f"[dim]Profile: {path}[/]")
+
+
+def _run_robustness(artifact_dir: Path, resamples: int):
+    """Run the robustness post-processor on a finished run folder."""
+    from src.tools.backtest_robustness_tools import backtest_robustness_tool
+
+    return backtest_robustness_tool(run_dir=artifact_dir, resamples=resamples)
+
+
+def _print_robustness(result) -> None:
+    """Print per-method observed value and confidence interval for the headline metrics."""
+    if not result.success or not result.data:
+        console.print(f"[bold red]Robustness analysis failed: {result.error}[/]")
+        return
+
+    data = result.data
+    confidence = data["config"]["confidence"]
+    console.print(
+        f"\n[bold]Robustness[/] ({data['config']['resamples']} resamples, "
+        f"{confidence:.0%} CI, ruin <= {data['config']['ruin_fraction']:.0%} of initial equity)"
+    )
+    for method, entry in data["methods"].items():
+        if "skipped" in entry:
+            console.print(f"  [yellow]{method}: skipped ({entry['skipped']})[/]")
+            continue
+        metrics = entry["metrics"]
+        parts = []
+        for key, label in (("max_drawdown", "MaxDD"), ("sharpe", "Sharpe"), ("cagr", "CAGR")):
+            m = metrics[key]
+            if key == "sharpe":
+                parts.append(f"{label} {m['observed']:.2f} [{m['ci_low']:.2f}, {m['ci_high']:.2f}]")
+            else:
+                parts.append(f"{label} {m['observed']:.1%} [{m['ci_low']:.1%}, {m['ci_high']:.1%}]")
+        console.print(f"  {method:<16} {' | '.join(parts)} | P(ruin) {entry['ruin_probability']:.2%}")
+    console.print(f"[dim]Report: {data['robustness_path']}[/]")
+
+
+def handle_backtest_robustness(args) -> int:
+    """Handle `backtest robustness` subcommand."""
+    from src.tools.backtest_robustness_tools import backtest_robustness_tool
+
+    if not args.json_output:
+        console.print(Panel(
+            f"[bold cyan]BACKTEST ROBUSTNESS[/]\n"
+            f"Run: {args.run_dir}\n"
+            f"Resamples: {args.resamples} | Methods: {', '.join(args.methods) if args.methods else 'all'}",
+            border_style="cyan"
+        ))
+
+    result = backtest_robustness_tool(
+        run_dir=Path(args.run_dir),
+        resamples=args.resamples,
+        methods=args.methods,
+        block_size=args.block_size,
+        block_lengths=args.block_lengths,
+        skip_prob=args.skip_prob,
+        ruin_fraction=args.ruin_fraction,
+        confidence=args.confidence,
+        seed=args.seed,
+        workers=args.workers,
+    )
+
+    if args.json_output:
+        return _json_result(result)
+
+    rc = _print_result(result)
+    if result.success:
+        _print_robustness(result)
+    return rc
+
+
+def handle_backtest_portfolio(args) -> int:
+    """Handle `backtest portfolio` subcommand."""
+    from src.tools.backtest_portfolio_tools import backtest_portfolio_tool
+
+    start = _parse_datetime(args.start) if args.start else None
+    end = _parse_datetime(args.end) if args.end else None
+
+    if not args.json_output:
+        console.print(Panel(
+            f"[bold cyan]PORTFOLIO BACKTEST[/]\n"
+            f"Plays: {', '.join(args.plays)}\n"
+            f"Data: {'synthetic' if args.synthetic else args.data_env}",
+            border_style="cyan"
+        ))
+
+    result = backtest_portfolio_tool(
+        play_ids=args.plays,
+        env=args.data_env,
+        start=start,
+        end=end,
+        plays_dir=Path(args.plays_dir) if args.plays_dir else None,
+        use_synthetic=args.synthetic,
+        max_positions=args.max_positions,
+        max_exposure_usdt=args.max_exposure_usdt,
+        max_im_rate=args.max_im_rate,
+        output_path=args.output_path,
+    )
+
+    if args.json_output:
+        return _json_result(result)
+
+    if result.success and result.data:
+        for row in result.data["attribution"]:
+            console.print(
+                f"  {row['play_id']} ({row['symbol']} {row['exec_tf']}): "
+                f"net {row['net_pnl']:+.2f} ({row['pnl_share_pct']:.1f}% of total), "
+                f"{row['trades']} trades, DD {row['max_drawdown_pct']:.2f}%"
+                + (f", {row['entries_vetoed']} vetoed" if row["entries_vetoed"] else "")
+            )
+    return _print_result(result)
+
+
 def handle_backtest_preflight(args) -> int:
     """Handle `backtest preflight` subcommand."""
     from src.tools.backtest_play_tools import backtest_preflight_play_tool
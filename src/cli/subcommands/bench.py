@@ -0,0 +1,94 @@
+"""Bench subcommand handler for TRADE CLI."""
+
+from __future__ import annotations
+
+from rich.panel import Panel
+from rich.table import Table
+
+from src.cli.utils import console
+from src.cli.subcommands._helpers import _json_result
+
+
+def _parse_metric_thresholds(values: list[str] | None) -> dict[str, float]:
+    thresholds: dict[str, float] = {}
+    for item in values or []:
+        prefix, sep, pct = item.partition("=")
+        if not sep or not prefix:
+            raise ValueError(f"--metric-threshold expects PREFIX=PCT, got '{item}'")
+        thresholds[prefix] = float(pct)
+    return thresholds
+
+
+def handle_bench(args) -> int:
+    """Handle `bench` - offline performance benchmarks vs a stored baseline."""
+    from src.tools.forge_bench_tools import forge_bench_tool
+
+    try:
+        metric_thresholds = _parse_metric_thresholds(args.metric_thresholds)
+    except ValueError as e:
+        console.print(f"[bold red]FAIL[/] {e}")
+        return 1
+
+    if not args.json_output:
+        console.print(Panel(
+            f"[bold cyan]BENCH[/]\n"
+            f"Scenarios: {', '.join(args.scenarios) if args.scenarios else 'all'}\n"
+            f"Workload: {'quick' if args.quick else 'full'}",
+            border_style="cyan"
+        ))
+
+    result = forge_bench_tool(
+        scenarios=args.scenarios,
+        quick=args.quick,
+        output_path=args.out,
+        baseline_path=args.baseline,
+        save_baseline=args.save_baseline,
+        threshold_pct=args.threshold,
+        metric_thresholds=metric_thresholds or None,
+    )
+
+    if args.json_output:
+        return _json_result(result)
+
+    data = result.data or {}
+    comparison = data.get("comparison") or {}
+    compared = {row["name"]: row for row in comparison.get("metrics", [])}
+
+    table = Table(show_header=True, header_style="bold", box=None)
+    table.add_column("Metric")
+    table.add_column("Value", justify="right")
+    table.add_column("Unit")
+    if comparison:
+        table.add_column("Baseline", justify="right")
+        table.add_column("Change", justify="right")
+    for name, metric in data.get("metrics", {}).items():
+        row = [name, f"{metric['value']:,.1f}", metric["unit"]]
+        if comparison:
+            cmp_row = compared.get(name)
+            if cmp_row is None:
+                row += ["-", "[dim]new[/]"]
+            else:
+                color = {"regressed": "red", "improved": "green"}.get(cmp_row["status"], "dim")
+                row += [f"{cmp_row['baseline']:,.1f}", f"[{color}]{cmp_row['change_pct']:+.1f}%[/]"]
+        table.add_row(*row)
+    console.print(table)
+
+    for scenario in data.get("scenarios", []):
+        if scenario.get("error"):
+            console.print(f"[red]  {scenario['name']}: {scenario['error']}[/]")
+
+    if comparison:
+        if not comparison["same_machine"]:
+            console.print("[yellow]Baseline was recorded on a different machine/interpreter - compare with care[/]")
+        if not comparison["same_config"]:
+            console.print("[yellow]Baseline used a different workload (quick vs full) - compare with care[/]")
+    if data.get("output_path"):
+        console.print(f"[dim]Report: {data['output_path']}[/]")
+    if data.get("baseline_saved"):
+        console.print(f"[dim]Baseline saved: {data['baseline_saved']}[/]")
+
+    if result.success:
+        console.print(f"\n[bold green]PASS[/] {result.message}")
+        return 0
+    console.print(f"\n[bold red]FAIL[/] {result.error}")
+    return 1
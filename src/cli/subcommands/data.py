@@ -53,6 +53,7 @@ def handle_data_sync(args) -> int:
 
     start = getattr(args, "start", None)
     end = getattr(args, "end", None)
+    derive = getattr(args, "derive", False)
 
     if start and end:
         from src.tools.data_tools import sync_range_tool
@@ -60,18 +61,24 @@ def handle_data_sync(args) -> int:
             symbols=symbols,
             start=datetime.fromisoformat(start).replace(tzinfo=None),
             end=datetime.fromisoformat(end).replace(tzinfo=None),
+            derive=derive,
         )
     else:
         from src.tools.data_tools import sync_symbols_tool
         period_code = _parse_period_to_code(getattr(args, "period", "30d"))
-        result = sync_symbols_tool(symbols=symbols, period=period_code)
+        result = sync_symbols_tool(symbols=symbols, period=period_code, derive=derive)
 
     if getattr(args, "heal", False) and result.success:
-        from src.tools.data_tools import heal_data_tool
+        from src.tools.data_tools import derive_timeframes_tool, heal_data_tool
         for sym in symbols:
             heal_result = heal_data_tool(symbol=sym)
             if not heal_result.success:
                 console.print(f"[yellow]Heal warning for {sym}: {heal_result.error}[/]")
+            elif derive:
+                # Healed 1m gaps can complete derived buckets anywhere in history
+                derive_result = derive_timeframes_tool(sym, full=True)
+                if not derive_result.success:
+                    console.print(f"[yellow]Derive warning for {sym}: {derive_result.error}[/]")
 
     return _print_data_result(args, result)
 
@@ -145,6 +152,47 @@ def handle_data_heal(args) -> int:
     return _print_data_result(args, result)
 
 
+def handle_data_audit_derived(args) -> int:
+    """Handle `data audit-derived` subcommand."""
+    from src.tools.data_tools import audit_derived_data_tool
+    timeframes = [tf.strip() for tf in args.tf.split(",") if tf.strip()] if getattr(args, "tf", None) else None
+    result = audit_derived_data_tool(
+        symbol=args.symbol.upper(),
+        timeframes=timeframes,
+        source=args.source,
+        sample_bars=args.bars,
+    )
+    if not getattr(args, "json_output", False) and result.data:
+        for tf, report in result.data.get("reports", {}).items():
+            color = "green" if report["ok"] else ("yellow" if not report["compared"] else "red")
+            console.print(
+                f"  [{color}]{tf:>4}[/] compared={report['compared']} mismatched={report['mismatched']} "
+                f"missing_derived={report['missing_derived']} missing_native={report['missing_native']}"
+            )
+    return _print_data_result(args, result)
+
+
+def handle_data_serve(args) -> int:
+    """Handle `data serve` subcommand (foreground until Ctrl-C)."""
+    from src.data.data_service import DataService, data_service_disabled
+
+    if data_service_disabled():
+        console.print("[red]Data service unavailable: DATA_SERVICE_DISABLE is set or this platform has no Unix sockets[/]")
+        return 1
+    try:
+        service = DataService(env=args.env)
+        service.start()
+    except Exception as e:
+        console.print(f"[red]Failed to start data service: {e}[/]")
+        return 1
+    console.print(f"[green]Data service ({args.env}) listening on {service.socket_path}[/] — Ctrl-C to stop")
+    try:
+        service.serve_forever()
+    except KeyboardInterrupt:
+        console.print("[dim]Data service stopped[/]")
+    return 0
+
+
 def handle_data_vacuum(args) -> int:
     """Handle `data vacuum` subcommand."""
     from src.tools.data_tools import vacuum_database_tool
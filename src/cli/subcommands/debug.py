@@ -111,6 +111,227 @@ def handle_debug_snapshot_plumbing(args) -> int:
         return 1
 
 
+def handle_debug_rule_compiler(args) -> int:
+    """Handle `debug rule-compiler` subcommand - compiled rule parity + benchmark."""
+    from src.tools.backtest_audit_tools import backtest_audit_rule_compiler_tool
+
+    if not args.json_output:
+        console.print(Panel(
+            f"[bold cyan]RULE COMPILER PARITY + BENCHMARK[/]\n"
+            f"Plays: {', '.join(args.plays) if args.plays else 'core validation plays'}\n"
+            f"Max snapshots per play: {args.max_snapshots}",
+            border_style="cyan"
+        ))
+
+    result = backtest_audit_rule_compiler_tool(
+        play_ids=args.plays,
+        max_snapshots=args.max_snapshots,
+    )
+
+    if args.json_output:
+        return _json_result(result)
+
+    for play in (result.data or {}).get("plays", []):
+        status = "[green]PASS[/]" if play["passed"] else "[red]FAIL[/]"
+        console.print(
+            f"  {status} {play['play_id']}: {play['snapshots']} snapshots, "
+            f"{play['interpreter_us_per_bar']:.1f}us -> {play['compiled_us_per_bar']:.1f}us per bar "
+            f"({play['speedup']:.1f}x)"
+        )
+        if play.get("error"):
+            console.print(f"[dim]    {play['error']}[/]")
+        for mismatch in play.get("mismatches", []):
+            console.print(
+                f"[dim]    exec_idx={mismatch['exec_idx']} {mismatch['where']}: "
+                f"expected={mismatch['expected']} observed={mismatch['observed']}[/]"
+            )
+
+    if result.success:
+        console.print(f"\n[bold green]PASS[/] {result.message}")
+        return 0
+    console.print(f"\n[bold red]FAIL[/] {result.error}")
+    return 1
+
+
+def handle_debug_alignment(args) -> int:
+    """Handle `debug alignment` subcommand - alignment table vs timestamp lookups."""
+    from src.tools.backtest_audit_tools import backtest_audit_alignment_tool
+
+    if not args.json_output:
+        console.print(Panel(
+            f"[bold cyan]MULTI-TF ALIGNMENT TABLE PARITY[/]\n"
+            f"Plays: {', '.join(args.plays) if args.plays else 'core validation plays'}\n"
+            f"Synthetic edge cases: {'yes' if args.synthetic else 'no'}",
+            border_style="cyan"
+        ))
+
+    result = backtest_audit_alignment_tool(
+        play_ids=args.plays,
+        synthetic=args.synthetic,
+    )
+
+    if args.json_output:
+        return _json_result(result)
+
+    for case in (result.data or {}).get("cases", []):
+        status = "[green]PASS[/]" if case["passed"] else "[red]FAIL[/]"
+        console.print(
+            f"  {status} {case['name']} ({case['exec_role']}): {case['exec_bars']} bars, "
+            f"{case['lookup_us_per_bar']:.2f}us -> {case['table_us_per_bar']:.2f}us per bar "
+            f"({case['speedup']:.1f}x), build {case['build_ms']:.1f}ms"
+        )
+        if case.get("error"):
+            console.print(f"[dim]    {case['error']}[/]")
+        for mismatch in case.get("mismatches", []):
+            console.print(
+                f"[dim]    exec_idx={mismatch['exec_idx']} {mismatch['where']}: "
+                f"expected={mismatch['expected']} observed={mismatch['observed']}[/]"
+            )
+
+    if result.success:
+        console.print(f"\n[bold green]PASS[/] {result.message}")
+        return 0
+    console.print(f"\n[bold red]FAIL[/] {result.error}")
+    return 1
+
+
+def handle_debug_prearm_replay(args) -> int:
+    """Handle `debug prearm-replay` subcommand - pre-armed vs normal live order path."""
+    from src.tools.forge_bench_tools import forge_prearm_replay_tool
+
+    if not args.json_output:
+        console.print(Panel(
+            f"[bold cyan]PRE-ARM REPLAY[/]\n"
+            f"Plays: {', '.join(args.plays) if args.plays else 'BENCH_001_simple'}\n"
+            f"Candles: {args.candles}, forming updates per candle: {args.forming_updates}",
+            border_style="cyan"
+        ))
+
+    result = forge_prearm_replay_tool(
+        play_ids=args.plays,
+        candles=args.candles,
+        forming_updates=args.forming_updates,
+        order_latency_ms=args.order_latency_ms,
+        query_latency_ms=args.query_latency_ms,
+    )
+
+    if args.json_output:
+        return _json_result(result)
+
+    for play in (result.data or {}).get("plays", []):
+        status = "[green]PASS[/]" if play["passed"] else "[red]FAIL[/]"
+        prearm = play.get("prearm") or {}
+        console.print(
+            f"  {status} {play['play_id']}: {play['orders']} orders ({play['entries']} entries), "
+            f"{play['mismatch_count']} mismatch(es), hits={prearm.get('hits', 0)} "
+            f"misses={prearm.get('misses', {})}"
+        )
+        console.print(
+            f"    to_order_ack p50: {play['baseline_to_order_ack_p50_ms']:.3f}ms -> "
+            f"{play['prearm_to_order_ack_p50_ms']:.3f}ms | pre-submit checks p50: "
+            f"{play['baseline_pre_submit_p50_ms']:.3f}ms -> {play['prearmed_p50_ms']:.3f}ms"
+        )
+        if play.get("error"):
+            console.print(f"[dim]    {play['error']}[/]")
+        for error in play.get("errors", []):
+            console.print(f"[dim]    {error}[/]")
+        for mismatch in play.get("mismatches", []):
+            console.print(
+                f"[dim]    order #{mismatch['index']}: baseline={mismatch['baseline']} "
+                f"prearm={mismatch['prearm']}[/]"
+            )
+
+    if result.success:
+        console.print(f"\n[bold green]PASS[/] {result.message}")
+        return 0
+    console.print(f"\n[bold red]FAIL[/] {result.error}")
+    return 1
+
+
+def handle_debug_checkpoint_restore(args) -> int:
+    """Handle `debug checkpoint-restore` subcommand - warm restart vs uninterrupted run and cold warmup."""
+    from src.tools.forge_bench_tools import forge_checkpoint_restore_tool
+
+    if not args.json_output:
+        console.print(Panel(
+            f"[bold cyan]CHECKPOINT RESTORE[/]\n"
+            f"Plays: {', '.join(args.plays) if args.plays else 'BENCH_001_simple, BENCH_004_structures'}\n"
+            f"Candles after warmup: {args.candles} (checkpoint halfway)",
+            border_style="cyan"
+        ))
+
+    result = forge_checkpoint_restore_tool(play_ids=args.plays, candles=args.candles)
+
+    if args.json_output:
+        return _json_result(result)
+
+    for play in (result.data or {}).get("plays", []):
+        status = "[green]PASS[/]" if play["passed"] else "[red]FAIL[/]"
+        cold = f"{play['diff_count_vs_cold']} diff(s)" if play["cold_compared"] else "skipped"
+        console.print(
+            f"  {status} {play['play_id']}: restored={play['restored']}, replayed {play['replayed']} bars, "
+            f"{play['diff_count_vs_uninterrupted']} diff(s) vs uninterrupted, cold: {cold}"
+        )
+        console.print(
+            f"    checkpoint {play['checkpoint_bytes'] / 1024:.1f}KB, save {play['save_ms']:.1f}ms | "
+            f"cold warmup {play['cold_warmup_ms']:.1f}ms, warm restart {play['warm_restart_ms']:.1f}ms | "
+            f"fallbacks: {', '.join(f'{k}={v}' for k, v in play['fallbacks'].items())}"
+        )
+        if play.get("error"):
+            console.print(f"[dim]    {play['error']}[/]")
+        for diff in play.get("diffs_vs_uninterrupted", []) + play.get("diffs_vs_cold", []):
+            console.print(f"[dim]    {diff}[/]")
+
+    if result.success:
+        console.print(f"\n[bold green]PASS[/] {result.message}")
+        return 0
+    console.print(f"\n[bold red]FAIL[/] {result.error}")
+    return 1
+
+
+def handle_debug_streaming_parity(args) -> int:
+    """Handle `debug streaming-parity` subcommand - streaming backtest vs in-memory run."""
+    from src.tools.forge_bench_tools import forge_streaming_parity_tool
+
+    if not args.json_output:
+        console.print(Panel(
+            f"[bold cyan]STREAMING PARITY[/]\n"
+            f"Plays: {', '.join(args.plays) if args.plays else 'BENCH_001_simple, BENCH_002_multi_tf'}\n"
+            f"Bars per TF: {args.bars} | Memory budget: {args.memory_budget_mb} MB",
+            border_style="cyan"
+        ))
+
+    result = forge_streaming_parity_tool(
+        play_ids=args.plays, bars=args.bars, memory_budget_mb=args.memory_budget_mb,
+    )
+
+    if args.json_output:
+        return _json_result(result)
+
+    for play in (result.data or {}).get("plays", []):
+        status = "[green]PASS[/]" if play["passed"] else "[red]FAIL[/]"
+        mem, stream = play["in_memory"], play["streaming"]
+        console.print(
+            f"  {status} {play['play_id']}: {mem.get('trades', '-')} trades, "
+            f"{len(play['mismatches'])} mismatch(es)"
+        )
+        if stream:
+            console.print(
+                f"    in-memory {mem['run_seconds']:.1f}s, streaming {stream['run_seconds']:.1f}s | "
+                f"mapped {play['mapped_mb']:.1f}MB, pager active={play['pager_active']}, "
+                f"{play['pager_releases']} release(s) | peak RSS {stream['peak_rss_mb']}MB"
+            )
+        if play.get("error"):
+            console.print(f"[dim]    {play['error']}[/]")
+        for mismatch in play["mismatches"]:
+            console.print(f"[dim]    {mismatch}[/]")
+
+    if result.success:
+        console.print(f"\n[bold green]PASS[/] {result.message}")
+        return 0
+    console.print(f"\n[bold red]FAIL[/] {result.error}")
+    return 1
+
 def handle_debug_determinism(args) -> int:
     """Handle `debug determinism` subcommand - Phase 3 hash-based verification."""
     from src.backtest.artifacts.determinism import compare_runs, verify_determinism_rerun
@@ -26,10 +26,17 @@ Incremental reporting:
   - Each gate result prints immediately as it completes
   - Partial report written to .validate_report.json after each gate
   - If process hangs/dies, partial results are on disk
+
+Incremental mode (--incremental, quick/standard/full/module):
+  - Gates and individual plays whose input hash (source import closure,
+    play YAML, config, registry versions) matches a stored pass are
+    reported as cached passes instead of rerun (see validate_cache.py)
+  - Exchange, pre-live and real-data gates always run
 """
 
 from __future__ import annotations
 
+import functools
 import json
 import os
 import re
@@ -50,6 +57,7 @@ from typing import Any, Callable
 from rich.console import Console
 
 from src.config.constants import PROJECT_ROOT
+from src.cli.validate_cache import ValidationResultStore, compute_input_hash, resolve_play_path
 
 console = Console()
 
@@ -99,6 +107,16 @@ REAL_DATA_SYNC_MANIFEST: list[dict[str, Any]] = [
 REAL_DATA_PHASES = ["accumulation", "markup", "distribution", "markdown"]
 
 
+# ── Incremental validation inputs ────────────────────────────────────
+# Entry modules per gate. The hashed source set is their transitive import
+# closure; this module is always included because the gate code lives here.
+
+PLAY_ENGINE_MODULES = ("src.backtest.play", "src.backtest.engine_factory")
+
+# Set by run_validation/run_module_validation when --incremental is given
+_result_store: ValidationResultStore | None = None
+
+
 # ── Data structures ───────────────────────────────────────────────────
 
 class Tier(str, Enum):
@@ -122,6 +140,7 @@ class GateResult:
     duration_sec: float
     detail: str = ""
     failures: list[str] = field(default_factory=list)
+    cached: bool = False
 
     def to_dict(self) -> dict:
         return {
@@ -132,6 +151,7 @@ class GateResult:
             "duration_sec": round(self.duration_sec, 2),
             "detail": self.detail,
             "failures": self.failures,
+            "cached": self.cached,
         }
 
 
@@ -172,7 +192,7 @@ def _print_gate_result(gate: GateResult) -> None:
     """Print a single gate result immediately to console."""
     status = "[bold green]PASS[/]" if gate.passed else "[bold red]FAIL[/]"
     name_padded = f"{gate.name} ".ljust(26, ".")
-    detail = f"[dim]{gate.detail}[/]"
+    detail = f"[dim]{gate.detail}{' (cached)' if gate.cached else ''}[/]"
     timing = f"[dim]{gate.duration_sec:.1f}s[/]"
     console.print(f" {gate.gate_id:4s} {name_padded} {status}  {detail:30s} {timing}")
 
@@ -218,6 +238,93 @@ def _finalize_report(tier: str, gates: list[GateResult], start_time: float) -> N
         pass
 
 
+# ── Incremental validation helpers ───────────────────────────────────
+
+def _incremental_gate(
+    gate_id: str,
+    modules: tuple[str, ...],
+    files: Callable[[], list[Path]] | None = None,
+) -> Callable[[Callable[[], GateResult]], Callable[[], GateResult]]:
+    """Decorate a gate so --incremental reuses a stored pass for unchanged inputs.
+
+    Args:
+        gate_id: Store key for the gate.
+        modules: Entry modules whose import closure the gate depends on.
+        files: Optional callable returning data files the gate reads (play YAMLs).
+    """
+    def decorator(fn: Callable[[], GateResult]) -> Callable[[], GateResult]:
+        @functools.wraps(fn)
+        def wrapper() -> GateResult:
+            store = _result_store
+            if store is None:
+                return fn()
+            input_hash = compute_input_hash(
+                (__name__, *modules), files() if files else (), {"gate": gate_id},
+            )
+            stored = store.get_gate(gate_id, input_hash)
+            if stored is not None:
+                stored["duration_sec"] = 0.0
+                stored["cached"] = True
+                return GateResult(**stored)
+            result = fn()
+            store.record_gate(gate_id, input_hash, result.to_dict())
+            return result
+        return wrapper
+    return decorator
+
+
+def _play_files(play_ids: list[str]) -> list[Path]:
+    """Resolve play IDs to YAML paths (missing plays are simply not hashed)."""
+    paths = [resolve_play_path(pid) for pid in play_ids]
+    return [p for p in paths if p is not None]
+
+
+def _play_input_hashes(
+    gate_id: str, play_ids: list[str], extra: dict[str, Any] | None = None,
+) -> dict[str, str]:
+    """Input hash per play for a play-running gate (empty when not incremental)."""
+    if _result_store is None:
+        return {}
+    hashes: dict[str, str] = {}
+    for pid in play_ids:
+        play_extra = {"gate": gate_id, "play": pid, **(extra or {}).get(pid, {})}
+        hashes[pid] = compute_input_hash(
+            (__name__, *PLAY_ENGINE_MODULES), _play_files([pid]), play_extra,
+        )
+    return hashes
+
+
+def _split_cached_plays(
+    gate_id: str, play_ids: list[str], hashes: dict[str, str],
+) -> tuple[list[str], dict[str, int]]:
+    """Split plays into (to_run, cached trade counts) using the result store."""
+    if _result_store is None:
+        return list(play_ids), {}
+    to_run: list[str] = []
+    cached: dict[str, int] = {}
+    for pid in play_ids:
+        trades = _result_store.get_play(gate_id, pid, hashes[pid])
+        if trades is None:
+            to_run.append(pid)
+        else:
+            cached[pid] = trades
+    return to_run, cached
+
+
+def _record_play_results(
+    gate_id: str, hashes: dict[str, str], outcomes: dict[str, tuple[int, str | None]],
+) -> None:
+    """Store per-play outcomes (passes kept, failures dropped)."""
+    if _result_store is None:
+        return
+    for pid, (trades, error) in outcomes.items():
+        _result_store.record_play(gate_id, pid, hashes[pid], trades, passed=error is None)
+
+
+def _cached_detail(cached: dict[str, int]) -> str:
+    return f" ({len(cached)} cached)" if cached else ""
+
+
 # ── Module-level worker functions (must be top-level for Windows spawn) ──
 
 def _run_single_play_synthetic(play_id: str) -> tuple[str, int, str | None]:
@@ -307,16 +414,20 @@ def _collect_futures_with_timeout(
     futures: dict[Future, str],
     play_timeout: int,
     gate_label: str = "",
+    outcomes: dict[str, tuple[int, str | None]] | None = None,
 ) -> tuple[int, list[str]]:
     """Collect results from play futures with per-play timeout.
 
-    Prints progress as each play completes.
+    Prints progress as each play completes. If ``outcomes`` is given, the
+    per-play (trades, error_or_None) is recorded into it.
     Returns (total_trades, failures).
     """
     total_trades = 0
     failures: list[str] = []
     total = len(futures)
     done = 0
+    if outcomes is None:
+        outcomes = {}
 
     try:
         for future in as_completed(futures, timeout=play_timeout * total):
@@ -328,18 +439,22 @@ def _collect_futures_with_timeout(
                 status = "[red]FAIL[/]" if error else "[green]ok[/]"
                 if error:
                     failures.append(error)
+                outcomes[pid] = (trades, error)
             except FuturesTimeoutError:
                 status = "[red]TIMEOUT[/]"
                 failures.append(f"{pid}: TIMEOUT after {play_timeout}s")
+                outcomes[pid] = (0, failures[-1])
             except Exception as e:
                 status = "[red]ERROR[/]"
                 failures.append(f"{pid}: {type(e).__name__}: {e}")
+                outcomes[pid] = (0, failures[-1])
             console.print(f"       [dim]{gate_label}[/] {done}/{total} {pid} {status}", highlight=False)
     except FuturesTimeoutError:
         # Overall as_completed timeout -- mark remaining as timed out
         for future, pid in futures.items():
             if not future.done():
                 failures.append(f"{pid}: TIMEOUT (pool deadline)")
+                outcomes[pid] = (0, failures[-1])
                 console.print(f"       [dim]{gate_label}[/] {pid} [red]TIMEOUT[/]", highlight=False)
 
     return total_trades, failures
@@ -371,34 +486,43 @@ def _gate_play_suite(
 
     workers = max_workers or _get_max_workers()
 
+    hashes = _play_input_hashes(gate_id, play_ids)
+    to_run, cached = _split_cached_plays(gate_id, play_ids, hashes)
+    total_trades += sum(cached.values())
+    outcomes: dict[str, tuple[int, str | None]] = {}
+
     # For small suites (<=3 plays), run sequentially to avoid process overhead
-    if checked <= 3:
-        for i, pid in enumerate(play_ids, 1):
-            console.print(f"       [dim]{gate_id}[/] {i}/{checked} {pid}...", highlight=False)
+    if len(to_run) <= 3:
+        for i, pid in enumerate(to_run, 1):
+            console.print(f"       [dim]{gate_id}[/] {i}/{len(to_run)} {pid}...", highlight=False)
             _, trades, error = _run_single_play_synthetic(pid)
             total_trades += trades
+            outcomes[pid] = (trades, error)
             if error:
                 failures.append(error)
     else:
         with ProcessPoolExecutor(max_workers=workers) as pool:
-            futures = {pool.submit(_run_single_play_synthetic, pid): pid for pid in play_ids}
-            trades, fails = _collect_futures_with_timeout(futures, play_timeout, gate_id)
+            futures = {pool.submit(_run_single_play_synthetic, pid): pid for pid in to_run}
+            trades, fails = _collect_futures_with_timeout(futures, play_timeout, gate_id, outcomes)
             total_trades += trades
             failures.extend(fails)
 
+    _record_play_results(gate_id, hashes, outcomes)
+
     return GateResult(
         gate_id=gate_id,
         name=gate_name,
         passed=len(failures) == 0,
         checked=checked,
         duration_sec=time.perf_counter() - start,
-        detail=f"{checked} plays, {total_trades} trades",
+        detail=f"{checked} plays, {total_trades} trades{_cached_detail(cached)}",
         failures=sorted(failures),
     )
 
 
 # ── Gate implementations ──────────────────────────────────────────────
 
+@_incremental_gate("G1", ("src.backtest.play",), lambda: _play_files(CORE_PLAY_IDS))
 def _gate_yaml_parse() -> GateResult:
     """G1: Parse and validate core validation plays."""
     start = time.perf_counter()
@@ -424,6 +548,7 @@ def _gate_yaml_parse() -> GateResult:
     )
 
 
+@_incremental_gate("G2", ("src.forge.audits.toolkit_contract_audit",))
 def _gate_registry_contract() -> GateResult:
     """G2: Indicator registry contract audit (44 indicators)."""
     start = time.perf_counter()
@@ -450,8 +575,9 @@ def _gate_registry_contract() -> GateResult:
     )
 
 
+@_incremental_gate("G3", ("src.forge.audits.audit_incremental_parity",))
 def _gate_incremental_parity() -> GateResult:
-    """G3: Incremental vs vectorized indicator parity (43 indicators)."""
+    """G3: Incremental vs vectorized indicator parity (44 indicators + registry coverage)."""
     start = time.perf_counter()
     failures: list[str] = []
 
@@ -483,11 +609,19 @@ def _gate_core_plays() -> GateResult:
     total_trades = 0
     workers = _get_max_workers()
 
-    with ProcessPoolExecutor(max_workers=workers) as pool:
-        futures = {pool.submit(_run_single_play_synthetic, pid): pid for pid in CORE_PLAY_IDS}
-        trades, fails = _collect_futures_with_timeout(futures, PLAY_TIMEOUT_SEC, "G4")
-        total_trades += trades
-        failures.extend(fails)
+    hashes = _play_input_hashes("G4", CORE_PLAY_IDS)
+    to_run, cached = _split_cached_plays("G4", CORE_PLAY_IDS, hashes)
+    total_trades += sum(cached.values())
+    outcomes: dict[str, tuple[int, str | None]] = {}
+
+    if to_run:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = {pool.submit(_run_single_play_synthetic, pid): pid for pid in to_run}
+            trades, fails = _collect_futures_with_timeout(futures, PLAY_TIMEOUT_SEC, "G4", outcomes)
+            total_trades += trades
+            failures.extend(fails)
+
+    _record_play_results("G4", hashes, outcomes)
 
     return GateResult(
         gate_id="G4",
@@ -495,7 +629,7 @@ def _gate_core_plays() -> GateResult:
         passed=len(failures) == 0,
         checked=len(CORE_PLAY_IDS),
         duration_sec=time.perf_counter() - start,
-        detail=f"{len(CORE_PLAY_IDS)} plays, {total_trades} trades",
+        detail=f"{len(CORE_PLAY_IDS)} plays, {total_trades} trades{_cached_detail(cached)}",
         failures=failures,
     )
 
@@ -506,35 +640,50 @@ def _gate_risk_stops() -> GateResult:
     failures: list[str] = []
     workers = _get_max_workers()
 
-    total = len(RISK_PLAY_EXPECTATIONS)
+    play_ids = list(RISK_PLAY_EXPECTATIONS)
+    hashes = _play_input_hashes(
+        "G4b", play_ids,
+        {pid: {"expected": expected} for pid, expected in RISK_PLAY_EXPECTATIONS.items()},
+    )
+    to_run, cached = _split_cached_plays("G4b", play_ids, hashes)
+    outcomes: dict[str, tuple[int, str | None]] = {}
+
+    total = len(to_run)
     done = 0
 
-    with ProcessPoolExecutor(max_workers=workers) as pool:
-        futures = {
-            pool.submit(_run_single_risk_play, pid, expected): pid
-            for pid, expected in RISK_PLAY_EXPECTATIONS.items()
-        }
-        try:
-            for future in as_completed(futures, timeout=PLAY_TIMEOUT_SEC * total):
-                pid = futures[future]
-                done += 1
-                try:
-                    _, error = future.result(timeout=PLAY_TIMEOUT_SEC)
-                    status = "[red]FAIL[/]" if error else "[green]ok[/]"
-                    if error:
-                        failures.append(error)
-                except FuturesTimeoutError:
-                    status = "[red]TIMEOUT[/]"
-                    failures.append(f"{pid}: TIMEOUT after {PLAY_TIMEOUT_SEC}s")
-                except Exception as e:
-                    status = "[red]ERROR[/]"
-                    failures.append(f"{pid}: {type(e).__name__}: {e}")
-                console.print(f"       [dim]G4b[/] {done}/{total} {pid} {status}", highlight=False)
-        except FuturesTimeoutError:
-            for future, pid in futures.items():
-                if not future.done():
-                    failures.append(f"{pid}: TIMEOUT (pool deadline)")
-                    console.print(f"       [dim]G4b[/] {pid} [red]TIMEOUT[/]", highlight=False)
+    if to_run:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = {
+                pool.submit(_run_single_risk_play, pid, RISK_PLAY_EXPECTATIONS[pid]): pid
+                for pid in to_run
+            }
+            try:
+                for future in as_completed(futures, timeout=PLAY_TIMEOUT_SEC * total):
+                    pid = futures[future]
+                    done += 1
+                    try:
+                        _, error = future.result(timeout=PLAY_TIMEOUT_SEC)
+                        status = "[red]FAIL[/]" if error else "[green]ok[/]"
+                        if error:
+                            failures.append(error)
+                        outcomes[pid] = (0, error)
+                    except FuturesTimeoutError:
+                        status = "[red]TIMEOUT[/]"
+                        failures.append(f"{pid}: TIMEOUT after {PLAY_TIMEOUT_SEC}s")
+                        outcomes[pid] = (0, failures[-1])
+                    except Exception as e:
+                        status = "[red]ERROR[/]"
+                        failures.append(f"{pid}: {type(e).__name__}: {e}")
+                        outcomes[pid] = (0, failures[-1])
+                    console.print(f"       [dim]G4b[/] {done}/{total} {pid} {status}", highlight=False)
+            except FuturesTimeoutError:
+                for future, pid in futures.items():
+                    if not future.done():
+                        failures.append(f"{pid}: TIMEOUT (pool deadline)")
+                        outcomes[pid] = (0, failures[-1])
+                        console.print(f"       [dim]G4b[/] {pid} [red]TIMEOUT[/]", highlight=False)
+
+    _record_play_results("G4b", hashes, outcomes)
 
     return GateResult(
         gate_id="G4b",
@@ -542,11 +691,12 @@ def _gate_risk_stops() -> GateResult:
         passed=len(failures) == 0,
         checked=len(RISK_PLAY_EXPECTATIONS),
         duration_sec=time.perf_counter() - start,
-        detail=f"{len(RISK_PLAY_EXPECTATIONS)} risk plays",
+        detail=f"{len(RISK_PLAY_EXPECTATIONS)} risk plays{_cached_detail(cached)}",
         failures=failures,
     )
 
 
+@_incremental_gate("G5", ("src.forge.audits.audit_structure_parity",))
 def _gate_structure_parity() -> GateResult:
     """G5: Structure detector vectorized vs incremental parity (7 detectors)."""
     start = time.perf_counter()
@@ -573,6 +723,7 @@ def _gate_structure_parity() -> GateResult:
     )
 
 
+@_incremental_gate("G6", ("src.forge.audits.audit_rollup_parity",))
 def _gate_rollup_parity() -> GateResult:
     """G6: 1m rollup bucket parity audit."""
     start = time.perf_counter()
@@ -597,6 +748,7 @@ def _gate_rollup_parity() -> GateResult:
     )
 
 
+@_incremental_gate("G7", ("src.cli.smoke_tests.sim_orders",))
 def _gate_sim_orders() -> GateResult:
     """G7: Simulator order type smoke tests."""
     start = time.perf_counter()
@@ -617,6 +769,7 @@ def _gate_sim_orders() -> GateResult:
     )
 
 
+@_incremental_gate("G11", ("src.backtest.metrics", "src.backtest.types"))
 def _gate_metrics_audit() -> GateResult:
     """G11: Financial metrics calculation correctness."""
     start = time.perf_counter()
@@ -719,6 +872,12 @@ def _gate_metrics_audit() -> GateResult:
     )
 
 
+@_incremental_gate(
+    "G15",
+    ("src.backtest.indicator_registry", "src.structures.registry"),
+    lambda: sorted((PROJECT_ROOT / "plays" / "validation" / "indicators").glob("*.yml"))
+    + sorted((PROJECT_ROOT / "plays" / "validation" / "structures").glob("*.yml")),
+)
 def _gate_coverage_check() -> GateResult:
     """G15: Check that all registered indicators and structures have validation plays."""
     import yaml
@@ -794,6 +953,7 @@ def _gate_coverage_check() -> GateResult:
     )
 
 
+@_incremental_gate("G16", (), lambda: sorted((PROJECT_ROOT / "src").rglob("*.py")))
 def _gate_logging_lint() -> GateResult:
     """G16: Banned logging patterns -- enforce get_module_logger() convention.
 
@@ -806,7 +966,7 @@ def _gate_logging_lint() -> GateResult:
     failures: list[str] = []
     checked = 0
 
-    src_dir = Path("src")
+    src_dir = PROJECT_ROOT / "src"
     if not src_dir.exists():
         return GateResult(
             gate_id="G16",
@@ -835,7 +995,7 @@ def _gate_logging_lint() -> GateResult:
             m = banned_re.search(line)
             if m:
                 failures.append(
-                    f"{py_file}:{line_num}: use get_module_logger() not {_sl}.{m.group(1)}()"
+                    f"{py_file.relative_to(PROJECT_ROOT)}:{line_num}: use get_module_logger() not {_sl}.{m.group(1)}()"
                 )
 
     return GateResult(
@@ -849,12 +1009,14 @@ def _gate_logging_lint() -> GateResult:
     )
 
 
+@_incremental_gate("G17", ("src.cli.validate_timestamps",))
 def _gate_timestamps() -> GateResult:
     """G17: Timestamp correctness — conversion, parsing, serialization."""
     from src.cli.validate_timestamps import gate_timestamps
     return gate_timestamps()
 
 
+@_incremental_gate("G14", PLAY_ENGINE_MODULES, lambda: _play_files(CORE_PLAY_IDS))
 def _gate_determinism() -> GateResult:
     """G14: Engine determinism - same input = same output."""
     start = time.perf_counter()
@@ -1602,15 +1764,22 @@ def run_module_validation(
     max_workers: int | None = None,
     json_output: bool = False,
     play_timeout: int = PLAY_TIMEOUT_SEC,
+    incremental: bool = False,
 ) -> int:
     """Run a single validation module independently.
 
+    Args:
+        incremental: Reuse stored passes for gates/plays with unchanged inputs.
+
     Returns:
         Exit code: 0 if all gates pass, 1 if any fail.
     """
+    global _result_store
     from src.utils.logger import suppress_for_validation
     suppress_for_validation()
 
+    _result_store = ValidationResultStore() if incremental else None
+
     modules = _make_module_definitions(max_workers, play_timeout)
     if module_name not in modules:
         console.print(f"[bold red]Unknown module: {module_name}[/]")
@@ -1661,12 +1830,15 @@ def run_validation(
     play_timeout: int = PLAY_TIMEOUT_SEC,
     gate_timeout: int = GATE_TIMEOUT_SEC,
     confirm: bool = False,
+    incremental: bool = False,
 ) -> int:
     """
     Run the unified validation suite at the specified tier.
 
     Args:
         confirm: Enable destructive tests (position lifecycle in pre-live tier).
+        incremental: Reuse stored passes for gates/plays with unchanged inputs
+            (quick/standard/full/module only; other tiers always run everything).
 
     Returns:
         Exit code: 0 if all gates pass, 1 if any fail.
@@ -1679,8 +1851,16 @@ def run_validation(
         return run_module_validation(
             module_name, max_workers=max_workers,
             json_output=json_output, play_timeout=play_timeout,
+            incremental=incremental,
         )
 
+    global _result_store
+    _result_store = (
+        ValidationResultStore()
+        if incremental and tier in (Tier.QUICK, Tier.STANDARD, Tier.FULL)
+        else None
+    )
+
     # Suppress noisy logging for validation runs (except exchange tier which needs app init)
     if tier != Tier.EXCHANGE:
         from src.utils.logger import suppress_for_validation
@@ -1869,4 +2049,11 @@ def _print_summary(report: ValidationReport) -> None:
             f"  [dim]({report.duration_sec:.1f}s)[/]"
         )
 
+    cached = sum(1 for g in report.gates if g.cached)
+    if _result_store is not None:
+        console.print(
+            f" [dim]incremental: {cached} gates cached, "
+            f"{_result_store.hits} hits / {_result_store.misses} misses[/]"
+        )
+
     console.print()
@@ -0,0 +1,200 @@
+"""
+Incremental validation: input-hash based result store.
+
+Backs ``python trade_cli.py validate <tier> --incremental``. For every gate,
+and for every play inside play gates, the store records a hash of the
+inputs that can change the outcome:
+
+- Source: transitive ``src.*`` import closure of the gate's entry modules
+  (static AST scan, so lazy in-function imports are included)
+- Play YAML (per play) and shared config (config/*.yml)
+- Synthetic data: SYNTHETIC_GENERATOR_VERSION. The dataset is a pure
+  function of the play's validation block and the generator source, both
+  already hashed, so the play is not generated just to hash it.
+- Registry versions: pipeline/structure schema versions and the registered
+  indicator and structure names
+- Interpreter and numpy/pandas versions
+
+A later run reuses a stored PASS when the hash matches. Failures are never
+stored, so a failing gate or play always reruns.
+
+Store file: .validate_cache.json (next to .validate_report.json).
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import platform
+import threading
+from collections.abc import Iterable
+from pathlib import Path
+from typing import Any
+
+from src.config.constants import PROJECT_ROOT
+from src.utils.helpers import atomic_write_text
+from src.utils.source_hash import hash_file, source_hashes
+
+VALIDATE_CACHE_FILE = Path(".validate_cache.json")
+
+# Bump when the hash recipe or the store layout changes
+STORE_VERSION = 1
+
+CONFIG_DIR = PROJECT_ROOT / "config"
+PLAYS_DIR = PROJECT_ROOT / "plays"
+
+
+# ── Hashing ──────────────────────────────────────────────────────────
+
+def resolve_play_path(play_id: str) -> Path | None:
+    """Find a play's YAML file the same way load_play() does."""
+    for ext in (".yml", ".yaml"):
+        candidate = PLAYS_DIR / f"{play_id}{ext}"
+        if candidate.exists():
+            return candidate
+        matches = list(PLAYS_DIR.rglob(f"{play_id}{ext}"))
+        if matches:
+            return matches[0]
+    return None
+
+
+_environment: dict[str, Any] | None = None
+
+
+def _environment_fingerprint() -> dict[str, Any]:
+    """Inputs shared by every gate: config, registry versions, interpreter/libraries."""
+    global _environment
+    if _environment is not None:
+        return _environment
+
+    import numpy as np
+    import pandas as pd
+
+    from src.backtest.artifacts.pipeline_signature import PIPELINE_VERSION
+    from src.backtest.indicator_registry import get_registry
+    from src.backtest.market_structure.types import STRUCTURE_SCHEMA_VERSION
+    from src.forge.validation.synthetic_data import SYNTHETIC_GENERATOR_VERSION
+    from src.structures.registry import list_structure_types
+
+    config_files = sorted(CONFIG_DIR.glob("*.yml")) if CONFIG_DIR.exists() else []
+    _environment = {
+        "store_version": STORE_VERSION,
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "pandas": pd.__version__,
+        "config": {p.name: hash_file(p) for p in config_files},
+        "registry": {
+            "pipeline_version": PIPELINE_VERSION,
+            "structure_schema_version": STRUCTURE_SCHEMA_VERSION,
+            "synthetic_generator_version": SYNTHETIC_GENERATOR_VERSION,
+            "indicators": sorted(get_registry().list_indicators()),
+            "structures": sorted(list_structure_types()),
+        },
+    }
+    return _environment
+
+
+def compute_input_hash(
+    modules: Iterable[str],
+    files: Iterable[Path] = (),
+    extra: dict[str, Any] | None = None,
+) -> str:
+    """
+    Hash everything that can change a gate's (or play's) outcome.
+
+    Args:
+        modules: Entry modules; their transitive src.* import closure is hashed.
+        files: Additional data files (play YAMLs, fixtures).
+        extra: Additional JSON-serializable parameters (play id, expectations).
+    """
+    components = {
+        "environment": _environment_fingerprint(),
+        "sources": source_hashes(modules),
+        "files": {str(p): hash_file(p) for p in sorted(set(files))},
+        "extra": extra or {},
+    }
+    serialized = json.dumps(components, sort_keys=True, default=str)
+    return hashlib.sha256(serialized.encode("utf-8")).hexdigest()
+
+
+# ── Result store ─────────────────────────────────────────────────────
+
+class ValidationResultStore:
+    """
+    Persistent record of passing gates and plays keyed by input hash.
+
+    Thread-safe: gates within a stage run concurrently. Every record is
+    flushed to disk immediately (atomic replace) so an interrupted run
+    keeps what already passed.
+    """
+
+    def __init__(self, path: Path = VALIDATE_CACHE_FILE):
+        self.path = path
+        self._lock = threading.Lock()
+        self._gates: dict[str, dict[str, Any]] = {}
+        self._plays: dict[str, dict[str, Any]] = {}
+        self.hits = 0
+        self.misses = 0
+        self._load()
+
+    def _load(self) -> None:
+        try:
+            raw = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return
+        if raw.get("store_version") != STORE_VERSION:
+            return
+        self._gates = raw.get("gates", {})
+        self._plays = raw.get("plays", {})
+
+    def _save(self) -> None:
+        data = {"store_version": STORE_VERSION, "gates": self._gates, "plays": self._plays}
+        try:
+            atomic_write_text(self.path, json.dumps(data, indent=2, sort_keys=True))
+        except OSError:
+            pass  # non-critical: next run simply reruns
+
+    # ── Gates ──
+
+    def get_gate(self, gate_id: str, input_hash: str) -> dict[str, Any] | None:
+        """Stored passing GateResult dict for this input hash, or None."""
+        with self._lock:
+            entry = self._gates.get(gate_id)
+            if entry is not None and entry["input_hash"] == input_hash:
+                self.hits += 1
+                return dict(entry["result"])
+            self.misses += 1
+            return None
+
+    def record_gate(self, gate_id: str, input_hash: str, result: dict[str, Any]) -> None:
+        """Store a passing result; a failing result drops any stored pass."""
+        with self._lock:
+            if result.get("passed"):
+                self._gates[gate_id] = {"input_hash": input_hash, "result": result}
+            else:
+                self._gates.pop(gate_id, None)
+            self._save()
+
+    # ── Plays ──
+
+    def get_play(self, gate_id: str, play_id: str, input_hash: str) -> int | None:
+        """Stored trade count of a passing play run for this input hash, or None."""
+        with self._lock:
+            entry = self._plays.get(f"{gate_id}:{play_id}")
+            if entry is not None and entry["input_hash"] == input_hash:
+                self.hits += 1
+                return int(entry["trades"])
+            self.misses += 1
+            return None
+
+    def record_play(
+        self, gate_id: str, play_id: str, input_hash: str, trades: int, passed: bool,
+    ) -> None:
+        """Store a passing play run; a failing run drops any stored pass."""
+        key = f"{gate_id}:{play_id}"
+        with self._lock:
+            if passed:
+                self._plays[key] = {"input_hash": input_hash, "trades": trades}
+            else:
+                self._plays.pop(key, None)
+            self._save()
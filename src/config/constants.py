@@ -25,6 +25,7 @@ RUNTIME_DIR = PROJECT_ROOT / "data" / "runtime"
 INSTANCES_DIR = RUNTIME_DIR / "instances"
 JOURNAL_DIR = PROJECT_ROOT / "data" / "journal"
 STATE_DIR = RUNTIME_DIR / "state"
+CHECKPOINT_DIR = RUNTIME_DIR / "checkpoints"
 
 
 # ==================== UTA Settle Coins ====================
@@ -18,6 +18,7 @@ from .exchange_manager import (
 from .position_manager import PositionManager, PortfolioSnapshot, TradeRecord
 from .risk_manager import RiskManager, Signal, RiskCheckResult
 from .order_executor import OrderExecutor, ExecutionResult
+from .prearm import PrearmBook, PreparedOrder
 from .safety import (
     panic_close_all,
     is_panic_triggered,
@@ -49,6 +50,9 @@ __all__ = [
     # Order Executor
     "OrderExecutor",
     "ExecutionResult",
+    # Pre-armed entry orders
+    "PrearmBook",
+    "PreparedOrder",
     # Safety
     "panic_close_all",
     "is_panic_triggered",
@@ -336,13 +336,13 @@ class ExchangeManager:
         from . import exchange_orders_market as mkt
         return mkt.market_sell(self, symbol, usd_amount, reduce_only=reduce_only)
     
-    def market_buy_with_tpsl(self, symbol: str, usd_amount: float, take_profit: float | None = None, stop_loss: float | None = None, tpsl_mode: str = "Full", tp_order_type: str = "Market", sl_order_type: str = "Market") -> OrderResult:
+    def market_buy_with_tpsl(self, symbol: str, usd_amount: float, take_profit: float | None = None, stop_loss: float | None = None, tpsl_mode: str = "Full", tp_order_type: str = "Market", sl_order_type: str = "Market", quote_price: float | None = None) -> OrderResult:
         from . import exchange_orders_market as mkt
-        return mkt.market_buy_with_tpsl(self, symbol, usd_amount, take_profit, stop_loss, tpsl_mode, tp_order_type, sl_order_type)
+        return mkt.market_buy_with_tpsl(self, symbol, usd_amount, take_profit, stop_loss, tpsl_mode, tp_order_type, sl_order_type, quote_price=quote_price)
 
-    def market_sell_with_tpsl(self, symbol: str, usd_amount: float, take_profit: float | None = None, stop_loss: float | None = None, tpsl_mode: str = "Full", tp_order_type: str = "Market", sl_order_type: str = "Market") -> OrderResult:
+    def market_sell_with_tpsl(self, symbol: str, usd_amount: float, take_profit: float | None = None, stop_loss: float | None = None, tpsl_mode: str = "Full", tp_order_type: str = "Market", sl_order_type: str = "Market", quote_price: float | None = None) -> OrderResult:
         from . import exchange_orders_market as mkt
-        return mkt.market_sell_with_tpsl(self, symbol, usd_amount, take_profit, stop_loss, tpsl_mode, tp_order_type, sl_order_type)
+        return mkt.market_sell_with_tpsl(self, symbol, usd_amount, take_profit, stop_loss, tpsl_mode, tp_order_type, sl_order_type, quote_price=quote_price)
     
     # ==================== Limit Orders (delegated) ====================
     
@@ -543,6 +543,13 @@ class ExchangeManager:
     def _calculate_qty(self, symbol: str, usd_amount: float, price: float | None = None) -> float:
         from . import exchange_instruments as inst
         return inst.calculate_qty(self, symbol, usd_amount, price)
+
+    def warm_order_path(self, symbol: str) -> None:
+        """Subscribe WebSocket tracking and cache instrument info ahead of an order."""
+        from . import exchange_instruments as inst
+        from . import exchange_websocket as ws
+        ws.ensure_symbol_tracked(self, symbol)
+        inst.get_instrument_info(self, symbol)
     
     def _get_price_precision(self, symbol: str) -> int:
         from . import exchange_instruments as inst
@@ -151,6 +151,7 @@ def market_buy_with_tpsl(
     tpsl_mode: str = "Full",
     tp_order_type: str = "Market",
     sl_order_type: str = "Market",
+    quote_price: float | None = None,
 ) -> "OrderResult":
     """Place a market buy order with TP/SL."""
     from .exchange_manager import OrderResult
@@ -162,7 +163,9 @@ def market_buy_with_tpsl(
     try:
         ws.ensure_symbol_tracked(manager, symbol)
 
-        quote_price = manager.get_price(symbol)
+        # quote_price: decision price of a pre-armed order (src/core/prearm.py)
+        if quote_price is None:
+            quote_price = manager.get_price(symbol)
         qty = inst.calculate_qty(manager, symbol, usd_amount, quote_price)
 
         result = manager.bybit.create_order(
@@ -208,6 +211,7 @@ def market_sell_with_tpsl(
     tpsl_mode: str = "Full",
     tp_order_type: str = "Market",
     sl_order_type: str = "Market",
+    quote_price: float | None = None,
 ) -> "OrderResult":
     """Place a market sell order with TP/SL (short)."""
     from .exchange_manager import OrderResult
@@ -219,7 +223,9 @@ def market_sell_with_tpsl(
     try:
         ws.ensure_symbol_tracked(manager, symbol)
 
-        quote_price = manager.get_price(symbol)
+        # quote_price: decision price of a pre-armed order (src/core/prearm.py)
+        if quote_price is None:
+            quote_price = manager.get_price(symbol)
         qty = inst.calculate_qty(manager, symbol, usd_amount, quote_price)
 
         result = manager.bybit.create_order(
@@ -16,14 +16,19 @@ from collections import OrderedDict
 from collections.abc import Callable
 from dataclasses import dataclass, field
 from datetime import datetime
+from typing import TYPE_CHECKING
 
 from ..utils.datetime_utils import utc_now
 from .exchange_manager import ExchangeManager, OrderResult
 from .risk_manager import RiskManager, Signal, RiskCheckResult
 from .position_manager import PositionManager
 from ..config.config import get_config
+from ..utils.latency import current_trace, mark_execution
 from ..utils.logger import get_module_logger
 
+if TYPE_CHECKING:
+    from .prearm import PreparedOrder
+
 
 @dataclass
 class ExecutionResult:
@@ -184,6 +189,7 @@ class OrderExecutor:
     def _on_execution(self, exec_data):
         """Handle execution update from WebSocket."""
         order_id = exec_data.order_id
+        mark_execution(order_id)  # Closes the latency trace of a traced order
 
         with self._pending_lock:
             # Check if this is a pending order we're tracking
@@ -230,19 +236,28 @@ class OrderExecutor:
             return False, reason
         return True, ""
 
-    def execute(self, signal: Signal) -> ExecutionResult:
+    def execute(self, signal: Signal, prepared: "PreparedOrder | None" = None) -> ExecutionResult:
         """
         Execute a trading signal through risk checks.
 
         Args:
             signal: Trading signal to execute
+            prepared: Pre-armed checks for this signal (src/core/prearm.py).
+                The caller has verified their inputs are unchanged; the
+                portfolio, risk and price checks are skipped and market
+                quantity is computed at signal.reference_price.
 
         Returns:
             ExecutionResult with full details
         """
+        trace = current_trace()
+
         # SAFETY: Check panic state before anything else
         from .safety import is_panic_triggered
-        if is_panic_triggered():
+        panic = is_panic_triggered()
+        if trace is not None:
+            trace.mark("executor.panic_check")
+        if panic:
             from .risk_manager import RiskCheckResult
             risk_result = RiskCheckResult(allowed=False, reason="Panic state active - trading halted")
             result = ExecutionResult(
@@ -256,6 +271,8 @@ class OrderExecutor:
 
         # SAFETY GUARD RAIL: Validate trading mode consistency FIRST
         is_valid, error_msg = self._validate_trading_mode()
+        if trace is not None:
+            trace.mark("executor.mode_validation")
         if not is_valid:
             self.logger.error("Trading mode validation failed: %s", error_msg)
             # Create a minimal risk check result for the error case
@@ -278,44 +295,19 @@ class OrderExecutor:
             signal.symbol, signal.direction, signal.size_usdt, signal.strategy,
         )
 
-        # Get current portfolio state
-        portfolio = self.position.get_snapshot()
-
-        # Step 1: Risk check
-        risk_result = self.risk.check(signal, portfolio)
-
-        if not risk_result.allowed:
-            self.logger.warning("Signal blocked by risk manager: %s", risk_result.reason)
-
-            # Emit order.execute.end event (blocked by risk)
-            self.logger.warning(
-                "[order.execute.end] symbol=%s direction=%s success=False "
-                "blocked_by_risk=True reason=%s",
-                signal.symbol, signal.direction, risk_result.reason,
-            )
-
-            result = ExecutionResult(
-                success=False,
-                signal=signal,
-                risk_check=risk_result,
-                error=f"Risk check failed: {risk_result.reason}"
-            )
-            self._invoke_callbacks(result)
-            return result
-
-        # Log any warnings
-        for warning in (risk_result.warnings or []):
-            self.logger.warning("Risk warning: %s", warning)
+        if prepared is not None:
+            risk_result = prepared.risk_check
+            if trace is not None:
+                trace.mark("executor.prearmed")
+        else:
+            risk_result, blocked = self._pre_submit_checks(signal, trace)
+            if blocked is not None:
+                self._invoke_callbacks(blocked)
+                return blocked
 
         # Determine execution size
         exec_size = risk_result.adjusted_size or signal.size_usdt
 
-        # G14.3: Fat finger / price sanity guard
-        deviation_result = self._check_price_deviation(signal)
-        if deviation_result is not None:
-            self._invoke_callbacks(deviation_result)
-            return deviation_result
-
         # Step 2: Execute order
         # Extract order type and parameters from signal metadata
         meta = signal.metadata or {}
@@ -326,6 +318,7 @@ class OrderExecutor:
         sl_order_type = meta.get("sl_order_type", "Market")
         stop_loss = meta.get("stop_loss")
         take_profit = meta.get("take_profit")
+        quote_price = signal.reference_price if prepared is not None else None
 
         order_result = None
 
@@ -355,12 +348,14 @@ class OrderExecutor:
                         signal.symbol, exec_size,
                         take_profit=take_profit, stop_loss=stop_loss,
                         tp_order_type=tp_order_type, sl_order_type=sl_order_type,
+                        quote_price=quote_price,
                     )
                 elif signal.direction == "SHORT":
                     order_result = self.exchange.market_sell_with_tpsl(
                         signal.symbol, exec_size,
                         take_profit=take_profit, stop_loss=stop_loss,
                         tp_order_type=tp_order_type, sl_order_type=sl_order_type,
+                        quote_price=quote_price,
                     )
 
             if order_result is None:
@@ -374,6 +369,8 @@ class OrderExecutor:
                 return result
 
         except Exception as e:
+            if trace is not None:
+                trace.mark("executor.order")
             self.logger.error("Order execution failed: %s", e)
 
             # Emit order.execute.end event (exception)
@@ -391,6 +388,9 @@ class OrderExecutor:
             self._invoke_callbacks(result)
             return result
 
+        if trace is not None:
+            trace.mark_order_ack(order_result.order_id if order_result.success else None)
+
         # Track pending order for WebSocket confirmation
         if order_result and order_result.order_id and self._use_ws_feedback:
             with self._pending_lock:
@@ -492,8 +492,90 @@ class OrderExecutor:
         )
 
         self._invoke_callbacks(result)
+        if trace is not None:
+            trace.mark("executor.record")
         return result
 
+    def _pre_submit_checks(
+        self,
+        signal: Signal,
+        trace=None,
+        quiet: bool = False,
+    ) -> tuple[RiskCheckResult, ExecutionResult | None]:
+        """
+        Portfolio snapshot, risk check and price deviation guard of execute().
+
+        Returns:
+            (risk_result, None) when the signal may be submitted, else
+            (risk_result, failed ExecutionResult). quiet logs blocks at debug
+            level only (pre-arm, where the close-bar path reports them).
+        """
+        # Get current portfolio state
+        portfolio = self.position.get_snapshot()
+        if trace is not None:
+            trace.mark("executor.portfolio_snapshot")
+
+        # Step 1: Risk check
+        risk_result = self.risk.check(signal, portfolio)
+        if trace is not None:
+            trace.mark("executor.risk_check")
+
+        if not risk_result.allowed:
+            if quiet:
+                self.logger.debug("Pre-arm blocked by risk manager: %s", risk_result.reason)
+            else:
+                self.logger.warning("Signal blocked by risk manager: %s", risk_result.reason)
+
+                # Emit order.execute.end event (blocked by risk)
+                self.logger.warning(
+                    "[order.execute.end] symbol=%s direction=%s success=False "
+                    "blocked_by_risk=True reason=%s",
+                    signal.symbol, signal.direction, risk_result.reason,
+                )
+
+            return risk_result, ExecutionResult(
+                success=False,
+                signal=signal,
+                risk_check=risk_result,
+                error=f"Risk check failed: {risk_result.reason}"
+            )
+
+        # Log any warnings
+        if not quiet:
+            for warning in (risk_result.warnings or []):
+                self.logger.warning("Risk warning: %s", warning)
+
+        # G14.3: Fat finger / price sanity guard
+        deviation_result = self._check_price_deviation(signal)
+        if trace is not None:
+            trace.mark("executor.price_deviation")
+        return risk_result, deviation_result
+
+    def prepare(self, signal: Signal) -> RiskCheckResult | None:
+        """
+        Run execute()'s pre-submit checks for an entry signal ahead of time.
+
+        Live pre-arm stage (src/core/prearm.py): trading mode, portfolio
+        snapshot, risk manager and price deviation guard (against
+        signal.reference_price), plus the WebSocket tracking and instrument
+        lookups of the order call. Nothing is submitted, no callbacks fire.
+
+        Returns:
+            The passing RiskCheckResult, or None if the signal is an exit or
+            any check blocks (the close-bar signal then runs the full path)
+        """
+        if signal.direction == "FLAT" or not self._validate_trading_mode()[0]:
+            return None
+        risk_result, blocked = self._pre_submit_checks(signal, quiet=True)
+        if blocked is not None:
+            return None
+        try:
+            self.exchange.warm_order_path(signal.symbol)
+        except Exception as e:
+            self.logger.debug("Pre-arm order path warmup failed for %s: %s", signal.symbol, e)
+            return None
+        return risk_result
+
     def close_position(self, symbol: str, strategy: str | None = None) -> ExecutionResult:
         """
         Close a position (convenience method).
@@ -0,0 +1,216 @@
+"""
+Pre-armed entry orders for live trading.
+
+Everything between a signal and the order REST call (portfolio snapshot,
+risk manager incl. global risk / funding / daily loss, price sanity ticker,
+instrument and WebSocket tracking lookups, the runner's SafetyChecks) used to
+run serially after the exec candle closed. With pre-arming, LiveRunner runs
+that work on forming exec-candle updates instead:
+
+    forming update  -> PlayEngine.build_entry_orders(price)   sized entry per
+                       allowed direction (flat, no working orders only)
+                    -> LiveExchange.prearm()                   OrderExecutor.prepare()
+                                                               per direction
+    candle close    -> PlayEngine.process_bar()                final rule evaluation
+                    -> LiveExchange.submit_order()             PrearmBook.take(); a hit
+                                                               goes straight to submit
+
+There is no forming-bar rule evaluation, so every direction the position
+policy allows is armed; the close-bar evaluation alone decides whether an
+order is sent. Exits (FLAT) are never pre-armed.
+
+A prepared order is used only if, at close:
+    - it was armed for this bar                      (else "stale_bar")
+    - the account fingerprint is unchanged           (else "account")
+      (position / order / execution update counts, equity, available balance)
+    - the signal's risk inputs match                 (else "size")
+      (symbol, direction, sized notional, leverage metadata)
+    - the close is within max_drift_pct of the       (else "drift")
+      price it was armed at
+Any miss takes the normal path, which runs every check again. The order
+itself is built from the close-bar signal either way (SL/TP, qty at the
+decision price), so a hit changes when the checks ran, not what is sent.
+
+Backtests never arm (PlayEngineConfig.prearm_orders is live-only).
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+from dataclasses import dataclass, field
+from time import perf_counter_ns
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .risk_manager import RiskCheckResult, Signal
+
+# Close vs armed price beyond this invalidates a prepared order
+PREARM_MAX_DRIFT_PCT = 0.5
+
+# Arm only in the last part of the exec bar (fraction of the bar, capped)
+PREARM_LEAD_FRACTION = 0.25
+PREARM_MAX_LEAD_SECONDS = 120.0
+
+
+def prearm_enabled_by_env() -> bool:
+    """Check the TRADE_PREARM environment variable."""
+    return os.environ.get("TRADE_PREARM", "").lower() in ("1", "true", "yes")
+
+
+def risk_inputs(signal: "Signal") -> tuple:
+    """The signal fields OrderExecutor's pre-submit checks depend on."""
+    leverage = signal.metadata.get("leverage") if signal.metadata else None
+    return (signal.symbol, signal.direction, round(signal.size_usdt, 8), leverage)
+
+
+@dataclass(slots=True)
+class PreparedOrder:
+    """Pre-submit checks of one entry direction, run ahead of the close."""
+    direction: str
+    risk_inputs: tuple
+    risk_check: "RiskCheckResult"
+    reference_price: float
+    bar_ts_close_ms: int
+    fingerprint: tuple
+    armed_ns: int = field(default_factory=perf_counter_ns)
+
+
+class PrearmBook:
+    """
+    Prepared entry orders of one symbol for the bar being formed.
+
+    Written from the runner's process loop (arm / clear) and read from
+    submit_order on the same loop; the lock only guards against callers
+    on other threads (tools, dashboard) reading stats.
+    """
+
+    def __init__(self, max_drift_pct: float = PREARM_MAX_DRIFT_PCT) -> None:
+        self.max_drift_pct = max_drift_pct
+        self._orders: dict[str, PreparedOrder] = {}
+        self._bar_ts_close_ms: int | None = None
+        self._fingerprint: tuple | None = None
+        self._reference_price = 0.0
+        self._safety_ok = False
+        self._safety_exposure = 0.0
+        self._lock = threading.Lock()
+        self.arms = 0
+        self.hits = 0
+        self.misses: dict[str, int] = {}
+
+    # ------------------------------------------------------------------
+    # Arming
+    # ------------------------------------------------------------------
+
+    def needs_arm(self, bar_ts_close_ms: int, fingerprint: tuple, price: float) -> bool:
+        """True if nothing valid is armed for this bar, account state and price."""
+        with self._lock:
+            if self._bar_ts_close_ms != bar_ts_close_ms or self._fingerprint != fingerprint:
+                return True
+            return not self._within_drift(price)
+
+    def begin(
+        self,
+        bar_ts_close_ms: int,
+        fingerprint: tuple,
+        price: float,
+        safety_ok: bool,
+        safety_exposure: float = 0.0,
+    ) -> None:
+        """
+        Start a fresh arm for a bar (drops earlier prepared orders).
+
+        safety_ok is the runner's SafetyChecks result for additional
+        exposure safety_exposure (the largest armed entry).
+        """
+        with self._lock:
+            self._orders.clear()
+            self._bar_ts_close_ms = bar_ts_close_ms
+            self._fingerprint = fingerprint
+            self._reference_price = price
+            self._safety_ok = safety_ok
+            self._safety_exposure = safety_exposure
+            self.arms += 1
+
+    def add(self, prepared: PreparedOrder) -> None:
+        with self._lock:
+            if prepared.bar_ts_close_ms == self._bar_ts_close_ms:
+                self._orders[prepared.direction] = prepared
+
+    def clear(self) -> None:
+        """Drop everything armed (end of exec candle, reconnect, stop)."""
+        with self._lock:
+            self._orders.clear()
+            self._bar_ts_close_ms = None
+            self._fingerprint = None
+            self._safety_ok = False
+            self._safety_exposure = 0.0
+
+    # ------------------------------------------------------------------
+    # Close
+    # ------------------------------------------------------------------
+
+    def check_bar(self, bar_ts_close_ms: int) -> None:
+        """Invalidate an arm made for another bar before the close is processed."""
+        with self._lock:
+            stale = self._bar_ts_close_ms is not None and self._bar_ts_close_ms != bar_ts_close_ms
+        if stale:
+            self._miss("stale_bar")
+            self.clear()
+
+    def safety_ok(self, fingerprint: tuple | None, price: float, exposure: float) -> bool:
+        """True if SafetyChecks passed at arm time for at least this exposure, inputs unchanged."""
+        if fingerprint is None:
+            return False
+        with self._lock:
+            return (
+                self._safety_ok
+                and exposure <= self._safety_exposure
+                and self._fingerprint == fingerprint
+                and self._within_drift(price)
+            )
+
+    def take(self, signal: "Signal", fingerprint: tuple) -> PreparedOrder | None:
+        """
+        Pop the prepared order for a close-bar entry signal if still valid.
+
+        Returns None (and counts the reason) when nothing usable is armed.
+        """
+        with self._lock:
+            prepared = self._orders.pop(signal.direction, None)
+        if prepared is None:
+            return None
+        if prepared.fingerprint != fingerprint:
+            return self._miss("account")
+        if prepared.risk_inputs != risk_inputs(signal):
+            return self._miss("size")
+        price = signal.reference_price
+        if not price or abs(price - prepared.reference_price) / prepared.reference_price * 100.0 > self.max_drift_pct:
+            return self._miss("drift")
+        with self._lock:
+            self.hits += 1
+        return prepared
+
+    def _within_drift(self, price: float) -> bool:
+        ref = self._reference_price
+        return ref > 0 and abs(price - ref) / ref * 100.0 <= self.max_drift_pct
+
+    def _miss(self, reason: str) -> None:
+        with self._lock:
+            self.misses[reason] = self.misses.get(reason, 0) + 1
+        return None
+
+    @property
+    def armed_directions(self) -> list[str]:
+        with self._lock:
+            return sorted(self._orders)
+
+    def to_dict(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                "arms": self.arms,
+                "hits": self.hits,
+                "misses": dict(self.misses),
+                "armed": sorted(self._orders),
+                "bar_ts_close_ms": self._bar_ts_close_ms,
+            }
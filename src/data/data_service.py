@@ -0,0 +1,648 @@
+"""
+Local data service: one process owns the writable DuckDB connection.
+
+Without the service every process opens the DuckDB file itself, so parallel
+readers need read-only connections (reset_stores(force_read_only=True)) and
+writers contend on the single-writer lock. With the service running
+(`python trade_cli.py data serve`), get_historical_store() returns a
+DataServiceClient instead and all access goes through a Unix socket:
+
+- Reads (get_ohlcv, get_funding, get_open_interest, status, ... and SELECT
+  statements on store.conn) run concurrently, each client thread on its own
+  DuckDB cursor. DataFrames travel as Arrow IPC streams.
+- Writes (sync*, heal, upsert_candle, derive_timeframes, DML on store.conn)
+  are queued to a single writer thread and applied in arrival order.
+  upsert_candle is fire-and-forget so live bar persistence never blocks.
+
+Wire format: 8-byte big-endian length + payload frames. A request is a
+pickled dict; a response is a pickled header followed, for DataFrame
+results, by one Arrow IPC frame. The socket is created with 0600
+permissions, and pickle is only exchanged with the same local user. Before
+unpickling, the client checks that the socket file belongs to its uid and
+both sides check the peer uid (SO_PEERCRED, where the platform has it).
+
+The service is found at `<duckdb path>.sock` (DATA_SERVICE_SOCKET overrides).
+Paths too long for a Unix socket fall back to a per-user 0700 directory
+(`$XDG_RUNTIME_DIR/trade-data-<uid>` or `<tempdir>/trade-data-<uid>`).
+Set DATA_SERVICE_DISABLE=1 to always open DuckDB directly. Platforms without
+AF_UNIX always use direct access.
+"""
+
+from __future__ import annotations
+
+import copy
+import hashlib
+import os
+import pickle
+import queue
+import socket
+import socketserver
+import stat
+import struct
+import tempfile
+import threading
+from concurrent.futures import Future
+from pathlib import Path
+from typing import Any
+
+import pandas as pd
+import pyarrow as pa
+
+from ..config.constants import DEFAULT_DATA_ENV, DataEnv, resolve_db_path, validate_data_env
+from ..utils.logger import get_module_logger
+
+logger = get_module_logger(__name__)
+
+
+PROTOCOL_VERSION = 1
+
+_FRAME_HEADER = struct.Struct(">Q")
+
+# struct ucred (pid, uid, gid) returned by SO_PEERCRED
+_PEERCRED = struct.Struct("3i")
+
+# Unix socket paths are limited to ~108 bytes
+_MAX_SOCKET_PATH = 100
+
+# Store methods that mutate the database (serialized through the writer queue)
+WRITE_METHODS = frozenset({
+    "sync",
+    "sync_range",
+    "sync_forward",
+    "sync_funding",
+    "sync_open_interest",
+    "fill_gaps",
+    "heal",
+    "upsert_candle",
+    "upsert_candles_batch",
+    "derive_timeframes",
+    "delete_symbol",
+    "delete_symbol_timeframe",
+    "cleanup_empty_symbols",
+    "vacuum",
+    "update_extremes",
+})
+
+# Writes the client does not wait for
+QUEUED_METHODS = frozenset({"upsert_candle"})
+
+# Methods that act on the service's shared store object directly
+CONTROL_METHODS = frozenset({"cancel", "reset_cancellation"})
+
+_READ_SQL_PREFIXES = ("SELECT", "WITH", "DESCRIBE", "SHOW", "PRAGMA", "EXPLAIN", "SUMMARIZE")
+
+# Simple attributes mirrored on the client at connect time
+_MIRRORED_ATTRS = (
+    "env",
+    "db_path",
+    "read_only",
+    "table_ohlcv",
+    "table_sync_metadata",
+    "table_funding",
+    "table_funding_metadata",
+    "table_oi",
+    "table_oi_metadata",
+    "table_extremes",
+)
+
+
+def data_service_disabled() -> bool:
+    """True when DATA_SERVICE_DISABLE is set or the platform has no Unix sockets."""
+    if not hasattr(socket, "AF_UNIX"):
+        return True
+    return os.getenv("DATA_SERVICE_DISABLE", "").strip().lower() in ("1", "true", "yes")
+
+
+def _private_socket_dir() -> Path:
+    """Per-user 0700 directory for fallback sockets; refuses one owned by someone else."""
+    runtime_dir = os.getenv("XDG_RUNTIME_DIR")
+    base = Path(runtime_dir) if runtime_dir else Path(tempfile.gettempdir())
+    path = base / f"trade-data-{os.getuid()}"
+    path.mkdir(mode=0o700, exist_ok=True)
+    st = path.lstat()
+    if not stat.S_ISDIR(st.st_mode) or st.st_uid != os.getuid() or st.st_mode & 0o077:
+        raise PermissionError(
+            f"Data service socket directory {path} is not a private directory owned by uid {os.getuid()}. "
+            f"Fix: remove it, or set DATA_SERVICE_SOCKET to a path in a directory only you can write"
+        )
+    return path
+
+
+def service_socket_path(env: DataEnv) -> Path:
+    """Socket path for an environment's data service (DATA_SERVICE_SOCKET overrides)."""
+    override = os.getenv("DATA_SERVICE_SOCKET")
+    if override:
+        return Path(override)
+    path = resolve_db_path(validate_data_env(env)).with_suffix(".sock")
+    if len(str(path)) > _MAX_SOCKET_PATH:
+        digest = hashlib.sha256(str(path).encode("utf-8")).hexdigest()[:16]
+        path = _private_socket_dir() / f"{digest}.sock"
+    return path
+
+
+def _check_socket_owner(socket_path: Path) -> None:
+    """Raise PermissionError unless socket_path is a socket owned by this process's uid."""
+    st = socket_path.lstat()
+    if not stat.S_ISSOCK(st.st_mode) or st.st_uid != os.getuid():
+        raise PermissionError(
+            f"{socket_path} is not a socket owned by uid {os.getuid()} (owner uid {st.st_uid}); "
+            f"refusing to exchange pickles with it"
+        )
+
+
+def _check_peer(sock: socket.socket) -> None:
+    """Raise PermissionError if the connected peer runs as another uid (SO_PEERCRED platforms only)."""
+    peercred = getattr(socket, "SO_PEERCRED", None)
+    if peercred is None:
+        return
+    creds = sock.getsockopt(socket.SOL_SOCKET, peercred, _PEERCRED.size)
+    _pid, uid, _gid = _PEERCRED.unpack(creds)
+    if uid != os.getuid():
+        raise PermissionError(f"Data service peer runs as uid {uid}, expected {os.getuid()}")
+
+
+def _connect_checked(socket_path: Path, timeout: float | None) -> socket.socket:
+    """Connect to the service socket after checking its owner, then check the peer."""
+    _check_socket_owner(socket_path)
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.settimeout(timeout)
+        sock.connect(str(socket_path))
+        _check_peer(sock)
+    except BaseException:
+        sock.close()
+        raise
+    return sock
+
+
+# ==================== FRAMING ====================
+
+
+def _recv_exact(sock: socket.socket, size: int) -> bytes:
+    buf = bytearray(size)
+    view = memoryview(buf)
+    got = 0
+    while got < size:
+        n = sock.recv_into(view[got:], size - got)
+        if n == 0:
+            raise ConnectionError("data service connection closed")
+        got += n
+    return bytes(buf)
+
+
+def _send_frames(sock: socket.socket, *payloads: bytes) -> None:
+    parts: list[bytes] = []
+    for payload in payloads:
+        parts.append(_FRAME_HEADER.pack(len(payload)))
+        parts.append(payload)
+    sock.sendall(b"".join(parts))
+
+
+def _recv_frame(sock: socket.socket) -> bytes:
+    (size,) = _FRAME_HEADER.unpack(_recv_exact(sock, _FRAME_HEADER.size))
+    return _recv_exact(sock, size)
+
+
+def _table_to_bytes(table: pa.Table) -> bytes:
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+    return sink.getvalue().to_pybytes()
+
+
+def _bytes_to_table(payload: bytes) -> pa.Table:
+    return pa.ipc.open_stream(pa.py_buffer(payload)).read_all()
+
+
+def _is_read_sql(query: str) -> bool:
+    words = query.lstrip().split(None, 1)
+    return bool(words) and words[0].upper() in _READ_SQL_PREFIXES
+
+
+# ==================== SERVER ====================
+
+
+class _WriterThread(threading.Thread):
+    """Applies queued writes to the service store one at a time."""
+
+    def __init__(self, store):
+        super().__init__(name="data-service-writer", daemon=True)
+        self._store = store
+        self._queue: queue.Queue[tuple[Any, tuple, dict, Future | None] | None] = queue.Queue()
+
+    def submit(self, fn, args: tuple, kwargs: dict, wait: bool) -> Future | None:
+        future: Future | None = Future() if wait else None
+        self._queue.put((fn, args, kwargs, future))
+        return future
+
+    def stop(self) -> None:
+        self._queue.put(None)
+
+    @property
+    def pending(self) -> int:
+        return self._queue.qsize()
+
+    def run(self) -> None:
+        while True:
+            item = self._queue.get()
+            if item is None:
+                return
+            fn, args, kwargs, future = item
+            try:
+                result = fn(*args, **kwargs)
+            except BaseException as e:  # reported to the waiting client
+                if future is not None:
+                    future.set_exception(e)
+                else:
+                    logger.error("Queued data write %s failed: %s", getattr(fn, "__name__", fn), e)
+                continue
+            if future is not None:
+                future.set_result(result)
+
+
+class _Handler(socketserver.BaseRequestHandler):
+    server: "_UnixServer"
+
+    def handle(self) -> None:
+        service = self.server.service
+        try:
+            _check_peer(self.request)
+        except OSError as e:
+            logger.warning("Data service rejected a connection: %s", e)
+            return
+        view = service.new_read_view()
+        try:
+            while True:
+                try:
+                    request = pickle.loads(_recv_frame(self.request))
+                except (ConnectionError, OSError, EOFError):
+                    return
+                frames = service.dispatch(request, view)
+                try:
+                    _send_frames(self.request, *frames)
+                except OSError:
+                    return
+        finally:
+            try:
+                view.conn.close()
+            except Exception:
+                pass
+
+
+class _UnixServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+    allow_reuse_address = True
+    service: "DataService"
+
+
+class DataService:
+    """
+    Owner of one environment's writable HistoricalDataStore, served over a Unix socket.
+
+    Usage:
+        service = DataService(env="backtest")
+        service.serve_forever()  # blocks; Ctrl-C or service.shutdown() stops it
+    """
+
+    def __init__(self, env: DataEnv = DEFAULT_DATA_ENV, socket_path: Path | None = None, db_path: str | None = None):
+        from .historical_data_store import HistoricalDataStore, register_service_store
+
+        self.env: DataEnv = validate_data_env(env)
+        self.socket_path = Path(socket_path) if socket_path else service_socket_path(self.env)
+        self.store = HistoricalDataStore(env=self.env, db_path=db_path)
+        # Code running inside the service (e.g. sync helpers) must use this store, not a client
+        register_service_store(self.store)
+        self._writer = _WriterThread(self.store)
+        self._server: _UnixServer | None = None
+
+    # ── Lifecycle ──
+
+    def start(self) -> None:
+        """Bind the socket and start the writer thread (serve_forever runs the accept loop)."""
+        if self.socket_path.exists():
+            if _ping(self.socket_path):
+                raise RuntimeError(f"A data service is already running on {self.socket_path}")
+            self.socket_path.unlink()
+        self.socket_path.parent.mkdir(parents=True, exist_ok=True)
+        old_umask = os.umask(0o177)
+        try:
+            self._server = _UnixServer(str(self.socket_path), _Handler)
+        finally:
+            os.umask(old_umask)
+        self._server.service = self
+        self._writer.start()
+        logger.info("Data service (%s) listening on %s", self.env, self.socket_path)
+
+    def serve_forever(self) -> None:
+        if self._server is None:
+            self.start()
+        assert self._server is not None
+        try:
+            self._server.serve_forever(poll_interval=0.5)
+        finally:
+            self.close()
+
+    def shutdown(self) -> None:
+        """Stop serve_forever from another thread."""
+        if self._server is not None:
+            self._server.shutdown()
+
+    def close(self) -> None:
+        self._writer.stop()
+        if self._writer.is_alive():
+            self._writer.join(timeout=30)
+        if self._server is not None:
+            self._server.server_close()
+            self._server = None
+        self.socket_path.unlink(missing_ok=True)
+        self.store.close()
+
+    # ── Dispatch ──
+
+    def new_read_view(self):
+        """Shallow copy of the store bound to its own DuckDB cursor (one per client connection)."""
+        view = copy.copy(self.store)
+        view.conn = self.store.conn.cursor()
+        return view
+
+    def dispatch(self, request: dict, view) -> tuple[bytes, ...]:
+        op = request.get("op")
+        try:
+            if op == "call":
+                result = self._call(request, view)
+            elif op == "sql":
+                result = self._sql(request, view)
+            elif op == "getattr":
+                result = getattr(self.store, request["name"])
+            elif op == "hello":
+                result = self._hello()
+            elif op == "ping":
+                result = "pong"
+            else:
+                raise ValueError(f"Unknown data service op: {op!r}")
+        except BaseException as e:
+            return (self._error_header(e),)
+        return self._encode(result)
+
+    def _hello(self) -> dict[str, Any]:
+        return {
+            "protocol": PROTOCOL_VERSION,
+            "pid": os.getpid(),
+            "attrs": {name: getattr(self.store, name) for name in _MIRRORED_ATTRS if hasattr(self.store, name)},
+        }
+
+    def _call(self, request: dict, view) -> Any:
+        method = request["method"]
+        if method.startswith("__"):
+            raise AttributeError(f"Data service does not expose {method}")
+        args = tuple(request.get("args", ()))
+        kwargs = dict(request.get("kwargs", {}))
+        if method in CONTROL_METHODS:
+            return getattr(self.store, method)(*args, **kwargs)
+        if method in WRITE_METHODS:
+            future = self._writer.submit(getattr(self.store, method), args, kwargs, wait=request.get("wait", True))
+            return None if future is None else future.result()
+        return getattr(view, method)(*args, **kwargs)
+
+    def _sql(self, request: dict, view) -> pa.Table:
+        query = request["query"]
+        params = request.get("params")
+        if _is_read_sql(query):
+            return view.conn.execute(query, params).fetch_arrow_table()
+
+        def run() -> pa.Table:
+            with self.store._write_operation():
+                return self.store.conn.execute(query, params).fetch_arrow_table()
+
+        future = self._writer.submit(run, (), {}, wait=True)
+        assert future is not None
+        return future.result()
+
+    @staticmethod
+    def _encode(result: Any) -> tuple[bytes, ...]:
+        if isinstance(result, pa.Table):
+            return (pickle.dumps({"ok": True, "kind": "table"}), _table_to_bytes(result))
+        if isinstance(result, pd.DataFrame):
+            try:
+                table = pa.Table.from_pandas(result, preserve_index=not isinstance(result.index, pd.RangeIndex))
+                return (pickle.dumps({"ok": True, "kind": "frame"}), _table_to_bytes(table))
+            except (pa.ArrowException, TypeError, ValueError):
+                pass  # fall through to pickle (e.g. mixed-type object columns)
+        return (pickle.dumps({"ok": True, "kind": "pickle", "value": result}, protocol=pickle.HIGHEST_PROTOCOL),)
+
+    @staticmethod
+    def _error_header(error: BaseException) -> bytes:
+        header: dict[str, Any] = {"ok": False, "error_type": type(error).__name__, "error": str(error)}
+        try:
+            header["exception"] = pickle.dumps(error)
+        except Exception:
+            pass
+        return pickle.dumps(header)
+
+
+# ==================== CLIENT ====================
+
+
+class _RemoteResult:
+    """Subset of the DuckDB result API used on store.conn (fetchone/fetchall/df)."""
+
+    def __init__(self, table: pa.Table):
+        self._table = table
+        self._rows: list[tuple] | None = None
+        self._pos = 0
+
+    def _all_rows(self) -> list[tuple]:
+        if self._rows is None:
+            columns = [col.to_pylist() for col in self._table.columns]
+            self._rows = list(zip(*columns)) if columns else []
+        return self._rows
+
+    def fetchone(self) -> tuple | None:
+        rows = self._all_rows()
+        if self._pos >= len(rows):
+            return None
+        row = rows[self._pos]
+        self._pos += 1
+        return row
+
+    def fetchall(self) -> list[tuple]:
+        rows = self._all_rows()[self._pos:]
+        self._pos = len(self._all_rows())
+        return rows
+
+    def df(self) -> pd.DataFrame:
+        return self._table.to_pandas()
+
+    def fetch_arrow_table(self) -> pa.Table:
+        return self._table
+
+
+class _RemoteConnection:
+    """Stand-in for store.conn: forwards SQL to the service."""
+
+    def __init__(self, client: "DataServiceClient"):
+        self._client = client
+
+    def execute(self, query: str, parameters: list | tuple | None = None) -> _RemoteResult:
+        table = self._client._request({"op": "sql", "query": query, "params": list(parameters) if parameters else None})
+        return _RemoteResult(table)
+
+    def close(self) -> None:
+        self._client.close()
+
+
+class DataServiceClient:
+    """
+    HistoricalDataStore stand-in that forwards every call to the data service.
+
+    Public store methods are proxied by name; `conn.execute(...)` forwards SQL.
+    Callable arguments (progress callbacks) cannot cross the socket and are
+    dropped. One request is in flight per client at a time.
+    """
+
+    def __init__(self, env: DataEnv, socket_path: Path, timeout: float | None = None):
+        self._socket_path = Path(socket_path)
+        self._timeout = timeout
+        self._lock = threading.Lock()
+        self._sock: socket.socket | None = None
+        self._pid = os.getpid()
+        self.conn = _RemoteConnection(self)
+        self.logger = logger
+        hello = self._request({"op": "hello"})
+        if hello.get("protocol") != PROTOCOL_VERSION:
+            self.close()
+            raise ConnectionError(
+                f"Data service protocol {hello.get('protocol')} != client protocol {PROTOCOL_VERSION}"
+            )
+        self.service_pid: int = hello["pid"]
+        for name, value in hello["attrs"].items():
+            setattr(self, name, value)
+        self.env = validate_data_env(env)
+
+    # ── Transport ──
+
+    def _connect(self) -> socket.socket:
+        return _connect_checked(self._socket_path, self._timeout)
+
+    def _request(self, request: dict) -> Any:
+        with self._lock:
+            if self._sock is None or self._pid != os.getpid():
+                # Never share a socket inherited across fork()
+                self._sock = self._connect()
+                self._pid = os.getpid()
+            try:
+                _send_frames(self._sock, pickle.dumps(request, protocol=pickle.HIGHEST_PROTOCOL))
+                header = pickle.loads(_recv_frame(self._sock))
+                payload = _recv_frame(self._sock) if header.get("kind") in ("table", "frame") else None
+            except (OSError, EOFError, pickle.UnpicklingError):
+                self._drop_socket()
+                raise
+        if not header["ok"]:
+            exc = None
+            if "exception" in header:
+                try:
+                    exc = pickle.loads(header["exception"])
+                except Exception:
+                    exc = None
+            if isinstance(exc, BaseException):
+                raise exc
+            raise RuntimeError(f"Data service error ({header['error_type']}): {header['error']}")
+        kind = header["kind"]
+        if kind == "table":
+            assert payload is not None
+            return _bytes_to_table(payload)
+        if kind == "frame":
+            assert payload is not None
+            return _bytes_to_table(payload).to_pandas()
+        return header["value"]
+
+    def _drop_socket(self) -> None:
+        if self._sock is not None:
+            try:
+                self._sock.close()
+            except OSError:
+                pass
+        self._sock = None
+
+    def close(self) -> None:
+        with self._lock:
+            self._drop_socket()
+
+    # ── Store API ──
+
+    def call(self, method: str, *args: Any, **kwargs: Any) -> Any:
+        """Invoke a HistoricalDataStore method in the service."""
+        args = tuple(None if callable(a) else a for a in args)
+        kwargs = {k: (None if callable(v) else v) for k, v in kwargs.items()}
+        return self._request({
+            "op": "call",
+            "method": method,
+            "args": args,
+            "kwargs": kwargs,
+            "wait": method not in QUEUED_METHODS,
+        })
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith("__"):
+            raise AttributeError(name)
+
+        def remote(*args: Any, **kwargs: Any) -> Any:
+            return self.call(name, *args, **kwargs)
+
+        remote.__name__ = name
+        return remote
+
+    @property
+    def _cancelled(self) -> bool:
+        return bool(self._request({"op": "getattr", "name": "_cancelled"}))
+
+    @_cancelled.setter
+    def _cancelled(self, value: bool) -> None:
+        self.call("cancel" if value else "reset_cancellation")
+
+    @staticmethod
+    def parse_period(period: str):
+        from .historical_data_store import HistoricalDataStore
+        return HistoricalDataStore.parse_period(period)
+
+    @staticmethod
+    def period_to_bars(period: str, timeframe: str) -> int:
+        from .historical_data_store import HistoricalDataStore
+        return HistoricalDataStore.period_to_bars(period, timeframe)
+
+    def __repr__(self) -> str:
+        return f"DataServiceClient(env={self.env!r}, socket={str(self._socket_path)!r}, service_pid={self.service_pid})"
+
+
+def _ping(socket_path: Path, timeout: float = 1.0) -> bool:
+    try:
+        with _connect_checked(socket_path, timeout) as sock:
+            _send_frames(sock, pickle.dumps({"op": "ping"}))
+            header = pickle.loads(_recv_frame(sock))
+            return header.get("ok") is True and header.get("value") == "pong"
+    except (OSError, EOFError, pickle.UnpicklingError, ConnectionError):
+        return False
+
+
+def data_service_running(env: DataEnv) -> bool:
+    """True if a data service for env answers on its socket (and the service is not disabled)."""
+    if data_service_disabled():
+        return False
+    try:
+        path = service_socket_path(env)
+    except OSError as e:
+        logger.warning("Data service socket unavailable, opening DuckDB directly: %s", e)
+        return False
+    return path.exists() and _ping(path)
+
+
+def connect_data_service(env: DataEnv) -> DataServiceClient | None:
+    """Client for env's running data service, or None (disabled, no socket, or not answering)."""
+    if not data_service_running(env):
+        return None
+    path = service_socket_path(env)
+    try:
+        return DataServiceClient(env, path)
+    except (OSError, ConnectionError) as e:
+        logger.warning("Data service at %s unusable, opening DuckDB directly: %s", path, e)
+        return None
@@ -7,6 +7,7 @@ Provides:
 - Period-based data retrieval (1Y, 6M, 1W, 1D, etc.)
 - DataFrame output for backtesting
 - Environment-aware storage (live vs demo)
+- Optional derived-TF sync: fetch 1m only, aggregate higher TFs locally
 
 Architecture:
 - Each data environment (live/demo) has its own DuckDB file
@@ -16,6 +17,7 @@ Architecture:
 """
 
 import atexit
+import hashlib
 import duckdb
 import os
 import pandas as pd
@@ -27,7 +29,7 @@ from datetime import datetime, timedelta
 from src.utils.datetime_utils import utc_now, datetime_to_epoch_ms, epoch_ms_to_datetime
 from pathlib import Path
 from collections.abc import Callable, Generator
-from typing import Any
+from typing import TYPE_CHECKING, Any
 from dataclasses import dataclass
 
 from ..exchanges.bybit_client import BybitClient
@@ -41,6 +43,10 @@ from ..config.constants import (
 )
 from ..utils.logger import get_module_logger
 
+if TYPE_CHECKING:
+    from .data_service import DataServiceClient
+    from .historical_derive import DerivedAuditReport
+
 
 # Activity emojis for visual feedback (with Windows-safe fallbacks)
 
@@ -342,6 +348,7 @@ class HistoricalDataStore:
         # Sync data
         store.sync("BTCUSDT", period="3M")  # 3 months, all timeframes
         store.sync(["BTCUSDT", "ETHUSDT"], period="1M", timeframes=["15m", "1h", "4h"])
+        store.sync("BTCUSDT", period="3M", derive=True)  # 1m from API, higher TFs derived
         
         # Query data
         df = store.get_ohlcv("BTCUSDT", "15m", period="1M")
@@ -779,11 +786,17 @@ class HistoricalDataStore:
         timeframes: list[str] | None = None,
         progress_callback: Callable | None = None,
         show_spinner: bool = True,
+        derive: bool = False,
     ) -> dict[str, int]:
-        """Sync historical data for symbols. See module docstring for details."""
+        """
+        Sync historical data for symbols. See module docstring for details.
+
+        derive=True fetches only 1m from the API and aggregates the other
+        timeframes locally (see historical_derive.py).
+        """
         from . import historical_sync
         return historical_sync.sync(
-            self, symbols, period, timeframes, progress_callback, show_spinner
+            self, symbols, period, timeframes, progress_callback, show_spinner, derive
         )
     
     def sync_range(
@@ -794,11 +807,12 @@ class HistoricalDataStore:
         timeframes: list[str] | None = None,
         progress_callback: Callable | None = None,
         show_spinner: bool = True,
+        derive: bool = False,
     ) -> dict[str, int]:
-        """Sync a specific date range with progress logging."""
+        """Sync a specific date range with progress logging (derive: see sync)."""
         from . import historical_sync
         return historical_sync.sync_range(
-            self, symbols, start, end, timeframes, progress_callback, show_spinner
+            self, symbols, start, end, timeframes, progress_callback, show_spinner, derive
         )
     
     def sync_forward(
@@ -807,11 +821,49 @@ class HistoricalDataStore:
         timeframes: list[str] | None = None,
         progress_callback: Callable | None = None,
         show_spinner: bool = True,
+        derive: bool = False,
     ) -> dict[str, int]:
-        """Sync data forward from the last stored candle to now."""
+        """Sync data forward from the last stored candle to now (derive: see sync)."""
         from . import historical_sync
         return historical_sync.sync_forward(
-            self, symbols, timeframes, progress_callback, show_spinner
+            self, symbols, timeframes, progress_callback, show_spinner, derive
+        )
+
+    def derive_timeframes(
+        self,
+        symbol: str,
+        timeframes: list[str] | None = None,
+        full: bool = False,
+    ) -> dict[str, int]:
+        """
+        Aggregate stored 1m bars into higher timeframes (incremental unless full).
+
+        Args:
+            symbol: Trading symbol
+            timeframes: Timeframes to derive (default: all); 1m and other
+                non-derivable entries are skipped
+            full: Rebuild all buckets, e.g. after healing 1m gaps
+
+        Returns:
+            {"SYMBOL_tf": bars written}
+        """
+        from . import historical_derive
+        timeframes = [tf for tf in (timeframes or TIMEFRAMES) if historical_derive.is_derivable(tf)]
+        return historical_derive.derive_timeframes(self, symbol, timeframes, full=full)
+
+    def audit_derived(
+        self,
+        symbol: str,
+        timeframe: str,
+        source: str = "api",
+        sample_bars: int = 200,
+        start: datetime | None = None,
+        end: datetime | None = None,
+    ) -> "DerivedAuditReport":
+        """Compare bars aggregated from 1m against native bars (see historical_derive.py)."""
+        from . import historical_derive
+        return historical_derive.audit_derived_timeframe(
+            self, symbol, timeframe, source, sample_bars, start, end
         )
     
     def _sync_forward_symbol_timeframe(self, symbol: str, timeframe: str) -> int:
@@ -1598,8 +1650,55 @@ class HistoricalDataStore:
             }
         }
     
+    def data_fingerprint(
+        self,
+        symbol: str,
+        timeframes: list[str],
+        end: datetime | None = None,
+    ) -> str:
+        """
+        Cheap content fingerprint of everything a backtest ending at ``end`` can read.
+
+        Aggregates (row count, first/last timestamp, value sums) over all OHLCV
+        rows per timeframe plus funding and open interest, up to ``end``. No
+        lower bound, so warmup history is covered. Any sync that adds, heals or
+        rewrites rows in that range changes the fingerprint.
+
+        Args:
+            symbol: Trading symbol
+            timeframes: Candle timeframes the run loads
+            end: Window end (None = all data)
+
+        Returns:
+            sha256 hex digest
+        """
+        symbol = symbol.upper()
+        end_param = end.replace(tzinfo=None) if end is not None and end.tzinfo else end
+        end_clause = " AND timestamp <= ?" if end_param is not None else ""
+        end_args: list[Any] = [end_param] if end_param is not None else []
+
+        parts: list[Any] = [self.env, symbol]
+        for tf in sorted(set(timeframes)):
+            row = self.conn.execute(f"""
+                SELECT COUNT(*), MIN(timestamp), MAX(timestamp),
+                       SUM(open), SUM(high), SUM(low), SUM(close), SUM(volume)
+                FROM {self.table_ohlcv}
+                WHERE symbol = ? AND timeframe = ?{end_clause}
+            """, [symbol, tf, *end_args]).fetchone()
+            parts.append((tf, row))
+
+        for table, column in ((self.table_funding, "funding_rate"), (self.table_oi, "open_interest")):
+            row = self.conn.execute(f"""
+                SELECT COUNT(*), MIN(timestamp), MAX(timestamp), SUM({column})
+                FROM {table}
+                WHERE symbol = ?{end_clause}
+            """, [symbol, *end_args]).fetchone()
+            parts.append((table, row))
+
+        return hashlib.sha256(repr(parts).encode("utf-8")).hexdigest()
+
     # ==================== STATUS METHODS ====================
-    
+
     def status(self, symbol: str | None = None) -> dict:
         """
         Get sync status of cached data with gap detection.
@@ -1963,6 +2062,31 @@ _store_live: HistoricalDataStore | None = None
 # Set to True in child processes for parallel backtest execution
 _force_read_only: bool = False
 
+# Data service clients per environment (see data_service.py); used instead of
+# opening DuckDB when a local data service is running
+_service_clients: dict[str, "DataServiceClient"] = {}
+
+
+def _get_service_client(env: DataEnv) -> "DataServiceClient | None":
+    """Cached client for env's data service, connecting on first use if one is running."""
+    client = _service_clients.get(env)
+    if client is None:
+        from .data_service import connect_data_service
+        client = connect_data_service(env)
+        if client is not None:
+            _service_clients[env] = client
+            get_module_logger(__name__).info("Using data service for %s data: %r", env, client)
+    return client
+
+
+def register_service_store(store: HistoricalDataStore) -> None:
+    """Make the data service's own store the process singleton for its env (never self-connect)."""
+    global _store_backtest, _store_live
+    if store.env == "backtest":
+        _store_backtest = store
+    else:
+        _store_live = store
+
 
 def reset_stores(force_read_only: bool = False) -> None:
     """
@@ -1985,6 +2109,11 @@ def reset_stores(force_read_only: bool = False) -> None:
     # Set process-level read-only flag
     _force_read_only = force_read_only
 
+    # Drop data service clients (a socket inherited across fork is never reused)
+    for client in _service_clients.values():
+        client._drop_socket()
+    _service_clients.clear()
+
     # Close existing connections if any
     _reset_logger = get_module_logger(__name__)
     for _name, _store in [("backtest", _store_backtest), ("live", _store_live)]:
@@ -2016,11 +2145,23 @@ def get_historical_store(env: DataEnv = DEFAULT_DATA_ENV, read_only: bool = Fals
         When read_only=True or _force_read_only is set (by reset_stores), a NEW
         instance is created in read-only mode. This allows multiple parallel
         processes to read simultaneously.
+
+        If a local data service is running for env (`data serve`, see
+        data_service.py) and this process has not opened the file itself, a
+        DataServiceClient with the same API is returned instead, for reads
+        and writes alike.
     """
     global _store_backtest, _store_live, _force_read_only
 
     env = validate_data_env(env)
 
+    # Data service: only when this process has no direct connection yet
+    existing = _store_backtest if env == "backtest" else _store_live
+    if existing is None:
+        client = _get_service_client(env)
+        if client is not None:
+            return client  # type: ignore[return-value]  # duck-typed HistoricalDataStore
+
     # Use read-only mode if explicitly requested OR if process-level flag is set
     # (set by reset_stores(force_read_only=True) in child processes)
     use_read_only = read_only or _force_read_only
@@ -2065,6 +2206,9 @@ def _atexit_close_stores() -> None:
                 pass
     _store_backtest = None
     _store_live = None
+    for client in _service_clients.values():
+        client.close()
+    _service_clients.clear()
 
 
 atexit.register(_atexit_close_stores)
@@ -0,0 +1,385 @@
+"""
+Derived timeframes: build higher-TF OHLCV bars from stored 1m bars.
+
+Contains: split_timeframes, derive_timeframe, derive_timeframes,
+derive_and_verify, audit_derived_timeframe.
+
+Bybit bar semantics reproduced by the aggregation:
+- Bars are labelled by their open time and aligned to UTC epoch multiples of
+  the interval (daily bars open at 00:00 UTC; every supported TF divides a day)
+- open = first 1m open, close = last 1m close, high/low = extremes,
+  volume/turnover = sums
+- Only complete buckets are written (all tf_minutes 1m bars present and the
+  bucket closed before now), so a derived bar never reflects a partial window
+
+Derived rows live in the same OHLCV table as native ones, so every reader
+(get_ohlcv, FeedStore builders, status, detect_gaps) is unaffected. Updates are
+incremental: only buckets at or after the last derived bar (plus any 1m history
+older than the first derived bar) are re-aggregated.
+"""
+
+import math
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import TYPE_CHECKING, Any
+
+import pandas as pd
+
+from src.utils.datetime_utils import normalize_timestamp, utc_now
+
+if TYPE_CHECKING:
+    from .historical_data_store import HistoricalDataStore
+
+
+DERIVED_BASE_TF = "1m"
+
+# Native bars fetched per derived TF after a derived sync to spot-check it
+VERIFY_SAMPLE_BARS = 50
+
+# Relative tolerances: prices must match exactly (up to float repr),
+# volume/turnover are sums of 1m values so allow rounding drift
+PRICE_REL_TOL = 1e-9
+VOLUME_REL_TOL = 1e-6
+
+# Mismatch details kept per audit report (counts are always complete)
+MAX_REPORTED_MISMATCHES = 20
+
+
+def _get_constants():
+    from .historical_data_store import TIMEFRAMES, TF_MINUTES, floor_to_bar_boundary
+    return TIMEFRAMES, TF_MINUTES, floor_to_bar_boundary
+
+
+def is_derivable(timeframe: str) -> bool:
+    """True if the timeframe can be aggregated from 1m bars (whole minutes dividing a day)."""
+    _, TF_MINUTES, _ = _get_constants()
+    minutes = TF_MINUTES.get(timeframe)
+    return minutes is not None and minutes > 1 and 1440 % minutes == 0
+
+
+def split_timeframes(timeframes: list[str]) -> tuple[list[str], list[str]]:
+    """
+    Split timeframes into (fetched from API, derived from 1m).
+
+    1m is always fetched when anything is derived; timeframes that cannot be
+    derived stay on the native path.
+    """
+    derived = [tf for tf in timeframes if is_derivable(tf)]
+    fetched = [tf for tf in timeframes if tf not in derived]
+    if derived and DERIVED_BASE_TF not in fetched:
+        fetched.insert(0, DERIVED_BASE_TF)
+    return fetched, derived
+
+
+def _bucket_sql(tf_minutes: int) -> str:
+    return f"time_bucket(INTERVAL {int(tf_minutes)} MINUTE, timestamp, TIMESTAMP '1970-01-01')"
+
+
+def _aggregate_sql(store: "HistoricalDataStore", tf_minutes: int, where: str) -> str:
+    """SELECT producing (timestamp, open, high, low, close, volume, turnover) per complete bucket."""
+    return f"""
+        SELECT
+            bucket AS timestamp,
+            arg_min(open, timestamp) AS open,
+            max(high) AS high,
+            min(low) AS low,
+            arg_max(close, timestamp) AS close,
+            sum(volume) AS volume,
+            sum(turnover) AS turnover
+        FROM (
+            SELECT {_bucket_sql(tf_minutes)} AS bucket, timestamp, open, high, low, close, volume, turnover
+            FROM {store.table_ohlcv}
+            WHERE symbol = ? AND timeframe = '{DERIVED_BASE_TF}' {where}
+        )
+        GROUP BY bucket
+        HAVING count(*) = {int(tf_minutes)}
+    """
+
+
+def _closed_bound(tf_minutes: int) -> datetime:
+    """Open time of the bucket still forming now; every earlier bucket is closed."""
+    _, _, floor_to_bar_boundary = _get_constants()
+    return floor_to_bar_boundary(utc_now(), tf_minutes)
+
+
+def derive_timeframe(
+    store: "HistoricalDataStore",
+    symbol: str,
+    timeframe: str,
+    full: bool = False,
+) -> int:
+    """
+    Aggregate stored 1m bars into `timeframe` and upsert the result.
+
+    Args:
+        store: Historical data store
+        symbol: Trading symbol
+        timeframe: Target timeframe (must satisfy is_derivable)
+        full: Rebuild every bucket instead of only new ones (use after healing 1m gaps)
+
+    Returns:
+        Number of derived bars written
+    """
+    _, TF_MINUTES, floor_to_bar_boundary = _get_constants()
+    if not is_derivable(timeframe):
+        raise ValueError(f"Timeframe '{timeframe}' cannot be derived from {DERIVED_BASE_TF} bars")
+
+    symbol = symbol.upper()
+    tf_minutes = TF_MINUTES[timeframe]
+    end_bound = _closed_bound(tf_minutes)
+
+    base = store.conn.execute(f"""
+        SELECT MIN(timestamp) FROM {store.table_ohlcv}
+        WHERE symbol = ? AND timeframe = ?
+    """, [symbol, DERIVED_BASE_TF]).fetchone()
+    base_first = normalize_timestamp(base[0]) if base and base[0] else None
+    if base_first is None:
+        return 0
+
+    ranges: list[tuple[datetime, datetime]] = []
+    if full:
+        ranges.append((floor_to_bar_boundary(base_first, tf_minutes), end_bound))
+    else:
+        existing = store.conn.execute(f"""
+            SELECT MIN(timestamp), MAX(timestamp) FROM {store.table_ohlcv}
+            WHERE symbol = ? AND timeframe = ?
+        """, [symbol, timeframe]).fetchone()
+        first_ts = normalize_timestamp(existing[0]) if existing and existing[0] else None
+        last_ts = normalize_timestamp(existing[1]) if existing and existing[1] else None
+        if first_ts is None or last_ts is None:
+            ranges.append((floor_to_bar_boundary(base_first, tf_minutes), end_bound))
+        else:
+            # 1m history extended backwards (older sync) -> derive the head too
+            if base_first < first_ts:
+                ranges.append((floor_to_bar_boundary(base_first, tf_minutes), first_ts))
+            ranges.append((last_ts, end_bound))
+
+    written = 0
+    for range_start, range_end in ranges:
+        if range_start >= range_end:
+            continue
+        select = _aggregate_sql(store, tf_minutes, "AND timestamp >= ? AND timestamp < ?")
+        with store._write_operation():
+            row = store.conn.execute(f"""
+                INSERT OR REPLACE INTO {store.table_ohlcv}
+                (symbol, timeframe, timestamp, open, high, low, close, volume, turnover)
+                SELECT ?, ?, timestamp, open, high, low, close, volume, turnover
+                FROM ({select})
+            """, [symbol, timeframe, symbol, range_start, range_end]).fetchone()
+        written += int(row[0]) if row else 0
+
+    if written:
+        store._update_metadata(symbol, timeframe)
+    return written
+
+
+def derive_timeframes(
+    store: "HistoricalDataStore",
+    symbol: str,
+    timeframes: list[str],
+    full: bool = False,
+) -> dict[str, int]:
+    """Derive several timeframes for one symbol. Returns {"SYMBOL_tf": bars written}."""
+    symbol = symbol.upper()
+    return {
+        f"{symbol}_{tf}": derive_timeframe(store, symbol, tf, full=full)
+        for tf in timeframes
+    }
+
+
+# ==================== CONSISTENCY AUDIT ====================
+
+
+@dataclass
+class DerivedAuditReport:
+    """Comparison of derived bars against native bars for one symbol/timeframe."""
+    symbol: str
+    timeframe: str
+    source: str
+    start: datetime | None = None
+    end: datetime | None = None
+    compared: int = 0
+    mismatched: int = 0
+    missing_derived: int = 0
+    missing_native: int = 0
+    mismatches: list[dict[str, Any]] = field(default_factory=list)
+
+    @property
+    def ok(self) -> bool:
+        """True if native bars were compared and every one matched a derived bar."""
+        return self.compared > 0 and self.mismatched == 0 and self.missing_derived == 0
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "symbol": self.symbol,
+            "timeframe": self.timeframe,
+            "source": self.source,
+            "start": self.start.isoformat() if self.start else None,
+            "end": self.end.isoformat() if self.end else None,
+            "ok": self.ok,
+            "compared": self.compared,
+            "mismatched": self.mismatched,
+            "missing_derived": self.missing_derived,
+            "missing_native": self.missing_native,
+            "mismatches": self.mismatches,
+        }
+
+
+def _base_coverage(store: "HistoricalDataStore", symbol: str) -> tuple[datetime | None, datetime | None]:
+    row = store.conn.execute(f"""
+        SELECT MIN(timestamp), MAX(timestamp) FROM {store.table_ohlcv}
+        WHERE symbol = ? AND timeframe = ?
+    """, [symbol, DERIVED_BASE_TF]).fetchone()
+    if not row or row[0] is None:
+        return None, None
+    return normalize_timestamp(row[0]), normalize_timestamp(row[1])
+
+
+def _fields_match(native: Mapping[Any, Any], derived: Mapping[Any, Any]) -> list[str]:
+    bad = []
+    for col in ("open", "high", "low", "close"):
+        if not math.isclose(float(native[col]), float(derived[col]), rel_tol=PRICE_REL_TOL):
+            bad.append(col)
+    if not math.isclose(float(native["volume"]), float(derived["volume"]), rel_tol=VOLUME_REL_TOL, abs_tol=1e-12):
+        bad.append("volume")
+    return bad
+
+
+def audit_derived_timeframe(
+    store: "HistoricalDataStore",
+    symbol: str,
+    timeframe: str,
+    source: str = "api",
+    sample_bars: int = VERIFY_SAMPLE_BARS,
+    start: datetime | None = None,
+    end: datetime | None = None,
+) -> DerivedAuditReport:
+    """
+    Compare bars aggregated from stored 1m data against native bars.
+
+    Derived bars are recomputed from 1m for the audit (not read back from the
+    table), so the check covers the aggregation itself.
+
+    Args:
+        store: Historical data store
+        symbol: Trading symbol
+        timeframe: Derivable timeframe to audit
+        source: "api" fetches native bars from Bybit; "db" uses native bars
+            already stored for the timeframe (a natively synced store)
+        sample_bars: Bars to compare when start is not given (most recent closed bars)
+        start: Window start (inclusive); defaults to sample_bars before end
+        end: Window end (exclusive); defaults to the end of 1m coverage
+
+    Returns:
+        DerivedAuditReport
+    """
+    TIMEFRAMES, TF_MINUTES, floor_to_bar_boundary = _get_constants()
+    if not is_derivable(timeframe):
+        raise ValueError(f"Timeframe '{timeframe}' cannot be derived from {DERIVED_BASE_TF} bars")
+    if source not in ("api", "db"):
+        raise ValueError(f"Invalid audit source '{source}'. Use 'api' or 'db'")
+
+    symbol = symbol.upper()
+    tf_minutes = TF_MINUTES[timeframe]
+    report = DerivedAuditReport(symbol=symbol, timeframe=timeframe, source=source)
+
+    base_first, base_last = _base_coverage(store, symbol)
+    if base_first is None or base_last is None:
+        return report
+
+    # Window: closed buckets fully inside 1m coverage
+    coverage_end = floor_to_bar_boundary(base_last + timedelta(minutes=1), tf_minutes)
+    window_end = min(normalize_timestamp(end) or coverage_end, coverage_end, _closed_bound(tf_minutes))
+    window_start = normalize_timestamp(start) or window_end - timedelta(minutes=tf_minutes * sample_bars)
+    first_full = floor_to_bar_boundary(base_first, tf_minutes)
+    if first_full < base_first:
+        first_full += timedelta(minutes=tf_minutes)
+    window_start = max(floor_to_bar_boundary(window_start, tf_minutes), first_full)
+    report.start, report.end = window_start, window_end
+    if window_start >= window_end:
+        return report
+
+    derived = store.conn.execute(
+        _aggregate_sql(store, tf_minutes, "AND timestamp >= ? AND timestamp < ?") + " ORDER BY timestamp",
+        [symbol, window_start, window_end],
+    ).df()
+
+    if source == "api":
+        from . import historical_sync
+        native = historical_sync._fetch_from_api(store, symbol, TIMEFRAMES[timeframe], window_start, window_end)
+    else:
+        native = store.conn.execute(f"""
+            SELECT timestamp, open, high, low, close, volume
+            FROM {store.table_ohlcv}
+            WHERE symbol = ? AND timeframe = ? AND timestamp >= ? AND timestamp < ?
+            ORDER BY timestamp
+        """, [symbol, timeframe, window_start, window_end]).df()
+
+    if not native.empty:
+        if native["timestamp"].dt.tz is not None:
+            native["timestamp"] = native["timestamp"].dt.tz_localize(None)
+        native = native.loc[(native["timestamp"] >= window_start) & (native["timestamp"] < window_end)]
+
+    derived_by_ts = {pd.Timestamp(rec["timestamp"]): rec for rec in derived.to_dict("records")}
+    native_ts = set()
+    for row in native.to_dict("records"):
+        ts = pd.Timestamp(row["timestamp"])
+        native_ts.add(ts)
+        match = derived_by_ts.get(ts)
+        if match is None:
+            report.missing_derived += 1
+            if len(report.mismatches) < MAX_REPORTED_MISMATCHES:
+                report.mismatches.append({"timestamp": ts.isoformat(), "fields": ["missing_derived"]})
+            continue
+        report.compared += 1
+        bad = _fields_match(row, match)
+        if bad:
+            report.mismatched += 1
+            if len(report.mismatches) < MAX_REPORTED_MISMATCHES:
+                report.mismatches.append({
+                    "timestamp": ts.isoformat(),
+                    "fields": bad,
+                    "native": {col: float(row[col]) for col in bad},
+                    "derived": {col: float(match[col]) for col in bad},
+                })
+    report.missing_native = sum(1 for ts in derived_by_ts if ts not in native_ts)
+    return report
+
+
+def derive_and_verify(
+    store: "HistoricalDataStore",
+    symbol: str,
+    timeframes: list[str],
+    sample_bars: int = VERIFY_SAMPLE_BARS,
+) -> tuple[dict[str, int], dict[str, DerivedAuditReport]]:
+    """
+    Derive timeframes incrementally, then spot-check each against native bars from the API.
+
+    Mismatches are logged as warnings; derived bars are kept either way since
+    they come from exchange 1m data.
+
+    Returns:
+        ({"SYMBOL_tf": bars written}, {"SYMBOL_tf": audit report})
+    """
+    symbol = symbol.upper()
+    counts: dict[str, int] = {}
+    audits: dict[str, DerivedAuditReport] = {}
+    for tf in timeframes:
+        key = f"{symbol}_{tf}"
+        counts[key] = derive_timeframe(store, symbol, tf)
+        if sample_bars <= 0:
+            continue
+        try:
+            report = audit_derived_timeframe(store, symbol, tf, source="api", sample_bars=sample_bars)
+        except Exception as e:
+            store.logger.warning("Derived %s verification skipped: %s", key, e)
+            continue
+        audits[key] = report
+        if report.compared and not report.ok:
+            store.logger.warning(
+                "Derived %s differs from native bars: %s mismatched, %s missing of %s compared (first: %s)",
+                key, report.mismatched, report.missing_derived, report.compared,
+                report.mismatches[:1],
+            )
+    return counts, audits
@@ -2,6 +2,9 @@
 Historical data sync operations.
 
 Contains: sync, sync_range, sync_forward, and internal sync methods.
+
+With derive=True only 1m (and any non-derivable timeframe) is fetched from the
+API; higher timeframes are aggregated from 1m in DuckDB (historical_derive.py).
 """
 
 import time
@@ -30,15 +33,16 @@ def sync(
     timeframes: list[str] | None = None,
     progress_callback: Callable | None = None,
     show_spinner: bool = True,
+    derive: bool = False,
 ) -> dict[str, int]:
-    """Sync historical data for symbols."""
+    """Sync historical data for symbols (derive=True: fetch 1m, derive higher TFs)."""
     TIMEFRAMES, _, ActivityEmoji, ActivitySpinner = _get_constants()
 
     if isinstance(symbols, str):
         symbols = [symbols]
 
     symbols = [s.upper() for s in symbols]
-    timeframes = timeframes or list(TIMEFRAMES.keys())
+    timeframes, derived_tfs = _plan_timeframes(timeframes or list(TIMEFRAMES.keys()), derive)
     target_start = utc_now() - store.parse_period(period)
 
     results = {}
@@ -96,6 +100,9 @@ def sync(
         if store._cancelled:
             break
 
+        if derived_tfs:
+            _derive_symbol(store, symbol, derived_tfs, results, progress_callback)
+
     return results
 
 
@@ -107,6 +114,7 @@ def sync_range(
     timeframes: list[str] | None = None,
     progress_callback: Callable | None = None,
     show_spinner: bool = True,
+    derive: bool = False,
 ) -> dict[str, int]:
     """Sync a specific date range with progress logging."""
     TIMEFRAMES, _, ActivityEmoji, ActivitySpinner = _get_constants()
@@ -115,7 +123,7 @@ def sync_range(
         symbols = [symbols]
     
     symbols = [s.upper() for s in symbols]
-    timeframes = timeframes or list(TIMEFRAMES.keys())
+    timeframes, derived_tfs = _plan_timeframes(timeframes or list(TIMEFRAMES.keys()), derive)
     results = {}
     total_synced = 0
     
@@ -163,6 +171,9 @@ def sync_range(
         if store._cancelled:
             break
 
+        if derived_tfs:
+            _derive_symbol(store, symbol, derived_tfs, results, progress_callback)
+
     store.logger.info("Sync complete: %s total candles", f"{total_synced:,}")
     return results
 
@@ -173,15 +184,16 @@ def sync_forward(
     timeframes: list[str] | None = None,
     progress_callback: Callable | None = None,
     show_spinner: bool = True,
+    derive: bool = False,
 ) -> dict[str, int]:
-    """Sync data forward from the last stored candle to now."""
+    """Sync data forward from the last stored candle to now (derive=True: extend derived TFs from 1m)."""
     TIMEFRAMES, _, ActivityEmoji, ActivitySpinner = _get_constants()
     
     if isinstance(symbols, str):
         symbols = [symbols]
     
     symbols = [s.upper() for s in symbols]
-    timeframes = timeframes or list(TIMEFRAMES.keys())
+    timeframes, derived_tfs = _plan_timeframes(timeframes or list(TIMEFRAMES.keys()), derive)
     results = {}
 
     total_pairs = len(symbols) * len(timeframes)
@@ -222,10 +234,52 @@ def sync_forward(
                     spinner.stop(f"{step_label}: error", success=False)
                 elif progress_callback:
                     progress_callback(symbol, tf, f"{ActivityEmoji.ERROR} error: {e}")
-    
+
+        if derived_tfs:
+            # Incremental extension only; the native spot-check runs on full syncs
+            _derive_symbol(store, symbol, derived_tfs, results, progress_callback, verify=False)
+
     return results
 
 
+def _plan_timeframes(timeframes: list[str], derive: bool) -> tuple[list[str], list[str]]:
+    """Return (timeframes to fetch, timeframes to derive from 1m)."""
+    if not derive:
+        return timeframes, []
+    from .historical_derive import split_timeframes
+    return split_timeframes(timeframes)
+
+
+def _derive_symbol(
+    store: "HistoricalDataStore",
+    symbol: str,
+    timeframes: list[str],
+    results: dict[str, int],
+    progress_callback: Callable | None = None,
+    verify: bool = True,
+) -> None:
+    """Derive timeframes for one symbol from its 1m bars and record counts in results."""
+    from .historical_derive import VERIFY_SAMPLE_BARS, derive_and_verify
+    _, _, ActivityEmoji, _ = _get_constants()
+
+    try:
+        counts, _ = derive_and_verify(
+            store, symbol, timeframes, sample_bars=VERIFY_SAMPLE_BARS if verify else 0
+        )
+    except Exception as e:
+        store.logger.error("Failed to derive %s %s from 1m: %s", symbol, timeframes, e)
+        counts = {f"{symbol}_{tf}": -1 for tf in timeframes}
+
+    results.update(counts)
+    for tf in timeframes:
+        count = counts[f"{symbol}_{tf}"]
+        if progress_callback:
+            emoji = ActivityEmoji.SUCCESS if count >= 0 else ActivityEmoji.ERROR
+            progress_callback(symbol, tf, f"{emoji} derived from 1m ({count:,} candles)")
+        else:
+            store.logger.info("  %s %s: %s candles derived from 1m", symbol, tf, f"{count:,}")
+
+
 def _sync_forward_symbol_timeframe(
     store: "HistoricalDataStore",
     symbol: str,
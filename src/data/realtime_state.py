@@ -750,6 +750,17 @@ class RealtimeState:
     # Statistics and Status
     # ==========================================================================
     
+    def get_private_state_version(self) -> tuple[int, int, int]:
+        """
+        Update counts of positions, orders and executions.
+
+        Changes whenever any private stream touches trading state; callers
+        compare two versions to detect that something happened in between.
+        """
+        with self._lock:
+            counts = self._update_counts
+            return counts["position"], counts["order"], counts["execution"]
+
     def get_stats(self) -> dict:
         """Get state statistics."""
         with self._lock:
@@ -31,6 +31,7 @@ from ..play_engine import PlayEngineConfig
 if TYPE_CHECKING:
     from ...backtest.play import Play
     from ...backtest.runtime.feed_store import FeedStore
+    from ...backtest.sim.exchange import SimulatedExchange
 
 
 class BacktestDataProvider:
@@ -56,6 +57,9 @@ class BacktestDataProvider:
         self._feed_store: FeedStore | None = None
         self._ready = False
         self._current_bar_index: int = -1
+        # Last two candles built (Candle is frozen): the runner asks for the
+        # current bar several times per step and for the previous bar once
+        self._candle_cache: list[tuple[int, Candle]] = []
 
         # These will be populated during engine initialization
         self._symbol = play.symbol_universe[0]
@@ -83,6 +87,13 @@ class BacktestDataProvider:
             return 0
         return self._feed_store.warmup_bars
 
+    @property
+    def feed_store(self) -> "FeedStore":
+        """FeedStore set by set_feed_store()."""
+        if self._feed_store is None:
+            raise RuntimeError("FeedStore not initialized. Call set_feed_store() first.")
+        return self._feed_store
+
     @property
     def current_bar_index(self) -> int:
         """Current bar index for structure access."""
@@ -100,6 +111,7 @@ class BacktestDataProvider:
         Called by BacktestRunner after loading historical data.
         """
         self._feed_store = feed_store
+        self._candle_cache = []
         self._ready = True
 
     def get_candle(self, index: int) -> Candle:
@@ -110,7 +122,12 @@ class BacktestDataProvider:
         if index < 0 or index >= self._feed_store.length:
             raise IndexError(f"Bar index {index} out of bounds [0, {self._feed_store.length})")
 
-        return Candle(
+        cache = self._candle_cache
+        for cached_idx, cached in cache:
+            if cached_idx == index:
+                return cached
+
+        candle = Candle(
             ts_open=self._feed_store.get_ts_open_datetime(index),
             ts_close=self._feed_store.get_ts_close_datetime(index),
             open=float(self._feed_store.open[index]),
@@ -119,6 +136,10 @@ class BacktestDataProvider:
             close=float(self._feed_store.close[index]),
             volume=float(self._feed_store.volume[index]),
         )
+        if len(cache) == 2:
+            cache.pop(0)
+        cache.append((index, candle))
+        return candle
 
     def get_indicator(self, name: str, index: int) -> float:
         """
@@ -262,6 +283,13 @@ class BacktestExchange:
             return self._current_bar_ts
         raise RuntimeError("Bar timestamp not set — call set_current_bar_timestamp() before submitting orders")
 
+    @property
+    def sim_exchange(self) -> "SimulatedExchange":
+        """SimulatedExchange set by set_simulated_exchange()."""
+        if self._sim_exchange is None:
+            raise RuntimeError("SimulatedExchange not set. Call set_simulated_exchange() first.")
+        return self._sim_exchange
+
     def set_simulated_exchange(self, sim_exchange) -> None:
         """
         Set the SimulatedExchange after initialization.
@@ -524,6 +552,13 @@ class BacktestExchange:
             return False
         return self._sim_exchange.position is not None
 
+    @property
+    def has_open_orders(self) -> bool:
+        """Check if any order is resting on the simulated book."""
+        if self._sim_exchange is None:
+            return False
+        return bool(self._sim_exchange.get_open_orders())
+
     @property
     def entries_disabled(self) -> bool:
         """Check if entries are disabled (e.g., due to starvation)."""
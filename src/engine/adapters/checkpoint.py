@@ -0,0 +1,343 @@
+"""
+Binary checkpoints of LiveDataProvider state for fast warm restarts.
+
+A checkpoint holds everything a cold warmup rebuilds from history: the
+candle buffers, indicator caches (rolling arrays plus the incremental
+indicator objects), structure detectors, the structure history ring
+buffers, the monotonic bar counters and the warmup flags, for every TF role.
+
+File layout:
+
+    b"TRADECKP" | uint32 header length | JSON header | zlib(pickle(state))
+
+The header is readable without unpickling the payload. It carries the
+format version, a code version (hash of the import closure of the
+modules whose objects are pickled), a fingerprint of the provider's
+configuration (symbol, TF mapping, buffer size, indicator and structure
+specs) and the ts_open of the last bar each TF role processed. A checkpoint is only restored when all
+three match the provider; anything else (missing file, other code, edited
+Play, corrupt payload) raises CheckpointError and the caller falls back to
+a cold warmup.
+
+Restart flow (LiveDataProvider._warm_restart): read the header, fetch the
+bars closed since each role's last ts_open, restore, then replay those bars
+through the normal on-close path. Parity of restore + replay against an
+uninterrupted run and against a cold warmup on the same bars:
+
+    python trade_cli.py debug checkpoint-restore [--play ID ...] [--json]
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import pickle
+import platform
+import struct
+import zlib
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+
+from src.config.constants import CHECKPOINT_DIR
+from src.utils.datetime_utils import datetime_to_epoch_ms, utc_now
+from src.utils.helpers import atomic_write_bytes
+from src.utils.logger import get_module_logger
+from src.utils.source_hash import source_version
+
+if TYPE_CHECKING:
+    from .live import LiveDataProvider
+
+logger = get_module_logger(__name__)
+
+# Bump when the file layout or the set of checkpointed fields changes
+CHECKPOINT_FORMAT_VERSION = 1
+
+CHECKPOINT_MAGIC = b"TRADECKP"
+
+# Modules whose objects end up in the pickled payload; the code version
+# hashes their import closure (source_hash.source_version)
+CHECKPOINT_SOURCE_MODULES = (
+    "src.engine.adapters.live",
+    "src.engine.adapters.checkpoint",
+    "src.indicators.incremental",
+    "src.structures",
+)
+
+TF_ROLES = ("low_tf", "med_tf", "high_tf")
+
+# Per-role provider attributes (buffer, indicator cache, structure state, ready flag)
+_ROLE_FIELDS = ("_{role}_buffer", "_{role}_indicators", "_{role}_structure", "_{role}_ready")
+
+# Provider-wide attributes
+_PROVIDER_FIELDS = ("_structure_history", "_global_bar_count", "_current_bar_index", "_ready")
+
+_HEADER_LEN = struct.Struct("<I")
+
+
+class CheckpointError(Exception):
+    """Checkpoint missing, unreadable or not compatible with the provider."""
+
+
+@dataclass
+class CheckpointHeader:
+    """JSON header of a checkpoint file."""
+    format_version: int
+    code_version: str
+    fingerprint: str
+    play_id: str
+    symbol: str
+    created_at: str
+    # ts_open (epoch ms) of the last bar each role processed; roles without bars are absent
+    last_ts_open_ms: dict[str, int] = field(default_factory=dict)
+    bars_processed: dict[str, int] = field(default_factory=dict)
+    payload_bytes: int = 0
+
+    def to_dict(self) -> dict[str, Any]:
+        return asdict(self)
+
+
+def checkpoint_code_version() -> str:
+    """Hash of the import closure whose objects are pickled, plus the Python version."""
+    digest = hashlib.sha256()
+    digest.update(f"{CHECKPOINT_FORMAT_VERSION}:{platform.python_version()}".encode("ascii"))
+    digest.update(source_version(CHECKPOINT_SOURCE_MODULES).encode("ascii"))
+    return digest.hexdigest()
+
+
+def default_checkpoint_path(name: str) -> Path:
+    """Checkpoint file for an engine name under data/runtime/checkpoints."""
+    return CHECKPOINT_DIR / f"{name}.ckpt"
+
+
+def active_roles(dp: "LiveDataProvider") -> list[str]:
+    """TF roles the provider keeps separate state for (same rules as warmup)."""
+    roles = ["low_tf"]
+    if dp._tf_mapping["med_tf"] != dp._tf_mapping["low_tf"]:
+        roles.append("med_tf")
+    if dp._tf_mapping["high_tf"] != dp._tf_mapping["med_tf"]:
+        roles.append("high_tf")
+    return roles
+
+
+def provider_fingerprint(dp: "LiveDataProvider") -> str:
+    """sha256 over the configuration that shapes the provider's state."""
+    config = {
+        "symbol": dp._symbol,
+        "tf_mapping": dp._tf_mapping,
+        "buffer_size": dp._buffer_size,
+        "warmup_bars": dp._warmup_bars,
+        "indicators": {role: dp._get_indicator_specs_for_tf(role) for role in TF_ROLES},
+        "structures": dp._get_structure_specs_by_tf_role() if dp._play.has_structures else {},
+    }
+    raw = json.dumps(config, sort_keys=True, default=str)
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+def _collect_state(dp: "LiveDataProvider") -> dict[str, Any]:
+    state: dict[str, Any] = {name: getattr(dp, name) for name in _PROVIDER_FIELDS}
+    for role in TF_ROLES:
+        for pattern in _ROLE_FIELDS:
+            name = pattern.format(role=role)
+            state[name] = getattr(dp, name)
+    return state
+
+
+def _build_header(dp: "LiveDataProvider", payload_bytes: int) -> CheckpointHeader:
+    last_ts: dict[str, int] = {}
+    for role in active_roles(dp):
+        buffer = getattr(dp, f"_{role}_buffer")
+        if buffer:
+            ts = datetime_to_epoch_ms(buffer[-1].ts_open)
+            if ts is not None:
+                last_ts[role] = ts
+    return CheckpointHeader(
+        format_version=CHECKPOINT_FORMAT_VERSION,
+        code_version=checkpoint_code_version(),
+        fingerprint=provider_fingerprint(dp),
+        play_id=dp._play.id,
+        symbol=dp._symbol,
+        created_at=utc_now().isoformat(),
+        last_ts_open_ms=last_ts,
+        bars_processed=dict(dp._global_bar_count),
+        payload_bytes=payload_bytes,
+    )
+
+
+def dump_checkpoint(dp: "LiveDataProvider") -> bytes:
+    """
+    Serialize the provider's state to checkpoint bytes.
+
+    Holds the provider's update lock so no candle is applied halfway
+    through the snapshot.
+    """
+    with dp._update_lock:
+        payload = zlib.compress(pickle.dumps(_collect_state(dp), protocol=pickle.HIGHEST_PROTOCOL), 1)
+        header = _build_header(dp, len(payload))
+    header_raw = json.dumps(header.to_dict(), sort_keys=True).encode("utf-8")
+    return CHECKPOINT_MAGIC + _HEADER_LEN.pack(len(header_raw)) + header_raw + payload
+
+
+def save_checkpoint(dp: "LiveDataProvider", path: Path | str) -> CheckpointHeader:
+    """
+    Write a checkpoint of the provider atomically (temp file + rename).
+
+    Returns:
+        The header that was written
+    """
+    data = dump_checkpoint(dp)
+    atomic_write_bytes(path, data)
+    header, _ = _split(data)
+    return header
+
+
+def _split(data: bytes) -> tuple[CheckpointHeader, memoryview]:
+    """Parse the header and return it with a view of the payload."""
+    start = len(CHECKPOINT_MAGIC)
+    if data[:start] != CHECKPOINT_MAGIC or len(data) < start + _HEADER_LEN.size:
+        raise CheckpointError("not a checkpoint file (bad magic)")
+    (header_len,) = _HEADER_LEN.unpack_from(data, start)
+    body = start + _HEADER_LEN.size
+    try:
+        raw = json.loads(bytes(data[body:body + header_len]).decode("utf-8"))
+        header = CheckpointHeader(**raw)
+    except (ValueError, TypeError) as e:
+        raise CheckpointError(f"unreadable checkpoint header: {e}") from e
+    return header, memoryview(data)[body + header_len:]
+
+
+def read_checkpoint(path: Path | str) -> tuple[CheckpointHeader, bytes]:
+    """Read a checkpoint file; the payload stays compressed until restored."""
+    try:
+        data = Path(path).read_bytes()
+    except OSError as e:
+        raise CheckpointError(f"cannot read checkpoint {path}: {e}") from e
+    header, payload = _split(data)
+    return header, bytes(payload)
+
+
+def check_compatible(header: CheckpointHeader, dp: "LiveDataProvider") -> None:
+    """
+    Raise CheckpointError unless the checkpoint was written by this code for
+    a provider with the same configuration.
+    """
+    if header.format_version != CHECKPOINT_FORMAT_VERSION:
+        raise CheckpointError(
+            f"format version {header.format_version} != {CHECKPOINT_FORMAT_VERSION}"
+        )
+    if header.code_version != checkpoint_code_version():
+        raise CheckpointError("written by a different code version")
+    if header.symbol != dp._symbol or header.play_id != dp._play.id:
+        raise CheckpointError(
+            f"checkpoint is for {header.play_id} {header.symbol}, provider runs {dp._play.id} {dp._symbol}"
+        )
+    if header.fingerprint != provider_fingerprint(dp):
+        raise CheckpointError("provider configuration changed (Play features, TF mapping or buffer size)")
+
+
+def restore_checkpoint(dp: "LiveDataProvider", header: CheckpointHeader, payload: bytes) -> None:
+    """
+    Replace the provider's state with a checkpoint payload.
+
+    The payload is fully decoded before any attribute is assigned, so a
+    corrupt file leaves the provider untouched.
+    """
+    check_compatible(header, dp)
+    if len(payload) != header.payload_bytes:
+        raise CheckpointError(f"truncated payload: {len(payload)}/{header.payload_bytes} bytes")
+    try:
+        state = pickle.loads(zlib.decompress(payload))
+    except Exception as e:
+        raise CheckpointError(f"corrupt checkpoint payload: {e}") from e
+    expected = set(_collect_state(dp))
+    if set(state) != expected:
+        raise CheckpointError(f"payload fields {sorted(set(state) ^ expected)} do not match")
+
+    with dp._update_lock:
+        for name, value in state.items():
+            if name.endswith("_indicators") and value is not None:
+                value._play = dp._play
+            setattr(dp, name, value)
+
+
+def load_checkpoint(dp: "LiveDataProvider", path: Path | str) -> CheckpointHeader:
+    """Read, validate and restore a checkpoint file. Returns its header."""
+    header, payload = read_checkpoint(path)
+    restore_checkpoint(dp, header, payload)
+    return header
+
+
+# ── State comparison (restore parity) ────────────────────────────────
+
+
+def snapshot_provider_state(dp: "LiveDataProvider", include_history: bool = True) -> dict[str, Any]:
+    """
+    Comparable view of the provider's state: candle buffers, OHLCV and
+    indicator arrays, current structure outputs, bar counters and flags.
+
+    include_history=False leaves out the structure history ring buffers,
+    which a cold warmup does not fill.
+    """
+    snap: dict[str, Any] = {
+        "ready": dp._ready,
+        "current_bar_index": dp._current_bar_index,
+    }
+    for role in active_roles(dp):
+        buffer = getattr(dp, f"_{role}_buffer")
+        snap[f"{role}.buffer"] = [
+            (c.ts_open, c.ts_close, c.open, c.high, c.low, c.close, c.volume) for c in buffer
+        ]
+        snap[f"{role}.bars"] = dp._global_bar_count[role]
+        snap[f"{role}.ready"] = getattr(dp, f"_{role}_ready")
+        cache = getattr(dp, f"_{role}_indicators")
+        if cache is not None:
+            n = cache._bar_count
+            for col in ("open", "high", "low", "close", "volume"):
+                snap[f"{role}.ohlcv.{col}"] = getattr(cache, f"_{col}")[:n].copy()
+            for name, arr in cache._indicators.items():
+                snap[f"{role}.ind.{name}"] = arr[:n].copy()
+        structure = getattr(dp, f"_{role}_structure")
+        if structure is not None:
+            for key in structure.list_structures():
+                for out in structure.list_outputs(key):
+                    try:
+                        snap[f"{role}.struct.{key}.{out}"] = structure.get_value(key, out)
+                    except (KeyError, RuntimeError):
+                        continue
+    if include_history:
+        for role, history in dp._structure_history.items():
+            snap[f"history.{role}.bar_idx"] = history.bar_indices()
+            for key, out in history.fields():
+                snap[f"history.{role}.{key}.{out}"] = history.values(key, out)
+    return snap
+
+
+def _same(a: Any, b: Any) -> bool:
+    if isinstance(a, np.ndarray) or isinstance(b, np.ndarray):
+        a_arr, b_arr = np.asarray(a), np.asarray(b)
+        if a_arr.shape != b_arr.shape:
+            return False
+        if a_arr.dtype.kind == "f" or b_arr.dtype.kind == "f":
+            return bool(np.array_equal(a_arr, b_arr, equal_nan=True))
+        return bool(np.array_equal(a_arr, b_arr))
+    if isinstance(a, float) and isinstance(b, float) and a != a and b != b:
+        return True
+    if isinstance(a, list) and isinstance(b, list):
+        return len(a) == len(b) and all(_same(x, y) for x, y in zip(a, b))
+    if isinstance(a, tuple) and isinstance(b, tuple):
+        return len(a) == len(b) and all(_same(x, y) for x, y in zip(a, b))
+    return a == b
+
+
+def diff_provider_states(expected: dict[str, Any], observed: dict[str, Any]) -> list[str]:
+    """Keys whose values differ (exact match, NaN == NaN), plus missing/extra keys."""
+    diffs = [f"missing {key}" for key in expected if key not in observed]
+    diffs.extend(f"extra {key}" for key in observed if key not in expected)
+    diffs.extend(
+        key for key in expected
+        if key in observed and not _same(expected[key], observed[key])
+    )
+    return diffs
+
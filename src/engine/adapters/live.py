@@ -10,11 +10,12 @@ Integrates with existing RealtimeState/RealtimeBootstrap infrastructure.
 
 
 import threading
-from collections import deque
 from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from time import perf_counter_ns
 from typing import TYPE_CHECKING, Any, Literal
 
-from src.utils.datetime_utils import utc_now, datetime_to_epoch_ms
+from src.utils.datetime_utils import utc_now, datetime_to_epoch_ms, epoch_ms_to_datetime
 
 import numpy as np
 import pandas as pd
@@ -34,13 +35,16 @@ from ..interfaces import (
 from ..play_engine import PlayEngineConfig
 
 from ...utils.logger import get_module_logger
+from ...utils.latency import current_trace
+from ...utils.profiler import active_profiler
 
 if TYPE_CHECKING:
     from ...backtest.play import Play
     from ...exchanges.bybit_client import BybitClient
     from ...data.realtime_state import RealtimeState
     from ...data.realtime_bootstrap import RealtimeBootstrap
-    from src.structures import TFIncrementalState
+    from src.structures import StructureHistory, TFIncrementalState
+    from .checkpoint import CheckpointHeader
 
 
 logger = get_module_logger(__name__)
@@ -72,8 +76,8 @@ class LiveIndicatorCache:
         # Indicator arrays (name -> numpy array)
         self._indicators: dict[str, np.ndarray] = {}
 
-        # Incremental indicator instances (name -> IncrementalIndicator)
-        self._incremental: dict[str, Any] = {}
+        # Incremental indicators (name -> (IncrementalIndicator, FeatureSpec, IndicatorInfo))
+        self._incremental: dict[str, tuple[Any, Any, Any]] = {}
 
         # Specs that don't support incremental computation
         self._vectorized_specs: list[dict] = []
@@ -92,6 +96,17 @@ class LiveIndicatorCache:
         # Track bar count (valid data in each array is [:_bar_count])
         self._bar_count: int = 0
 
+    def __getstate__(self) -> dict[str, Any]:
+        """Pickle for checkpoints: the lock is recreated and the Play re-attached on restore."""
+        state = self.__dict__.copy()
+        del state["_lock"]
+        state["_play"] = None
+        return state
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
     def initialize_from_history(
         self,
         candles: list,
@@ -158,10 +173,10 @@ class LiveIndicatorCache:
                     # Create incremental indicator
                     inc_ind = create_incremental_indicator(ind_type, feature.params)
                     if inc_ind is not None:
-                        self._incremental[feature.output_key] = (inc_ind, feature)
-
-                        # Use registry to determine input requirements and outputs
+                        # Use registry to determine input requirements and outputs.
+                        # Resolved once here so update() does no per-candle lookups.
                         info = registry.get_indicator_info(ind_type)
+                        self._incremental[feature.output_key] = (inc_ind, feature, info)
                         needs_hlc = info.requires_hlc
 
                         # Initialize arrays for all outputs (pre-allocated)
@@ -300,33 +315,32 @@ class LiveIndicatorCache:
                 self._bar_count += 1
 
             # Update incremental indicators (O(1) per indicator)
-            from ...backtest.indicator_registry import get_registry
-            registry = get_registry()
-
-            for name, (inc_ind, feature) in self._incremental.items():
-                ind_type = feature.indicator_type.lower()
-
-                # Use registry to determine input requirements
-                info = registry.get_indicator_info(ind_type)
+            prof = active_profiler()
+            high = float(candle.high)
+            low = float(candle.low)
+            close = float(candle.close)
+            volume = float(candle.volume)
+            ts_open_ms: int | None = None
+            if candle.ts_open is not None:
+                from src.backtest.runtime.feed_store import _datetime_to_epoch_ms
+                ts_open_ms = _datetime_to_epoch_ms(candle.ts_open)
+
+            for name, (inc_ind, feature, info) in self._incremental.items():
+                t = perf_counter_ns() if prof is not None else 0
                 if info.requires_hlc:
-                    kwargs: dict = dict(
-                        high=float(candle.high),
-                        low=float(candle.low),
-                        close=float(candle.close),
-                    )
+                    kwargs: dict = dict(high=high, low=low, close=close)
                     if info.requires_volume:
-                        kwargs["volume"] = float(candle.volume)
+                        kwargs["volume"] = volume
                     # Pass ts_open for session-boundary indicators (VWAP)
-                    if candle.ts_open is not None:
-                        from src.backtest.runtime.feed_store import _datetime_to_epoch_ms
-                        kwargs["ts_open"] = _datetime_to_epoch_ms(candle.ts_open)
+                    if ts_open_ms is not None:
+                        kwargs["ts_open"] = ts_open_ms
                     inc_ind.update(**kwargs)
                 else:
                     # Route primary input by feature's input_source
                     input_val = self._resolve_input_from_candle(feature, candle)
                     kwargs = dict(close=input_val)
                     if info.requires_volume:
-                        kwargs["volume"] = float(candle.volume)
+                        kwargs["volume"] = volume
                     inc_ind.update(**kwargs)
 
                 # Write new values at write_idx (no allocation)
@@ -336,6 +350,8 @@ class LiveIndicatorCache:
                         self._indicators[key][write_idx] = self._get_incremental_output(inc_ind, suffix)
                 else:
                     self._indicators[name][write_idx] = inc_ind.value
+                if prof is not None:
+                    prof.lap(f"indicators.{name}", t)
 
             # Write NaN placeholder for engine-managed indicators (e.g., anchored_vwap).
             # Engine fills correct values after structure update via _update_anchored_vwap().
@@ -383,7 +399,9 @@ class LiveIndicatorCache:
         from ...backtest.indicator_vendor import compute_indicator
 
         n = self._bar_count
+        prof = active_profiler()
         for spec in self._vectorized_specs:
+            t = perf_counter_ns() if prof is not None else 0
             try:
                 feature = FeatureSpec.from_dict(spec)
                 result = compute_indicator(
@@ -409,6 +427,8 @@ class LiveIndicatorCache:
                     self._indicators[feature.output_key][:n] = values[:n]
             except Exception as e:
                 logger.warning("Failed to compute indicator %s: %s", spec, e)
+            if prof is not None:
+                prof.lap(f"indicators.{spec.get('output_key', '?')}", t)
 
     def get(self, name: str, index: int) -> float:
         """Get indicator value at index. Thread-safe."""
@@ -475,7 +495,7 @@ class LiveIndicatorCache:
             volume_s = pd.Series(self._volume[:n])
 
             # For each incrementally computed indicator, recompute vectorized
-            for name, (inc_ind, feature) in self._incremental.items():
+            for name, (inc_ind, feature, _info) in self._incremental.items():
                 try:
                     # Determine primary input based on feature's input_source
                     source_str = (
@@ -619,6 +639,14 @@ class LiveDataProvider:
         # G6.2.2: Thread safety for buffer access from WebSocket callbacks
         self._buffer_lock = threading.Lock()
 
+        # Serializes whole candle updates against checkpoint save/restore
+        self._update_lock = threading.Lock()
+
+        # Warm restart (src/engine/adapters/checkpoint.py): checkpoint file,
+        # set by enable_checkpoints(); header of the restored checkpoint
+        self._checkpoint_path: Path | None = None
+        self._restored_checkpoint: "CheckpointHeader | None" = None
+
         # 3-Feed Candle Buffers
         self._low_tf_buffer: list[Candle] = []
         self._med_tf_buffer: list[Candle] = []
@@ -641,9 +669,8 @@ class LiveDataProvider:
         self._med_tf_structure: "TFIncrementalState | None" = None
         self._high_tf_structure: "TFIncrementalState | None" = None
 
-        # G16.3: Structure history ring buffer for lookback
-        # Key: (tf_role, struct_key, field) -> deque of (bar_idx, value)
-        self._structure_history: dict[tuple[str, str, str], deque] = {}
+        # G16.3: Structure history for lookback, one columnar ring buffer per TF role
+        self._structure_history: dict[str, "StructureHistory"] = {}
 
         # H7: Monotonic global bar counter per TF (never resets on trim)
         self._global_bar_count: dict[str, int] = {
@@ -801,7 +828,6 @@ class LiveDataProvider:
         ensure DuckDB has enough data.  Runs once during connect().
         """
         from ...data.historical_data_store import get_historical_store
-        from ...data.historical_sync import sync_range
         from src.backtest.runtime.timeframe import tf_minutes as _tf_minutes
 
         store = get_historical_store(env=self._env)
@@ -826,8 +852,7 @@ class LiveDataProvider:
                 f"({start.date()} to {now.date()})"
             )
             try:
-                sync_range(
-                    store,
+                store.sync_range(
                     symbols=self._symbol,
                     start=start,
                     end=now,
@@ -838,10 +863,17 @@ class LiveDataProvider:
                 logger.warning("Warmup sync failed for %s (will try REST fallback): %s", tf_str, e)
 
     async def _load_initial_bars(self) -> None:
-        """Load initial bars from bar buffer, DuckDB, or REST API for all TFs."""
+        """Load initial bars from bar buffer, DuckDB, or REST API for all TFs.
+
+        With checkpoints enabled, a compatible checkpoint is restored and
+        only the bars closed since it are replayed (see _warm_restart).
+        """
         if self._realtime_state is None:
             return
 
+        if await self._warm_restart():
+            return
+
         # Load bars for each unique timeframe
         unique_tfs = {
             "low_tf": self._tf_mapping["low_tf"],
@@ -1027,11 +1059,13 @@ class LiveDataProvider:
             })
         return specs
 
-    async def _load_bars_from_db_for_tf(self, tf_str: str) -> list:
+    async def _load_bars_from_db_for_tf(self, tf_str: str, start: datetime | None = None) -> list:
         """
         Load bars from DuckDB for warm-up for a specific timeframe.
 
         Fallback when in-memory buffer is empty (e.g., bot restart).
+        start narrows the query (warm restart needs only the bars since
+        its checkpoint); default is the last buffer_size bars.
         """
         from ...data.historical_data_store import get_historical_store
         from ...data.realtime_state import BarRecord
@@ -1043,7 +1077,8 @@ class LiveDataProvider:
             # Calculate time range (last N bars based on timeframe)
             end = utc_now()
             tf_mins = tf_minutes(tf_str)
-            start = end - timedelta(minutes=tf_mins * self._buffer_size)
+            earliest = end - timedelta(minutes=tf_mins * self._buffer_size)
+            start = earliest if start is None else max(start, earliest)
 
             # Query DuckDB (G14.1: use get_ohlcv, not query_ohlcv)
             df = store.get_ohlcv(
@@ -1084,11 +1119,12 @@ class LiveDataProvider:
             logger.error("Failed to load bars from DuckDB for %s: %s", tf_str, e)
             return []
 
-    async def _load_bars_from_rest_api(self, tf_str: str) -> list:
+    async def _load_bars_from_rest_api(self, tf_str: str, start: datetime | None = None) -> list:
         """Load bars from Bybit REST API for warm-up.
 
         Third fallback when both bar buffer and DuckDB are empty (e.g. fresh
-        demo account with no historical data synced).
+        demo account with no historical data synced). start narrows the
+        request to the bars since a warm restart checkpoint.
         """
         from ...data.historical_data_store import get_historical_store, TIMEFRAMES
         from ...data.realtime_state import BarRecord
@@ -1106,6 +1142,9 @@ class LiveDataProvider:
             tf_mins = tf_minutes(tf_str)
             # Fetch enough bars for warmup (capped at 1000 per Bybit API limit)
             fetch_count = min(self._warmup_bars + 10, 1000)
+            if start is not None:
+                since_bars = int((end - start).total_seconds() // (tf_mins * 60)) + 2
+                fetch_count = min(fetch_count, since_bars)
             start = end - timedelta(minutes=tf_mins * fetch_count)
 
             _end_ms = datetime_to_epoch_ms(end)
@@ -1154,6 +1193,161 @@ class LiveDataProvider:
             logger.error("Failed to load bars from REST API for %s: %s", tf_str, e)
             return []
 
+    # ------------------------------------------------------------------
+    # Checkpoints (warm restart)
+    # ------------------------------------------------------------------
+
+    def enable_checkpoints(self, path: Path | str) -> None:
+        """
+        Use a checkpoint file for warm restarts.
+
+        _load_initial_bars() restores from it when it is compatible, and
+        save_checkpoint() overwrites it.
+        """
+        self._checkpoint_path = Path(path)
+
+    @property
+    def restored_checkpoint(self) -> "CheckpointHeader | None":
+        """Header of the checkpoint the warmup restored (None after a cold warmup)."""
+        return self._restored_checkpoint
+
+    def save_checkpoint(self) -> "CheckpointHeader | None":
+        """
+        Write the current state to the checkpoint file.
+
+        No-op (returns None) when checkpoints are disabled or warmup has not
+        completed, so a failed warmup never replaces a good checkpoint.
+        """
+        if self._checkpoint_path is None or not self.is_ready():
+            return None
+        from .checkpoint import save_checkpoint
+        return save_checkpoint(self, self._checkpoint_path)
+
+    async def _warm_restart(self) -> bool:
+        """
+        Restore the checkpoint and replay the bars closed since it.
+
+        Returns False (caller does a cold warmup) when checkpoints are off,
+        the file is missing or incompatible, or some TF's bars since the
+        checkpoint cannot be fetched without a gap.
+        """
+        path = self._checkpoint_path
+        if path is None or not path.exists():
+            return False
+        from .checkpoint import (
+            CheckpointError, active_roles, check_compatible, read_checkpoint, restore_checkpoint,
+        )
+
+        started = perf_counter_ns()
+        try:
+            header, payload = read_checkpoint(path)
+            check_compatible(header, self)
+        except CheckpointError as e:
+            logger.warning("Checkpoint %s not used (%s); cold warmup", path, e)
+            return False
+
+        replay: dict[str, list[Candle]] = {}
+        for tf_role in active_roles(self):
+            tf_str = self._tf_mapping[tf_role]
+            last_ts_open_ms = header.last_ts_open_ms.get(tf_role)
+            candles = None
+            if last_ts_open_ms is not None:
+                candles = await self._load_closed_candles_since(tf_str, last_ts_open_ms)
+            if candles is None:
+                logger.warning(
+                    "Checkpoint %s not used: no gap-free %s (%s) bars since it; cold warmup",
+                    path, tf_role, tf_str,
+                )
+                return False
+            replay[tf_role] = candles
+
+        try:
+            restore_checkpoint(self, header, payload)
+        except CheckpointError as e:
+            logger.warning("Checkpoint %s not used (%s); cold warmup", path, e)
+            return False
+
+        with self._update_lock:
+            for tf_role, candles in replay.items():
+                for candle in candles:
+                    self._apply_closed_candle(candle, tf_role)
+        self._check_all_tf_warmup()
+        self._restored_checkpoint = header
+
+        logger.info(
+            "Warm restart from %s (created %s): replayed %s in %.1fms",
+            path, header.created_at,
+            ", ".join(f"{role}={len(c)}" for role, c in replay.items()),
+            (perf_counter_ns() - started) / 1e6,
+        )
+        return True
+
+    async def _load_closed_candles_since(self, tf_str: str, since_ts_open_ms: int) -> list[Candle] | None:
+        """
+        Closed bars of a TF opened after since_ts_open_ms, from the warmup
+        tiers (bar buffer, then DuckDB, then REST).
+
+        Returns None when no tier holds a gap-free run starting at the
+        checkpoint's last bar, since replaying across a gap would diverge
+        from an uninterrupted run.
+        """
+        assert self._realtime_state is not None
+        bars = self._realtime_state.get_bar_buffer(
+            env=self._env,
+            symbol=self._symbol,
+            timeframe=tf_str,
+            limit=self._buffer_size,
+        )
+        candles = self._closed_candles_since(bars, tf_str, since_ts_open_ms)
+        since = epoch_ms_to_datetime(since_ts_open_ms)
+        if candles is None:
+            candles = self._closed_candles_since(
+                await self._load_bars_from_db_for_tf(tf_str, start=since), tf_str, since_ts_open_ms,
+            )
+        if candles is None:
+            candles = self._closed_candles_since(
+                await self._load_bars_from_rest_api(tf_str, start=since), tf_str, since_ts_open_ms,
+            )
+        return candles
+
+    def _closed_candles_since(self, bars: list, tf_str: str, since_ts_open_ms: int) -> list[Candle] | None:
+        """Consecutive closed Candles after since_ts_open_ms, or None if bars do not connect."""
+        if not bars:
+            return None
+        tf_duration = timedelta(minutes=tf_minutes(tf_str))
+        step_ms = tf_minutes(tf_str) * 60_000
+        now = utc_now()
+        bars = sorted(bars, key=lambda b: b.timestamp)
+        first_ts_ms = datetime_to_epoch_ms(bars[0].timestamp)
+        assert first_ts_ms is not None
+        if first_ts_ms > since_ts_open_ms:
+            return None
+
+        candles: list[Candle] = []
+        expected_ms = since_ts_open_ms + step_ms
+        connected = False
+        for bar in bars:
+            ts_ms = datetime_to_epoch_ms(bar.timestamp)
+            assert ts_ms is not None
+            if ts_ms <= since_ts_open_ms:
+                connected = ts_ms == since_ts_open_ms
+                continue
+            if bar.timestamp + tf_duration > now:
+                break  # still forming; arrives through on_candle_close
+            if ts_ms != expected_ms:
+                return None
+            candles.append(Candle(
+                ts_open=bar.timestamp,
+                ts_close=bar.timestamp + tf_duration,
+                open=bar.open,
+                high=bar.high,
+                low=bar.low,
+                close=bar.close,
+                volume=bar.volume,
+            ))
+            expected_ms += step_ms
+        return candles if connected else None
+
     def _get_structure_specs_by_tf_role(self) -> dict[str, list[dict]]:
         """Derive structure specs grouped by TF role from play.features.
 
@@ -1418,18 +1612,12 @@ class LiveDataProvider:
         if resolved_role is None:
             # Resolve exec pointer to actual role
             resolved_role = self._exec_role
-        buf_key = (resolved_role, key, field)
-        buf = self._structure_history.get(buf_key)
-        if buf and index < 0:
-            abs_idx = len(buf) + index
-            if 0 <= abs_idx < len(buf):
-                return buf[abs_idx][1]
-            # Out-of-range lookback: return NaN instead of falling through
-            return float("nan")
-
         if index < 0:
-            # Negative index but no buffer — return NaN
-            return float("nan")
+            # Out-of-range lookback or nothing recorded yet: NaN
+            history = self._structure_history.get(resolved_role)
+            if history is None:
+                return float("nan")
+            return history.value_at(key, field, index)
 
         # Non-negative index: return current value
         return structure.get_value(key, field)
@@ -1558,7 +1746,15 @@ class LiveDataProvider:
 
         tf_role = self._get_tf_role_for_timeframe(timeframe)
 
-        # Route to correct buffer and indicator cache
+        with self._update_lock:
+            self._apply_closed_candle(candle, tf_role)
+
+        # WU-02, WU-04: Check warmup for all TFs with NaN validation
+        if not self._ready:
+            self._check_all_tf_warmup()
+
+    def _apply_closed_candle(self, candle: Candle, tf_role: str) -> None:
+        """Route a closed candle to its TF role's buffer, indicators and structures."""
         if tf_role == "low_tf":
             self._update_tf_buffer(
                 candle, self._low_tf_buffer, self._low_tf_indicators, self._low_tf_structure, tf_role
@@ -1572,10 +1768,6 @@ class LiveDataProvider:
                 candle, self._high_tf_buffer, self._high_tf_indicators, self._high_tf_structure, tf_role
             )
 
-        # WU-02, WU-04: Check warmup for all TFs with NaN validation
-        if not self._ready:
-            self._check_all_tf_warmup()
-
     def _get_tf_role_for_timeframe(self, timeframe: str) -> str:
         """Map a timeframe string to its TF role (low_tf, med_tf, high_tf)."""
         if timeframe == self._tf_mapping["low_tf"]:
@@ -1670,17 +1862,12 @@ class LiveDataProvider:
         tf_role: str,
         bar_idx: int,
     ) -> None:
-        """G16.3: Record all structure output values in history ring buffer."""
-        for struct_key in structure_state.list_structures():
-            for field in structure_state.list_outputs(struct_key):
-                try:
-                    value = structure_state.get_value(struct_key, field)
-                except (KeyError, RuntimeError):
-                    continue
-                buf_key = (tf_role, struct_key, field)
-                if buf_key not in self._structure_history:
-                    self._structure_history[buf_key] = deque(maxlen=500)
-                self._structure_history[buf_key].append((bar_idx, value))
+        """G16.3: Record all structure output values in the TF's history ring buffer."""
+        history = self._structure_history.get(tf_role)
+        if history is None:
+            from src.structures import StructureHistory
+            history = self._structure_history[tf_role] = StructureHistory(structure_state)
+        history.record(structure_state, bar_idx)
 
 
 class LiveExchange:
@@ -1726,6 +1913,10 @@ class LiveExchange:
         self._last_known_balance: float = 0.0
         self._equity_stale_count: int = 0
 
+        # Pre-armed entry orders (filled by LiveRunner when prearm_orders is on)
+        from ...core.prearm import PrearmBook
+        self.prearm_book = PrearmBook()
+
         # Tracking
         self._connected = False
         _now_ms = datetime_to_epoch_ms(utc_now())
@@ -2019,62 +2210,18 @@ class LiveExchange:
                 error="Exchange not connected. Call connect() first.",
             )
 
-        from ...core.risk_manager import Signal
-
         try:
-            # Extract original Signal from Order metadata if available
-            # (PlayEngine.execute_signal stores it as order.metadata["signal"])
-            original_signal = order.metadata.get("signal") if order.metadata else None
-
-            # Preserve strategy and confidence from original signal
-            strategy = (
-                original_signal.strategy
-                if original_signal and hasattr(original_signal, "strategy")
-                else (self._play.name or self._play.id)
-            )
-            confidence = (
-                original_signal.confidence
-                if original_signal and hasattr(original_signal, "confidence")
-                else 1.0
-            )
-
-            # Build metadata preserving original signal fields
-            signal_metadata = {}
-            if original_signal and hasattr(original_signal, "metadata") and original_signal.metadata:
-                signal_metadata.update(original_signal.metadata)
-            # Ensure stop_loss/take_profit are in metadata for downstream consumers
-            if order.stop_loss is not None:
-                signal_metadata["stop_loss"] = order.stop_loss
-            if order.take_profit is not None:
-                signal_metadata["take_profit"] = order.take_profit
-            if order.order_type:
-                signal_metadata["order_type"] = order.order_type.lower()
-            if order.limit_price is not None:
-                signal_metadata["limit_price"] = order.limit_price
-            signal_metadata["time_in_force"] = order.time_in_force
-            signal_metadata["tp_order_type"] = order.tp_order_type
-            signal_metadata["sl_order_type"] = order.sl_order_type
-
-            # M-S6: Preserve reference_price from original signal for deviation guard
-            ref_price = (
-                original_signal.reference_price
-                if original_signal and hasattr(original_signal, "reference_price")
-                else None
-            )
+            signal = self._order_to_signal(order)
 
-            # Convert unified Order to Signal format (only valid Signal fields)
-            signal = Signal(
-                symbol=order.symbol,
-                direction=self._order_side_to_direction(order.side),
-                size_usdt=order.size_usdt,
-                strategy=strategy,
-                confidence=confidence,
-                metadata=signal_metadata,
-                reference_price=ref_price,
-            )
+            # Pre-armed checks for this entry, if still valid (src/core/prearm.py)
+            prepared = None
+            if self.prearm_book.armed_directions:
+                fingerprint = self.prearm_fingerprint()
+                if fingerprint is not None:
+                    prepared = self.prearm_book.take(signal, fingerprint)
 
             # Execute through OrderExecutor
-            exec_result = self._order_executor.execute(signal)
+            exec_result = self._order_executor.execute(signal, prepared=prepared)
 
             # Convert to unified OrderResult
             # Build risk_check metadata (RiskCheckResult has no to_dict)
@@ -2108,6 +2255,118 @@ class LiveExchange:
                 error=str(e),
             )
 
+    def _order_to_signal(self, order: Order):
+        """Convert a unified Order (from PlayEngine) to the OrderExecutor Signal."""
+        from ...core.risk_manager import Signal
+
+        # Extract original Signal from Order metadata if available
+        # (PlayEngine.execute_signal stores it as order.metadata["signal"])
+        original_signal = order.metadata.get("signal") if order.metadata else None
+
+        # Preserve strategy and confidence from original signal
+        strategy = (
+            original_signal.strategy
+            if original_signal and hasattr(original_signal, "strategy")
+            else (self._play.name or self._play.id)
+        )
+        confidence = (
+            original_signal.confidence
+            if original_signal and hasattr(original_signal, "confidence")
+            else 1.0
+        )
+
+        # Build metadata preserving original signal fields
+        signal_metadata = {}
+        if original_signal and hasattr(original_signal, "metadata") and original_signal.metadata:
+            signal_metadata.update(original_signal.metadata)
+        # Ensure stop_loss/take_profit are in metadata for downstream consumers
+        if order.stop_loss is not None:
+            signal_metadata["stop_loss"] = order.stop_loss
+        if order.take_profit is not None:
+            signal_metadata["take_profit"] = order.take_profit
+        if order.order_type:
+            signal_metadata["order_type"] = order.order_type.lower()
+        if order.limit_price is not None:
+            signal_metadata["limit_price"] = order.limit_price
+        signal_metadata["time_in_force"] = order.time_in_force
+        signal_metadata["tp_order_type"] = order.tp_order_type
+        signal_metadata["sl_order_type"] = order.sl_order_type
+
+        # M-S6: Preserve reference_price from original signal for deviation guard
+        ref_price = (
+            original_signal.reference_price
+            if original_signal and hasattr(original_signal, "reference_price")
+            else None
+        )
+
+        # Convert unified Order to Signal format (only valid Signal fields)
+        return Signal(
+            symbol=order.symbol,
+            direction=self._order_side_to_direction(order.side),
+            size_usdt=order.size_usdt,
+            strategy=strategy,
+            confidence=confidence,
+            metadata=signal_metadata,
+            reference_price=ref_price,
+        )
+
+    def prearm_fingerprint(self) -> tuple | None:
+        """
+        Account state a prepared order depends on, or None if it cannot be
+        observed (private WebSocket down or stale: nothing is pre-armed).
+        """
+        rs = self._realtime_state
+        if rs is None or not self._is_ws_data_fresh():
+            return None
+        metrics = rs.get_account_metrics()
+        if metrics is None:
+            return None
+        return (rs.get_private_state_version(), metrics.total_equity, metrics.total_available_balance)
+
+    def prearm(
+        self,
+        orders: list[Order],
+        reference_price: float,
+        bar_ts_close_ms: int,
+        safety_ok: bool,
+        safety_exposure: float = 0.0,
+    ) -> int:
+        """
+        Run OrderExecutor pre-submit checks for entry orders of the forming bar.
+
+        Args:
+            orders: PlayEngine.build_entry_orders() output
+            reference_price: Forming-candle price the orders were sized at
+            bar_ts_close_ms: Close of the bar being formed
+            safety_ok: Runner SafetyChecks result for the same state
+            safety_exposure: Additional exposure safety_ok was checked for
+
+        Returns:
+            Number of directions armed (0 when the account state is unknown)
+        """
+        from ...core.prearm import PreparedOrder, risk_inputs
+
+        book = self.prearm_book
+        fingerprint = self.prearm_fingerprint()
+        if self._order_executor is None or fingerprint is None:
+            book.clear()
+            return 0
+        book.begin(bar_ts_close_ms, fingerprint, reference_price, safety_ok, safety_exposure)
+        for order in orders:
+            signal = self._order_to_signal(order)
+            risk_check = self._order_executor.prepare(signal)
+            if risk_check is None:
+                continue
+            book.add(PreparedOrder(
+                direction=signal.direction,
+                risk_inputs=risk_inputs(signal),
+                risk_check=risk_check,
+                reference_price=reference_price,
+                bar_ts_close_ms=bar_ts_close_ms,
+                fingerprint=fingerprint,
+            ))
+        return len(book.armed_directions)
+
     def _order_side_to_direction(self, side: str) -> str:
         """Convert order side to direction string.
 
@@ -2370,6 +2629,9 @@ class LiveExchange:
                     qty=close_qty,
                     raw_response=raw,
                 )
+            trace = current_trace()
+            if trace is not None:
+                trace.mark_order_ack(result.order_id if result and result.success else None)
 
             if result and result.success:
                 logger.info(
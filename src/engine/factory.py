@@ -80,6 +80,8 @@ def _build_config_from_play(
     Returns:
         Configured PlayEngineConfig
     """
+    from ..core.prearm import prearm_enabled_by_env
+
     account = play.account
     assert account is not None, "Play must have an account config to build engine config"
 
@@ -137,6 +139,7 @@ def _build_config_from_play(
         state_save_interval=state_save_interval,
         on_sl_beyond_liq=account.on_sl_beyond_liq,
         max_drawdown_pct=account.max_drawdown_pct,
+        prearm_orders=(mode == "live" and prearm_enabled_by_env()),
     )
 
     if config_override:
@@ -1,18 +1,20 @@
 """
 Trade journal for persistent trade logging.
 
-Writes trade events as JSONL (one JSON object per line) for post-analysis.
-Each line is a complete JSON object with event type, timestamp, and details.
+Writes trade events through the shared JournalWriter (journal_writer.py):
+batched appends, JSONL by default or Arrow IPC segments with
+JOURNAL_FORMAT=arrow. Each event is a JSON object with event type,
+timestamp, and details; read them back with JournalReader.
 
 Journal files are stored at {project_root}/data/journal/{instance_id}.jsonl
+(or {instance_id}/ for the arrow format).
 """
 
-import json
-from datetime import datetime
 from pathlib import Path
 
 from ..utils.datetime_utils import utc_now
 from ..utils.logger import get_module_logger
+from .journal_writer import JournalWriter, default_journal_format
 
 logger = get_module_logger(__name__)
 
@@ -24,14 +26,25 @@ class TradeJournal:
     - signal: timestamp, symbol, direction, size_usdt, strategy, metadata
     - fill: timestamp, symbol, direction, size_usdt, fill_price, order_id, sl, tp
     - error: timestamp, symbol, direction, error
+    - trace: timestamp, symbol, per-hop latency spans of an exec candle
+      (utils/latency.py CandleTrace.to_record())
+    - trace_ack: timestamp, symbol, order_id, ws_execution_ms, to_ws_execution_ms
+
+    Every event is written immediately; fills are also fsync'd.
     """
 
-    def __init__(self, instance_id: str):
+    def __init__(self, instance_id: str, fmt: str | None = None):
         self._instance_id = instance_id
         from ..config.constants import JOURNAL_DIR
         self._journal_dir = JOURNAL_DIR
         self._journal_dir.mkdir(parents=True, exist_ok=True)
-        self._path = self._journal_dir / f"{instance_id}.jsonl"
+        self._writer = JournalWriter(
+            self._journal_dir / f"{instance_id}.jsonl",
+            fmt=fmt or default_journal_format(),
+            flush_events=1,  # live volume is low; write through, fsync fills only
+            fsync_events=("fill",),
+        )
+        self._path = self._writer.path
         logger.info("TradeJournal initialized: %s", self._path)
 
     def record_signal(
@@ -94,32 +107,71 @@ class TradeJournal:
             "error": error,
         })
 
+    def record_trace(self, symbol: str, trace: dict) -> None:
+        """Record the latency trace of a processed exec candle."""
+        self._write({
+            "event": "trace",
+            "timestamp": utc_now().isoformat(),
+            "instance_id": self._instance_id,
+            "symbol": symbol,
+            **trace,
+        })
+
+    def record_trace_ack(
+        self,
+        symbol: str,
+        order_id: str,
+        ws_execution_ms: float,
+        to_ws_execution_ms: float,
+    ) -> None:
+        """Record the WebSocket execution ack of a traced order."""
+        self._write({
+            "event": "trace_ack",
+            "timestamp": utc_now().isoformat(),
+            "instance_id": self._instance_id,
+            "symbol": symbol,
+            "order_id": order_id,
+            "ws_execution_ms": round(ws_execution_ms, 3),
+            "to_ws_execution_ms": round(to_ws_execution_ms, 3),
+        })
+
     def _write(self, data: dict) -> None:
-        """Append a JSON line to the journal file."""
-        try:
-            with open(self._path, "a", encoding="utf-8", newline="\n") as f:
-                f.write(json.dumps(data, default=str) + "\n")
-        except Exception as e:
-            logger.warning("Failed to write journal entry: %s", e)
+        """Append an event to the journal."""
+        self._writer.append(data)
+
+    def flush(self) -> None:
+        """Write buffered events."""
+        self._writer.flush()
+
+    def close(self) -> None:
+        """Flush and close the journal."""
+        self._writer.close()
 
     @property
     def path(self) -> Path:
-        """Path to the journal file."""
+        """Path to the journal file (segment directory for the arrow format)."""
         return self._path
 
 
 class BacktestJournal:
     """Lightweight journal for backtest runs.
 
-    Writes signal/fill/error events to ``events.jsonl`` inside the artifact
-    folder so that backtest runs produce the same event log as live/demo runs.
+    Writes signal/fill/error events to ``events.jsonl`` (or ``events/`` with
+    the arrow format) inside the artifact folder so that backtest runs produce
+    the same event log as live/demo runs. Events are buffered and written in
+    batches; call close() when the run is done.
     """
 
-    def __init__(self, artifact_dir: Path, play_id: str, symbol: str):
-        self._path = artifact_dir / "events.jsonl"
+    def __init__(self, artifact_dir: Path, play_id: str, symbol: str, fmt: str | None = None):
+        self._writer = JournalWriter(
+            artifact_dir / "events.jsonl",
+            fmt=fmt or default_journal_format(),
+            flush_events=4096,
+            flush_interval_s=float("inf"),
+        )
+        self._path = self._writer.path
         self._play_id = play_id
         self._symbol = symbol
-        self._count = 0
 
     def record(self, event: str, bar_idx: int, **fields) -> None:
         """Record a generic backtest event."""
@@ -130,12 +182,7 @@ class BacktestJournal:
             "bar_idx": bar_idx,
             **fields,
         }
-        try:
-            with open(self._path, "a", encoding="utf-8", newline="\n") as f:
-                f.write(json.dumps(entry, default=str) + "\n")
-            self._count += 1
-        except Exception:
-            pass  # Never crash on journal write
+        self._writer.append(entry)  # Never raises on write failure
 
     def record_signal(self, bar_idx: int, decision: str, reason: str) -> None:
         """Record a signal evaluation that produced an action."""
@@ -158,10 +205,14 @@ class BacktestJournal:
             entry_price=entry_price, exit_price=exit_price, pnl=pnl, reason=reason,
         )
 
+    def close(self) -> None:
+        """Write buffered events and close the journal."""
+        self._writer.close()
+
     @property
     def path(self) -> Path:
         return self._path
 
     @property
     def event_count(self) -> int:
-        return self._count
+        return self._writer.event_count
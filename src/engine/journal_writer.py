@@ -0,0 +1,469 @@
+"""
+Shared buffered event-journal writer and reader.
+
+Used by TradeJournal (live/demo), BacktestJournal and ShadowJournal.
+Events are plain dicts with an ``event`` type key; ``timestamp`` (ISO string,
+datetime or epoch ms) and ``bar_idx`` are indexed when present.
+
+Writes are batched: the buffer is flushed when it holds ``flush_events``
+events, when ``flush_interval_s`` has passed since the last flush (checked on
+append and by flush_if_due()), and immediately for event types listed in
+``fsync_events``, which are also fsync'd. close() flushes the rest.
+
+Formats:
+    jsonl  - one JSON object per line in ``<path>`` (e.g. events.jsonl),
+             with json.dumps' default spacing; compact_json=True writes
+             compact lines (ShadowJournal, as before JournalWriter)
+    arrow  - Arrow IPC stream segments in ``<path without suffix>/``
+             (e.g. events/segment-000001.arrows) with an index.json listing
+             rows, time range and per-type counts of every segment.
+             Segments rotate every ``segment_max_events`` rows and on reopen.
+             Columns: event, ts_ms, bar_idx, payload (the event as JSON).
+
+JournalReader streams events of either format filtered by type and time:
+the arrow reader skips segments via the index and filters on the event and
+ts_ms columns, decoding payloads only for matching rows; the JSONL reader
+skips lines whose type token does not match before parsing. export_jsonl()
+converts any journal back to JSONL.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import time
+from collections.abc import Callable, Collection, Iterator
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, TextIO
+
+import pyarrow as pa
+import pyarrow.compute as pc
+
+from ..utils.logger import get_module_logger
+
+logger = get_module_logger(__name__)
+
+JOURNAL_FORMATS = ("jsonl", "arrow")
+
+DEFAULT_FLUSH_EVENTS = 256
+DEFAULT_FLUSH_INTERVAL_S = 1.0
+DEFAULT_SEGMENT_MAX_EVENTS = 50_000
+
+JOURNAL_INDEX_FILE = "index.json"
+JOURNAL_INDEX_VERSION = 1
+
+JOURNAL_SCHEMA = pa.schema([
+    ("event", pa.string()),
+    ("ts_ms", pa.int64()),
+    ("bar_idx", pa.int64()),
+    ("payload", pa.string()),
+])
+
+# JSONL journals keep json.dumps' default separators unless created with
+# compact_json=True; Arrow payloads are always compact
+_JSON_SEPARATORS = (", ", ": ")
+_COMPACT_JSON_SEPARATORS = (",", ":")
+
+# pyarrow.compute generates these kernels at import time; its stubs do not declare them
+_pc_is_in: Callable[..., Any] = pc.is_in  # pyright: ignore[reportAttributeAccessIssue]
+_pc_greater_equal: Callable[..., Any] = pc.greater_equal  # pyright: ignore[reportAttributeAccessIssue]
+_pc_less_equal: Callable[..., Any] = pc.less_equal  # pyright: ignore[reportAttributeAccessIssue]
+_pc_and: Callable[..., Any] = pc.and_  # pyright: ignore[reportAttributeAccessIssue]
+
+
+def default_journal_format() -> str:
+    """Journal format from JOURNAL_FORMAT (jsonl | arrow), default jsonl."""
+    fmt = os.getenv("JOURNAL_FORMAT", "jsonl").strip().lower()
+    if fmt not in JOURNAL_FORMATS:
+        raise ValueError(f"JOURNAL_FORMAT must be one of {JOURNAL_FORMATS}, got '{fmt}'")
+    return fmt
+
+
+def _to_ms(value: Any) -> int | None:
+    """Epoch ms from an ISO string, datetime or number (naive = UTC); None if unparseable."""
+    if value is None or isinstance(value, bool):
+        return None
+    if isinstance(value, (int, float)):
+        return int(value)
+    if isinstance(value, str):
+        try:
+            value = datetime.fromisoformat(value)
+        except ValueError:
+            return None
+    if isinstance(value, datetime):
+        if value.tzinfo is None:
+            value = value.replace(tzinfo=timezone.utc)
+        return int(value.timestamp() * 1000)
+    return None
+
+
+def _arrow_dir(path: Path) -> Path:
+    """Segment directory for a journal path (events.jsonl -> events/)."""
+    return path.with_suffix("") if path.suffix else path
+
+
+# ── Writer ───────────────────────────────────────────────────────────
+
+
+class JournalWriter:
+    """
+    Batched append-only event journal.
+
+    Never raises on I/O errors: a failed flush is logged and the batch
+    dropped, so journaling cannot take down a run.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        fmt: str = "jsonl",
+        flush_events: int = DEFAULT_FLUSH_EVENTS,
+        flush_interval_s: float = DEFAULT_FLUSH_INTERVAL_S,
+        fsync_events: Collection[str] = (),
+        segment_max_events: int = DEFAULT_SEGMENT_MAX_EVENTS,
+        compact_json: bool = False,
+    ):
+        if fmt not in JOURNAL_FORMATS:
+            raise ValueError(f"Journal format must be one of {JOURNAL_FORMATS}, got '{fmt}'")
+        if flush_events < 1 or segment_max_events < 1:
+            raise ValueError("flush_events and segment_max_events must be >= 1")
+        self._fmt = fmt
+        self._path = Path(path)
+        self._flush_events = flush_events
+        self._flush_interval_s = flush_interval_s
+        self._fsync_events = frozenset(fsync_events)
+        self._segment_max_events = segment_max_events
+        self._separators = _COMPACT_JSON_SEPARATORS if compact_json else _JSON_SEPARATORS
+
+        self._buffer: list[dict[str, Any]] = []
+        self._last_flush = time.monotonic()
+        self._count = 0
+        self._closed = False
+
+        # jsonl state
+        self._fd: TextIO | None = None
+
+        # arrow state
+        self._dir = _arrow_dir(self._path)
+        self._index: dict[str, Any] = {}
+        self._segment: dict[str, Any] | None = None
+        self._sink: Any = None
+        self._stream: pa.ipc.RecordBatchStreamWriter | None = None
+
+        if fmt == "arrow":
+            self._index = _load_index(self._dir) or {"version": JOURNAL_INDEX_VERSION, "segments": []}
+
+    @property
+    def path(self) -> Path:
+        """Journal location: the JSONL file, or the segment directory for arrow."""
+        return self._dir if self._fmt == "arrow" else self._path
+
+    @property
+    def format(self) -> str:
+        return self._fmt
+
+    @property
+    def event_count(self) -> int:
+        """Events appended through this writer (buffered or written)."""
+        return self._count
+
+    def append(self, event: dict[str, Any]) -> None:
+        """Buffer one event; flush (and fsync) per the batching rules."""
+        if self._closed:
+            logger.warning("Journal %s is closed; dropping %s event", self.path, event.get("event"))
+            return
+        self._buffer.append(event)
+        self._count += 1
+        if event.get("event") in self._fsync_events:
+            self.flush(fsync=True)
+        elif (
+            len(self._buffer) >= self._flush_events
+            or time.monotonic() - self._last_flush >= self._flush_interval_s
+        ):
+            self.flush()
+
+    def flush_if_due(self) -> None:
+        """Flush if the time-based interval has elapsed (for idle periods)."""
+        if self._buffer and time.monotonic() - self._last_flush >= self._flush_interval_s:
+            self.flush()
+
+    def flush(self, fsync: bool = False) -> None:
+        """Write all buffered events."""
+        self._last_flush = time.monotonic()
+        if not self._buffer:
+            return
+        batch, self._buffer = self._buffer, []
+        try:
+            if self._fmt == "jsonl":
+                self._flush_jsonl(batch, fsync)
+            else:
+                self._flush_arrow(batch, fsync)
+        except (OSError, pa.ArrowException, TypeError, ValueError) as e:
+            logger.warning("Journal write failed for %s (%d events dropped): %s", self.path, len(batch), e)
+
+    def close(self) -> None:
+        """Flush, fsync and close; further appends are dropped."""
+        if self._closed:
+            return
+        self.flush(fsync=True)
+        self._closed = True
+        try:
+            if self._fd is not None:
+                self._fd.close()
+            self._close_segment()
+        except (OSError, pa.ArrowException) as e:
+            logger.warning("Journal close failed for %s: %s", self.path, e)
+        self._fd = None
+
+    def __enter__(self) -> "JournalWriter":
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+    # ── jsonl ──
+
+    def _flush_jsonl(self, batch: list[dict[str, Any]], fsync: bool) -> None:
+        if self._fd is None:
+            self._path.parent.mkdir(parents=True, exist_ok=True)
+            self._fd = open(self._path, "a", encoding="utf-8", newline="\n")
+        self._fd.write("".join(
+            json.dumps(e, default=str, separators=self._separators) + "\n" for e in batch
+        ))
+        self._fd.flush()
+        if fsync:
+            os.fsync(self._fd.fileno())
+
+    # ── arrow ──
+
+    def _open_segment(self) -> None:
+        self._dir.mkdir(parents=True, exist_ok=True)
+        segments = self._index["segments"]
+        number = (segments[-1]["number"] + 1) if segments else 1
+        name = f"segment-{number:06d}.arrows"
+        self._segment = {
+            "number": number,
+            "file": name,
+            "rows": 0,
+            "ts_min": None,
+            "ts_max": None,
+            "events": {},
+        }
+        segments.append(self._segment)
+        self._sink = open(self._dir / name, "wb")
+        self._stream = pa.ipc.new_stream(self._sink, JOURNAL_SCHEMA)
+
+    def _close_segment(self) -> None:
+        if self._stream is not None:
+            self._stream.close()
+            self._sink.close()
+        self._stream = None
+        self._sink = None
+        self._segment = None
+
+    def _flush_arrow(self, batch: list[dict[str, Any]], fsync: bool) -> None:
+        start = 0
+        while start < len(batch):
+            if self._segment is None:
+                self._open_segment()
+            assert self._segment is not None and self._stream is not None
+            room = self._segment_max_events - self._segment["rows"]
+            chunk = batch[start:start + room]
+            start += len(chunk)
+            self._write_chunk(chunk)
+            if fsync:
+                os.fsync(self._sink.fileno())
+            if self._segment["rows"] >= self._segment_max_events:
+                self._close_segment()
+        _save_index(self._dir, self._index)
+
+    def _write_chunk(self, chunk: list[dict[str, Any]]) -> None:
+        assert self._segment is not None and self._stream is not None
+        types = [str(e.get("event", "")) for e in chunk]
+        ts = [_to_ms(e.get("timestamp")) for e in chunk]
+        bars = [e.get("bar_idx") if isinstance(e.get("bar_idx"), int) else None for e in chunk]
+        payloads = [json.dumps(e, default=str, separators=_COMPACT_JSON_SEPARATORS) for e in chunk]
+        self._stream.write_batch(pa.record_batch(
+            [pa.array(types, pa.string()), pa.array(ts, pa.int64()),
+             pa.array(bars, pa.int64()), pa.array(payloads, pa.string())],
+            schema=JOURNAL_SCHEMA,
+        ))
+        self._sink.flush()
+
+        seg = self._segment
+        seg["rows"] += len(chunk)
+        for t in types:
+            seg["events"][t] = seg["events"].get(t, 0) + 1
+        known = [v for v in ts if v is not None]
+        if known:
+            lo, hi = min(known), max(known)
+            seg["ts_min"] = lo if seg["ts_min"] is None else min(seg["ts_min"], lo)
+            seg["ts_max"] = hi if seg["ts_max"] is None else max(seg["ts_max"], hi)
+
+
+def _load_index(directory: Path) -> dict[str, Any] | None:
+    try:
+        index = json.loads((directory / JOURNAL_INDEX_FILE).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    if index.get("version") != JOURNAL_INDEX_VERSION:
+        return None
+    return index
+
+
+def _save_index(directory: Path, index: dict[str, Any]) -> None:
+    """Replace index.json (temp file + rename; not fsync'd, it is rewritten every flush)."""
+    tmp = directory / f".{JOURNAL_INDEX_FILE}.tmp"
+    tmp.write_text(json.dumps(index, indent=1), encoding="utf-8")
+    os.replace(tmp, directory / JOURNAL_INDEX_FILE)
+
+
+# ── Reader ───────────────────────────────────────────────────────────
+
+
+class JournalReader:
+    """
+    Stream events from a JSONL or arrow journal.
+
+    ``path`` may be the JSONL file, the arrow segment directory, or the
+    JSONL-style path of an arrow journal (events.jsonl -> events/).
+    """
+
+    def __init__(self, path: Path):
+        path = Path(path)
+        if path.is_dir():
+            self._fmt, self._path = "arrow", path
+        elif path.is_file():
+            self._fmt, self._path = "jsonl", path
+        elif _arrow_dir(path).is_dir():
+            self._fmt, self._path = "arrow", _arrow_dir(path)
+        else:
+            raise FileNotFoundError(f"No journal at {path}")
+
+    @property
+    def format(self) -> str:
+        return self._fmt
+
+    def iter_events(
+        self,
+        event_types: Collection[str] | None = None,
+        start: datetime | int | None = None,
+        end: datetime | int | None = None,
+    ) -> Iterator[dict[str, Any]]:
+        """
+        Yield events in write order.
+
+        Args:
+            event_types: Only these ``event`` values (default: all)
+            start: Inclusive lower bound on the event timestamp (datetime or epoch ms)
+            end: Inclusive upper bound on the event timestamp
+                 (events without a timestamp are skipped when a bound is set)
+        """
+        types = frozenset(event_types) if event_types else None
+        start_ms = _to_ms(start)
+        end_ms = _to_ms(end)
+        if self._fmt == "jsonl":
+            yield from self._iter_jsonl(types, start_ms, end_ms)
+        else:
+            yield from self._iter_arrow(types, start_ms, end_ms)
+
+    def read_events(self, **filters: Any) -> list[dict[str, Any]]:
+        """List form of iter_events()."""
+        return list(self.iter_events(**filters))
+
+    def _iter_jsonl(
+        self, types: frozenset[str] | None, start_ms: int | None, end_ms: int | None,
+    ) -> Iterator[dict[str, Any]]:
+        # Type tokens in both compact and default json.dumps spacing
+        tokens = None
+        if types is not None:
+            tokens = [f'"event":"{t}"' for t in types] + [f'"event": "{t}"' for t in types]
+        timed = start_ms is not None or end_ms is not None
+        with open(self._path, "r", encoding="utf-8") as f:
+            for line in f:
+                if tokens is not None and not any(tok in line for tok in tokens):
+                    continue
+                try:
+                    event = json.loads(line)
+                except ValueError:
+                    continue  # torn last line after a crash
+                if types is not None and event.get("event") not in types:
+                    continue
+                if timed and not _in_range(_to_ms(event.get("timestamp")), start_ms, end_ms):
+                    continue
+                yield event
+
+    def _iter_arrow(
+        self, types: frozenset[str] | None, start_ms: int | None, end_ms: int | None,
+    ) -> Iterator[dict[str, Any]]:
+        index = _load_index(self._path)
+        if index is None:
+            raise FileNotFoundError(f"Journal index missing or unreadable in {self._path}")
+        type_set = pa.array(sorted(types), pa.string()) if types is not None else None
+        for seg in index["segments"]:
+            if types is not None and not types.intersection(seg.get("events", {})):
+                continue
+            if start_ms is not None and (seg.get("ts_max") is None or seg["ts_max"] < start_ms):
+                continue
+            if end_ms is not None and (seg.get("ts_min") is None or seg["ts_min"] > end_ms):
+                continue
+            for batch in _read_segment(self._path / seg["file"]):
+                mask = None
+                if type_set is not None:
+                    mask = _pc_is_in(batch.column("event"), value_set=type_set)
+                if start_ms is not None:
+                    m = _pc_greater_equal(batch.column("ts_ms"), start_ms)
+                    mask = m if mask is None else _pc_and(mask, m)
+                if end_ms is not None:
+                    m = _pc_less_equal(batch.column("ts_ms"), end_ms)
+                    mask = m if mask is None else _pc_and(mask, m)
+                if mask is not None:
+                    batch = batch.filter(mask)  # nulls (no timestamp) drop out
+                for payload in batch.column("payload").to_pylist():
+                    yield json.loads(payload)
+
+
+def _in_range(ts_ms: int | None, start_ms: int | None, end_ms: int | None) -> bool:
+    if ts_ms is None:
+        return False
+    if start_ms is not None and ts_ms < start_ms:
+        return False
+    return end_ms is None or ts_ms <= end_ms
+
+
+def _read_segment(path: Path) -> Iterator[pa.RecordBatch]:
+    """Record batches of one segment; stops at a torn tail (crash mid-write)."""
+    try:
+        source = pa.memory_map(str(path))
+        reader = pa.ipc.open_stream(source)
+    except (OSError, pa.ArrowInvalid) as e:
+        logger.warning("Skipping unreadable journal segment %s: %s", path, e)
+        return
+    while True:
+        try:
+            batch = reader.read_next_batch()
+        except StopIteration:
+            return
+        except pa.ArrowInvalid as e:
+            logger.warning("Journal segment %s ends in a partial batch: %s", path, e)
+            return
+        yield batch
+
+
+def export_jsonl(
+    source: Path,
+    dest: Path,
+    event_types: Collection[str] | None = None,
+    start: datetime | int | None = None,
+    end: datetime | int | None = None,
+) -> int:
+    """Write (filtered) events of any journal to a JSONL file; returns the event count."""
+    reader = JournalReader(source)
+    count = 0
+    dest.parent.mkdir(parents=True, exist_ok=True)
+    with open(dest, "w", encoding="utf-8", newline="\n") as f:
+        for event in reader.iter_events(event_types=event_types, start=start, end=end):
+            f.write(json.dumps(event, default=str, separators=_JSON_SEPARATORS) + "\n")
+            count += 1
+    return count
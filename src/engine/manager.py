@@ -609,6 +609,10 @@ class EngineManager:
                 exchange = LiveExchange(play, config)
                 state_store = FileStateStore()
 
+                # Warm restart: next start of this play restores its state
+                from .adapters.checkpoint import default_checkpoint_path
+                data_provider.enable_checkpoints(default_checkpoint_path(f"live_{play.name}_{symbol}"))
+
                 # Create engine
                 engine = PlayEngine(
                     play=play,
@@ -35,6 +35,7 @@ import uuid
 from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
+from time import perf_counter_ns
 from typing import TYPE_CHECKING, Any, Callable, Literal, cast
 
 from .interfaces import (
@@ -52,6 +53,7 @@ from .sizing import SizingModel, SizingConfig
 
 from ..utils.logger import get_module_logger
 from ..utils.debug import is_debug_enabled, is_verbose_enabled, verbose_log, debug_log, debug_signal, debug_trade, debug_snapshot
+from ..utils.profiler import active_profiler
 from .timeframe import TFIndexManager
 
 
@@ -85,6 +87,9 @@ if TYPE_CHECKING:
     from ..backtest.execution_validation import PlaySignalEvaluator, EvaluationResult, SignalDecision
     from ..backtest.runtime.snapshot_view import RuntimeSnapshotView
     from ..backtest.runtime.feed_store import FeedStore
+    from ..backtest.runtime.alignment import AlignmentTable
+    from ..backtest.rules.prescreen import EntryPrescreen
+    from .adapters.backtest import BacktestExchange
     from ..backtest.simulated_risk_manager import StopLiqValidationResult
     from ..core.risk_manager import Signal
 
@@ -126,6 +131,14 @@ class PlayEngineConfig:
     persist_state: bool = False
     state_save_interval: int = 100  # Save every N bars
 
+    # Backtest: skip rule evaluation on flat bars where no entry case can match
+    # (vectorized candidate mask, see src/backtest/rules/prescreen.py)
+    entry_prescreen: bool = True
+
+    # Live: prepare validated entry orders on forming exec-candle updates
+    # (LiveRunner pre-arm stage, see src/core/prearm.py). Env: TRADE_PREARM=1
+    prearm_orders: bool = False
+
     def __post_init__(self) -> None:
         """Load defaults from config/defaults.yml if not specified."""
         from src.config.constants import DEFAULTS
@@ -226,6 +239,10 @@ class PlayEngine:
         # Manages indices for all 3 TFs relative to exec role
         self._tf_index_manager: TFIndexManager | None = None
 
+        # Backtest: exec_idx -> TF / 1m / funding indices, built once per run
+        # (src/backtest/runtime/alignment.py)
+        self._alignment: "AlignmentTable | None" = None
+
         # 1m quote feed for action model (set by parity test or runner)
         # This enables granular 1m evaluation within exec_tf bars
         self._quote_feed: FeedStore | None = None  # FeedStore for 1m OHLCV
@@ -267,6 +284,10 @@ class PlayEngine:
         # Limit order expiry tracking: list of (order_id, submit_bar_index)
         self._pending_limit_orders: list[tuple[str, int]] = []
 
+        # Entry pre-screen (backtest only, set by build_entry_prescreen)
+        self._entry_prescreen: "EntryPrescreen | None" = None
+        self._prescreen_skipped_bars: int = 0
+
         # Anchored VWAP post-structure update cache
         # These indicators depend on swing structure versions and must be updated
         # AFTER structures, not during batch pre-computation.
@@ -385,6 +406,10 @@ class PlayEngine:
         self._current_bar_index = bar_index
         self._bars_processed += 1
 
+        # Per-phase timing (None unless profiling, see src/utils/profiler.py)
+        prof = active_profiler()
+        t = perf_counter_ns() if prof is not None else 0
+
         # Refresh equity from exchange for accurate sizing (live only)
         if not self.is_backtest:
             try:
@@ -408,13 +433,18 @@ class PlayEngine:
                 C=candle.close, V=candle.volume,
             )
 
-        # Update high_tf/med_tf indices (forward-fill logic)
+        if prof is not None:
+            t = prof.lap("engine.candle", t)
+
+        # Update high_tf/med_tf indices (forward-fill logic, closes high/med TF structures)
         self._update_high_tf_med_tf_indices(candle)
 
         # 1. Update incremental state (structures)
         # Skip when LiveDataProvider owns structure updates (on_candle_close handles it)
         if self._incremental_state is not None and not self._live_structures_external:
             self._update_incremental_state(bar_index, candle)
+        if prof is not None:
+            t = prof.lap("engine.structures", t)
 
         # 2. Check readiness (warmup complete, data available)
         if not self._is_ready():
@@ -455,6 +485,18 @@ class PlayEngine:
                     )
                     self._drawdown_halted = True
                 return None
+        if prof is not None:
+            t = prof.lap("engine.exchange", t)
+
+        # 3d. Entry pre-screen: flat, no working orders and no entry case can
+        #     match on this bar -> evaluation cannot produce a signal
+        if self._entry_prescreen is not None and self._prescreen_skips(bar_index):
+            self._prescreen_skipped_bars += 1
+            if prof is not None:
+                prof.lap("engine.prescreen", t)
+            return None
+        if prof is not None:
+            t = prof.lap("engine.prescreen", t)
 
         # 4. Get current position
         position = self.exchange.get_position(self.symbol)
@@ -468,6 +510,8 @@ class PlayEngine:
 
         # 5. Evaluate rules and generate signal
         signal = self._evaluate_rules(bar_index, candle, position)
+        if prof is not None:
+            prof.lap("engine.rules", t)
 
         if signal:
             self._total_signals += 1
@@ -597,7 +641,11 @@ class PlayEngine:
                     )
 
         # Apply risk sizing using unified SizingModel
+        prof = active_profiler()
+        t = perf_counter_ns() if prof is not None else 0
         sized_usdt = self._size_position(signal)
+        if prof is not None:
+            prof.lap("execute.sizing", t)
 
         # Validate minimum size
         if sized_usdt < self.config.min_trade_usdt:
@@ -644,7 +692,10 @@ class PlayEngine:
         )
 
         # Submit to exchange
+        t = perf_counter_ns() if prof is not None else 0
         result = self.exchange.submit_order(order)
+        if prof is not None:
+            prof.lap("execute.submit", t)
 
         if result.success:
             # Only count market orders as trades; limit orders are counted when filled
@@ -678,6 +729,54 @@ class PlayEngine:
 
         return result
 
+    def build_entry_orders(self, reference_price: float) -> list[Order]:
+        """
+        Entry orders execute_signal() would size if an entry fired at reference_price.
+
+        Live pre-arm stage only (src/core/prearm.py): one market or limit
+        order per direction the position policy allows, sized from current
+        equity. Empty while a position or working order exists. SL/TP are
+        left unset; they come from the close-bar signal.
+        """
+        from ..core.risk_manager import Signal
+
+        if self.is_backtest or self.exchange.get_position(self.symbol) is not None:
+            return []
+        if self.exchange.get_pending_orders(self.symbol):
+            return []
+
+        policy = self.play.position_policy
+        directions = [d for d, ok in (("LONG", policy.allows_long()), ("SHORT", policy.allows_short())) if ok]
+        orders: list[Order] = []
+        for direction in directions:
+            probe = Signal(
+                symbol=self.symbol,
+                direction=direction,
+                size_usdt=0.0,
+                strategy=self.play.name or "",
+                metadata={"entry_price": reference_price},
+                reference_price=reference_price,
+            )
+            sized_usdt = self._size_position(probe)
+            if sized_usdt < self.config.min_trade_usdt:
+                continue
+            limit_price: float | None = None
+            if self.play.entry_order_type == "LIMIT":
+                offset = self.play.limit_offset_pct / 100.0
+                limit_price = reference_price * (1.0 - offset if direction == "LONG" else 1.0 + offset)
+            orders.append(Order(
+                symbol=self.symbol,
+                side=cast(Literal["LONG", "SHORT", "FLAT"], direction),
+                size_usdt=sized_usdt,
+                order_type=cast(Literal["MARKET", "LIMIT", "STOP_MARKET", "STOP_LIMIT"], self.play.entry_order_type),
+                limit_price=limit_price,
+                time_in_force=self.play.time_in_force,
+                tp_order_type=self.play.tp_order_type,
+                sl_order_type=self.play.sl_order_type,
+                metadata={"signal": probe},
+            ))
+        return orders
+
     def get_state(self) -> EngineState:
         """
         Get current engine state for persistence.
@@ -745,6 +844,66 @@ class PlayEngine:
         self.logger.debug("Warmup complete at bar %s", self._current_bar_index)
         return True
 
+    def build_entry_prescreen(self) -> "EntryPrescreen | None":
+        """
+        Compile the Play's entry cases into a whole-run candidate mask.
+
+        Called by BacktestRunner before the bar loop. The mask is only
+        installed when it excludes at least one bar; verbose/debug runs and
+        audit snapshot callbacks keep full per-bar evaluation.
+
+        Returns:
+            EntryPrescreen statistics, or None if the pre-screen is not applicable
+        """
+        from .adapters.backtest import BacktestDataProvider, BacktestExchange
+        from ..backtest.rules.prescreen import compile_entry_prescreen
+
+        self._entry_prescreen = None
+        if not self.is_backtest or not self.config.entry_prescreen or not self.play.actions:
+            return None
+        if self._on_snapshot is not None or is_verbose_enabled() or is_debug_enabled():
+            return None
+        if not isinstance(self._data_provider, BacktestDataProvider) or not isinstance(self._exchange, BacktestExchange):
+            return None
+        if self._data_provider._feed_store is None or self._data_provider.num_bars == 0:
+            return None
+
+        probe = self._build_snapshot_view(0, self.data.get_candle(0))
+        if probe is None:
+            return None
+
+        policy = self.play.position_policy
+        try:
+            prescreen = compile_entry_prescreen(
+                self.play.actions,
+                self.play.setups,
+                probe.exec_aligned_column,
+                probe.exec_ctx.feed.length,
+                allows_long=policy.allows_long(),
+                allows_short=policy.allows_short(),
+            )
+        except (ValueError, KeyError, TypeError) as e:
+            self.logger.warning("Entry pre-screen disabled: %s", e)
+            return None
+
+        if prescreen.screens_anything:
+            self._entry_prescreen = prescreen
+        self.logger.debug(
+            "Entry pre-screen: %d/%d candidate bars (%d/%d entry cases exact)",
+            prescreen.candidate_bars, prescreen.total_bars,
+            prescreen.exact_cases, prescreen.entry_cases,
+        )
+        return prescreen
+
+    def _prescreen_skips(self, bar_index: int) -> bool:
+        """True if rule evaluation can be skipped on this bar (see build_entry_prescreen)."""
+        assert self._entry_prescreen is not None
+        mask = self._entry_prescreen.mask
+        if bar_index >= mask.shape[0] or mask[bar_index]:
+            return False
+        exchange = cast("BacktestExchange", self._exchange)
+        return not exchange.has_position and not exchange.has_open_orders
+
     def _update_high_tf_med_tf_indices(self, candle: Candle) -> None:
         """
         Update high_tf/med_tf forward-fill indices based on current candle.
@@ -776,6 +935,7 @@ class PlayEngine:
                     med_tf_feed=self._med_tf_feed,
                     high_tf_feed=self._high_tf_feed,
                     exec_role=self._tf_mapping.get("exec", "low_tf"),
+                    alignment=self.alignment_table,
                 )
 
             # Update indices via shared manager (single source of truth)
@@ -794,6 +954,27 @@ class PlayEngine:
             # Live mode: use buffer-length-based index tracking
             self._update_live_tf_indices(candle)
 
+    @property
+    def alignment_table(self) -> "AlignmentTable | None":
+        """
+        Backtest alignment table for the current feeds (built on first use).
+
+        None in live mode or before the exec FeedStore is wired.
+        """
+        if self._alignment is None and self.is_backtest:
+            exec_feed = getattr(self._data_provider, '_feed_store', None)
+            if exec_feed is None:
+                return None
+            from ..backtest.runtime.alignment import build_alignment_table
+            self._alignment = build_alignment_table(
+                exec_feed,
+                low_tf_feed=exec_feed,
+                med_tf_feed=self._med_tf_feed,
+                high_tf_feed=self._high_tf_feed,
+                quote_feed=self._quote_feed,
+            )
+        return self._alignment
+
     def _update_live_tf_indices(self, candle: Candle) -> None:
         """
         Update TF indices for live mode using buffer lengths.
@@ -1589,6 +1770,7 @@ class PlayEngine:
             quote_feed=self._quote_feed,
             exec_tf=self.timeframe,
             logger=self.logger,
+            alignment=self.alignment_table,
         )
 
         # Create context for this evaluation
@@ -1636,6 +1818,8 @@ class PlayEngine:
                 return None
 
         # Build snapshot view for evaluation and persist for trailing stop ATR access
+        prof = active_profiler()
+        t = perf_counter_ns() if prof is not None else 0
         snapshot = self._build_snapshot_view(bar_index, candle)
         if snapshot is None:
             return None
@@ -1644,6 +1828,8 @@ class PlayEngine:
         # Call audit callback if registered
         if self._on_snapshot is not None:
             self._on_snapshot(snapshot, bar_index, self._current_high_tf_idx, self._current_med_tf_idx)
+        if prof is not None:
+            t = prof.lap("engine.rules.snapshot", t)
 
         # Determine position state
         has_position = position is not None
@@ -1658,6 +1844,8 @@ class PlayEngine:
                 verbose_log(line, bar_idx=bar_index)
         else:
             result = self._signal_evaluator.evaluate(snapshot, has_position, position_side)
+        if prof is not None:
+            prof.lap("engine.rules.eval", t)
 
         if is_debug_enabled() and not self.is_backtest:
             self.logger.debug(
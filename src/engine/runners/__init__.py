@@ -3,6 +3,7 @@ Runners package for PlayEngine.
 
 Runners drive the PlayEngine in different modes:
 - BacktestRunner: Loop over historical bars
+- PortfolioBacktestRunner: Many Plays on one merged clock (portfolio ledger)
 - LiveRunner: WebSocket event loop
 
 Shadow mode uses the daemon at src/shadow/ (ShadowEngine + ShadowOrchestrator).
@@ -26,6 +27,12 @@ Usage:
 """
 
 from .backtest_runner import BacktestRunner, BacktestResult
+from .portfolio_runner import (
+    PortfolioBacktestRunner,
+    PortfolioBacktestResult,
+    PortfolioLedger,
+    PortfolioLimits,
+)
 from .live_runner import LiveRunner, LiveRunnerStats, RunnerState
 from .parallel import (
     run_backtests_parallel,
@@ -36,6 +43,11 @@ __all__ = [
     # Backtest
     "BacktestRunner",
     "BacktestResult",
+    # Portfolio
+    "PortfolioBacktestRunner",
+    "PortfolioBacktestResult",
+    "PortfolioLedger",
+    "PortfolioLimits",
     # Parallel execution
     "run_backtests_parallel",
     "ParallelBacktestResult",
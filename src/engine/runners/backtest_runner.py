@@ -40,11 +40,14 @@ Usage:
     result = runner.run()
 """
 
+from array import array
 from dataclasses import dataclass, field
 from datetime import datetime
+from time import perf_counter_ns
 from typing import TYPE_CHECKING, Any
 
 from ...utils.datetime_utils import utc_now
+from ...utils.profiler import active_profiler, profile_span
 from ..adapters.backtest import BacktestDataProvider, BacktestExchange
 from ..play_engine import PlayEngine
 
@@ -54,9 +57,13 @@ from ...backtest.runtime.timeframe import tf_minutes
 from ...backtest.types import EquityPoint, StopReason
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+
     from ...backtest.play import Play
+    from ...backtest.runtime.feed_paging import FeedPager
     from ...backtest.runtime.feed_store import FeedStore
     from ...backtest.sim.exchange import SimulatedExchange
+    from ...core.risk_manager import Signal
 
 
 @dataclass
@@ -112,6 +119,61 @@ class BacktestResult:
     metadata: dict[str, Any] = field(default_factory=dict)
 
 
+class _EquityColumns:
+    """
+    Per-bar equity points recorded as columns (no dict per bar).
+
+    Timestamps are not stored: every point is the close of its exec bar,
+    so to_dicts() reads them back from the FeedStore when the run ends.
+    """
+
+    __slots__ = ("bar_idx", "equity")
+
+    def __init__(self) -> None:
+        self.bar_idx = array("q")
+        self.equity = array("d")
+
+    def __len__(self) -> int:
+        return len(self.bar_idx)
+
+    def append(self, bar_idx: int, equity: float) -> None:
+        self.bar_idx.append(bar_idx)
+        self.equity.append(equity)
+
+    def to_dicts(self, ts_close_at: "Callable[[int], datetime]") -> list[dict[str, Any]]:
+        """Materialize the BacktestResult.equity_curve rows."""
+        return [
+            {"bar_idx": idx, "timestamp": ts_close_at(idx), "equity": equity}
+            for idx, equity in zip(self.bar_idx, self.equity)
+        ]
+
+
+@dataclass
+class _RunState:
+    """Loop state carried between begin(), step() and finish()."""
+
+    started_at: datetime
+    start_idx: int
+    end_idx: int
+    start_ts: datetime
+    end_ts: datetime
+    prescreen: Any
+    initial_equity: float
+    last_bar_idx: int
+    equity_curve: _EquityColumns = field(default_factory=_EquityColumns)
+    bars_in_position: int = 0
+    peak_equity: float = 0.0
+    max_drawdown_pct: float = 0.0
+    trailing_config: dict | None = None
+    break_even_config: dict | None = None
+    atr_feature_id: str | None = None
+    prev_atr_value: float | None = None
+    stopped_early: bool = False
+    stop_reason: str | None = None
+    stop_classification: str | None = None
+    stop_reason_detail: str | None = None
+
+
 class BacktestRunner:
     """
     Runner that executes PlayEngine through historical data.
@@ -133,6 +195,8 @@ class BacktestRunner:
         feed_store: "FeedStore | None" = None,
         sim_exchange: "SimulatedExchange | None" = None,
         sim_start_idx: int | None = None,
+        signal_gate: "Callable[[Signal], bool] | None" = None,
+        feed_pager: "FeedPager | None" = None,
     ):
         """
         Initialize backtest runner.
@@ -142,11 +206,20 @@ class BacktestRunner:
             feed_store: Optional pre-built FeedStore (for testing)
             sim_exchange: Optional pre-built SimulatedExchange (for testing)
             sim_start_idx: Optional simulation start index (skips warmup period)
+            signal_gate: Optional check called before each signal is executed;
+                returning False drops the signal (portfolio-level risk vetoes)
+            feed_pager: Optional FeedPager of streamed (memory-mapped) feeds,
+                advanced every step to bound resident memory
         """
         self._engine = engine
         self._pre_built_feed_store = feed_store
         self._pre_built_sim_exchange = sim_exchange
         self._sim_start_idx_override = sim_start_idx
+        self.signal_gate = signal_gate
+        self._feed_pager = feed_pager
+        self._state: _RunState | None = None
+        # (bar_idx, sim Bar) of the last step, reused as the next prev_bar
+        self._last_sim_bar: tuple[int, Any] = (-1, None)
 
         # Validate adapters are backtest type
         if not isinstance(engine._data_provider, BacktestDataProvider):
@@ -163,6 +236,16 @@ class BacktestRunner:
         self._data_provider: BacktestDataProvider = engine._data_provider
         self._exchange_adapter: BacktestExchange = engine._exchange
 
+    @property
+    def data_provider(self) -> BacktestDataProvider:
+        """The engine's backtest data provider."""
+        return self._data_provider
+
+    @property
+    def exchange_adapter(self) -> BacktestExchange:
+        """The engine's backtest exchange adapter."""
+        return self._exchange_adapter
+
     def run(
         self,
         start_ts: datetime | None = None,
@@ -178,6 +261,30 @@ class BacktestRunner:
         Returns:
             BacktestResult with metrics and trades
         """
+        with profile_span("runner.begin"):
+            state = self.begin(start_ts, end_ts)
+        step = self.step
+        for bar_idx in range(state.start_idx, state.end_idx):
+            if not step(bar_idx):
+                break
+        with profile_span("runner.finish"):
+            return self.finish()
+
+    def begin(
+        self,
+        start_ts: datetime | None = None,
+        end_ts: datetime | None = None,
+    ) -> "_RunState":
+        """
+        Prepare a run without stepping any bars.
+
+        run() is begin() + step() over [start_idx, end_idx) + finish().
+        Callers that drive several runners from one clock (portfolio
+        backtests) use the three calls directly.
+
+        Returns:
+            Run state with the bar range to step
+        """
         started_at = utc_now()
 
         # Initialize data and exchange
@@ -191,136 +298,168 @@ class BacktestRunner:
         else:
             start_idx = self._data_provider.warmup_bars
         end_idx = num_bars
-        warmup_bars = start_idx  # For result metadata
 
         # Get timing from data
         first_candle = self._data_provider.get_candle(start_idx)
         last_candle = self._data_provider.get_candle(end_idx - 1)
-        actual_start_ts = start_ts or first_candle.ts_open
-        actual_end_ts = end_ts or last_candle.ts_close
-
-        # Track equity curve
-        equity_curve = []
-        initial_equity = self._exchange_adapter.get_equity()
-
-        # Track time in market
-        bars_in_position = 0
-
-        # Track peak equity for max drawdown check
-        peak_equity = initial_equity
-        max_drawdown_pct = self._engine._config.max_drawdown_pct if hasattr(self._engine._config, 'max_drawdown_pct') else 0.0
 
-        # Stop tracking
-        stopped_early = False
-        stop_reason = None
-        stop_classification = None
-        stop_reason_detail = None
+        state = _RunState(
+            started_at=started_at,
+            start_idx=start_idx,
+            end_idx=end_idx,
+            start_ts=start_ts or first_candle.ts_open,
+            end_ts=end_ts or last_candle.ts_close,
+            # Entry pre-screen: whole-run candidate mask so flat bars where no
+            # entry case can match skip snapshot building and rule evaluation
+            prescreen=self._engine.build_entry_prescreen(),
+            initial_equity=self._exchange_adapter.get_equity(),
+            last_bar_idx=start_idx,
+        )
+        state.peak_equity = state.initial_equity
+        state.max_drawdown_pct = self._engine._config.max_drawdown_pct if hasattr(self._engine._config, 'max_drawdown_pct') else 0.0
 
         # Extract trailing/BE config from Play's risk model
-        trailing_config = None
-        break_even_config = None
-        atr_feature_id = None
-        prev_atr_value = None
-
         play = self._engine._play
         if play.risk_model is not None:
             if play.risk_model.trailing_config is not None:
                 tc = play.risk_model.trailing_config
-                trailing_config = {
+                state.trailing_config = {
                     "atr_multiplier": tc.atr_multiplier,
                     "trail_pct": tc.trail_pct,
                     "activation_pct": tc.activation_pct,
                 }
-                atr_feature_id = tc.atr_feature_id
+                state.atr_feature_id = tc.atr_feature_id
 
             if play.risk_model.break_even_config is not None:
                 bc = play.risk_model.break_even_config
-                break_even_config = {
+                state.break_even_config = {
                     "activation_pct": bc.activation_pct,
                     "offset_pct": bc.offset_pct,
                 }
 
-        # Main bar loop
-        # Execution model:
-        # 1. Orders submitted at bar N-1 close fill at bar N open
-        # 2. Strategy evaluates at bar N close -> generates signal
-        # 3. Signal submits order (to fill at bar N+1 open)
-        bar_idx = start_idx
-        for bar_idx in range(start_idx, end_idx):
-            # Update current bar index in data provider
-            self._data_provider.current_bar_index = bar_idx
-
-            # Get candle for this bar
-            candle = self._data_provider.get_candle(bar_idx)
-
-            # Set bar context on exchange BEFORE processing
-            self._set_bar_context(bar_idx)
-
-            # 1. Process fills from previous bar's orders (fill at THIS bar's open)
-            # Also updates trailing/BE stops using previous bar's ATR
-            _liquidated = self._process_bar_fills(
-                bar_idx,
-                trailing_config=trailing_config,
-                break_even_config=break_even_config,
-                atr_value=prev_atr_value,
+        self._state = state
+        return state
+
+    def step(self, bar_idx: int) -> bool:
+        """
+        Process one exec bar.
+
+        Execution model:
+        1. Orders submitted at bar N-1 close fill at bar N open
+        2. Strategy evaluates at bar N close -> generates signal
+        3. Signal submits order (to fill at bar N+1 open)
+
+        Args:
+            bar_idx: Exec bar index (bars must be stepped in order)
+
+        Returns:
+            False once the run has stopped (liquidation or max drawdown)
+        """
+        state = self._state
+        if state is None:
+            raise RuntimeError("BacktestRunner.step() called before begin()")
+        state.last_bar_idx = bar_idx
+        if self._feed_pager is not None:
+            self._feed_pager.advance(bar_idx)
+
+        # Per-phase timing (None unless profiling, see src/utils/profiler.py)
+        prof = active_profiler()
+        t = perf_counter_ns() if prof is not None else 0
+
+        # Update current bar index in data provider
+        self._data_provider.current_bar_index = bar_idx
+
+        # Get candle for this bar
+        candle = self._data_provider.get_candle(bar_idx)
+
+        # Set bar context on exchange BEFORE processing
+        self._set_bar_context(bar_idx)
+        if prof is not None:
+            t = prof.lap("runner.context", t)
+
+        # 1. Process fills from previous bar's orders (fill at THIS bar's open)
+        # Also updates trailing/BE stops using previous bar's ATR
+        _liquidated = self._process_bar_fills(
+            bar_idx,
+            trailing_config=state.trailing_config,
+            break_even_config=state.break_even_config,
+            atr_value=state.prev_atr_value,
+        )
+        if prof is not None:
+            t = prof.lap("runner.fills", t)
+
+        if _liquidated:
+            state.stopped_early = True
+            state.stop_reason = "liquidated"
+            state.stop_classification = StopReason.LIQUIDATED.value
+            state.stop_reason_detail = (
+                f"Liquidation at bar {bar_idx} ({candle.ts_close}): "
+                f"equity fell to or below maintenance margin"
             )
+            self._engine.logger.warning(state.stop_reason_detail)
+            return False
 
-            if _liquidated:
-                stopped_early = True
-                stop_reason = "liquidated"
-                stop_classification = StopReason.LIQUIDATED.value
-                stop_reason_detail = (
-                    f"Liquidation at bar {bar_idx} ({candle.ts_close}): "
-                    f"equity fell to or below maintenance margin"
+        # 2. Process bar through engine (signal generation at bar close)
+        signal = self._engine.process_bar(bar_idx)
+        if prof is not None:
+            t = prof.lap("engine", t)
+
+        # 2b. Extract ATR value for next iteration (if trailing is configured)
+        if state.atr_feature_id and self._engine._snapshot_view is not None:
+            try:
+                state.prev_atr_value = self._engine._snapshot_view.get_feature_value(state.atr_feature_id)
+            except (KeyError, AttributeError):
+                state.prev_atr_value = None
+
+        # 3. Execute signal if any (submits order for NEXT bar's fill)
+        if signal is not None and (self.signal_gate is None or self.signal_gate(signal)):
+            self._engine.execute_signal(signal)
+            if prof is not None:
+                t = prof.lap("execute", t)
+
+        # Track time in market (check position after fills and signals)
+        if self._exchange_adapter.has_position:
+            state.bars_in_position += 1
+
+        # Record equity
+        equity = self._exchange_adapter.get_equity()
+        state.equity_curve.append(bar_idx, equity)
+
+        # Update peak equity and check max drawdown
+        state.peak_equity = max(state.peak_equity, equity)
+        max_drawdown_pct = state.max_drawdown_pct
+        if prof is not None:
+            prof.lap("runner.record", t)
+        if max_drawdown_pct > 0 and state.peak_equity > 0:
+            current_dd_pct = (state.peak_equity - equity) / state.peak_equity * 100
+            if current_dd_pct >= max_drawdown_pct:
+                # Max drawdown hit - stop backtest
+                state.stopped_early = True
+                state.stop_reason = "max_drawdown"
+                state.stop_classification = StopReason.MAX_DRAWDOWN_HIT.value
+                state.stop_reason_detail = (
+                    f"Max drawdown hit: {current_dd_pct:.2f}% >= {max_drawdown_pct:.2f}% "
+                    f"(equity ${equity:.2f}, peak ${state.peak_equity:.2f})"
                 )
-                self._engine.logger.warning(stop_reason_detail)
-                break
+                self._engine.logger.warning(state.stop_reason_detail)
+                return False
+        return True
 
-            # 2. Process bar through engine (signal generation at bar close)
-            signal = self._engine.process_bar(bar_idx)
+    def finish(self) -> BacktestResult:
+        """
+        Close any open position and build the result for the stepped bars.
 
-            # 2b. Extract ATR value for next iteration (if trailing is configured)
-            if atr_feature_id and self._engine._snapshot_view is not None:
-                try:
-                    prev_atr_value = self._engine._snapshot_view.get_feature_value(atr_feature_id)
-                except (KeyError, AttributeError):
-                    prev_atr_value = None
-
-            # 3. Execute signal if any (submits order for NEXT bar's fill)
-            if signal is not None:
-                self._engine.execute_signal(signal)
-
-            # Track time in market (check position after fills and signals)
-            if self._exchange_adapter.has_position:
-                bars_in_position += 1
-
-            # Record equity
-            equity = self._exchange_adapter.get_equity()
-            equity_curve.append({
-                "bar_idx": bar_idx,
-                "timestamp": candle.ts_close,
-                "equity": equity,
-            })
-
-            # Update peak equity and check max drawdown
-            peak_equity = max(peak_equity, equity)
-            if max_drawdown_pct > 0 and peak_equity > 0:
-                current_dd_pct = (peak_equity - equity) / peak_equity * 100
-                if current_dd_pct >= max_drawdown_pct:
-                    # Max drawdown hit - stop backtest
-                    stopped_early = True
-                    stop_reason = "max_drawdown"
-                    stop_classification = StopReason.MAX_DRAWDOWN_HIT.value
-                    stop_reason_detail = (
-                        f"Max drawdown hit: {current_dd_pct:.2f}% >= {max_drawdown_pct:.2f}% "
-                        f"(equity ${equity:.2f}, peak ${peak_equity:.2f})"
-                    )
-                    self._engine.logger.warning(stop_reason_detail)
-                    break
+        Returns:
+            BacktestResult with metrics and trades
+        """
+        state = self._state
+        if state is None:
+            raise RuntimeError("BacktestRunner.finish() called before begin()")
+        start_idx = state.start_idx
 
         # Close any remaining position (at last processed bar or stop bar)
-        last_bar_idx = bar_idx if stopped_early else end_idx - 1
-        close_reason = stop_reason if stopped_early else None
+        last_bar_idx = state.last_bar_idx if state.stopped_early else state.end_idx - 1
+        close_reason = state.stop_reason if state.stopped_early else None
         self._close_remaining_position(last_bar_idx, close_reason)
 
         # Update equity curve after force close so equity_curve[-1] includes
@@ -329,12 +468,10 @@ class BacktestRunner:
         # but NOT the exit fee/slippage, causing sum(trades.net_pnl) to
         # diverge from (final_equity - initial_equity) by ~$7 per run.
         post_close_equity = self._exchange_adapter.get_equity()
-        last_candle = self._data_provider.get_candle(last_bar_idx)
-        equity_curve.append({
-            "bar_idx": last_bar_idx,
-            "timestamp": last_candle.ts_close,
-            "equity": post_close_equity,
-        })
+        state.equity_curve.append(last_bar_idx, post_close_equity)
+        feed_store = self._data_provider._feed_store
+        assert feed_store is not None
+        equity_curve = state.equity_curve.to_dicts(feed_store.get_ts_close_datetime)
 
         # Build result
         finished_at = utc_now()
@@ -347,27 +484,35 @@ class BacktestRunner:
         if self._exchange_adapter._sim_exchange is not None:
             exchange_metrics_dict = self._exchange_adapter._sim_exchange.exchange_metrics.to_dict()
 
-        return self._build_result(
+        result = self._build_result(
             play_id=self._engine._play.name or "unknown",
             symbol=self._data_provider.symbol,
             timeframe=self._data_provider.timeframe,
-            start_ts=actual_start_ts,
-            end_ts=actual_end_ts,
-            started_at=started_at,
+            start_ts=state.start_ts,
+            end_ts=state.end_ts,
+            started_at=state.started_at,
             finished_at=finished_at,
-            initial_equity=initial_equity,
+            initial_equity=state.initial_equity,
             final_equity=final_equity,
             trades=trades,
             equity_curve=equity_curve,
             bars_processed=actual_bars_processed,
-            warmup_bars=warmup_bars,
-            bars_in_position=bars_in_position,
-            stopped_early=stopped_early,
-            stop_reason=stop_reason,
-            stop_classification=stop_classification,
-            stop_reason_detail=stop_reason_detail,
+            warmup_bars=start_idx,
+            bars_in_position=state.bars_in_position,
+            stopped_early=state.stopped_early,
+            stop_reason=state.stop_reason,
+            stop_classification=state.stop_classification,
+            stop_reason_detail=state.stop_reason_detail,
             exchange_metrics=exchange_metrics_dict,
         )
+        prescreen = state.prescreen
+        if prescreen is not None:
+            result.metadata["entry_prescreen"] = {
+                **prescreen.to_dict(),
+                "active": self._engine._entry_prescreen is not None,
+                "skipped_bars": self._engine._prescreen_skipped_bars,
+            }
+        return result
 
     def _setup(self) -> None:
         """
@@ -473,7 +618,11 @@ class BacktestRunner:
         if sim_exchange is None:
             return False
 
-        # Build Bar for SimulatedExchange
+        prof = active_profiler()
+        t = perf_counter_ns() if prof is not None else 0
+
+        # Build Bar for SimulatedExchange; the previous step's Bar (frozen)
+        # is reused as prev_bar instead of being rebuilt
         from ...backtest.sim.types import Bar
 
         candle = self._data_provider.get_candle(bar_idx)
@@ -492,18 +641,23 @@ class BacktestRunner:
         # Get previous bar if available
         prev_bar = None
         if bar_idx > 0:
-            prev_candle = self._data_provider.get_candle(bar_idx - 1)
-            prev_bar = Bar(
-                symbol=self._data_provider.symbol,
-                tf=self._data_provider.timeframe,
-                ts_open=prev_candle.ts_open,
-                ts_close=prev_candle.ts_close,
-                open=prev_candle.open,
-                high=prev_candle.high,
-                low=prev_candle.low,
-                close=prev_candle.close,
-                volume=prev_candle.volume,
-            )
+            cached_idx, cached_bar = self._last_sim_bar
+            if cached_idx == bar_idx - 1:
+                prev_bar = cached_bar
+            else:
+                prev_candle = self._data_provider.get_candle(bar_idx - 1)
+                prev_bar = Bar(
+                    symbol=self._data_provider.symbol,
+                    tf=self._data_provider.timeframe,
+                    ts_open=prev_candle.ts_open,
+                    ts_close=prev_candle.ts_close,
+                    open=prev_candle.open,
+                    high=prev_candle.high,
+                    low=prev_candle.low,
+                    close=prev_candle.close,
+                    volume=prev_candle.volume,
+                )
+        self._last_sim_bar = (bar_idx, bar)
 
         # Get 1m quote feed from engine for granular entry fills
         quote_feed = self._engine._quote_feed
@@ -511,16 +665,23 @@ class BacktestRunner:
         if quote_feed is not None and quote_feed.length > 0:
             exec_tf_minutes = tf_minutes(self._data_provider.timeframe)
             if exec_tf_minutes > 1:
+                alignment = self._engine.alignment_table
                 try:
-                    exec_1m_range = quote_feed.get_1m_indices_for_exec(
-                        bar_idx, exec_tf_minutes,
-                        exec_ts_open=candle.ts_open,
-                        exec_ts_close=candle.ts_close,
-                    )
+                    if alignment is not None and alignment.quote_start is not None:
+                        exec_1m_range = alignment.quote_range(bar_idx)
+                    else:
+                        exec_1m_range = quote_feed.get_1m_indices_for_exec(
+                            bar_idx, exec_tf_minutes,
+                            exec_ts_open=candle.ts_open,
+                            exec_ts_close=candle.ts_close,
+                        )
                 except (ValueError, IndexError):
                     # Fall back to exec-bar granularity if 1m mapping fails
                     exec_1m_range = None
 
+        if prof is not None:
+            t = prof.lap("runner.fills.bars", t)
+
         # Process bar for fills (with 1m granularity when available)
         # Fill price uses first 1m bar's OPEN within this exec bar (see module docstring)
         # Also updates trailing/BE stops if configured
@@ -533,6 +694,8 @@ class BacktestRunner:
             break_even_config=break_even_config,
             atr_value=atr_value,
         )
+        if prof is not None:
+            t = prof.lap("runner.fills.exchange", t)
 
         # Log fills with actual 1m-based prices
         # NOTE: Logging happens HERE (not in PlayEngine.execute_signal) because:
@@ -562,6 +725,8 @@ class BacktestRunner:
                         exit=fill.price,
                         pnl=fill.pnl if hasattr(fill, "pnl") else None,
                     )
+        if prof is not None:
+            prof.lap("runner.fills.log", t)
 
         return step_result.liquidation_result.liquidated
 
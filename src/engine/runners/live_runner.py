@@ -24,18 +24,21 @@ import queue
 import threading
 import time
 import traceback
+from collections import deque
 from dataclasses import dataclass, field
 from datetime import datetime
 from src.utils.datetime_utils import epoch_ms_to_datetime
 from enum import Enum
 from typing import TYPE_CHECKING, Callable
 
-from ...utils.datetime_utils import utc_now
+from ...utils.datetime_utils import datetime_to_epoch_ms, utc_now
 
 from ..play_engine import PlayEngine
 from src.backtest.runtime.timeframe import tf_minutes
+from ...core.prearm import PREARM_LEAD_FRACTION, PREARM_MAX_LEAD_SECONDS, PrearmBook
 from ...core.safety import check_panic_and_halt, get_panic_state
 
+from ...utils.latency import CandleTrace, LatencyStats, current_trace, tracing
 from ...utils.logger import get_module_logger
 from ...utils.debug import is_debug_enabled
 
@@ -83,6 +86,10 @@ class LiveRunnerStats:
     last_candle_ts: datetime | None = None
     last_signal_ts: datetime | None = None
     errors: list[str] = field(default_factory=list)
+    # Rolling per-hop candle-to-exchange latency (see utils/latency.py)
+    latency: LatencyStats = field(default_factory=LatencyStats)
+    # Pre-armed entry orders (LiveExchange.prearm_book when prearm_orders is on)
+    prearm: PrearmBook | None = None
 
     def __post_init__(self) -> None:
         if self.started_at is not None:
@@ -115,6 +122,8 @@ class LiveRunnerStats:
             "last_candle_ts": self.last_candle_ts.isoformat() if self.last_candle_ts else None,
             "last_signal_ts": self.last_signal_ts.isoformat() if self.last_signal_ts else None,
             "errors": self.errors[-10:],  # Last 10 errors
+            "latency": self.latency.summary(),
+            "prearm": self.prearm.to_dict() if self.prearm is not None else None,
         }
 
 
@@ -141,6 +150,7 @@ class LiveRunner:
         max_reconnect_delay: float = 60.0,
         max_reconnect_attempts: int = 10,
         reconcile_interval: float = 300.0,
+        checkpoint_interval: float = 300.0,
     ):
         """
         Initialize live runner.
@@ -153,6 +163,8 @@ class LiveRunner:
             max_reconnect_delay: Maximum delay between reconnection attempts
             max_reconnect_attempts: Maximum reconnection attempts before giving up
             reconcile_interval: Seconds between position reconciliation checks (default 5 min)
+            checkpoint_interval: Seconds between warm restart checkpoints of the data
+                provider, when it has a checkpoint file (default 5 min)
         """
         self._engine = engine
         self._on_signal = on_signal
@@ -161,6 +173,7 @@ class LiveRunner:
         self._max_reconnect_delay = max_reconnect_delay
         self._max_reconnect_attempts = max_reconnect_attempts
         self._reconcile_interval = reconcile_interval
+        self._checkpoint_interval = checkpoint_interval
 
         # Validate mode
         if engine.is_backtest:
@@ -176,6 +189,7 @@ class LiveRunner:
         self._stop_event = asyncio.Event()
         self._reconnect_attempts = 0
         self._last_reconcile_ts: datetime | None = None
+        self._last_checkpoint_ts: datetime | None = None
 
         # Max drawdown tracking (B5)
         self._peak_equity: float = 0.0
@@ -216,6 +230,21 @@ class LiveRunner:
         self._seen_candles: dict[str, set[float]] = {}
         self._SEEN_CANDLE_MAX_PER_TF = 100
 
+        # Latency traces whose WS execution arrived (appended on the WS
+        # thread, journaled from the process loop)
+        self._acked_traces: deque[CandleTrace] = deque()
+
+        # Pre-arm stage (src/core/prearm.py): latest forming exec kline and
+        # whether a pre-arm request is already waiting in the candle queue
+        self._prearm_book: PrearmBook | None = None
+        if engine.config.prearm_orders:
+            from ..adapters.live import LiveExchange
+            if isinstance(engine._exchange, LiveExchange):
+                self._prearm_book = engine._exchange.prearm_book
+                self._stats.prearm = self._prearm_book
+        self._forming_kline = None
+        self._prearm_queued = False
+
     @property
     def _debug(self) -> bool:
         """Check if debug mode is active (reads global flag, responsive to runtime changes)."""
@@ -391,9 +420,16 @@ class LiveRunner:
         except Exception as e:
             logger.error("Failed to cancel orders on shutdown: %s", e)
 
+        # Final checkpoint while the provider still holds its state
+        await self._maybe_checkpoint(force=True)
+
         # Disconnect from data provider
         await self._disconnect()
 
+        if self._journal:
+            self._flush_trace_acks()
+            self._journal.close()
+
         self._transition_state(RunnerState.STOPPED)
         self._stats.stopped_at = utc_now()
 
@@ -560,6 +596,29 @@ class LiveRunner:
         except Exception as e:
             logger.warning("Periodic reconciliation failed (non-fatal): %s", e)
 
+    async def _maybe_checkpoint(self, force: bool = False) -> None:
+        """
+        Periodic warm restart checkpoint of the LiveDataProvider.
+
+        Written off the event loop; a no-op unless the provider has a
+        checkpoint file (LiveDataProvider.enable_checkpoints) and is warmed up.
+        """
+        from ..adapters.live import LiveDataProvider
+
+        data_provider = self._engine._data_provider
+        if not isinstance(data_provider, LiveDataProvider) or data_provider._checkpoint_path is None:
+            return
+
+        now = utc_now()
+        if not force and self._last_checkpoint_ts is not None:
+            if (now - self._last_checkpoint_ts).total_seconds() < self._checkpoint_interval:
+                return
+        try:
+            if await asyncio.to_thread(data_provider.save_checkpoint) is not None:
+                self._last_checkpoint_ts = now
+        except Exception as e:
+            logger.warning("Checkpoint failed (non-fatal): %s", e)
+
     def _on_kline_update(self, kline_data) -> None:
         """
         Handle kline update from RealtimeState.
@@ -576,10 +635,18 @@ class LiveRunner:
         if kline_tf not in self._play_timeframes:
             return
 
-        # Only process closed candles
+        # Only process closed candles; forming exec updates only request a
+        # pre-arm (coalesced: one queued request, latest update wins)
         if not kline_data.is_closed:
+            if self._prearm_book is not None and kline_tf == self._exec_tf:
+                self._forming_kline = kline_data
+                if not self._prearm_queued:
+                    self._prearm_queued = True
+                    self._candle_queue.put_nowait((None, kline_data.interval, time.monotonic(), None))
             return
 
+        trace = CandleTrace(kline_tf, on_ack=self._on_trace_ack)
+
         # H3: Deduplicate candles (WebSocket reconnect can re-deliver)
         ts_open_epoch = float(kline_data.start_time)
         seen_for_tf = self._seen_candles.setdefault(kline_tf, set())
@@ -620,8 +687,12 @@ class LiveRunner:
                 volume=kline_data.volume,
             )
 
-            # Enqueue (candle, timeframe, enqueue_time) for age tracking
-            self._candle_queue.put_nowait((candle, kline_data.interval, time.monotonic()))
+            trace.ts_close_ms = close_ts_ms
+            trace.close_lag_ms = time.time() * 1000.0 - close_ts_ms
+            trace.mark("convert")
+
+            # Enqueue (candle, timeframe, enqueue_time, trace) for age tracking
+            self._candle_queue.put_nowait((candle, kline_data.interval, time.monotonic(), trace))
             depth = self._candle_queue.qsize()
             if depth > self._QUEUE_WARN_DEPTH:
                 logger.warning(
@@ -678,9 +749,14 @@ class LiveRunner:
                         f"| uptime={hrs}h{mins:02d}m | bars={self._stats.bars_processed} "
                         f"signals={self._stats.signals_generated} | last={last_str}"
                     )
+                    self._flush_trace_acks()
                     continue
 
-                candle, timeframe, enqueue_time = result
+                candle, timeframe, enqueue_time, trace = result
+                if candle is None:
+                    # Pre-arm request from a forming exec candle
+                    await self._run_prearm()
+                    continue
                 queue_age = time.monotonic() - enqueue_time
                 queue_depth = self._candle_queue.qsize()
 
@@ -708,7 +784,7 @@ class LiveRunner:
                     )
 
                 # Process candle
-                await self._process_candle(candle, timeframe)
+                await self._run_traced_candle(candle, timeframe, trace)
 
                 # B5: Check max drawdown after processing
                 await self._check_max_drawdown()
@@ -716,6 +792,9 @@ class LiveRunner:
                 # G5.4: Periodic position reconciliation
                 await self._maybe_reconcile_positions()
 
+                # Warm restart checkpoint of indicator/structure state
+                await self._maybe_checkpoint()
+
             except asyncio.CancelledError:
                 self._transition_state(RunnerState.STOPPING)
                 self._stop_event.set()
@@ -806,6 +885,83 @@ class LiveRunner:
             logger.warning("Error waiting for candle: %s", e)
             return None
 
+    async def _run_traced_candle(self, candle, timeframe: str, trace: CandleTrace) -> None:
+        """Process a dequeued candle with its latency trace installed."""
+        trace.mark("queue")
+        with tracing(trace):
+            try:
+                await self._process_candle(candle, timeframe)
+            finally:
+                # Pre-armed orders are good for one exec close only
+                if self._prearm_book is not None and timeframe.lower() == self._exec_tf:
+                    self._prearm_book.clear()
+                self._finish_trace(trace)
+
+    async def _run_prearm(self) -> None:
+        """
+        Pre-arm entry orders on the latest forming exec candle (src/core/prearm.py).
+
+        Runs on the process loop between closed candles, only in the last
+        PREARM_LEAD_FRACTION of the bar (capped at PREARM_MAX_LEAD_SECONDS),
+        and only when the close would be allowed to trade. Re-arms when the
+        account fingerprint changes or the price drifts; failures just leave
+        nothing armed, so the close takes the normal path.
+        """
+        from ..adapters.live import LiveExchange
+
+        self._prearm_queued = False
+        kline = self._forming_kline
+        book = self._prearm_book
+        exchange = self._engine._exchange
+        if kline is None or book is None or not isinstance(exchange, LiveExchange):
+            return
+        if not self._position_sync_ok or self.is_paused or not self._engine._data_provider.is_ready():
+            return
+        if self._realtime_state is not None and not self._realtime_state.is_websocket_healthy():
+            return
+
+        bar_ms = tf_minutes(self._exec_tf) * 60 * 1000
+        if kline.end_time > 0:
+            close_ts_ms = kline.end_time + 1
+        else:
+            close_ts_ms = kline.start_time + bar_ms
+        lead_ms = min(bar_ms * PREARM_LEAD_FRACTION, PREARM_MAX_LEAD_SECONDS * 1000.0)
+        if close_ts_ms - time.time() * 1000.0 > lead_ms:
+            return
+
+        fingerprint = exchange.prearm_fingerprint()
+        if fingerprint is None:
+            book.clear()
+            return
+        price = kline.close
+        if not book.needs_arm(close_ts_ms, fingerprint, price):
+            return
+
+        try:
+            orders = self._engine.build_entry_orders(price)
+            exposure = max((o.size_usdt for o in orders), default=0.0)
+            safety_ok = bool(orders) and self._run_safety_checks(additional_exposure=exposure, quiet=True)
+            armed = exchange.prearm(orders, price, close_ts_ms, safety_ok, exposure)
+        except Exception as e:
+            book.clear()
+            logger.warning("Pre-arm failed (close will run full checks): %s", e)
+            return
+        if self._debug:
+            logger.debug(
+                f"[DBG] Pre-armed {armed} entr{'y' if armed == 1 else 'ies'} at {price} "
+                f"for close {close_ts_ms} (safety_ok={safety_ok})"
+            )
+
+    def _prearm_safety_ok(self, signal: "Signal", price: float) -> bool:
+        """True if the pre-arm SafetyChecks result covers this entry signal."""
+        from ..adapters.live import LiveExchange
+
+        book = self._prearm_book
+        exchange = self._engine._exchange
+        if book is None or signal.direction == "FLAT" or not isinstance(exchange, LiveExchange):
+            return False
+        return book.safety_ok(exchange.prearm_fingerprint(), price, signal.size_usdt)
+
     async def _process_candle(self, candle, timeframe: str) -> None:
         """
         Process a closed candle through the engine.
@@ -830,11 +986,16 @@ class LiveRunner:
         data_provider = self._engine._data_provider
         if isinstance(data_provider, LiveDataProvider):
             data_provider.on_candle_close(candle, timeframe=timeframe)
+        trace = current_trace()
+        if trace is not None:
+            trace.mark("data_provider")
 
         # Only evaluate signals on execution timeframe candles
         if timeframe.lower() != self._exec_tf:
             logger.debug("Non-exec TF candle (%s), updated indicators only", timeframe)
             return
+        if trace is not None:
+            trace.is_exec = True
 
         # Check if data provider is ready (warmup complete)
         if not data_provider.is_ready():
@@ -881,9 +1042,16 @@ class LiveRunner:
             # Dump indicator snapshot before engine processes
             self._debug_dump_indicators(data_provider)
 
+        if self._prearm_book is not None:
+            bar_ts_close_ms = datetime_to_epoch_ms(candle.ts_close)
+            if bar_ts_close_ms is not None:
+                self._prearm_book.check_bar(bar_ts_close_ms)
+
         # Process through engine (use -1 for latest in live mode)
         try:
             signal = self._engine.process_bar(-1)
+            if trace is not None:
+                trace.mark("engine")
         except Exception as e:
             if self._debug:
                 logger.error("[DBG] Error processing bar:\n%s", traceback.format_exc())
@@ -932,9 +1100,18 @@ class LiveRunner:
                     direction=signal.direction,
                     size_usdt=signal.size_usdt,
                 )
+            if trace is not None:
+                trace.mark("signal")
 
-            # B4: Run safety checks before execution
-            if not self._run_safety_checks(additional_exposure=signal.size_usdt):
+            # B4: Run safety checks before execution (pre-armed entries reuse
+            # the forming-candle result while its inputs are unchanged)
+            if self._prearm_safety_ok(signal, candle.close):
+                safety_ok = True
+            else:
+                safety_ok = self._run_safety_checks(additional_exposure=signal.size_usdt)
+            if trace is not None:
+                trace.mark("safety")
+            if not safety_ok:
                 logger.warning("Safety checks failed, skipping signal execution")
                 return
 
@@ -961,6 +1138,9 @@ class LiveRunner:
         try:
             self._stats.orders_submitted += 1
             result = self._engine.execute_signal(signal)
+            trace = current_trace()
+            if trace is not None:
+                trace.mark("execute")
 
             if result.success:
                 self._stats.orders_filled += 1
@@ -1033,6 +1213,31 @@ class LiveRunner:
                     f"Execute exception for {signal.symbol}: {e}"
                 )
 
+    def _finish_trace(self, trace: CandleTrace) -> None:
+        """Fold a processed candle's trace into the stats and the journal."""
+        self._stats.latency.record_trace(trace)
+        if trace.is_exec and self._journal:
+            self._journal.record_trace(symbol=self._engine.symbol, trace=trace.to_record())
+        self._flush_trace_acks()
+
+    def _on_trace_ack(self, trace: CandleTrace) -> None:
+        """WS execution for a traced order (called on the WebSocket thread)."""
+        self._stats.latency.record_ack(trace)
+        self._acked_traces.append(trace)
+
+    def _flush_trace_acks(self) -> None:
+        """Journal execution acks collected from the WebSocket thread."""
+        while self._acked_traces:
+            trace = self._acked_traces.popleft()
+            ws_ns = trace.ws_execution_ns
+            if self._journal and ws_ns is not None and trace.ack_ns is not None:
+                self._journal.record_trace_ack(
+                    symbol=self._engine.symbol,
+                    order_id=trace.order_id or "",
+                    ws_execution_ms=ws_ns / 1e6,
+                    to_ws_execution_ms=(trace.ack_ns - trace.t0_ns) / 1e6,
+                )
+
     async def _reconnect(self) -> None:
         """Attempt to reconnect to WebSocket with exponential backoff."""
         self._transition_state(RunnerState.RECONNECTING)
@@ -1063,6 +1268,10 @@ class LiveRunner:
                     break
             if drained:
                 logger.info("Drained %s stale candle(s) from queue before reconnect", drained)
+            self._prearm_queued = False
+            self._forming_kline = None
+            if self._prearm_book is not None:
+                self._prearm_book.clear()
 
             await self._disconnect()
             await self._connect()
@@ -1076,12 +1285,14 @@ class LiveRunner:
             logger.error("Reconnection failed: %s", e)
             self._stats.errors.append(f"Reconnect error: {e}")
 
-    def _run_safety_checks(self, additional_exposure: float = 0) -> bool:
+    def _run_safety_checks(self, additional_exposure: float = 0, quiet: bool = False) -> bool:
         """
         B4: Run SafetyChecks before order execution.
 
         Args:
             additional_exposure: USD exposure of the pending signal.
+            quiet: Pre-arm run; failures are logged at debug and not recorded
+                (the close re-runs the checks and reports them).
 
         Returns True if all checks pass, False to skip execution.
         Fail-closed: if safety checks cannot run, trading is halted.
@@ -1102,6 +1313,9 @@ class LiveRunner:
             passed, failures = checks.run_all_checks(additional_exposure=additional_exposure)
             if not passed:
                 for reason in failures:
+                    if quiet:
+                        logger.debug("Pre-arm safety check failed: %s", reason)
+                        continue
                     logger.error("Safety check failed: %s", reason)
                     self._stats.errors.append(f"Safety: {reason}")
             return passed
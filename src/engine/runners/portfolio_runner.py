@@ -0,0 +1,586 @@
+"""
+Portfolio backtest runner.
+
+Runs several Plays (any mix of symbols and exec timeframes) in one process
+on a single merged clock instead of N independent backtests:
+
+- One PlayEngine + SimulatedExchange per Play. Each Play trades its own
+  starting equity as a sub-account, exactly as in a standalone run.
+- Data is built once per unique requirement: Plays with identical data
+  needs step on the same FeedStores (SharedDataCache), and 1m quote feeds
+  are shared per symbol and window.
+- Exec bars of all Plays are merged by close timestamp and stepped in
+  order. Plays closing on the same timestamp step in portfolio order, so
+  a run is deterministic.
+- PortfolioLedger marks the combined account after every clock step and
+  records per-Play attribution. Optional PortfolioLimits apply the
+  account-level entry vetoes that GlobalRiskView.check_pre_trade enforces
+  live (position count, total exposure, initial margin rate).
+
+With no limits configured, every Play's trades are identical to its
+standalone backtest; the portfolio view is purely additive.
+
+Usage:
+    from src.engine.runners.portfolio_runner import PortfolioBacktestRunner, PortfolioLimits
+
+    runner = PortfolioBacktestRunner(
+        plays=[play_a, play_b, play_c],
+        window_start=start,
+        window_end=end,
+        limits=PortfolioLimits(max_positions=2),
+    )
+    result = runner.run()
+    print(result.to_dict()["attribution"])
+"""
+
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+
+from ...utils.logger import get_module_logger
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from ...backtest.engine_factory import PlayBacktestResult
+    from ...backtest.play import Play
+    from ...backtest.sim.exchange import SimulatedExchange
+    from ...core.risk_manager import Signal
+    from ...risk.global_risk import RiskDecision
+
+logger = get_module_logger(__name__)
+
+
+@dataclass
+class PortfolioLimits:
+    """
+    Account-level entry limits for a portfolio backtest.
+
+    Same checks as GlobalRiskView.check_pre_trade, evaluated against the
+    combined sim accounts. None disables a check; exits are never vetoed.
+    """
+    max_positions: int | None = None
+    max_total_exposure_usdt: float | None = None
+    max_account_im_rate: float | None = None
+
+    def __post_init__(self) -> None:
+        if self.max_positions is not None and self.max_positions < 1:
+            raise ValueError(f"max_positions must be >= 1, got {self.max_positions}")
+        if self.max_total_exposure_usdt is not None and self.max_total_exposure_usdt <= 0:
+            raise ValueError(f"max_total_exposure_usdt must be > 0, got {self.max_total_exposure_usdt}")
+        if self.max_account_im_rate is not None and not 0 < self.max_account_im_rate <= 1:
+            raise ValueError(f"max_account_im_rate must be in (0, 1], got {self.max_account_im_rate}")
+
+    @property
+    def active(self) -> bool:
+        return (
+            self.max_positions is not None
+            or self.max_total_exposure_usdt is not None
+            or self.max_account_im_rate is not None
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "max_positions": self.max_positions,
+            "max_total_exposure_usdt": self.max_total_exposure_usdt,
+            "max_account_im_rate": self.max_account_im_rate,
+        }
+
+
+@dataclass
+class _Account:
+    """One Play's sub-account in the ledger."""
+    play_id: str
+    symbol: str
+    sim_exchange: "SimulatedExchange"
+    initial_equity: float
+    peak_exposure_usdt: float = 0.0
+
+
+class PortfolioLedger:
+    """
+    Combined view over every Play's SimulatedExchange.
+
+    Marks portfolio equity, exposure, used margin and open positions after
+    each clock step, and answers pre-trade checks for PortfolioLimits.
+    """
+
+    def __init__(self, limits: PortfolioLimits | None = None):
+        self.limits = limits or PortfolioLimits()
+        self._accounts: dict[str, _Account] = {}
+        self.equity_curve: list[dict[str, Any]] = []
+        self.vetoes: Counter[tuple[str, str]] = Counter()  # (play_id, reason) -> count
+        self.peak_equity = 0.0
+        self.max_drawdown_usdt = 0.0
+        self.max_drawdown_pct = 0.0
+        self.peak_exposure_usdt = 0.0
+        self.peak_positions = 0
+
+    def add_play(self, play_id: str, symbol: str, sim_exchange: "SimulatedExchange") -> None:
+        if play_id in self._accounts:
+            raise ValueError(f"Play '{play_id}' is already in the portfolio")
+        self._accounts[play_id] = _Account(
+            play_id=play_id,
+            symbol=symbol,
+            sim_exchange=sim_exchange,
+            initial_equity=sim_exchange.equity_usdt,
+        )
+        self.peak_equity = self.initial_equity
+
+    @property
+    def initial_equity(self) -> float:
+        return sum(a.initial_equity for a in self._accounts.values())
+
+    @staticmethod
+    def _exposure(account: _Account) -> float:
+        sim = account.sim_exchange
+        position = sim.position
+        if position is None:
+            return 0.0
+        price = sim.last_mark_price or position.entry_price
+        return abs(position.size) * price
+
+    @staticmethod
+    def _pending_entry_usdt(account: _Account) -> float:
+        return sum(
+            order.size_usdt
+            for order in account.sim_exchange.get_open_orders()
+            if not order.reduce_only
+        )
+
+    def _committed(self, account: _Account) -> bool:
+        """Open position or an entry order waiting for its fill."""
+        return account.sim_exchange.position is not None or self._pending_entry_usdt(account) > 0
+
+    def equity(self) -> float:
+        return sum(a.sim_exchange.equity_usdt for a in self._accounts.values())
+
+    def used_margin_usdt(self) -> float:
+        return sum(a.sim_exchange.used_margin_usdt for a in self._accounts.values())
+
+    # Backtest entries fill at the next bar's open, so pre-trade checks count
+    # pending entry orders as positions; live fills are immediate and
+    # GlobalRiskView sees them as positions already.
+
+    def committed_positions(self) -> int:
+        return sum(1 for a in self._accounts.values() if self._committed(a))
+
+    def committed_exposure_usdt(self) -> float:
+        return sum(self._exposure(a) + self._pending_entry_usdt(a) for a in self._accounts.values())
+
+    def check_entry(self, play_id: str) -> "RiskDecision":
+        """
+        Pre-trade check for a new entry, mirroring GlobalRiskView.
+
+        Args:
+            play_id: Play submitting the entry
+
+        Returns:
+            RiskDecision (allowed, or the first veto hit)
+        """
+        from ...risk.global_risk import RiskDecision, RiskVeto
+
+        limits = self.limits
+        if limits.max_account_im_rate is not None:
+            equity = self.equity()
+            im_rate = self.used_margin_usdt() / equity if equity > 0 else float("inf")
+            if im_rate > limits.max_account_im_rate:
+                return RiskDecision.deny(
+                    RiskVeto.MARGIN_EXCEEDED,
+                    f"Portfolio initial margin rate exceeded: {im_rate:.1%}",
+                    account_im_rate=im_rate,
+                    limit=limits.max_account_im_rate,
+                )
+        if limits.max_positions is not None:
+            count = self.committed_positions()
+            if count >= limits.max_positions:
+                return RiskDecision.deny(
+                    RiskVeto.POSITION_LIMIT,
+                    f"Maximum portfolio positions reached: {count}",
+                    position_count=count,
+                    limit=limits.max_positions,
+                )
+        if limits.max_total_exposure_usdt is not None:
+            exposure = self.committed_exposure_usdt()
+            if exposure >= limits.max_total_exposure_usdt:
+                return RiskDecision.deny(
+                    RiskVeto.EXPOSURE_LIMIT,
+                    f"Maximum portfolio exposure reached: ${exposure:.2f}",
+                    total_exposure=exposure,
+                    limit=limits.max_total_exposure_usdt,
+                )
+        return RiskDecision.allow()
+
+    def gate_for(self, play_id: str) -> "Callable[[Signal], bool]":
+        """Signal gate for one Play's BacktestRunner (vetoes entries only)."""
+
+        def _gate(signal: "Signal") -> bool:
+            if signal.direction.upper() == "FLAT":
+                return True
+            # Entries while already committed are handled by the engine/exchange
+            if self._committed(self._accounts[play_id]):
+                return True
+            decision = self.check_entry(play_id)
+            if not decision.allowed:
+                self.vetoes[(play_id, decision.veto_reason.value)] += 1
+                logger.info("Portfolio veto %s: %s", play_id, decision.message)
+            return decision.allowed
+
+        return _gate
+
+    def mark(self, timestamp: datetime) -> None:
+        """Record the combined account after a clock step."""
+        equity = 0.0
+        exposure = 0.0
+        used_margin = 0.0
+        positions = 0
+        for account in self._accounts.values():
+            sim = account.sim_exchange
+            equity += sim.equity_usdt
+            used_margin += sim.used_margin_usdt
+            if sim.position is not None:
+                positions += 1
+                play_exposure = self._exposure(account)
+                exposure += play_exposure
+                if play_exposure > account.peak_exposure_usdt:
+                    account.peak_exposure_usdt = play_exposure
+
+        self.equity_curve.append({
+            "timestamp": timestamp,
+            "equity": equity,
+            "exposure_usdt": exposure,
+            "used_margin_usdt": used_margin,
+            "positions": positions,
+        })
+        if equity > self.peak_equity:
+            self.peak_equity = equity
+        drawdown = self.peak_equity - equity
+        if drawdown > self.max_drawdown_usdt:
+            self.max_drawdown_usdt = drawdown
+            self.max_drawdown_pct = drawdown / self.peak_equity * 100 if self.peak_equity > 0 else 0.0
+        if exposure > self.peak_exposure_usdt:
+            self.peak_exposure_usdt = exposure
+        if positions > self.peak_positions:
+            self.peak_positions = positions
+
+    def vetoes_for(self, play_id: str) -> int:
+        return sum(n for (pid, _), n in self.vetoes.items() if pid == play_id)
+
+    def peak_exposure_for(self, play_id: str) -> float:
+        return self._accounts[play_id].peak_exposure_usdt
+
+
+@dataclass
+class PlayAttribution:
+    """One Play's contribution to the portfolio."""
+    play_id: str
+    symbol: str
+    exec_tf: str
+    initial_equity: float
+    final_equity: float
+    net_pnl: float
+    fees: float
+    trades: int
+    win_rate: float
+    max_drawdown_pct: float
+    peak_exposure_usdt: float
+    bars_processed: int
+    entries_vetoed: int = 0
+    pnl_share_pct: float = 0.0  # share of portfolio net PnL
+    stop_reason: str | None = None
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "play_id": self.play_id,
+            "symbol": self.symbol,
+            "exec_tf": self.exec_tf,
+            "initial_equity": round(self.initial_equity, 2),
+            "final_equity": round(self.final_equity, 2),
+            "net_pnl": round(self.net_pnl, 2),
+            "fees": round(self.fees, 2),
+            "trades": self.trades,
+            "win_rate": round(self.win_rate, 4),
+            "max_drawdown_pct": round(self.max_drawdown_pct, 2),
+            "peak_exposure_usdt": round(self.peak_exposure_usdt, 2),
+            "bars_processed": self.bars_processed,
+            "entries_vetoed": self.entries_vetoed,
+            "pnl_share_pct": round(self.pnl_share_pct, 2),
+            "stop_reason": self.stop_reason,
+        }
+
+
+@dataclass
+class PortfolioBacktestResult:
+    """Result of a portfolio backtest."""
+    play_results: dict[str, "PlayBacktestResult"]
+    attribution: list[PlayAttribution]
+    equity_curve: list[dict[str, Any]]
+    initial_equity: float
+    final_equity: float
+    max_drawdown_pct: float
+    max_drawdown_usdt: float
+    peak_exposure_usdt: float
+    peak_positions: int
+    limits: PortfolioLimits
+    vetoes: dict[str, int] = field(default_factory=dict)  # reason -> count
+    clock_steps: int = 0
+    bars_processed: int = 0
+    data_sharing: dict[str, int] = field(default_factory=dict)
+    runtime_seconds: float = 0.0
+
+    @property
+    def net_pnl(self) -> float:
+        return self.final_equity - self.initial_equity
+
+    def to_dict(self, include_equity_curve: bool = False) -> dict[str, Any]:
+        result: dict[str, Any] = {
+            "plays": len(self.play_results),
+            "initial_equity": round(self.initial_equity, 2),
+            "final_equity": round(self.final_equity, 2),
+            "net_pnl": round(self.net_pnl, 2),
+            "net_return_pct": round(self.net_pnl / self.initial_equity * 100, 2) if self.initial_equity else 0.0,
+            "max_drawdown_pct": round(self.max_drawdown_pct, 2),
+            "max_drawdown_usdt": round(self.max_drawdown_usdt, 2),
+            "peak_exposure_usdt": round(self.peak_exposure_usdt, 2),
+            "peak_positions": self.peak_positions,
+            "total_trades": sum(a.trades for a in self.attribution),
+            "limits": self.limits.to_dict(),
+            "vetoes": dict(self.vetoes),
+            "clock_steps": self.clock_steps,
+            "bars_processed": self.bars_processed,
+            "data_sharing": dict(self.data_sharing),
+            "runtime_seconds": round(self.runtime_seconds, 2),
+            "bars_per_second": round(self.bars_processed / self.runtime_seconds, 1) if self.runtime_seconds else 0.0,
+            "attribution": [a.to_dict() for a in self.attribution],
+        }
+        if include_equity_curve:
+            result["equity_curve"] = [
+                {**point, "timestamp": point["timestamp"].isoformat()}
+                for point in self.equity_curve
+            ]
+        return result
+
+
+@dataclass
+class _Member:
+    """A Play's engine and runner inside the portfolio loop."""
+    play: "Play"
+    engine: Any
+    runner: Any
+    state: Any  # BacktestRunner run state from begin()
+    feed: Any
+    active: bool = True
+
+
+class PortfolioBacktestRunner:
+    """
+    Steps many Plays bar-synchronously on one merged clock.
+
+    Each Play keeps its own PlayEngine, SimulatedExchange and BacktestRunner
+    (driven through begin()/step()/finish()), so per-Play semantics are
+    exactly those of a standalone backtest.
+    """
+
+    def __init__(
+        self,
+        plays: list["Play"],
+        window_start: datetime | None = None,
+        window_end: datetime | None = None,
+        limits: PortfolioLimits | None = None,
+        data_env: str = "backtest",
+        use_synthetic: bool = False,
+        structure_backend: str = "incremental",
+    ):
+        """
+        Initialize portfolio runner.
+
+        Args:
+            plays: Plays to run (unique ids; any symbols and exec TFs)
+            window_start: Backtest window start (optional with synthetic data)
+            window_end: Backtest window end (optional with synthetic data)
+            limits: Optional account-level entry limits
+            data_env: Data environment for DuckDB-backed runs
+            use_synthetic: Build data from each Play's validation: block
+            structure_backend: "incremental" or "vectorized"
+        """
+        if not plays:
+            raise ValueError("Portfolio backtest requires at least one Play")
+        ids = [p.id for p in plays]
+        duplicates = sorted({pid for pid in ids if ids.count(pid) > 1})
+        if duplicates:
+            raise ValueError(f"Duplicate Play ids in portfolio: {', '.join(duplicates)}")
+        self.plays = list(plays)
+        self.window_start = window_start
+        self.window_end = window_end
+        self.limits = limits or PortfolioLimits()
+        self.data_env = data_env
+        self.use_synthetic = use_synthetic
+        self.structure_backend = structure_backend
+
+    def run(self) -> PortfolioBacktestResult:
+        """
+        Build every engine, run the merged clock and collect results.
+
+        Returns:
+            PortfolioBacktestResult with per-Play results and attribution
+        """
+        from ...backtest.data_builder import SharedDataCache
+        from ...backtest.engine_factory import (
+            build_backtest_runner,
+            create_engine_from_play,
+            play_result_from_backtest,
+        )
+
+        started = time.perf_counter()
+        cache = SharedDataCache()
+        ledger = PortfolioLedger(self.limits)
+        members: list[_Member] = []
+
+        for play in self.plays:
+            engine = create_engine_from_play(
+                play=play,
+                window_start=self.window_start,
+                window_end=self.window_end,
+                data_env=self.data_env,
+                use_synthetic=self.use_synthetic,
+                structure_backend=self.structure_backend,
+                shared_cache=cache,
+            )
+            gate = ledger.gate_for(play.id) if self.limits.active else None
+            runner = build_backtest_runner(engine, signal_gate=gate)
+            state = runner.begin()
+            provider = runner.data_provider
+            ledger.add_play(play.id, provider.symbol, runner.exchange_adapter.sim_exchange)
+            members.append(_Member(
+                play=play,
+                engine=engine,
+                runner=runner,
+                state=state,
+                feed=provider.feed_store,
+            ))
+
+        logger.info(
+            "Portfolio: %d plays on %d unique feed sets (%d quote feeds)",
+            len(members), cache.unique_feeds, cache.to_dict()["unique_quote_feeds"],
+        )
+
+        ts_ms, member_idx, bar_idx = self._merged_clock(members)
+        clock_steps, bars_processed = self._run_clock(members, ledger, ts_ms, member_idx, bar_idx)
+
+        play_results: dict[str, "PlayBacktestResult"] = {}
+        runner_results = {}
+        for member in members:
+            backtest_result = member.runner.finish()
+            runner_results[member.play.id] = backtest_result
+            play_results[member.play.id] = play_result_from_backtest(member.engine, member.play, backtest_result)
+
+        # Final mark after end-of-data closes (includes exit fees)
+        if ledger.equity_curve:
+            ledger.mark(ledger.equity_curve[-1]["timestamp"])
+        final_equity = ledger.equity()
+        net_total = final_equity - ledger.initial_equity
+
+        attribution = []
+        for member in members:
+            play_id = member.play.id
+            backtest_result = runner_results[play_id]
+            net_pnl = backtest_result.final_equity - backtest_result.initial_equity
+            attribution.append(PlayAttribution(
+                play_id=play_id,
+                symbol=backtest_result.symbol,
+                exec_tf=backtest_result.timeframe,
+                initial_equity=backtest_result.initial_equity,
+                final_equity=backtest_result.final_equity,
+                net_pnl=net_pnl,
+                fees=backtest_result.total_fees,
+                trades=backtest_result.total_trades,
+                win_rate=backtest_result.win_rate,
+                max_drawdown_pct=backtest_result.max_drawdown_pct,
+                peak_exposure_usdt=ledger.peak_exposure_for(play_id),
+                bars_processed=backtest_result.bars_processed,
+                entries_vetoed=ledger.vetoes_for(play_id),
+                pnl_share_pct=net_pnl / net_total * 100 if net_total and net_pnl else 0.0,
+                stop_reason=backtest_result.metadata.get("stop_reason"),
+            ))
+
+        vetoes: Counter[str] = Counter()
+        for (_, reason), count in ledger.vetoes.items():
+            vetoes[reason] += count
+
+        return PortfolioBacktestResult(
+            play_results=play_results,
+            attribution=attribution,
+            equity_curve=ledger.equity_curve,
+            initial_equity=ledger.initial_equity,
+            final_equity=final_equity,
+            max_drawdown_pct=ledger.max_drawdown_pct,
+            max_drawdown_usdt=ledger.max_drawdown_usdt,
+            peak_exposure_usdt=ledger.peak_exposure_usdt,
+            peak_positions=ledger.peak_positions,
+            limits=self.limits,
+            vetoes=dict(vetoes),
+            clock_steps=clock_steps,
+            bars_processed=bars_processed,
+            data_sharing=cache.to_dict(),
+            runtime_seconds=time.perf_counter() - started,
+        )
+
+    @staticmethod
+    def _merged_clock(members: list[_Member]) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Merge every member's exec bars into one (timestamp, member) order.
+
+        Returns:
+            (ts_close_ms, member index, bar index) arrays in stepping order
+        """
+        ts_parts, member_parts, bar_parts = [], [], []
+        for i, member in enumerate(members):
+            state = member.state
+            bars = np.arange(state.start_idx, state.end_idx, dtype=np.int64)
+            ts_close = member.feed.ts_close[state.start_idx:state.end_idx]
+            ts_parts.append(ts_close.astype("datetime64[ms]").astype(np.int64))
+            member_parts.append(np.full(len(bars), i, dtype=np.int64))
+            bar_parts.append(bars)
+
+        ts_ms = np.concatenate(ts_parts)
+        member_idx = np.concatenate(member_parts)
+        bar_idx = np.concatenate(bar_parts)
+        # Stable: timestamp first, then portfolio order (bars per member stay ascending)
+        order = np.lexsort((bar_idx, member_idx, ts_ms))
+        return ts_ms[order], member_idx[order], bar_idx[order]
+
+    @staticmethod
+    def _run_clock(
+        members: list[_Member],
+        ledger: PortfolioLedger,
+        ts_ms: np.ndarray,
+        member_idx: np.ndarray,
+        bar_idx: np.ndarray,
+    ) -> tuple[int, int]:
+        """Step members in clock order, marking the ledger per timestamp."""
+        clock_steps = 0
+        bars_processed = 0
+        prev_ts: int | None = None
+        prev_member: _Member | None = None
+        prev_bar = 0
+
+        for ts, i, bar in zip(ts_ms.tolist(), member_idx.tolist(), bar_idx.tolist()):
+            if ts != prev_ts and prev_member is not None:
+                ledger.mark(prev_member.feed.get_ts_close_datetime(prev_bar))
+                clock_steps += 1
+            member = members[i]
+            if not member.active:
+                continue
+            if not member.runner.step(bar):
+                member.active = False
+            bars_processed += 1
+            prev_ts, prev_member, prev_bar = ts, member, bar
+
+        if prev_member is not None:
+            ledger.mark(prev_member.feed.get_ts_close_datetime(prev_bar))
+            clock_steps += 1
+        return clock_steps, bars_processed
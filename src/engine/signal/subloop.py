@@ -19,9 +19,13 @@ Engines provide a SubLoopContext that implements the engine-specific parts:
 
 from dataclasses import dataclass
 from datetime import datetime
+from time import perf_counter_ns
 from typing import TYPE_CHECKING, Any, Protocol
 
+from ...utils.profiler import active_profiler
+
 if TYPE_CHECKING:
+    from ...backtest.runtime.alignment import AlignmentTable
     from ...backtest.runtime.snapshot_view import RuntimeSnapshotView
     from ...backtest.runtime.feed_store import FeedStore
     from ...core.risk_manager import Signal
@@ -132,6 +136,7 @@ class SubLoopEvaluator:
         quote_feed: "FeedStore | None",
         exec_tf: str,
         logger: Any | None = None,
+        alignment: "AlignmentTable | None" = None,
     ):
         """Initialize the sub-loop evaluator.
 
@@ -139,8 +144,11 @@ class SubLoopEvaluator:
             quote_feed: 1m price data feed (None if unavailable)
             exec_tf: Execution timeframe (e.g., "15m", "1h")
             logger: Logger for warnings (optional)
+            alignment: Precomputed exec_idx -> 1m range table (optional;
+                without it the range is bisected per exec bar)
         """
         self._quote_feed = quote_feed
+        self._alignment = alignment if alignment is not None and alignment.quote_start is not None else None
         self._exec_tf = exec_tf.lower()
         minutes = self.TF_MINUTES.get(self._exec_tf)
         if minutes is None:
@@ -181,11 +189,14 @@ class SubLoopEvaluator:
             return self._evaluate_fallback(exec_idx, context, exec_close)
 
         # Get 1m bar range for this exec bar
-        start_1m, end_1m = self._quote_feed.get_1m_indices_for_exec(
-            exec_idx, self._exec_tf_minutes,
-            exec_ts_open=exec_ts_open,
-            exec_ts_close=exec_ts_close,
-        )
+        if self._alignment is not None:
+            start_1m, end_1m = self._alignment.quote_range(exec_idx)
+        else:
+            start_1m, end_1m = self._quote_feed.get_1m_indices_for_exec(
+                exec_idx, self._exec_tf_minutes,
+                exec_ts_open=exec_ts_open,
+                exec_ts_close=exec_ts_close,
+            )
 
         # Verbose: log subloop range (first bar only to avoid per-bar spam)
         if not self._fallback_warned:
@@ -223,18 +234,24 @@ class SubLoopEvaluator:
         else:
             prev_price_1m = None
 
+        # Per-phase timing of snapshot build vs rule evaluation (profiling only)
+        prof = active_profiler()
+
         # Iterate through 1m bars (mandatory 1m action loop)
         for sub_idx in range(start_1m, end_1m + 1):
             # Get 1m close price
             price_1m = float(self._quote_feed.close[sub_idx])
 
             # Build snapshot with 1m prices
+            t = perf_counter_ns() if prof is not None else 0
             snapshot = context.build_snapshot_1m(
                 exec_idx=exec_idx,
                 price_1m=price_1m,
                 prev_price_1m=prev_price_1m,
                 quote_idx=sub_idx,
             )
+            if prof is not None:
+                t = prof.lap("engine.rules.snapshot", t)
             last_snapshot = snapshot
 
             # Update previous price for next iteration
@@ -250,6 +267,8 @@ class SubLoopEvaluator:
 
             # Evaluate strategy
             signal = context.evaluate_signal(snapshot)
+            if prof is not None:
+                prof.lap("engine.rules.eval", t)
 
             if signal is not None:
                 # Get 1m close timestamp for order submission
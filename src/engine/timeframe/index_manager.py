@@ -18,7 +18,9 @@ Example (exec=med_tf, low_tf=15m, med_tf=1h, high_tf=4h):
     - med_tf (1h): direct access (current bar)
     - high_tf (4h): forward-fill until 4h closes
 
-Uses O(1) ts_close_ms_to_idx mapping from FeedStore.
+Uses O(1) ts_close_ms_to_idx mapping from FeedStore, or, when given an
+AlignmentTable (src/backtest/runtime/alignment.py), reads the precomputed
+close-match columns by exec index instead.
 """
 
 
@@ -27,6 +29,7 @@ from datetime import datetime
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
+    from ...backtest.runtime.alignment import AlignmentTable
     from ...backtest.runtime.feed_store import FeedStore
 
 
@@ -88,6 +91,7 @@ class TFIndexManager:
         med_tf_feed: "FeedStore | None",
         high_tf_feed: "FeedStore | None",
         exec_role: str,
+        alignment: "AlignmentTable | None" = None,
     ) -> None:
         """
         Initialize TFIndexManager.
@@ -97,6 +101,8 @@ class TFIndexManager:
             med_tf_feed: MedTF FeedStore (None if same as low_tf)
             high_tf_feed: HighTF FeedStore (None if same as med_tf or low_tf)
             exec_role: Which feed we step on ("low_tf", "med_tf", "high_tf")
+            alignment: Precomputed table built from the same feeds, indexed by
+                exec_idx (used whenever update_indices() gets an exec_idx)
         """
         self._low_tf_feed = low_tf_feed
         self._med_tf_feed = med_tf_feed
@@ -113,6 +119,21 @@ class TFIndexManager:
         else:
             raise ValueError(f"Invalid exec_role: {exec_role}")
 
+        # Close-match columns as lists (plain int reads in the hot loop);
+        # None for the exec role (direct) and for absent feeds
+        self._aligned: tuple[list[int] | None, list[int] | None, list[int] | None] | None = None
+        if alignment is not None:
+            def _col(role: str, feed: "FeedStore | None", col) -> list[int] | None:
+                if role == exec_role or feed is None or col is None:
+                    return None
+                return col.tolist()
+
+            self._aligned = (
+                _col("low_tf", low_tf_feed, alignment.low_tf_idx),
+                _col("med_tf", med_tf_feed, alignment.med_tf_idx),
+                _col("high_tf", high_tf_feed, alignment.high_tf_idx),
+            )
+
         # Current indices
         self._current_low_tf_idx: int = 0
         self._current_med_tf_idx: int = 0
@@ -147,6 +168,9 @@ class TFIndexManager:
         Returns:
             TFIndexUpdate with change flags and current indices
         """
+        if self._aligned is not None and exec_idx is not None:
+            return self._update_from_alignment(exec_idx)
+
         low_tf_changed = False
         med_tf_changed = False
         high_tf_changed = False
@@ -228,3 +252,47 @@ class TFIndexManager:
             high_tf_idx=self._current_high_tf_idx,
         )
 
+    def _update_from_alignment(self, exec_idx: int) -> TFIndexUpdate:
+        """update_indices() via the AlignmentTable columns (same semantics)."""
+        assert self._aligned is not None
+        low_col, med_col, high_col = self._aligned
+        role = self._exec_role
+
+        low_tf_changed = False
+        if role == "low_tf":
+            low_tf_changed = exec_idx != self._current_low_tf_idx
+            self._current_low_tf_idx = exec_idx
+        elif low_col is not None:
+            idx = low_col[exec_idx]
+            if idx >= 0:
+                low_tf_changed = idx != self._current_low_tf_idx
+                self._current_low_tf_idx = idx
+
+        med_tf_changed = False
+        if role == "med_tf":
+            med_tf_changed = exec_idx != self._current_med_tf_idx
+            self._current_med_tf_idx = exec_idx
+        elif med_col is not None:
+            idx = med_col[exec_idx]
+            if idx >= 0:
+                med_tf_changed = idx != self._current_med_tf_idx
+                self._current_med_tf_idx = idx
+
+        high_tf_changed = False
+        if role == "high_tf":
+            high_tf_changed = exec_idx != self._current_high_tf_idx
+            self._current_high_tf_idx = exec_idx
+        elif high_col is not None:
+            idx = high_col[exec_idx]
+            if idx >= 0:
+                high_tf_changed = idx != self._current_high_tf_idx
+                self._current_high_tf_idx = idx
+
+        return TFIndexUpdate(
+            low_tf_changed=low_tf_changed,
+            med_tf_changed=med_tf_changed,
+            high_tf_changed=high_tf_changed,
+            low_tf_idx=self._current_low_tf_idx,
+            med_tf_idx=self._current_med_tf_idx,
+            high_tf_idx=self._current_high_tf_idx,
+        )
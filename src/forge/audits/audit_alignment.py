@@ -0,0 +1,358 @@
+"""
+Multi-TF Alignment Table Parity Audit.
+
+The backtest loop reads med/high TF indices, 1m sub-loop ranges and funding
+positions from a table built once per run (src/backtest/runtime/alignment.py)
+instead of per-bar timestamp lookups. This audit rebuilds both for every
+exec bar and requires identical answers:
+
+    TF indices    TFIndexManager stepped with the table vs with
+                  FeedStore.get_idx_at_ts_close() (same TFIndexUpdate,
+                  including the changed flags)
+    1m range      AlignmentTable.quote_range() vs
+                  FeedStore.get_1m_indices_for_exec()
+    funding       funding_idx vs a bisect over the sorted settlement times
+
+Cases: the validation Plays (real feed layout) plus synthetic feeds for the
+edges validate_timestamps covers (US DST transitions, year boundary) and
+the ones the table must not smooth over: missing higher-TF bars, 1m gaps
+and a 1m feed that starts late / ends early, and an exec role other than
+low_tf. Per-bar lookup time of both paths is reported.
+
+CLI: python trade_cli.py debug alignment [--play ID ...] [--no-synthetic] [--json]
+"""
+
+from __future__ import annotations
+
+import bisect
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from src.utils.logger import get_module_logger
+
+if TYPE_CHECKING:
+    from src.backtest.runtime.feed_store import FeedStore
+
+logger = get_module_logger(__name__)
+
+# Validation plays: single-TF, structure, multi-TF (15m / 1h / D) layouts
+DEFAULT_ALIGNMENT_PLAYS = (
+    "V_CORE_001_indicator_cross",
+    "V_CORE_002_structure_chain",
+    "V_CORE_003_cases_metadata",
+    "V_CORE_004_multi_tf",
+    "V_CORE_005_arithmetic_window",
+)
+
+MAX_REPORTED_MISMATCHES = 10
+
+
+@dataclass
+class AlignmentCaseResult:
+    """Parity and lookup timing for one Play or synthetic case."""
+    name: str
+    exec_role: str = "low_tf"
+    exec_bars: int = 0
+    checks: int = 0
+    mismatch_count: int = 0
+    mismatches: list[dict[str, Any]] = field(default_factory=list)  # first few only
+    lookup_us: float = 0.0  # total, timestamp lookups
+    table_us: float = 0.0   # total, table reads
+    build_ms: float = 0.0
+    error: str | None = None
+
+    @property
+    def passed(self) -> bool:
+        return self.error is None and self.mismatch_count == 0 and self.exec_bars > 0
+
+    @property
+    def speedup(self) -> float:
+        return self.lookup_us / self.table_us if self.table_us else 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        bars = self.exec_bars or 1
+        return {
+            "name": self.name,
+            "passed": self.passed,
+            "exec_role": self.exec_role,
+            "exec_bars": self.exec_bars,
+            "checks": self.checks,
+            "mismatch_count": self.mismatch_count,
+            "mismatches": self.mismatches,
+            "build_ms": round(self.build_ms, 2),
+            "lookup_us_per_bar": round(self.lookup_us / bars, 3),
+            "table_us_per_bar": round(self.table_us / bars, 3),
+            "speedup": round(self.speedup, 2),
+            "error": self.error,
+        }
+
+
+@dataclass
+class AlignmentAuditResult:
+    """Aggregate result across Plays and synthetic cases."""
+    cases: list[AlignmentCaseResult]
+    runtime_seconds: float = 0.0
+
+    @property
+    def success(self) -> bool:
+        return bool(self.cases) and all(c.passed for c in self.cases)
+
+    def to_dict(self) -> dict[str, Any]:
+        bars = sum(c.exec_bars for c in self.cases)
+        lookup = sum(c.lookup_us for c in self.cases)
+        table = sum(c.table_us for c in self.cases)
+        return {
+            "success": self.success,
+            "total_exec_bars": bars,
+            "total_checks": sum(c.checks for c in self.cases),
+            "total_mismatches": sum(c.mismatch_count for c in self.cases),
+            "lookup_us_per_bar": round(lookup / bars, 3) if bars else 0.0,
+            "table_us_per_bar": round(table / bars, 3) if bars else 0.0,
+            "speedup": round(lookup / table, 2) if table else 0.0,
+            "runtime_seconds": round(self.runtime_seconds, 2),
+            "cases": [c.to_dict() for c in self.cases],
+        }
+
+
+def _record(result: AlignmentCaseResult, exec_idx: int, where: str, expected: Any, observed: Any) -> None:
+    result.mismatch_count += 1
+    if len(result.mismatches) < MAX_REPORTED_MISMATCHES:
+        result.mismatches.append({
+            "exec_idx": exec_idx,
+            "where": where,
+            "expected": expected,
+            "observed": observed,
+        })
+
+
+def _check_feeds(
+    result: AlignmentCaseResult,
+    exec_feed: "FeedStore",
+    low_tf_feed: "FeedStore",
+    med_tf_feed: "FeedStore | None",
+    high_tf_feed: "FeedStore | None",
+    quote_feed: "FeedStore | None",
+    exec_role: str,
+    exec_tf_minutes: int,
+) -> None:
+    """Compare table-driven against timestamp-driven lookups on every exec bar."""
+    from src.backtest.runtime.alignment import build_alignment_table
+    from src.engine.timeframe import TFIndexManager
+
+    perf = time.perf_counter_ns
+    t0 = perf()
+    table = build_alignment_table(
+        exec_feed,
+        low_tf_feed=low_tf_feed,
+        med_tf_feed=med_tf_feed,
+        high_tf_feed=high_tf_feed,
+        quote_feed=quote_feed,
+    )
+    result.build_ms = (perf() - t0) / 1e6
+    result.exec_role = exec_role
+    result.exec_bars = exec_feed.length
+
+    plain = TFIndexManager(low_tf_feed, med_tf_feed, high_tf_feed, exec_role)
+    aligned = TFIndexManager(low_tf_feed, med_tf_feed, high_tf_feed, exec_role, alignment=table)
+    check_quote = quote_feed is not None and quote_feed.length > 0
+    settlements = sorted(exec_feed.funding_settlement_times)
+
+    for i in range(exec_feed.length):
+        ts_open = exec_feed.get_ts_open_datetime(i)
+        ts_close = exec_feed.get_ts_close_datetime(i)
+
+        t0 = perf()
+        expected = plain.update_indices(ts_close, exec_idx=i)
+        if check_quote:
+            assert quote_feed is not None
+            expected_range = quote_feed.get_1m_indices_for_exec(i, exec_tf_minutes, ts_open, ts_close)
+        t1 = perf()
+        observed = aligned.update_indices(ts_close, exec_idx=i)
+        if check_quote:
+            observed_range = table.quote_range(i)
+        t2 = perf()
+        result.lookup_us += (t1 - t0) / 1000.0
+        result.table_us += (t2 - t1) / 1000.0
+
+        result.checks += 1
+        if observed != expected:
+            _record(result, i, "tf_indices", str(expected), str(observed))
+        if check_quote:
+            result.checks += 1
+            if observed_range != expected_range:
+                _record(result, i, "quote_range", expected_range, observed_range)
+        if settlements:
+            assert table.funding_idx is not None
+            result.checks += 1
+            want = bisect.bisect_right(settlements, int(table.exec_close_ms[i])) - 1
+            got = int(table.funding_idx[i])
+            if got != want:
+                _record(result, i, "funding_idx", want, got)
+
+
+def _audit_play(play_id: str, plays_dir: Path | None) -> AlignmentCaseResult:
+    from src.backtest.engine_factory import create_engine_from_play
+    from src.backtest.play import load_play
+    from src.backtest.runtime.timeframe import tf_minutes
+
+    result = AlignmentCaseResult(name=play_id)
+    engine = create_engine_from_play(play=load_play(play_id, base_dir=plays_dir))
+    exec_feed = engine._data_provider._feed_store
+    # Same feeds PlayEngine hands to TFIndexManager / build_alignment_table
+    _check_feeds(
+        result,
+        exec_feed,
+        low_tf_feed=exec_feed,
+        med_tf_feed=engine._med_tf_feed,
+        high_tf_feed=engine._high_tf_feed,
+        quote_feed=engine._quote_feed,
+        exec_role=engine._tf_mapping.get("exec", "low_tf"),
+        exec_tf_minutes=tf_minutes(engine.timeframe),
+    )
+    return result
+
+
+# =============================================================================
+# Synthetic feeds
+# =============================================================================
+
+def _feed(
+    tf: str,
+    start: datetime,
+    end: datetime,
+    drop: list[tuple[datetime, datetime]] | None = None,
+) -> "FeedStore":
+    """OHLCV FeedStore of tf bars opening in [start, end), minus dropped opens."""
+    import pandas as pd
+
+    from src.backtest.runtime.feed_store import FeedStore
+    from src.backtest.runtime.timeframe import tf_duration
+
+    step = tf_duration(tf)
+    rows = []
+    ts = start
+    while ts < end:
+        if not any(lo <= ts < hi for lo, hi in drop or ()):
+            rows.append({
+                "timestamp": ts, "ts_close": ts + step,
+                "open": 100.0, "high": 101.0, "low": 99.0, "close": 100.5, "volume": 1.0,
+            })
+        ts += step
+    return FeedStore.from_dataframe(pd.DataFrame(rows), tf, "BTCUSDT")
+
+
+def _settlements(start: datetime, end: datetime) -> set[int]:
+    """8h funding settlements in [start, end] plus one off-grid event."""
+    from src.backtest.runtime.feed_store import _datetime_to_epoch_ms
+
+    out = set()
+    ts = start.replace(hour=0, minute=0)
+    while ts <= end:
+        out.add(_datetime_to_epoch_ms(ts))
+        ts += timedelta(hours=8)
+    out.add(_datetime_to_epoch_ms(start + timedelta(hours=3, minutes=7)))
+    return out
+
+
+def _synthetic_cases() -> list[tuple[str, dict[str, Any]]]:
+    """(name, _check_feeds kwargs) for the timestamp edge cases."""
+    cases: list[tuple[str, dict[str, Any]]] = []
+
+    def low_tf_case(name: str, start: datetime, end: datetime, **drops: list[tuple[datetime, datetime]]):
+        exec_feed = _feed("15m", start, end, drops.get("exec"))
+        exec_feed.funding_settlement_times = _settlements(start, end)
+        cases.append((name, {
+            "exec_feed": exec_feed,
+            "low_tf_feed": exec_feed,
+            "med_tf_feed": _feed("1h", start, end, drops.get("med")),
+            "high_tf_feed": _feed("4h", start, end, drops.get("high")),
+            "quote_feed": _feed("1m", start, end, drops.get("quote")),
+            "exec_role": "low_tf",
+            "exec_tf_minutes": 15,
+        }))
+
+    # US DST spring forward 2025-03-09 07:00 UTC / fall back 2025-11-02 06:00 UTC
+    low_tf_case("dst_spring_2025", datetime(2025, 3, 8), datetime(2025, 3, 11))
+    low_tf_case("dst_fall_2025", datetime(2025, 11, 1), datetime(2025, 11, 4))
+    low_tf_case("year_boundary", datetime(2024, 12, 30), datetime(2025, 1, 2))
+
+    # Missing bars on every feed (exchange outages, partial syncs)
+    d = datetime(2025, 3, 9)
+    low_tf_case(
+        "gaps",
+        datetime(2025, 3, 8), datetime(2025, 3, 11),
+        exec=[(d + timedelta(hours=10), d + timedelta(hours=11))],
+        med=[(d + timedelta(hours=3), d + timedelta(hours=5))],
+        high=[(d + timedelta(hours=8), d + timedelta(hours=12))],
+        quote=[
+            (d + timedelta(hours=6, minutes=55), d + timedelta(hours=7, minutes=5)),
+            (d + timedelta(hours=14), d + timedelta(hours=14, minutes=15)),
+        ],
+    )
+
+    # 1m feed starts late and ends early: (0, 0) / (len-1, len-1) ranges
+    start, end = datetime(2025, 6, 1), datetime(2025, 6, 3)
+    exec_feed = _feed("15m", start, end)
+    cases.append(("quote_short", {
+        "exec_feed": exec_feed,
+        "low_tf_feed": exec_feed,
+        "med_tf_feed": None,
+        "high_tf_feed": None,
+        "quote_feed": _feed("1m", start + timedelta(hours=5), end - timedelta(hours=7)),
+        "exec_role": "low_tf",
+        "exec_tf_minutes": 15,
+    }))
+
+    # Exec on med_tf: low_tf is looked up, high_tf forward-filled
+    start, end = datetime(2025, 3, 8), datetime(2025, 3, 11)
+    exec_feed = _feed("1h", start, end)
+    cases.append(("exec_med_tf", {
+        "exec_feed": exec_feed,
+        "low_tf_feed": _feed("15m", start, end, [(datetime(2025, 3, 9, 6), datetime(2025, 3, 9, 8))]),
+        "med_tf_feed": exec_feed,
+        "high_tf_feed": _feed("D", start, end),
+        "quote_feed": _feed("1m", start, end),
+        "exec_role": "med_tf",
+        "exec_tf_minutes": 60,
+    }))
+    return cases
+
+
+def run_alignment_audit(
+    play_ids: list[str] | None = None,
+    synthetic: bool = True,
+    plays_dir: Path | None = None,
+) -> AlignmentAuditResult:
+    """
+    Compare the precomputed alignment table against per-bar lookups.
+
+    Args:
+        play_ids: Plays to check (default: DEFAULT_ALIGNMENT_PLAYS)
+        synthetic: Also run the synthetic DST / gap / boundary cases
+        plays_dir: Optional plays root for load_play
+
+    Returns:
+        AlignmentAuditResult with per-case parity and lookup timings
+    """
+    start = time.perf_counter()
+    results: list[AlignmentCaseResult] = []
+    for play_id in play_ids or DEFAULT_ALIGNMENT_PLAYS:
+        try:
+            results.append(_audit_play(play_id, plays_dir))
+        except Exception as e:
+            logger.error("Alignment audit failed for %s: %s", play_id, e)
+            results.append(AlignmentCaseResult(name=play_id, error=f"{type(e).__name__}: {e}"))
+
+    if synthetic:
+        for name, kwargs in _synthetic_cases():
+            result = AlignmentCaseResult(name=name)
+            try:
+                _check_feeds(result, **kwargs)
+            except Exception as e:
+                logger.error("Alignment audit failed for %s: %s", name, e)
+                result.error = f"{type(e).__name__}: {e}"
+            results.append(result)
+    return AlignmentAuditResult(cases=results, runtime_seconds=time.perf_counter() - start)
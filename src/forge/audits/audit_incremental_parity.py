@@ -1,12 +1,15 @@
 """
 G3-1: Incremental vs Vectorized Indicator Parity Audit.
 
-Compares all 43 O(1) incremental indicators against their pandas_ta
-vectorized equivalents to ensure mathematical parity.
+Compares the O(1) incremental indicators against their pandas_ta
+vectorized equivalents (or an independent pandas reference where no
+pandas_ta equivalent exists) to ensure mathematical parity. Every
+registry indicator with an incremental_class must be audited here or be
+listed in PARITY_EXEMPT with the reason.
 
 CLI: python trade_cli.py backtest audit-incremental-parity [--tolerance 1e-6] [--bars 1000]
 
-The 43 incremental indicators tested:
+The 44 incremental indicators tested:
 1. EMA - Exponential Moving Average
 2. SMA - Simple Moving Average
 3. RSI - Relative Strength Index
@@ -50,6 +53,14 @@ The 43 incremental indicators tested:
 41. FISHER - Fisher Transform
 42. KVO - Klinger Volume Oscillator
 43. VWAP - Volume Weighted Average Price
+44. SESSION_LEVELS - Previous/current day and previous week high/low
+
+CCI is checked at lengths 14, 100 and 500, and the streaming deviation
+primitive it is built on (RollingMeanAbsDev) against pandas_ta.mad().
+
+The BANK row checks the vectorized indicator banks (EMA, SMA, RSI, ATR,
+MACD, BBands) against one per-instance object per slot, through bank-wide
+updates, staged per-view updates on subsets of slots, and slot removal.
 """
 
 from dataclasses import dataclass, field
@@ -102,9 +113,21 @@ from src.indicators.incremental import (
     IncrementalFisher,
     IncrementalKVO,
     IncrementalVWAP,
+    IncrementalSessionLevels,
+    RollingMeanAbsDev,
+    create_incremental_indicator,
+    create_indicator_bank,
 )
 from src.indicators import compute_indicator
 
+# Registry indicators with an incremental_class that have no independent
+# vectorized reference to compare against.
+PARITY_EXEMPT: dict[str, str] = {
+    "anchored_vwap": "batch path is a NaN placeholder; the engine fills it from live swing state",
+    "anchored_volume_profile": "batch path is a NaN placeholder; the engine fills it from live swing state",
+    "volume_profile": "batch path runs IncrementalVolumeProfile itself (path-dependent rebinning)",
+}
+
 
 @dataclass
 class IncrementalIndicatorResult:
@@ -497,33 +520,90 @@ def audit_willr_parity(df: pd.DataFrame, tolerance: float) -> IncrementalIndicat
     )
 
 
-def audit_cci_parity(df: pd.DataFrame, tolerance: float) -> IncrementalIndicatorResult:
-    """Test CCI parity."""
-    length = 14
-    warmup = length
+# CCI / MAD window lengths: short (default), and long windows where the
+# streaming deviation (RollingMeanAbsDev) spans many sorted buckets
+MAD_PARITY_LENGTHS = (14, 100, 500)
 
-    inc = IncrementalCCI(length=length)
-    inc_values = []
-    for _, row in df.iterrows():
-        inc.update(high=row["high"], low=row["low"], close=row["close"])
-        inc_values.append(inc.value)
 
-    vec = compute_indicator(
-        "cci", high=df["high"], low=df["low"], close=df["close"], length=length
-    )
+def audit_cci_parity(df: pd.DataFrame, tolerance: float) -> IncrementalIndicatorResult:
+    """Test CCI parity at short and long lengths."""
+    per_length: dict[str, float] = {}
+    passed_all = True
+    max_diff_all = 0.0
+    mean_diffs: list[float] = []
+    valid_total = 0
+    for length in MAD_PARITY_LENGTHS:
+        if length >= len(df):
+            continue
+        inc = IncrementalCCI(length=length)
+        inc_values = []
+        for h, lo, c in zip(df["high"].tolist(), df["low"].tolist(), df["close"].tolist()):
+            inc.update(high=h, low=lo, close=c)
+            inc_values.append(inc.value)
+
+        vec = compute_indicator(
+            "cci", high=df["high"], low=df["low"], close=df["close"], length=length
+        )
 
-    passed, max_diff, mean_diff, valid = _compare_series(
-        inc_values, vec, warmup, tolerance
-    )
+        passed, max_diff, mean_diff, valid = _compare_series(
+            inc_values, vec, length, tolerance
+        )
+        passed_all = passed_all and passed
+        max_diff_all = max(max_diff_all, max_diff)
+        mean_diffs.append(mean_diff)
+        valid_total += valid
+        per_length[str(length)] = max_diff
 
     return IncrementalIndicatorResult(
         indicator="CCI",
-        passed=passed,
-        max_abs_diff=max_diff,
-        mean_abs_diff=mean_diff,
-        valid_comparisons=valid,
-        warmup_bars=warmup,
+        passed=passed_all,
+        max_abs_diff=max_diff_all,
+        mean_abs_diff=float(np.mean(mean_diffs)) if mean_diffs else 0.0,
+        valid_comparisons=valid_total,
+        warmup_bars=MAD_PARITY_LENGTHS[0],
         outputs_checked=["value"],
+        details={"max_abs_diff_by_length": per_length},
+    )
+
+
+def audit_mad_parity(df: pd.DataFrame, tolerance: float) -> IncrementalIndicatorResult:
+    """Test the RollingMeanAbsDev primitive against pandas_ta.mad()."""
+    import pandas_ta as ta
+
+    per_length: dict[str, float] = {}
+    passed_all = True
+    max_diff_all = 0.0
+    mean_diffs: list[float] = []
+    valid_total = 0
+    for length in MAD_PARITY_LENGTHS:
+        if length >= len(df):
+            continue
+        window = RollingMeanAbsDev(length)
+        inc_values = []
+        for close in df["close"].tolist():
+            window.push(close)
+            inc_values.append(window.mad() if window.is_full else np.nan)
+
+        vec = ta.mad(df["close"], length=length)
+
+        passed, max_diff, mean_diff, valid = _compare_series(
+            inc_values, vec, length, tolerance
+        )
+        passed_all = passed_all and passed
+        max_diff_all = max(max_diff_all, max_diff)
+        mean_diffs.append(mean_diff)
+        valid_total += valid
+        per_length[str(length)] = max_diff
+
+    return IncrementalIndicatorResult(
+        indicator="MAD",
+        passed=passed_all,
+        max_abs_diff=max_diff_all,
+        mean_abs_diff=float(np.mean(mean_diffs)) if mean_diffs else 0.0,
+        valid_comparisons=valid_total,
+        warmup_bars=MAD_PARITY_LENGTHS[0],
+        outputs_checked=["mad"],
+        details={"max_abs_diff_by_length": per_length},
     )
 
 
@@ -1783,6 +1863,187 @@ def audit_stochrsi_parity(df: pd.DataFrame, tolerance: float) -> IncrementalIndi
     )
 
 
+_MS_PER_HOUR = 3_600_000
+_MS_PER_DAY = 86_400_000
+_MS_PER_WEEK = 7 * _MS_PER_DAY
+
+
+def audit_session_levels_parity(df: pd.DataFrame, tolerance: float) -> IncrementalIndicatorResult:
+    """
+    Test Session Levels parity against a groupby reference.
+
+    The batch path runs the incremental class itself, so the reference here
+    is built independently: hourly bars from a Wednesday, day and Monday-based
+    week ids, cummax/cummin within the session and the prior session's
+    max/min mapped forward.
+    """
+    warmup = 0
+    ts_open = 1_704_240_000_000 + np.arange(len(df), dtype=np.int64) * _MS_PER_HOUR  # 2024-01-03 00:00 UTC
+
+    inc = IncrementalSessionLevels()
+    outputs = ("prev_day_high", "prev_day_low", "current_day_high", "current_day_low",
+               "prev_week_high", "prev_week_low")
+    inc_values: dict[str, list[float]] = {key: [] for key in outputs}
+    for i, row in enumerate(df.itertuples(index=False)):
+        inc.update(high=row.high, low=row.low, close=row.close, volume=row.volume, ts_open=int(ts_open[i]))
+        for key in outputs:
+            inc_values[key].append(getattr(inc, key))
+
+    high = df["high"].reset_index(drop=True)
+    low = df["low"].reset_index(drop=True)
+    day_id = pd.Series(ts_open // _MS_PER_DAY)
+    week_id = pd.Series((ts_open + 3 * _MS_PER_DAY) // _MS_PER_WEEK)
+
+    def _prev_session(values: pd.Series, session: pd.Series, how: str) -> pd.Series:
+        per_session = values.groupby(session).agg(how)
+        return session.map(per_session.shift(1))
+
+    vec = {
+        "current_day_high": high.groupby(day_id).cummax(),
+        "current_day_low": low.groupby(day_id).cummin(),
+        "prev_day_high": _prev_session(high, day_id, "max"),
+        "prev_day_low": _prev_session(low, day_id, "min"),
+        "prev_week_high": _prev_session(high, week_id, "max"),
+        "prev_week_low": _prev_session(low, week_id, "min"),
+    }
+
+    results = []
+    for key in outputs:
+        p, mx, mn, v = _compare_series(inc_values[key], vec[key], warmup, tolerance)
+        # NaN on one side only (e.g. a previous session that was never seen) is a mismatch
+        inc_nan = np.isnan(np.asarray(inc_values[key], dtype=float))
+        vec_nan = vec[key].isna().to_numpy()
+        if (inc_nan != vec_nan).any():
+            p = False
+        results.append((p, mx, mn, v))
+
+    return IncrementalIndicatorResult(
+        indicator="SESSION_LEVELS",
+        passed=all(r[0] for r in results),
+        max_abs_diff=max(r[1] for r in results),
+        mean_abs_diff=float(np.mean([r[2] for r in results])),
+        valid_comparisons=min(r[3] for r in results),
+        warmup_bars=warmup,
+        outputs_checked=list(outputs),
+    )
+
+
+# Params per bank slot; each slot also trades its own (offset, scaled) series
+BANK_PARITY_PARAMS: dict[str, list[dict[str, Any]]] = {
+    "ema": [{"length": n} for n in (1, 2, 9, 20, 50, 200)],
+    "sma": [{"length": n} for n in (1, 2, 9, 20, 50, 200)],
+    "rsi": [{"length": n} for n in (2, 7, 14, 21, 50)],
+    "atr": [{"length": n} for n in (1, 5, 14, 21, 50)],
+    "macd": [{"fast": f, "slow": sl, "signal": sg} for f, sl, sg in ((12, 26, 9), (5, 35, 5), (3, 10, 16), (8, 21, 1))],
+    "bbands": [{"length": n, "std": k} for n, k in ((2, 1.0), (20, 2.0), (50, 2.5), (100, 3.0))],
+}
+
+
+def _bank_output(inc: Any, output: str) -> float:
+    if output == "value":
+        return float(inc.value)
+    return float(getattr(inc, f"{output}_value", getattr(inc, output, np.nan)))
+
+
+def audit_bank_parity(df: pd.DataFrame, tolerance: float) -> IncrementalIndicatorResult:
+    """
+    Test vectorized indicator banks against per-instance objects.
+
+    Bars cycle through three ways of advancing the bank: bank.update() for
+    every slot, view.update() on every slot (one flush), and view.update()
+    on alternating slots (subset flush). Halfway through, the first slot is
+    removed so the last one moves into its row.
+    """
+    bars = len(df)
+    base = {col: df[col].to_numpy(dtype=float) for col in ("high", "low", "close")}
+    per_type: dict[str, float] = {}
+    max_diff_all = 0.0
+    diffs: list[float] = []
+    nan_mismatches = 0
+    ready_mismatches = 0
+    valid = 0
+
+    for ind_type, param_list in BANK_PARITY_PARAMS.items():
+        bank = create_indicator_bank(ind_type, capacity=2)
+        slots = [(bank.add(**params), create_incremental_indicator(ind_type, params)) for params in param_list]
+        series = [
+            {col: np.roll(arr, 37 * j) * (1.0 + 0.1 * j) for col, arr in base.items()}
+            for j in range(len(slots))
+        ]
+        type_max = 0.0
+        for i in range(bars):
+            if i == bars // 2 and len(slots) > 1:
+                bank.remove(slots[0][0])
+                slots.pop(0)
+                series.pop(0)
+            mode = i % 3
+            for j, ((view, inc), data) in enumerate(zip(slots, series)):
+                if mode == 2 and (i + j) % 2:
+                    continue
+                inputs = {col: float(data[col][i]) for col in bank.INPUTS}
+                inc.update(**inputs)
+                if mode:
+                    view.update(**inputs)
+            if mode == 0:
+                # Bank inputs are in slot order, which remove() reshuffled
+                columns = {col: np.empty(len(slots)) for col in bank.INPUTS}
+                for (view, _), data in zip(slots, series):
+                    for col, arr in columns.items():
+                        arr[view.slot] = data[col][i]
+                bank.update(**columns)
+            for view, inc in slots:
+                if view.is_ready != inc.is_ready:
+                    ready_mismatches += 1
+                for output in bank.OUTPUTS:
+                    a, b = view.output(output), _bank_output(inc, output)
+                    if np.isnan(a) or np.isnan(b):
+                        nan_mismatches += int(np.isnan(a) != np.isnan(b))
+                        continue
+                    diff = abs(a - b)
+                    type_max = max(type_max, diff)
+                    diffs.append(diff)
+                    valid += 1
+        per_type[ind_type] = type_max
+        max_diff_all = max(max_diff_all, type_max)
+
+    errors = []
+    if nan_mismatches:
+        errors.append(f"{nan_mismatches} NaN mismatches")
+    if ready_mismatches:
+        errors.append(f"{ready_mismatches} is_ready mismatches")
+    return IncrementalIndicatorResult(
+        indicator="BANK",
+        passed=max_diff_all <= tolerance and not errors,
+        max_abs_diff=max_diff_all,
+        mean_abs_diff=float(np.mean(diffs)) if diffs else 0.0,
+        valid_comparisons=valid,
+        warmup_bars=0,
+        outputs_checked=sorted(BANK_PARITY_PARAMS),
+        error_message="; ".join(errors) or None,
+        details={"max_abs_diff_by_type": per_type},
+    )
+
+
+def _audit_registry_coverage(audited: set[str]) -> IncrementalIndicatorResult:
+    """Fail if a registry incremental indicator is neither audited nor exempt."""
+    from src.backtest.indicator_registry import get_registry
+
+    registry = get_registry()
+    incremental = {name for name in registry.list_indicators() if registry.supports_incremental(name)}
+    uncovered = sorted(incremental - audited - set(PARITY_EXEMPT))
+    return IncrementalIndicatorResult(
+        indicator="REGISTRY_COVERAGE",
+        passed=not uncovered,
+        max_abs_diff=0.0,
+        mean_abs_diff=0.0,
+        valid_comparisons=len(incremental & audited),
+        warmup_bars=0,
+        outputs_checked=sorted(incremental & audited),
+        error_message=f"Not audited and not exempt: {', '.join(uncovered)}" if uncovered else None,
+        details={"exempt": dict(PARITY_EXEMPT)},
+    )
+
+
 # =============================================================================
 # Main Audit Runner
 # =============================================================================
@@ -1815,7 +2076,7 @@ def run_incremental_parity_audit(
         # Generate synthetic data
         df = generate_synthetic_ohlcv(bars=bars, seed=seed)
 
-        # Run all audits - all 43 indicators
+        # Run all audits - all 44 indicators
         audit_funcs = [
             # Original 11
             audit_ema_parity,
@@ -1826,6 +2087,7 @@ def run_incremental_parity_audit(
             audit_bbands_parity,
             audit_willr_parity,
             audit_cci_parity,
+            audit_mad_parity,
             audit_stoch_parity,
             audit_adx_parity,
             audit_supertrend_parity,
@@ -1868,9 +2130,13 @@ def run_incremental_parity_audit(
             # Phase 7: Volume complex
             audit_kvo_parity,
             audit_vwap_parity,
-            # NOTE: anchored_vwap is intentionally excluded. Batch precomputation
-            # returns NaN placeholders; the engine overwrites with live swing state.
-            # Parity testing batch vs incremental would always fail (by design).
+            # Phase 8: Session-boundary
+            audit_session_levels_parity,
+            # Vectorized banks vs per-instance objects
+            audit_bank_parity,
+            # NOTE: anchored_vwap, anchored_volume_profile and volume_profile are
+            # intentionally excluded (see PARITY_EXEMPT). Checked by the
+            # registry coverage result below.
         ]
 
         results = []
@@ -1896,6 +2162,11 @@ def run_incremental_parity_audit(
                     )
                 )
 
+        audited = {
+            f.__name__.removeprefix("audit_").removesuffix("_parity") for f in audit_funcs
+        }
+        results.append(_audit_registry_coverage(audited))
+
         passed_count = sum(1 for r in results if r.passed)
         failed_count = len(results) - passed_count
 
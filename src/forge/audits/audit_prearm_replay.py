@@ -0,0 +1,194 @@
+"""
+Pre-arm Replay Audit.
+
+Replays the same synthetic exec candles (with forming updates before every
+close) through the offline live harness (src/forge/bench/live_harness.py)
+twice: once with pre-arming off and once with it on (src/core/prearm.py).
+The exchange must receive exactly the same orders in the same sequence -
+side, type, qty, SL/TP and flags; only order ids may differ.
+
+Latency of both runs is reported side by side: candle close to order ack
+(to_order_ack) and the pre-submit spans a pre-armed hit skips. The audit
+fails on any order difference, and also when entries were sent but the
+pre-arm run never hit (the stage silently doing nothing).
+
+CLI: python trade_cli.py debug prearm-replay [--play ID ...] [--candles N] [--json]
+"""
+
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass, field
+from typing import Any
+
+from src.utils.logger import get_module_logger
+
+logger = get_module_logger(__name__)
+
+DEFAULT_PREARM_PLAYS = ("BENCH_001_simple",)
+DEFAULT_PREARM_CANDLES = 1000
+DEFAULT_FORMING_UPDATES = 2
+MAX_REPORTED_MISMATCHES = 10
+
+# Spans the normal path spends between safety and the order call
+_PRE_SUBMIT_SPANS = ("executor.portfolio_snapshot", "executor.risk_check", "executor.price_deviation")
+
+
+def _p50(latency: dict[str, dict[str, float | int]], span: str) -> float:
+    row = latency.get(span)
+    return float(row["p50_ms"]) if row else 0.0
+
+
+@dataclass
+class PrearmReplayPlayResult:
+    """Order parity and latency of one Play, pre-arm off vs on."""
+    play_id: str
+    candles: int = 0
+    orders: int = 0
+    entries: int = 0
+    mismatch_count: int = 0
+    mismatches: list[dict[str, Any]] = field(default_factory=list)  # first few only
+    prearm: dict[str, Any] | None = None
+    baseline_to_order_ack_ms: float = 0.0
+    prearm_to_order_ack_ms: float = 0.0
+    baseline_pre_submit_ms: float = 0.0
+    prearmed_ms: float = 0.0
+    errors: list[str] = field(default_factory=list)
+    error: str | None = None
+
+    @property
+    def hits(self) -> int:
+        return int(self.prearm["hits"]) if self.prearm else 0
+
+    @property
+    def passed(self) -> bool:
+        return (
+            self.error is None
+            and not self.errors
+            and self.mismatch_count == 0
+            and (self.entries == 0 or self.hits > 0)
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "play_id": self.play_id,
+            "passed": self.passed,
+            "candles": self.candles,
+            "orders": self.orders,
+            "entries": self.entries,
+            "mismatch_count": self.mismatch_count,
+            "mismatches": self.mismatches,
+            "prearm": self.prearm,
+            "baseline_to_order_ack_p50_ms": self.baseline_to_order_ack_ms,
+            "prearm_to_order_ack_p50_ms": self.prearm_to_order_ack_ms,
+            "baseline_pre_submit_p50_ms": round(self.baseline_pre_submit_ms, 3),
+            "prearmed_p50_ms": self.prearmed_ms,
+            "errors": self.errors[-10:],
+            "error": self.error,
+        }
+
+
+@dataclass
+class PrearmReplayAuditResult:
+    """Aggregate result across Plays."""
+    plays: list[PrearmReplayPlayResult]
+    runtime_seconds: float = 0.0
+
+    @property
+    def success(self) -> bool:
+        return bool(self.plays) and all(p.passed for p in self.plays)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "success": self.success,
+            "total_orders": sum(p.orders for p in self.plays),
+            "total_mismatches": sum(p.mismatch_count for p in self.plays),
+            "total_hits": sum(p.hits for p in self.plays),
+            "runtime_seconds": round(self.runtime_seconds, 2),
+            "plays": [p.to_dict() for p in self.plays],
+        }
+
+
+def _audit_play(
+    play_id: str,
+    candles: int,
+    forming_updates: int,
+    order_latency_ms: float,
+    query_latency_ms: float,
+) -> PrearmReplayPlayResult:
+    from src.forge.bench.live_harness import run_live_e2e
+
+    result = PrearmReplayPlayResult(play_id=play_id, candles=candles)
+    runs = {
+        prearm: run_live_e2e(
+            play_id,
+            candles=candles,
+            order_latency_ms=order_latency_ms,
+            query_latency_ms=query_latency_ms,
+            prearm=prearm,
+            forming_updates=forming_updates,
+        )
+        for prearm in (False, True)
+    }
+    base, armed = runs[False], runs[True]
+
+    result.orders = len(base.orders)
+    result.entries = sum(1 for o in base.orders if not o.get("reduce_only"))
+    result.errors = base.errors + armed.errors
+    result.prearm = armed.prearm
+
+    if len(base.orders) != len(armed.orders):
+        result.mismatch_count += 1
+        result.mismatches.append({
+            "index": None,
+            "baseline": f"{len(base.orders)} orders",
+            "prearm": f"{len(armed.orders)} orders",
+        })
+    for i, (expected, observed) in enumerate(zip(base.orders, armed.orders)):
+        if expected != observed:
+            result.mismatch_count += 1
+            if len(result.mismatches) < MAX_REPORTED_MISMATCHES:
+                result.mismatches.append({"index": i, "baseline": expected, "prearm": observed})
+
+    result.baseline_to_order_ack_ms = _p50(base.latency, "to_order_ack")
+    result.prearm_to_order_ack_ms = _p50(armed.latency, "to_order_ack")
+    result.baseline_pre_submit_ms = sum(_p50(base.latency, span) for span in _PRE_SUBMIT_SPANS)
+    result.prearmed_ms = _p50(armed.latency, "executor.prearmed")
+    return result
+
+
+def run_prearm_replay_audit(
+    play_ids: list[str] | None = None,
+    candles: int = DEFAULT_PREARM_CANDLES,
+    forming_updates: int = DEFAULT_FORMING_UPDATES,
+    order_latency_ms: float = 0.0,
+    query_latency_ms: float = 0.0,
+) -> PrearmReplayAuditResult:
+    """
+    Replay each Play through the live harness with pre-arming off and on.
+
+    Args:
+        play_ids: Single-TF Plays (default: BENCH_001_simple)
+        candles: Exec candles per run (after warmup)
+        forming_updates: Forming klines before each close (>= 1)
+        order_latency_ms: Simulated create_order round trip
+        query_latency_ms: Simulated round trip of other REST calls
+
+    Returns:
+        PrearmReplayAuditResult with per-Play order parity and latency
+
+    Raises:
+        ValueError: If forming_updates < 1 (nothing would be pre-armed)
+    """
+    if forming_updates < 1:
+        raise ValueError(f"forming_updates must be >= 1 for a pre-arm replay, got {forming_updates}")
+
+    started = time.perf_counter()
+    results: list[PrearmReplayPlayResult] = []
+    for play_id in play_ids or list(DEFAULT_PREARM_PLAYS):
+        try:
+            results.append(_audit_play(play_id, candles, forming_updates, order_latency_ms, query_latency_ms))
+        except Exception as e:
+            logger.error("Pre-arm replay failed for %s: %s", play_id, e)
+            results.append(PrearmReplayPlayResult(play_id=play_id, candles=candles, error=str(e)))
+    return PrearmReplayAuditResult(plays=results, runtime_seconds=time.perf_counter() - started)
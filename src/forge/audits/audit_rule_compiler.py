@@ -0,0 +1,213 @@
+"""
+Rule Compiler Parity + Benchmark Audit.
+
+Runs validation Plays through the backtest engine and, on every snapshot the
+engine evaluates, compares the closure-compiled case conditions
+(src/backtest/rules/closure_compiler.py) against the ExprEvaluator
+interpreter. Each case must produce the same tri-state outcome (met / not
+met / error) and every block the same intents.
+
+The same snapshots time both paths, giving a per-bar rule-evaluation cost
+(all action blocks, microseconds) for interpreter vs compiled.
+
+CLI: python trade_cli.py debug rule-compiler [--play ID ...] [--max-snapshots N] [--json]
+"""
+
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from src.utils.logger import get_module_logger
+
+logger = get_module_logger(__name__)
+
+# Validation plays with nested boolean logic, windows, arithmetic,
+# crossovers, structures, multi-TF features and multi-case blocks
+DEFAULT_RULE_BENCH_PLAYS = (
+    "V_CORE_001_indicator_cross",
+    "V_CORE_002_structure_chain",
+    "V_CORE_003_cases_metadata",
+    "V_CORE_004_multi_tf",
+    "V_CORE_005_arithmetic_window",
+)
+
+DEFAULT_MAX_SNAPSHOTS = 3000
+MAX_REPORTED_MISMATCHES = 10
+
+
+class _SnapshotBudgetReached(Exception):
+    """Raised from the snapshot callback to stop the backtest early."""
+
+
+@dataclass
+class RuleCompilerPlayResult:
+    """Parity and timing for one Play."""
+    play_id: str
+    snapshots: int = 0
+    case_checks: int = 0
+    mismatch_count: int = 0
+    mismatches: list[dict[str, Any]] = field(default_factory=list)  # first few only
+    interpreter_us: float = 0.0  # total, all blocks
+    compiled_us: float = 0.0
+    error: str | None = None
+
+    @property
+    def passed(self) -> bool:
+        return self.error is None and self.mismatch_count == 0 and self.snapshots > 0
+
+    @property
+    def interpreter_us_per_bar(self) -> float:
+        return self.interpreter_us / self.snapshots if self.snapshots else 0.0
+
+    @property
+    def compiled_us_per_bar(self) -> float:
+        return self.compiled_us / self.snapshots if self.snapshots else 0.0
+
+    @property
+    def speedup(self) -> float:
+        return self.interpreter_us / self.compiled_us if self.compiled_us else 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "play_id": self.play_id,
+            "passed": self.passed,
+            "snapshots": self.snapshots,
+            "case_checks": self.case_checks,
+            "mismatch_count": self.mismatch_count,
+            "mismatches": self.mismatches,
+            "interpreter_us_per_bar": round(self.interpreter_us_per_bar, 2),
+            "compiled_us_per_bar": round(self.compiled_us_per_bar, 2),
+            "speedup": round(self.speedup, 2),
+            "error": self.error,
+        }
+
+
+@dataclass
+class RuleCompilerAuditResult:
+    """Aggregate result across Plays."""
+    plays: list[RuleCompilerPlayResult]
+    runtime_seconds: float = 0.0
+
+    @property
+    def success(self) -> bool:
+        return bool(self.plays) and all(p.passed for p in self.plays)
+
+    def to_dict(self) -> dict[str, Any]:
+        snapshots = sum(p.snapshots for p in self.plays)
+        interp = sum(p.interpreter_us for p in self.plays)
+        compiled = sum(p.compiled_us for p in self.plays)
+        return {
+            "success": self.success,
+            "total_snapshots": snapshots,
+            "total_case_checks": sum(p.case_checks for p in self.plays),
+            "total_mismatches": sum(p.mismatch_count for p in self.plays),
+            "interpreter_us_per_bar": round(interp / snapshots, 2) if snapshots else 0.0,
+            "compiled_us_per_bar": round(compiled / snapshots, 2) if snapshots else 0.0,
+            "speedup": round(interp / compiled, 2) if compiled else 0.0,
+            "runtime_seconds": round(self.runtime_seconds, 2),
+            "plays": [p.to_dict() for p in self.plays],
+        }
+
+
+def _audit_play(
+    play_id: str,
+    max_snapshots: int,
+    plays_dir: Path | None,
+) -> RuleCompilerPlayResult:
+    from src.backtest.engine_factory import create_engine_from_play, run_engine_with_play
+    from src.backtest.play import load_play
+    from src.backtest.rules.closure_compiler import compile_blocks, compile_expr, eval_outcome
+    from src.backtest.rules.evaluation import ExprEvaluator
+    from src.backtest.rules.strategy_blocks import StrategyBlocksExecutor
+
+    result = RuleCompilerPlayResult(play_id=play_id)
+    play = load_play(play_id, base_dir=plays_dir)
+    if not play.actions:
+        result.error = "Play has no actions"
+        return result
+
+    evaluator = ExprEvaluator()
+    if play.setups:
+        evaluator.set_setup_cache(play.setups)
+    executor = StrategyBlocksExecutor(evaluator=evaluator)
+    compiled = compile_blocks(play.actions, play.setups, play.feature_registry)
+    cases = [
+        (block.id, idx, case.when, compile_expr(case.when, play.setups, play.feature_registry))
+        for block in play.actions
+        for idx, case in enumerate(block.cases)
+    ]
+    blocks = list(play.actions)
+    perf = time.perf_counter_ns
+
+    def on_snapshot(snapshot, exec_idx, high_tf_idx, med_tf_idx):
+        if result.snapshots >= max_snapshots:
+            raise _SnapshotBudgetReached()
+        result.snapshots += 1
+
+        t0 = perf()
+        expected = executor.execute(blocks, snapshot)
+        t1 = perf()
+        observed = compiled.execute(snapshot)
+        t2 = perf()
+        result.interpreter_us += (t1 - t0) / 1000.0
+        result.compiled_us += (t2 - t1) / 1000.0
+
+        if [i.action for i in observed] != [i.action for i in expected]:
+            _record(result, exec_idx, "intents", [i.action for i in expected], [i.action for i in observed])
+
+        for block_id, idx, when, fn in cases:
+            result.case_checks += 1
+            want = eval_outcome(evaluator.evaluate(when, snapshot))
+            got = fn(snapshot, 0)
+            if got is not want:
+                _record(result, exec_idx, f"{block_id}[{idx}]", want, got)
+
+    engine = create_engine_from_play(play=play, on_snapshot=on_snapshot)
+    # Evaluate every bar, not only pre-screen candidates
+    engine._config.entry_prescreen = False
+    try:
+        run_engine_with_play(engine, play)
+    except _SnapshotBudgetReached:
+        pass
+    return result
+
+
+def _record(result: RuleCompilerPlayResult, exec_idx: int, where: str, expected: Any, observed: Any) -> None:
+    result.mismatch_count += 1
+    if len(result.mismatches) < MAX_REPORTED_MISMATCHES:
+        result.mismatches.append({
+            "exec_idx": exec_idx,
+            "where": where,
+            "expected": expected,
+            "observed": observed,
+        })
+
+
+def run_rule_compiler_audit(
+    play_ids: list[str] | None = None,
+    max_snapshots: int = DEFAULT_MAX_SNAPSHOTS,
+    plays_dir: Path | None = None,
+) -> RuleCompilerAuditResult:
+    """
+    Compare compiled vs interpreted rule evaluation and time both.
+
+    Args:
+        play_ids: Plays to run (default: DEFAULT_RULE_BENCH_PLAYS)
+        max_snapshots: Evaluated snapshots per Play before the run is stopped
+        plays_dir: Optional plays root for load_play
+
+    Returns:
+        RuleCompilerAuditResult with per-Play parity and per-bar timings
+    """
+    start = time.perf_counter()
+    results: list[RuleCompilerPlayResult] = []
+    for play_id in play_ids or DEFAULT_RULE_BENCH_PLAYS:
+        try:
+            results.append(_audit_play(play_id, max_snapshots, plays_dir))
+        except Exception as e:
+            logger.error("Rule compiler audit failed for %s: %s", play_id, e)
+            results.append(RuleCompilerPlayResult(play_id=play_id, error=f"{type(e).__name__}: {e}"))
+    return RuleCompilerAuditResult(plays=results, runtime_seconds=time.perf_counter() - start)
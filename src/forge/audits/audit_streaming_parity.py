@@ -0,0 +1,187 @@
+"""
+Streaming Parity Audit.
+
+Runs each Play twice on the same synthetic candles:
+
+    in-memory  the default DataBuilder path (DataFrames -> FeedStores)
+    streaming  backtest run --streaming: chunked data prep into
+               memory-mapped FeedStore columns, paged by a FeedPager
+
+The budget defaults to 1 MB so the pager releases pages throughout the
+run. Both runs must produce the same trade count, final equity, trades
+hash and equity hash. Peak RSS after each run is reported (ru_maxrss
+never decreases, so the streaming figure is an upper bound).
+
+CLI: python trade_cli.py debug streaming-parity [--play ID ...] [--bars N] [--memory-budget-mb MB] [--json]
+"""
+
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass, field
+from typing import Any, cast
+
+from src.utils.logger import get_module_logger
+
+logger = get_module_logger(__name__)
+
+DEFAULT_STREAMING_PLAYS = ("BENCH_001_simple", "BENCH_002_multi_tf")
+DEFAULT_STREAMING_BARS = 1500
+DEFAULT_STREAMING_BUDGET_MB = 1
+
+
+@dataclass
+class StreamingParityPlayResult:
+    """Streaming vs in-memory parity of one Play."""
+    play_id: str
+    bars: int = 0
+    in_memory: dict[str, Any] = field(default_factory=dict)
+    streaming: dict[str, Any] = field(default_factory=dict)
+    mismatches: list[str] = field(default_factory=list)
+    pager_active: bool = False
+    pager_releases: int = 0
+    mapped_mb: float = 0.0
+    error: str | None = None
+
+    @property
+    def passed(self) -> bool:
+        return self.error is None and not self.mismatches
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "play_id": self.play_id,
+            "passed": self.passed,
+            "bars": self.bars,
+            "in_memory": self.in_memory,
+            "streaming": self.streaming,
+            "mismatches": self.mismatches,
+            "pager_active": self.pager_active,
+            "pager_releases": self.pager_releases,
+            "mapped_mb": round(self.mapped_mb, 1),
+            "error": self.error,
+        }
+
+
+@dataclass
+class StreamingParityAuditResult:
+    """Aggregate result across Plays."""
+    plays: list[StreamingParityPlayResult]
+    memory_budget_mb: int = DEFAULT_STREAMING_BUDGET_MB
+    runtime_seconds: float = 0.0
+
+    @property
+    def success(self) -> bool:
+        return bool(self.plays) and all(p.passed for p in self.plays)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "success": self.success,
+            "memory_budget_mb": self.memory_budget_mb,
+            "total_mismatches": sum(len(p.mismatches) for p in self.plays),
+            "runtime_seconds": round(self.runtime_seconds, 2),
+            "plays": [p.to_dict() for p in self.plays],
+        }
+
+
+def _run(play, provider, streaming: bool, memory_budget_mb: int) -> tuple[dict[str, Any], Any]:
+    """One engine run; returns its comparable outputs and the engine."""
+    from src.backtest.artifacts.hashes import compute_equity_hash, compute_trades_hash
+    from src.backtest.engine_factory import create_engine_from_play, run_engine_with_play
+    from src.utils.profiler import peak_rss_mb
+
+    window_start, window_end = provider.get_data_range(play.exec_tf)
+    started = time.perf_counter()
+    engine = create_engine_from_play(
+        play=play,
+        synthetic_provider=provider,
+        window_start=window_start,
+        window_end=window_end,
+        streaming=streaming,
+        memory_budget_mb=memory_budget_mb,
+    )
+    result = run_engine_with_play(engine, play)
+    rss = peak_rss_mb()
+    return {
+        "trades": len(result.trades),
+        "final_equity": result.final_equity,
+        "trades_hash": compute_trades_hash(result.trades),
+        "equity_hash": compute_equity_hash(result.equity_curve),
+        "run_seconds": round(time.perf_counter() - started, 2),
+        "peak_rss_mb": round(rss, 1) if rss is not None else None,
+    }, engine
+
+
+def _audit_play(play_id: str, bars: int, memory_budget_mb: int, seed: int) -> StreamingParityPlayResult:
+    from src.backtest.play import load_play
+    from src.forge.validation.synthetic_data import PatternType, generate_synthetic_candles
+    from src.forge.validation.synthetic_provider import SyntheticCandlesProvider
+
+    play = load_play(play_id)
+    tf_mapping = play.tf_mapping or {}
+    timeframes = {play.exec_tf, "1m"}
+    timeframes.update(tf for role, tf in tf_mapping.items() if role != "exec")
+    pattern = play.validation.pattern if play.validation is not None else "trending"
+    provider = SyntheticCandlesProvider(generate_synthetic_candles(
+        symbol=play.symbol_universe[0],
+        timeframes=sorted(timeframes),
+        bars_per_tf=bars,
+        seed=seed,
+        pattern=cast(PatternType, pattern),
+        align_multi_tf=True,
+    ))
+
+    result = StreamingParityPlayResult(play_id=play_id, bars=bars)
+    result.in_memory, _ = _run(play, provider, False, memory_budget_mb)
+    result.streaming, engine = _run(play, provider, True, memory_budget_mb)
+    pager = getattr(engine, "_feed_pager", None)
+    if pager is not None:
+        result.pager_active = pager.active
+        result.pager_releases = pager.releases
+        result.mapped_mb = pager.mapped_bytes / (1024 * 1024)
+
+    for key in ("trades", "final_equity", "trades_hash", "equity_hash"):
+        expected, actual = result.in_memory[key], result.streaming[key]
+        if expected != actual:
+            result.mismatches.append(f"{key}: in-memory={expected} streaming={actual}")
+    return result
+
+
+def run_streaming_parity_audit(
+    play_ids: list[str] | None = None,
+    bars: int = DEFAULT_STREAMING_BARS,
+    memory_budget_mb: int = DEFAULT_STREAMING_BUDGET_MB,
+    seed: int = 42,
+) -> StreamingParityAuditResult:
+    """
+    Check streaming backtests against in-memory runs on the same candles.
+
+    Args:
+        play_ids: Plays to run (default: BENCH_001_simple, BENCH_002_multi_tf)
+        bars: Synthetic bars per timeframe
+        memory_budget_mb: Streaming budget (small, so the pager is exercised)
+        seed: Synthetic data seed
+
+    Returns:
+        StreamingParityAuditResult with per-Play hashes, pager stats and RSS
+
+    Raises:
+        ValueError: If bars < 1 or memory_budget_mb < 1
+    """
+    if bars < 1:
+        raise ValueError(f"bars must be >= 1 for a streaming parity audit, got {bars}")
+    if memory_budget_mb < 1:
+        raise ValueError(f"memory_budget_mb must be >= 1, got {memory_budget_mb}")
+
+    started = time.perf_counter()
+    results: list[StreamingParityPlayResult] = []
+    for play_id in play_ids or list(DEFAULT_STREAMING_PLAYS):
+        try:
+            results.append(_audit_play(play_id, bars, memory_budget_mb, seed))
+        except Exception as e:
+            logger.error("Streaming parity audit failed for %s: %s", play_id, e)
+            results.append(StreamingParityPlayResult(play_id=play_id, bars=bars, error=str(e)))
+    return StreamingParityAuditResult(
+        plays=results,
+        memory_budget_mb=memory_budget_mb,
+        runtime_seconds=time.perf_counter() - started,
+    )
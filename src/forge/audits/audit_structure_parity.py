@@ -14,6 +14,9 @@ The 7 structure detectors tested:
 5. fibonacci - Fibonacci retracement/extension levels
 6. market_structure - BOS/CHoCH detection
 7. derived_zone - K slots + scalar aggregates
+
+It also gates the production vectorized backend (src/structures/vectorized.py):
+audit_vectorized_backend requires exact per-bar equality with incremental.
 """
 
 from dataclasses import dataclass, field
@@ -1383,6 +1386,195 @@ def audit_breaker_block(ohlcv: dict[str, np.ndarray], tolerance: float, dataset:
 # =============================================================================
 
 
+# Structure specs exercised by the vectorized backend audit. Every kernel in
+# VECTORIZED_STRUCTURE_REGISTRY must appear here with its gate/param variants.
+VECTORIZED_BACKEND_SPECS: list[dict[str, Any]] = [
+    {"type": "swing", "key": "swing", "params": {"left": 5, "right": 5}},
+    {"type": "trend", "key": "trend", "uses": "swing"},
+    {
+        "type": "swing", "key": "swing_gated",
+        "params": {
+            "left": 3, "right": 2, "atr_key": "atr", "major_threshold": 1.0,
+            "min_atr_move": 0.5, "strict_alternation": True,
+        },
+    },
+    {"type": "trend", "key": "trend_gated", "uses": "swing_gated", "params": {"wave_history_size": 3}},
+    {"type": "swing", "key": "swing_pct", "params": {"left": 2, "right": 4, "min_pct_move": 0.5}},
+    {"type": "rolling_window", "key": "hi_20", "params": {"size": 20, "source": "high", "mode": "max"}},
+    {"type": "rolling_window", "key": "lo_5", "params": {"size": 5, "source": "low", "mode": "min"}},
+    {"type": "rolling_window", "key": "vol_1", "params": {"size": 1, "source": "volume", "mode": "max"}},
+    {"type": "displacement", "key": "disp", "params": {"atr_key": "atr"}},
+    {
+        "type": "displacement", "key": "disp_loose",
+        "params": {"atr_key": "atr", "body_atr_min": 0.8, "wick_ratio_max": 0.9},
+    },
+    {"type": "displacement", "key": "disp_no_atr", "params": {"atr_key": "missing_atr"}},
+    {"type": "zone", "key": "demand", "uses": "swing", "params": {"zone_type": "demand", "width_atr": 1.5}},
+    {
+        "type": "zone", "key": "supply", "uses": "swing_pct",
+        "params": {"zone_type": "supply", "width_atr": 0.5, "atr_key": "atr"},
+    },
+    {
+        "type": "zone", "key": "demand_no_atr", "uses": "swing",
+        "params": {"zone_type": "demand", "width_atr": 1.0, "atr_key": "missing_atr"},
+    },
+    {"type": "fibonacci", "key": "fib", "uses": "swing", "params": {"levels": [0.382, 0.5, 0.618]}},
+    {
+        "type": "fibonacci", "key": "fib_ext", "uses": "swing_gated",
+        "params": {"levels": [0.272, 1.0], "mode": "extension"},
+    },
+    {
+        "type": "fibonacci", "key": "fib_unpaired", "uses": "swing",
+        "params": {"levels": [0.5, 1.618], "mode": "extension_down", "use_paired_anchor": False},
+    },
+    {
+        "type": "fibonacci", "key": "fib_trend", "uses": ["swing", "trend"],
+        "params": {
+            "levels": [0.618], "mode": "extension",
+            "use_paired_anchor": False, "use_trend_anchor": True,
+        },
+    },
+    {"type": "premium_discount", "key": "pd", "uses": "swing"},
+    {"type": "market_structure", "key": "ms", "uses": "swing"},
+    {"type": "market_structure", "key": "ms_wick", "uses": "swing_pct", "params": {"confirmation_close": False}},
+    {"type": "fair_value_gap", "key": "fvg", "params": {"max_active": 5}},
+    {"type": "fair_value_gap", "key": "fvg_atr", "params": {"atr_key": "atr", "min_gap_atr": 0.3, "max_active": 2}},
+    {
+        "type": "order_block", "key": "ob", "uses": "swing",
+        "params": {"atr_key": "atr", "body_atr_min": 0.5, "wick_ratio_max": 1.0},
+    },
+    {
+        "type": "order_block", "key": "ob_disp", "uses": ["swing", "disp_loose"],
+        "params": {"use_body": False, "lookback": 2, "max_active": 3},
+    },
+    # ob + ms_wick: both OB invalidations and CHoCHs are frequent, so breakers form
+    {"type": "breaker_block", "key": "brk", "uses": ["ob", "ms_wick"], "params": {"max_active": 5}},
+    {"type": "breaker_block", "key": "brk_no_ms", "uses": "ob_disp"},
+    {
+        "type": "liquidity_zones", "key": "liq", "uses": "swing_pct",
+        "params": {"atr_key": "atr", "tolerance_atr": 0.5, "sweep_atr": 0.1, "min_touches": 2},
+    },
+    {
+        "type": "liquidity_zones", "key": "liq_wide", "uses": "swing",
+        "params": {"atr_key": "atr", "tolerance_atr": 2.0, "sweep_atr": 0.0, "min_touches": 1, "max_active": 2},
+    },
+    {
+        "type": "derived_zone", "key": "dz", "uses": "swing",
+        "params": {"levels": [0.382, 0.5, 0.618], "max_active": 5, "width_pct": 0.004},
+    },
+    {
+        "type": "derived_zone", "key": "dz_ext", "uses": "swing_pct",
+        "params": {
+            "levels": [0.272], "mode": "extension", "max_active": 3,
+            "use_paired_source": False, "break_tolerance_pct": 0.0,
+        },
+    },
+    # Not eligible: atr_zigzag has no kernel, so its dependent trend stays incremental too
+    {"type": "swing", "key": "zigzag", "params": {"mode": "atr_zigzag", "atr_key": "atr"}},
+    {"type": "trend", "key": "trend_zigzag", "uses": "zigzag"},
+]
+VECTORIZED_BACKEND_INELIGIBLE = {"zigzag", "trend_zigzag"}
+
+
+def _simple_atr(ohlcv: dict[str, np.ndarray], period: int = 14) -> np.ndarray:
+    """SMA of true range (NaN during warmup) for structure audits."""
+    high, low, close = ohlcv["high"], ohlcv["low"], ohlcv["close"]
+    prev_close = np.concatenate(([close[0]], close[:-1]))
+    tr = np.maximum(high - low, np.maximum(np.abs(high - prev_close), np.abs(low - prev_close)))
+    tr[0] = high[0] - low[0]
+    atr = np.full(len(close), np.nan)
+    if len(close) >= period:
+        csum = np.cumsum(np.concatenate(([0.0], tr)))
+        atr[period - 1:] = (csum[period:] - csum[:-period]) / period
+    return atr
+
+
+def _same_value(a: Any, b: Any) -> bool:
+    """Exact equality including Python type, treating NaN == NaN."""
+    if type(a) is not type(b):
+        return False
+    if isinstance(a, float) and np.isnan(a):
+        return bool(np.isnan(b))
+    return a == b
+
+
+def audit_vectorized_backend(ohlcv: dict[str, np.ndarray], tolerance: float, dataset: str) -> StructureDetectorResult:
+    """
+    Audit the production vectorized structure backend against incremental.
+
+    Builds the same structures twice, switches one copy to the vectorized
+    backend, feeds both bar-by-bar from a non-zero start index (as the
+    backtest engine does after warmup) and requires identical values and
+    Python types for every output on every bar. Tolerance is not used:
+    the backend must be exact.
+    """
+    from types import SimpleNamespace
+
+    from src.structures import VECTORIZED_STRUCTURE_REGISTRY
+    from src.structures.base import BarData
+    from src.structures.state import TFIncrementalState
+    from src.structures.vectorized import PrecomputedStructure, vectorize_tf_state
+
+    try:
+        covered = {spec["type"] for spec in VECTORIZED_BACKEND_SPECS}
+        uncovered = sorted(set(VECTORIZED_STRUCTURE_REGISTRY) - covered)
+        if uncovered:
+            raise ValueError(f"kernels without audit specs: {uncovered}")
+
+        atr = _simple_atr(ohlcv)
+        feed = SimpleNamespace(
+            open=ohlcv["open"], high=ohlcv["high"], low=ohlcv["low"],
+            close=ohlcv["close"], volume=ohlcv["volume"], indicators={"atr": atr},
+        )
+        reference = TFIncrementalState("audit", VECTORIZED_BACKEND_SPECS)
+        vectorized = TFIncrementalState("audit", VECTORIZED_BACKEND_SPECS)
+        switched = set(vectorize_tf_state(vectorized, feed))
+        expected = {spec["key"] for spec in VECTORIZED_BACKEND_SPECS} - VECTORIZED_BACKEND_INELIGIBLE
+        if switched != expected:
+            raise ValueError(
+                f"eligibility mismatch: switched={sorted(switched)} expected={sorted(expected)}"
+            )
+
+        n = len(ohlcv["close"])
+        start = min(7, n - 1)  # Non-zero start exercises base_idx handling
+        mismatched: list[str] = []
+        keys_checked = 0
+        for i in range(start, n):
+            bar = BarData(
+                idx=i, open=float(ohlcv["open"][i]), high=float(ohlcv["high"][i]),
+                low=float(ohlcv["low"][i]), close=float(ohlcv["close"][i]),
+                volume=float(ohlcv["volume"][i]), indicators={"atr": float(atr[i])},
+            )
+            reference.update(bar)
+            vectorized.update(bar)
+            for key in switched:
+                assert isinstance(vectorized.structures[key], PrecomputedStructure)
+                for out_key in reference.list_outputs(key):
+                    keys_checked += 1
+                    ref_val = reference.get_value(key, out_key)
+                    vec_val = vectorized.get_value(key, out_key)
+                    if not _same_value(ref_val, vec_val) and len(mismatched) < 20:
+                        mismatched.append(f"{key}.{out_key}@{i}: {ref_val!r} != {vec_val!r}")
+
+        return StructureDetectorResult(
+            detector="vectorized_backend",
+            dataset=dataset,
+            passed=not mismatched,
+            max_abs_diff=0.0 if not mismatched else float("inf"),
+            mismatched_keys=mismatched,
+            total_keys_checked=keys_checked,
+            warmup_bars=start,
+        )
+    except Exception as e:
+        return StructureDetectorResult(
+            detector="vectorized_backend",
+            dataset=dataset,
+            passed=False,
+            max_abs_diff=float("inf"),
+            error_message=str(e),
+        )
+
+
 def audit_nan_resilience(ohlcv: dict[str, np.ndarray], dataset: str) -> list[StructureDetectorResult]:
     """
     Test all 7 detectors with NaN/missing indicator inputs.
@@ -1776,6 +1968,7 @@ def run_structure_parity_audit(
             audit_liquidity_zones,
             audit_premium_discount,
             audit_breaker_block,
+            audit_vectorized_backend,
         ]
 
         # Run each audit on each dataset
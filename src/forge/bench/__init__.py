@@ -0,0 +1,44 @@
+"""
+Standing performance benchmarks for the engine, indicators, structures,
+DSL, live data path and DuckDB loads.
+
+CLI: python trade_cli.py bench --help
+"""
+
+from src.forge.bench.scenarios import (
+    BENCH_PLAYS,
+    QUICK_CONFIG,
+    SCENARIOS,
+    BenchConfig,
+    BenchMetric,
+)
+from src.forge.bench.suite import (
+    DEFAULT_BASELINE_PATH,
+    DEFAULT_REGRESSION_THRESHOLD_PCT,
+    BenchComparison,
+    BenchReport,
+    MetricComparison,
+    compare_to_baseline,
+    load_bench_report,
+    resolve_threshold,
+    run_bench,
+    write_bench_report,
+)
+
+__all__ = [
+    "BENCH_PLAYS",
+    "QUICK_CONFIG",
+    "SCENARIOS",
+    "BenchConfig",
+    "BenchMetric",
+    "DEFAULT_BASELINE_PATH",
+    "DEFAULT_REGRESSION_THRESHOLD_PCT",
+    "BenchComparison",
+    "BenchReport",
+    "MetricComparison",
+    "compare_to_baseline",
+    "load_bench_report",
+    "resolve_threshold",
+    "run_bench",
+    "write_bench_report",
+]
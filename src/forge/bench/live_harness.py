@@ -0,0 +1,371 @@
+"""
+Offline end-to-end harness for the live trading path.
+
+Drives a LiveRunner through the real live stack - kline callback, candle
+queue, LiveDataProvider, PlayEngine, LiveExchange, OrderExecutor,
+ExchangeManager and the WebSocket execution callback - against a
+MockBybitClient (src/forge/bench/mock_exchange.py), with latency tracing on.
+No network, no real API keys, no journal or state files.
+
+Only the I/O edges are replaced: the exchange client, and the WebSocket
+itself (the bootstrap singleton is a MockRealtimeBootstrap, klines are handed to LiveRunner._on_kline_update, fills are pushed
+through RealtimeState.add_execution). The runner's own position sync and
+reconnect logic are not exercised.
+
+With forming_updates > 0 each closed candle is preceded by that many
+forming (unconfirmed) klines on the path from open to close, which is what
+drives the pre-arm stage (src/core/prearm.py) when prearm=True.
+
+Usage:
+    from src.forge.bench.live_harness import run_live_e2e
+
+    result = run_live_e2e("BENCH_001_simple", candles=500)
+    for line in format_latency_summary(result.latency):
+        print(line)
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, cast
+
+from src.utils.logger import get_module_logger
+
+if TYPE_CHECKING:
+    from src.backtest.play import Play
+    from src.engine.adapters.live import LiveDataProvider
+    from src.engine.interfaces import Candle
+    from src.exchanges.bybit_client import BybitClient
+
+logger = get_module_logger(__name__)
+
+_HARNESS_API_KEY = "offline-harness"
+
+
+def synthetic_live_candles(play: "Play", count: int, seed: int) -> list["Candle"]:
+    """Exec-TF synthetic candles (UTC-naive) for driving the live path."""
+    from src.backtest.runtime.timeframe import tf_duration
+    from src.engine.interfaces import Candle
+    from src.forge.validation.synthetic_data import generate_synthetic_candles
+
+    timeframe = play.exec_tf
+    pattern = play.validation.pattern if play.validation is not None else "trending"
+    df = generate_synthetic_candles(
+        timeframes=[timeframe],
+        bars_per_tf=count,
+        seed=seed,
+        pattern=pattern,  # type: ignore[arg-type]
+    ).timeframes[timeframe]
+    step = tf_duration(timeframe)
+    return [
+        Candle(
+            ts_open=ts,
+            ts_close=ts + step,
+            open=o, high=h, low=l, close=c, volume=v,
+        )
+        for ts, o, h, l, c, v in zip(
+            (t.to_pydatetime().replace(tzinfo=None) for t in df["timestamp"]),
+            df["open"].tolist(), df["high"].tolist(), df["low"].tolist(),
+            df["close"].tolist(), df["volume"].tolist(),
+        )
+    ]
+
+
+def warm_live_provider(live_dp: "LiveDataProvider", candles: list["Candle"]) -> None:
+    """
+    Offline warmup of a single-TF LiveDataProvider: seed indicators from
+    history, then replay the bars through the structure state (same as the
+    live parity audit).
+    """
+    warmup_n = len(candles)
+    live_dp._low_tf_indicators.initialize_from_history(
+        candles,
+        live_dp._get_indicator_specs_for_tf("low_tf"),
+    )
+    live_dp._init_structure_states()
+    if live_dp._low_tf_structure is not None:
+        for i in range(warmup_n):
+            live_dp._update_structure_state_for_tf(live_dp._low_tf_structure, i, candles[i], "low_tf")
+    live_dp._global_bar_count["low_tf"] = warmup_n
+    live_dp._low_tf_buffer = list(candles)
+
+
+def bar_records(candles: list["Candle"]) -> list:
+    """Candles as RealtimeState BarRecords (timestamp = ts_open)."""
+    from src.data.realtime_models import BarRecord
+
+    return [
+        BarRecord(timestamp=c.ts_open, open=c.open, high=c.high, low=c.low, close=c.close, volume=c.volume)
+        for c in candles
+    ]
+
+
+def load_live_provider(
+    play: "Play",
+    candles: list["Candle"],
+    checkpoint_path: "Path | None" = None,
+) -> "LiveDataProvider":
+    """
+    New single-TF LiveDataProvider warmed through its real startup path
+    (_load_initial_bars), with an in-memory RealtimeState bar buffer holding
+    the candles as the only bar source. With checkpoint_path the provider
+    warm-restarts from that checkpoint when it can.
+    """
+    import pandas as pd
+
+    from src.data.realtime_state import RealtimeState
+    from src.engine.adapters.live import LiveDataProvider
+
+    live_dp = LiveDataProvider(play)
+    state = RealtimeState()
+    state.init_bar_buffer(live_dp._env, live_dp.symbol, live_dp.timeframe, pd.DataFrame(), max_size=len(candles))
+    for bar in bar_records(candles):
+        state.append_bar(live_dp._env, live_dp.symbol, live_dp.timeframe, bar)
+    live_dp._realtime_state = state
+    if checkpoint_path is not None:
+        live_dp.enable_checkpoints(checkpoint_path)
+    asyncio.run(live_dp._load_initial_bars())
+    return live_dp
+
+
+@contextmanager
+def _offline_bootstrap() -> Iterator[None]:
+    """Install a MockRealtimeBootstrap as the bootstrap singleton for the block."""
+    from src.data import realtime_bootstrap
+    from src.forge.bench.mock_exchange import MockRealtimeBootstrap
+
+    with realtime_bootstrap._bootstrap_lock:
+        saved = realtime_bootstrap._realtime_bootstrap
+        realtime_bootstrap._realtime_bootstrap = MockRealtimeBootstrap()  # type: ignore[assignment]
+    try:
+        yield
+    finally:
+        with realtime_bootstrap._bootstrap_lock:
+            realtime_bootstrap._realtime_bootstrap = saved
+
+
+@dataclass
+class LiveE2EResult:
+    """Counters and latency summary of one harness run."""
+    play_id: str
+    candles: int
+    bars_processed: int = 0
+    signals_generated: int = 0
+    orders_submitted: int = 0
+    orders_filled: int = 0
+    orders_failed: int = 0
+    executions_delivered: int = 0
+    errors: list[str] = field(default_factory=list)
+    latency: dict[str, dict[str, float | int]] = field(default_factory=dict)
+    # Orders as the exchange received them (ids stripped, in arrival order)
+    orders: list[dict[str, Any]] = field(default_factory=list)
+    prearm: dict[str, Any] | None = None
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "play_id": self.play_id,
+            "candles": self.candles,
+            "bars_processed": self.bars_processed,
+            "signals_generated": self.signals_generated,
+            "orders_submitted": self.orders_submitted,
+            "orders_filled": self.orders_filled,
+            "orders_failed": self.orders_failed,
+            "executions_delivered": self.executions_delivered,
+            "errors": self.errors[-10:],
+            "latency": self.latency,
+            "orders": len(self.orders),
+            "prearm": self.prearm,
+        }
+
+
+def run_live_e2e(
+    play_id: str,
+    candles: int = 500,
+    seed: int = 42,
+    order_latency_ms: float = 0.0,
+    query_latency_ms: float = 0.0,
+    prearm: bool = False,
+    forming_updates: int = 0,
+) -> LiveE2EResult:
+    """
+    Run closed exec candles through the live stack against a mock exchange.
+
+    Args:
+        play_id: Single-TF Play (exec TF only; higher TFs are not fed)
+        candles: Candles driven after warmup
+        seed: Synthetic data seed
+        order_latency_ms: Simulated REST round trip of create_order
+        query_latency_ms: Simulated round trip of every other REST call
+        prearm: Enable PlayEngineConfig.prearm_orders
+        forming_updates: Forming exec klines sent before each closed one
+
+    Returns:
+        LiveE2EResult with runner counters and LiveRunnerStats.latency.summary()
+
+    Raises:
+        ValueError: If the Play uses more than one timeframe
+    """
+    from src.backtest.play import load_play
+
+    play = load_play(play_id)
+    tf_mapping = play.tf_mapping or {}
+    tfs = {tf_mapping.get(role, play.exec_tf) for role in ("low_tf", "med_tf", "high_tf")}
+    if len(tfs) != 1:
+        raise ValueError(f"Live harness supports single-TF Plays only; {play_id} uses {sorted(tfs)}")
+    with _offline_bootstrap():
+        return asyncio.run(_run(
+            play, candles, seed, order_latency_ms, query_latency_ms, prearm, forming_updates,
+        ))
+
+
+async def _run(
+    play: "Play",
+    count: int,
+    seed: int,
+    order_latency_ms: float,
+    query_latency_ms: float,
+    prearm: bool,
+    forming_updates: int,
+) -> LiveE2EResult:
+    from src.config.config import get_config
+    from src.data.realtime_models import KlineData
+    from src.data.realtime_state import get_realtime_state, reset_realtime_state
+    from src.engine.adapters.live import LiveDataProvider, LiveExchange
+    from src.engine.adapters.state import InMemoryStateStore
+    from src.engine.factory import _build_config_from_play
+    from src.engine.play_engine import PlayEngine
+    from src.engine.runners.live_runner import LiveRunner
+    from src.forge.bench.mock_exchange import MockBybitClient
+    from src.risk.global_risk import reset_global_risk_view
+    from src.utils.datetime_utils import datetime_to_epoch_ms
+    from src.utils.latency import clear_awaiting_executions
+
+    assert play.account is not None
+    symbol = play.symbol_universe[0]
+
+    # OrderExecutor refuses to trade without live credentials configured
+    app_config = get_config()
+    bybit_cfg = app_config.bybit
+    saved_keys = (bybit_cfg.live_api_key, bybit_cfg.live_api_secret)
+    if not saved_keys[0] or not saved_keys[1]:
+        bybit_cfg.live_api_key = bybit_cfg.live_api_key or _HARNESS_API_KEY
+        bybit_cfg.live_api_secret = bybit_cfg.live_api_secret or _HARNESS_API_KEY
+    # The process-wide exposure cap (env default $200) would block every
+    # signal after the first fill, exits included; size it to the Play account
+    saved_exposure = app_config.risk.max_total_exposure_usd
+    app_config.risk.max_total_exposure_usd = max(
+        saved_exposure, play.account.starting_equity_usdt * play.account.max_leverage,
+    )
+
+    # Fresh process-wide singletons so callbacks and snapshots from other
+    # runs (or a real session) never mix with the mock account
+    reset_realtime_state()
+    reset_global_risk_view()
+    clear_awaiting_executions()
+    realtime_state = get_realtime_state()
+    try:
+        config = _build_config_from_play(
+            play, "live", persist_state=False, config_override={"prearm_orders": prearm},
+        )
+        live_dp = LiveDataProvider(play)
+        mock = MockBybitClient(
+            equity_usdt=play.account.starting_equity_usdt,
+            order_latency_ms=order_latency_ms,
+            query_latency_ms=query_latency_ms,
+        )
+        # Duck-typed stand-in: answers the calls the live stack makes
+        exchange = LiveExchange(play, config, client=cast("BybitClient", mock))
+        engine = PlayEngine(
+            play=play,
+            data_provider=live_dp,
+            exchange=exchange,
+            state_store=InMemoryStateStore(),
+            config=config,
+        )
+
+        warmup_n = live_dp._warmup_bars
+        all_candles = synthetic_live_candles(play, warmup_n + count, seed)
+        warm_live_provider(live_dp, all_candles[:warmup_n])
+        mock.set_price(symbol, all_candles[warmup_n - 1].close)
+        mock.publish_account(realtime_state)
+        await exchange.connect()
+
+        runner = LiveRunner(engine)
+        runner._exec_tf = play.exec_tf.lower()
+        runner._play_timeframes = {runner._exec_tf}
+        runner._position_sync_ok = True
+
+        result = LiveE2EResult(play_id=play.id, candles=count)
+        for candle in all_candles[warmup_n:]:
+            start_ms = datetime_to_epoch_ms(candle.ts_open)
+            end_ms = datetime_to_epoch_ms(candle.ts_close)
+            assert start_ms is not None and end_ms is not None
+            # Forming updates walk from open to close; the last one lands
+            # just short of the close (0.9 of the move)
+            for k in range(1, forming_updates + 1):
+                price = candle.open + (candle.close - candle.open) * 0.9 * k / forming_updates
+                mock.set_price(symbol, price)
+                runner._on_kline_update(KlineData(
+                    symbol=symbol,
+                    interval=play.exec_tf,
+                    start_time=start_ms,
+                    open=candle.open,
+                    high=max(candle.open, price), low=min(candle.open, price), close=price,
+                    volume=candle.volume * k / (forming_updates + 1),
+                    turnover=candle.volume * k / (forming_updates + 1) * price,
+                    end_time=end_ms - 1,
+                    is_closed=False,
+                ))
+                await _drain(runner)
+            mock.set_price(symbol, candle.close)
+            runner._on_kline_update(KlineData(
+                symbol=symbol,
+                interval=play.exec_tf,
+                start_time=start_ms,
+                open=candle.open, high=candle.high, low=candle.low, close=candle.close,
+                volume=candle.volume,
+                turnover=candle.volume * candle.close,
+                end_time=end_ms - 1,
+                is_closed=True,
+            ))
+            await _drain(runner)
+            # Fills reach the executor the way the private WebSocket delivers them
+            result.executions_delivered += mock.deliver_executions(realtime_state)
+            mock.publish_account(realtime_state)
+        runner._flush_trace_acks()
+
+        stats = runner.stats
+        result.bars_processed = stats.bars_processed
+        result.signals_generated = stats.signals_generated
+        result.orders_submitted = stats.orders_submitted
+        result.orders_filled = stats.orders_filled
+        result.orders_failed = stats.orders_failed
+        result.errors = list(stats.errors)
+        # Synthetic candles are historical, so kline lateness is meaningless here
+        result.latency = {k: v for k, v in stats.latency.summary().items() if k != "close_lag"}
+        result.orders = [
+            {k: v for k, v in order.items() if k not in ("order_id", "order_link_id")}
+            for order in mock.orders
+        ]
+        result.prearm = stats.prearm.to_dict() if stats.prearm is not None else None
+        return result
+    finally:
+        bybit_cfg.live_api_key, bybit_cfg.live_api_secret = saved_keys
+        app_config.risk.max_total_exposure_usd = saved_exposure
+        clear_awaiting_executions()
+        reset_global_risk_view()
+        reset_realtime_state()
+
+
+async def _drain(runner) -> None:
+    """Process everything the kline callback queued, as LiveRunner._process_loop would."""
+    while not runner._candle_queue.empty():
+        queued, timeframe, _enqueued_at, trace = runner._candle_queue.get_nowait()
+        if queued is None:
+            await runner._run_prearm()
+        else:
+            await runner._run_traced_candle(queued, timeframe, trace)
@@ -0,0 +1,308 @@
+"""
+In-process stand-in for BybitClient used by the offline live harness.
+
+MockBybitClient answers the REST calls the live stack makes through
+ExchangeManager (account, instruments, risk tiers, positions, orders) from a
+small in-memory account: one-way positions per symbol, market orders fill
+immediately at the current mark, TP/SL and limit orders are accepted but
+never trigger. Every fill is queued as a WebSocket-style execution that
+deliver_executions() pushes into RealtimeState, so OrderExecutor sees the
+same callback path as in live trading; publish_account() does the same
+for the wallet stream that GlobalRiskView reads.
+
+Latency knobs (all default to zero so benchmarks measure our own code):
+    order_latency_ms   sleep inside create_order (REST round trip)
+    query_latency_ms   sleep inside every other request
+
+MockRealtimeBootstrap replaces the WebSocket bootstrap singleton for the
+same run. Not a market simulator: no slippage, fees or liquidation.
+"""
+
+from __future__ import annotations
+
+import itertools
+import threading
+import time
+from typing import Any
+
+from src.data.realtime_models import AccountMetrics, ExecutionData
+
+_MOCK_BASE_URL = "mock://bybit"
+
+
+class MockBybitClient:
+    """Offline BybitClient replacement with immediate market fills."""
+
+    def __init__(
+        self,
+        equity_usdt: float = 10_000.0,
+        order_latency_ms: float = 0.0,
+        query_latency_ms: float = 0.0,
+        tick_size: float = 0.1,
+        qty_step: float = 0.001,
+        max_leverage: int = 100,
+    ) -> None:
+        self.api_key = "mock-key"
+        self.api_secret = "mock-secret"
+        self.base_url = _MOCK_BASE_URL
+        self.order_latency_ms = order_latency_ms
+        self.query_latency_ms = query_latency_ms
+        self._tick_size = tick_size
+        self._qty_step = qty_step
+        self._max_leverage = max_leverage
+        self._wallet = equity_usdt
+        self._prices: dict[str, float] = {}
+        # symbol -> (signed qty, avg price)
+        self._positions: dict[str, tuple[float, float]] = {}
+        self._open_orders: dict[str, dict[str, Any]] = {}
+        self._pending_executions: list[ExecutionData] = []
+        self._order_ids = itertools.count(1)
+        self._lock = threading.Lock()
+        self.orders: list[dict[str, Any]] = []
+
+    # ------------------------------------------------------------------
+    # Harness controls
+    # ------------------------------------------------------------------
+
+    def set_price(self, symbol: str, price: float) -> None:
+        """Move the mark/last price of a symbol (call once per candle)."""
+        self._prices[symbol] = price
+
+    def publish_account(self, realtime_state) -> None:
+        """Push the account as a private-WebSocket wallet update (marks it connected)."""
+        realtime_state.set_private_ws_connected()
+        realtime_state.update_account_metrics(AccountMetrics.from_bybit(self.get_balance()))
+
+    def deliver_executions(self, realtime_state) -> int:
+        """Push queued fills into RealtimeState as execution messages."""
+        with self._lock:
+            pending, self._pending_executions = self._pending_executions, []
+        for execution in pending:
+            realtime_state.add_execution(execution)
+        return len(pending)
+
+    def _sleep(self, ms: float) -> None:
+        if ms > 0:
+            time.sleep(ms / 1000.0)
+
+    def _price(self, symbol: str) -> float:
+        price = self._prices.get(symbol)
+        if price is None:
+            raise ValueError(f"MockBybitClient has no price for {symbol}; call set_price() first")
+        return price
+
+    # ------------------------------------------------------------------
+    # Market data and instruments
+    # ------------------------------------------------------------------
+
+    def get_ticker(self, symbol: str | None = None, category: str = "linear") -> dict[str, Any]:
+        self._sleep(self.query_latency_ms)
+        assert symbol is not None
+        price = self._price(symbol)
+        return {
+            "symbol": symbol,
+            "lastPrice": str(price),
+            "markPrice": str(price),
+            "bid1Price": str(price - self._tick_size),
+            "ask1Price": str(price + self._tick_size),
+        }
+
+    def get_instruments(self, symbol: str | None = None, category: str = "linear") -> list[dict]:
+        self._sleep(self.query_latency_ms)
+        return [{
+            "symbol": symbol,
+            "status": "Trading",
+            "priceFilter": {"tickSize": str(self._tick_size)},
+            "lotSizeFilter": {
+                "qtyStep": str(self._qty_step),
+                "minOrderQty": str(self._qty_step),
+                "maxOrderQty": "1000000",
+                "minNotionalValue": "5",
+            },
+            "leverageFilter": {"maxLeverage": str(self._max_leverage)},
+        }]
+
+    def get_risk_limit(self, symbol: str | None = None, category: str = "linear") -> list[dict]:
+        self._sleep(self.query_latency_ms)
+        return [{
+            "id": 1,
+            "symbol": symbol,
+            "riskLimitValue": "2000000",
+            "maintenanceMarginRate": "0.005",
+            "initialMargin": "0.01",
+            "isLowestRisk": 1,
+            "maxLeverage": str(self._max_leverage),
+        }]
+
+    def get_fee_rates(self, symbol: str | None = None, category: str = "linear") -> list[dict]:
+        self._sleep(self.query_latency_ms)
+        return [{"symbol": symbol or "", "takerFeeRate": "0.00055", "makerFeeRate": "0.0002"}]
+
+    def get_time_offset(self) -> int:
+        return 0
+
+    # ------------------------------------------------------------------
+    # Account and positions
+    # ------------------------------------------------------------------
+
+    def _unrealized(self) -> float:
+        return sum(qty * (self._prices.get(sym, avg) - avg) for sym, (qty, avg) in self._positions.items())
+
+    def get_balance(self, account_type: str = "UNIFIED") -> dict:
+        self._sleep(self.query_latency_ms)
+        with self._lock:
+            equity = self._wallet + self._unrealized()
+            used = sum(abs(qty) * avg for qty, avg in self._positions.values())
+        return {
+            "totalEquity": str(equity),
+            "totalWalletBalance": str(self._wallet),
+            "totalAvailableBalance": str(max(equity - used, 0.0)),
+            "totalMarginBalance": str(equity),
+            "totalInitialMargin": str(used),
+            "totalMaintenanceMargin": str(used * 0.005),
+        }
+
+    def get_positions(
+        self, symbol: str | None = None, settle_coin: str = "USDT", category: str = "linear",
+    ) -> list[dict]:
+        self._sleep(self.query_latency_ms)
+        out = []
+        with self._lock:
+            for sym, (qty, avg) in self._positions.items():
+                if symbol is not None and sym != symbol:
+                    continue
+                mark = self._prices.get(sym, avg)
+                out.append({
+                    "symbol": sym,
+                    "side": "Buy" if qty > 0 else "Sell",
+                    "size": str(abs(qty)),
+                    "avgPrice": str(avg),
+                    "markPrice": str(mark),
+                    "unrealisedPnl": str(qty * (mark - avg)),
+                    "leverage": "1",
+                    "tradeMode": 1,
+                    "positionIdx": 0,
+                })
+        return out
+
+    def set_leverage(self, symbol: str, leverage: int, category: str = "linear") -> dict:
+        self._sleep(self.query_latency_ms)
+        return {}
+
+    def switch_cross_isolated_margin(
+        self, symbol: str, trade_mode: int, buy_leverage: str, sell_leverage: str, category: str = "linear",
+    ) -> dict:
+        self._sleep(self.query_latency_ms)
+        return {}
+
+    def switch_position_mode_v5(
+        self, mode: int, symbol: str | None = None, coin: str | None = None, category: str = "linear",
+    ) -> dict:
+        return {}
+
+    def set_disconnect_cancel_all(self, time_window: int) -> dict:
+        return {}
+
+    def set_trading_stop(self, symbol: str, **kwargs) -> dict:
+        self._sleep(self.query_latency_ms)
+        return {}
+
+    # ------------------------------------------------------------------
+    # Orders
+    # ------------------------------------------------------------------
+
+    def create_order(self, symbol: str, side: str, order_type: str, qty: float, **kwargs) -> dict:
+        self._sleep(self.order_latency_ms)
+        order_id = f"mock-{next(self._order_ids)}"
+        order_link_id = kwargs.get("order_link_id") or ""
+        qty = float(qty)
+        record = {"order_id": order_id, "symbol": symbol, "side": side, "order_type": order_type, "qty": qty, **kwargs}
+        self.orders.append(record)
+
+        if order_type != "Market":
+            with self._lock:
+                self._open_orders[order_id] = record
+            return {"orderId": order_id, "orderLinkId": order_link_id}
+
+        price = self._price(symbol)
+        signed = qty if side == "Buy" else -qty
+        with self._lock:
+            cur_qty, cur_avg = self._positions.get(symbol, (0.0, 0.0))
+            new_qty = cur_qty + signed
+            if cur_qty == 0 or (cur_qty > 0) == (signed > 0):
+                avg = (cur_qty * cur_avg + signed * price) / new_qty if new_qty else 0.0
+            else:
+                closed = min(abs(cur_qty), abs(signed))
+                self._wallet += closed * (price - cur_avg) * (1 if cur_qty > 0 else -1)
+                avg = cur_avg if abs(new_qty) > 0 and (new_qty > 0) == (cur_qty > 0) else price
+            if abs(new_qty) < self._qty_step / 2:
+                self._positions.pop(symbol, None)
+            else:
+                self._positions[symbol] = (new_qty, avg)
+            self._pending_executions.append(ExecutionData(
+                exec_id=f"{order_id}-1",
+                order_id=order_id,
+                symbol=symbol,
+                side=side,
+                price=price,
+                qty=qty,
+                exec_type="Trade",
+                order_link_id=order_link_id,
+                exec_time=int(time.time() * 1000),
+            ))
+        return {"orderId": order_id, "orderLinkId": order_link_id, "avgPrice": str(price)}
+
+    def get_open_orders(
+        self, symbol: str | None = None, order_id: str | None = None, order_link_id: str | None = None,
+        open_only: int = 0, limit: int = 50, category: str = "linear", settle_coin: str | None = None,
+    ) -> list[dict]:
+        self._sleep(self.query_latency_ms)
+        with self._lock:
+            orders = list(self._open_orders.values())
+        return [
+            {
+                "orderId": o["order_id"],
+                "orderLinkId": o.get("order_link_id") or "",
+                "symbol": o["symbol"],
+                "side": o["side"],
+                "orderType": o["order_type"],
+                "qty": str(o["qty"]),
+                "price": str(o.get("price") or 0),
+                "orderStatus": "New",
+                "reduceOnly": bool(o.get("reduce_only")),
+            }
+            for o in orders
+            if symbol is None or o["symbol"] == symbol
+        ][:limit]
+
+    def cancel_order(self, symbol: str, order_id: str | None = None, order_link_id: str | None = None, **kwargs) -> dict:
+        self._sleep(self.query_latency_ms)
+        with self._lock:
+            self._open_orders.pop(order_id or "", None)
+        return {"orderId": order_id}
+
+    def cancel_all_orders(self, symbol: str | None = None, category: str = "linear", settle_coin: str | None = None) -> dict:
+        self._sleep(self.query_latency_ms)
+        with self._lock:
+            for oid in [oid for oid, o in self._open_orders.items() if symbol is None or o["symbol"] == symbol]:
+                del self._open_orders[oid]
+        return {}
+
+
+class MockRealtimeBootstrap:
+    """
+    Stand-in for the RealtimeBootstrap singleton: reports itself running and
+    records symbol subscriptions, so order helpers that ensure WebSocket
+    tracking never build a real client (whose construction syncs server time
+    over REST).
+    """
+
+    def __init__(self) -> None:
+        self.is_running = True
+        self.symbols: set[str] = set()
+
+    def ensure_symbol_subscribed(self, symbol: str) -> None:
+        self.symbols.add(symbol)
+
+    def remove_symbol(self, symbol: str) -> None:
+        self.symbols.discard(symbol)
@@ -0,0 +1,735 @@
+"""
+Benchmark scenarios for `trade_cli.py bench`.
+
+Every scenario runs a fixed, offline workload on deterministic synthetic
+data (seeded, no network, no real DB) and returns BenchMetric rows with a
+dotted name, value, unit and direction. Workload sizes come from
+BenchConfig so the same scenario runs small in quick mode and full size
+when recording a baseline.
+
+Scenarios:
+    backtest    Exec bars/sec through BacktestRunner for the four canonical
+                bench Plays (plays/bench/): simple, multi_tf, subloop_1m,
+                structures. Engine setup time is reported separately.
+    indicators  update() calls/sec for every incremental indicator in the
+                factory, plus the aggregate across all of them
+    mad         CCI update + value per bar at lengths 14-500, streaming mean
+                absolute deviation (RollingMeanAbsDev) vs a full window rescan
+    bank        Instance updates/sec of the vectorized indicator banks (EMA,
+                SMA, RSI, ATR, MACD, BBands) at 10/100/1000 instances vs one
+                per-instance object each (final values parity-checked)
+    structures  Detector updates/sec for each structure type in the
+                structures bench Play, plus the full dependency chain
+    history     Per-bar cost of recording every structure output of the
+                structures bench Play (columnar StructureHistory vs per-field
+                deques read through get_value) and lookback reads; values
+                parity-checked
+    dsl         Rule evaluation ns/bar, compiled closures vs interpreter
+                (parity-checked on the same snapshots)
+    live        Per-candle latency of LiveDataProvider.on_candle_close()
+                (p50/p99/mean) after warmup, offline
+    live_e2e    Candle-to-order latency (total, engine, to_order_ack p50/p99)
+                through LiveRunner and OrderExecutor against MockBybitClient
+                (src/forge/bench/live_harness.py)
+    checkpoint  LiveDataProvider startup on a full bar buffer: cold warmup vs
+                warm restart from a checkpoint plus a short replay; also
+                checkpoint save time and size
+    duckdb      HistoricalDataStore.get_ohlcv() rows/sec on a temporary
+                DuckDB file seeded with synthetic 1m candles
+"""
+
+from __future__ import annotations
+
+import math
+import shutil
+import statistics
+import tempfile
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import timedelta
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from src.utils.logger import get_module_logger
+
+if TYPE_CHECKING:
+    from src.backtest.play import Play
+
+logger = get_module_logger(__name__)
+
+# Canonical bench Plays (plays/bench/). Baselines depend on these staying fixed.
+BENCH_PLAYS: dict[str, str] = {
+    "simple": "BENCH_001_simple",
+    "multi_tf": "BENCH_002_multi_tf",
+    "subloop_1m": "BENCH_003_subloop_1m",
+    "structures": "BENCH_004_structures",
+}
+
+# Single-TF Plays driven through the live data path
+LIVE_BENCH_PLAYS = ("simple", "structures")
+
+
+@dataclass(frozen=True)
+class BenchMetric:
+    """One measured value. Names are dotted: <scenario>.<subject>.<measure>."""
+    name: str
+    value: float
+    unit: str
+    higher_is_better: bool = True
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "value": round(self.value, 3),
+            "unit": self.unit,
+            "higher_is_better": self.higher_is_better,
+        }
+
+
+@dataclass(frozen=True)
+class BenchConfig:
+    """Workload sizes for all scenarios."""
+    backtest_bars: int = 4000       # exec bars per bench Play
+    indicator_bars: int = 20000     # update() calls per indicator
+    structure_bars: int = 20000     # bars through the structure chain
+    dsl_snapshots: int = 2000       # evaluated snapshots per bench Play
+    live_candles: int = 2000        # timed candles after warmup
+    duckdb_rows: int = 500_000      # 1m rows seeded into the temp DB
+    repeats: int = 3                # best-of for micro benchmarks
+    seed: int = 42
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "backtest_bars": self.backtest_bars,
+            "indicator_bars": self.indicator_bars,
+            "structure_bars": self.structure_bars,
+            "dsl_snapshots": self.dsl_snapshots,
+            "live_candles": self.live_candles,
+            "duckdb_rows": self.duckdb_rows,
+            "repeats": self.repeats,
+            "seed": self.seed,
+        }
+
+
+QUICK_CONFIG = BenchConfig(
+    backtest_bars=1000,
+    indicator_bars=5000,
+    structure_bars=5000,
+    dsl_snapshots=500,
+    live_candles=500,
+    duckdb_rows=100_000,
+    repeats=2,
+)
+
+
+# =============================================================================
+# Shared helpers
+# =============================================================================
+
+
+def _per_sec(count: int, seconds: float) -> float:
+    return count / seconds if seconds > 0 else 0.0
+
+
+def _synthetic_frame(timeframe: str, bars: int, seed: int, pattern: str = "trending"):
+    """Single-TF synthetic OHLCV DataFrame (cached on disk by the generator)."""
+    from src.forge.validation.synthetic_data import generate_synthetic_candles
+
+    candles = generate_synthetic_candles(
+        timeframes=[timeframe],
+        bars_per_tf=bars,
+        seed=seed,
+        pattern=pattern,  # type: ignore[arg-type]
+    )
+    return candles.timeframes[timeframe]
+
+
+def _play_timeframes(play: "Play") -> set[str]:
+    tf_mapping = play.tf_mapping or {}
+    tfs = {tf_mapping.get(role, play.exec_tf) for role in ("low_tf", "med_tf", "high_tf")}
+    tfs.add("1m")
+    return tfs
+
+
+def _bench_provider(play: "Play", exec_bars: int, seed: int):
+    """
+    Synthetic provider sized so the Play's exec TF gets ~exec_bars bars.
+
+    generate_synthetic_candles sizes by the slowest TF and scales the faster
+    ones to cover the same range, so convert exec bars into slowest-TF bars.
+    """
+    from src.backtest.runtime.timeframe import tf_minutes
+    from src.forge.validation.synthetic_data import generate_synthetic_candles
+    from src.forge.validation.synthetic_provider import SyntheticCandlesProvider
+
+    timeframes = _play_timeframes(play)
+    slowest = max(tf_minutes(tf) for tf in timeframes)
+    bars_per_tf = max(1, math.ceil(exec_bars * tf_minutes(play.exec_tf) / slowest))
+    pattern = play.validation.pattern if play.validation is not None else "trending"
+    candles = generate_synthetic_candles(
+        symbol=play.symbol_universe[0],
+        timeframes=sorted(timeframes),
+        bars_per_tf=bars_per_tf,
+        seed=seed,
+        pattern=pattern,  # type: ignore[arg-type]
+        align_multi_tf=True,
+    )
+    return SyntheticCandlesProvider(candles)
+
+
+# =============================================================================
+# Scenarios
+# =============================================================================
+
+
+def bench_backtest(config: BenchConfig) -> list[BenchMetric]:
+    """Exec bars/sec through BacktestRunner for each bench Play."""
+    from src.backtest.engine_factory import build_backtest_runner, create_engine_from_play
+    from src.backtest.play import load_play
+
+    metrics: list[BenchMetric] = []
+    for label, play_id in BENCH_PLAYS.items():
+        play = load_play(play_id)
+        provider = _bench_provider(play, config.backtest_bars, config.seed)
+
+        t0 = time.perf_counter()
+        engine = create_engine_from_play(play, synthetic_provider=provider, use_synthetic=False)
+        runner = build_backtest_runner(engine)
+        t1 = time.perf_counter()
+        result = runner.run()
+        t2 = time.perf_counter()
+
+        metrics.append(BenchMetric(f"backtest.{label}.bars_per_sec", _per_sec(result.bars_processed, t2 - t1), "bars/s"))
+        metrics.append(BenchMetric(f"backtest.{label}.setup_seconds", t1 - t0, "s", higher_is_better=False))
+    return metrics
+
+
+def bench_indicators(config: BenchConfig) -> list[BenchMetric]:
+    """update() calls/sec for every incremental indicator."""
+    from src.backtest.runtime.feed_store import _datetime_to_epoch_ms
+    from src.indicators.incremental import create_incremental_indicator, list_incremental_indicators
+
+    df = _synthetic_frame("15m", config.indicator_bars, config.seed)
+    rows = list(zip(
+        df["open"].tolist(),
+        df["high"].tolist(),
+        df["low"].tolist(),
+        df["close"].tolist(),
+        df["volume"].tolist(),
+        [_datetime_to_epoch_ms(ts.to_pydatetime()) for ts in df["timestamp"]],
+    ))
+
+    metrics: list[BenchMetric] = []
+    total_updates = 0
+    total_seconds = 0.0
+    for indicator_type in sorted(list_incremental_indicators()):
+        best = math.inf
+        for _ in range(config.repeats):
+            ind = create_incremental_indicator(indicator_type, {})
+            if ind is None:
+                break
+            update = ind.update
+            t0 = time.perf_counter()
+            for o, h, l, c, v, ts in rows:
+                update(open=o, high=h, low=l, close=c, volume=v, ts_open=ts)
+            best = min(best, time.perf_counter() - t0)
+        if best is math.inf:
+            continue
+        total_updates += len(rows)
+        total_seconds += best
+        metrics.append(BenchMetric(f"indicators.{indicator_type}.updates_per_sec", _per_sec(len(rows), best), "updates/s"))
+
+    metrics.append(BenchMetric("indicators.all.updates_per_sec", _per_sec(total_updates, total_seconds), "updates/s"))
+    return metrics
+
+
+# Window lengths for the mean-absolute-deviation scenario
+MAD_BENCH_LENGTHS = (14, 50, 100, 200, 500)
+
+
+def _cci_rescan(tp_values: list[float], length: int) -> list[float]:
+    """CCI with the mean deviation rescanned over the window every bar (reference)."""
+    from collections import deque
+
+    window: deque[float] = deque()
+    total = 0.0
+    out = []
+    for tp in tp_values:
+        window.append(tp)
+        total += tp
+        if len(window) > length:
+            total -= window.popleft()
+        if len(window) < length:
+            out.append(math.nan)
+            continue
+        mean = total / length
+        mean_dev = sum(abs(x - mean) for x in window) / length
+        out.append(0.0 if mean_dev == 0 else (tp - mean) / (0.015 * mean_dev))
+    return out
+
+
+def bench_mad(config: BenchConfig) -> list[BenchMetric]:
+    """CCI bars/sec per window length, streaming deviation vs window rescan."""
+    from src.indicators.incremental import IncrementalCCI
+
+    df = _synthetic_frame("15m", config.indicator_bars, config.seed)
+    rows = list(zip(df["high"].tolist(), df["low"].tolist(), df["close"].tolist()))
+    tp_values = [(h + l + c) / 3.0 for h, l, c in rows]
+
+    metrics: list[BenchMetric] = []
+    for length in MAD_BENCH_LENGTHS:
+        best_stream = math.inf
+        best_rescan = math.inf
+        values: list[float] = []
+        reference: list[float] = []
+        for _ in range(config.repeats):
+            cci = IncrementalCCI(length=length)
+            update = cci.update
+            values = []
+            t0 = time.perf_counter()
+            for h, l, c in rows:
+                update(high=h, low=l, close=c)
+                values.append(cci.value)
+            best_stream = min(best_stream, time.perf_counter() - t0)
+
+            t0 = time.perf_counter()
+            reference = _cci_rescan(tp_values, length)
+            best_rescan = min(best_rescan, time.perf_counter() - t0)
+
+        worst = max(
+            (abs(a - b) for a, b in zip(values, reference) if not (math.isnan(a) or math.isnan(b))),
+            default=0.0,
+        )
+        if worst > 1e-6:
+            raise ValueError(f"mad: CCI length {length} differs from the rescan reference by {worst:.3g}")
+        stream_rate = _per_sec(len(rows), best_stream)
+        metrics.append(BenchMetric(f"mad.cci_{length}.bars_per_sec", stream_rate, "bars/s"))
+        metrics.append(BenchMetric(
+            f"mad.cci_{length}.speedup_vs_rescan", best_rescan / best_stream if best_stream > 0 else 0.0, "x",
+        ))
+    return metrics
+
+
+BANK_BENCH_INSTANCES = (10, 100, 1000)
+
+
+def _bank_bench_params(ind_type: str, i: int) -> dict[str, Any]:
+    """Varied params per instance (engines rarely share exact settings)."""
+    if ind_type == "macd":
+        return {"fast": 8 + i % 8, "slow": 21 + i % 13, "signal": 5 + i % 5}
+    if ind_type == "bbands":
+        return {"length": 10 + i % 40, "std": 2.0}
+    return {"length": 5 + i % 45}
+
+
+def bench_bank(config: BenchConfig) -> list[BenchMetric]:
+    """Indicator bank instance updates/sec vs per-instance objects."""
+    import numpy as np
+
+    from src.indicators.incremental import IncrementalIndicator, create_incremental_indicator, create_indicator_bank
+    from src.indicators.incremental.bank import BANK_TYPES
+
+    rng = np.random.default_rng(config.seed)
+    budget = config.indicator_bars * 10  # instance updates per measurement
+    metrics: list[BenchMetric] = []
+    for ind_type in BANK_TYPES:
+        for count in BANK_BENCH_INSTANCES:
+            candles = max(50, budget // count)
+            close = 100.0 * np.exp(np.cumsum(rng.normal(0.0, 0.01, (candles, count)), axis=0))
+            spread = np.abs(rng.normal(0.0, 0.005, (candles, count))) * close
+            columns = {"high": close + spread, "low": close - spread, "close": close}
+            params = [_bank_bench_params(ind_type, i) for i in range(count)]
+            rows = {col: arr.tolist() for col, arr in columns.items()}
+
+            best_bank = math.inf
+            best_objects = math.inf
+            for _ in range(config.repeats):
+                bank = create_indicator_bank(ind_type, capacity=count)
+                for p in params:
+                    bank.add(**p)
+                inputs = [columns[col] for col in bank.INPUTS]
+                names = bank.INPUTS
+                update = bank.update
+                t0 = time.perf_counter()
+                for t in range(candles):
+                    update(**{name: arr[t] for name, arr in zip(names, inputs)})
+                best_bank = min(best_bank, time.perf_counter() - t0)
+
+                objects: list[IncrementalIndicator] = []
+                for p in params:
+                    obj = create_incremental_indicator(ind_type, p)
+                    if obj is None:
+                        raise ValueError(f"bank: {ind_type} has no per-instance incremental class")
+                    objects.append(obj)
+                high, low, close_rows = rows["high"], rows["low"], rows["close"]
+                t0 = time.perf_counter()
+                for t in range(candles):
+                    h, lo, c = high[t], low[t], close_rows[t]
+                    for j, obj in enumerate(objects):
+                        obj.update(high=h[j], low=lo[j], close=c[j])
+                best_objects = min(best_objects, time.perf_counter() - t0)
+
+                expected = np.array([obj.value for obj in objects])
+                observed = bank.values()
+                both = ~np.isnan(expected) & ~np.isnan(observed)
+                worst = float(np.max(np.abs(expected[both] - observed[both]), initial=0.0))
+                if worst > 1e-6 or (np.isnan(expected) != np.isnan(observed)).any():
+                    raise ValueError(f"bank: {ind_type} x{count} differs from per-instance objects by {worst:.3g}")
+            updates = candles * count
+            metrics.append(BenchMetric(
+                f"bank.{ind_type}_{count}.updates_per_sec", _per_sec(updates, best_bank), "updates/s",
+            ))
+            metrics.append(BenchMetric(
+                f"bank.{ind_type}_{count}.speedup_vs_objects",
+                best_objects / best_bank if best_bank > 0 else 0.0, "x",
+            ))
+    return metrics
+
+
+def _structure_bench_inputs(config: BenchConfig) -> tuple["Play", list[dict[str, Any]], list[Any]]:
+    """Structures bench Play, its exec structure specs and synthetic BarData (with atr_14)."""
+    from src.backtest.play import load_play
+    from src.indicators.incremental import IncrementalATR
+    from src.structures.base import BarData
+
+    play = load_play(BENCH_PLAYS["structures"])
+    registry = play.feature_registry
+    assert registry is not None
+    specs: list[dict[str, Any]] = []
+    for feature in registry.get_structures():
+        spec: dict[str, Any] = {
+            "type": feature.structure_type,
+            "key": feature.id,
+            "params": dict(feature.params) if feature.params else {},
+        }
+        if feature.uses:
+            spec["uses"] = list(feature.uses)
+        specs.append(spec)
+
+    pattern = play.validation.pattern if play.validation is not None else "volatile"
+    df = _synthetic_frame(play.exec_tf, config.structure_bars, config.seed, pattern)
+    atr = IncrementalATR(length=14)
+    bars: list[BarData] = []
+    for i, (o, h, l, c, v) in enumerate(zip(
+        df["open"].tolist(), df["high"].tolist(), df["low"].tolist(),
+        df["close"].tolist(), df["volume"].tolist(),
+    )):
+        atr.update(high=h, low=l, close=c)
+        indicators = {"atr_14": atr.value} if atr.is_ready else {}
+        bars.append(BarData(idx=i, open=o, high=h, low=l, close=c, volume=v, indicators=indicators))
+    return play, specs, bars
+
+
+def bench_structures(config: BenchConfig) -> list[BenchMetric]:
+    """Per-detector updates/sec and full-chain bars/sec on the structures bench Play."""
+    from src.structures import TFIncrementalState
+
+    play, specs, bars = _structure_bench_inputs(config)
+    perf = time.perf_counter_ns
+    best_by_key: dict[str, int] = {}
+    best_chain = math.inf
+    for _ in range(config.repeats):
+        # Per-detector cost: same dependency order as TFIncrementalState.update
+        state = TFIncrementalState(play.exec_tf, specs)
+        detectors = list(state.structures.items())
+        spent = dict.fromkeys(state.structures, 0)
+        for bar in bars:
+            idx = bar.idx
+            for key, detector in detectors:
+                t0 = perf()
+                detector.update(idx, bar)
+                spent[key] += perf() - t0
+        for key, ns in spent.items():
+            best_by_key[key] = min(best_by_key.get(key, ns), ns)
+
+        # Full chain through the public entry point
+        state = TFIncrementalState(play.exec_tf, specs)
+        t0 = time.perf_counter()
+        for bar in bars:
+            state.update(bar)
+        best_chain = min(best_chain, time.perf_counter() - t0)
+
+    types = {spec["key"]: spec["type"] for spec in specs}
+    metrics = [
+        BenchMetric(f"structures.{types[key]}.updates_per_sec", _per_sec(len(bars), ns / 1e9), "updates/s")
+        for key, ns in best_by_key.items()
+    ]
+    metrics.append(BenchMetric("structures.chain.bars_per_sec", _per_sec(len(bars), best_chain), "bars/s"))
+    return metrics
+
+
+def _record_history_reference(state: Any, history: dict[tuple[str, str], Any], bar_idx: int) -> None:
+    """Per-field deques of (bar_idx, value), read through the string path (reference)."""
+    from collections import deque
+
+    from src.structures import DEFAULT_HISTORY_BARS
+
+    for struct_key in state.list_structures():
+        for field in state.list_outputs(struct_key):
+            try:
+                value = state.get_value(struct_key, field)
+            except (KeyError, RuntimeError):
+                continue
+            buf = history.get((struct_key, field))
+            if buf is None:
+                buf = history[(struct_key, field)] = deque(maxlen=DEFAULT_HISTORY_BARS)
+            buf.append((bar_idx, value))
+
+
+def _history_lookup_reference(history: dict[tuple[str, str], Any], key: str, field: str, index: int) -> Any:
+    """Lookback read from the per-field deques (reference)."""
+    buf = history.get((key, field))
+    if buf and index < 0:
+        abs_idx = len(buf) + index
+        if 0 <= abs_idx < len(buf):
+            return buf[abs_idx][1]
+    return math.nan
+
+
+# Lookback offsets read per field in the history scenario
+HISTORY_LOOKBACKS = (-1, -2, -5, -20, -100)
+
+
+def bench_history(config: BenchConfig) -> list[BenchMetric]:
+    """Per-bar structure history recording and lookback reads, columnar vs per-field deques."""
+    from src.structures import StructureHistory, TFIncrementalState
+
+    play, specs, bars = _structure_bench_inputs(config)
+    perf = time.perf_counter_ns
+    best_record = best_reference = math.inf
+    history: StructureHistory | None = None
+    reference: dict[tuple[str, str], Any] = {}
+    for _ in range(config.repeats):
+        state = TFIncrementalState(play.exec_tf, specs)
+        history = StructureHistory(state)
+        reference = {}
+        spent_record = spent_reference = 0
+        for bar in bars:
+            state.update(bar)
+            t0 = perf()
+            history.record(state, bar.idx)
+            t1 = perf()
+            _record_history_reference(state, reference, bar.idx)
+            spent_reference += perf() - t1
+            spent_record += t1 - t0
+        best_record = min(best_record, spent_record)
+        best_reference = min(best_reference, spent_reference)
+    assert history is not None
+
+    # Parity: every recorded value, same type
+    for (key, field), buf in reference.items():
+        expected = [value for _, value in buf]
+        observed = history.values(key, field)
+        if len(expected) != len(observed) or any(
+            type(a) is not type(b) or (a != b and not (a != a and b != b))
+            for a, b in zip(expected, observed)
+        ):
+            raise ValueError(f"history {key}.{field}: columnar values differ from the reference")
+
+    fields = list(reference)
+    best_lookup = best_reference_lookup = math.inf
+    for _ in range(config.repeats):
+        t0 = perf()
+        for key, field in fields:
+            for index in HISTORY_LOOKBACKS:
+                history.value_at(key, field, index)
+        t1 = perf()
+        for key, field in fields:
+            for index in HISTORY_LOOKBACKS:
+                _history_lookup_reference(reference, key, field, index)
+        best_reference_lookup = min(best_reference_lookup, perf() - t1)
+        best_lookup = min(best_lookup, t1 - t0)
+    lookups = len(fields) * len(HISTORY_LOOKBACKS)
+
+    return [
+        BenchMetric("history.structures.record_us", best_record / len(bars) / 1000.0, "us", higher_is_better=False),
+        BenchMetric("history.structures.reference_record_us", best_reference / len(bars) / 1000.0, "us", higher_is_better=False),
+        BenchMetric("history.structures.record_speedup", best_reference / best_record, "x"),
+        BenchMetric("history.structures.lookup_ns", best_lookup / lookups, "ns", higher_is_better=False),
+        BenchMetric("history.structures.reference_lookup_ns", best_reference_lookup / lookups, "ns", higher_is_better=False),
+    ]
+
+
+def bench_dsl(config: BenchConfig) -> list[BenchMetric]:
+    """Rule evaluation ns/bar, compiled vs interpreted, on the bench Plays."""
+    from src.forge.audits.audit_rule_compiler import run_rule_compiler_audit
+
+    audit = run_rule_compiler_audit(
+        play_ids=list(BENCH_PLAYS.values()),
+        max_snapshots=config.dsl_snapshots,
+    )
+    label_by_id = {play_id: label for label, play_id in BENCH_PLAYS.items()}
+    metrics: list[BenchMetric] = []
+    for play in audit.plays:
+        if not play.passed:
+            detail = play.error or f"{play.mismatch_count} compiled/interpreter mismatches"
+            raise ValueError(f"Rule compiler audit failed for {play.play_id}: {detail}")
+        label = label_by_id[play.play_id]
+        metrics.append(BenchMetric(f"dsl.{label}.compiled_ns_per_bar", play.compiled_us_per_bar * 1000.0, "ns/bar", higher_is_better=False))
+        metrics.append(BenchMetric(f"dsl.{label}.interpreter_ns_per_bar", play.interpreter_us_per_bar * 1000.0, "ns/bar", higher_is_better=False))
+    return metrics
+
+
+def bench_live(config: BenchConfig) -> list[BenchMetric]:
+    """Per-candle LiveDataProvider.on_candle_close() latency after warmup."""
+    from src.backtest.play import load_play
+    from src.engine.adapters.live import LiveDataProvider
+    from src.forge.bench.live_harness import synthetic_live_candles, warm_live_provider
+
+    metrics: list[BenchMetric] = []
+    for label in LIVE_BENCH_PLAYS:
+        play = load_play(BENCH_PLAYS[label])
+        live_dp = LiveDataProvider(play)
+        warmup_n = live_dp._warmup_bars
+        timeframe = live_dp.timeframe
+        candles = synthetic_live_candles(play, warmup_n + config.live_candles, config.seed)
+        warm_live_provider(live_dp, candles[:warmup_n])
+
+        perf = time.perf_counter_ns
+        latencies_us: list[float] = []
+        for candle in candles[warmup_n:]:
+            t0 = perf()
+            live_dp.on_candle_close(candle, timeframe=timeframe)
+            latencies_us.append((perf() - t0) / 1000.0)
+
+        latencies_us.sort()
+        p50 = latencies_us[len(latencies_us) // 2]
+        p99 = latencies_us[min(len(latencies_us) - 1, int(len(latencies_us) * 0.99))]
+        metrics.append(BenchMetric(f"live.{label}.p50_us", p50, "us", higher_is_better=False))
+        metrics.append(BenchMetric(f"live.{label}.p99_us", p99, "us", higher_is_better=False))
+        metrics.append(BenchMetric(f"live.{label}.mean_us", statistics.fmean(latencies_us), "us", higher_is_better=False))
+    return metrics
+
+
+def bench_duckdb(config: BenchConfig) -> list[BenchMetric]:
+    """get_ohlcv() throughput on a temporary DuckDB seeded with synthetic 1m bars."""
+    from src.data.historical_data_store import HistoricalDataStore
+
+    df = _synthetic_frame("1m", config.duckdb_rows, config.seed)
+    df = df.assign(symbol="BTCUSDT", timeframe="1m")
+    first_ts = df["timestamp"].iloc[0].to_pydatetime()
+    last_ts = df["timestamp"].iloc[-1].to_pydatetime()
+
+    tmp_dir = Path(tempfile.mkdtemp(prefix="trade_bench_"))
+    store = HistoricalDataStore(db_path=str(tmp_dir / "bench.duckdb"))
+    try:
+        store.conn.execute(f"""
+            INSERT INTO {store.table_ohlcv} (symbol, timeframe, timestamp, open, high, low, close, volume)
+            SELECT symbol, timeframe, timestamp, open, high, low, close, volume FROM df
+        """)
+
+        best_full = math.inf
+        rows = 0
+        for _ in range(config.repeats):
+            t0 = time.perf_counter()
+            rows = len(store.get_ohlcv("BTCUSDT", "1m", start=first_ts, end=last_ts))
+            best_full = min(best_full, time.perf_counter() - t0)
+
+        # One-day windows walking through the range (typical backtest slices)
+        window = timedelta(days=1)
+        starts = [first_ts + i * window for i in range(max(1, int((last_ts - first_ts) / window)))][:50]
+        best_windows = math.inf
+        for _ in range(config.repeats):
+            t0 = time.perf_counter()
+            for start in starts:
+                store.get_ohlcv("BTCUSDT", "1m", start=start, end=start + window)
+            best_windows = min(best_windows, time.perf_counter() - t0)
+    finally:
+        store.close()
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+
+    return [
+        BenchMetric("duckdb.full_load.rows_per_sec", _per_sec(rows, best_full), "rows/s"),
+        BenchMetric("duckdb.window_load.queries_per_sec", _per_sec(len(starts), best_windows), "queries/s"),
+    ]
+
+
+def bench_live_e2e(config: BenchConfig) -> list[BenchMetric]:
+    """Candle-to-order latency through LiveRunner against the mock exchange."""
+    from src.forge.bench.live_harness import run_live_e2e
+
+    metrics: list[BenchMetric] = []
+    for label in LIVE_BENCH_PLAYS:
+        result = run_live_e2e(BENCH_PLAYS[label], candles=config.live_candles, seed=config.seed)
+        if result.bars_processed != config.live_candles:
+            raise ValueError(
+                f"live_e2e {label}: processed {result.bars_processed}/{config.live_candles} candles"
+            )
+        for span in ("total", "engine", "to_order_ack"):
+            row = result.latency.get(span)
+            if row is None or not row["count"]:
+                continue
+            for measure in ("p50", "p99"):
+                metrics.append(BenchMetric(
+                    f"live_e2e.{label}.{span}.{measure}_us", row[f"{measure}_ms"] * 1000.0, "us",
+                    higher_is_better=False,
+                ))
+    return metrics
+
+
+# Bars closed between the checkpoint and the warm restart
+CHECKPOINT_REPLAY_BARS = 5
+
+
+def bench_checkpoint(config: BenchConfig) -> list[BenchMetric]:
+    """LiveDataProvider startup: cold warmup vs checkpoint restore + short replay."""
+    from src.backtest.play import load_play
+    from src.engine.adapters.live import LiveDataProvider
+    from src.forge.bench.live_harness import load_live_provider, synthetic_live_candles
+
+    metrics: list[BenchMetric] = []
+    tmp_dir = Path(tempfile.mkdtemp(prefix="trade_bench_"))
+    try:
+        for label in LIVE_BENCH_PLAYS:
+            play = load_play(BENCH_PLAYS[label])
+            # A full bar buffer, as after a long-running session
+            history_n = LiveDataProvider(play)._buffer_size
+            candles = synthetic_live_candles(play, history_n, config.seed)
+            path = tmp_dir / f"{label}.ckpt"
+
+            best_cold = math.inf
+            for _ in range(config.repeats):
+                t0 = time.perf_counter()
+                load_live_provider(play, candles)
+                best_cold = min(best_cold, time.perf_counter() - t0)
+
+            live_dp = load_live_provider(play, candles[:-CHECKPOINT_REPLAY_BARS])
+            live_dp.enable_checkpoints(path)
+            best_save = math.inf
+            for _ in range(config.repeats):
+                t0 = time.perf_counter()
+                if live_dp.save_checkpoint() is None:
+                    raise ValueError(f"checkpoint {label}: provider not ready after {len(candles)} bars")
+                best_save = min(best_save, time.perf_counter() - t0)
+
+            best_restart = math.inf
+            for _ in range(config.repeats):
+                t0 = time.perf_counter()
+                restarted = load_live_provider(play, candles, checkpoint_path=path)
+                best_restart = min(best_restart, time.perf_counter() - t0)
+                if restarted.restored_checkpoint is None:
+                    raise ValueError(f"checkpoint {label}: warm restart fell back to a cold warmup")
+
+            metrics.append(BenchMetric(f"checkpoint.{label}.cold_warmup_ms", best_cold * 1000.0, "ms", higher_is_better=False))
+            metrics.append(BenchMetric(f"checkpoint.{label}.restart_ms", best_restart * 1000.0, "ms", higher_is_better=False))
+            metrics.append(BenchMetric(f"checkpoint.{label}.save_ms", best_save * 1000.0, "ms", higher_is_better=False))
+            metrics.append(BenchMetric(f"checkpoint.{label}.size_kb", path.stat().st_size / 1024.0, "KB", higher_is_better=False))
+            metrics.append(BenchMetric(f"checkpoint.{label}.restart_speedup", best_cold / best_restart, "x"))
+    finally:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+    return metrics
+
+
+SCENARIOS: dict[str, Callable[[BenchConfig], list[BenchMetric]]] = {
+    "backtest": bench_backtest,
+    "indicators": bench_indicators,
+    "mad": bench_mad,
+    "bank": bench_bank,
+    "structures": bench_structures,
+    "history": bench_history,
+    "dsl": bench_dsl,
+    "live": bench_live,
+    "live_e2e": bench_live_e2e,
+    "checkpoint": bench_checkpoint,
+    "duckdb": bench_duckdb,
+}
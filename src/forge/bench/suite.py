@@ -0,0 +1,339 @@
+"""
+Bench suite runner, JSON reports and baseline regression checks.
+
+run_bench() executes the selected scenarios (src/forge/bench/scenarios.py)
+and returns a BenchReport: machine info, workload config, per-scenario
+timings/errors and a flat {metric_name: {value, unit, higher_is_better}}
+map. Reports are plain JSON so any stored run can serve as a baseline.
+
+compare_to_baseline() checks every metric present in both reports against
+a regression threshold in percent. Thresholds resolve by longest matching
+metric-name prefix (DEFAULT_METRIC_THRESHOLDS, then caller overrides), so
+noisy families such as live latency can carry a wider band than
+throughput metrics.
+
+CLI: python trade_cli.py bench [--scenario NAME ...] [--quick] [--baseline PATH]
+                               [--save-baseline] [--threshold PCT]
+                               [--metric-threshold PREFIX=PCT ...] [--json]
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+from src.forge.bench.scenarios import SCENARIOS, BenchConfig, BenchMetric
+from src.utils.logger import get_module_logger
+
+logger = get_module_logger(__name__)
+
+BENCH_DIR = Path("backtests/_bench")
+DEFAULT_BASELINE_PATH = BENCH_DIR / "baseline.json"
+
+DEFAULT_REGRESSION_THRESHOLD_PCT = 10.0
+
+# Wider bands for families with more run-to-run noise
+DEFAULT_METRIC_THRESHOLDS: dict[str, float] = {
+    "backtest.": 15.0,
+    "live.": 25.0,
+    "live_e2e.": 25.0,
+    "checkpoint.": 25.0,
+    "duckdb.": 25.0,
+}
+
+REPORT_VERSION = 1
+
+
+def collect_machine_info() -> dict[str, Any]:
+    """Host, interpreter and library versions recorded with every report."""
+    import duckdb
+    import numpy
+    import pandas
+
+    info: dict[str, Any] = {
+        "hostname": platform.node(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "processor": platform.processor() or platform.machine(),
+        "cpu_count": os.cpu_count(),
+        "python": sys.version.split()[0],
+        "numpy": numpy.__version__,
+        "pandas": pandas.__version__,
+        "duckdb": duckdb.__version__,
+        "git_commit": None,
+    }
+    try:
+        info["git_commit"] = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True, text=True, timeout=5, check=True,
+        ).stdout.strip() or None
+    except (OSError, subprocess.SubprocessError):
+        pass
+    return info
+
+
+def _machine_fingerprint(machine: dict[str, Any]) -> tuple:
+    return (machine.get("platform"), machine.get("processor"), machine.get("cpu_count"), machine.get("python"))
+
+
+@dataclass
+class ScenarioResult:
+    """Metrics (or the failure) for one scenario."""
+    name: str
+    metrics: list[BenchMetric] = field(default_factory=list)
+    seconds: float = 0.0
+    error: str | None = None
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "name": self.name,
+            "seconds": round(self.seconds, 2),
+            "metric_count": len(self.metrics),
+            "error": self.error,
+        }
+
+
+@dataclass
+class BenchReport:
+    """One bench run."""
+    created_at: str
+    machine: dict[str, Any]
+    config: BenchConfig
+    quick: bool
+    scenarios: list[ScenarioResult]
+    runtime_seconds: float = 0.0
+
+    @property
+    def success(self) -> bool:
+        return all(s.error is None for s in self.scenarios)
+
+    @property
+    def metrics(self) -> dict[str, BenchMetric]:
+        return {m.name: m for s in self.scenarios for m in s.metrics}
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "version": REPORT_VERSION,
+            "created_at": self.created_at,
+            "quick": self.quick,
+            "success": self.success,
+            "runtime_seconds": round(self.runtime_seconds, 2),
+            "machine": self.machine,
+            "config": self.config.to_dict(),
+            "scenarios": [s.to_dict() for s in self.scenarios],
+            "metrics": {name: m.to_dict() for name, m in sorted(self.metrics.items())},
+        }
+
+
+def run_bench(
+    scenarios: list[str] | None = None,
+    config: BenchConfig | None = None,
+    quick: bool = False,
+) -> BenchReport:
+    """
+    Run bench scenarios and collect metrics.
+
+    Args:
+        scenarios: Scenario names from SCENARIOS (default: all, in order)
+        config: Workload sizes (default: BenchConfig())
+        quick: Recorded in the report so baselines are only compared like-for-like
+
+    Returns:
+        BenchReport; a failing scenario is recorded with its error and the
+        remaining scenarios still run
+    """
+    names = list(scenarios) if scenarios else list(SCENARIOS)
+    unknown = [n for n in names if n not in SCENARIOS]
+    if unknown:
+        raise ValueError(f"Unknown bench scenario(s): {', '.join(unknown)}. Valid: {', '.join(SCENARIOS)}")
+    config = config or BenchConfig()
+
+    start = time.perf_counter()
+    results: list[ScenarioResult] = []
+    for name in names:
+        t0 = time.perf_counter()
+        result = ScenarioResult(name=name)
+        try:
+            result.metrics = SCENARIOS[name](config)
+        except Exception as e:
+            logger.error("Bench scenario %s failed: %s", name, e)
+            result.error = f"{type(e).__name__}: {e}"
+        result.seconds = time.perf_counter() - t0
+        results.append(result)
+
+    return BenchReport(
+        created_at=datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        machine=collect_machine_info(),
+        config=config,
+        quick=quick,
+        scenarios=results,
+        runtime_seconds=time.perf_counter() - start,
+    )
+
+
+# =============================================================================
+# Baseline comparison
+# =============================================================================
+
+
+@dataclass
+class MetricComparison:
+    """One metric against its baseline value."""
+    name: str
+    baseline: float
+    current: float
+    unit: str
+    higher_is_better: bool
+    threshold_pct: float
+
+    @property
+    def change_pct(self) -> float:
+        if self.baseline == 0:
+            return 0.0
+        return (self.current - self.baseline) / abs(self.baseline) * 100.0
+
+    @property
+    def status(self) -> str:
+        # Signed so that positive always means "better"
+        gain = self.change_pct if self.higher_is_better else -self.change_pct
+        if gain < -self.threshold_pct:
+            return "regressed"
+        if gain > self.threshold_pct:
+            return "improved"
+        return "ok"
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "name": self.name,
+            "baseline": round(self.baseline, 3),
+            "current": round(self.current, 3),
+            "unit": self.unit,
+            "change_pct": round(self.change_pct, 2),
+            "threshold_pct": self.threshold_pct,
+            "status": self.status,
+        }
+
+
+@dataclass
+class BenchComparison:
+    """Current report vs a stored baseline."""
+    baseline_path: str
+    baseline_created_at: str | None
+    rows: list[MetricComparison]
+    new_metrics: list[str]
+    missing_metrics: list[str]
+    same_machine: bool
+    same_config: bool
+
+    @property
+    def regressions(self) -> list[MetricComparison]:
+        return [r for r in self.rows if r.status == "regressed"]
+
+    @property
+    def improvements(self) -> list[MetricComparison]:
+        return [r for r in self.rows if r.status == "improved"]
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "baseline_path": self.baseline_path,
+            "baseline_created_at": self.baseline_created_at,
+            "same_machine": self.same_machine,
+            "same_config": self.same_config,
+            "compared": len(self.rows),
+            "regressions": [r.to_dict() for r in self.regressions],
+            "improvements": [r.to_dict() for r in self.improvements],
+            "new_metrics": self.new_metrics,
+            "missing_metrics": self.missing_metrics,
+            "metrics": [r.to_dict() for r in self.rows],
+        }
+
+
+def resolve_threshold(
+    metric_name: str,
+    default_pct: float = DEFAULT_REGRESSION_THRESHOLD_PCT,
+    overrides: dict[str, float] | None = None,
+) -> float:
+    """Threshold for a metric: longest matching prefix wins, else default_pct."""
+    prefixes = {**DEFAULT_METRIC_THRESHOLDS, **(overrides or {})}
+    matches = [p for p in prefixes if metric_name.startswith(p)]
+    if not matches:
+        return default_pct
+    return prefixes[max(matches, key=len)]
+
+
+def compare_to_baseline(
+    current: dict[str, Any],
+    baseline: dict[str, Any],
+    baseline_path: str = "",
+    threshold_pct: float = DEFAULT_REGRESSION_THRESHOLD_PCT,
+    metric_thresholds: dict[str, float] | None = None,
+) -> BenchComparison:
+    """
+    Compare two report dicts (BenchReport.to_dict() / stored JSON).
+
+    Args:
+        current: Report being checked
+        baseline: Stored baseline report
+        baseline_path: Shown in the comparison output
+        threshold_pct: Regression threshold for metrics without a prefix rule
+        metric_thresholds: Extra {metric-name prefix: pct} rules
+
+    Returns:
+        BenchComparison with per-metric status (ok / regressed / improved)
+    """
+    cur_metrics: dict[str, dict[str, Any]] = current.get("metrics", {})
+    base_metrics: dict[str, dict[str, Any]] = baseline.get("metrics", {})
+    # Only scenarios that ran this time can be missing metrics
+    ran = {s["name"] for s in current.get("scenarios", [])}
+
+    rows = [
+        MetricComparison(
+            name=name,
+            baseline=float(base_metrics[name]["value"]),
+            current=float(entry["value"]),
+            unit=entry.get("unit", ""),
+            higher_is_better=bool(entry.get("higher_is_better", True)),
+            threshold_pct=resolve_threshold(name, threshold_pct, metric_thresholds),
+        )
+        for name, entry in sorted(cur_metrics.items())
+        if name in base_metrics
+    ]
+
+    return BenchComparison(
+        baseline_path=baseline_path,
+        baseline_created_at=baseline.get("created_at"),
+        rows=rows,
+        new_metrics=sorted(set(cur_metrics) - set(base_metrics)),
+        missing_metrics=sorted(
+            name for name in set(base_metrics) - set(cur_metrics) if name.split(".", 1)[0] in ran
+        ),
+        same_machine=_machine_fingerprint(current.get("machine", {})) == _machine_fingerprint(baseline.get("machine", {})),
+        same_config=current.get("config") == baseline.get("config"),
+    )
+
+
+def load_bench_report(path: Path | str) -> dict[str, Any]:
+    """Read a stored bench report (or baseline) JSON file."""
+    path = Path(path)
+    if not path.exists():
+        raise ValueError(f"Bench report not found: {path}")
+    data = json.loads(path.read_text(encoding="utf-8"))
+    if "metrics" not in data:
+        raise ValueError(f"Not a bench report (no 'metrics'): {path}")
+    return data
+
+
+def write_bench_report(data: dict[str, Any], path: Path | str) -> Path:
+    """Write a report dict as indented JSON, creating parent dirs."""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(data, indent=2, default=str), encoding="utf-8")
+    return path
@@ -14,10 +14,13 @@ All audit and validation code should import from this module.
 
 import hashlib
 import json
-from dataclasses import dataclass, field
+import math
+import os
+from dataclasses import asdict, dataclass, field
 from datetime import datetime, timedelta
 from pathlib import Path
 
+from ...config.constants import PROJECT_ROOT
 from ...utils.datetime_utils import utc_now
 from typing import Literal
 from types import MappingProxyType
@@ -40,6 +43,13 @@ DEFAULT_VOLATILITY = 0.02  # 2% daily volatility
 DEFAULT_TIMEFRAMES = ["1m", "5m", "15m", "1h", "4h"]
 HASH_LENGTH = 12  # SHA256 prefix length
 
+# Bump whenever a generator or _prices_to_ohlcv changes its output for the
+# same inputs - cached datasets from older versions are then ignored.
+SYNTHETIC_GENERATOR_VERSION = 1
+
+# On-disk cache of generated datasets (override with SYNTHETIC_CACHE_DIR)
+DEFAULT_SYNTHETIC_CACHE_DIR = PROJECT_ROOT / "data" / "synthetic_cache"
+
 # Timeframe to minutes mapping (Bybit intervals only)
 # Bybit intervals: 1,3,5,15,30,60,120,240,360,720,D,W,M
 TF_TO_MINUTES: dict[str, int] = {
@@ -222,6 +232,169 @@ def _compute_synthetic_hash(
     return hashlib.sha256(serialized.encode('utf-8')).hexdigest()[:HASH_LENGTH]
 
 
+# =============================================================================
+# Vectorized Generation Helpers
+# =============================================================================
+# Generators draw all random numbers for a phase in one call. numpy's
+# Generator yields the same stream whether values are drawn one at a time or
+# as an array (same distribution, same order), so batched draws reproduce the
+# per-bar loops bit for bit. Recurrences of the form p + a + b are evaluated
+# left to right in plain Python floats to keep the original rounding; a pure
+# random walk uses cumsum, which accumulates sequentially and is exact.
+
+def _phase_slices(n_bars: int, *bounds: int) -> list[slice]:
+    """
+    Split bars 1..n_bars-1 into consecutive phases.
+
+    Mirrors an ``if i < b1: ... elif i < b2: ... else: ...`` chain: bar i
+    belongs to the first phase whose bound exceeds it, the last phase takes
+    the remainder. Phases may be empty.
+    """
+    slices = []
+    start = min(1, n_bars)
+    for bound in bounds:
+        stop = max(start, min(bound, n_bars))
+        slices.append(slice(start, stop))
+        start = stop
+    slices.append(slice(start, max(start, n_bars)))
+    return slices
+
+
+def _bar_noise(rng: np.random.Generator, n_bars: int, scale) -> np.ndarray:
+    """Draw one normal(0, scale) per bar for bars 1..n_bars-1 (index 0 stays 0.0)."""
+    noise = np.zeros(n_bars)
+    noise[1:] = rng.normal(0, scale, n_bars - 1)
+    return noise
+
+
+def _bar_noise_pairs(
+    rng: np.random.Generator,
+    n_bars: int,
+    scale,
+    extra: list[tuple[slice, float]],
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Draw per-bar noise where some phases draw a second normal after it.
+
+    Every bar 1..n_bars-1 draws normal(0, scale); bars inside an ``extra``
+    (slice, scale) phase then draw normal(0, that scale). Returns the
+    (noise, second) arrays indexed by bar, second is 0.0 where not drawn.
+    """
+    has_second = np.zeros(n_bars, dtype=bool)
+    second_scale = np.zeros(n_bars)
+    for bars, extra_scale in extra:
+        has_second[bars] = True
+        second_scale[bars] = extra_scale
+    has_second = has_second[1:]
+    per_bar = 1 + has_second
+    first = np.cumsum(per_bar) - per_bar
+    second_pos = first[has_second] + 1
+
+    scales = np.full(int(per_bar.sum()), scale, dtype=float)
+    scales[second_pos] = second_scale[1:][has_second]
+    draws = rng.normal(0, scales)
+
+    noise = np.zeros(n_bars)
+    noise[1:] = draws[first]
+    second = np.zeros(n_bars)
+    second[1:][has_second] = draws[second_pos]
+    return noise, second
+
+
+def _drift_walk(prices: np.ndarray, bars: slice, drift, noise: np.ndarray) -> None:
+    """Fill prices[i] = prices[i-1] + drift + noise for bars in the slice.
+
+    ``drift`` is a scalar or a per-bar array; ``noise`` is aligned with the slice.
+    """
+    count = bars.stop - bars.start
+    if count <= 0:
+        return
+    drifts = drift.tolist() if isinstance(drift, np.ndarray) else [drift] * count
+    p = float(prices[bars.start - 1])
+    out = []
+    for d, e in zip(drifts, noise.tolist()):
+        p = p + d + e
+        out.append(p)
+    prices[bars] = out
+
+
+def _revert_walk(
+    prices: np.ndarray,
+    bars: slice,
+    target: float,
+    strength: float,
+    noise: np.ndarray,
+) -> None:
+    """Fill prices[i] = prices[i-1] + strength * (target - prices[i-1]) + noise."""
+    if bars.stop <= bars.start:
+        return
+    p = float(prices[bars.start - 1])
+    out = []
+    for e in noise.tolist():
+        p = p + strength * (target - p) + e
+        out.append(p)
+    prices[bars] = out
+
+
+def _step_walk(prices: np.ndarray, bars: slice, steps: np.ndarray) -> None:
+    """Fill prices[i] = prices[i-1] + steps for bars in the slice (sequential cumsum)."""
+    if bars.stop <= bars.start:
+        return
+    prices[bars] = np.cumsum(np.concatenate(([prices[bars.start - 1]], steps)))[1:]
+
+
+class _NormalStream:
+    """
+    Normal draws for loops whose draw count depends on the prices.
+
+    Draws ``capacity`` standard normals up front, hands them out one at a
+    time, and on ``close()`` rewinds the generator and advances it by exactly
+    the number consumed - leaving it where per-draw ``rng.normal(0, scale)``
+    calls would have. ``scale * z`` equals numpy's ``0 + scale * z``.
+    """
+
+    def __init__(self, rng: np.random.Generator, capacity: int):
+        self._rng = rng
+        self._state = rng.bit_generator.state
+        self._values = rng.standard_normal(capacity).tolist()
+        self._pos = 0
+
+    def normal(self, scale: float) -> float:
+        value = scale * self._values[self._pos]
+        self._pos += 1
+        return value
+
+    def close(self) -> None:
+        self._rng.bit_generator.state = self._state
+        self._rng.standard_normal(self._pos)
+
+
+def _draw_sequence(
+    rng: np.random.Generator,
+    kinds: np.ndarray,
+    arg1: np.ndarray,
+    arg2: np.ndarray,
+) -> np.ndarray:
+    """
+    Draw a mixed sequence of normals and uniforms in order.
+
+    ``kinds`` is True for uniform(arg1, arg2) and False for normal(0, arg1).
+    Consecutive draws of the same kind are batched into one call.
+    """
+    out = np.empty(len(kinds))
+    if len(kinds) == 0:
+        return out
+    edges = np.flatnonzero(np.diff(kinds.astype(np.int8))) + 1
+    starts = np.concatenate(([0], edges))
+    stops = np.concatenate((edges, [len(kinds)]))
+    for start, stop in zip(starts.tolist(), stops.tolist()):
+        if kinds[start]:
+            out[start:stop] = rng.uniform(arg1[start:stop], arg2[start:stop])
+        else:
+            out[start:stop] = rng.normal(0, arg1[start:stop])
+    return out
+
+
 # =============================================================================
 # Pattern Generators
 # =============================================================================
@@ -269,11 +442,9 @@ def _generate_ranging_prices(
 
     mean_reversion_strength = 0.1
 
-    for i in range(1, n_bars):
-        # Mean reversion + random walk
-        reversion = mean_reversion_strength * (base_price - prices[i-1])
-        noise = rng.normal(0, volatility * base_price)
-        prices[i] = prices[i-1] + reversion + noise
+    # Mean reversion + random walk
+    noise = _bar_noise(rng, n_bars, volatility * base_price)
+    _revert_walk(prices, slice(1, n_bars), base_price, mean_reversion_strength, noise[1:])
 
     return prices
 
@@ -288,6 +459,9 @@ def _generate_volatile_prices(
     Generate prices with high volatility spikes.
 
     Creates breakout scenarios for stop placement testing.
+
+    Stays a per-bar loop: whether a bar draws a spike or a normal move is
+    itself random, so the draws cannot be batched without changing the stream.
     """
     prices = np.zeros(n_bars)
     prices[0] = base_price
@@ -368,19 +542,17 @@ def _generate_trend_up_clean(
     total_move = base_price * cfg.trend_magnitude
     trend_rate = total_move / trend1_end
 
-    for i in range(1, n_bars):
-        noise = rng.normal(0, volatility * base_price * cfg.noise_level)
-
-        if i < trend1_end:
-            # Main trend up
-            prices[i] = prices[i-1] + trend_rate + noise
-        elif i < pullback_end:
-            # Pullback (30% of the move)
-            pullback_rate = (total_move * cfg.pullback_depth) / (pullback_end - trend1_end)
-            prices[i] = prices[i-1] - pullback_rate + noise
-        else:
-            # Continue trend
-            prices[i] = prices[i-1] + trend_rate * 0.8 + noise
+    noise = _bar_noise(rng, n_bars, volatility * base_price * cfg.noise_level)
+    trend, pullback, resume = _phase_slices(n_bars, trend1_end, pullback_end)
+
+    # Main trend up
+    _drift_walk(prices, trend, trend_rate, noise[trend])
+    # Pullback (30% of the move)
+    if pullback.stop > pullback.start:
+        pullback_rate = (total_move * cfg.pullback_depth) / (pullback_end - trend1_end)
+        _drift_walk(prices, pullback, -pullback_rate, noise[pullback])
+    # Continue trend
+    _drift_walk(prices, resume, trend_rate * 0.8, noise[resume])
 
     return prices
 
@@ -403,16 +575,14 @@ def _generate_trend_down_clean(
     total_move = base_price * cfg.trend_magnitude
     trend_rate = total_move / trend1_end
 
-    for i in range(1, n_bars):
-        noise = rng.normal(0, volatility * base_price * cfg.noise_level)
+    noise = _bar_noise(rng, n_bars, volatility * base_price * cfg.noise_level)
+    trend, rally, resume = _phase_slices(n_bars, trend1_end, rally_end)
 
-        if i < trend1_end:
-            prices[i] = prices[i-1] - trend_rate + noise
-        elif i < rally_end:
-            rally_rate = (total_move * cfg.pullback_depth) / (rally_end - trend1_end)
-            prices[i] = prices[i-1] + rally_rate + noise
-        else:
-            prices[i] = prices[i-1] - trend_rate * 0.8 + noise
+    _drift_walk(prices, trend, -trend_rate, noise[trend])
+    if rally.stop > rally.start:
+        rally_rate = (total_move * cfg.pullback_depth) / (rally_end - trend1_end)
+        _drift_walk(prices, rally, rally_rate, noise[rally])
+    _drift_walk(prices, resume, -(trend_rate * 0.8), noise[resume])
 
     return prices
 
@@ -434,9 +604,8 @@ def _generate_trend_grinding(
     trend_rate = total_move / n_bars
     low_vol = volatility * 0.3  # 30% of normal volatility
 
-    for i in range(1, n_bars):
-        noise = rng.normal(0, low_vol * base_price)
-        prices[i] = prices[i-1] + trend_rate + noise
+    noise = _bar_noise(rng, n_bars, low_vol * base_price)
+    _drift_walk(prices, slice(1, n_bars), trend_rate, noise[1:])
 
     return prices
 
@@ -453,14 +622,12 @@ def _generate_trend_parabolic(
     prices = np.zeros(n_bars)
     prices[0] = base_price
 
-    # Exponential acceleration
-    for i in range(1, n_bars):
-        # Acceleration factor increases over time
-        progress = i / n_bars
-        accel = 1 + progress * 3  # 1x to 4x acceleration
-        base_move = (base_price * cfg.trend_magnitude) / n_bars
-        noise = rng.normal(0, volatility * base_price * cfg.noise_level)
-        prices[i] = prices[i-1] + base_move * accel + noise
+    # Exponential acceleration: factor increases over time
+    progress = np.arange(1, n_bars) / n_bars
+    accel = 1 + progress * 3  # 1x to 4x acceleration
+    base_move = (base_price * cfg.trend_magnitude) / n_bars
+    noise = _bar_noise(rng, n_bars, volatility * base_price * cfg.noise_level)
+    _drift_walk(prices, slice(1, n_bars), base_move * accel, noise[1:])
 
     return prices
 
@@ -483,19 +650,22 @@ def _generate_trend_exhaustion(
     total_move = base_price * cfg.trend_magnitude
     trend_rate = total_move / trend_end
 
-    for i in range(1, n_bars):
-        noise = rng.normal(0, volatility * base_price * cfg.noise_level)
-
-        if i < trend_end:
-            # Strong trend up
-            prices[i] = prices[i-1] + trend_rate + noise
-        elif i < exhaust_end:
-            # Exhaustion - slowing, choppy
-            prices[i] = prices[i-1] + rng.normal(0, volatility * base_price * 2)
-        else:
-            # Reversal down
-            reversal_rate = total_move * 0.6 / (n_bars - exhaust_end)
-            prices[i] = prices[i-1] - reversal_rate + noise
+    trend, exhaust, reversal = _phase_slices(n_bars, trend_end, exhaust_end)
+
+    # Every bar draws noise; exhaustion bars draw a second, wider move after it
+    noise, wide = _bar_noise_pairs(
+        rng, n_bars, volatility * base_price * cfg.noise_level,
+        [(exhaust, volatility * base_price * 2)],
+    )
+
+    # Strong trend up
+    _drift_walk(prices, trend, trend_rate, noise[trend])
+    # Exhaustion - slowing, choppy
+    _step_walk(prices, exhaust, wide[exhaust])
+    # Reversal down
+    if reversal.stop > reversal.start:
+        reversal_rate = total_move * 0.6 / (n_bars - exhaust_end)
+        _drift_walk(prices, reversal, -reversal_rate, noise[reversal])
 
     return prices
 
@@ -516,21 +686,28 @@ def _generate_trend_stairs(
     bars_per_step = n_bars // steps
     step_move = (base_price * cfg.trend_magnitude) / steps
 
-    for i in range(1, n_bars):
-        step_num = i // bars_per_step
-        pos_in_step = i % bars_per_step
-        step_progress = pos_in_step / bars_per_step
-
-        noise = rng.normal(0, volatility * base_price * cfg.noise_level)
-
-        if step_progress < 0.6:  # 60% trending
-            trend_rate = step_move / (bars_per_step * 0.6)
-            prices[i] = prices[i-1] + trend_rate + noise
-        else:  # 40% consolidation
-            # Mean revert to current step level
-            target = base_price + (step_num + 1) * step_move
-            reversion = 0.1 * (target - prices[i-1])
-            prices[i] = prices[i-1] + reversion + noise
+    noise = _bar_noise(rng, n_bars, volatility * base_price * cfg.noise_level)
+    if n_bars < 2:
+        return prices
+
+    trend_rate = step_move / (bars_per_step * 0.6)
+    bars = np.arange(1, n_bars)
+    step_num = bars // bars_per_step
+    pos_in_step = bars % bars_per_step
+    step_progress = pos_in_step / bars_per_step
+    trending = step_progress < 0.6  # 60% trending, 40% consolidation
+    # Consolidation mean-reverts to the current step level
+    targets = base_price + (step_num + 1) * step_move
+
+    p = float(prices[0])
+    out = []
+    for is_trend, target, e in zip(trending.tolist(), targets.tolist(), noise[1:].tolist()):
+        if is_trend:
+            p = p + trend_rate + e
+        else:
+            p = p + 0.1 * (target - p) + e
+        out.append(p)
+    prices[1:] = out
 
     return prices
 
@@ -551,10 +728,8 @@ def _generate_range_tight(
     squeeze_vol = cfg.volatility_squeeze
     mean_reversion = 0.2
 
-    for i in range(1, n_bars):
-        reversion = mean_reversion * (base_price - prices[i-1])
-        noise = rng.normal(0, squeeze_vol * base_price)
-        prices[i] = prices[i-1] + reversion + noise
+    noise = _bar_noise(rng, n_bars, squeeze_vol * base_price)
+    _revert_walk(prices, slice(1, n_bars), base_price, mean_reversion, noise[1:])
 
     return prices
 
@@ -574,18 +749,27 @@ def _generate_range_wide(
     range_high = base_price * (1 + cfg.range_width / 2)
     range_low = base_price * (1 - cfg.range_width / 2)
 
-    for i in range(1, n_bars):
+    # Boundary hits draw an extra normal, so at most two draws per bar
+    stream = _NormalStream(rng, 2 * max(n_bars - 1, 0))
+    change_scale = volatility * base_price * 1.5
+    bounce_scale = volatility * base_price
+
+    p = float(prices[0])
+    out = []
+    for _ in range(1, n_bars):
         # Random walk with boundary reflection
-        change = rng.normal(0, volatility * base_price * 1.5)
-        new_price = prices[i-1] + change
+        new_price = p + stream.normal(change_scale)
 
         # Soft boundaries - mean revert when near edges
         if new_price > range_high:
-            new_price = range_high - abs(rng.normal(0, volatility * base_price))
+            new_price = range_high - abs(stream.normal(bounce_scale))
         elif new_price < range_low:
-            new_price = range_low + abs(rng.normal(0, volatility * base_price))
+            new_price = range_low + abs(stream.normal(bounce_scale))
 
-        prices[i] = new_price
+        p = new_price
+        out.append(p)
+    stream.close()
+    prices[1:] = out
 
     return prices
 
@@ -604,20 +788,19 @@ def _generate_range_ascending(
 
     resistance = base_price * (1 + cfg.range_width / 2)
 
-    for i in range(1, n_bars):
-        progress = i / n_bars
-        # Rising support level
-        support = base_price * (1 - cfg.range_width / 2) + progress * base_price * cfg.range_width * 0.8
+    progress = np.arange(1, n_bars) / n_bars
+    # Rising support level
+    support = base_price * (1 - cfg.range_width / 2) + progress * base_price * cfg.range_width * 0.8
 
-        noise = rng.normal(0, volatility * base_price * cfg.noise_level)
-        mid = (support + resistance) / 2
+    noise = _bar_noise(rng, n_bars, volatility * base_price * cfg.noise_level)
+    mid = (support + resistance) / 2
 
-        # Oscillate between support and resistance
-        phase = np.sin(progress * 8 * np.pi)
-        prices[i] = mid + phase * (resistance - support) / 2 + noise
+    # Oscillate between support and resistance
+    phase = np.sin(progress * 8 * np.pi)
+    raw = mid + phase * (resistance - support) / 2 + noise[1:]
 
-        # Enforce boundaries
-        prices[i] = max(support, min(resistance, prices[i]))
+    # Enforce boundaries
+    prices[1:] = np.maximum(support, np.minimum(resistance, raw))
 
     return prices
 
@@ -636,18 +819,17 @@ def _generate_range_descending(
 
     support = base_price * (1 - cfg.range_width / 2)
 
-    for i in range(1, n_bars):
-        progress = i / n_bars
-        # Falling resistance level
-        resistance = base_price * (1 + cfg.range_width / 2) - progress * base_price * cfg.range_width * 0.8
+    progress = np.arange(1, n_bars) / n_bars
+    # Falling resistance level
+    resistance = base_price * (1 + cfg.range_width / 2) - progress * base_price * cfg.range_width * 0.8
 
-        noise = rng.normal(0, volatility * base_price * cfg.noise_level)
-        mid = (support + resistance) / 2
+    noise = _bar_noise(rng, n_bars, volatility * base_price * cfg.noise_level)
+    mid = (support + resistance) / 2
 
-        phase = np.sin(progress * 8 * np.pi)
-        prices[i] = mid + phase * (resistance - support) / 2 + noise
+    phase = np.sin(progress * 8 * np.pi)
+    raw = mid + phase * (resistance - support) / 2 + noise[1:]
 
-        prices[i] = max(support, min(resistance, prices[i]))
+    prices[1:] = np.maximum(support, np.minimum(resistance, raw))
 
     return prices
 
@@ -667,17 +849,17 @@ def _generate_reversal_v_bottom(
     bottom_bar = n_bars // 2
     drop_magnitude = base_price * cfg.trend_magnitude
 
-    for i in range(1, n_bars):
-        noise = rng.normal(0, volatility * base_price * cfg.noise_level)
+    noise = _bar_noise(rng, n_bars, volatility * base_price * cfg.noise_level)
+    drop, recovery = _phase_slices(n_bars, bottom_bar)
 
-        if i < bottom_bar:
-            # Sharp drop
-            drop_rate = drop_magnitude / bottom_bar
-            prices[i] = prices[i-1] - drop_rate + noise
-        else:
-            # Sharp recovery
-            recovery_rate = drop_magnitude / (n_bars - bottom_bar)
-            prices[i] = prices[i-1] + recovery_rate + noise
+    # Sharp drop
+    if drop.stop > drop.start:
+        drop_rate = drop_magnitude / bottom_bar
+        _drift_walk(prices, drop, -drop_rate, noise[drop])
+    # Sharp recovery
+    if recovery.stop > recovery.start:
+        recovery_rate = drop_magnitude / (n_bars - bottom_bar)
+        _drift_walk(prices, recovery, recovery_rate, noise[recovery])
 
     return prices
 
@@ -697,15 +879,15 @@ def _generate_reversal_v_top(
     top_bar = n_bars // 2
     rise_magnitude = base_price * cfg.trend_magnitude
 
-    for i in range(1, n_bars):
-        noise = rng.normal(0, volatility * base_price * cfg.noise_level)
+    noise = _bar_noise(rng, n_bars, volatility * base_price * cfg.noise_level)
+    rise, drop = _phase_slices(n_bars, top_bar)
 
-        if i < top_bar:
-            rise_rate = rise_magnitude / top_bar
-            prices[i] = prices[i-1] + rise_rate + noise
-        else:
-            drop_rate = rise_magnitude / (n_bars - top_bar)
-            prices[i] = prices[i-1] - drop_rate + noise
+    if rise.stop > rise.start:
+        rise_rate = rise_magnitude / top_bar
+        _drift_walk(prices, rise, rise_rate, noise[rise])
+    if drop.stop > drop.start:
+        drop_rate = rise_magnitude / (n_bars - top_bar)
+        _drift_walk(prices, drop, -drop_rate, noise[drop])
 
     return prices
 
@@ -730,21 +912,14 @@ def _generate_reversal_double_bottom(
 
     bottom_price = base_price - drop_magnitude
 
-    for i in range(1, n_bars):
-        noise = rng.normal(0, volatility * base_price * cfg.noise_level)
-
-        if i < first_bottom:
-            rate = drop_magnitude / first_bottom
-            prices[i] = prices[i-1] - rate + noise
-        elif i < middle_peak:
-            rate = (drop_magnitude * 0.5) / (middle_peak - first_bottom)
-            prices[i] = prices[i-1] + rate + noise
-        elif i < second_bottom:
-            rate = (drop_magnitude * 0.5) / (second_bottom - middle_peak)
-            prices[i] = prices[i-1] - rate + noise
-        else:
-            rate = drop_magnitude / (n_bars - second_bottom)
-            prices[i] = prices[i-1] + rate + noise
+    noise = _bar_noise(rng, n_bars, volatility * base_price * cfg.noise_level)
+    legs = _phase_slices(n_bars, first_bottom, middle_peak, second_bottom)
+    leg_bars = (first_bottom, middle_peak - first_bottom, second_bottom - middle_peak, n_bars - second_bottom)
+    leg_moves = (-drop_magnitude, drop_magnitude * 0.5, -(drop_magnitude * 0.5), drop_magnitude)
+
+    for bars, n_leg, move in zip(legs, leg_bars, leg_moves):
+        if bars.stop > bars.start:
+            _drift_walk(prices, bars, move / n_leg, noise[bars])
 
     return prices
 
@@ -766,21 +941,14 @@ def _generate_reversal_double_top(
     second_top = int(n_bars * 0.75)
     rise_magnitude = base_price * cfg.trend_magnitude
 
-    for i in range(1, n_bars):
-        noise = rng.normal(0, volatility * base_price * cfg.noise_level)
-
-        if i < first_top:
-            rate = rise_magnitude / first_top
-            prices[i] = prices[i-1] + rate + noise
-        elif i < middle_dip:
-            rate = (rise_magnitude * 0.5) / (middle_dip - first_top)
-            prices[i] = prices[i-1] - rate + noise
-        elif i < second_top:
-            rate = (rise_magnitude * 0.5) / (second_top - middle_dip)
-            prices[i] = prices[i-1] + rate + noise
-        else:
-            rate = rise_magnitude / (n_bars - second_top)
-            prices[i] = prices[i-1] - rate + noise
+    noise = _bar_noise(rng, n_bars, volatility * base_price * cfg.noise_level)
+    legs = _phase_slices(n_bars, first_top, middle_dip, second_top)
+    leg_bars = (first_top, middle_dip - first_top, second_top - middle_dip, n_bars - second_top)
+    leg_moves = (rise_magnitude, -(rise_magnitude * 0.5), rise_magnitude * 0.5, -rise_magnitude)
+
+    for bars, n_leg, move in zip(legs, leg_bars, leg_moves):
+        if bars.stop > bars.start:
+            _drift_walk(prices, bars, move / n_leg, noise[bars])
 
     return prices
 
@@ -803,22 +971,21 @@ def _generate_breakout_clean(
     range_high = base_price * (1 + cfg.range_width / 4)
     range_low = base_price * (1 - cfg.range_width / 4)
 
-    for i in range(1, n_bars):
-        noise = rng.normal(0, volatility * base_price * cfg.noise_level)
-
-        if i < range_end:
-            # Consolidation
-            mid = (range_high + range_low) / 2
-            phase = np.sin(i / range_end * 6 * np.pi)
-            prices[i] = mid + phase * (range_high - range_low) / 2 + noise
-        elif i < breakout_end:
-            # Breakout bar(s) - strong move
-            rate = (base_price * cfg.trend_magnitude * 0.3) / (breakout_end - range_end)
-            prices[i] = prices[i-1] + rate + noise
-        else:
-            # Follow-through
-            rate = (base_price * cfg.trend_magnitude * 0.5) / (n_bars - breakout_end)
-            prices[i] = prices[i-1] + rate + noise
+    noise = _bar_noise(rng, n_bars, volatility * base_price * cfg.noise_level)
+    consolidation, breakout, follow = _phase_slices(n_bars, range_end, breakout_end)
+
+    # Consolidation
+    mid = (range_high + range_low) / 2
+    phase = np.sin(np.arange(consolidation.start, consolidation.stop) / range_end * 6 * np.pi)
+    prices[consolidation] = mid + phase * (range_high - range_low) / 2 + noise[consolidation]
+    # Breakout bar(s) - strong move
+    if breakout.stop > breakout.start:
+        rate = (base_price * cfg.trend_magnitude * 0.3) / (breakout_end - range_end)
+        _drift_walk(prices, breakout, rate, noise[breakout])
+    # Follow-through
+    if follow.stop > follow.start:
+        rate = (base_price * cfg.trend_magnitude * 0.5) / (n_bars - breakout_end)
+        _drift_walk(prices, follow, rate, noise[follow])
 
     return prices
 
@@ -842,26 +1009,25 @@ def _generate_breakout_false(
     range_high = base_price * (1 + cfg.range_width / 4)
     range_low = base_price * (1 - cfg.range_width / 4)
 
-    for i in range(1, n_bars):
-        noise = rng.normal(0, volatility * base_price * cfg.noise_level)
-
-        if i < range_end:
-            mid = (range_high + range_low) / 2
-            phase = np.sin(i / range_end * 6 * np.pi)
-            prices[i] = mid + phase * (range_high - range_low) / 2 + noise
-        elif i < fakeout_end:
-            # False breakout up
-            rate = (base_price * cfg.hunt_depth * 2) / (fakeout_end - range_end)
-            prices[i] = prices[i-1] + rate + noise
-        elif i < reversal_end:
-            # Sharp reversal down through range
-            rate = (base_price * cfg.range_width) / (reversal_end - fakeout_end)
-            prices[i] = prices[i-1] - rate + noise
-        else:
-            # Settle at lower level
-            target = range_low - base_price * cfg.range_width * 0.2
-            reversion = 0.1 * (target - prices[i-1])
-            prices[i] = prices[i-1] + reversion + noise
+    noise = _bar_noise(rng, n_bars, volatility * base_price * cfg.noise_level)
+    consolidation, fakeout, reversal, settle = _phase_slices(
+        n_bars, range_end, fakeout_end, reversal_end,
+    )
+
+    mid = (range_high + range_low) / 2
+    phase = np.sin(np.arange(consolidation.start, consolidation.stop) / range_end * 6 * np.pi)
+    prices[consolidation] = mid + phase * (range_high - range_low) / 2 + noise[consolidation]
+    # False breakout up
+    if fakeout.stop > fakeout.start:
+        rate = (base_price * cfg.hunt_depth * 2) / (fakeout_end - range_end)
+        _drift_walk(prices, fakeout, rate, noise[fakeout])
+    # Sharp reversal down through range
+    if reversal.stop > reversal.start:
+        rate = (base_price * cfg.range_width) / (reversal_end - fakeout_end)
+        _drift_walk(prices, reversal, -rate, noise[reversal])
+    # Settle at lower level
+    target = range_low - base_price * cfg.range_width * 0.2
+    _revert_walk(prices, settle, target, 0.1, noise[settle])
 
     return prices
 
@@ -884,26 +1050,24 @@ def _generate_breakout_retest(
 
     range_high = base_price * (1 + cfg.range_width / 4)
 
-    for i in range(1, n_bars):
-        noise = rng.normal(0, volatility * base_price * cfg.noise_level)
-
-        if i < range_end:
-            mid = base_price
-            phase = np.sin(i / range_end * 6 * np.pi) * cfg.range_width / 4
-            prices[i] = mid + phase * base_price + noise
-        elif i < breakout_end:
-            # Breakout
-            rate = (range_high * 0.1) / (breakout_end - range_end)
-            prices[i] = prices[i-1] + rate + noise
-        elif i < retest_end:
-            # Pullback to retest breakout level
-            target = range_high
-            reversion = 0.15 * (target - prices[i-1])
-            prices[i] = prices[i-1] + reversion + noise
-        else:
-            # Continuation up
-            rate = (base_price * cfg.trend_magnitude * 0.5) / (n_bars - retest_end)
-            prices[i] = prices[i-1] + rate + noise
+    noise = _bar_noise(rng, n_bars, volatility * base_price * cfg.noise_level)
+    consolidation, breakout, retest, continuation = _phase_slices(
+        n_bars, range_end, breakout_end, retest_end,
+    )
+
+    mid = base_price
+    phase = np.sin(np.arange(consolidation.start, consolidation.stop) / range_end * 6 * np.pi) * cfg.range_width / 4
+    prices[consolidation] = mid + phase * base_price + noise[consolidation]
+    # Breakout
+    if breakout.stop > breakout.start:
+        rate = (range_high * 0.1) / (breakout_end - range_end)
+        _drift_walk(prices, breakout, rate, noise[breakout])
+    # Pullback to retest breakout level
+    _revert_walk(prices, retest, range_high, 0.15, noise[retest])
+    # Continuation up
+    if continuation.stop > continuation.start:
+        rate = (base_price * cfg.trend_magnitude * 0.5) / (n_bars - retest_end)
+        _drift_walk(prices, continuation, rate, noise[continuation])
 
     return prices
 
@@ -923,24 +1087,27 @@ def _generate_vol_squeeze_expand(
     squeeze_end = int(n_bars * 0.6)
     expansion_end = int(n_bars * 0.75)
 
-    for i in range(1, n_bars):
-        if i < squeeze_end:
-            # Decreasing volatility squeeze
-            progress = i / squeeze_end
-            current_vol = cfg.volatility_base * (1 - progress * 0.8)  # Vol decreases to 20%
-            noise = rng.normal(0, current_vol * base_price)
-            # Slight drift up
-            prices[i] = prices[i-1] + base_price * 0.0001 + noise
-        elif i < expansion_end:
-            # Volatility expansion with direction
-            noise = rng.normal(0, cfg.volatility_spike * base_price)
-            rate = (base_price * cfg.trend_magnitude * 0.3) / (expansion_end - squeeze_end)
-            prices[i] = prices[i-1] + rate + noise
-        else:
-            # Continue with elevated volatility
-            noise = rng.normal(0, cfg.volatility_base * 1.5 * base_price)
-            rate = (base_price * cfg.trend_magnitude * 0.3) / (n_bars - expansion_end)
-            prices[i] = prices[i-1] + rate + noise
+    squeeze, expansion, elevated = _phase_slices(n_bars, squeeze_end, expansion_end)
+
+    # Volatility per phase: decreasing squeeze (down to 20%), spike, elevated
+    scales = np.zeros(n_bars)
+    progress = np.arange(squeeze.start, squeeze.stop) / max(squeeze_end, 1)
+    current_vol = cfg.volatility_base * (1 - progress * 0.8)
+    scales[squeeze] = current_vol * base_price
+    scales[expansion] = cfg.volatility_spike * base_price
+    scales[elevated] = cfg.volatility_base * 1.5 * base_price
+    noise = _bar_noise(rng, n_bars, scales[1:])
+
+    # Slight drift up
+    _drift_walk(prices, squeeze, base_price * 0.0001, noise[squeeze])
+    # Volatility expansion with direction
+    if expansion.stop > expansion.start:
+        rate = (base_price * cfg.trend_magnitude * 0.3) / (expansion_end - squeeze_end)
+        _drift_walk(prices, expansion, rate, noise[expansion])
+    # Continue with elevated volatility
+    if elevated.stop > elevated.start:
+        rate = (base_price * cfg.trend_magnitude * 0.3) / (n_bars - expansion_end)
+        _drift_walk(prices, elevated, rate, noise[elevated])
 
     return prices
 
@@ -963,23 +1130,25 @@ def _generate_vol_spike_recover(
 
     crash_magnitude = base_price * cfg.volatility_spike * 2
 
-    for i in range(1, n_bars):
-        noise = rng.normal(0, volatility * base_price * cfg.noise_level)
-
-        if i < normal_end:
-            # Normal trading
-            prices[i] = prices[i-1] + rng.normal(0, volatility * base_price)
-        elif i < crash_end:
-            # Flash crash
-            rate = crash_magnitude / (crash_end - normal_end)
-            prices[i] = prices[i-1] - rate + noise * 0.5
-        elif i < recovery_end:
-            # V-recovery
-            rate = crash_magnitude / (recovery_end - crash_end)
-            prices[i] = prices[i-1] + rate + noise * 0.5
-        else:
-            # Back to normal
-            prices[i] = prices[i-1] + rng.normal(0, volatility * base_price)
+    normal, crash, recovery, after = _phase_slices(n_bars, normal_end, crash_end, recovery_end)
+    # Normal trading bars draw their move after the (unused) noise draw
+    noise, move = _bar_noise_pairs(
+        rng, n_bars, volatility * base_price * cfg.noise_level,
+        [(normal, volatility * base_price), (after, volatility * base_price)],
+    )
+
+    # Normal trading
+    _step_walk(prices, normal, move[normal])
+    # Flash crash
+    if crash.stop > crash.start:
+        rate = crash_magnitude / (crash_end - normal_end)
+        _drift_walk(prices, crash, -rate, noise[crash] * 0.5)
+    # V-recovery
+    if recovery.stop > recovery.start:
+        rate = crash_magnitude / (recovery_end - crash_end)
+        _drift_walk(prices, recovery, rate, noise[recovery] * 0.5)
+    # Back to normal
+    _step_walk(prices, after, move[after])
 
     return prices
 
@@ -1001,19 +1170,21 @@ def _generate_vol_spike_continue(
 
     crash_magnitude = base_price * cfg.volatility_spike * 2
 
-    for i in range(1, n_bars):
-        noise = rng.normal(0, volatility * base_price * cfg.noise_level)
-
-        if i < normal_end:
-            prices[i] = prices[i-1] + rng.normal(0, volatility * base_price)
-        elif i < crash_end:
-            # Sharp crash
-            rate = crash_magnitude / (crash_end - normal_end)
-            prices[i] = prices[i-1] - rate + noise * 0.5
-        else:
-            # Continued selling, slower pace
-            rate = crash_magnitude * 0.3 / (n_bars - crash_end)
-            prices[i] = prices[i-1] - rate + rng.normal(0, volatility * base_price * 1.5)
+    normal, crash, selling = _phase_slices(n_bars, normal_end, crash_end)
+    noise, move = _bar_noise_pairs(
+        rng, n_bars, volatility * base_price * cfg.noise_level,
+        [(normal, volatility * base_price), (selling, volatility * base_price * 1.5)],
+    )
+
+    _step_walk(prices, normal, move[normal])
+    # Sharp crash
+    if crash.stop > crash.start:
+        rate = crash_magnitude / (crash_end - normal_end)
+        _drift_walk(prices, crash, -rate, noise[crash] * 0.5)
+    # Continued selling, slower pace
+    if selling.stop > selling.start:
+        rate = crash_magnitude * 0.3 / (n_bars - crash_end)
+        _drift_walk(prices, selling, -rate, move[selling])
 
     return prices
 
@@ -1030,12 +1201,11 @@ def _generate_vol_decay(
     prices = np.zeros(n_bars)
     prices[0] = base_price
 
-    for i in range(1, n_bars):
-        progress = i / n_bars
-        # Volatility decays from high to low
-        current_vol = cfg.volatility_spike * (1 - progress * 0.9) + cfg.volatility_squeeze
-        noise = rng.normal(0, current_vol * base_price)
-        prices[i] = prices[i-1] + noise
+    progress = np.arange(1, n_bars) / n_bars
+    # Volatility decays from high to low
+    current_vol = cfg.volatility_spike * (1 - progress * 0.9) + cfg.volatility_squeeze
+    noise = _bar_noise(rng, n_bars, current_vol * base_price)
+    _step_walk(prices, slice(1, n_bars), noise[1:])
 
     return prices
 
@@ -1059,27 +1229,27 @@ def _generate_liquidity_hunt_lows(
     support = base_price * (1 - cfg.range_width / 4)
     hunt_low = support * (1 - cfg.hunt_depth)
 
-    for i in range(1, n_bars):
-        noise = rng.normal(0, volatility * base_price * cfg.noise_level)
-
-        if i < range_end:
-            # Range with defined support
-            mid = base_price
-            phase = np.sin(i / range_end * 8 * np.pi)
-            amplitude = (base_price - support) * 0.8
-            prices[i] = support + amplitude + phase * amplitude * 0.3 + noise
-        elif i < hunt_end:
-            # Sweep below support
-            rate = (support - hunt_low) / (hunt_end - range_end)
-            prices[i] = prices[i-1] - rate + noise * 0.3
-        elif i < recovery_end:
-            # Sharp recovery
-            rate = (base_price - hunt_low) / (recovery_end - hunt_end)
-            prices[i] = prices[i-1] + rate + noise
-        else:
-            # Continue higher
-            rate = (base_price * cfg.trend_magnitude * 0.3) / (n_bars - recovery_end)
-            prices[i] = prices[i-1] + rate + noise
+    noise = _bar_noise(rng, n_bars, volatility * base_price * cfg.noise_level)
+    ranging, hunt, recovery, continuation = _phase_slices(
+        n_bars, range_end, hunt_end, recovery_end,
+    )
+
+    # Range with defined support
+    phase = np.sin(np.arange(ranging.start, ranging.stop) / range_end * 8 * np.pi)
+    amplitude = (base_price - support) * 0.8
+    prices[ranging] = support + amplitude + phase * amplitude * 0.3 + noise[ranging]
+    # Sweep below support
+    if hunt.stop > hunt.start:
+        rate = (support - hunt_low) / (hunt_end - range_end)
+        _drift_walk(prices, hunt, -rate, noise[hunt] * 0.3)
+    # Sharp recovery
+    if recovery.stop > recovery.start:
+        rate = (base_price - hunt_low) / (recovery_end - hunt_end)
+        _drift_walk(prices, recovery, rate, noise[recovery])
+    # Continue higher
+    if continuation.stop > continuation.start:
+        rate = (base_price * cfg.trend_magnitude * 0.3) / (n_bars - recovery_end)
+        _drift_walk(prices, continuation, rate, noise[continuation])
 
     return prices
 
@@ -1103,23 +1273,21 @@ def _generate_liquidity_hunt_highs(
     resistance = base_price * (1 + cfg.range_width / 4)
     hunt_high = resistance * (1 + cfg.hunt_depth)
 
-    for i in range(1, n_bars):
-        noise = rng.normal(0, volatility * base_price * cfg.noise_level)
-
-        if i < range_end:
-            mid = base_price
-            phase = np.sin(i / range_end * 8 * np.pi)
-            amplitude = (resistance - base_price) * 0.8
-            prices[i] = base_price + phase * amplitude + noise
-        elif i < hunt_end:
-            rate = (hunt_high - resistance) / (hunt_end - range_end)
-            prices[i] = prices[i-1] + rate + noise * 0.3
-        elif i < drop_end:
-            rate = (hunt_high - base_price) / (drop_end - hunt_end)
-            prices[i] = prices[i-1] - rate + noise
-        else:
-            rate = (base_price * cfg.trend_magnitude * 0.3) / (n_bars - drop_end)
-            prices[i] = prices[i-1] - rate + noise
+    noise = _bar_noise(rng, n_bars, volatility * base_price * cfg.noise_level)
+    ranging, hunt, drop, continuation = _phase_slices(n_bars, range_end, hunt_end, drop_end)
+
+    phase = np.sin(np.arange(ranging.start, ranging.stop) / range_end * 8 * np.pi)
+    amplitude = (resistance - base_price) * 0.8
+    prices[ranging] = base_price + phase * amplitude + noise[ranging]
+    if hunt.stop > hunt.start:
+        rate = (hunt_high - resistance) / (hunt_end - range_end)
+        _drift_walk(prices, hunt, rate, noise[hunt] * 0.3)
+    if drop.stop > drop.start:
+        rate = (hunt_high - base_price) / (drop_end - hunt_end)
+        _drift_walk(prices, drop, -rate, noise[drop])
+    if continuation.stop > continuation.start:
+        rate = (base_price * cfg.trend_magnitude * 0.3) / (n_bars - drop_end)
+        _drift_walk(prices, continuation, -rate, noise[continuation])
 
     return prices
 
@@ -1131,7 +1299,12 @@ def _generate_choppy_whipsaw(
     volatility: float,
     config: PatternConfig | None = None,
 ) -> np.ndarray:
-    """Generate choppy price action with many false signals."""
+    """
+    Generate choppy price action with many false signals.
+
+    Stays a per-bar loop: direction flips and boundary resets decide which
+    distribution is drawn next, so the draws cannot be batched.
+    """
     cfg = config or PatternConfig()
     prices = np.zeros(n_bars)
     prices[0] = base_price
@@ -1174,9 +1347,8 @@ def _generate_accumulation(
     drift_rate = (base_price * cfg.trend_magnitude * 0.3) / n_bars
     low_vol = volatility * 0.4
 
-    for i in range(1, n_bars):
-        noise = rng.normal(0, low_vol * base_price)
-        prices[i] = prices[i-1] + drift_rate + noise
+    noise = _bar_noise(rng, n_bars, low_vol * base_price)
+    _drift_walk(prices, slice(1, n_bars), drift_rate, noise[1:])
 
     return prices
 
@@ -1196,9 +1368,8 @@ def _generate_distribution(
     drift_rate = (base_price * cfg.trend_magnitude * 0.3) / n_bars
     low_vol = volatility * 0.4
 
-    for i in range(1, n_bars):
-        noise = rng.normal(0, low_vol * base_price)
-        prices[i] = prices[i-1] - drift_rate + noise
+    noise = _bar_noise(rng, n_bars, low_vol * base_price)
+    _drift_walk(prices, slice(1, n_bars), -drift_rate, noise[1:])
 
     return prices
 
@@ -1266,10 +1437,9 @@ def _generate_mtf_pullback_bull(
     pullback_end = int(n_bars * 0.6)
     pullback_depth = base_price * cfg.trend_magnitude * cfg.pullback_depth
 
-    for i in range(n_bars):
-        if pullback_start <= i < pullback_end:
-            progress = (i - pullback_start) / (pullback_end - pullback_start)
-            pullback[i] = -np.sin(progress * np.pi) * pullback_depth
+    if pullback_end > pullback_start:
+        progress = np.arange(pullback_end - pullback_start) / (pullback_end - pullback_start)
+        pullback[pullback_start:pullback_end] = -np.sin(progress * np.pi) * pullback_depth
 
     noise = rng.normal(0, volatility * base_price * cfg.noise_level, n_bars)
 
@@ -1295,10 +1465,9 @@ def _generate_mtf_pullback_bear(
     rally_end = int(n_bars * 0.6)
     rally_height = base_price * cfg.trend_magnitude * cfg.pullback_depth
 
-    for i in range(n_bars):
-        if rally_start <= i < rally_end:
-            progress = (i - rally_start) / (rally_end - rally_start)
-            rally[i] = np.sin(progress * np.pi) * rally_height
+    if rally_end > rally_start:
+        progress = np.arange(rally_end - rally_start) / (rally_end - rally_start)
+        rally[rally_start:rally_end] = np.sin(progress * np.pi) * rally_height
 
     noise = rng.normal(0, volatility * base_price * cfg.noise_level, n_bars)
 
@@ -1344,17 +1513,21 @@ def _generate_displacement_impulse(
 
     sorted_impulses = sorted(impulse_bars)
 
-    for i in range(1, n_bars):
-        if i in impulse_bars:
-            # Impulse: 3-5% of base_price, well above wick noise (~0.5%)
-            impulse_size = base_price * rng.uniform(0.03, 0.05)
-            # Alternate between bullish and bearish
-            idx_in_sequence = sorted_impulses.index(i)
-            d = 1 if idx_in_sequence % 2 == 0 else -1
-            prices[i] = prices[i - 1] + d * impulse_size
-        else:
-            # Calm: very small random walk
-            prices[i] = prices[i - 1] + rng.normal(0, calm_noise)
+    # Draw in bar order: a calm stretch of normals, then the impulse uniform
+    steps = np.zeros(n_bars)
+    calm_start = 1
+    for idx_in_sequence, i in enumerate(sorted_impulses):
+        # Calm: very small random walk
+        steps[calm_start:i] = rng.normal(0, calm_noise, i - calm_start)
+        # Impulse: 3-5% of base_price, well above wick noise (~0.5%)
+        impulse_size = base_price * rng.uniform(0.03, 0.05)
+        # Alternate between bullish and bearish
+        d = 1 if idx_in_sequence % 2 == 0 else -1
+        steps[i] = d * impulse_size
+        calm_start = i + 1
+    steps[calm_start:] = rng.normal(0, calm_noise, max(n_bars - calm_start, 0))
+
+    _step_walk(prices, slice(1, n_bars), steps[1:])
 
     return prices
 
@@ -1392,32 +1565,28 @@ def _generate_trending_with_gaps(
     # Additive jump size: 3-5% of base_price (not current price)
     jump_base = base_price * 0.03
 
-    for i in range(1, n_bars):
-        if i < phase1_end:
-            # Phase 1: Calm consolidation
-            prices[i] = prices[i - 1] + rng.normal(0, noise_scale * 0.3)
-
-        elif i < phase2_end:
-            # Phase 2: Strong trend with impulse gaps
-            phase2_progress = i - phase1_end
-            if phase2_progress % impulse_interval == 1:
-                # Impulse bar: large additive upward jump
-                jump = rng.uniform(jump_base, jump_base * 1.5)
-                prices[i] = prices[i - 1] + jump
-            elif phase2_progress % impulse_interval == 2:
-                # Bar after impulse: continue higher to widen gap
-                prices[i] = prices[i - 1] + rng.uniform(jump_base * 0.3, jump_base * 0.5)
-            else:
-                # Normal trend bar: gentle upward drift
-                drift = base_price * 0.001
-                prices[i] = prices[i - 1] + rng.uniform(drift * 0.5, drift * 2.0)
-
-        else:
-            # Phase 3: Pullback that fills some gaps
-            phase3_len = n_bars - phase2_end
-            target_pullback = (prices[phase2_end - 1] - prices[phase1_end]) * 0.4
-            pullback_rate = target_pullback / max(phase3_len, 1)
-            prices[i] = prices[i - 1] - pullback_rate + rng.normal(0, noise_scale * 0.5)
+    calm, trend, pullback = _phase_slices(n_bars, phase1_end, phase2_end)
+
+    # Phase 1: Calm consolidation
+    _step_walk(prices, calm, rng.normal(0, noise_scale * 0.3, calm.stop - calm.start))
+
+    # Phase 2: Strong trend with impulse gaps
+    phase2_progress = np.arange(trend.start, trend.stop) - phase1_end
+    cycle_pos = phase2_progress % impulse_interval
+    drift = base_price * 0.001
+    # Impulse bar: large additive upward jump; the bar after continues higher
+    # to widen the gap; normal trend bars drift gently upward
+    low = np.select([cycle_pos == 1, cycle_pos == 2], [jump_base, jump_base * 0.3], drift * 0.5)
+    high = np.select([cycle_pos == 1, cycle_pos == 2], [jump_base * 1.5, jump_base * 0.5], drift * 2.0)
+    _step_walk(prices, trend, rng.uniform(low, high))
+
+    # Phase 3: Pullback that fills some gaps
+    if pullback.stop > pullback.start:
+        phase3_len = n_bars - phase2_end
+        target_pullback = (prices[phase2_end - 1] - prices[phase1_end]) * 0.4
+        pullback_rate = target_pullback / max(phase3_len, 1)
+        noise = rng.normal(0, noise_scale * 0.5, pullback.stop - pullback.start)
+        _drift_walk(prices, pullback, -pullback_rate, noise)
 
     return prices
 
@@ -1459,65 +1628,82 @@ def _generate_equal_highs_lows(
     osc_period = max(12, n_bars // 40)
     noise_scale = volatility * base_price * cfg.noise_level * 0.3
 
-    for i in range(1, n_bars):
-        if i < phase1_end:
-            # Phase 1: Oscillate around base_price with highs clustering near high_target
-            # Use sine wave to create regular swing points
-            phase_progress = (i - 0) / max(phase1_end, 1)
-            osc = np.sin(2 * np.pi * i / osc_period)
-
-            # Center around midpoint between base and high_target
-            mid = (base_price + high_target) / 2
-            amplitude = (high_target - base_price) / 2
-
-            prices[i] = mid + osc * amplitude + rng.normal(0, noise_scale)
-
-            # Add slight randomization to avoid perfectly equal highs
-            # (within ~0.3% of target, matching tolerance_atr * ATR)
-            if osc > 0.8:
-                jitter = rng.uniform(-0.003, 0.003) * base_price
-                prices[i] = high_target + jitter + rng.normal(0, noise_scale * 0.5)
-
-        elif i < phase2_end:
-            # Phase 2: Sweep above the clustered highs then reverse
-            phase2_len = phase2_end - phase1_end
-            phase2_progress = (i - phase1_end) / max(phase2_len, 1)
-
-            if phase2_progress < 0.4:
-                # Push up through the highs
-                sweep_height = high_target * 0.03  # 3% above target
-                prices[i] = high_target + sweep_height * (phase2_progress / 0.4)
-                prices[i] += rng.normal(0, noise_scale * 0.3)
-            else:
-                # Reverse sharply
-                peak = high_target * 1.03
-                drop_progress = (phase2_progress - 0.4) / 0.6
-                prices[i] = peak - (peak - high_target) * drop_progress * 1.5
-                prices[i] += rng.normal(0, noise_scale * 0.5)
-
-        elif i < phase3_end:
-            # Phase 3: Downtrend
-            phase3_len = phase3_end - phase2_end
-            phase3_progress = (i - phase2_end) / max(phase3_len, 1)
-
-            start_price = prices[phase2_end - 1]
-            target_end = low_target * 1.05  # End slightly above low_target
-            drift = (target_end - start_price) * phase3_progress
-            prices[i] = start_price + drift + rng.normal(0, noise_scale)
-
-        else:
-            # Phase 4: Oscillate with lows clustering near low_target
-            osc = np.sin(2 * np.pi * (i - phase3_end) / osc_period)
-
-            mid = (low_target + low_target * 1.04) / 2
-            amplitude = (low_target * 1.04 - low_target) / 2
-
-            prices[i] = mid + osc * amplitude + rng.normal(0, noise_scale)
-
-            # Cluster lows near low_target
-            if osc < -0.8:
-                jitter = rng.uniform(-0.003, 0.003) * base_price
-                prices[i] = low_target + jitter + rng.normal(0, noise_scale * 0.5)
+    bars = np.arange(n_bars)
+    swings, sweep, downtrend, lows = _phase_slices(n_bars, phase1_end, phase2_end, phase3_end)
+
+    # Phases 1 and 4 oscillate with a sine wave to create regular swing points
+    osc = np.zeros(n_bars)
+    osc[swings] = np.sin(2 * np.pi * bars[swings] / osc_period)
+    osc[lows] = np.sin(2 * np.pi * (bars[lows] - phase3_end) / osc_period)
+    clustered = np.zeros(n_bars, dtype=bool)
+    clustered[swings] = osc[swings] > 0.8
+    clustered[lows] = osc[lows] < -0.8
+
+    phase2_len = phase2_end - phase1_end
+    phase2_progress = (bars[sweep] - phase1_end) / max(phase2_len, 1)
+    pushing = phase2_progress < 0.4
+
+    # Every bar draws one normal; clustered bars then draw a jitter uniform
+    # and a second normal. Draw them all in bar order.
+    first_scale = np.full(n_bars, noise_scale)
+    first_scale[sweep] = np.where(pushing, noise_scale * 0.3, noise_scale * 0.5)
+    per_bar = 1 + 2 * clustered[1:]
+    first = np.cumsum(per_bar) - per_bar
+    jitter_pos = first[clustered[1:]] + 1
+    n_draws = int(per_bar.sum())
+    kinds = np.zeros(n_draws, dtype=bool)
+    arg1 = np.empty(n_draws)
+    arg2 = np.zeros(n_draws)
+    arg1[first] = first_scale[1:]
+    kinds[jitter_pos] = True
+    arg1[jitter_pos] = -0.003
+    arg2[jitter_pos] = 0.003
+    arg1[jitter_pos + 1] = noise_scale * 0.5
+    draws = _draw_sequence(rng, kinds, arg1, arg2)
+
+    noise = np.zeros(n_bars)
+    noise[1:] = draws[first]
+    jitter = np.zeros(n_bars)
+    jitter[1:][clustered[1:]] = draws[jitter_pos] * base_price
+    cluster_noise = np.zeros(n_bars)
+    cluster_noise[1:][clustered[1:]] = draws[jitter_pos + 1]
+
+    # Phase 1: Oscillate around base_price with highs clustering near high_target
+    # Center around midpoint between base and high_target
+    mid = (base_price + high_target) / 2
+    amplitude = (high_target - base_price) / 2
+    prices[swings] = mid + osc[swings] * amplitude + noise[swings]
+    # Add slight randomization to avoid perfectly equal highs
+    # (within ~0.3% of target, matching tolerance_atr * ATR)
+    high_cluster = bars[swings][clustered[swings]]
+    prices[high_cluster] = high_target + jitter[high_cluster] + cluster_noise[high_cluster]
+
+    # Phase 2: Sweep above the clustered highs then reverse
+    sweep_height = high_target * 0.03  # 3% above target
+    peak = high_target * 1.03
+    drop_progress = (phase2_progress - 0.4) / 0.6
+    prices[sweep] = np.where(
+        pushing,
+        high_target + sweep_height * (phase2_progress / 0.4),
+        peak - (peak - high_target) * drop_progress * 1.5,
+    ) + noise[sweep]
+
+    # Phase 3: Downtrend
+    if downtrend.stop > downtrend.start:
+        phase3_len = phase3_end - phase2_end
+        phase3_progress = (bars[downtrend] - phase2_end) / max(phase3_len, 1)
+        start_price = prices[phase2_end - 1]
+        target_end = low_target * 1.05  # End slightly above low_target
+        drift = (target_end - start_price) * phase3_progress
+        prices[downtrend] = start_price + drift + noise[downtrend]
+
+    # Phase 4: Oscillate with lows clustering near low_target
+    mid = (low_target + low_target * 1.04) / 2
+    amplitude = (low_target * 1.04 - low_target) / 2
+    prices[lows] = mid + osc[lows] * amplitude + noise[lows]
+    # Cluster lows near low_target
+    low_cluster = bars[lows][clustered[lows]]
+    prices[low_cluster] = low_target + jitter[low_cluster] + cluster_noise[low_cluster]
 
     return prices
 
@@ -1559,46 +1745,48 @@ def _generate_ob_retest(
 
     noise_scale = volatility * base_price * cfg.noise_level * 0.3
 
-    for i in range(1, n_bars):
-        if i < phase1_end:
-            # Phase 1: Consolidation — small random walk
-            prices[i] = prices[i - 1] + rng.normal(0, noise_scale)
-
-        elif i < phase2a_end:
-            # Phase 2a: Bearish candle(s) — the OB candle(s)
-            # Total drop targets ~3% of current price, spread over ob_bearish_bars
-            drop_per_bar = prices[phase1_end - 1] * 0.03 / ob_bearish_bars
-            prices[i] = prices[i - 1] - drop_per_bar + rng.normal(0, noise_scale * 0.2)
-
-        elif i < phase2b_end:
-            # Phase 2b: Bullish displacement — large jump per bar
-            # Each bar jumps 4-6% of base_price (must exceed ATR by 1.5x)
-            jump = base_price * rng.uniform(0.04, 0.06)
-            prices[i] = prices[i - 1] + jump
-
-        elif i < phase3_end:
-            # Phase 3: Continuation upward (rate scales with phase length)
-            phase3_len = phase3_end - phase2b_end
-            rate = (base_price * cfg.trend_magnitude * 0.4) / max(phase3_len, 1)
-            prices[i] = prices[i - 1] + rate + rng.normal(0, noise_scale * 0.5)
-
-        elif i < phase4_end:
-            # Phase 4: Pullback toward OB zone
-            phase4_len = phase4_end - phase3_end
-            phase4_progress = (i - phase3_end) / max(phase4_len, 1)
-
-            ob_zone_approx = prices[phase1_end]
-            peak = prices[phase3_end - 1]
-            target = ob_zone_approx + (peak - ob_zone_approx) * 0.3
-
-            interp = peak + (target - peak) * phase4_progress
-            prices[i] = interp + rng.normal(0, noise_scale * 0.5)
+    consolidation, ob_bars, displacement, continuation, pullback, resume = _phase_slices(
+        n_bars, phase1_end, phase2a_end, phase2b_end, phase3_end, phase4_end,
+    )
 
-        else:
-            # Phase 5: Continuation up from OB
-            phase5_len = n_bars - phase4_end
-            rate = (base_price * cfg.trend_magnitude * 0.3) / max(phase5_len, 1)
-            prices[i] = prices[i - 1] + rate + rng.normal(0, noise_scale * 0.5)
+    def _noise(bars: slice, scale: float) -> np.ndarray:
+        return rng.normal(0, scale, bars.stop - bars.start)
+
+    # Phase 1: Consolidation — small random walk
+    _step_walk(prices, consolidation, _noise(consolidation, noise_scale))
+
+    # Phase 2a: Bearish candle(s) — the OB candle(s)
+    # Total drop targets ~3% of current price, spread over ob_bearish_bars
+    if ob_bars.stop > ob_bars.start:
+        drop_per_bar = prices[phase1_end - 1] * 0.03 / ob_bearish_bars
+        _drift_walk(prices, ob_bars, -drop_per_bar, _noise(ob_bars, noise_scale * 0.2))
+
+    # Phase 2b: Bullish displacement — large jump per bar
+    # Each bar jumps 4-6% of base_price (must exceed ATR by 1.5x)
+    jumps = base_price * rng.uniform(0.04, 0.06, displacement.stop - displacement.start)
+    _step_walk(prices, displacement, jumps)
+
+    # Phase 3: Continuation upward (rate scales with phase length)
+    phase3_len = phase3_end - phase2b_end
+    rate = (base_price * cfg.trend_magnitude * 0.4) / max(phase3_len, 1)
+    _drift_walk(prices, continuation, rate, _noise(continuation, noise_scale * 0.5))
+
+    # Phase 4: Pullback toward OB zone
+    if pullback.stop > pullback.start:
+        phase4_len = phase4_end - phase3_end
+        phase4_progress = (np.arange(pullback.start, pullback.stop) - phase3_end) / max(phase4_len, 1)
+
+        ob_zone_approx = prices[phase1_end]
+        peak = prices[phase3_end - 1]
+        target = ob_zone_approx + (peak - ob_zone_approx) * 0.3
+
+        interp = peak + (target - peak) * phase4_progress
+        prices[pullback] = interp + _noise(pullback, noise_scale * 0.5)
+
+    # Phase 5: Continuation up from OB
+    phase5_len = n_bars - phase4_end
+    rate = (base_price * cfg.trend_magnitude * 0.3) / max(phase5_len, 1)
+    _drift_walk(prices, resume, rate, _noise(resume, noise_scale * 0.5))
 
     return prices
 
@@ -1681,45 +1869,50 @@ def _prices_to_ohlcv(
         correlate_volume: If True, larger price moves get higher volume
     """
     n_bars = len(close_prices)
-
-    # Generate OHLC
-    opens = np.zeros(n_bars)
-    highs = np.zeros(n_bars)
-    lows = np.zeros(n_bars)
-    volumes = np.zeros(n_bars)
-    timestamps = []
-
-    opens[0] = close_prices[0]
-
-    for i in range(n_bars):
-        close = close_prices[i]
-
-        if i > 0:
-            # Open is typically near previous close
-            opens[i] = close_prices[i-1] * (1 + rng.normal(0, 0.001))
-
-        # High is max of open/close plus some wick
-        base_high = max(opens[i], close)
-        highs[i] = base_high * (1 + abs(rng.normal(0, 0.005)))
-
-        # Low is min of open/close minus some wick
-        base_low = min(opens[i], close)
-        lows[i] = base_low * (1 - abs(rng.normal(0, 0.005)))
-
-        # Volume generation
-        if correlate_volume and i > 0:
-            # Higher volume on bigger price moves
-            price_change = abs(close - close_prices[i-1]) / close_prices[i-1]
-            # 1% move → ~1.5x volume, 2% move → ~2x volume
-            vol_multiplier = 1 + (price_change * 50)
-            base_vol = rng.lognormal(mean=10, sigma=0.8) * 1000
-            volumes[i] = base_vol * vol_multiplier
-        else:
-            # Random uncorrelated volume
-            volumes[i] = rng.lognormal(mean=10, sigma=1) * 1000
-
-        # Timestamp
-        timestamps.append(base_timestamp + timedelta(minutes=tf_minutes * i))
+    closes = np.asarray(close_prices, dtype=float)
+
+    # Random draws in per-bar order: [open jitter (bars > 0)], high wick,
+    # low wick, log-volume. Drawn as one batch with per-draw loc/scale.
+    draws_per_bar = np.full(n_bars, 4)
+    draws_per_bar[0] = 3
+    first = np.cumsum(draws_per_bar) - draws_per_bar
+    high_pos = first + (draws_per_bar - 3)
+    loc = np.zeros(int(draws_per_bar.sum()))
+    scale = np.empty_like(loc)
+    scale[first[1:]] = 0.001
+    scale[high_pos] = 0.005
+    scale[high_pos + 1] = 0.005
+    loc[high_pos + 2] = 10
+    scale[high_pos + 2] = 1
+    if correlate_volume:
+        scale[high_pos[1:] + 2] = 0.8
+    draws = rng.normal(loc, scale)
+
+    # Open is typically near previous close
+    opens = np.empty(n_bars)
+    opens[0] = closes[0]
+    opens[1:] = closes[:-1] * (1 + draws[first[1:]])
+
+    # High is max of open/close plus some wick
+    highs = np.maximum(opens, closes) * (1 + np.abs(draws[high_pos]))
+
+    # Low is min of open/close minus some wick
+    lows = np.minimum(opens, closes) * (1 - np.abs(draws[high_pos + 1]))
+
+    # Volume: lognormal draw = exp(normal); math.exp matches numpy's C exp
+    volumes = np.array([math.exp(x) for x in draws[high_pos + 2].tolist()]) * 1000
+    if correlate_volume and n_bars > 1:
+        # Higher volume on bigger price moves
+        price_change = np.abs(closes[1:] - closes[:-1]) / closes[:-1]
+        # 1% move → ~1.5x volume, 2% move → ~2x volume
+        vol_multiplier = 1 + (price_change * 50)
+        volumes[1:] = volumes[1:] * vol_multiplier
+
+    # Timestamps (same dtype a list of base_timestamp-typed values would get)
+    offsets = pd.to_timedelta(np.arange(n_bars) * tf_minutes, unit="m")
+    timestamps = pd.Series(pd.Timestamp(base_timestamp) + offsets).astype(
+        pd.Series([base_timestamp]).dtype
+    )
 
     # Create DataFrame with standard column names
     df = pd.DataFrame({
@@ -1859,6 +2052,103 @@ def generate_synthetic_for_play(
     )
 
 
+# =============================================================================
+# Dataset Cache
+# =============================================================================
+# Validation runs generate the same (pattern, bars, timeframes) dataset for
+# many plays. Generation and _compute_synthetic_hash (CSV-based) are both
+# deterministic functions of the generation inputs, so a finished dataset is
+# stored on disk under a key derived from those inputs and reused, data_hash
+# included.
+
+def get_synthetic_cache_dir() -> Path:
+    """Return the synthetic dataset cache directory (SYNTHETIC_CACHE_DIR env override)."""
+    return Path(os.getenv("SYNTHETIC_CACHE_DIR", str(DEFAULT_SYNTHETIC_CACHE_DIR)))
+
+
+def _synthetic_cache_key(
+    symbol: str,
+    timeframes: list[str],
+    bars_per_tf: int,
+    seed: int,
+    pattern: PatternType,
+    base_price: float,
+    volatility: float,
+    base_timestamp: datetime,
+    correlate_volume: bool,
+    align_multi_tf: bool,
+    config: PatternConfig | None,
+) -> str:
+    """Compute the cache key for a generation request.
+
+    Timeframe order is part of the key: all timeframes share one RNG stream.
+    """
+    components = {
+        "version": SYNTHETIC_GENERATOR_VERSION,
+        "symbol": symbol,
+        "timeframes": list(timeframes),
+        "bars_per_tf": bars_per_tf,
+        "seed": seed,
+        "pattern": pattern,
+        "base_price": repr(float(base_price)),
+        "volatility": repr(float(volatility)),
+        "base_timestamp": pd.Timestamp(base_timestamp).isoformat(),
+        "base_timestamp_type": type(base_timestamp).__name__,
+        "correlate_volume": correlate_volume,
+        "align_multi_tf": align_multi_tf,
+        "config": asdict(config or PatternConfig()),
+    }
+    serialized = json.dumps(components, sort_keys=True)
+    return hashlib.sha256(serialized.encode('utf-8')).hexdigest()[:24]
+
+
+def _load_cached_candles(entry_dir: Path) -> SyntheticCandles | None:
+    """Load a cached dataset, or None if the entry is missing or incomplete."""
+    meta_path = entry_dir / "meta.json"
+    if not meta_path.exists():
+        return None
+    try:
+        meta = json.loads(meta_path.read_text(encoding="utf-8"))
+        tf_dataframes = {
+            tf: pd.read_parquet(entry_dir / f"{tf}.parquet")
+            for tf in meta["timeframes"]
+        }
+    except (OSError, ValueError, KeyError):
+        # Partially written or stale entry - regenerate
+        return None
+
+    return SyntheticCandles(
+        symbol=meta["symbol"],
+        timeframes=tf_dataframes,
+        seed=meta["seed"],
+        pattern=meta["pattern"],
+        bars_per_tf=meta["bars_per_tf"],
+        bar_counts=meta["bar_counts"],
+        align_multi_tf=meta["align_multi_tf"],
+        total_minutes=meta["total_minutes"],
+        base_price=meta["base_price"],
+        volatility=meta["volatility"],
+        data_hash=meta["data_hash"],
+        generated_at=meta["generated_at"],
+    )
+
+
+def _store_cached_candles(entry_dir: Path, candles: SyntheticCandles) -> None:
+    """Store a dataset in the cache (files are written atomically, meta.json last)."""
+    try:
+        entry_dir.mkdir(parents=True, exist_ok=True)
+        for tf, df in candles.timeframes.items():
+            tmp_path = entry_dir / f".{tf}.parquet.{os.getpid()}.tmp"
+            df.to_parquet(tmp_path, index=False)
+            os.replace(tmp_path, entry_dir / f"{tf}.parquet")
+        tmp_path = entry_dir / f".meta.json.{os.getpid()}.tmp"
+        tmp_path.write_text(json.dumps(candles.to_dict(), indent=2), encoding="utf-8")
+        os.replace(tmp_path, entry_dir / "meta.json")
+    except OSError:
+        # Cache is an optimization only - a read-only or full disk must not fail generation
+        pass
+
+
 # =============================================================================
 # Main Generation Function
 # =============================================================================
@@ -1874,6 +2164,7 @@ def generate_synthetic_candles(
     correlate_volume: bool = True,
     align_multi_tf: bool = True,
     config: PatternConfig | None = None,
+    use_cache: bool = True,
 ) -> SyntheticCandles:
     """
     Generate synthetic OHLCV data for all timeframes.
@@ -1904,6 +2195,8 @@ def generate_synthetic_candles(
         correlate_volume: If True (default), volume correlates with price moves.
         align_multi_tf: If True (default), all timeframes cover the same time range.
         config: Optional PatternConfig for fine-tuning pattern parameters.
+        use_cache: If True (default), reuse a previously generated dataset for the
+            same inputs from the on-disk cache (see get_synthetic_cache_dir).
 
     Returns:
         SyntheticCandles with OHLCV DataFrames for each timeframe
@@ -1929,13 +2222,24 @@ def generate_synthetic_candles(
         if tf not in TF_TO_MINUTES:
             raise ValueError(f"Unknown timeframe: {tf}. Valid: {list(TF_TO_MINUTES.keys())}")
 
-    # Create RNG with seed for reproducibility
-    rng = np.random.default_rng(seed)
-
     # Select pattern generator from registry
     if pattern not in PATTERN_GENERATORS:
         raise ValueError(f"Unknown pattern: {pattern}. Valid: {list(PATTERN_GENERATORS.keys())}")
 
+    cache_entry: Path | None = None
+    if use_cache:
+        cache_key = _synthetic_cache_key(
+            symbol, timeframes, bars_per_tf, seed, pattern, base_price, volatility,
+            base_timestamp, correlate_volume, align_multi_tf, config,
+        )
+        cache_entry = get_synthetic_cache_dir() / cache_key
+        cached = _load_cached_candles(cache_entry)
+        if cached is not None:
+            return cached
+
+    # Create RNG with seed for reproducibility
+    rng = np.random.default_rng(seed)
+
     generator = PATTERN_GENERATORS[pattern]
 
     # Check if generator accepts config parameter (new-style generators)
@@ -2011,7 +2315,7 @@ def generate_synthetic_candles(
         pattern=pattern,
     )
 
-    return SyntheticCandles(
+    candles = SyntheticCandles(
         symbol=symbol,
         timeframes=tf_dataframes,
         seed=seed,
@@ -2025,6 +2329,11 @@ def generate_synthetic_candles(
         data_hash=data_hash,
     )
 
+    if cache_entry is not None:
+        _store_cached_candles(cache_entry, candles)
+
+    return candles
+
 
 # =============================================================================
 # Single-TF DataFrame Generator (for toolkit audits)
@@ -105,6 +105,11 @@ class SyntheticCandlesProvider:
         """Get list of available timeframes."""
         return list(self._candles.timeframes.keys())
 
+    @property
+    def data_hash(self) -> str:
+        """Deterministic hash of the generated candles."""
+        return self._candles.data_hash
+
     def get_ohlcv(
         self,
         symbol: str,
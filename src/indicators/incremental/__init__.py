@@ -20,6 +20,9 @@ Usage:
 # Base class
 from .base import IncrementalIndicator
 
+# Streaming primitives
+from .mad import RollingMeanAbsDev
+
 # Core indicators
 from .core import (
     IncrementalEMA,
@@ -99,6 +102,20 @@ from .volume import (
 from .session import IncrementalSessionLevels
 from .anchored_volume_profile import IncrementalAnchoredVolumeProfile
 
+# Vectorized banks (N instances of one type in NumPy arrays)
+from .bank import (
+    IndicatorBank,
+    BankView,
+    EMABank,
+    SMABank,
+    RSIBank,
+    ATRBank,
+    MACDBank,
+    BBandsBank,
+    create_indicator_bank,
+    supports_bank,
+)
+
 # Factory and utilities
 from .factory import (
     create_incremental_indicator,
@@ -109,6 +126,8 @@ from .factory import (
 __all__ = [
     # Base
     "IncrementalIndicator",
+    # Primitives
+    "RollingMeanAbsDev",
     # Core
     "IncrementalEMA",
     "IncrementalSMA",
@@ -164,6 +183,17 @@ __all__ = [
     "IncrementalVolumeProfile",
     "IncrementalSessionLevels",
     "IncrementalAnchoredVolumeProfile",
+    # Banks
+    "IndicatorBank",
+    "BankView",
+    "EMABank",
+    "SMABank",
+    "RSIBank",
+    "ATRBank",
+    "MACDBank",
+    "BBandsBank",
+    "create_indicator_bank",
+    "supports_bank",
     # Factory and utilities
     "create_incremental_indicator",
     "supports_incremental",
@@ -8,6 +8,7 @@ behavior based on market conditions or use non-standard weighting.
 from __future__ import annotations
 
 from collections import deque
+from itertools import islice
 from dataclasses import dataclass, field
 from typing import Any
 
@@ -256,6 +257,12 @@ class IncrementalUO(IncrementalIndicator):
         avg3 = sum(bp, slow) / sum(tr, slow)
         uo = 100 * ((4 * avg1) + (2 * avg2) + avg3) / 7
 
+    One ring buffer of the slow window with running sums per period; the
+    value leaving each shorter window is read near the buffer's right end.
+    The sums are recomputed exactly from the buffer once per `slow` updates,
+    and a window of flat bars (tr == 0, hence bp == 0) sums to exactly 0,
+    so rounding left behind by large bars cannot push UO outside [0, 100].
+
     Matches pandas_ta.uo() output.
     """
 
@@ -265,12 +272,16 @@ class IncrementalUO(IncrementalIndicator):
     _prev_close: float = field(default=np.nan, init=False)
     _bp_buffer: deque = field(default_factory=deque, init=False)
     _tr_buffer: deque = field(default_factory=deque, init=False)
+    _bp_sums: list[float] = field(default_factory=lambda: [0.0, 0.0, 0.0], init=False)
+    _tr_sums: list[float] = field(default_factory=lambda: [0.0, 0.0, 0.0], init=False)
     _count: int = field(default=0, init=False)
+    _flat_run: int = field(default=0, init=False)
+    _until_resum: int = field(default=0, init=False)
 
     def update(
         self, high: float, low: float, close: float, **kwargs: Any
     ) -> None:
-        """Update with new HLC data."""
+        """Update with new HLC data - amortized O(1) operation."""
         self._count += 1
 
         if self._count == 1:
@@ -283,35 +294,54 @@ class IncrementalUO(IncrementalIndicator):
 
         self._prev_close = close
 
-        self._bp_buffer.append(bp)
-        self._tr_buffer.append(tr)
+        bp_buf = self._bp_buffer
+        tr_buf = self._tr_buffer
+        bp_buf.append(bp)
+        tr_buf.append(tr)
+        n = len(bp_buf)
+
+        self._flat_run = self._flat_run + 1 if tr == 0 else 0
+        self._until_resum -= 1
+        resum = self._until_resum <= 0
+        if resum:
+            self._until_resum = self.slow
+
+        # Add to every window, then drop the value that just left each one
+        for i, period in enumerate((self.fast, self.medium, self.slow)):
+            if self._flat_run >= period:
+                self._bp_sums[i] = 0.0
+                self._tr_sums[i] = 0.0
+            elif resum:
+                self._bp_sums[i] = sum(islice(bp_buf, max(n - period, 0), n))
+                self._tr_sums[i] = sum(islice(tr_buf, max(n - period, 0), n))
+            else:
+                self._bp_sums[i] += bp
+                self._tr_sums[i] += tr
+                if n > period:
+                    self._bp_sums[i] -= bp_buf[-period - 1]
+                    self._tr_sums[i] -= tr_buf[-period - 1]
 
-        if len(self._bp_buffer) > self.slow:
-            self._bp_buffer.popleft()
-            self._tr_buffer.popleft()
+        if n > self.slow:
+            bp_buf.popleft()
+            tr_buf.popleft()
 
     def reset(self) -> None:
         self._prev_close = np.nan
         self._bp_buffer.clear()
         self._tr_buffer.clear()
+        self._bp_sums = [0.0, 0.0, 0.0]
+        self._tr_sums = [0.0, 0.0, 0.0]
         self._count = 0
+        self._flat_run = 0
+        self._until_resum = 0
 
     @property
     def value(self) -> float:
         if not self.is_ready:
             return np.nan
 
-        bp_list = list(self._bp_buffer)
-        tr_list = list(self._tr_buffer)
-        n = len(bp_list)
-
-        # Get sums for each period
-        bp_fast = sum(bp_list[n - self.fast :])
-        tr_fast = sum(tr_list[n - self.fast :])
-        bp_med = sum(bp_list[n - self.medium :])
-        tr_med = sum(tr_list[n - self.medium :])
-        bp_slow = sum(bp_list)
-        tr_slow = sum(tr_list)
+        bp_fast, bp_med, bp_slow = self._bp_sums
+        tr_fast, tr_med, tr_slow = self._tr_sums
 
         # Avoid division by zero
         avg1 = bp_fast / tr_fast if tr_fast != 0 else 0
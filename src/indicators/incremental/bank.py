@@ -0,0 +1,676 @@
+"""
+Indicator banks: many instances of one incremental indicator in NumPy arrays.
+
+The shadow daemon runs dozens of engines, most of them computing the same
+few indicator types at different parameters or on different symbols. With
+one IncrementalEMA object per engine, a candle close costs N Python update
+calls. A bank keeps the state of all N instances as per-slot arrays
+(count, running sums, EMA values, window rings) and advances every slot
+with one vectorized step per candle:
+
+    bank = EMABank()
+    fast = bank.add(length=9)          # BankView (an IncrementalIndicator)
+    slow = bank.add(length=21)
+    bank.update(close=np.array([...]))  # one close per slot, slot order
+    fast.value, slow.is_ready
+
+A BankView has the per-instance interface (update / value / is_ready /
+reset plus the multi-output properties such as macd_value or upper), so
+it can stand in where an IncrementalIndicator is expected. view.update()
+only stages the input for its slot; the first read from any view of the
+bank advances all staged slots in one call. A driver that stages every
+instance's candle before reading values (or calls bank.update() directly)
+pays one NumPy step per indicator type, however many slots share the
+bank. Each step has a fixed cost of a few dozen NumPy calls, so a bank
+only pays off past a few dozen instances (bench: ~0.3x objects at 10,
+2-6x at 100, 8-25x at 1000).
+
+Neither PlayEngine nor LiveIndicatorCache uses banks yet: each engine
+still builds its own incremental objects. Sharing a bank needs one driver
+that steps every engine on the same candle clock (e.g. the shadow
+daemon's feed hub callback). Only engines on the same symbol and
+timeframe close a candle together, and the shadow config caps those at
+max_engines_per_symbol (default 10), which is below the break-even.
+
+The steps reproduce the per-instance warmup rules exactly (SMA-seeded EMA,
+RMA seeded from the first change for RSI, SMA-seeded Wilder ATR, MACD
+signal gated on both EMAs). EMA / RSI / ATR / MACD values are bit-identical
+to the classes in core.py; SMA and BBands resum their window from a ring
+buffer every `length` updates like the classes do, but in NumPy summation
+order, so they agree to rounding (~1e-12).
+
+Banks are not thread-safe: share one only among engines driven from the
+same thread (one feed hub callback).
+
+Parity: incremental parity audit, BANK row (validate gate G3)
+Throughput: python trade_cli.py bench --scenario bank
+"""
+
+from __future__ import annotations
+
+from typing import Any, ClassVar
+
+import numpy as np
+
+from .base import IncrementalIndicator
+
+# Slots allocated by an empty bank; capacity doubles when full
+DEFAULT_BANK_CAPACITY = 8
+
+
+def _ema_step(
+    x: np.ndarray,
+    count: np.ndarray,
+    warmup_sum: np.ndarray,
+    ema: np.ndarray,
+    length: np.ndarray,
+    alpha: np.ndarray,
+    decay: np.ndarray,
+    active: np.ndarray | None = None,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """One IncrementalEMA.update() per row (rows outside `active` unchanged)."""
+    if active is None:
+        count = count + 1
+        warm = count <= length
+        seed = count == length
+        live = count > length
+    else:
+        count = count + active
+        warm = active & (count <= length)
+        seed = active & (count == length)
+        live = active & (count > length)
+    warmup_sum = np.where(warm, warmup_sum + x, warmup_sum)
+    ema = np.where(seed, warmup_sum / length, ema)
+    ema = np.where(live, alpha * x + decay * ema, ema)
+    return count, warmup_sum, ema
+
+
+class BankView(IncrementalIndicator):
+    """
+    One slot of an IndicatorBank, usable wherever an incremental indicator is.
+
+    Multi-output values are exposed under the per-instance property names:
+    `<output>` and `<output>_value` (macd_value, signal_value, upper, ...).
+    """
+
+    __slots__ = ("_bank", "_slot")
+
+    def __init__(self, bank: IndicatorBank, slot: int) -> None:
+        self._bank: IndicatorBank | None = bank
+        self._slot = slot
+
+    @property
+    def bank(self) -> IndicatorBank:
+        if self._bank is None:
+            raise ValueError("BankView was removed from its bank")
+        return self._bank
+
+    @property
+    def slot(self) -> int:
+        """Row of this instance in the bank's arrays (changes on bank.remove())."""
+        return self._slot
+
+    def update(self, **kwargs: Any) -> None:
+        """Stage one candle; applied with the rest of the bank on the next read."""
+        self.bank._stage(self._slot, kwargs)
+
+    def reset(self) -> None:
+        self.bank._reset_slot(self._slot)
+
+    @property
+    def value(self) -> float:
+        bank = self.bank
+        return bank._read(self._slot, bank.OUTPUTS[0])
+
+    @property
+    def is_ready(self) -> bool:
+        return self.bank._slot_ready(self._slot)
+
+    def output(self, name: str) -> float:
+        """Value of a named output (see the bank's OUTPUTS)."""
+        bank = self.bank
+        if name not in bank.OUTPUTS:
+            raise ValueError(
+                f"{bank.indicator_type} bank has no output '{name}'\n"
+                f"\n"
+                f"Fix: use one of {', '.join(bank.OUTPUTS)}"
+            )
+        return bank._read(self._slot, name)
+
+    def __getattr__(self, name: str) -> float:
+        # Only reached when normal lookup fails: map macd_value / upper / ...
+        bank = object.__getattribute__(self, "_bank")
+        key = name[:-6] if name.endswith("_value") else name
+        if bank is not None and key in bank.OUTPUTS:
+            return bank._read(object.__getattribute__(self, "_slot"), key)
+        raise AttributeError(name)
+
+    def __repr__(self) -> str:
+        kind = self._bank.indicator_type if self._bank is not None else "removed"
+        return f"BankView({kind}, slot={self._slot})"
+
+
+class IndicatorBank:
+    """
+    State of N instances of one indicator type, advanced in one call.
+
+    Subclasses declare their inputs, outputs, parameters (with the factory
+    defaults) and per-slot state with its initial value, and implement
+    _configure() (parameter arrays for a new slot) and _step() (one candle
+    for a set of rows). Slots stay dense: remove() moves the last slot into
+    the freed row and re-points its view.
+    """
+
+    indicator_type: ClassVar[str] = ""
+    INPUTS: ClassVar[tuple[str, ...]] = ("close",)
+    OUTPUTS: ClassVar[tuple[str, ...]] = ("value",)
+    PARAMS: ClassVar[dict[str, float]] = {}
+    PARAM_ARRAYS: ClassVar[tuple[str, ...]] = ()
+    STATE: ClassVar[dict[str, float]] = {}
+    # Readiness: slot is ready when state[READY[0]] >= param[READY[1]] + READY[2]
+    READY: ClassVar[tuple[str, str, int]] = ("count", "length", 0)
+    # Keep a (slots x max length) window ring in state["ring"]
+    RING: ClassVar[bool] = False
+
+    def __init__(self, capacity: int = DEFAULT_BANK_CAPACITY) -> None:
+        if capacity < 1:
+            raise ValueError(
+                f"capacity must be >= 1, got {capacity}\n"
+                f"\n"
+                f"Fix: {type(self).__name__}(capacity={DEFAULT_BANK_CAPACITY})"
+            )
+        self._size = 0
+        self._capacity = capacity
+        self._views: list[BankView] = []
+        self._params: dict[str, np.ndarray] = {name: np.zeros(capacity) for name in self.PARAM_ARRAYS}
+        self._state: dict[str, np.ndarray] = {
+            name: np.full(capacity, init, dtype=np.int64 if isinstance(init, int) else np.float64)
+            for name, init in self.STATE.items()
+        }
+        if self.RING:
+            self._state["ring"] = np.zeros((capacity, 1))
+        self._pending: dict[str, np.ndarray] = {name: np.zeros(capacity) for name in self.INPUTS}
+        self._staged = np.zeros(capacity, dtype=bool)
+        self._staged_count = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    @property
+    def views(self) -> list[BankView]:
+        """Views in slot order."""
+        return list(self._views)
+
+    # ------------------------------------------------------------------
+    # Instances
+    # ------------------------------------------------------------------
+
+    def add(self, **params: Any) -> BankView:
+        """
+        Add an instance with factory-style params (missing ones use defaults).
+
+        Raises:
+            ValueError: On unknown or invalid params
+        """
+        unknown = set(params) - set(self.PARAMS)
+        if unknown:
+            raise ValueError(
+                f"Unknown {self.indicator_type} bank params: {', '.join(sorted(unknown))}\n"
+                f"\n"
+                f"Fix: use {', '.join(self.PARAMS) or 'no params'}"
+            )
+        merged = {**self.PARAMS, **params}
+        self.flush()
+        if self._size == self._capacity:
+            self._grow(2 * self._capacity)
+        slot = self._size
+        self._configure(slot, merged)
+        self._size += 1
+        self._reset_slot(slot)
+        view = BankView(self, slot)
+        self._views.append(view)
+        return view
+
+    def remove(self, view: BankView) -> None:
+        """Drop an instance; the last slot moves into its row."""
+        if view._bank is not self:
+            raise ValueError(f"{view!r} does not belong to this {self.indicator_type} bank")
+        self.flush()
+        slot, last = view._slot, self._size - 1
+        if slot != last:
+            for arr in (*self._params.values(), *self._state.values()):
+                arr[slot] = arr[last]
+            moved = self._views[last]
+            moved._slot = slot
+            self._views[slot] = moved
+        self._views.pop()
+        self._size -= 1
+        view._bank = None
+
+    # ------------------------------------------------------------------
+    # Advancing
+    # ------------------------------------------------------------------
+
+    def update(self, **inputs: Any) -> None:
+        """
+        Advance every instance by one candle.
+
+        Args:
+            **inputs: One array per input (len(bank) values, slot order) or a
+                scalar shared by all slots (same symbol, different params)
+        """
+        self.flush()
+        n = self._size
+        if n:
+            self._advance(slice(0, n), self._coerce_inputs(inputs, (n,)))
+
+    def update_batch(self, **inputs: Any) -> dict[str, np.ndarray]:
+        """
+        Advance every instance through T candles.
+
+        Args:
+            **inputs: (T, len(bank)) arrays, or (T,) arrays shared by all slots
+
+        Returns:
+            Output name -> (T, len(bank)) array of values after each candle
+        """
+        self.flush()
+        n = self._size
+        columns: dict[str, Any] = {}
+        for name in self.INPUTS:
+            arr = inputs.get(name)
+            if arr is not None:
+                arr = np.asarray(arr, dtype=np.float64)
+                if arr.ndim == 1:
+                    arr = np.broadcast_to(arr[:, None], (arr.shape[0], n))
+            columns[name] = arr
+        first = columns[self.INPUTS[0]]
+        steps = first.shape[0] if first is not None and first.ndim else 0
+        x = self._coerce_inputs(columns, (steps, n))
+        out = {name: np.empty((steps, n)) for name in self.OUTPUTS}
+        sel = slice(0, n)
+        for t in range(steps):
+            self._advance(sel, {name: arr[t] for name, arr in x.items()})
+            for name, arr in out.items():
+                arr[t] = self._state[name][:n]
+        return out
+
+    def flush(self) -> None:
+        """Apply inputs staged through BankView.update() in one step."""
+        k = self._staged_count
+        if not k:
+            return
+        n = self._size
+        sel: slice | np.ndarray = slice(0, n) if k == n else np.flatnonzero(self._staged[:n])
+        x = {name: arr[sel].copy() for name, arr in self._pending.items()}
+        self._staged[:n] = False
+        self._staged_count = 0
+        self._advance(sel, x)
+
+    def values(self, output: str | None = None) -> np.ndarray:
+        """Copy of one output for all slots (default: the primary output)."""
+        self.flush()
+        name = output or self.OUTPUTS[0]
+        if name not in self.OUTPUTS:
+            raise ValueError(
+                f"{self.indicator_type} bank has no output '{name}'\n"
+                f"\n"
+                f"Fix: use one of {', '.join(self.OUTPUTS)}"
+            )
+        return self._state[name][: self._size].copy()
+
+    def ready(self) -> np.ndarray:
+        """Per-slot is_ready flags."""
+        self.flush()
+        n = self._size
+        state_key, param_key, offset = self.READY
+        return self._state[state_key][:n] >= self._params[param_key][:n] + offset
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    def _coerce_inputs(self, inputs: dict[str, Any], shape: tuple[int, ...]) -> dict[str, np.ndarray]:
+        x: dict[str, np.ndarray] = {}
+        for name in self.INPUTS:
+            if inputs.get(name) is None:
+                raise ValueError(
+                    f"{self.indicator_type} bank update needs '{name}'\n"
+                    f"\n"
+                    f"Fix: bank.update({', '.join(f'{i}=...' for i in self.INPUTS)})"
+                )
+            arr = np.asarray(inputs[name], dtype=np.float64)
+            if arr.ndim == 0:
+                arr = np.full(shape, float(arr))
+            if arr.shape != shape:
+                raise ValueError(
+                    f"{self.indicator_type} bank input '{name}' has shape {arr.shape}, expected {shape}\n"
+                    f"\n"
+                    f"Fix: pass one value per slot in slot order (view.slot)"
+                )
+            x[name] = arr
+        return x
+
+    def _advance(self, sel: slice | np.ndarray, x: dict[str, np.ndarray]) -> None:
+        p = {name: arr[sel] for name, arr in self._params.items()}
+        s = {name: arr[sel] for name, arr in self._state.items()}
+        with np.errstate(divide="ignore", invalid="ignore"):
+            self._step(s, p, x)
+        for name, arr in self._state.items():
+            arr[sel] = s[name]
+
+    def _stage(self, slot: int, kwargs: dict[str, Any]) -> None:
+        if self._staged[slot]:
+            self.flush()  # second candle for this slot before any read
+        for name, arr in self._pending.items():
+            arr[slot] = kwargs[name]
+        self._staged[slot] = True
+        self._staged_count += 1
+
+    def _read(self, slot: int, name: str) -> float:
+        if self._staged_count:
+            self.flush()
+        return float(self._state[name][slot])
+
+    def _slot_ready(self, slot: int) -> bool:
+        if self._staged_count:
+            self.flush()
+        state_key, param_key, offset = self.READY
+        return bool(self._state[state_key][slot] >= self._params[param_key][slot] + offset)
+
+    def _reset_slot(self, slot: int) -> None:
+        for name, init in self.STATE.items():
+            self._state[name][slot] = init
+        if self.RING:
+            self._state["ring"][slot] = 0.0
+        if self._staged[slot]:
+            self._staged[slot] = False
+            self._staged_count -= 1
+
+    def _grow(self, capacity: int) -> None:
+        def grown(arr: np.ndarray) -> np.ndarray:
+            out = np.zeros((capacity, *arr.shape[1:]), dtype=arr.dtype)
+            out[: arr.shape[0]] = arr
+            return out
+
+        self._params = {name: grown(arr) for name, arr in self._params.items()}
+        self._state = {name: grown(arr) for name, arr in self._state.items()}
+        self._pending = {name: grown(arr) for name, arr in self._pending.items()}
+        self._staged = grown(self._staged)
+        self._capacity = capacity
+
+    def _ensure_ring_width(self, width: int) -> None:
+        ring = self._state["ring"]
+        if ring.shape[1] < width:
+            wider = np.zeros((ring.shape[0], width))
+            wider[:, : ring.shape[1]] = ring
+            self._state["ring"] = wider
+
+    def _set_length(self, slot: int, name: str, value: Any, minimum: int = 1) -> int:
+        if isinstance(value, bool) or not isinstance(value, (int, np.integer)) or value < minimum:
+            raise ValueError(
+                f"{self.indicator_type} bank: {name} must be an int >= {minimum}, got {value!r}\n"
+                f"\n"
+                f"Fix: bank.add({name}={max(minimum, int(self.PARAMS[name]))})"
+            )
+        self._params[name][slot] = value
+        return int(value)
+
+    def _configure(self, slot: int, params: dict[str, Any]) -> None:
+        raise NotImplementedError
+
+    def _step(self, s: dict[str, np.ndarray], p: dict[str, np.ndarray], x: dict[str, np.ndarray]) -> None:
+        raise NotImplementedError
+
+
+class EMABank(IndicatorBank):
+    """IncrementalEMA for N slots (SMA seed, then alpha = 2 / (length + 1))."""
+
+    indicator_type = "ema"
+    PARAMS = {"length": 20}
+    PARAM_ARRAYS = ("length", "alpha", "decay")
+    STATE = {"count": 0, "warmup_sum": 0.0, "value": np.nan}
+
+    def _configure(self, slot: int, params: dict[str, Any]) -> None:
+        length = self._set_length(slot, "length", params["length"])
+        alpha = 2.0 / (length + 1)
+        self._params["alpha"][slot] = alpha
+        self._params["decay"][slot] = 1 - alpha
+
+    def _step(self, s: dict[str, np.ndarray], p: dict[str, np.ndarray], x: dict[str, np.ndarray]) -> None:
+        s["count"], s["warmup_sum"], s["value"] = _ema_step(
+            x["close"], s["count"], s["warmup_sum"], s["value"], p["length"], p["alpha"], p["decay"],
+        )
+
+
+class SMABank(IndicatorBank):
+    """IncrementalSMA for N slots (running sum over a window ring)."""
+
+    indicator_type = "sma"
+    PARAMS = {"length": 20}
+    PARAM_ARRAYS = ("length",)
+    STATE = {"pos": 0, "filled": 0, "since_resum": 0, "sum": 0.0, "value": np.nan}
+    READY = ("filled", "length", 0)
+    RING = True
+
+    def _configure(self, slot: int, params: dict[str, Any]) -> None:
+        self._ensure_ring_width(self._set_length(slot, "length", params["length"]))
+
+    def _step(self, s: dict[str, np.ndarray], p: dict[str, np.ndarray], x: dict[str, np.ndarray]) -> None:
+        total = _ring_push(s, p["length"], x["close"])
+        s["value"] = np.where(s["filled"] >= p["length"], total / p["length"], np.nan)
+
+
+class BBandsBank(IndicatorBank):
+    """IncrementalBBands for N slots (running sum and sum of squares, ddof=1)."""
+
+    indicator_type = "bbands"
+    OUTPUTS = ("middle", "lower", "upper", "bandwidth", "percent_b")
+    PARAMS = {"length": 20, "std": 2.0}
+    PARAM_ARRAYS = ("length", "std")
+    STATE = {
+        "pos": 0, "filled": 0, "since_resum": 0, "sum": 0.0, "sq_sum": 0.0,
+        "middle": np.nan, "lower": np.nan, "upper": np.nan, "bandwidth": np.nan, "percent_b": np.nan,
+    }
+    READY = ("filled", "length", 0)
+    RING = True
+
+    def _configure(self, slot: int, params: dict[str, Any]) -> None:
+        # length 1 has no sample std (the per-instance class divides by n - 1)
+        self._ensure_ring_width(self._set_length(slot, "length", params["length"], minimum=2))
+        self._params["std"][slot] = float(params["std"])
+
+    def _step(self, s: dict[str, np.ndarray], p: dict[str, np.ndarray], x: dict[str, np.ndarray]) -> None:
+        close = x["close"]
+        length = p["length"]
+        total = _ring_push(s, length, close)
+        ready = s["filled"] >= length
+        middle = total / length
+        variance = (s["sq_sum"] - length * middle * middle) / (length - 1)
+        std = np.sqrt(np.maximum(variance, 0.0))
+        upper = middle + p["std"] * std
+        lower = middle - p["std"] * std
+        width = upper - lower
+        bandwidth = np.where(middle == 0, np.nan, width / middle * 100.0)
+        percent_b = np.where(upper == lower, 0.5, (close - lower) / width)
+        s["middle"] = np.where(ready, middle, np.nan)
+        s["lower"] = np.where(ready, lower, np.nan)
+        s["upper"] = np.where(ready, upper, np.nan)
+        s["bandwidth"] = np.where(ready, bandwidth, np.nan)
+        s["percent_b"] = np.where(ready, percent_b, np.nan)
+
+
+def _ring_push(s: dict[str, np.ndarray], length: np.ndarray, x: np.ndarray) -> np.ndarray:
+    """Window push shared by SMA and BBands; returns (and stores) the running sum."""
+    ring = s["ring"]
+    rows = np.arange(ring.shape[0])
+    pos = s["pos"]
+    full = s["filled"] >= length
+    oldest = ring[rows, pos]
+    total = np.where(full, s["sum"] + x - oldest, s["sum"] + x)
+    sq_total: np.ndarray | None = None
+    if "sq_sum" in s:
+        sq_total = np.where(full, s["sq_sum"] + x * x - oldest * oldest, s["sq_sum"] + x * x)
+    ring[rows, pos] = x
+    pos = pos + 1
+    s["pos"] = np.where(pos >= length, 0, pos)
+    s["filled"] = np.minimum(s["filled"] + 1, length).astype(np.int64)
+    since = s["since_resum"] + 1
+    resum = np.flatnonzero(since >= length)
+    if resum.size:
+        # Exact resum from the window (unused ring columns stay 0)
+        total[resum] = ring[resum].sum(axis=1)
+        if sq_total is not None:
+            window = ring[resum]
+            sq_total[resum] = (window * window).sum(axis=1)
+        since[resum] = 0
+    s["since_resum"] = since
+    s["sum"] = total
+    if sq_total is not None:
+        s["sq_sum"] = sq_total
+    return total
+
+
+class RSIBank(IndicatorBank):
+    """IncrementalRSI for N slots (RMA seeded with the first change)."""
+
+    indicator_type = "rsi"
+    PARAMS = {"length": 14}
+    PARAM_ARRAYS = ("length", "alpha", "decay")
+    STATE = {"count": 0, "prev_close": np.nan, "avg_gain": np.nan, "avg_loss": np.nan, "value": np.nan}
+    READY = ("count", "length", 1)
+
+    def _configure(self, slot: int, params: dict[str, Any]) -> None:
+        length = self._set_length(slot, "length", params["length"])
+        alpha = 1.0 / length
+        self._params["alpha"][slot] = alpha
+        self._params["decay"][slot] = 1 - alpha
+
+    def _step(self, s: dict[str, np.ndarray], p: dict[str, np.ndarray], x: dict[str, np.ndarray]) -> None:
+        close = x["close"]
+        count = s["count"] + 1
+        change = close - s["prev_close"]
+        gain = np.maximum(0.0, change)
+        loss = np.maximum(0.0, -change)
+        seed = count == 2
+        live = count > 2
+        alpha, decay = p["alpha"], p["decay"]
+        avg_gain = np.where(seed, gain, np.where(live, alpha * gain + decay * s["avg_gain"], s["avg_gain"]))
+        avg_loss = np.where(seed, loss, np.where(live, alpha * loss + decay * s["avg_loss"], s["avg_loss"]))
+        total = avg_gain + avg_loss
+        rsi = np.where(total == 0, 50.0, 100.0 * avg_gain / total)
+        s["count"] = count
+        s["prev_close"] = close
+        s["avg_gain"] = avg_gain
+        s["avg_loss"] = avg_loss
+        s["value"] = np.where(count > p["length"], rsi, np.nan)
+
+
+class ATRBank(IndicatorBank):
+    """IncrementalATR for N slots (SMA seed of the first `length` TRs, then Wilder)."""
+
+    indicator_type = "atr"
+    INPUTS = ("high", "low", "close")
+    PARAMS = {"length": 14}
+    PARAM_ARRAYS = ("length", "alpha", "decay")
+    STATE = {"count": 0, "prev_close": np.nan, "warmup_sum": 0.0, "value": np.nan}
+
+    def _configure(self, slot: int, params: dict[str, Any]) -> None:
+        length = self._set_length(slot, "length", params["length"])
+        alpha = 1.0 / length
+        self._params["alpha"][slot] = alpha
+        self._params["decay"][slot] = 1 - alpha
+
+    def _step(self, s: dict[str, np.ndarray], p: dict[str, np.ndarray], x: dict[str, np.ndarray]) -> None:
+        high, low = x["high"], x["low"]
+        length = p["length"]
+        count = s["count"] + 1
+        prev = s["prev_close"]
+        first = count == 1
+        # Bar 0 has no previous close: TR = high - low
+        tr = np.where(
+            first,
+            high - low,
+            np.maximum(np.maximum(high - low, np.abs(high - prev)), np.abs(low - prev)),
+        )
+        warmup_sum = np.where(count <= length, s["warmup_sum"] + tr, s["warmup_sum"])
+        atr = np.where((count == length) & ~first, warmup_sum / length, s["value"])
+        atr = np.where(count > length, p["alpha"] * tr + p["decay"] * atr, atr)
+        s["count"] = count
+        s["prev_close"] = x["close"]
+        s["warmup_sum"] = warmup_sum
+        s["value"] = atr
+
+
+class MACDBank(IndicatorBank):
+    """IncrementalMACD for N slots (signal EMA fed once both EMAs are ready)."""
+
+    indicator_type = "macd"
+    OUTPUTS = ("macd", "signal", "histogram")
+    PARAMS = {"fast": 12, "slow": 26, "signal": 9}
+    PARAM_ARRAYS = (
+        "fast", "fast_alpha", "fast_decay",
+        "slow", "slow_alpha", "slow_decay",
+        "signal", "signal_alpha", "signal_decay",
+    )
+    STATE = {
+        "fast_count": 0, "fast_sum": 0.0, "fast_ema": np.nan,
+        "slow_count": 0, "slow_sum": 0.0, "slow_ema": np.nan,
+        "signal_count": 0, "signal_sum": 0.0, "signal_ema": np.nan,
+        "macd": np.nan, "signal": np.nan, "histogram": np.nan,
+    }
+    READY = ("signal_count", "signal", 0)
+
+    def _configure(self, slot: int, params: dict[str, Any]) -> None:
+        for name in ("fast", "slow", "signal"):
+            length = self._set_length(slot, name, params[name])
+            alpha = 2.0 / (length + 1)
+            self._params[f"{name}_alpha"][slot] = alpha
+            self._params[f"{name}_decay"][slot] = 1 - alpha
+
+    def _step(self, s: dict[str, np.ndarray], p: dict[str, np.ndarray], x: dict[str, np.ndarray]) -> None:
+        close = x["close"]
+        for name in ("fast", "slow"):
+            s[f"{name}_count"], s[f"{name}_sum"], s[f"{name}_ema"] = _ema_step(
+                close, s[f"{name}_count"], s[f"{name}_sum"], s[f"{name}_ema"],
+                p[name], p[f"{name}_alpha"], p[f"{name}_decay"],
+            )
+        both = (s["fast_count"] >= p["fast"]) & (s["slow_count"] >= p["slow"])
+        macd = np.where(both, s["fast_ema"] - s["slow_ema"], s["macd"])
+        s["signal_count"], s["signal_sum"], s["signal_ema"] = _ema_step(
+            macd, s["signal_count"], s["signal_sum"], s["signal_ema"],
+            p["signal"], p["signal_alpha"], p["signal_decay"], active=both,
+        )
+        signal_ready = both & (s["signal_count"] >= p["signal"])
+        s["macd"] = macd
+        s["signal"] = np.where(signal_ready, s["signal_ema"], s["signal"])
+        s["histogram"] = np.where(signal_ready, macd - s["signal"], s["histogram"])
+
+
+BANK_TYPES: dict[str, type[IndicatorBank]] = {
+    bank.indicator_type: bank
+    for bank in (EMABank, SMABank, RSIBank, ATRBank, MACDBank, BBandsBank)
+}
+
+
+def supports_bank(indicator_type: str) -> bool:
+    """True if the indicator type has a vectorized bank."""
+    return indicator_type.lower() in BANK_TYPES
+
+
+def create_indicator_bank(indicator_type: str, capacity: int = DEFAULT_BANK_CAPACITY) -> IndicatorBank:
+    """
+    Create an empty bank for an indicator type.
+
+    Raises:
+        ValueError: If the type has no bank implementation
+    """
+    bank_cls = BANK_TYPES.get(indicator_type.lower())
+    if bank_cls is None:
+        raise ValueError(
+            f"No indicator bank for '{indicator_type}'\n"
+            f"\n"
+            f"Fix: use one of {', '.join(sorted(BANK_TYPES))}, or per-instance "
+            f"create_incremental_indicator()"
+        )
+    return bank_cls(capacity=capacity)
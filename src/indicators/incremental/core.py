@@ -16,6 +16,7 @@ import numpy as np
 from src.structures.primitives import MonotonicDeque
 
 from .base import IncrementalIndicator
+from .mad import RollingMeanAbsDev
 
 
 @dataclass
@@ -547,7 +548,7 @@ class IncrementalWilliamsR(IncrementalIndicator):
 @dataclass
 class IncrementalCCI(IncrementalIndicator):
     """
-    Commodity Channel Index with O(1) update, O(n) value access.
+    Commodity Channel Index with O(log n) value access.
 
     Formula:
         tp = (high + low + close) / 3
@@ -555,37 +556,29 @@ class IncrementalCCI(IncrementalIndicator):
         mean_dev = mean(|tp - tp_sma|) over length
         cci = (tp - tp_sma) / (0.015 * mean_dev)
 
-    Note: The mean absolute deviation (MAD) calculation is inherently O(n)
-    because changing the mean affects all |tp - mean| terms. This is a
-    fundamental mathematical limitation - MAD cannot be computed incrementally.
-    The update() is O(1), only value access is O(n).
+    The mean absolute deviation changes with every move of the mean, so
+    the typical prices are kept in a RollingMeanAbsDev (sorted window
+    with per-bucket sums, see mad.py) instead of being rescanned.
 
-    Uses ring buffer for typical prices and running sums.
     Matches pandas_ta.cci() output.
     """
 
     length: int = 14
-    _tp_buffer: deque = field(default_factory=deque, init=False)
-    _tp_sum: float = field(default=0.0, init=False)
+    _tp_window: RollingMeanAbsDev = field(init=False)
     _count: int = field(default=0, init=False)
 
+    def __post_init__(self) -> None:
+        self._tp_window = RollingMeanAbsDev(self.length)
+
     def update(
         self, high: float, low: float, close: float, **kwargs: Any
     ) -> None:
         """Update with new OHLC data."""
         self._count += 1
-
-        tp = (high + low + close) / 3.0
-        self._tp_sum += tp
-        self._tp_buffer.append(tp)
-
-        if len(self._tp_buffer) > self.length:
-            oldest = self._tp_buffer.popleft()
-            self._tp_sum -= oldest
+        self._tp_window.push((high + low + close) / 3.0)
 
     def reset(self) -> None:
-        self._tp_buffer.clear()
-        self._tp_sum = 0.0
+        self._tp_window.reset()
         self._count = 0
 
     @property
@@ -593,23 +586,17 @@ class IncrementalCCI(IncrementalIndicator):
         if not self.is_ready:
             return np.nan
 
-        # TP SMA
-        tp_sma = self._tp_sum / self.length
-
-        # Mean deviation
-        mean_dev = sum(abs(tp - tp_sma) for tp in self._tp_buffer) / self.length
+        window = self._tp_window
+        tp_sma, mean_dev = window.mean_and_mad()
 
         if mean_dev == 0:
             return 0.0
 
-        # Current TP
-        current_tp = self._tp_buffer[-1]
-
-        return (current_tp - tp_sma) / (0.015 * mean_dev)
+        return (window.last - tp_sma) / (0.015 * mean_dev)
 
     @property
     def is_ready(self) -> bool:
-        return len(self._tp_buffer) >= self.length
+        return len(self._tp_window) >= self.length
 
 
 @dataclass
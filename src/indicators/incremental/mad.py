@@ -0,0 +1,231 @@
+"""
+Streaming mean absolute deviation over a sliding window.
+
+Mean absolute deviation around the window mean,
+
+    mad = sum(|x_i - mean|) / n
+
+cannot be updated by adding and removing terms: every time the mean moves,
+every |x_i - mean| term changes. It can be answered from the window in
+sorted order, though. With k values below the mean, summing S_below and
+S_above:
+
+    sum(|x_i - mean|) = (mean * k - S_below) + (S_above - mean * (n - k))
+
+RollingMeanAbsDev keeps the window as a bucketed sorted list (sorted
+sublists of at most 2 * BUCKET_LOAD values, each with its own sum and
+max). Locating the mean is a bisect over bucket maxes plus a bisect in one
+bucket (O(log n)); the prefix sum adds whole-bucket sums and one partial
+bucket, O(n / BUCKET_LOAD + BUCKET_LOAD) element adds done by the C-level
+sum(). Inserts and evictions touch a single bucket. For the window lengths
+indicators use (up to a few hundred) this costs about the same at length
+500 as at length 14, where a full rescan grows linearly.
+
+Short windows (length <= DIRECT_SCAN_MAX_LENGTH) skip the sorted
+structure: rescanning a dozen values in a C-level sum() is cheaper than
+maintaining buckets, and it is exactly what pandas_ta computes.
+
+Bucket sums are adjusted by +/- on insert and evict and recomputed
+exactly from the bucket contents on every split / merge and once per
+`length` pushes, so floating point error cannot accumulate over long live
+sessions.
+
+NaN inputs are kept out of the sorted window; while one is inside the
+window, mad() and mean() return NaN (same as a pandas rolling apply).
+"""
+
+from __future__ import annotations
+
+import math
+from bisect import bisect_left, bisect_right, insort
+from collections import deque
+
+# Target bucket size; buckets split above 2x and merge below 1/2x
+BUCKET_LOAD = 32
+
+# Windows up to this length are rescanned instead of kept sorted
+DIRECT_SCAN_MAX_LENGTH = 24
+
+
+class RollingMeanAbsDev:
+    """
+    Sliding-window mean and mean absolute deviation without window rescans.
+
+    Example:
+        >>> mad = RollingMeanAbsDev(length=3)
+        >>> for x in (1.0, 2.0, 6.0):
+        ...     mad.push(x)
+        >>> mad.mean(), mad.mad()
+        (3.0, 2.0)
+    """
+
+    __slots__ = (
+        "length", "_window", "_sorted", "_lists", "_maxes", "_sums", "_nan_count", "_until_resum",
+    )
+
+    def __init__(self, length: int) -> None:
+        """
+        Args:
+            length: Window length (must be >= 1)
+
+        Raises:
+            ValueError: If length < 1
+        """
+        if length < 1:
+            raise ValueError(
+                f"length must be >= 1, got {length}\n"
+                f"\n"
+                f"Fix: RollingMeanAbsDev(length=20)"
+            )
+        self.length = length
+        self._window: deque[float] = deque()
+        self._sorted = length > DIRECT_SCAN_MAX_LENGTH
+        self._lists: list[list[float]] = []
+        self._maxes: list[float] = []
+        self._sums: list[float] = []
+        self._nan_count = 0
+        self._until_resum = length
+
+    def __len__(self) -> int:
+        return len(self._window)
+
+    @property
+    def is_full(self) -> bool:
+        return len(self._window) >= self.length
+
+    @property
+    def last(self) -> float:
+        """Most recently pushed value."""
+        return self._window[-1]
+
+    def reset(self) -> None:
+        self._window.clear()
+        self._lists.clear()
+        self._maxes.clear()
+        self._sums.clear()
+        self._nan_count = 0
+        self._until_resum = self.length
+
+    def push(self, value: float) -> None:
+        """Append a value, evicting the oldest once the window is full."""
+        window = self._window
+        window.append(value)
+        if value != value:
+            self._nan_count += 1
+        elif self._sorted:
+            self._insert(value)
+        if len(window) > self.length:
+            oldest = window.popleft()
+            if oldest != oldest:
+                self._nan_count -= 1
+            elif self._sorted:
+                self._remove(oldest)
+        if not self._sorted:
+            return
+        self._until_resum -= 1
+        if self._until_resum == 0:
+            self._until_resum = self.length
+            self._sums[:] = [sum(bucket) for bucket in self._lists]
+
+    def mean(self) -> float:
+        """Mean of the current window (NaN if empty or holding a NaN)."""
+        n = len(self._window)
+        if n == 0 or self._nan_count:
+            return math.nan
+        return (sum(self._sums) if self._sorted else sum(self._window)) / n
+
+    def mad(self) -> float:
+        """Mean absolute deviation around the window mean."""
+        return self.mean_and_mad()[1]
+
+    def mean_and_mad(self) -> tuple[float, float]:
+        """(mean, mean absolute deviation) of the window in one pass."""
+        n = len(self._window)
+        if n == 0 or self._nan_count:
+            return math.nan, math.nan
+        if not self._sorted:
+            window = self._window
+            center = sum(window) / n
+            return center, sum([abs(x - center) for x in window]) / n
+        lists = self._lists
+        sums = self._sums
+        if len(lists) == 1:
+            bucket = lists[0]
+            total = sums[0]
+            center = total / n
+            if bucket[0] == bucket[-1]:
+                return center, 0.0  # constant window (avoids cancellation noise)
+            below_count = bisect_left(bucket, center)
+            below_sum = sum(bucket[:below_count])
+        else:
+            total = sum(sums)
+            center = total / n
+            if lists[0][0] == lists[-1][-1]:
+                return center, 0.0
+            i = bisect_left(self._maxes, center)
+            below_sum = sum(sums[:i])
+            below_count = sum(map(len, lists[:i]))
+            if i < len(lists):
+                bucket = lists[i]
+                j = bisect_left(bucket, center)
+                below_sum += sum(bucket[:j])
+                below_count += j
+        deviation = (center * below_count - below_sum) + (total - below_sum - center * (n - below_count))
+        return center, max(deviation, 0.0) / n
+
+    # ------------------------------------------------------------------
+    # Sorted buckets
+    # ------------------------------------------------------------------
+
+    def _insert(self, value: float) -> None:
+        lists, maxes = self._lists, self._maxes
+        if not lists:
+            lists.append([value])
+            maxes.append(value)
+            self._sums.append(value)
+            return
+        i = bisect_right(maxes, value)
+        if i == len(maxes):
+            i -= 1
+            lists[i].append(value)
+            maxes[i] = value
+        else:
+            insort(lists[i], value)
+        bucket = lists[i]
+        if len(bucket) > 2 * BUCKET_LOAD:
+            half = bucket[BUCKET_LOAD:]
+            del bucket[BUCKET_LOAD:]
+            lists.insert(i + 1, half)
+            maxes[i] = bucket[-1]
+            maxes.insert(i + 1, half[-1])
+            self._sums.insert(i + 1, sum(half))
+            self._sums[i] = sum(bucket)
+        else:
+            self._sums[i] += value
+
+    def _remove(self, value: float) -> None:
+        lists, maxes = self._lists, self._maxes
+        i = bisect_left(maxes, value)
+        bucket = lists[i]
+        del bucket[bisect_left(bucket, value)]
+        if not bucket:
+            del lists[i], maxes[i], self._sums[i]
+            return
+        maxes[i] = bucket[-1]
+        if len(bucket) >= BUCKET_LOAD // 2 or len(lists) == 1:
+            self._sums[i] -= value
+            return
+        # Merge into a neighbour (the next one, or the previous at the end)
+        j = i if i + 1 < len(lists) else i - 1
+        bucket = lists[j]
+        bucket.extend(lists[j + 1])
+        del lists[j + 1], maxes[j + 1], self._sums[j + 1]
+        maxes[j] = bucket[-1]
+        if len(bucket) > 2 * BUCKET_LOAD:
+            half = bucket[BUCKET_LOAD:]
+            del bucket[BUCKET_LOAD:]
+            lists.insert(j + 1, half)
+            maxes[j] = bucket[-1]
+            maxes.insert(j + 1, half[-1])
+            self._sums.insert(j + 1, sum(half))
+        self._sums[j] = sum(bucket)
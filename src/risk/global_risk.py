@@ -520,4 +520,8 @@ def get_global_risk_view(
         return _global_risk_view
 
 
-
+def reset_global_risk_view():
+    """Reset the global GlobalRiskView instance (for testing, offline harnesses)."""
+    global _global_risk_view
+    with _grv_lock:
+        _global_risk_view = None
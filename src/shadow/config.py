@@ -34,5 +34,8 @@ class ShadowConfig:
     # DB batch write
     db_flush_interval_seconds: int = 60        # Flush accumulated writes to DuckDB
 
+    # Warm restart checkpoints of engine indicator/structure state (0 = off)
+    checkpoint_interval_seconds: int = 300
+
     # Default play config
     default_play_config: ShadowPlayConfig = ShadowPlayConfig()
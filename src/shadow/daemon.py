@@ -13,6 +13,7 @@ Usage:
 
 State files:
     data/shadow/state/orchestrator.state.json  — which plays to restore
+    data/runtime/checkpoints/shadow_<id>.ckpt   — engine state for warm restarts
 """
 
 import asyncio
@@ -128,7 +129,7 @@ class ShadowDaemon:
             # Find instance ID for this play
             for iid, engine in list(self._orchestrator._engines.items()):
                 if engine.play.id == play_id:
-                    self._orchestrator.remove_play(iid)
+                    self._orchestrator.remove_play(iid, discard_checkpoint=True)
                     logger.info("Reload: removed %s", play_id)
                     break
 
@@ -166,6 +167,7 @@ class ShadowDaemon:
             auto_restart_on_stale=shadow.get("auto_restart_on_stale", True),
             max_restart_attempts=shadow.get("max_restart_attempts", 3),
             db_flush_interval_seconds=shadow.get("db_flush_interval_seconds", 60),
+            checkpoint_interval_seconds=shadow.get("checkpoint_interval_seconds", 300),
             default_play_config=ShadowPlayConfig(
                 initial_equity_usdt=shadow.get("default_equity_usdt", 10000.0),
                 max_drawdown_pct=shadow.get("default_max_drawdown_pct", 25.0),
@@ -17,6 +17,7 @@ from __future__ import annotations
 
 import time
 import uuid
+from pathlib import Path
 from typing import TYPE_CHECKING
 
 from ..utils.datetime_utils import utc_now
@@ -66,6 +67,7 @@ class ShadowEngine:
         "_initial_equity",
         "_trades_buffer",
         "_snapshots_buffer",
+        "_checkpoint_path",
     )
 
     def __init__(
@@ -74,11 +76,14 @@ class ShadowEngine:
         instance_id: str | None = None,
         play_config: ShadowPlayConfig | None = None,
         snapshot_interval_seconds: int = 3600,
+        checkpoint_path: Path | None = None,
     ) -> None:
         self._play = play
         self._instance_id = instance_id or uuid.uuid4().hex[:12]
         self._config = play_config or ShadowPlayConfig()
         self._snapshot_interval = snapshot_interval_seconds
+        # Warm restart checkpoint of the LiveDataProvider (None = always cold warmup)
+        self._checkpoint_path = checkpoint_path
 
         # Set by initialize()
         self._sim_exchange: SimulatedExchange | None = None
@@ -162,6 +167,7 @@ class ShadowEngine:
 
         # Pre-fill LiveDataProvider with historical bars from DuckDB/REST
         # so warmup completes immediately instead of waiting N minutes for live candles
+        # (restores the checkpoint and replays only newer bars when one is usable)
         self._warmup_from_history()
 
         # Wire LiveDataProvider's structure states into PlayEngine so
@@ -183,8 +189,29 @@ class ShadowEngine:
             self._instance_id, self._play.id, self.symbol, self._initial_equity,
         )
 
+    def checkpoint(self) -> bool:
+        """Write the data provider's warm restart checkpoint. Returns True if written.
+
+        Skipped for engines that are not running cleanly (ERROR state, or
+        still warming up), so a broken state is never persisted.
+        """
+        if self._checkpoint_path is None or self._state != ShadowEngineState.RUNNING:
+            return False
+        assert self._engine is not None
+        from ..engine.adapters.live import LiveDataProvider
+
+        dp = self._engine._data_provider
+        if not isinstance(dp, LiveDataProvider):
+            return False
+        try:
+            return dp.save_checkpoint() is not None
+        except Exception as e:
+            logger.warning("ShadowEngine %s checkpoint failed: %s", self._instance_id, e)
+            return False
+
     def stop(self) -> ShadowEngineStats:
         """Stop the engine and return final stats."""
+        self.checkpoint()
         self._state = ShadowEngineState.STOPPED
         self._stats.stopped_at = utc_now()
 
@@ -338,6 +365,9 @@ class ShadowEngine:
         # 12. Periodic snapshot
         self._take_snapshot()
 
+        # 13. Write batched journal events once the flush interval has passed
+        self._journal.flush_if_due()
+
         self._prev_bar = bar
 
     def _process_fills(self, step_result: StepResult) -> None:
@@ -529,6 +559,7 @@ class ShadowEngine:
         """
         assert self._engine is not None
         from ..engine.adapters.live import LiveDataProvider
+        from ..data.data_service import data_service_running
         from ..data.realtime_state import RealtimeState
         import asyncio
 
@@ -537,6 +568,9 @@ class ShadowEngine:
             logger.warning("DataProvider is not LiveDataProvider, skipping history pre-fill")
             return
 
+        if self._checkpoint_path is not None:
+            dp.enable_checkpoints(self._checkpoint_path)
+
         try:
             # _load_initial_bars() early-returns if _realtime_state is None.
             # Set a temporary state so the bar-buffer check proceeds (it will be
@@ -546,8 +580,12 @@ class ShadowEngine:
 
             # Skip _sync_warmup_data() — it writes to DuckDB, which conflicts
             # when multiple shadow engines warm up in parallel (single-writer lock).
-            # _load_initial_bars() reads from DuckDB (safe for concurrent reads)
-            # and falls back to REST API if DuckDB has insufficient data.
+            # With a data service running, writes are queued there instead, so
+            # the sync is safe. _load_initial_bars() reads from DuckDB (safe for
+            # concurrent reads) and falls back to REST API if DuckDB has
+            # insufficient data.
+            if data_service_running(dp._env):
+                dp._sync_warmup_data()
             loop = asyncio.new_event_loop()
             try:
                 loop.run_until_complete(dp._load_initial_bars())
@@ -555,8 +593,8 @@ class ShadowEngine:
                 loop.close()
 
             logger.info(
-                "ShadowEngine %s warmup from history complete: ready=%s",
-                self._instance_id, dp.is_ready(),
+                "ShadowEngine %s warmup from history complete: ready=%s restored=%s",
+                self._instance_id, dp.is_ready(), dp.restored_checkpoint is not None,
             )
         except Exception as e:
             logger.warning(
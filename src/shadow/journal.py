@@ -1,16 +1,19 @@
 """
-Shadow journal — JSONL append-only logging for trades and snapshots.
+Shadow journal — append-only logging for trades and snapshots.
 
-One journal file per engine instance:
-  data/shadow/{instance_id}/events.jsonl
+One journal per engine instance:
+  data/shadow/{instance_id}/events.jsonl   (JOURNAL_FORMAT=jsonl, default)
+  data/shadow/{instance_id}/events/        (JOURNAL_FORMAT=arrow segments)
 
-Designed for minimal I/O: buffered writes, flush on trade events
-and periodic snapshots. No per-bar writes.
+Designed for minimal I/O with hundreds of engines: events are batched by
+the shared JournalWriter and written at most once per second; trades are
+written and fsync'd immediately. No per-bar writes.
 """
 
-import json
+from pathlib import Path
 
 from ..config.constants import PROJECT_ROOT
+from ..engine.journal_writer import JournalWriter, default_journal_format
 from ..utils.logger import get_module_logger
 
 from .types import ShadowSnapshot, ShadowTrade
@@ -21,18 +24,24 @@ SHADOW_DATA_DIR = PROJECT_ROOT / "data" / "shadow"
 
 
 class ShadowJournal:
-    """Append-only JSONL journal for a single shadow engine instance.
+    """Append-only journal for a single shadow engine instance.
 
-    Writes are buffered by the OS file buffer and flushed on each
-    trade/snapshot event. No per-bar I/O.
+    Signals, snapshots and errors are buffered (flushed by size, by time on
+    the next event or flush_if_due(), and on close); trades are flushed and
+    fsync'd as they are recorded.
     """
 
-    def __init__(self, instance_id: str) -> None:
+    def __init__(self, instance_id: str, fmt: str | None = None) -> None:
         self._instance_id = instance_id
         self._dir = SHADOW_DATA_DIR / instance_id
         self._dir.mkdir(parents=True, exist_ok=True)
-        self._events_path = self._dir / "events.jsonl"
-        self._fd = open(self._events_path, "a", encoding="utf-8", newline="\n")
+        self._writer = JournalWriter(
+            self._dir / "events.jsonl",
+            fmt=fmt or default_journal_format(),
+            fsync_events=("trade",),
+            compact_json=True,
+        )
+        self._events_path = self._writer.path
 
     def record_trade(self, trade: ShadowTrade) -> None:
         """Record a completed trade."""
@@ -61,16 +70,18 @@ class ShadowJournal:
         })
 
     def _write(self, data: dict) -> None:
-        """Write a single JSON line and flush."""
-        try:
-            self._fd.write(json.dumps(data, separators=(",", ":")) + "\n")
-            self._fd.flush()
-        except OSError as e:
-            logger.warning("Journal write failed for %s: %s", self._instance_id, e)
+        """Append an event (never raises on write failure)."""
+        self._writer.append(data)
+
+    def flush_if_due(self) -> None:
+        """Write buffered events if the flush interval has elapsed."""
+        self._writer.flush_if_due()
+
+    @property
+    def path(self) -> Path:
+        """Journal location (events.jsonl, or the events/ segment directory)."""
+        return self._events_path
 
     def close(self) -> None:
-        """Close the journal file."""
-        try:
-            self._fd.close()
-        except OSError:
-            pass
+        """Flush and close the journal."""
+        self._writer.close()
@@ -7,6 +7,7 @@ Responsibilities:
 - Resource limits (max engines, max per symbol)
 - Health monitoring (stale engine detection, auto-restart)
 - Batch DB writes (accumulate, flush periodically)
+- Warm restart checkpoints (periodic, and on stop)
 - Graceful shutdown (stop all engines, flush, close feeds)
 
 Memory: orchestrator itself is lightweight. The engines and feeds
@@ -17,6 +18,7 @@ from __future__ import annotations
 
 import asyncio
 import uuid
+from pathlib import Path
 from typing import TYPE_CHECKING
 
 from ..utils.datetime_utils import utc_now
@@ -55,6 +57,7 @@ class ShadowOrchestrator:
         # Background tasks (set by start())
         self._health_task: asyncio.Task[None] | None = None
         self._flush_task: asyncio.Task[None] | None = None
+        self._checkpoint_task: asyncio.Task[None] | None = None
         self._running = False
 
     # ── Properties ──────────────────────────────────────────────
@@ -96,6 +99,7 @@ class ShadowOrchestrator:
             instance_id=iid,
             play_config=config,
             snapshot_interval_seconds=self._config.snapshot_interval_seconds,
+            checkpoint_path=self._checkpoint_path(iid),
         )
         engine.initialize()
 
@@ -123,9 +127,14 @@ class ShadowOrchestrator:
         )
         return iid
 
-    def remove_play(self, instance_id: str) -> ShadowEngineStats:
+    def remove_play(self, instance_id: str, discard_checkpoint: bool = False) -> ShadowEngineStats:
         """Stop and remove a play. Returns final stats.
 
+        Args:
+            instance_id: Engine to remove
+            discard_checkpoint: Delete its warm restart checkpoint (play removed
+                for good, not just stopped for a restart)
+
         Raises:
             KeyError: If instance_id not found
         """
@@ -144,6 +153,10 @@ class ShadowOrchestrator:
         # Mark stopped in DB
         self._perf_db.mark_instance_stopped(instance_id, "manual")
 
+        checkpoint_path = self._checkpoint_path(instance_id)
+        if discard_checkpoint and checkpoint_path is not None:
+            checkpoint_path.unlink(missing_ok=True)
+
         logger.info(
             "Orchestrator: removed %s (trades=%d pnl=%.2f)",
             instance_id, stats.trades_closed, stats.cumulative_pnl_usdt,
@@ -181,6 +194,8 @@ class ShadowOrchestrator:
         self._running = True
         self._health_task = asyncio.create_task(self._health_loop())
         self._flush_task = asyncio.create_task(self._flush_loop())
+        if self._config.checkpoint_interval_seconds > 0:
+            self._checkpoint_task = asyncio.create_task(self._checkpoint_loop())
         logger.info("Orchestrator: background tasks started")
 
     async def stop(self) -> None:
@@ -188,7 +203,7 @@ class ShadowOrchestrator:
         self._running = False
 
         # Cancel background tasks
-        for task in (self._health_task, self._flush_task):
+        for task in (self._health_task, self._flush_task, self._checkpoint_task):
             if task is not None:
                 task.cancel()
                 try:
@@ -245,6 +260,32 @@ class ShadowOrchestrator:
             await asyncio.sleep(interval)
             self._flush_all()
 
+    async def _checkpoint_loop(self) -> None:
+        """Periodic warm restart checkpoints of every running engine.
+
+        Runs in a worker thread: pickling a fleet of engines takes long
+        enough to stall the event loop. Each provider's update lock keeps a
+        checkpoint from interleaving with a candle update.
+        """
+        interval = self._config.checkpoint_interval_seconds
+
+        while self._running:
+            await asyncio.sleep(interval)
+            await asyncio.to_thread(self._checkpoint_all)
+
+    def _checkpoint_all(self) -> int:
+        """Checkpoint all running engines. Returns the number written."""
+        written = sum(1 for engine in list(self._engines.values()) if engine.checkpoint())
+        logger.debug("Orchestrator checkpoint: %d/%d engines", written, len(self._engines))
+        return written
+
+    def _checkpoint_path(self, instance_id: str) -> Path | None:
+        """Checkpoint file of an engine (None when checkpoints are disabled)."""
+        if self._config.checkpoint_interval_seconds <= 0:
+            return None
+        from ..engine.adapters.checkpoint import default_checkpoint_path
+        return default_checkpoint_path(f"shadow_{instance_id}")
+
     async def _restart_engine(self, instance_id: str) -> None:
         """Restart a stale/errored engine."""
         engine = self._engines.get(instance_id)
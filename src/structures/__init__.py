@@ -30,11 +30,16 @@ Registry (from registry.py):
     get_structure_warmup      - Get warmup bars needed for a structure
     get_structure_output_type - Get output type for a structure field
     STRUCTURE_OUTPUT_TYPES    - Maps structure fields to output types
+    VECTORIZED_STRUCTURE_REGISTRY - Whole-array kernels for the backtest backend
+    register_vectorized_structure - Decorator to register a vectorized kernel
 
 State Containers (from state.py):
     TFIncrementalState        - Container for single-timeframe structures
     MultiTFIncrementalState   - Container for multi-timeframe structures
 
+Structure History (from history.py, live):
+    StructureHistory          - Columnar ring buffer of every output per bar
+
 Batch Wrapper (from batch_wrapper.py):
     run_detector_batch        - Run detector in batch mode over OHLCV data
 
@@ -46,6 +51,12 @@ Detectors (from detectors/):
     IncrementalRollingWindow  - Rolling window min/max
     IncrementalDerivedZone    - Derived zones with K slots + aggregates
 
+Vectorized Backend (from vectorized.py, backtest only):
+    STRUCTURE_BACKENDS        - Selectable backends ("incremental", "vectorized")
+    StructureArrays           - Float64 feed columns for one timeframe
+    PrecomputedStructure      - Detector serving precomputed kernel outputs
+    apply_vectorized_backend  - Switch eligible structures in a multi-TF state
+
 Example Usage:
 --------------
 
@@ -106,6 +117,8 @@ from .registry import (
     get_structure_warmup,
     get_structure_output_type,
     STRUCTURE_OUTPUT_TYPES,
+    VECTORIZED_STRUCTURE_REGISTRY,
+    register_vectorized_structure,
 )
 
 # State containers
@@ -114,6 +127,12 @@ from .state import (
     MultiTFIncrementalState,
 )
 
+# Structure history (live lookback)
+from .history import (
+    DEFAULT_HISTORY_BARS,
+    StructureHistory,
+)
+
 # Batch wrapper
 from .batch_wrapper import (
     run_detector_batch,
@@ -130,6 +149,14 @@ from .detectors import (
     IncrementalDerivedZone,
 )
 
+# Vectorized backtest backend (imports trigger kernel registration)
+from .vectorized import (
+    STRUCTURE_BACKENDS,
+    StructureArrays,
+    PrecomputedStructure,
+    apply_vectorized_backend,
+)
+
 __all__ = [
     # Types
     "ZoneType",
@@ -151,9 +178,14 @@ __all__ = [
     "get_structure_warmup",
     "get_structure_output_type",
     "STRUCTURE_OUTPUT_TYPES",
+    "VECTORIZED_STRUCTURE_REGISTRY",
+    "register_vectorized_structure",
     # State containers
     "TFIncrementalState",
     "MultiTFIncrementalState",
+    # Structure history
+    "DEFAULT_HISTORY_BARS",
+    "StructureHistory",
     # Batch wrapper
     "run_detector_batch",
     # Detectors
@@ -164,4 +196,9 @@ __all__ = [
     "IncrementalMarketStructure",
     "IncrementalRollingWindow",
     "IncrementalDerivedZone",
+    # Vectorized backend
+    "STRUCTURE_BACKENDS",
+    "StructureArrays",
+    "PrecomputedStructure",
+    "apply_vectorized_backend",
 ]
@@ -281,6 +281,21 @@ class BaseIncrementalDetector(ABC):
             )
         return self.get_value(key)
 
+    def output_values(self) -> list[float | int | str | bool | None]:
+        """
+        All output values in get_output_keys() order.
+
+        Bulk read used to record every output each bar (StructureHistory).
+        The default reads key by key through get_value(); detectors with
+        many or computed outputs override it. Overrides must return exactly
+        what get_value() returns for each key.
+
+        Returns:
+            List of values, one per output key.
+        """
+        get_value = self.get_value
+        return [get_value(key) for key in self.get_output_keys()]
+
     def get_all_values(self) -> dict[str, float | int | str]:
         """
         Return all output values as a dictionary.
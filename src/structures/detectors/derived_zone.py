@@ -65,6 +65,16 @@ ZONE_STATE_NONE = "none"
 ZONE_STATE_ACTIVE = "active"
 ZONE_STATE_BROKEN = "broken"
 
+# Per-slot output fields, in output key order (zone{N}_{field})
+SLOT_FIELDS = (
+    "lower", "upper", "state", "anchor_idx", "age_bars",
+    "touched_this_bar", "touch_count", "last_touch_age",
+    "inside", "instance_id",
+)
+
+# Slot outputs of an unpopulated slot (see _get_empty_value)
+_EMPTY_SLOT_VALUES = (None, None, ZONE_STATE_NONE, -1, -1, False, 0, -1, False, 0)
+
 
 @register_structure("derived_zone")
 class IncrementalDerivedZone(BaseIncrementalDetector):
@@ -451,13 +461,8 @@ class IncrementalDerivedZone(BaseIncrementalDetector):
         keys: list[str] = []
 
         # Slot fields for each zone
-        slot_fields = [
-            "lower", "upper", "state", "anchor_idx", "age_bars",
-            "touched_this_bar", "touch_count", "last_touch_age",
-            "inside", "instance_id"
-        ]
         for i in range(self.max_active):
-            for field in slot_fields:
+            for field in SLOT_FIELDS:
                 keys.append(f"zone{i}_{field}")
 
         # Aggregate fields
@@ -475,6 +480,41 @@ class IncrementalDerivedZone(BaseIncrementalDetector):
 
         return keys
 
+    def output_values(self) -> list[float | int | str | bool | None]:
+        """
+        All outputs in get_output_keys() order, read straight from the zone
+        dicts (no key parsing). Same values as get_value() per key.
+        """
+        values: list[Any] = []
+        zones = self._zones
+        for zone in zones[:self.max_active]:
+            last_touch = zone.get("last_touch_bar", -1)
+            values += (
+                zone["lower"], zone["upper"], zone["state"], zone["anchor_idx"], zone["age_bars"],
+                zone["touched_this_bar"], zone["touch_count"],
+                -1 if last_touch < 0 else self._current_bar_idx - last_touch,
+                zone["inside"], zone["instance_id"],
+            )
+        for _ in range(len(zones), self.max_active):
+            values += _EMPTY_SLOT_VALUES
+
+        active = [(idx, zone) for idx, zone in enumerate(zones) if zone["state"] == ZONE_STATE_ACTIVE]
+        first_idx, first_lower, first_upper = (
+            (active[0][0], active[0][1]["lower"], active[0][1]["upper"]) if active else (-1, None, None)
+        )
+        values += (
+            len(active),
+            bool(active),
+            any(zone["touched_this_bar"] for _, zone in active),
+            any(zone["inside"] for _, zone in active),
+            first_lower,
+            first_upper,
+            first_idx,
+            first_idx,
+            self._source_version,
+        )
+        return values
+
     def get_value(self, key: str) -> float | int | str | bool | None:
         """
         Get output by key.
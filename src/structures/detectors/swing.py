@@ -354,10 +354,7 @@ class IncrementalSwing(BaseIncrementalDetector):
             bar: Bar data containing high and low prices.
         """
         # Gate 2: Reset alternation output flags each bar (both modes)
-        self._high_accepted = False
-        self._low_accepted = False
-        self._high_replaced_pending = False
-        self._low_replaced_pending = False
+        self._reset_bar_flags()
 
         # Dispatch to mode-specific update
         if self._mode == "fractal":
@@ -387,16 +384,50 @@ class IncrementalSwing(BaseIncrementalDetector):
         pivot_idx = self.left
         pivot_bar_idx = bar_idx - self.right
 
+        high_candidate = self._high_buf[pivot_idx] if self._is_swing_high(pivot_idx) else None
+        low_candidate = self._low_buf[pivot_idx] if self._is_swing_low(pivot_idx) else None
+        if high_candidate is None and low_candidate is None:
+            # Nothing to confirm; pairing state machine is a no-op
+            return
+
+        self._confirm_fractal_pivots(
+            pivot_bar_idx, high_candidate, low_candidate, self._get_atr(bar)
+        )
+
+    def _reset_bar_flags(self) -> None:
+        """Reset the Gate 2 alternation flags that only live for one bar."""
+        self._high_accepted = False
+        self._low_accepted = False
+        self._high_replaced_pending = False
+        self._low_replaced_pending = False
+
+    def _confirm_fractal_pivots(
+        self,
+        pivot_bar_idx: int,
+        high_candidate: float | None,
+        low_candidate: float | None,
+        atr: float | None,
+    ) -> None:
+        """
+        Run fractal pivot candidates through the gates and pairing state.
+
+        Split out of _update_fractal so the vectorized backend can detect
+        window pivots with array ops and replay only the candidate bars
+        through the exact same gate logic (see src/structures/vectorized.py).
+
+        Args:
+            pivot_bar_idx: Absolute bar index of the pivot (bar_idx - right).
+            high_candidate: Pivot high if it is a window swing high, else None.
+            low_candidate: Pivot low if it is a window swing low, else None.
+            atr: Current ATR value (or None if not available).
+        """
         # Track what pivots were confirmed this bar
         confirmed_high = False
         confirmed_low = False
 
-        # Get ATR for significance calculation (if configured)
-        atr = self._get_atr(bar)
-
         # Check for swing high
-        if self._is_swing_high(pivot_idx):
-            new_high_level = self._high_buf[pivot_idx]
+        if high_candidate is not None:
+            new_high_level = high_candidate
 
             # Gate 1: Check if pivot should be accepted (filter insignificant pivots)
             if self._should_accept_pivot("high", new_high_level, atr):
@@ -435,8 +466,8 @@ class IncrementalSwing(BaseIncrementalDetector):
                     self._high_replaced_pending = alt_replaced
 
         # Check for swing low
-        if self._is_swing_low(pivot_idx):
-            new_low_level = self._low_buf[pivot_idx]
+        if low_candidate is not None:
+            new_low_level = low_candidate
 
             # Gate 1: Check if pivot should be accepted (filter insignificant pivots)
             if self._should_accept_pivot("low", new_low_level, atr):
@@ -0,0 +1,304 @@
+"""
+Columnar history of structure outputs for live engines.
+
+LiveDataProvider keeps the last N values of every structure output on a
+timeframe so get_structure_at() can look back (-1 = latest bar, -2 = the
+one before, ...). StructureHistory holds them in one preallocated column
+per output field, all sharing a single ring position:
+
+    FLOAT   array('d')
+    INT     array('q')
+    BOOL    array('b')  0/1
+    ENUM    array('h')  codes into a per-column category table
+    other   list        undeclared outputs (see STRUCTURE_OUTPUT_TYPES)
+
+Column kinds come from the declared output types. A column that ever
+receives None gets a null mask (bytearray) next to it. A value that does
+not fit its declared kind exactly (wrong Python type, int64 overflow)
+turns that column into a plain list, so every read returns exactly the
+value the detector produced.
+
+Slots are assigned once per structure, in get_output_keys() order. Each
+bar the detector hands over all its values through output_values() and
+they are written by slot: no key strings, no per-field dict lookups.
+A lookback read is one dict lookup plus one column index.
+
+Example:
+    >>> history = StructureHistory(state, capacity=500)
+    >>> state.update(bar)
+    >>> history.record(state, bar.idx)
+    >>> history.value_at("swing", "high_level", -1)
+    50000.0
+"""
+
+from __future__ import annotations
+
+from array import array
+from typing import TYPE_CHECKING, Any
+
+from .registry import get_structure_output_type
+from .types import FeatureOutputType
+from ..utils.logger import get_module_logger
+
+if TYPE_CHECKING:
+    from .state import TFIncrementalState
+
+logger = get_module_logger(__name__)
+
+# Bars of history kept per timeframe
+DEFAULT_HISTORY_BARS = 500
+
+# Column kinds (kinds up to _OBJECT are read back as stored)
+_FLOAT, _INT, _OBJECT, _BOOL, _ENUM = range(5)
+
+_KIND_OF_OUTPUT_TYPE = {
+    FeatureOutputType.FLOAT: _FLOAT,
+    FeatureOutputType.INT: _INT,
+    FeatureOutputType.BOOL: _BOOL,
+    FeatureOutputType.ENUM: _ENUM,
+}
+_TYPECODES = {_FLOAT: "d", _INT: "q", _BOOL: "b", _ENUM: "h"}
+_PY_TYPES: dict[int, type] = {_FLOAT: float, _INT: int, _BOOL: bool, _ENUM: str}
+_MAX_CATEGORIES = 32767  # int16 codes
+
+
+class _Checked:
+    """Fast-path type of columns that need the full write path (nulls, ENUM, list)."""
+
+
+class StructureHistory:
+    """
+    Preallocated columnar ring buffer of structure outputs for one timeframe.
+
+    Built from a TFIncrementalState; record() must be called with that same
+    state (or one with the same structures) after every update.
+
+    Attributes:
+        capacity: Bars kept (older bars are overwritten).
+    """
+
+    __slots__ = (
+        "capacity", "_spans", "_slots", "_fields", "_kinds", "_columns",
+        "_fast_types", "_nulls", "_categories", "_codes", "_bar_idx", "_head", "_count",
+    )
+
+    def __init__(self, state: "TFIncrementalState", capacity: int = DEFAULT_HISTORY_BARS) -> None:
+        """
+        Args:
+            state: Structure state whose outputs are recorded
+            capacity: Bars kept per column (must be >= 1)
+
+        Raises:
+            ValueError: If capacity < 1
+        """
+        if capacity < 1:
+            raise ValueError(
+                f"capacity must be >= 1, got {capacity}\n"
+                f"\n"
+                f"Fix: StructureHistory(state, capacity={DEFAULT_HISTORY_BARS})"
+            )
+        self.capacity = capacity
+        # (struct_key, first slot, end slot) in update order
+        self._spans: list[tuple[str, int, int]] = []
+        self._slots: dict[str, dict[str, int]] = {}
+        self._fields: list[tuple[str, str]] = []
+        self._kinds: list[int] = []
+        self._columns: list[Any] = []
+        self._fast_types: list[type] = []
+        self._nulls: list[bytearray | None] = []
+        # Per slot; only ENUM slots ever fill them
+        self._categories: list[list[str]] = []
+        self._codes: list[dict[str, int]] = []
+        self._bar_idx = array("q", bytes(8 * capacity))
+        self._head = 0
+        self._count = 0
+
+        for key in state.list_structures():
+            detector = state.structures[key]
+            start = len(self._kinds)
+            by_field = self._slots[key] = {}
+            for field in detector.get_output_keys():
+                try:
+                    kind = _KIND_OF_OUTPUT_TYPE[get_structure_output_type(detector._type, field)]
+                except ValueError:
+                    kind = _OBJECT
+                by_field[field] = len(self._kinds)
+                self._fields.append((key, field))
+                self._add_column(kind)
+            self._spans.append((key, start, len(self._kinds)))
+
+    def _add_column(self, kind: int) -> None:
+        capacity = self.capacity
+        self._kinds.append(kind)
+        if kind == _OBJECT:
+            self._columns.append([None] * capacity)
+        else:
+            self._columns.append(array(_TYPECODES[kind], bytes(array(_TYPECODES[kind]).itemsize * capacity)))
+        self._fast_types.append(_PY_TYPES[kind] if kind in (_FLOAT, _INT, _BOOL) else _Checked)
+        self._nulls.append(None)
+        self._categories.append([])
+        self._codes.append({})
+
+    def __len__(self) -> int:
+        return self._count
+
+    @property
+    def field_count(self) -> int:
+        return len(self._kinds)
+
+    def has_field(self, key: str, field: str) -> bool:
+        return field in self._slots.get(key, ())
+
+    # ------------------------------------------------------------------
+    # Write path
+    # ------------------------------------------------------------------
+
+    def record(self, state: "TFIncrementalState", bar_idx: int) -> None:
+        """Append the current outputs of every structure in state as one row."""
+        pos = self._head
+        columns = self._columns
+        fast_types = self._fast_types
+        structures = state.structures
+        for key, start, end in self._spans:
+            detector = structures[key]
+            try:
+                values = detector.output_values()
+            except (KeyError, RuntimeError):
+                values = self._values_per_key(detector, start, end)
+            slot = start
+            for value in values:
+                if type(value) is fast_types[slot]:
+                    try:
+                        columns[slot][pos] = value
+                    except OverflowError:
+                        self._write_checked(slot, pos, value)
+                else:
+                    self._write_checked(slot, pos, value)
+                slot += 1
+        self._bar_idx[pos] = bar_idx
+        self._head = (pos + 1) % self.capacity
+        if self._count < self.capacity:
+            self._count += 1
+
+    def _values_per_key(self, detector: Any, start: int, end: int) -> list[Any]:
+        """Fallback when output_values() fails: read key by key, None where unavailable."""
+        values: list[Any] = []
+        for _, field in self._fields[start:end]:
+            try:
+                values.append(detector.get_value(field))
+            except (KeyError, RuntimeError):
+                values.append(None)
+        return values
+
+    def _write_checked(self, slot: int, pos: int, value: Any) -> None:
+        kind = self._kinds[slot]
+        if kind == _OBJECT:
+            self._columns[slot][pos] = value
+            return
+        if value is None:
+            nulls = self._nulls[slot]
+            if nulls is None:
+                nulls = self._nulls[slot] = bytearray(self.capacity)
+                self._fast_types[slot] = _Checked
+            nulls[pos] = 1
+            return
+        if type(value) is not _PY_TYPES[kind]:
+            self._demote(slot, f"got {type(value).__name__}")
+            self._columns[slot][pos] = value
+            return
+        if kind == _ENUM:
+            codes = self._codes[slot]
+            code = codes.get(value)
+            if code is None:
+                categories = self._categories[slot]
+                if len(categories) >= _MAX_CATEGORIES:
+                    self._demote(slot, "too many categories")
+                    self._columns[slot][pos] = value
+                    return
+                code = codes[value] = len(categories)
+                categories.append(value)
+            value = code
+        try:
+            self._columns[slot][pos] = value
+        except OverflowError:
+            self._demote(slot, "value out of range")
+            self._columns[slot][pos] = value
+            return
+        nulls = self._nulls[slot]
+        if nulls is not None:
+            nulls[pos] = 0
+
+    def _demote(self, slot: int, reason: str) -> None:
+        """Turn a typed column into a list column, keeping the rows written so far."""
+        key, field = self._fields[slot]
+        logger.debug("Structure history column %s.%s stored untyped: %s", key, field, reason)
+        self._columns[slot] = [self._decode(slot, pos) for pos in range(self.capacity)]
+        self._kinds[slot] = _OBJECT
+        self._fast_types[slot] = _Checked
+        self._nulls[slot] = None
+        self._categories[slot] = []
+        self._codes[slot] = {}
+
+    # ------------------------------------------------------------------
+    # Read path
+    # ------------------------------------------------------------------
+
+    def _decode(self, slot: int, pos: int) -> Any:
+        nulls = self._nulls[slot]
+        if nulls is not None and nulls[pos]:
+            return None
+        value = self._columns[slot][pos]
+        kind = self._kinds[slot]
+        if kind == _BOOL:
+            return bool(value)
+        if kind == _ENUM:
+            categories = self._categories[slot]
+            return categories[value] if value < len(categories) else None
+        return value
+
+    def value_at(self, key: str, field: str, index: int) -> Any:
+        """
+        Value of key.field index bars back (-1 = latest recorded bar).
+
+        Returns NaN for an unknown field or a lookback beyond the recorded
+        bars. O(1).
+        """
+        by_field = self._slots.get(key)
+        slot = by_field.get(field) if by_field is not None else None
+        if slot is None or not -self._count <= index <= -1:
+            return float("nan")
+        pos = (self._head + index) % self.capacity
+        nulls = self._nulls[slot]
+        if nulls is not None and nulls[pos]:
+            return None
+        value = self._columns[slot][pos]
+        kind = self._kinds[slot]
+        if kind <= _OBJECT:
+            return value
+        if kind == _BOOL:
+            return bool(value)
+        categories = self._categories[slot]
+        return categories[value] if value < len(categories) else None
+
+    def values(self, key: str, field: str) -> list[Any]:
+        """All recorded values of key.field, oldest first."""
+        slot = self._slots[key][field]
+        return [self._decode(slot, pos) for pos in self._positions()]
+
+    def bar_indices(self) -> list[int]:
+        """Bar index of every recorded row, oldest first."""
+        return [self._bar_idx[pos] for pos in self._positions()]
+
+    def fields(self) -> list[tuple[str, str]]:
+        """(struct_key, field) of every column, in slot order."""
+        return list(self._fields)
+
+    def _positions(self) -> list[int]:
+        start = (self._head - self._count) % self.capacity
+        return [(start + i) % self.capacity for i in range(self._count)]
+
+    def __repr__(self) -> str:
+        return (
+            f"StructureHistory(structures={len(self._spans)}, fields={len(self._kinds)}, "
+            f"bars={self._count}/{self.capacity})"
+        )
@@ -6,6 +6,8 @@ Provides:
 - register_structure: Decorator to register detector classes
 - get_structure_info: Get metadata about a registered structure
 - list_structure_types: List all registered structure type names
+- VECTORIZED_STRUCTURE_REGISTRY: Whole-array kernels for the backtest backend
+- register_vectorized_structure: Decorator to register a vectorized kernel
 
 The registry enables dynamic discovery and validation of structure types.
 Detectors are registered at import time via the @register_structure decorator.
@@ -42,6 +44,13 @@ if TYPE_CHECKING:
 # Global registry: maps structure type name to detector class
 STRUCTURE_REGISTRY: dict[str, type["BaseIncrementalDetector"]] = {}
 
+# Vectorized backend registry: maps structure type name to a whole-array kernel
+# and the predicate that says which param combinations the kernel covers.
+# Kernels live in src/structures/vectorized.py and must match the incremental
+# detector bit-for-bit (gated by audit_structure_parity).
+VECTORIZED_STRUCTURE_REGISTRY: dict[str, Callable] = {}
+VECTORIZED_STRUCTURE_SUPPORTS: dict[str, Callable[[dict[str, Any]], bool]] = {}
+
 
 # =============================================================================
 # Structure Output Types
@@ -436,6 +445,58 @@ def register_structure(name: str):
     return decorator
 
 
+def register_vectorized_structure(
+    name: str,
+    supports: Callable[[dict[str, Any]], bool] | None = None,
+):
+    """
+    Decorator to register a vectorized kernel for a structure type.
+
+    The kernel computes every output of the structure for a whole feed in
+    one call and is used by the backtest "vectorized" structure backend.
+    The incremental detector registered under the same name stays the
+    reference (and the only implementation used live).
+
+    Args:
+        name: The structure type name. Must already be in STRUCTURE_REGISTRY.
+        supports: Optional predicate over the structure params. Structures
+            whose params are not supported stay on the incremental detector.
+
+    Returns:
+        Decorator function.
+
+    Raises:
+        ValueError: If name has no incremental detector or already has a kernel.
+
+    Example:
+        @register_vectorized_structure("displacement")
+        def displacement_kernel(params, arrays, deps):
+            ...
+            return {"is_displacement": ..., "direction": ...}
+    """
+
+    def decorator(fn: Callable) -> Callable:
+        if name not in STRUCTURE_REGISTRY:
+            raise ValueError(
+                f"Cannot register vectorized kernel '{name}': no incremental detector registered\n"
+                f"\n"
+                f"Fix: Register the incremental detector with @register_structure('{name}') first;\n"
+                f"     it is the reference the kernel is audited against."
+            )
+        if name in VECTORIZED_STRUCTURE_REGISTRY:
+            existing = VECTORIZED_STRUCTURE_REGISTRY[name]
+            raise ValueError(
+                f"Vectorized kernel '{name}' already registered by {existing.__name__}\n"
+                f"\n"
+                f"Fix: Use a unique name or remove the duplicate registration."
+            )
+        VECTORIZED_STRUCTURE_REGISTRY[name] = fn
+        VECTORIZED_STRUCTURE_SUPPORTS[name] = supports or (lambda params: True)
+        return fn
+
+    return decorator
+
+
 def get_structure_info(name: str) -> dict[str, Any]:
     """
     Get metadata about a registered structure type.
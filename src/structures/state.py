@@ -26,11 +26,13 @@ See: docs/architecture/INCREMENTAL_STATE_ARCHITECTURE.md
 
 from __future__ import annotations
 
+from time import perf_counter_ns
 from typing import TYPE_CHECKING, Any
 
 from .base import BaseIncrementalDetector
 from .registry import STRUCTURE_REGISTRY
 from ..utils.debug import is_debug_enabled, is_verbose_enabled, verbose_log
+from ..utils.profiler import active_profiler
 
 if TYPE_CHECKING:
     from .base import BarData
@@ -86,6 +88,9 @@ class TFIncrementalState:
         self._bar_idx: int = -1
         self.structures: dict[str, BaseIncrementalDetector] = {}
         self._update_order: list[str] = []
+        # Per-key spec details kept for alternate backends (see vectorized.py)
+        self.struct_params: dict[str, dict[str, Any]] = {}
+        self.struct_uses: dict[str, list[str]] = {}
 
         self._build_structures(structure_specs)
 
@@ -186,6 +191,8 @@ class TFIncrementalState:
 
             self.structures[key] = detector
             self._update_order.append(key)
+            self.struct_params[key] = dict(params)
+            self.struct_uses[key] = uses
 
     def update(self, bar: "BarData") -> None:
         """
@@ -211,6 +218,7 @@ class TFIncrementalState:
 
         _verbose = is_verbose_enabled()
         _debug = is_debug_enabled()
+        prof = active_profiler()
 
         for key in self._update_order:
             detector = self.structures[key]
@@ -218,7 +226,12 @@ class TFIncrementalState:
             ver_before = getattr(detector, "_version", None)
             trend_before = getattr(detector, "trend_direction", None)
 
-            detector.update(bar.idx, bar)
+            if prof is None:
+                detector.update(bar.idx, bar)
+            else:
+                t = perf_counter_ns()
+                detector.update(bar.idx, bar)
+                prof.lap(f"engine.structures.{self.timeframe}.{key}", t)
 
             # Log structure change events
             if _verbose and ver_before is not None:
@@ -317,6 +330,8 @@ class TFIncrementalState:
         instance._bar_idx = data.get("bar_idx", 0)
         instance.structures = {}  # Detectors must be re-registered
         instance._update_order = []
+        instance.struct_params = {}
+        instance.struct_uses = {}
         return instance
 
     def reset(self) -> None:
@@ -0,0 +1,1448 @@
+"""
+Vectorized structure backend for backtests.
+
+The incremental detectors process one bar at a time, which is what live
+trading needs but wastes time in a backtest where the whole feed is known
+up front. This module provides whole-array kernels that compute every
+output of a structure for a timeframe in a single pass, plus an
+array-replay detector (PrecomputedStructure) that plugs the results into
+TFIncrementalState so the engine reads them through the usual API.
+
+Provides:
+- StructureArrays: Float64 feed columns for one TF, sliced from the first update
+- PrecomputedStructure: Detector that serves precomputed kernel outputs
+- apply_vectorized_backend: Swap eligible detectors in a MultiTFIncrementalState
+- Kernels for every registered structure type
+
+Kernels vectorize what depends only on the feed (pivot windows, gap
+patterns, displacement tests, zone/level distances) and replay the
+reference detector on the sparse bars where its state can change, found
+by vectorized search. Not vectorized (always incremental): swing in
+atr_zigzag mode. Under the vectorized backend such a structure, and every
+structure tied to one through uses:, logs a warning naming why it stays
+incremental.
+
+Rules:
+- The incremental detectors remain the reference. Every kernel must match
+  them exactly (same values and Python types), gated by
+  audit_structure_parity.audit_vectorized_backend.
+- Live trading never uses this module.
+- A structure is only switched when a kernel supports its params AND every
+  structure it depends on, and every structure depending on it, is also
+  switched. Incremental dependents read detector attributes directly, so a
+  precomputed dependency would break them.
+- Kernels start from the first bar the engine feeds (not feed index 0),
+  so warmup-sensitive state (windows, pairing) matches the incremental run.
+
+See: docs/architecture/INCREMENTAL_STATE_ARCHITECTURE.md
+"""
+
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass
+from types import SimpleNamespace
+from typing import TYPE_CHECKING, Any, Callable, Mapping
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+from .base import BarData, BaseIncrementalDetector
+from .detectors.derived_zone import SLOT_FIELDS, ZONE_STATE_ACTIVE, ZONE_STATE_BROKEN
+from ..utils.logger import get_module_logger
+from .registry import (
+    STRUCTURE_REGISTRY,
+    VECTORIZED_STRUCTURE_REGISTRY,
+    VECTORIZED_STRUCTURE_SUPPORTS,
+    register_vectorized_structure,
+)
+
+if TYPE_CHECKING:
+    from .state import MultiTFIncrementalState, TFIncrementalState
+
+logger = get_module_logger(__name__)
+
+# Supported structure backends (selected per backtest run)
+STRUCTURE_BACKENDS: tuple[str, ...] = ("incremental", "vectorized")
+
+# Rows per block when comparing sliding windows (bounds temp memory for wide windows)
+_WINDOW_BLOCK_ROWS = 65_536
+
+
+# =============================================================================
+# Inputs
+# =============================================================================
+
+
+@dataclass(frozen=True, slots=True)
+class StructureArrays:
+    """
+    Feed columns for one timeframe, starting at the first structure update.
+
+    All columns are float64 so arithmetic matches the incremental detectors,
+    which receive Python floats built from the same arrays.
+
+    Attributes:
+        base_idx: Absolute feed index of position 0.
+        open/high/low/close/volume: OHLCV columns.
+        indicators: Indicator columns by feed key.
+    """
+
+    base_idx: int
+    open: np.ndarray
+    high: np.ndarray
+    low: np.ndarray
+    close: np.ndarray
+    volume: np.ndarray
+    indicators: Mapping[str, np.ndarray]
+
+    @classmethod
+    def from_feed(cls, feed: Any, base_idx: int) -> "StructureArrays":
+        """Slice a FeedStore-like object (OHLCV arrays + indicators dict)."""
+
+        def col(arr: np.ndarray) -> np.ndarray:
+            return np.asarray(arr[base_idx:], dtype=np.float64)
+
+        return cls(
+            base_idx=base_idx,
+            open=col(feed.open),
+            high=col(feed.high),
+            low=col(feed.low),
+            close=col(feed.close),
+            volume=col(feed.volume),
+            indicators={name: col(arr) for name, arr in feed.indicators.items()},
+        )
+
+    def __len__(self) -> int:
+        return len(self.close)
+
+    def source(self, name: str) -> np.ndarray:
+        """Return an OHLCV column by name."""
+        return getattr(self, name)
+
+    def indicator(self, key: str | None) -> np.ndarray | None:
+        """Return an indicator column, or None if not in the feed."""
+        if key is None:
+            return None
+        return self.indicators.get(key)
+
+
+# Kernel signature: (params, arrays, deps by type -> output arrays) -> output arrays
+VectorizedKernel = Callable[
+    [dict[str, Any], StructureArrays, dict[str, dict[str, np.ndarray]]],
+    dict[str, np.ndarray],
+]
+
+
+# =============================================================================
+# Array-replay detector
+# =============================================================================
+
+
+def _scalar_converter(arr: np.ndarray) -> Callable[[Any], Any]:
+    """Return the converter giving the incremental detector's Python type."""
+    kind = arr.dtype.kind
+    if kind == "f":
+        return float
+    if kind in ("i", "u"):
+        return int
+    if kind == "b":
+        return bool
+    return lambda value: value
+
+
+class PrecomputedStructure(BaseIncrementalDetector):
+    """
+    Detector that serves outputs computed by a vectorized kernel.
+
+    Computation is deferred to the first update() so the kernel starts at
+    the same bar as the incremental detector would. Dependencies (also
+    PrecomputedStructure) are updated first by TFIncrementalState, so their
+    arrays are ready when this one computes.
+
+    Updates must be contiguous after the first one; the backtest engine
+    feeds every exec bar and every closed med/high bar in order.
+    """
+
+    REQUIRED_PARAMS: list[str] = []
+    OPTIONAL_PARAMS: dict[str, Any] = {}
+    DEPENDS_ON: list[str] = []
+
+    def __init__(
+        self,
+        struct_type: str,
+        key: str,
+        params: dict[str, Any],
+        initial: dict[str, Any],
+        feed: Any,
+        kernel: VectorizedKernel,
+        deps: dict[str, "PrecomputedStructure"],
+    ) -> None:
+        """
+        Initialize the replay detector.
+
+        Args:
+            struct_type: Structure type name (kept as _type for engine lookups).
+            key: Structure key.
+            params: Structure params from the Play.
+            initial: Output values of the fresh incremental detector it replaces
+                (also defines the output keys).
+            feed: FeedStore for the structure's timeframe.
+            kernel: Registered vectorized kernel.
+            deps: Precomputed dependencies keyed by dependency type.
+        """
+        self._type = struct_type
+        self._key = key
+        self._params = params
+        self._initial = dict(initial)
+        self._output_keys = list(initial)
+        self._feed = feed
+        self._kernel = kernel
+        self._deps = deps
+        self._outputs: dict[str, np.ndarray] | None = None
+        self._converters: dict[str, Callable[[Any], Any]] = {}
+        self._base_idx: int = -1
+        self._pos: int = -1
+
+    def _compute(self, base_idx: int) -> None:
+        arrays = StructureArrays.from_feed(self._feed, base_idx)
+        dep_outputs: dict[str, dict[str, np.ndarray]] = {}
+        for dep_type, dep in self._deps.items():
+            if dep._outputs is None or dep._base_idx != base_idx:
+                raise ValueError(
+                    f"Structure '{self._key}' dependency '{dep._key}' was not computed "
+                    f"from bar {base_idx}.\n"
+                    "\n"
+                    "Fix: Define dependencies before dependents in the structures list "
+                    "so they are updated first."
+                )
+            dep_outputs[dep_type] = dep._outputs
+        outputs = self._kernel(self._params, arrays, dep_outputs)
+        missing = [k for k in self._output_keys if k not in outputs]
+        if missing:
+            raise ValueError(
+                f"Vectorized kernel for '{self._type}' did not produce outputs {missing}.\n"
+                "\n"
+                "Fix: Kernels must return every key from the incremental detector's "
+                "get_output_keys()."
+            )
+        self._outputs = outputs
+        self._converters = {k: _scalar_converter(outputs[k]) for k in self._output_keys}
+        self._base_idx = base_idx
+
+    def update(self, bar_idx: int, bar: "BarData") -> None:
+        """Advance to bar_idx, computing all outputs on the first call."""
+        if self._outputs is None:
+            self._compute(bar_idx)
+            self._pos = 0
+            return
+        pos = bar_idx - self._base_idx
+        if pos != self._pos + 1:
+            raise ValueError(
+                f"Structure '{self._key}' (vectorized backend) expects contiguous bars: "
+                f"got bar {bar_idx} after bar {self._base_idx + self._pos}.\n"
+                "\n"
+                "Fix: Run this backtest with --structure-backend incremental."
+            )
+        if pos >= len(self._outputs[self._output_keys[0]]):
+            raise ValueError(
+                f"Structure '{self._key}' (vectorized backend) got bar {bar_idx} "
+                f"beyond the precomputed feed.\n"
+                "\n"
+                "Fix: Run this backtest with --structure-backend incremental."
+            )
+        self._pos = pos
+
+    def get_output_keys(self) -> list[str]:
+        """Return the output keys of the replaced incremental detector."""
+        return list(self._output_keys)
+
+    def get_value(self, key: str) -> float | int | str | bool | None:
+        """Get output by key at the current bar."""
+        if self._outputs is None:
+            # Before the first bar: same defaults as a fresh detector
+            return self._initial[key]
+        if key not in self._converters:
+            raise KeyError(key)
+        value = self._outputs[key][self._pos]
+        if value is None:
+            return None
+        return self._converters[key](value)
+
+    def get_value_safe(self, key: str) -> float | int | str:
+        """Get output by key, validating it against the precomputed outputs."""
+        if key not in self._converters:
+            return super().get_value_safe(key)
+        value = self._outputs[key][self._pos]  # type: ignore[index]
+        if value is None:
+            return None  # type: ignore[return-value]
+        return self._converters[key](value)
+
+    def reset(self) -> None:
+        """Drop precomputed outputs; the next update recomputes."""
+        self._outputs = None
+        self._converters = {}
+        self._base_idx = -1
+        self._pos = -1
+
+    def to_dict(self) -> dict[str, Any]:
+        """Serialize the current output row."""
+        if self._outputs is None:
+            return {"backend": "vectorized", "bar_idx": None}
+        row = {k: self.get_value(k) for k in self._output_keys}
+        return {"backend": "vectorized", "bar_idx": self._base_idx + self._pos, **row}
+
+    def __repr__(self) -> str:
+        return f"PrecomputedStructure(type={self._type!r}, key={self._key!r})"
+
+
+# =============================================================================
+# Backend selection
+# =============================================================================
+
+
+def _eligible_keys(tf_state: "TFIncrementalState") -> tuple[list[str], dict[str, str]]:
+    """
+    Keys that can switch to the vectorized backend, in update order.
+
+    Starts from structures with a supporting kernel and removes any whose
+    dependencies or dependents stay incremental, until stable.
+
+    Returns:
+        (switchable keys, reason per key that stays incremental)
+    """
+    candidates: set[str] = set()
+    fallbacks: dict[str, str] = {}
+    for key in tf_state.list_structures():
+        struct_type = tf_state.structures[key]._type
+        supports = VECTORIZED_STRUCTURE_SUPPORTS.get(struct_type)
+        if supports is None:
+            fallbacks[key] = f"no vectorized kernel for type '{struct_type}'"
+        elif not supports(tf_state.struct_params.get(key, {})):
+            fallbacks[key] = f"params not supported by the '{struct_type}' kernel"
+        else:
+            candidates.add(key)
+
+    dependents: dict[str, list[str]] = {key: [] for key in tf_state.structures}
+    for key, uses in tf_state.struct_uses.items():
+        for dep_key in uses:
+            dependents.setdefault(dep_key, []).append(key)
+
+    changed = True
+    while changed:
+        changed = False
+        for key in list(candidates):
+            blocking = [d for d in tf_state.struct_uses.get(key, []) if d not in candidates]
+            blocking += [d for d in dependents.get(key, []) if d not in candidates]
+            if blocking:
+                candidates.discard(key)
+                fallbacks[key] = f"linked to incremental structure(s) {', '.join(blocking)}"
+                changed = True
+
+    return [key for key in tf_state.list_structures() if key in candidates], fallbacks
+
+
+def vectorize_tf_state(tf_state: "TFIncrementalState", feed: Any) -> list[str]:
+    """
+    Replace eligible detectors on one timeframe with PrecomputedStructure.
+
+    Args:
+        tf_state: Timeframe state (freshly built, not yet updated).
+        feed: FeedStore for the same timeframe.
+
+    Structures that stay incremental are logged as warnings with the reason.
+
+    Returns:
+        Switched structure keys in update order.
+    """
+    switched, fallbacks = _eligible_keys(tf_state)
+    for key, reason in fallbacks.items():
+        logger.warning(
+            "Vectorized structure backend: '%s' (%s, %s) stays incremental: %s",
+            key, tf_state.structures[key]._type, tf_state.timeframe, reason,
+        )
+    for key in switched:
+        original = tf_state.structures[key]
+        deps: dict[str, PrecomputedStructure] = {}
+        for dep_key in tf_state.struct_uses.get(key, []):
+            dep = tf_state.structures[dep_key]
+            assert isinstance(dep, PrecomputedStructure)
+            deps[dep._type] = dep
+        tf_state.structures[key] = PrecomputedStructure(
+            struct_type=original._type,
+            key=key,
+            params=tf_state.struct_params.get(key, {}),
+            initial={k: original.get_value(k) for k in original.get_output_keys()},
+            feed=feed,
+            kernel=VECTORIZED_STRUCTURE_REGISTRY[original._type],
+            deps=deps,
+        )
+    return switched
+
+
+def apply_vectorized_backend(
+    state: "MultiTFIncrementalState",
+    feeds_by_tf: Mapping[str, Any],
+) -> dict[str, list[str]]:
+    """
+    Switch every eligible structure in a multi-TF state to the vectorized backend.
+
+    Args:
+        state: Multi-TF state built from the Play.
+        feeds_by_tf: FeedStore per timeframe string (exec, med and high TFs).
+
+    Returns:
+        Dict of timeframe -> switched structure keys (only non-empty entries).
+    """
+    tf_states: list[TFIncrementalState] = [state.exec]
+    tf_states.extend(state.med_tf.values())
+    tf_states.extend(state.high_tf.values())
+
+    result: dict[str, list[str]] = {}
+    for tf_state in tf_states:
+        feed = feeds_by_tf.get(tf_state.timeframe)
+        if feed is None:
+            continue
+        switched = vectorize_tf_state(tf_state, feed)
+        if switched:
+            result[tf_state.timeframe] = switched
+    return result
+
+
+# =============================================================================
+# Helpers
+# =============================================================================
+
+
+def _output_array(values: list[Any]) -> np.ndarray:
+    """Build a typed output array from Python values of one type."""
+    sample = values[0]
+    if isinstance(sample, bool):
+        return np.array(values, dtype=np.bool_)
+    if isinstance(sample, int):
+        return np.array(values, dtype=np.int64)
+    if isinstance(sample, float):
+        return np.array(values, dtype=np.float64)
+    return np.array(values, dtype=object)
+
+
+def _expand_events(
+    n: int,
+    event_pos: np.ndarray,
+    initial: dict[str, Any],
+    snapshots: dict[str, list[Any]],
+    pulse_keys: frozenset[str] = frozenset(),
+) -> dict[str, np.ndarray]:
+    """
+    Expand per-event detector snapshots to per-bar arrays.
+
+    Between events the detector state is unchanged, so each bar takes the
+    snapshot of the last event at or before it (or the initial value).
+    Pulse keys only hold their snapshot on the event bar itself and
+    revert to the initial value otherwise.
+    """
+    last_event = np.searchsorted(event_pos, np.arange(n), side="right")
+    outputs: dict[str, np.ndarray] = {}
+    for key, init_value in initial.items():
+        table = _output_array([init_value] + snapshots[key])
+        if key in pulse_keys:
+            arr = np.full(n, table[0], dtype=table.dtype)
+            arr[event_pos] = table[1:]
+        else:
+            arr = table[last_event]
+        outputs[key] = arr
+    return outputs
+
+
+def _window_extremes(values: np.ndarray, left: int, right: int, is_high: bool) -> np.ndarray:
+    """
+    Flag bars that confirm a fractal pivot, matching IncrementalSwing exactly.
+
+    Position j is flagged when the window [j-left-right, j] is full and no
+    other value in it is >= (high) or <= (low) the pivot at j-right. NaN
+    never compares true, which mirrors the per-element loop.
+    """
+    n = len(values)
+    window = left + right + 1
+    flags = np.zeros(n, dtype=np.bool_)
+    if n < window:
+        return flags
+    windows = sliding_window_view(values, window)
+    rows = windows.shape[0]
+    for start in range(0, rows, _WINDOW_BLOCK_ROWS):
+        block = windows[start:start + _WINDOW_BLOCK_ROWS]
+        pivot = block[:, left:left + 1]
+        beaten = block >= pivot if is_high else block <= pivot
+        beaten[:, left] = False
+        flags[window - 1 + start:window - 1 + start + len(block)] = ~beaten.any(axis=1)
+    return flags
+
+
+# Largest block scanned at once when searching for the next event bar
+_EVENT_BLOCK_MAX = 65_536
+
+
+class _DepView:
+    """
+    Stand-in dependency for replaying a reference detector on selected bars.
+
+    Serves another kernel's output arrays at `pos` through get_value(), with
+    the Python types PrecomputedStructure would return.
+    """
+
+    def __init__(self, outputs: dict[str, np.ndarray]) -> None:
+        self._outputs = outputs
+        self._converters = {k: _scalar_converter(v) for k, v in outputs.items()}
+        self.pos = 0
+
+    def get_value(self, key: str) -> Any:
+        value = self._outputs[key][self.pos]
+        if value is None:
+            return None
+        return self._converters[key](value)
+
+
+def _dep_views(deps: dict[str, dict[str, np.ndarray]]) -> dict[str, _DepView]:
+    """Wrap precomputed dependency outputs for a reference detector."""
+    return {dep_type: _DepView(outputs) for dep_type, outputs in deps.items()}
+
+
+def _reference_detector(
+    struct_type: str,
+    params: dict[str, Any],
+    views: Mapping[str, _DepView],
+) -> BaseIncrementalDetector:
+    """Create the incremental detector a kernel replays, wired to dependency views."""
+    return STRUCTURE_REGISTRY[struct_type].validate_and_create(
+        struct_type, "_vectorized", params, dict(views)  # type: ignore[arg-type]
+    )
+
+
+def _bar_at(arrays: StructureArrays, pos: int) -> BarData:
+    """Build the BarData the engine would pass for position pos."""
+    return BarData(
+        idx=arrays.base_idx + pos,
+        open=float(arrays.open[pos]),
+        high=float(arrays.high[pos]),
+        low=float(arrays.low[pos]),
+        close=float(arrays.close[pos]),
+        volume=float(arrays.volume[pos]),
+        indicators={name: float(col[pos]) for name, col in arrays.indicators.items()},
+    )
+
+
+def _indicator_or_nan(arrays: StructureArrays, key: str | None) -> np.ndarray:
+    """Indicator column, or all-NaN when the feed lacks it (detectors see NaN)."""
+    col = arrays.indicator(key)
+    return col if col is not None else np.full(len(arrays), np.nan)
+
+
+def _first_event(events: Callable[[int, int], np.ndarray], start: int, stop: int) -> int:
+    """
+    First position in [start, stop) flagged by events(lo, hi), else stop.
+
+    Scans doubling blocks so the cost tracks the distance to the next event
+    rather than the length of the feed.
+    """
+    block = 64
+    while start < stop:
+        end = min(stop, start + block)
+        hits = np.flatnonzero(events(start, end))
+        if len(hits):
+            return start + int(hits[0])
+        start = end
+        block = min(block * 2, _EVENT_BLOCK_MAX)
+    return stop
+
+
+def _replay_events(
+    detector: BaseIncrementalDetector,
+    arrays: StructureArrays,
+    views: Mapping[str, _DepView],
+    events: Callable[[int, int], np.ndarray],
+    prepare: Callable[[int], None] | None = None,
+    on_event: Callable[[], None] | None = None,
+) -> tuple[np.ndarray, dict[str, list[Any]]]:
+    """
+    Replay a reference detector only on the bars where its state can change.
+
+    events(lo, hi) flags the bars in [lo, hi) where update() would change the
+    detector's state or outputs, given its state after the last replayed bar.
+    It may flag extra bars (replaying them is harmless) but must not miss
+    any. prepare(pos) restores per-bar buffers (candle history) skipped
+    between events; on_event() captures extra state after each replay.
+
+    Returns:
+        (event positions, output snapshots per event)
+    """
+    n = len(arrays)
+    keys = detector.get_output_keys()
+    snapshots: dict[str, list[Any]] = {k: [] for k in keys}
+    event_pos: list[int] = []
+    pos = _first_event(events, 0, n)
+    while pos < n:
+        for view in views.values():
+            view.pos = pos
+        if prepare is not None:
+            prepare(pos)
+        bar = _bar_at(arrays, pos)
+        detector.update(bar.idx, bar)
+        event_pos.append(pos)
+        for k in keys:
+            snapshots[k].append(detector.get_value(k))
+        if on_event is not None:
+            on_event()
+        pos = _first_event(events, pos + 1, n)
+    return np.array(event_pos, dtype=np.int64), snapshots
+
+
+def _changed(*columns: np.ndarray, initial: tuple[Any, ...]) -> np.ndarray:
+    """Flag bars where any column differs from its previous bar (or its initial value)."""
+    n = len(columns[0])
+    flags = np.zeros(n, dtype=np.bool_)
+    if n == 0:
+        return flags
+    for col, init in zip(columns, initial):
+        flags[0] |= bool(col[0] != init)
+        flags[1:] |= col[1:] != col[:-1]
+    return flags
+
+
+def _nearest_by_close(
+    close: np.ndarray,
+    last_event: np.ndarray,
+    slot_rows: list[list[tuple[float, tuple[Any, ...]]]],
+    empty: tuple[Any, ...],
+) -> list[np.ndarray]:
+    """
+    Per-bar fields of the slot nearest to close, matching the detectors' scans.
+
+    slot_rows[k] lists (mid, fields) for the candidate slots after event k-1
+    (row 0: before the first event) in the detector's scan order. The first
+    slot with the strictly smallest |close - mid| wins, as in the detectors'
+    `dist < nearest_dist` loops; bars without a candidate (or with a NaN
+    close) take `empty`.
+    """
+    rows = len(slot_rows)
+    width = max((len(r) for r in slot_rows), default=0)
+    n = len(close)
+    if width == 0:
+        return [np.full(n, value, dtype=_output_array([value]).dtype) for value in empty]
+
+    mids = np.full((rows, width), np.nan)
+    member = np.zeros((rows, width), dtype=np.bool_)
+    tables = [np.full((rows, width), value, dtype=_output_array([value]).dtype) for value in empty]
+    for r, slots in enumerate(slot_rows):
+        for c, (mid, fields) in enumerate(slots):
+            mids[r, c] = mid
+            member[r, c] = True
+            for table, value in zip(tables, fields):
+                table[r, c] = value
+
+    outputs = [np.empty(n, dtype=t.dtype) for t in tables]
+    for start in range(0, n, _WINDOW_BLOCK_ROWS):
+        stop = min(n, start + _WINDOW_BLOCK_ROWS)
+        row = last_event[start:stop]
+        with np.errstate(invalid="ignore"):
+            dist = np.abs(close[start:stop, None] - mids[row])
+        dist = np.where(member[row] & ~np.isnan(dist), dist, np.inf)
+        best = np.argmin(dist, axis=1)
+        picked = np.arange(stop - start)
+        found = dist[picked, best] < np.inf
+        for out, table, value in zip(outputs, tables, empty):
+            out[start:stop] = np.where(found, table[row, best], value)
+    return outputs
+
+
+# =============================================================================
+# Kernels
+# =============================================================================
+
+
+@register_vectorized_structure("rolling_window")
+def rolling_window_kernel(
+    params: dict[str, Any],
+    arrays: StructureArrays,
+    deps: dict[str, dict[str, np.ndarray]],
+) -> dict[str, np.ndarray]:
+    """Rolling min/max of an OHLCV column over the last `size` bars."""
+    size = params["size"]
+    values = arrays.source(params["source"])
+    n = len(values)
+    if n == 0:
+        return {"value": np.empty(0, dtype=np.float64)}
+    if np.isnan(values).any():
+        # MonotonicDeque ordering with NaN is comparison-order dependent;
+        # replay the reference detector rather than approximate it.
+        return _replay_detector("rolling_window", params, arrays)
+
+    reducer = np.minimum if params["mode"] == "min" else np.maximum
+    out = np.empty(n, dtype=np.float64)
+    head = min(size, n)
+    out[:head] = reducer.accumulate(values[:head])
+    if n > size:
+        windows = sliding_window_view(values, size)[1:]
+        for start in range(0, len(windows), _WINDOW_BLOCK_ROWS):
+            block = windows[start:start + _WINDOW_BLOCK_ROWS]
+            out[size + start:size + start + len(block)] = reducer.reduce(block, axis=1)
+    return {"value": out}
+
+
+@register_vectorized_structure("displacement")
+def displacement_kernel(
+    params: dict[str, Any],
+    arrays: StructureArrays,
+    deps: dict[str, dict[str, np.ndarray]],
+) -> dict[str, np.ndarray]:
+    """Body/ATR and wick ratios per bar, with last-event tracking."""
+    n = len(arrays)
+    atr_key = params.get("atr_key", "atr")
+    body_atr_min = float(params.get("body_atr_min", 1.5))
+    wick_ratio_max = float(params.get("wick_ratio_max", 0.4))
+
+    body_atr_ratio = np.full(n, np.nan)
+    wick_ratio = np.full(n, np.nan)
+    is_disp = np.zeros(n, dtype=np.bool_)
+    direction = np.zeros(n, dtype=np.int64)
+
+    atr = arrays.indicator(atr_key)
+    if atr is not None and n > 0:
+        o, h, lo, c = arrays.open, arrays.high, arrays.low, arrays.close
+        with np.errstate(invalid="ignore", divide="ignore"):
+            valid = ~np.isnan(atr) & (atr > 0)
+            body = np.abs(c - o)
+            doji = valid & (body == 0)
+            live = valid & ~doji
+            upper_wick = h - np.maximum(o, c)
+            lower_wick = np.minimum(o, c) - lo
+            ratio = body / atr
+            wicks = (upper_wick + lower_wick) / body
+        body_atr_ratio[doji] = 0.0
+        wick_ratio[doji] = np.inf
+        body_atr_ratio[live] = ratio[live]
+        wick_ratio[live] = wicks[live]
+        is_disp = live & (ratio >= body_atr_min) & (wicks <= wick_ratio_max)
+        direction[is_disp] = np.where(c[is_disp] > o[is_disp], 1, -1)
+
+    event_pos = np.flatnonzero(is_disp)
+    last_event = np.searchsorted(event_pos, np.arange(n), side="right")
+    last_idx = np.concatenate(([-1], event_pos + arrays.base_idx)).astype(np.int64)
+    last_dir = np.concatenate(([0], direction[event_pos])).astype(np.int64)
+
+    return {
+        "is_displacement": is_disp,
+        "direction": direction,
+        "body_atr_ratio": body_atr_ratio,
+        "wick_ratio": wick_ratio,
+        "last_idx": last_idx[last_event],
+        "last_direction": last_dir[last_event],
+        "version": last_event.astype(np.int64),
+    }
+
+
+def _swing_supported(params: dict[str, Any]) -> bool:
+    """Only fractal mode is vectorized; atr_zigzag depends on every bar."""
+    return params.get("mode", "fractal") == "fractal"
+
+
+# Swing outputs that reset at the start of every bar
+_SWING_PULSE_KEYS = frozenset({
+    "high_accepted",
+    "low_accepted",
+    "high_replaced_pending",
+    "low_replaced_pending",
+})
+
+
+@register_vectorized_structure("swing", supports=_swing_supported)
+def swing_kernel(
+    params: dict[str, Any],
+    arrays: StructureArrays,
+    deps: dict[str, dict[str, np.ndarray]],
+) -> dict[str, np.ndarray]:
+    """
+    Fractal swing pivots.
+
+    Window pivot detection is vectorized. The (sparse) bars that confirm a
+    candidate are then replayed through the reference detector's gate and
+    pairing logic, so significance, alternation and anchor hashes match.
+    """
+    detector = STRUCTURE_REGISTRY["swing"].validate_and_create("swing", "_vectorized", params, {})
+    left = params["left"]
+    right = params["right"]
+    high_flags = _window_extremes(arrays.high, left, right, is_high=True)
+    low_flags = _window_extremes(arrays.low, left, right, is_high=False)
+    atr = arrays.indicator(params.get("atr_key"))
+
+    keys = detector.get_output_keys()
+    initial = {k: detector.get_value(k) for k in keys}
+    snapshots: dict[str, list[Any]] = {k: [] for k in keys}
+    event_pos = np.flatnonzero(high_flags | low_flags)
+
+    for pos in event_pos.tolist():
+        pivot_pos = pos - right
+        atr_val: float | None = None
+        if atr is not None:
+            raw = float(atr[pos])
+            atr_val = None if math.isnan(raw) else raw
+        detector._reset_bar_flags()  # type: ignore[attr-defined]
+        detector._confirm_fractal_pivots(  # type: ignore[attr-defined]
+            arrays.base_idx + pivot_pos,
+            float(arrays.high[pivot_pos]) if high_flags[pos] else None,
+            float(arrays.low[pivot_pos]) if low_flags[pos] else None,
+            atr_val,
+        )
+        for k in keys:
+            snapshots[k].append(detector.get_value(k))
+
+    return _expand_events(len(arrays), event_pos, initial, snapshots, _SWING_PULSE_KEYS)
+
+
+@register_vectorized_structure("trend")
+def trend_kernel(
+    params: dict[str, Any],
+    arrays: StructureArrays,
+    deps: dict[str, dict[str, np.ndarray]],
+) -> dict[str, np.ndarray]:
+    """
+    Wave-based trend from precomputed swing outputs.
+
+    The trend only changes when the swing high/low index changes, so the
+    reference detector is replayed on those bars only. bars_in_trend grows
+    by one on every other bar.
+    """
+    swing = deps["swing"]
+    n = len(arrays)
+    stand_in = SimpleNamespace(high_idx=-1, low_idx=-1, high_level=math.nan, low_level=math.nan)
+    detector = STRUCTURE_REGISTRY["trend"].validate_and_create(
+        "trend", "_vectorized", params, {"swing": stand_in}  # type: ignore[dict-item]
+    )
+
+    high_idx = swing["high_idx"]
+    low_idx = swing["low_idx"]
+    changed = np.zeros(n, dtype=np.bool_)
+    if n > 0:
+        changed[0] = high_idx[0] != -1 or low_idx[0] != -1
+        changed[1:] = (high_idx[1:] != high_idx[:-1]) | (low_idx[1:] != low_idx[:-1])
+    event_pos = np.flatnonzero(changed)
+
+    keys = detector.get_output_keys()
+    initial = {k: detector.get_value(k) for k in keys}
+    snapshots: dict[str, list[Any]] = {k: [] for k in keys}
+    last_bars = 0
+    last_pos = -1
+    for pos in event_pos.tolist():
+        # Catch up the bars_in_trend increments of the skipped quiet bars
+        detector.bars_in_trend = last_bars + (pos - last_pos - 1)  # type: ignore[attr-defined]
+        stand_in.high_idx = int(high_idx[pos])
+        stand_in.low_idx = int(low_idx[pos])
+        stand_in.high_level = float(swing["high_level"][pos])
+        stand_in.low_level = float(swing["low_level"][pos])
+        detector.update(arrays.base_idx + pos, None)  # type: ignore[arg-type]
+        for k in keys:
+            snapshots[k].append(detector.get_value(k))
+        last_bars = detector.bars_in_trend  # type: ignore[attr-defined]
+        last_pos = pos
+
+    outputs = _expand_events(n, event_pos, initial, snapshots)
+    # Quiet bars: bars_in_trend = value at last event + bars since it
+    last_event = np.searchsorted(event_pos, np.arange(n), side="right")
+    anchor_pos = np.concatenate(([-1], event_pos))[last_event]
+    outputs["bars_in_trend"] = outputs["bars_in_trend"] + (np.arange(n) - anchor_pos)
+    return outputs
+
+
+def _initial_outputs(detector: BaseIncrementalDetector) -> dict[str, Any]:
+    """Output values of a fresh detector (the value of every bar before its first event)."""
+    return {k: detector.get_value(k) for k in detector.get_output_keys()}
+
+
+@register_vectorized_structure("premium_discount")
+def premium_discount_kernel(
+    params: dict[str, Any],
+    arrays: StructureArrays,
+    deps: dict[str, dict[str, np.ndarray]],
+) -> dict[str, np.ndarray]:
+    """
+    Premium/discount levels from the precomputed swing pair.
+
+    Fully vectorized: the levels follow the pair, zone and depth follow the
+    close, and the version counts zone changes.
+    """
+    swing = deps["swing"]
+    n = len(arrays)
+    high = swing["pair_high_level"]
+    low = swing["pair_low_level"]
+    close = arrays.close
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        span = high - low
+        missing = np.isnan(high) | np.isnan(low)
+        flat = ~missing & (span <= 0)
+        live = ~missing & ~flat
+        equilibrium = low + 0.5 * span
+        premium = low + 0.75 * span
+        discount = low + 0.25 * span
+        raw_depth = (close - low) / span
+        # max(0.0, min(1.0, raw)) with Python's NaN ordering (NaN close -> 1.0)
+        depth = np.where(raw_depth < 1.0, raw_depth, 1.0)
+        depth = np.where(depth > 0.0, depth, 0.0)
+        # Zone codes: 0 none, 1 premium, 2 discount, 3 equilibrium
+        live_code = np.where(close >= premium, 1, np.where(close <= discount, 2, 3))
+
+    code = np.where(live, live_code, np.where(flat, 3, 0))
+    names = np.array(["none", "premium", "discount", "equilibrium"], dtype=object)
+    prev = np.concatenate(([0], code[:-1])) if n else code
+
+    return {
+        "equilibrium": np.where(live, equilibrium, np.where(flat, high, np.nan)),
+        "premium_level": np.where(live, premium, np.where(flat, high, np.nan)),
+        "discount_level": np.where(live, discount, np.where(flat, low, np.nan)),
+        "zone": names[code],
+        "depth_pct": np.where(live, depth, np.where(flat, 0.5, np.nan)),
+        "version": np.cumsum(code != prev).astype(np.int64),
+    }
+
+
+@register_vectorized_structure("zone")
+def zone_kernel(
+    params: dict[str, Any],
+    arrays: StructureArrays,
+    deps: dict[str, dict[str, np.ndarray]],
+) -> dict[str, np.ndarray]:
+    """
+    Demand/supply zone from the precomputed swing.
+
+    The reference detector is replayed on the bars that create a zone (new
+    swing with a valid ATR) or break the active one. A new swing seen while
+    ATR is NaN leaves the detector untouched, so those bars are skipped.
+    """
+    views = _dep_views(deps)
+    detector: Any = _reference_detector("zone", params, views)
+    initial = _initial_outputs(detector)
+    demand = detector.zone_type == "demand"
+    swing_idx = deps["swing"]["low_idx" if demand else "high_idx"]
+    atr_ok = ~np.isnan(_indicator_or_nan(arrays, detector.atr_key))
+    close = arrays.close
+
+    def events(lo: int, hi: int) -> np.ndarray:
+        idx = swing_idx[lo:hi]
+        pending = (idx != detector._last_swing_idx) & (idx >= 0)
+        flags = pending & atr_ok[lo:hi]
+        if detector.state == "active":
+            window = close[lo:hi]
+            broken = window < detector.lower if demand else window > detector.upper
+            flags |= ~pending & broken
+        return flags
+
+    event_pos, snapshots = _replay_events(detector, arrays, views, events)
+    return _expand_events(len(arrays), event_pos, initial, snapshots)
+
+
+@register_vectorized_structure("fibonacci")
+def fibonacci_kernel(
+    params: dict[str, Any],
+    arrays: StructureArrays,
+    deps: dict[str, dict[str, np.ndarray]],
+) -> dict[str, np.ndarray]:
+    """
+    Fibonacci levels from the precomputed swing (and trend).
+
+    Levels only change when the watched swing/trend outputs change, so the
+    reference detector is replayed on those bars only.
+    """
+    views = _dep_views(deps)
+    detector: Any = _reference_detector("fibonacci", params, views)
+    initial = _initial_outputs(detector)
+    swing = deps["swing"]
+    if detector.use_trend_anchor:
+        changed = _changed(
+            deps["trend"]["version"], swing["pair_version"],
+            initial=(detector._last_trend_version, detector._last_trend_pair_version),
+        )
+    elif detector.use_paired_anchor:
+        changed = _changed(swing["pair_version"], initial=(detector._last_pair_version,))
+    else:
+        changed = _changed(
+            swing["high_idx"], swing["low_idx"],
+            initial=(detector._last_high_idx, detector._last_low_idx),
+        )
+
+    event_pos, snapshots = _replay_events(
+        detector, arrays, views, lambda lo, hi: changed[lo:hi]
+    )
+    return _expand_events(len(arrays), event_pos, initial, snapshots)
+
+
+# Market structure outputs that reset at the start of every bar
+_MARKET_STRUCTURE_PULSE_KEYS = frozenset({"bos_this_bar", "choch_this_bar"})
+
+
+@register_vectorized_structure("market_structure")
+def market_structure_kernel(
+    params: dict[str, Any],
+    arrays: StructureArrays,
+    deps: dict[str, dict[str, np.ndarray]],
+) -> dict[str, np.ndarray]:
+    """
+    BOS/CHoCH from the precomputed swing.
+
+    The reference detector is replayed on bars with a new swing pivot or a
+    close (or wick) beyond a level its current bias is watching.
+    """
+    views = _dep_views(deps)
+    detector: Any = _reference_detector("market_structure", params, views)
+    initial = _initial_outputs(detector)
+    swing = deps["swing"]
+    high_idx = swing["high_idx"]
+    low_idx = swing["low_idx"]
+    check_high = arrays.close if detector._confirmation_close else arrays.high
+    check_low = arrays.close if detector._confirmation_close else arrays.low
+
+    def events(lo: int, hi: int) -> np.ndarray:
+        h_idx = high_idx[lo:hi]
+        l_idx = low_idx[lo:hi]
+        flags = ((h_idx != detector._last_high_idx) & (h_idx >= 0)) | (
+            (l_idx != detector._last_low_idx) & (l_idx >= 0)
+        )
+        up = check_high[lo:hi]
+        down = check_low[lo:hi]
+        # NaN levels never compare true, as in the detector's isnan guards
+        if detector.bias == 1:
+            flags |= (down < detector._choch_anchor_level) | (up > detector._break_level_high)
+        elif detector.bias == -1:
+            flags |= (up > detector._choch_anchor_level) | (down < detector._break_level_low)
+        else:
+            flags |= (up > detector._break_level_high) | (down < detector._break_level_low)
+        return flags
+
+    event_pos, snapshots = _replay_events(detector, arrays, views, events)
+    return _expand_events(
+        len(arrays), event_pos, initial, snapshots, _MARKET_STRUCTURE_PULSE_KEYS
+    )
+
+
+def _touch_flags(
+    slots: list[dict[str, Any]],
+    arrays: StructureArrays,
+    lo: int,
+    hi: int,
+) -> np.ndarray:
+    """
+    Bars in [lo, hi) that touch or invalidate an active order/breaker block.
+
+    Bullish: close below lower or low into the zone; bearish: close above
+    upper or high into the zone (the detectors' mitigation checks).
+    """
+    flags = np.zeros(hi - lo, dtype=np.bool_)
+    for slot in slots:
+        if slot["state"] != "active":
+            continue
+        if slot["direction"] == 1:
+            flags |= (arrays.close[lo:hi] < slot["lower"]) | (arrays.low[lo:hi] <= slot["upper"])
+        else:
+            flags |= (arrays.close[lo:hi] > slot["upper"]) | (arrays.high[lo:hi] >= slot["lower"])
+    return flags
+
+
+def _record_active_slots(
+    slots: list[dict[str, Any]],
+    bull_rows: list[list[tuple[float, tuple[Any, ...]]]],
+    bear_rows: list[list[tuple[float, tuple[Any, ...]]]],
+    fields: tuple[str, ...],
+) -> None:
+    """Append the active bullish/bearish slots (scan order) for _nearest_by_close."""
+    bull: list[tuple[float, tuple[Any, ...]]] = []
+    bear: list[tuple[float, tuple[Any, ...]]] = []
+    for slot in slots:
+        if slot["state"] != "active":
+            continue
+        entry = ((slot["upper"] + slot["lower"]) / 2.0, tuple(slot[f] for f in fields))
+        (bull if slot["direction"] == 1 else bear).append(entry)
+    bull_rows.append(bull)
+    bear_rows.append(bear)
+
+
+def _fill_nearest(
+    outputs: dict[str, np.ndarray],
+    arrays: StructureArrays,
+    event_pos: np.ndarray,
+    bull_rows: list[list[tuple[float, tuple[Any, ...]]]],
+    bear_rows: list[list[tuple[float, tuple[Any, ...]]]],
+    keys: tuple[str, ...],
+) -> dict[str, np.ndarray]:
+    """Overwrite nearest_{bull,bear}_{key} outputs, which follow the close every bar."""
+    last_event = np.searchsorted(event_pos, np.arange(len(arrays)), side="right")
+    empty = tuple(math.nan for _ in keys)
+    for side, rows in (("bull", bull_rows), ("bear", bear_rows)):
+        columns = _nearest_by_close(arrays.close, last_event, rows, empty)
+        for key, column in zip(keys, columns):
+            outputs[f"nearest_{side}_{key}"] = column
+    return outputs
+
+
+# Fair value gap outputs that reset at the start of every bar
+_FVG_PULSE_KEYS = frozenset({
+    "new_this_bar", "new_direction", "new_upper", "new_lower", "any_mitigated_this_bar",
+})
+
+
+@register_vectorized_structure("fair_value_gap")
+def fair_value_gap_kernel(
+    params: dict[str, Any],
+    arrays: StructureArrays,
+    deps: dict[str, dict[str, np.ndarray]],
+) -> dict[str, np.ndarray]:
+    """
+    Fair value gaps with mitigation tracking.
+
+    Three-candle gaps are found vectorized; the reference detector is
+    replayed on those bars and on bars that deepen the fill of, or
+    invalidate, an active gap. Nearest-gap outputs follow the close and are
+    computed per bar from the active gaps after each event.
+    """
+    detector: Any = _reference_detector("fair_value_gap", params, {})
+    initial = _initial_outputs(detector)
+    n = len(arrays)
+    high, low, close = arrays.high, arrays.low, arrays.close
+    # ATR filtering is left to the replay; every raw gap is a candidate
+    gaps = np.zeros(n, dtype=np.bool_)
+    if n >= 3:
+        gaps[2:] = (low[2:] > high[:-2]) | (high[2:] < low[:-2])
+
+    def events(lo: int, hi: int) -> np.ndarray:
+        flags = gaps[lo:hi].copy()
+        with np.errstate(invalid="ignore", divide="ignore"):
+            for fvg in detector._fvgs:
+                gap_range = fvg["upper"] - fvg["lower"]
+                if fvg["state"] != "active" or gap_range <= 0:
+                    continue
+                if fvg["direction"] == 1:
+                    bar_low = low[lo:hi]
+                    fill = np.minimum((fvg["upper"] - bar_low) / gap_range, 1.0)
+                    flags |= (bar_low <= fvg["upper"]) & (fill > fvg["fill_pct"])
+                    flags |= close[lo:hi] < fvg["lower"]
+                else:
+                    bar_high = high[lo:hi]
+                    fill = np.minimum((bar_high - fvg["lower"]) / gap_range, 1.0)
+                    flags |= (bar_high >= fvg["lower"]) & (fill > fvg["fill_pct"])
+                    flags |= close[lo:hi] > fvg["upper"]
+        return flags
+
+    def prepare(pos: int) -> None:
+        detector._candle_buf.clear()
+        for p in range(max(0, pos - 2), pos):
+            detector._candle_buf.append((float(high[p]), float(low[p])))
+
+    bull_rows: list[list[tuple[float, tuple[Any, ...]]]] = [[]]
+    bear_rows: list[list[tuple[float, tuple[Any, ...]]]] = [[]]
+    fields = ("upper", "lower", "fill_pct")
+    event_pos, snapshots = _replay_events(
+        detector, arrays, {}, events, prepare,
+        lambda: _record_active_slots(detector._fvgs, bull_rows, bear_rows, fields),
+    )
+    outputs = _expand_events(n, event_pos, initial, snapshots, _FVG_PULSE_KEYS)
+    return _fill_nearest(outputs, arrays, event_pos, bull_rows, bear_rows, fields)
+
+
+# Order block outputs that reset at the start of every bar
+_ORDER_BLOCK_PULSE_KEYS = frozenset({
+    "new_this_bar", "new_direction", "new_upper", "new_lower",
+    "any_mitigated_this_bar", "any_invalidated_this_bar",
+    "last_invalidated_direction", "last_invalidated_upper", "last_invalidated_lower",
+})
+
+
+@register_vectorized_structure("order_block")
+def order_block_kernel(
+    params: dict[str, Any],
+    arrays: StructureArrays,
+    deps: dict[str, dict[str, np.ndarray]],
+) -> dict[str, np.ndarray]:
+    """
+    Order blocks with mitigation tracking.
+
+    Displacement bars (from the displacement dependency, or the detector's
+    inline ATR test computed vectorized) are the only creation candidates.
+    The reference detector is replayed on those bars and on bars that touch
+    or invalidate an active block; nearest-block outputs follow the close.
+    """
+    views = _dep_views(deps)
+    detector: Any = _reference_detector("order_block", params, views)
+    initial = _initial_outputs(detector)
+    n = len(arrays)
+    o, h, lo_, c = arrays.open, arrays.high, arrays.low, arrays.close
+    if "displacement" in deps:
+        disp = deps["displacement"]
+        candidates = disp["is_displacement"] & (disp["direction"] != 0)
+    else:
+        atr = _indicator_or_nan(arrays, detector._atr_key)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            body = np.abs(c - o)
+            wicks = ((h - np.maximum(o, c)) + (np.minimum(o, c) - lo_)) / body
+            candidates = (
+                ~np.isnan(atr) & (atr > 0) & (body != 0)
+                & (body / atr >= detector._body_atr_min)
+                & (wicks <= detector._wick_ratio_max)
+            )
+    history_len = detector._candle_history.maxlen
+
+    def prepare(pos: int) -> None:
+        detector._candle_history.clear()
+        for p in range(max(0, pos - history_len), pos):
+            detector._candle_history.append(
+                (arrays.base_idx + p, float(o[p]), float(h[p]), float(lo_[p]), float(c[p]))
+            )
+
+    bull_rows: list[list[tuple[float, tuple[Any, ...]]]] = [[]]
+    bear_rows: list[list[tuple[float, tuple[Any, ...]]]] = [[]]
+    fields = ("upper", "lower")
+    event_pos, snapshots = _replay_events(
+        detector, arrays, views,
+        lambda lo, hi: candidates[lo:hi] | _touch_flags(detector._obs, arrays, lo, hi),
+        prepare,
+        lambda: _record_active_slots(detector._obs, bull_rows, bear_rows, fields),
+    )
+    outputs = _expand_events(n, event_pos, initial, snapshots, _ORDER_BLOCK_PULSE_KEYS)
+    return _fill_nearest(outputs, arrays, event_pos, bull_rows, bear_rows, fields)
+
+
+# Breaker block outputs that reset at the start of every bar
+_BREAKER_BLOCK_PULSE_KEYS = frozenset({
+    "new_this_bar", "new_direction", "new_upper", "new_lower", "any_mitigated_this_bar",
+})
+
+
+@register_vectorized_structure("breaker_block")
+def breaker_block_kernel(
+    params: dict[str, Any],
+    arrays: StructureArrays,
+    deps: dict[str, dict[str, np.ndarray]],
+) -> dict[str, np.ndarray]:
+    """
+    Breaker blocks from precomputed order block and market structure outputs.
+
+    A breaker can only form on a bar with both an OB invalidation and a
+    CHoCH. The reference detector is replayed on those bars and on bars
+    that touch or invalidate an active breaker; nearest outputs follow the
+    close.
+    """
+    views = _dep_views(deps)
+    detector: Any = _reference_detector("breaker_block", params, views)
+    initial = _initial_outputs(detector)
+    n = len(arrays)
+    if "market_structure" in deps:
+        candidates = (
+            deps["order_block"]["any_invalidated_this_bar"]
+            & deps["market_structure"]["choch_this_bar"]
+        )
+    else:
+        candidates = np.zeros(n, dtype=np.bool_)
+
+    bull_rows: list[list[tuple[float, tuple[Any, ...]]]] = [[]]
+    bear_rows: list[list[tuple[float, tuple[Any, ...]]]] = [[]]
+    fields = ("upper", "lower")
+    event_pos, snapshots = _replay_events(
+        detector, arrays, views,
+        lambda lo, hi: candidates[lo:hi] | _touch_flags(detector._breakers, arrays, lo, hi),
+        on_event=lambda: _record_active_slots(detector._breakers, bull_rows, bear_rows, fields),
+    )
+    outputs = _expand_events(n, event_pos, initial, snapshots, _BREAKER_BLOCK_PULSE_KEYS)
+    return _fill_nearest(outputs, arrays, event_pos, bull_rows, bear_rows, fields)
+
+
+# Liquidity zone outputs that reset at the start of every bar
+_LIQUIDITY_PULSE_KEYS = frozenset({
+    "new_zone_this_bar", "sweep_this_bar", "sweep_direction", "swept_level",
+})
+
+
+@register_vectorized_structure("liquidity_zones")
+def liquidity_zones_kernel(
+    params: dict[str, Any],
+    arrays: StructureArrays,
+    deps: dict[str, dict[str, np.ndarray]],
+) -> dict[str, np.ndarray]:
+    """
+    Liquidity zones and sweeps from the precomputed swing.
+
+    On bars with a valid ATR, the reference detector is replayed when a
+    new pivot arrives or price sweeps an active zone. Nearest-zone outputs
+    follow the close and are computed per bar.
+    """
+    views = _dep_views(deps)
+    detector: Any = _reference_detector("liquidity_zones", params, views)
+    initial = _initial_outputs(detector)
+    n = len(arrays)
+    swing = deps["swing"]
+    high_idx = swing["high_idx"]
+    low_idx = swing["low_idx"]
+    atr = _indicator_or_nan(arrays, detector._atr_key)
+    with np.errstate(invalid="ignore"):
+        atr_ok = ~np.isnan(atr) & (atr > 0)
+
+    def events(lo: int, hi: int) -> np.ndarray:
+        h_idx = high_idx[lo:hi]
+        l_idx = low_idx[lo:hi]
+        flags = ((h_idx != detector._last_high_idx) & (h_idx >= 0)) | (
+            (l_idx != detector._last_low_idx) & (l_idx >= 0)
+        )
+        band = detector._sweep_atr * atr[lo:hi]
+        with np.errstate(invalid="ignore"):
+            for zone in detector._zones:
+                if zone["side"] == "high":
+                    flags |= arrays.high[lo:hi] > zone["level"] + band
+                else:
+                    flags |= arrays.low[lo:hi] < zone["level"] - band
+        return flags & atr_ok[lo:hi]
+
+    high_rows: list[list[tuple[float, tuple[Any, ...]]]] = [[]]
+    low_rows: list[list[tuple[float, tuple[Any, ...]]]] = [[]]
+
+    def record() -> None:
+        # Every zone left after update() is active (swept zones are pruned)
+        high_rows.append([(z["level"], (z["level"], z["touches"])) for z in detector._zones if z["side"] == "high"])
+        low_rows.append([(z["level"], (z["level"], z["touches"])) for z in detector._zones if z["side"] == "low"])
+
+    event_pos, snapshots = _replay_events(detector, arrays, views, events, on_event=record)
+    outputs = _expand_events(n, event_pos, initial, snapshots, _LIQUIDITY_PULSE_KEYS)
+    last_event = np.searchsorted(event_pos, np.arange(n), side="right")
+    for side, rows in (("high", high_rows), ("low", low_rows)):
+        level, touches = _nearest_by_close(arrays.close, last_event, rows, (math.nan, 0))
+        outputs[f"nearest_{side}_level"] = level
+        outputs[f"nearest_{side}_touches"] = touches
+    return outputs
+
+
+@register_vectorized_structure("derived_zone")
+def derived_zone_kernel(
+    params: dict[str, Any],
+    arrays: StructureArrays,
+    deps: dict[str, dict[str, np.ndarray]],
+) -> dict[str, np.ndarray]:
+    """
+    Derived zones (K slots + aggregates) from the precomputed swing.
+
+    Zones are regenerated by the reference detector on the bars where the
+    source version changes. Between regenerations the zone list is fixed,
+    so each zone's touches, age and break are computed over the whole
+    segment.
+    """
+    close = arrays.close
+    if np.isnan(close).any():
+        # A NaN close freezes every zone field for that bar; replay instead.
+        return _replay_detector("derived_zone", params, arrays, deps)
+
+    views = _dep_views(deps)
+    detector: Any = _reference_detector("derived_zone", params, views)
+    n = len(arrays)
+    slots = detector.max_active
+    version_key = "pair_version" if detector.use_paired_source else "version"
+    version = deps["swing"][version_key]
+    regen = np.flatnonzero(_changed(version, initial=(detector._source_version,)))
+    bar_idx = arrays.base_idx + np.arange(n, dtype=np.int64)
+    lower_tol = 1.0 - detector.break_tolerance_pct
+    upper_tol = 1.0 + detector.break_tolerance_pct
+
+    # Unpopulated slot values, as the fresh detector reports them
+    empty = {f: detector.get_value(f"zone0_{f}") for f in SLOT_FIELDS}
+    columns = [
+        {f: np.full(n, v, dtype=_output_array([v]).dtype) for f, v in empty.items()}
+        for _ in range(slots)
+    ]
+    active = np.zeros((slots, n), dtype=np.bool_)
+
+    zones: list[dict[str, Any]] = []
+    bounds = np.concatenate((regen, [n])).tolist()
+    for a, b in zip(bounds[:-1], bounds[1:]):
+        views["swing"].pos = a
+        detector._source_version = int(version[a])
+        detector._zones = zones
+        detector._regenerate_zones(int(bar_idx[a]), _bar_at(arrays, a))
+        zones = detector._zones
+
+        idx = bar_idx[a:b]
+        price = close[a:b]
+        for i, zone in enumerate(zones[:slots]):
+            col = columns[i]
+            col["lower"][a:b] = zone["lower"]
+            col["upper"][a:b] = zone["upper"]
+            col["anchor_idx"][a:b] = zone["anchor_idx"]
+            col["age_bars"][a:b] = idx - zone["anchor_idx"]
+            col["instance_id"][a:b] = zone["instance_id"]
+            last_touch = np.full(b - a, zone["last_touch_bar"], dtype=np.int64)
+            if zone["state"] == ZONE_STATE_ACTIVE:
+                inside = (zone["lower"] <= price) & (price <= zone["upper"])
+                breaks = (zone["anchor_idx"] < idx) & (
+                    (price < zone["lower"] * lower_tol) | (price > zone["upper"] * upper_tol)
+                )
+                hit = np.flatnonzero(breaks)
+                live = int(hit[0]) if len(hit) else b - a  # bars still active after update
+                inside[live + 1:] = False
+                touches = zone["touch_count"] + np.cumsum(inside)
+                last_touch = np.maximum.accumulate(np.where(inside, idx, last_touch))
+                col["state"][a:a + live] = ZONE_STATE_ACTIVE
+                col["state"][a + live:b] = ZONE_STATE_BROKEN
+                col["touched_this_bar"][a:b] = inside
+                col["inside"][a:b] = inside
+                col["touch_count"][a:b] = touches
+                active[i, a:a + live] = True
+                zone["touch_count"] = int(touches[-1])
+                zone["last_touch_bar"] = int(last_touch[-1])
+                if len(hit):
+                    zone["state"] = ZONE_STATE_BROKEN
+            else:
+                col["state"][a:b] = zone["state"]
+                col["touch_count"][a:b] = zone["touch_count"]
+            col["last_touch_age"][a:b] = np.where(last_touch >= 0, idx - last_touch, -1)
+
+    outputs: dict[str, np.ndarray] = {}
+    for i, col in enumerate(columns):
+        for field in SLOT_FIELDS:
+            outputs[f"zone{i}_{field}"] = col[field]
+
+    touched = np.array([col["touched_this_bar"] for col in columns]).reshape(slots, n)
+    inside_all = np.array([col["inside"] for col in columns]).reshape(slots, n)
+    active_count = active.sum(axis=0).astype(np.int64)
+    any_active = active_count > 0
+    first_idx = np.where(any_active, np.argmax(active, axis=0), -1).astype(np.int64)
+    first_lower = np.full(n, None, dtype=object)
+    first_upper = np.full(n, None, dtype=object)
+    for i, col in enumerate(columns):
+        mask = first_idx == i
+        first_lower[mask] = col["lower"][mask]
+        first_upper[mask] = col["upper"][mask]
+
+    outputs.update({
+        "active_count": active_count,
+        "any_active": any_active,
+        "any_touched": np.asarray((touched & active).any(axis=0)),
+        "any_inside": np.asarray((inside_all & active).any(axis=0)),
+        "first_active_lower": first_lower,
+        "first_active_upper": first_upper,
+        "first_active_idx": first_idx,
+        "newest_active_idx": first_idx.copy(),
+        "source_version": version.astype(np.int64),
+    })
+    return outputs
+
+
+def _replay_detector(
+    struct_type: str,
+    params: dict[str, Any],
+    arrays: StructureArrays,
+    deps: dict[str, dict[str, np.ndarray]] | None = None,
+) -> dict[str, np.ndarray]:
+    """Run the reference detector over every bar (fallback for edge-case data)."""
+    views = _dep_views(deps or {})
+    detector = _reference_detector(struct_type, params, views)
+    keys = detector.get_output_keys()
+    rows: dict[str, list[Any]] = {k: [] for k in keys}
+    for pos in range(len(arrays)):
+        for view in views.values():
+            view.pos = pos
+        bar = _bar_at(arrays, pos)
+        detector.update(bar.idx, bar)
+        for k in keys:
+            rows[k].append(detector.get_value(k))
+    return {k: _output_array(v) for k, v in rows.items()}
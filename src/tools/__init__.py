@@ -160,6 +160,8 @@ from .data_tools import (
     sync_range_tool,
     sync_data_tool,
     heal_data_tool,
+    derive_timeframes_tool,
+    audit_derived_data_tool,
     delete_symbol_tool,
     cleanup_empty_symbols_tool,
     vacuum_database_tool,
@@ -202,8 +204,16 @@ from .backtest_audit_tools import (
     backtest_math_parity_tool,
     backtest_audit_snapshot_plumbing_tool,
     backtest_audit_rollup_parity_tool,
+    backtest_audit_rule_compiler_tool,
+    backtest_audit_alignment_tool,
 )
 
+# Backtest robustness (Monte Carlo / bootstrap post-processing)
+from .backtest_robustness_tools import backtest_robustness_tool
+
+# Portfolio backtest (many plays, one shared clock)
+from .backtest_portfolio_tools import backtest_portfolio_tool
+
 # Portfolio tools (UTA management)
 from .portfolio_tools import (
     get_uta_snapshot_tool,
@@ -237,6 +247,12 @@ from .forge_stress_test_tools import (
     forge_structure_parity_tool,
     forge_indicator_parity_tool,
 )
+from .forge_bench_tools import (
+    forge_bench_tool,
+    forge_checkpoint_restore_tool,
+    forge_prearm_replay_tool,
+    forge_streaming_parity_tool,
+)
 
 
 __all__ = [
@@ -334,6 +350,8 @@ __all__ = [
     "sync_range_tool",
     "sync_data_tool",
     "heal_data_tool",
+    "derive_timeframes_tool",
+    "audit_derived_data_tool",
     "delete_symbol_tool",
     "cleanup_empty_symbols_tool",
     "vacuum_database_tool",
@@ -366,12 +384,20 @@ __all__ = [
     "backtest_math_parity_tool",
     "backtest_audit_snapshot_plumbing_tool",
     "backtest_audit_rollup_parity_tool",
+    "backtest_audit_rule_compiler_tool",
+    "backtest_audit_alignment_tool",
+    "backtest_robustness_tool",
+    "backtest_portfolio_tool",
 
     # Forge stress test tools
     "forge_stress_test_tool",
     "forge_generate_synthetic_data_tool",
     "forge_structure_parity_tool",
     "forge_indicator_parity_tool",
+    "forge_bench_tool",
+    "forge_prearm_replay_tool",
+    "forge_checkpoint_restore_tool",
+    "forge_streaming_parity_tool",
 
     # Portfolio tools (UTA management)
     "get_uta_snapshot_tool",
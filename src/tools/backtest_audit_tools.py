@@ -482,3 +482,118 @@ def backtest_audit_rollup_parity_tool(
             success=False,
             error=f"Rollup audit error: {e}",
         )
+
+
+# =============================================================================
+# Rule Compiler Parity + Per-Bar Benchmark
+# =============================================================================
+
+def backtest_audit_rule_compiler_tool(
+    play_ids: list[str] | None = None,
+    max_snapshots: int = 3000,
+) -> ToolResult:
+    """
+    Compare closure-compiled rule evaluation against the DSL interpreter.
+
+    Runs each Play's backtest and, on every evaluated snapshot, checks that
+    every case condition yields the same outcome and every block the same
+    intents, timing both paths per bar.
+
+    Args:
+        play_ids: Plays to run (default: complex core validation plays)
+        max_snapshots: Evaluated snapshots per Play (default: 3000)
+
+    Returns:
+        ToolResult with per-Play parity and interpreter/compiled us per bar
+    """
+    try:
+        from ..forge.audits.audit_rule_compiler import run_rule_compiler_audit
+
+        result = run_rule_compiler_audit(play_ids=play_ids, max_snapshots=max_snapshots)
+        data = result.to_dict()
+
+        if result.success:
+            return ToolResult(
+                success=True,
+                message=(
+                    f"Rule compiler parity PASSED: {data['total_snapshots']} snapshots, "
+                    f"{data['total_case_checks']} case checks; "
+                    f"{data['interpreter_us_per_bar']:.1f}us -> {data['compiled_us_per_bar']:.1f}us per bar "
+                    f"({data['speedup']:.1f}x)"
+                ),
+                data=data,
+            )
+        failed = [p.play_id for p in result.plays if not p.passed]
+        return ToolResult(
+            success=False,
+            error=(
+                f"Rule compiler parity FAILED for {', '.join(failed)}: "
+                f"{data['total_mismatches']} mismatch(es)"
+            ),
+            data=data,
+        )
+
+    except Exception as e:
+        logger.error("Rule compiler audit failed: %s\n%s", e, traceback.format_exc())
+        return ToolResult(
+            success=False,
+            error=f"Rule compiler audit error: {e}",
+        )
+
+
+# =============================================================================
+# Multi-TF Alignment Table Parity
+# =============================================================================
+
+def backtest_audit_alignment_tool(
+    play_ids: list[str] | None = None,
+    synthetic: bool = True,
+) -> ToolResult:
+    """
+    Compare the precomputed multi-TF alignment table against per-bar lookups.
+
+    For every exec bar, TF indices (incl. changed flags), 1m sub-loop ranges
+    and funding positions read from the table must equal the timestamp
+    lookups they replace. Synthetic cases add DST dates, the year boundary,
+    missing bars and a short 1m feed.
+
+    Args:
+        play_ids: Plays to check (default: core validation plays)
+        synthetic: Also run the synthetic edge cases (default: True)
+
+    Returns:
+        ToolResult with per-case parity and lookup vs table us per bar
+    """
+    try:
+        from ..forge.audits.audit_alignment import run_alignment_audit
+
+        result = run_alignment_audit(play_ids=play_ids, synthetic=synthetic)
+        data = result.to_dict()
+
+        if result.success:
+            return ToolResult(
+                success=True,
+                message=(
+                    f"Alignment parity PASSED: {len(result.cases)} cases, "
+                    f"{data['total_exec_bars']} exec bars, {data['total_checks']} checks; "
+                    f"{data['lookup_us_per_bar']:.2f}us -> {data['table_us_per_bar']:.2f}us per bar "
+                    f"({data['speedup']:.1f}x)"
+                ),
+                data=data,
+            )
+        failed = [c.name for c in result.cases if not c.passed]
+        return ToolResult(
+            success=False,
+            error=(
+                f"Alignment parity FAILED for {', '.join(failed)}: "
+                f"{data['total_mismatches']} mismatch(es)"
+            ),
+            data=data,
+        )
+
+    except Exception as e:
+        logger.error("Alignment audit failed: %s\n%s", e, traceback.format_exc())
+        return ToolResult(
+            success=False,
+            error=f"Alignment audit error: {e}",
+        )
@@ -454,6 +454,12 @@ def backtest_run_play_tool(
     validate_artifacts_after: bool = True,
     skip_preflight: bool = False,
     use_synthetic: bool = False,
+    structure_backend: str = "incremental",
+    use_cache: bool = True,
+    profile: bool = False,
+    profile_alloc: bool = False,
+    streaming: bool = False,
+    memory_budget_mb: int | None = None,
 ) -> ToolResult:
     """
     Run a backtest for an Play.
@@ -481,6 +487,18 @@ def backtest_run_play_tool(
                        data was already synced by the parent process.
         use_synthetic: If True and Play has a synthetic: block, use synthetic data.
                       If False (default), the synthetic block is ignored and real data is used.
+        structure_backend: "incremental" (default, reference) or "vectorized"
+                      (precompute eligible structures per TF; results must be identical).
+        use_cache: If True (default), return the stored result of an identical earlier
+                  run (same input hash, data fingerprint and engine code) instead of
+                  re-running. False forces execution (CLI: --no-cache).
+        profile: If True, time each engine/runner phase and write profile.json to the
+                artifact folder (also returned as data["profile"]); always executes.
+        profile_alloc: Like profile, plus tracemalloc allocations per phase, GC and
+                retained memory per component (profile["alloc"]).
+        streaming: If True, stream the data window into memory-mapped feeds instead
+                of in-memory frames (multi-year 1m runs); results are identical.
+        memory_budget_mb: Resident budget for streamed feed data (default 256).
 
     Returns:
         ToolResult with backtest results
@@ -625,6 +643,7 @@ def backtest_run_play_tool(
             RunnerResult,
             run_backtest_with_gates,
         )
+        from ..backtest.runtime.feed_paging import DEFAULT_MEMORY_BUDGET_MB
 
         # Set default artifacts dir
         if artifacts_dir is None:
@@ -633,8 +652,13 @@ def backtest_run_play_tool(
         # Create data_loader from HistoricalDataStore
         # Skip DuckDB entirely for synthetic runs (no DB access needed)
         data_loader_fn: Callable[[str, str, datetime, datetime], pd.DataFrame] | None = None
+        data_fingerprint: str | None = None
         if synthetic_provider is None:
             store = get_historical_store(env=env)
+            if use_cache:
+                data_fingerprint = store.data_fingerprint(
+                    resolved_symbol, [*config.all_tfs, "1m"], end=end,
+                )
 
             def data_loader(symbol: str, tf: str, start_dt: datetime, end_dt: datetime) -> pd.DataFrame:
                 """Load OHLCV data from DuckDB."""
@@ -662,6 +686,13 @@ def backtest_run_play_tool(
             data_loader=data_loader_fn,
             emit_snapshots=emit_snapshots,
             data_env=env,  # Pass data environment for correct DB selection
+            structure_backend=structure_backend,
+            use_result_cache=use_cache,
+            data_fingerprint=data_fingerprint,
+            profile=profile,
+            profile_alloc=profile_alloc,
+            streaming=streaming,
+            memory_budget_mb=memory_budget_mb or DEFAULT_MEMORY_BUDGET_MB,
         )
 
         # Run backtest with gates
@@ -699,11 +730,18 @@ def backtest_run_play_tool(
             "smoke": smoke,
             "trades_count": trades_count,
             "run_id": run_result.run_id,
+            "cache_hit": run_result.cache_hit,
         }
 
         if summary:
             result_data["summary"] = summary.to_dict()
 
+        if run_result.profile_path is not None:
+            from ..utils.profiler import load_profile
+
+            result_data["profile_path"] = str(run_result.profile_path)
+            result_data["profile"] = load_profile(run_result.profile_path)
+
         if run_result.artifact_path:
             result_data["artifact_dir"] = str(run_result.artifact_path)
 
@@ -735,7 +773,10 @@ def backtest_run_play_tool(
 
         return ToolResult(
             success=True,
-            message=f"Backtest complete: {trades_count} trades",
+            message=(
+                f"Backtest complete: {trades_count} trades"
+                + (" (cached result)" if run_result.cache_hit else "")
+            ),
             symbol=resolved_symbol,
             data=result_data,
         )
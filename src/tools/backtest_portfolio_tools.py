@@ -0,0 +1,117 @@
+"""
+Backtest portfolio tools — many Plays on one shared clock.
+
+Runs several Plays in a single pass through PortfolioBacktestRunner
+(src/engine/runners/portfolio_runner.py): shared FeedStores per unique
+data requirement, bar-synchronous stepping, and a portfolio ledger with
+per-Play attribution and optional account-level entry limits.
+"""
+
+import json
+from datetime import datetime
+from pathlib import Path
+import traceback
+
+from .shared import ToolResult
+from ..config.constants import DataEnv, DEFAULT_BACKTEST_ENV
+from ..utils.logger import get_module_logger
+
+
+logger = get_module_logger(__name__)
+
+
+def backtest_portfolio_tool(
+    play_ids: list[str],
+    env: DataEnv = DEFAULT_BACKTEST_ENV,
+    start: datetime | None = None,
+    end: datetime | None = None,
+    plays_dir: Path | None = None,
+    use_synthetic: bool = False,
+    max_positions: int | None = None,
+    max_exposure_usdt: float | None = None,
+    max_im_rate: float | None = None,
+    output_path: Path | str | None = None,
+) -> ToolResult:
+    """
+    Run a portfolio backtest over several Plays.
+
+    Args:
+        play_ids: Plays to run together (unique; any symbols and exec TFs)
+        env: Data environment ("live")
+        start: Window start (required unless use_synthetic)
+        end: Window end (required unless use_synthetic)
+        plays_dir: Override Play directory
+        use_synthetic: Use each Play's validation: block for synthetic data
+        max_positions: Portfolio-wide open position cap (entries vetoed at the cap)
+        max_exposure_usdt: Portfolio-wide notional exposure cap
+        max_im_rate: Portfolio-wide initial margin rate cap (used margin / equity)
+        output_path: Optional JSON file for the full result (with equity curve)
+
+    Returns:
+        ToolResult with portfolio totals, vetoes, data sharing and attribution
+    """
+    try:
+        from ..backtest.play import load_play
+        from ..engine.runners.portfolio_runner import PortfolioBacktestRunner, PortfolioLimits
+
+        if not play_ids:
+            return ToolResult(success=False, error="At least one play id is required")
+        if not use_synthetic and (start is None or end is None):
+            return ToolResult(
+                success=False,
+                error="Portfolio backtest needs --start and --end (or --synthetic)",
+            )
+
+        plays = [load_play(play_id, base_dir=plays_dir) for play_id in play_ids]
+        if use_synthetic:
+            missing = [p.id for p in plays if p.validation is None]
+            if missing:
+                return ToolResult(
+                    success=False,
+                    error=f"Plays without a validation: block cannot run synthetic: {', '.join(missing)}",
+                )
+
+        limits = PortfolioLimits(
+            max_positions=max_positions,
+            max_total_exposure_usdt=max_exposure_usdt,
+            max_account_im_rate=max_im_rate,
+        )
+        runner = PortfolioBacktestRunner(
+            plays=plays,
+            window_start=start,
+            window_end=end,
+            limits=limits,
+            data_env=env,
+            use_synthetic=use_synthetic,
+        )
+        result = runner.run()
+        data = result.to_dict()
+
+        if output_path is not None:
+            path = Path(output_path)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(json.dumps(result.to_dict(include_equity_curve=True), indent=2, default=str))
+            data["output_path"] = str(path)
+
+        sharing = data["data_sharing"]
+        return ToolResult(
+            success=True,
+            message=(
+                f"Portfolio of {data['plays']} plays: net {data['net_pnl']:+.2f} USDT "
+                f"({data['net_return_pct']:+.2f}%), max DD {data['max_drawdown_pct']:.2f}%, "
+                f"{data['total_trades']} trades, {sum(data['vetoes'].values())} vetoed entries; "
+                f"{sharing['unique_feed_sets']} feed set(s) for {data['plays']} plays, "
+                f"{data['bars_per_second']:.0f} bars/s"
+            ),
+            data=data,
+        )
+
+    except ValueError as e:
+        return ToolResult(success=False, error=str(e))
+
+    except Exception as e:
+        logger.error("Portfolio backtest failed: %s\n%s", e, traceback.format_exc())
+        return ToolResult(
+            success=False,
+            error=f"Portfolio backtest error: {e}",
+        )
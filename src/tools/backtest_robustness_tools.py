@@ -0,0 +1,120 @@
+"""
+Backtest robustness tools — Monte Carlo / bootstrap post-processing.
+
+Reads a finished run's artifacts (result.json, trades.parquet,
+equity.parquet), resamples them (src/backtest/robustness.py) and writes
+robustness.json into the same run folder.
+"""
+
+from pathlib import Path
+import traceback
+
+from .shared import ToolResult
+from ..utils.logger import get_module_logger
+
+
+logger = get_module_logger(__name__)
+
+
+def backtest_robustness_tool(
+    run_dir: Path | str,
+    resamples: int = 10_000,
+    methods: list[str] | None = None,
+    block_size: int | None = None,
+    block_lengths: str = "fixed",
+    skip_prob: float = 0.10,
+    ruin_fraction: float = 0.50,
+    confidence: float = 0.90,
+    seed: int = 42,
+    workers: int = 1,
+) -> ToolResult:
+    """
+    Run Monte Carlo / bootstrap robustness analysis on a finished backtest.
+
+    Args:
+        run_dir: Artifact folder of the run (contains result.json, trades/equity parquet)
+        resamples: Resamples per method
+        methods: Subset of trade_shuffle, block_bootstrap, random_skip (default: all)
+        block_size: Block length for block_bootstrap (default: ceil(sqrt(n_bars)))
+        block_lengths: "fixed" (circular block bootstrap) or "geometric"
+            (stationary bootstrap, mean length block_size)
+        skip_prob: Per-trade drop probability for random_skip
+        ruin_fraction: Ruin = equity touches <= ruin_fraction * initial equity
+        confidence: Two-sided confidence interval level
+        seed: Base seed (results are identical for any worker count)
+        workers: Processes for resampling (1 = in-process)
+
+    Returns:
+        ToolResult with the robustness report; robustness.json written to run_dir
+    """
+    try:
+        from ..backtest.artifacts import STANDARD_FILES, ResultsSummary, read_parquet
+        from ..backtest.robustness import (
+            ROBUSTNESS_FILE,
+            ROBUSTNESS_METHODS,
+            RobustnessConfig,
+            run_robustness_analysis,
+        )
+
+        run_path = Path(run_dir)
+        result_path = run_path / STANDARD_FILES["result"]
+        trades_path = run_path / STANDARD_FILES["trades"]
+        equity_path = run_path / STANDARD_FILES["equity"]
+        missing = [p.name for p in (result_path, trades_path, equity_path) if not p.exists()]
+        if missing:
+            return ToolResult(
+                success=False,
+                error=f"Run folder {run_path} is missing {missing}. Run the backtest first.",
+            )
+
+        summary = ResultsSummary.load_json(result_path)
+        trades_df = read_parquet(trades_path)
+        equity_df = read_parquet(equity_path)
+        if "net_pnl" not in trades_df.columns or "equity" not in equity_df.columns:
+            return ToolResult(
+                success=False,
+                error="trades.parquet needs 'net_pnl' and equity.parquet needs 'equity' columns",
+            )
+
+        config = RobustnessConfig(
+            resamples=resamples,
+            methods=tuple(methods) if methods else ROBUSTNESS_METHODS,
+            block_size=block_size,
+            block_lengths=block_lengths,
+            skip_prob=skip_prob,
+            ruin_fraction=ruin_fraction,
+            confidence=confidence,
+            seed=seed,
+            workers=workers,
+        )
+        report = run_robustness_analysis(
+            trade_pnl=trades_df["net_pnl"].to_numpy(dtype="float64"),
+            equity=equity_df["equity"].to_numpy(dtype="float64"),
+            initial_equity=summary.initial_equity,
+            tf=summary.tf_exec,
+            config=config,
+        )
+
+        output_path = run_path / ROBUSTNESS_FILE
+        report.write_json(output_path)
+        logger.info("Robustness report written to %s", output_path)
+
+        data = report.to_dict()
+        data["play_id"] = summary.play_id
+        data["robustness_path"] = str(output_path)
+        return ToolResult(
+            success=True,
+            message=(
+                f"Robustness analysis complete: {resamples} resamples x "
+                f"{len(config.methods)} methods in {report.duration_seconds:.1f}s"
+            ),
+            symbol=summary.symbol,
+            data=data,
+        )
+
+    except ValueError as e:
+        return ToolResult(success=False, error=str(e))
+
+    except Exception as e:
+        logger.error("Robustness analysis failed: %s\n%s", e, traceback.format_exc())
+        return ToolResult(success=False, error=f"Robustness analysis error: {e}")
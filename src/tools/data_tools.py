@@ -34,6 +34,8 @@ from .data_tools_sync import (
     sync_range_tool,
     sync_data_tool,
     heal_data_tool,
+    derive_timeframes_tool,
+    audit_derived_data_tool,
     delete_symbol_tool,
     cleanup_empty_symbols_tool,
     vacuum_database_tool,
@@ -70,6 +72,8 @@ __all__ = [
     "sync_range_tool",
     "sync_data_tool",
     "heal_data_tool",
+    "derive_timeframes_tool",
+    "audit_derived_data_tool",
     "delete_symbol_tool",
     "cleanup_empty_symbols_tool",
     "vacuum_database_tool",
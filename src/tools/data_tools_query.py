@@ -12,7 +12,9 @@ from ..utils.datetime_utils import normalize_time_range_params as _normalize_tim
 
 
 # Import tools for composite operations
-from .data_tools_sync import sync_symbols_tool, sync_funding_tool, sync_open_interest_tool, sync_data_tool
+from .data_tools_sync import (
+    sync_symbols_tool, sync_funding_tool, sync_open_interest_tool, sync_data_tool, derive_timeframes_tool,
+)
 
 
 def get_funding_history_tool(
@@ -354,6 +356,7 @@ def sync_to_now_tool(
     symbols: list[str],
     timeframes: list[str] | None = None,
     env: DataEnv = DEFAULT_DATA_ENV,
+    derive: bool = False,
 ) -> ToolResult:
     """
     Sync data forward from the last stored candle to now (no backfill).
@@ -366,6 +369,7 @@ def sync_to_now_tool(
         symbols: List of symbols to sync forward
         timeframes: List of timeframes (e.g., ["15m", "1h", "4h"]) or None for all
         env: Data environment ("live"). Defaults to "live".
+        derive: Fetch only 1m and extend derived higher timeframes locally
     
     Returns:
         ToolResult with per-symbol/timeframe counts
@@ -379,6 +383,7 @@ def sync_to_now_tool(
             symbols,
             timeframes=timeframes,
             show_spinner=False,
+            derive=derive,
         )
         
         total_synced = sum(v for v in results.values() if v > 0)
@@ -417,6 +422,7 @@ def sync_forward_tool(
     symbols: list[str],
     timeframes: list[str] | None = None,
     env: DataEnv = DEFAULT_DATA_ENV,
+    derive: bool = False,
 ) -> ToolResult:
     """
     Sync data forward to now AND fill any gaps in existing data.
@@ -431,6 +437,7 @@ def sync_forward_tool(
         symbols: List of symbols to sync and heal
         timeframes: List of timeframes (e.g., ["15m", "1h", "4h"]) or None for all
         env: Data environment ("live"). Defaults to "live".
+        derive: Sync and gap-fill only 1m, then rebuild derived higher timeframes
 
     Returns:
         ToolResult with combined sync and gap-fill summary
@@ -452,7 +459,7 @@ def sync_forward_tool(
     
     # 1. Sync forward
     try:
-        sync_result = sync_to_now_tool(symbols, timeframes=timeframes, env=env)
+        sync_result = sync_to_now_tool(symbols, timeframes=timeframes, env=env, derive=derive)
         if sync_result.success:
             assert sync_result.data is not None
             results["sync_forward"] = {
@@ -470,7 +477,7 @@ def sync_forward_tool(
         for symbol in symbols:
             gap_result = sync_data_tool(
                 symbol=symbol,
-                timeframe=None,  # All timeframes for this symbol
+                timeframe="1m" if derive else None,  # All timeframes unless derived from 1m
                 env=env,
             )
             if gap_result.success:
@@ -478,6 +485,11 @@ def sync_forward_tool(
                 # Merge per-symbol results
                 for key, count in gap_result.data.get("results", {}).items():
                     gap_results[key] = count
+            if derive:
+                # Healed 1m gaps can complete buckets anywhere in history
+                derive_result = derive_timeframes_tool(symbol, timeframes=timeframes, full=True, env=env)
+                if not derive_result.success:
+                    errors.append(f"Derive {symbol}: {derive_result.error}")
         
         total_filled = sum(v for v in gap_results.values() if v > 0)
         results["gap_fill"] = {
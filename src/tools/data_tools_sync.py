@@ -17,6 +17,7 @@ def sync_symbols_tool(
     timeframes: list[str] | None = None,
     progress_callback: Callable | None = None,
     env: DataEnv = DEFAULT_DATA_ENV,
+    derive: bool = False,
 ) -> ToolResult:
     """
     Sync (update) data for symbols from the exchange.
@@ -27,6 +28,7 @@ def sync_symbols_tool(
         timeframes: List of timeframes (e.g., ["15m", "1h", "4h", "D"])
         progress_callback: Optional callback for progress updates
         env: Data environment ("live"). Defaults to "live".
+        derive: Fetch only 1m and aggregate higher timeframes locally
     
     Returns:
         ToolResult with sync results
@@ -45,6 +47,7 @@ def sync_symbols_tool(
             timeframes=timeframes,
             progress_callback=progress_callback,
             show_spinner=False,
+            derive=derive,
         )
         
         total_synced = sum(v for v in results.values() if v > 0)
@@ -60,6 +63,7 @@ def sync_symbols_tool(
                     "symbols": symbols,
                     "period": period,
                     "cancelled": True,
+                    "derive": derive,
                     "env": env,
                 },
                 source="duckdb",
@@ -73,6 +77,7 @@ def sync_symbols_tool(
                 "total_synced": total_synced,
                 "symbols": symbols,
                 "period": period,
+                "derive": derive,
                 "env": env,
             },
             source="duckdb",
@@ -96,6 +101,7 @@ def sync_range_tool(
     end: datetime,
     timeframes: list[str] | None = None,
     env: DataEnv = DEFAULT_DATA_ENV,
+    derive: bool = False,
 ) -> ToolResult:
     """
     Sync data for a specific date range.
@@ -106,6 +112,7 @@ def sync_range_tool(
         end: End datetime
         timeframes: List of timeframes
         env: Data environment ("live"). Defaults to "live".
+        derive: Fetch only 1m and aggregate higher timeframes locally
     
     Returns:
         ToolResult with sync results
@@ -115,7 +122,7 @@ def sync_range_tool(
     
     try:
         store = _get_historical_store(env=env)
-        results = store.sync_range(symbols, start=start, end=end, timeframes=timeframes)
+        results = store.sync_range(symbols, start=start, end=end, timeframes=timeframes, derive=derive)
         
         total_synced = sum(v for v in results.values() if v > 0)
         
@@ -128,6 +135,7 @@ def sync_range_tool(
                 "symbols": symbols,
                 "start": start.isoformat(),
                 "end": end.isoformat(),
+                "derive": derive,
                 "env": env,
             },
             source="duckdb",
@@ -247,6 +255,102 @@ def heal_data_tool(
         )
 
 
+def derive_timeframes_tool(
+    symbol: str,
+    timeframes: list[str] | None = None,
+    full: bool = False,
+    env: DataEnv = DEFAULT_DATA_ENV,
+) -> ToolResult:
+    """
+    Aggregate stored 1m bars into higher timeframes.
+
+    Args:
+        symbol: Symbol to derive
+        timeframes: Timeframes to derive (None for every derivable timeframe)
+        full: Rebuild every bar instead of extending from the last derived bar
+        env: Data environment ("live"). Defaults to "live".
+
+    Returns:
+        ToolResult with bars written per timeframe
+    """
+    try:
+        store = _get_historical_store(env=env)
+        results = store.derive_timeframes(symbol, timeframes=timeframes, full=full)
+        total = sum(results.values())
+        return ToolResult(
+            success=True,
+            symbol=symbol,
+            message=f"[{env.upper()}] Derived {total:,} candles from 1m",
+            data={"results": results, "total_derived": total, "full": full, "env": env},
+            source="duckdb",
+        )
+    except Exception as e:
+        return ToolResult(
+            success=False,
+            symbol=symbol,
+            error=f"Derive failed: {str(e)}",
+        )
+
+
+def audit_derived_data_tool(
+    symbol: str,
+    timeframes: list[str] | None = None,
+    source: str = "api",
+    sample_bars: int = 200,
+    env: DataEnv = DEFAULT_DATA_ENV,
+) -> ToolResult:
+    """
+    Compare bars derived from 1m against native exchange bars.
+
+    Args:
+        symbol: Symbol to audit
+        timeframes: Timeframes to audit (None for every derivable timeframe)
+        source: "api" fetches native bars from Bybit; "db" uses natively synced bars in DuckDB
+        sample_bars: Most recent closed bars compared per timeframe
+        env: Data environment ("live"). Defaults to "live".
+
+    Returns:
+        ToolResult with one audit report per timeframe; fails if any timeframe mismatches
+    """
+    from ..data.historical_data_store import TIMEFRAMES
+    from ..data.historical_derive import is_derivable
+
+    if source not in ("api", "db"):
+        return ToolResult(success=False, symbol=symbol, error=f"Invalid source '{source}'. Use 'api' or 'db'")
+
+    try:
+        store = _get_historical_store(env=env)
+        timeframes = timeframes or [tf for tf in TIMEFRAMES if is_derivable(tf)]
+        reports = {
+            tf: store.audit_derived(symbol, tf, source=source, sample_bars=sample_bars).to_dict()
+            for tf in timeframes
+        }
+        failed = [tf for tf, r in reports.items() if r["compared"] and not r["ok"]]
+        compared = sum(r["compared"] for r in reports.values())
+        data = {"reports": reports, "failed": failed, "compared": compared, "source": source, "env": env}
+        if failed:
+            return ToolResult(
+                success=False,
+                symbol=symbol,
+                error=f"Derived bars differ from native bars for {', '.join(failed)}",
+                data=data,
+                source="duckdb",
+            )
+        return ToolResult(
+            success=True,
+            symbol=symbol,
+            message=f"[{env.upper()}] {compared:,} derived bars match native bars ({source})",
+            data=data,
+            source="duckdb",
+        )
+    except Exception as e:
+        return ToolResult(
+            success=False,
+            symbol=symbol,
+            error=f"Derived audit failed: {str(e)}",
+        )
+
+
 
 
 def delete_symbol_tool(symbol: str, vacuum: bool = True, env: DataEnv = DEFAULT_DATA_ENV) -> ToolResult:
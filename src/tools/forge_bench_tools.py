@@ -0,0 +1,290 @@
+"""
+Forge bench tools — standing performance benchmarks with baseline checks.
+
+Runs the offline bench scenarios (src/forge/bench/), writes the report as
+JSON with machine info, and compares it against a stored baseline using
+per-metric regression thresholds.
+"""
+
+from datetime import datetime
+from pathlib import Path
+import traceback
+
+from .shared import ToolResult
+from ..utils.logger import get_module_logger
+
+
+logger = get_module_logger(__name__)
+
+
+def forge_bench_tool(
+    scenarios: list[str] | None = None,
+    quick: bool = False,
+    output_path: Path | str | None = None,
+    baseline_path: Path | str | None = None,
+    save_baseline: bool = False,
+    threshold_pct: float | None = None,
+    metric_thresholds: dict[str, float] | None = None,
+) -> ToolResult:
+    """
+    Run the bench suite and check it against a baseline.
+
+    Args:
+        scenarios: Scenario names (default: all of backtest, indicators,
+            structures, dsl, live, live_e2e, duckdb)
+        quick: Use the reduced QUICK_CONFIG workload
+        output_path: Report JSON path (default: backtests/_bench/bench_<timestamp>.json)
+        baseline_path: Baseline JSON to compare with (default:
+            backtests/_bench/baseline.json when it exists)
+        save_baseline: Also write this report as the baseline
+        threshold_pct: Regression threshold for metrics without a prefix rule
+        metric_thresholds: Extra {metric-name prefix: pct} threshold rules
+
+    Returns:
+        ToolResult with the report, the comparison (if a baseline was found)
+        and success=False on scenario errors or regressions
+    """
+    try:
+        from ..forge.bench import (
+            DEFAULT_BASELINE_PATH,
+            DEFAULT_REGRESSION_THRESHOLD_PCT,
+            QUICK_CONFIG,
+            BenchConfig,
+            compare_to_baseline,
+            load_bench_report,
+            run_bench,
+            write_bench_report,
+        )
+
+        config = QUICK_CONFIG if quick else BenchConfig()
+        report = run_bench(scenarios=scenarios, config=config, quick=quick)
+        data = report.to_dict()
+
+        if output_path is None:
+            stamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            output_path = DEFAULT_BASELINE_PATH.parent / f"bench_{stamp}.json"
+
+        comparison = None
+        explicit_baseline = baseline_path is not None
+        baseline_file = Path(baseline_path) if explicit_baseline else DEFAULT_BASELINE_PATH
+        if explicit_baseline or baseline_file.exists():
+            baseline = load_bench_report(baseline_file)
+            comparison = compare_to_baseline(
+                data,
+                baseline,
+                baseline_path=str(baseline_file),
+                threshold_pct=DEFAULT_REGRESSION_THRESHOLD_PCT if threshold_pct is None else threshold_pct,
+                metric_thresholds=metric_thresholds,
+            )
+            data["comparison"] = comparison.to_dict()
+
+        data["output_path"] = str(write_bench_report(data, output_path))
+        if save_baseline:
+            baseline_out = Path(baseline_path) if explicit_baseline else DEFAULT_BASELINE_PATH
+            report_only = {k: v for k, v in data.items() if k not in ("comparison", "output_path")}
+            data["baseline_saved"] = str(write_bench_report(report_only, baseline_out))
+
+        failed = [s for s in report.scenarios if s.error]
+        regressions = comparison.regressions if comparison is not None else []
+        summary = (
+            f"{len(report.metrics)} metrics from {len(report.scenarios)} scenario(s) "
+            f"in {report.runtime_seconds:.1f}s"
+        )
+        if comparison is not None:
+            summary += (
+                f"; vs baseline: {len(regressions)} regressed, "
+                f"{len(comparison.improvements)} improved of {len(comparison.rows)}"
+            )
+
+        if failed or regressions:
+            problems = [f"{s.name}: {s.error}" for s in failed]
+            worst = sorted(regressions, key=lambda r: -abs(r.change_pct))
+            problems += [f"{r.name} {r.change_pct:+.1f}% (limit {r.threshold_pct:.0f}%)" for r in worst[:5]]
+            if len(worst) > 5:
+                problems.append(f"... {len(worst) - 5} more in the report")
+            return ToolResult(
+                success=False,
+                error=f"Bench failed - {summary}. " + "; ".join(problems),
+                data=data,
+            )
+        return ToolResult(success=True, message=f"Bench complete - {summary}", data=data)
+
+    except ValueError as e:
+        return ToolResult(success=False, error=str(e))
+
+    except Exception as e:
+        logger.error("Bench failed: %s\n%s", e, traceback.format_exc())
+        return ToolResult(
+            success=False,
+            error=f"Bench error: {e}",
+        )
+
+
+def forge_prearm_replay_tool(
+    play_ids: list[str] | None = None,
+    candles: int = 1000,
+    forming_updates: int = 2,
+    order_latency_ms: float = 0.0,
+    query_latency_ms: float = 0.0,
+) -> ToolResult:
+    """
+    Replay Plays through the offline live harness with pre-arming off and on.
+
+    Both runs must send the exchange the same orders; reports close-to-order
+    latency of each and the pre-arm hit/miss counts.
+
+    Args:
+        play_ids: Single-TF Plays (default: BENCH_001_simple)
+        candles: Exec candles per run (after warmup)
+        forming_updates: Forming klines sent before each close
+        order_latency_ms: Simulated create_order round trip
+        query_latency_ms: Simulated round trip of other REST calls
+
+    Returns:
+        ToolResult with per-Play order parity, latency and pre-arm stats
+    """
+    try:
+        from ..forge.audits.audit_prearm_replay import run_prearm_replay_audit
+
+        result = run_prearm_replay_audit(
+            play_ids=play_ids,
+            candles=candles,
+            forming_updates=forming_updates,
+            order_latency_ms=order_latency_ms,
+            query_latency_ms=query_latency_ms,
+        )
+        data = result.to_dict()
+
+        if result.success:
+            return ToolResult(
+                success=True,
+                message=(
+                    f"Pre-arm replay PASSED: {data['total_orders']} identical orders, "
+                    f"{data['total_hits']} pre-armed hit(s)"
+                ),
+                data=data,
+            )
+        failed = [p.play_id for p in result.plays if not p.passed]
+        return ToolResult(
+            success=False,
+            error=(
+                f"Pre-arm replay FAILED for {', '.join(failed)}: "
+                f"{data['total_mismatches']} order mismatch(es), {data['total_hits']} hit(s)"
+            ),
+            data=data,
+        )
+
+    except ValueError as e:
+        return ToolResult(success=False, error=str(e))
+
+    except Exception as e:
+        logger.error("Pre-arm replay failed: %s\n%s", e, traceback.format_exc())
+        return ToolResult(
+            success=False,
+            error=f"Pre-arm replay error: {e}",
+        )
+
+
+def forge_checkpoint_restore_tool(
+    play_ids: list[str] | None = None,
+    candles: int = 250,
+) -> ToolResult:
+    """
+    Check LiveDataProvider warm restart (checkpoint restore + replay) offline.
+
+    The restored provider must match an uninterrupted run exactly and a cold
+    warmup on the same bars (structure history aside); corrupt checkpoints
+    and bar gaps must fall back to the cold path.
+
+    Args:
+        play_ids: Single-TF Plays (default: BENCH_001_simple, BENCH_004_structures)
+        candles: Closed candles after warmup (checkpoint taken halfway)
+
+    Returns:
+        ToolResult with per-Play state diffs, checkpoint size and timings
+    """
+    try:
+        from ..forge.audits.audit_checkpoint_restore import run_checkpoint_restore_audit
+
+        result = run_checkpoint_restore_audit(play_ids=play_ids, candles=candles)
+        data = result.to_dict()
+
+        if result.success:
+            return ToolResult(
+                success=True,
+                message=f"Checkpoint restore PASSED: {len(result.plays)} play(s) identical after restore + replay",
+                data=data,
+            )
+        failed = [p.play_id for p in result.plays if not p.passed]
+        return ToolResult(
+            success=False,
+            error=(
+                f"Checkpoint restore FAILED for {', '.join(failed)}: "
+                f"{data['total_diffs']} state difference(s)"
+            ),
+            data=data,
+        )
+
+    except ValueError as e:
+        return ToolResult(success=False, error=str(e))
+
+    except Exception as e:
+        logger.error("Checkpoint restore audit failed: %s\n%s", e, traceback.format_exc())
+        return ToolResult(
+            success=False,
+            error=f"Checkpoint restore error: {e}",
+        )
+
+
+def forge_streaming_parity_tool(
+    play_ids: list[str] | None = None,
+    bars: int = 1500,
+    memory_budget_mb: int = 1,
+) -> ToolResult:
+    """
+    Check streaming backtests (memory-mapped, paged feeds) against in-memory runs.
+
+    Both runs use the same synthetic candles; trade count, final equity,
+    trades hash and equity hash must be identical.
+
+    Args:
+        play_ids: Plays to run (default: BENCH_001_simple, BENCH_002_multi_tf)
+        bars: Synthetic bars per timeframe
+        memory_budget_mb: Streaming budget (small, so the pager is exercised)
+
+    Returns:
+        ToolResult with per-Play hashes, pager stats and peak RSS
+    """
+    try:
+        from ..forge.audits.audit_streaming_parity import run_streaming_parity_audit
+
+        result = run_streaming_parity_audit(
+            play_ids=play_ids, bars=bars, memory_budget_mb=memory_budget_mb,
+        )
+        data = result.to_dict()
+
+        if result.success:
+            return ToolResult(
+                success=True,
+                message=f"Streaming parity PASSED: {len(result.plays)} play(s) identical to in-memory runs",
+                data=data,
+            )
+        failed = [p.play_id for p in result.plays if not p.passed]
+        return ToolResult(
+            success=False,
+            error=(
+                f"Streaming parity FAILED for {', '.join(failed)}: "
+                f"{data['total_mismatches']} mismatch(es)"
+            ),
+            data=data,
+        )
+
+    except ValueError as e:
+        return ToolResult(success=False, error=str(e))
+
+    except Exception as e:
+        logger.error("Streaming parity audit failed: %s\n%s", e, traceback.format_exc())
+        return ToolResult(
+            success=False,
+            error=f"Streaming parity error: {e}",
+        )
@@ -19,7 +19,11 @@ def get_imports():
         backtest_audit_rollup_parity_tool,
         backtest_math_parity_tool,
         backtest_audit_snapshot_plumbing_tool,
+        backtest_audit_rule_compiler_tool,
+        backtest_audit_alignment_tool,
         verify_artifact_parity_tool,
+        backtest_robustness_tool,
+        backtest_portfolio_tool,
     )
     return {
         "backtest_list_plays": backtest_list_plays_tool,
@@ -33,7 +37,11 @@ def get_imports():
         "backtest_audit_rollup": backtest_audit_rollup_parity_tool,
         "backtest_audit_math_parity": backtest_math_parity_tool,
         "backtest_audit_snapshot_plumbing": backtest_audit_snapshot_plumbing_tool,
+        "backtest_audit_rule_compiler": backtest_audit_rule_compiler_tool,
+        "backtest_audit_alignment": backtest_audit_alignment_tool,
         "backtest_verify_artifacts": verify_artifact_parity_tool,
+        "backtest_robustness": backtest_robustness_tool,
+        "backtest_portfolio": backtest_portfolio_tool,
     }
 
 
@@ -123,6 +131,50 @@ SPECS = [
         },
         "required": ["plays_dir"],
     },
+    {
+        "name": "backtest_robustness",
+        "description": "Monte Carlo / bootstrap robustness of a finished run (trade shuffle, block bootstrap, random skip). Writes robustness.json with CIs for drawdown, Sharpe, CAGR and ruin probability.",
+        "category": "backtest.play",
+        "parameters": {
+            "run_dir": {"type": "string", "description": "Run artifact folder (from backtest_run_play artifact_dir)"},
+            "resamples": {"type": "integer", "description": "Resamples per method", "default": 10000},
+            "methods": {
+                "type": "array",
+                "description": "Subset of trade_shuffle, block_bootstrap, random_skip",
+                "items": {"type": "string"},
+                "optional": True,
+            },
+            "block_size": {"type": "integer", "description": "Block length for block_bootstrap", "optional": True},
+            "block_lengths": {"type": "string", "description": "Block lengths (fixed = circular, geometric = stationary bootstrap)", "default": "fixed"},
+            "skip_prob": {"type": "number", "description": "Per-trade drop probability for random_skip", "default": 0.1},
+            "ruin_fraction": {"type": "number", "description": "Ruin when equity <= fraction * initial", "default": 0.5},
+            "confidence": {"type": "number", "description": "Confidence interval level", "default": 0.9},
+            "seed": {"type": "integer", "description": "Random seed", "default": 42},
+            "workers": {"type": "integer", "description": "Worker processes", "default": 1},
+        },
+        "required": ["run_dir"],
+    },
+    {
+        "name": "backtest_portfolio",
+        "description": "Run several Plays in one pass on a shared clock (shared feeds, portfolio ledger, per-play attribution, optional account-level entry caps)",
+        "category": "backtest.play",
+        "parameters": {
+            "play_ids": {
+                "type": "array",
+                "description": "Play identifiers to run together",
+                "items": {"type": "string"},
+            },
+            "env": {"type": "string", "description": "Data environment ('live')", "default": "live"},
+            "start": {"type": "string", "description": "Window start datetime", "optional": True},
+            "end": {"type": "string", "description": "Window end datetime", "optional": True},
+            "use_synthetic": {"type": "boolean", "description": "Use synthetic data from each Play's validation block", "default": False},
+            "max_positions": {"type": "integer", "description": "Portfolio-wide open position cap", "optional": True},
+            "max_exposure_usdt": {"type": "number", "description": "Portfolio-wide notional exposure cap (USDT)", "optional": True},
+            "max_im_rate": {"type": "number", "description": "Portfolio-wide initial margin rate cap (0-1)", "optional": True},
+            "output_path": {"type": "string", "description": "JSON file for the full result with equity curve", "optional": True},
+        },
+        "required": ["play_ids"],
+    },
     # Audit tools
     {
         "name": "backtest_audit_toolkit",
@@ -173,6 +225,36 @@ SPECS = [
         },
         "required": ["play_id", "start_date", "end_date"],
     },
+    {
+        "name": "backtest_audit_rule_compiler",
+        "description": "Check compiled rule closures against the DSL interpreter on validation plays and report per-bar rule evaluation time for both",
+        "category": "backtest.audit",
+        "parameters": {
+            "play_ids": {
+                "type": "array",
+                "description": "Play identifiers (default: core validation plays)",
+                "items": {"type": "string"},
+                "optional": True,
+            },
+            "max_snapshots": {"type": "integer", "description": "Evaluated snapshots per play", "default": 3000},
+        },
+        "required": [],
+    },
+    {
+        "name": "backtest_audit_alignment",
+        "description": "Check the precomputed multi-TF alignment table (TF indices, 1m ranges, funding) against per-bar timestamp lookups on validation plays and DST / gap edge cases",
+        "category": "backtest.audit",
+        "parameters": {
+            "play_ids": {
+                "type": "array",
+                "description": "Play identifiers (default: core validation plays)",
+                "items": {"type": "string"},
+                "optional": True,
+            },
+            "synthetic": {"type": "boolean", "description": "Also run synthetic DST / gap / boundary cases", "default": True},
+        },
+        "required": [],
+    },
     {
         "name": "backtest_verify_artifacts",
         "description": "Verify backtest artifact integrity",
@@ -18,6 +18,7 @@ def get_imports():
         sync_to_now_tool, sync_forward_tool,
         build_symbol_history_tool,
         sync_data_tool, heal_data_tool,
+        derive_timeframes_tool, audit_derived_data_tool,
         delete_symbol_tool, cleanup_empty_symbols_tool, vacuum_database_tool,
         delete_all_data_tool,
         get_funding_history_tool, get_open_interest_history_tool, get_ohlcv_history_tool,
@@ -37,6 +38,8 @@ def get_imports():
         "build_symbol_history": build_symbol_history_tool,
         "sync_data": sync_data_tool,
         "heal_data": heal_data_tool,
+        "derive_timeframes": derive_timeframes_tool,
+        "audit_derived_data": audit_derived_data_tool,
         "delete_symbol": delete_symbol_tool,
         "cleanup_empty_symbols": cleanup_empty_symbols_tool,
         "vacuum_database": vacuum_database_tool,
@@ -99,6 +102,7 @@ SPECS = [
             "symbols": {"type": "array", "items": {"type": "string"}, "description": "List of symbols to sync"},
             "period": {"type": "string", "description": "Period (1D, 1W, 1M, 3M, 6M, 1Y)", "default": "1M"},
             "timeframes": {"type": "array", "items": {"type": "string"}, "description": "Timeframes to sync", "optional": True},
+            "derive": {"type": "boolean", "description": "Fetch only 1m and derive higher timeframes locally", "default": False},
             "env": DATA_ENV_PARAM,
         },
         "required": ["symbols"],
@@ -112,6 +116,7 @@ SPECS = [
             "start": {"type": "string", "description": "Start datetime (ISO format)"},
             "end": {"type": "string", "description": "End datetime (ISO format)"},
             "timeframes": {"type": "array", "items": {"type": "string"}, "description": "Timeframes to sync", "optional": True},
+            "derive": {"type": "boolean", "description": "Fetch only 1m and derive higher timeframes locally", "default": False},
             "env": DATA_ENV_PARAM,
         },
         "required": ["symbols", "start", "end"],
@@ -146,6 +151,7 @@ SPECS = [
         "parameters": {
             "symbols": {"type": "array", "items": {"type": "string"}, "description": "List of symbols to sync forward"},
             "timeframes": {"type": "array", "items": {"type": "string"}, "description": "Timeframes to sync", "optional": True},
+            "derive": {"type": "boolean", "description": "Fetch only 1m and derive higher timeframes locally", "default": False},
             "env": DATA_ENV_PARAM,
         },
         "required": ["symbols"],
@@ -157,6 +163,7 @@ SPECS = [
         "parameters": {
             "symbols": {"type": "array", "items": {"type": "string"}, "description": "List of symbols to sync and heal"},
             "timeframes": {"type": "array", "items": {"type": "string"}, "description": "Timeframes to sync", "optional": True},
+            "derive": {"type": "boolean", "description": "Fetch only 1m and derive higher timeframes locally", "default": False},
             "env": DATA_ENV_PARAM,
         },
         "required": ["symbols"],
@@ -198,6 +205,31 @@ SPECS = [
         },
         "required": [],
     },
+    {
+        "name": "derive_timeframes",
+        "description": "Aggregate stored 1m bars into higher timeframes (incremental unless full)",
+        "category": "data.maintenance",
+        "parameters": {
+            "symbol": {"type": "string", "description": "Symbol to derive"},
+            "timeframes": {"type": "array", "items": {"type": "string"}, "description": "Timeframes (default: all derivable)", "optional": True},
+            "full": {"type": "boolean", "description": "Rebuild every derived bar", "default": False},
+            "env": DATA_ENV_PARAM,
+        },
+        "required": ["symbol"],
+    },
+    {
+        "name": "audit_derived_data",
+        "description": "Compare bars derived from 1m against native exchange bars",
+        "category": "data.maintenance",
+        "parameters": {
+            "symbol": {"type": "string", "description": "Symbol to audit"},
+            "timeframes": {"type": "array", "items": {"type": "string"}, "description": "Timeframes (default: all derivable)", "optional": True},
+            "source": {"type": "string", "description": "Native bars from 'api' (Bybit) or 'db' (natively synced DuckDB)", "default": "api"},
+            "sample_bars": {"type": "integer", "description": "Most recent closed bars compared per timeframe", "default": 200},
+            "env": DATA_ENV_PARAM,
+        },
+        "required": ["symbol"],
+    },
     {
         "name": "delete_symbol",
         "description": "Delete all data for a symbol",
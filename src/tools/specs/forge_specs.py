@@ -12,12 +12,20 @@ def get_imports():
         forge_generate_synthetic_data_tool,
         forge_structure_parity_tool,
         forge_indicator_parity_tool,
+        forge_bench_tool,
+        forge_prearm_replay_tool,
+        forge_checkpoint_restore_tool,
+        forge_streaming_parity_tool,
     )
     return {
         "forge_stress_test": forge_stress_test_tool,
         "forge_generate_synthetic_data": forge_generate_synthetic_data_tool,
         "forge_structure_parity": forge_structure_parity_tool,
         "forge_indicator_parity": forge_indicator_parity_tool,
+        "forge_bench": forge_bench_tool,
+        "forge_prearm_replay": forge_prearm_replay_tool,
+        "forge_checkpoint_restore": forge_checkpoint_restore_tool,
+        "forge_streaming_parity": forge_streaming_parity_tool,
     }
 
 
@@ -84,4 +92,72 @@ SPECS = [
         },
         "required": [],
     },
+    {
+        "name": "forge_bench",
+        "description": "Run offline performance benchmarks (backtest, indicators, structures, DSL, live, DuckDB) and compare with a stored baseline",
+        "category": "forge",
+        "parameters": {
+            "scenarios": {
+                "type": "array",
+                "description": "Scenarios to run: backtest, indicators, structures, dsl, live, duckdb (default: all)",
+                "items": {"type": "string"},
+                "optional": True,
+            },
+            "quick": {"type": "boolean", "description": "Reduced workload for smoke runs", "default": False},
+            "output_path": {"type": "string", "description": "Report JSON path (default: backtests/_bench/bench_<timestamp>.json)", "optional": True},
+            "baseline_path": {"type": "string", "description": "Baseline JSON (default: backtests/_bench/baseline.json if present)", "optional": True},
+            "save_baseline": {"type": "boolean", "description": "Store this run as the baseline", "default": False},
+            "threshold_pct": {"type": "number", "description": "Regression threshold in percent for metrics without a prefix rule", "default": 10.0},
+        },
+        "required": [],
+    },
+    {
+        "name": "forge_prearm_replay",
+        "description": "Replay synthetic candles through the offline live stack with order pre-arming off and on; orders must be identical, reports close-to-order latency and pre-arm hits",
+        "category": "forge",
+        "parameters": {
+            "play_ids": {
+                "type": "array",
+                "description": "Single-TF play identifiers (default: BENCH_001_simple)",
+                "items": {"type": "string"},
+                "optional": True,
+            },
+            "candles": {"type": "integer", "description": "Exec candles per run", "default": 1000},
+            "forming_updates": {"type": "integer", "description": "Forming klines before each close", "default": 2},
+            "order_latency_ms": {"type": "number", "description": "Simulated order REST round trip", "default": 0.0},
+            "query_latency_ms": {"type": "number", "description": "Simulated round trip of other REST calls", "default": 0.0},
+        },
+        "required": [],
+    },
+    {
+        "name": "forge_checkpoint_restore",
+        "description": "Check live/shadow warm restart offline: checkpoint restore + replay must match an uninterrupted run and a cold warmup on the same bars",
+        "category": "forge",
+        "parameters": {
+            "play_ids": {
+                "type": "array",
+                "description": "Single-TF play identifiers (default: BENCH_001_simple, BENCH_004_structures)",
+                "items": {"type": "string"},
+                "optional": True,
+            },
+            "candles": {"type": "integer", "description": "Closed candles after warmup (checkpoint taken halfway)", "default": 250},
+        },
+        "required": [],
+    },
+    {
+        "name": "forge_streaming_parity",
+        "description": "Check streaming backtests (memory-mapped, paged feeds) against in-memory runs: trades, equity and hashes must be identical",
+        "category": "forge",
+        "parameters": {
+            "play_ids": {
+                "type": "array",
+                "description": "Play identifiers (default: BENCH_001_simple, BENCH_002_multi_tf)",
+                "items": {"type": "string"},
+                "optional": True,
+            },
+            "bars": {"type": "integer", "description": "Synthetic bars per timeframe", "default": 1500},
+            "memory_budget_mb": {"type": "integer", "description": "Streaming memory budget (small, so the pager is exercised)", "default": 1},
+        },
+        "required": [],
+    },
 ]
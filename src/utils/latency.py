@@ -0,0 +1,282 @@
+"""
+Live candle-to-exchange latency tracing.
+
+One CandleTrace follows a closed candle from the WebSocket kline callback to
+the exchange acknowledgement. Each hop appends a monotonic (perf_counter_ns)
+mark; a span is the time between a mark and the one before it, the first
+span starting when the kline arrived:
+
+    convert                    kline -> Candle, dedup, enqueue
+    queue                      time waiting in the candle queue
+    data_provider              LiveDataProvider.on_candle_close
+    engine                     PlayEngine.process_bar
+    signal                     signal journal + notification
+    safety                     pre-trade safety checks
+    executor.panic_check       OrderExecutor.execute steps ...
+    executor.mode_validation
+    executor.portfolio_snapshot
+    executor.risk_check
+    executor.price_deviation
+    executor.prearmed          replaces the three above for a pre-armed entry
+    executor.order             REST order call until its response (order ack)
+    executor.record            position recording, callbacks
+    execute                    back through LiveExchange / PlayEngine
+    ws_execution               order ack -> WebSocket execution message
+
+Totals: "total" (kline arrival -> end of exec-candle processing),
+"to_order_ack" (-> REST response) and "to_ws_execution" (-> execution
+message). "close_lag" is wall-clock lateness of the kline itself (arrival
+minus candle close), kept apart from the monotonic spans.
+
+Instrumented code asks for the current trace once and marks hops only when
+one is installed, so untraced calls (backtest, tools) pay one lookup:
+
+    trace = current_trace()
+    ...
+    if trace is not None:
+        trace.mark("executor.risk_check")
+
+The current trace is a ContextVar, so concurrent tasks and threads (the
+WebSocket callback thread) never see each other's trace. Execution messages
+arrive on another thread and find their trace by order id through
+CandleTrace.mark_order_ack() / mark_execution().
+
+LatencyStats keeps a rolling window per span and reports count, p50, p99,
+last and max in milliseconds.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict, deque
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from time import perf_counter_ns
+from typing import Any
+
+DEFAULT_LATENCY_WINDOW = 1000
+_MAX_AWAITING_ACK = 256
+
+_current: ContextVar["CandleTrace | None"] = ContextVar("candle_trace", default=None)
+
+_awaiting_ack: OrderedDict[str, "CandleTrace"] = OrderedDict()
+_awaiting_lock = threading.Lock()
+
+
+class CandleTrace:
+    """Hop marks for one closed candle, from kline arrival to exchange ack."""
+
+    __slots__ = (
+        "timeframe", "ts_close_ms", "close_lag_ms", "is_exec",
+        "t0_ns", "marks", "order_id", "order_ack_ns", "ack_ns", "on_ack",
+    )
+
+    def __init__(
+        self,
+        timeframe: str,
+        on_ack: Callable[["CandleTrace"], None] | None = None,
+    ) -> None:
+        self.t0_ns = perf_counter_ns()
+        self.timeframe = timeframe
+        self.ts_close_ms = 0
+        self.close_lag_ms: float | None = None
+        self.is_exec = False
+        self.marks: list[tuple[str, int]] = []
+        self.order_id: str | None = None
+        self.order_ack_ns: int | None = None
+        self.ack_ns: int | None = None
+        self.on_ack = on_ack
+
+    def mark(self, hop: str) -> None:
+        """Close the span ending now under the given hop name."""
+        self.marks.append((hop, perf_counter_ns()))
+
+    def mark_order_ack(self, order_id: str | None) -> None:
+        """Mark the REST order response; park the trace for its execution message."""
+        self.mark("executor.order")
+        self.order_ack_ns = self.marks[-1][1]
+        if order_id:
+            await_execution(order_id, self)
+
+    def spans_ns(self) -> list[tuple[str, int]]:
+        """(hop, ns) per mark, each measured from the previous mark."""
+        out: list[tuple[str, int]] = []
+        prev = self.t0_ns
+        for hop, ns in self.marks:
+            out.append((hop, ns - prev))
+            prev = ns
+        return out
+
+    @property
+    def total_ns(self) -> int:
+        """Kline arrival to the last mark."""
+        return self.marks[-1][1] - self.t0_ns if self.marks else 0
+
+    @property
+    def ws_execution_ns(self) -> int | None:
+        """Order ack to execution message, once both are known."""
+        if self.ack_ns is None or self.order_ack_ns is None:
+            return None
+        return self.ack_ns - self.order_ack_ns
+
+    def to_record(self) -> dict[str, Any]:
+        """Journal payload (milliseconds, rounded to the microsecond)."""
+        spans: dict[str, float] = {}
+        for hop, ns in self.spans_ns():
+            spans[hop] = round(spans.get(hop, 0.0) + ns / 1e6, 3)
+        return {
+            "timeframe": self.timeframe,
+            "candle_ts_close_ms": self.ts_close_ms,
+            "close_lag_ms": None if self.close_lag_ms is None else round(self.close_lag_ms, 3),
+            "spans_ms": spans,
+            "total_ms": round(self.total_ns / 1e6, 3),
+            "order_id": self.order_id,
+            "to_order_ack_ms": (
+                None if self.order_ack_ns is None else round((self.order_ack_ns - self.t0_ns) / 1e6, 3)
+            ),
+        }
+
+
+def current_trace() -> CandleTrace | None:
+    """Trace of the candle being processed in this context, or None."""
+    return _current.get()
+
+
+@contextmanager
+def tracing(trace: CandleTrace | None) -> Iterator[CandleTrace | None]:
+    """Install a trace as current for the block (None installs nothing)."""
+    if trace is None:
+        yield None
+        return
+    token = _current.set(trace)
+    try:
+        yield trace
+    finally:
+        _current.reset(token)
+
+
+def await_execution(order_id: str, trace: CandleTrace) -> None:
+    """Park a trace until the first execution message of its order arrives."""
+    trace.order_id = order_id
+    with _awaiting_lock:
+        _awaiting_ack[order_id] = trace
+        while len(_awaiting_ack) > _MAX_AWAITING_ACK:
+            _awaiting_ack.popitem(last=False)
+
+
+def mark_execution(order_id: str) -> CandleTrace | None:
+    """
+    Close the trace waiting on an order's first execution message.
+
+    Returns the trace (after its on_ack callback ran), or None when no
+    trace waits on this order id. Later partial fills find nothing.
+    """
+    if not _awaiting_ack:
+        return None
+    with _awaiting_lock:
+        trace = _awaiting_ack.pop(order_id, None)
+    if trace is None:
+        return None
+    trace.ack_ns = perf_counter_ns()
+    if trace.on_ack is not None:
+        trace.on_ack(trace)
+    return trace
+
+
+def clear_awaiting_executions() -> None:
+    """Drop all parked traces (offline harness reset)."""
+    with _awaiting_lock:
+        _awaiting_ack.clear()
+
+
+class LatencyHistogram:
+    """Rolling window of one span's samples (milliseconds)."""
+
+    __slots__ = ("_samples", "count", "max_ms")
+
+    def __init__(self, window: int = DEFAULT_LATENCY_WINDOW) -> None:
+        self._samples: deque[float] = deque(maxlen=window)
+        self.count = 0
+        self.max_ms = 0.0
+
+    def add(self, ms: float) -> None:
+        self._samples.append(ms)
+        self.count += 1
+        if ms > self.max_ms:
+            self.max_ms = ms
+
+    def summary(self) -> dict[str, float | int]:
+        """count (all time), p50 / p99 over the window, last and max (all time)."""
+        samples = sorted(self._samples)
+        n = len(samples)
+        if n == 0:
+            return {"count": self.count, "p50_ms": 0.0, "p99_ms": 0.0, "last_ms": 0.0, "max_ms": 0.0}
+        return {
+            "count": self.count,
+            "p50_ms": round(samples[n // 2], 3),
+            "p99_ms": round(samples[min(n - 1, int(n * 0.99))], 3),
+            "last_ms": round(self._samples[-1], 3),
+            "max_ms": round(self.max_ms, 3),
+        }
+
+
+class LatencyStats:
+    """Per-span rolling histograms fed by finished traces (thread-safe)."""
+
+    def __init__(self, window: int = DEFAULT_LATENCY_WINDOW) -> None:
+        self._window = window
+        self._histograms: dict[str, LatencyHistogram] = {}
+        self._lock = threading.Lock()
+
+    def record(self, span: str, ms: float) -> None:
+        with self._lock:
+            hist = self._histograms.get(span)
+            if hist is None:
+                hist = self._histograms[span] = LatencyHistogram(self._window)
+            hist.add(ms)
+
+    def record_trace(self, trace: CandleTrace) -> None:
+        """Add every span of a processed candle; totals only for exec candles."""
+        spans: dict[str, int] = {}
+        for hop, ns in trace.spans_ns():
+            spans[hop] = spans.get(hop, 0) + ns
+        for hop, ns in spans.items():
+            self.record(hop, ns / 1e6)
+        if trace.close_lag_ms is not None:
+            self.record("close_lag", trace.close_lag_ms)
+        if trace.is_exec and trace.marks:
+            self.record("total", trace.total_ns / 1e6)
+        if trace.order_ack_ns is not None:
+            self.record("to_order_ack", (trace.order_ack_ns - trace.t0_ns) / 1e6)
+
+    def record_ack(self, trace: CandleTrace) -> None:
+        """Add the execution-message spans of an acknowledged trace."""
+        ws_ns = trace.ws_execution_ns
+        if ws_ns is None or trace.ack_ns is None:
+            return
+        self.record("ws_execution", ws_ns / 1e6)
+        self.record("to_ws_execution", (trace.ack_ns - trace.t0_ns) / 1e6)
+
+    def get(self, span: str) -> dict[str, float | int] | None:
+        with self._lock:
+            hist = self._histograms.get(span)
+            return hist.summary() if hist is not None else None
+
+    def summary(self) -> dict[str, dict[str, float | int]]:
+        """{span: {count, p50_ms, p99_ms, last_ms, max_ms}} in span order."""
+        with self._lock:
+            return {name: hist.summary() for name, hist in self._histograms.items()}
+
+
+def format_latency_summary(summary: dict[str, dict[str, float | int]]) -> list[str]:
+    """Table lines for a LatencyStats.summary() (hops first, totals last)."""
+    totals = ("close_lag", "total", "to_order_ack", "to_ws_execution")
+    order = [name for name in summary if name not in totals] + [name for name in totals if name in summary]
+    lines = [f"{'Span':<30} {'Count':>7} {'p50 ms':>9} {'p99 ms':>9} {'Max ms':>9}"]
+    for name in order:
+        row = summary[name]
+        lines.append(
+            f"{name:<30} {row['count']:>7} {row['p50_ms']:>9.3f} {row['p99_ms']:>9.3f} {row['max_ms']:>9.3f}"
+        )
+    return lines
@@ -0,0 +1,493 @@
+"""
+Per-phase hot-path profiler.
+
+Opt-in, low-overhead timing of where a run spends its time. Instrumented
+code asks for the active profiler once per call and, when one is active,
+adds monotonic-clock (perf_counter_ns) laps to per-phase accumulators.
+With no active profiler the cost is one ``is not None`` check per phase
+boundary.
+
+Phases are dotted paths; the dots define the tree used for profile.json
+and the flame-style summary:
+
+    prep.*         data load, indicator build (per indicator), FeedStores,
+                   quote feed, market data, sim exchange, structure state
+    gates.*        preflight / indicator requirement gates
+    runner.*       BacktestRunner bookkeeping: begin, bar context, fills
+                   (incl. SimulatedExchange steps), equity record, finish
+    engine         PlayEngine.process_bar (inclusive, recorded by the runner)
+    engine.*       candle + TF indices, structures (per TF and detector),
+                   exchange step, prescreen, rules (snapshot / eval)
+    execute.*      signal execution: sizing, order submit
+    indicators.*   LiveIndicatorCache.update (per indicator, live path)
+    artifacts.*    journal, parquet, result.json, signature, validation
+
+A node that is never recorded itself is the sum of its children. Roots are
+disjoint, so their sum plus "untracked" is the wall time of the profile.
+
+Usage:
+    from src.utils.profiler import profiling, format_profile_summary
+
+    with profiling(play_id="V_001") as prof:
+        run_backtest(...)
+    for line in format_profile_summary(prof.to_dict()):
+        print(line)
+
+Enable for backtests:
+    - CLI flag: backtest run --profile (writes <artifact_dir>/profile.json)
+    - Or environment variable: TRADE_PROFILE=1
+
+Allocation mode (backtest run --profile-alloc, TRADE_PROFILE=alloc) also
+runs tracemalloc and charges every phase boundary with the Python memory
+allocated since the previous boundary: net bytes (still held), churn bytes
+(transient high-water, a lower bound on bytes allocated) and the largest
+single-call peak. GC collections and pause time are counted per
+generation, and a snapshot diff over the run ranks source files
+(components) by memory they retained. Timings in this mode are inflated
+by tracemalloc; compare allocations, not seconds.
+
+Not thread-aware: laps from concurrent threads land in the same accumulators.
+
+peak_rss_mb() (process high-water resident memory) is recorded in every
+backtest's result.json, profiled or not.
+"""
+
+from __future__ import annotations
+
+import gc
+import json
+import os
+import sys
+import tracemalloc
+from collections.abc import Iterator
+from contextlib import contextmanager, nullcontext
+from pathlib import Path
+from time import perf_counter_ns
+from typing import Any, ContextManager
+
+PROFILE_VERSION = 1
+
+_active: "PhaseProfiler | None" = None
+
+
+# Source files listed in the retained-by-component table
+ALLOC_TOP_COMPONENTS = 15
+
+
+def profile_enabled_by_env() -> bool:
+    """Check the TRADE_PROFILE environment variable."""
+    return os.environ.get("TRADE_PROFILE", "").lower() in ("1", "true", "yes", "alloc")
+
+
+def profile_alloc_by_env() -> bool:
+    """TRADE_PROFILE=alloc: profile allocations as well as time."""
+    return os.environ.get("TRADE_PROFILE", "").lower() == "alloc"
+
+
+def peak_rss_mb() -> float | None:
+    """Peak resident set size of this process in MB (None where unsupported)."""
+    try:
+        import resource
+    except ImportError:  # Windows
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is KiB on Linux, bytes on macOS
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def active_profiler() -> "PhaseProfiler | None":
+    """Return the active profiler, or None when profiling is off."""
+    return _active
+
+
+class AllocTracker:
+    """
+    tracemalloc accounting per phase boundary (PhaseProfiler alloc mode).
+
+    charge() attributes everything allocated since the previous charge to
+    one phase, so back-to-back laps split cleanly; a span nested in
+    unprofiled code also picks up that code's allocations.
+    """
+
+    __slots__ = (
+        "_net", "_churn", "_peak", "_mark", "_started_tracing", "_baseline",
+        "_gc_start_ns", "_gc_collections", "_gc_collected", "_gc_pause_ns",
+        "_retained", "_traced_peak",
+    )
+
+    def __init__(self) -> None:
+        self._net: dict[str, int] = {}
+        self._churn: dict[str, int] = {}
+        self._peak: dict[str, int] = {}
+        self._started_tracing = not tracemalloc.is_tracing()
+        if self._started_tracing:
+            tracemalloc.start()
+        self._baseline: tracemalloc.Snapshot | None = tracemalloc.take_snapshot()
+        self._gc_start_ns = 0
+        self._gc_collections = [0, 0, 0]
+        self._gc_collected = [0, 0, 0]
+        self._gc_pause_ns = [0, 0, 0]
+        self._retained: list[dict[str, Any]] = []
+        self._traced_peak = 0
+        gc.callbacks.append(self._on_gc)
+        tracemalloc.reset_peak()
+        self._mark = tracemalloc.get_traced_memory()[0]
+
+    def _on_gc(self, phase: str, info: dict[str, int]) -> None:
+        if phase == "start":
+            self._gc_start_ns = perf_counter_ns()
+            return
+        gen = info["generation"]
+        self._gc_collections[gen] += 1
+        self._gc_collected[gen] += info["collected"]
+        self._gc_pause_ns[gen] += perf_counter_ns() - self._gc_start_ns
+
+    def charge(self, phase: str) -> None:
+        current, peak = tracemalloc.get_traced_memory()
+        self._traced_peak = max(self._traced_peak, peak)
+        net = current - self._mark
+        transient = max(peak - self._mark, 0)
+        if phase in self._net:
+            self._net[phase] += net
+            self._churn[phase] += transient
+            if transient > self._peak[phase]:
+                self._peak[phase] = transient
+        else:
+            self._net[phase] = net
+            self._churn[phase] = transient
+            self._peak[phase] = transient
+        tracemalloc.reset_peak()
+        self._mark = current
+
+    def stop(self, top: int = ALLOC_TOP_COMPONENTS) -> None:
+        """Stop GC accounting and rank source files by retained memory."""
+        if self._on_gc in gc.callbacks:
+            gc.callbacks.remove(self._on_gc)
+        baseline = self._baseline
+        if baseline is None:
+            return  # already stopped
+        self._traced_peak = max(self._traced_peak, tracemalloc.get_traced_memory()[1])
+        stats = tracemalloc.take_snapshot().compare_to(baseline, "filename")
+        stats.sort(key=lambda st: -st.size_diff)
+        root = str(Path.cwd())
+        self._retained = [
+            {
+                "component": _component_name(st.traceback[0].filename, root),
+                "retained_bytes": st.size_diff,
+                "retained_blocks": st.count_diff,
+            }
+            for st in stats[:top]
+            if st.size_diff > 0
+        ]
+        self._baseline = None
+        if self._started_tracing:
+            tracemalloc.stop()
+
+    def to_dict(self, calls: dict[str, int]) -> dict[str, Any]:
+        return {
+            "traced_peak_bytes": self._traced_peak,
+            "phases": {
+                name: {
+                    "net_bytes": self._net[name],
+                    "churn_bytes": self._churn[name],
+                    "peak_bytes": self._peak[name],
+                    "churn_per_call": round(self._churn[name] / calls[name], 1) if calls.get(name) else 0.0,
+                }
+                for name in sorted(self._net)
+            },
+            "gc": {
+                f"gen{gen}": {
+                    "collections": self._gc_collections[gen],
+                    "collected": self._gc_collected[gen],
+                    "pause_seconds": round(self._gc_pause_ns[gen] / 1e9, 6),
+                }
+                for gen in range(3)
+            },
+            "retained_by_component": self._retained,
+        }
+
+
+def _component_name(filename: str, root: str) -> str:
+    """Repo-relative path for project files, else the path below site-packages / stdlib."""
+    if filename.startswith(root):
+        return filename[len(root):].lstrip("/\\")
+    for marker in ("site-packages", "lib/python"):
+        pos = filename.find(marker)
+        if pos >= 0:
+            return filename[pos:]
+    return filename
+
+
+class PhaseProfiler:
+    """Nanosecond accumulators and call counts keyed by dotted phase path."""
+
+    __slots__ = ("_ns", "_calls", "_start_ns", "_stop_ns", "_alloc", "meta")
+
+    def __init__(self, alloc: bool = False, **meta: Any) -> None:
+        self._ns: dict[str, int] = {}
+        self._calls: dict[str, int] = {}
+        self._alloc: AllocTracker | None = AllocTracker() if alloc else None
+        self._start_ns = perf_counter_ns()
+        self._stop_ns: int | None = None
+        self.meta: dict[str, Any] = dict(meta)
+
+    @property
+    def alloc_enabled(self) -> bool:
+        return self._alloc is not None
+
+    def add(self, phase: str, elapsed_ns: int) -> None:
+        """Accumulate one timed call of a phase."""
+        ns = self._ns
+        if phase in ns:
+            ns[phase] += elapsed_ns
+            self._calls[phase] += 1
+        else:
+            ns[phase] = elapsed_ns
+            self._calls[phase] = 1
+        if self._alloc is not None:
+            self._alloc.charge(phase)
+
+    def lap(self, phase: str, t0: int) -> int:
+        """Record now - t0 for a phase and return now (start of the next lap)."""
+        now = perf_counter_ns()
+        self.add(phase, now - t0)
+        return now
+
+    @contextmanager
+    def span(self, phase: str) -> Iterator[None]:
+        """Time a block as one call of a phase (coarse, non-hot phases)."""
+        t0 = perf_counter_ns()
+        try:
+            yield
+        finally:
+            self.add(phase, perf_counter_ns() - t0)
+
+    def stop(self) -> None:
+        """Freeze the wall clock of the profile (and stop allocation tracing)."""
+        if self._stop_ns is None:
+            self._stop_ns = perf_counter_ns()
+            if self._alloc is not None:
+                self._alloc.stop()
+
+    @property
+    def wall_ns(self) -> int:
+        end = self._stop_ns if self._stop_ns is not None else perf_counter_ns()
+        return end - self._start_ns
+
+    def phases(self) -> dict[str, tuple[int, int]]:
+        """{phase: (total_ns, calls)} as recorded."""
+        return {name: (ns, self._calls[name]) for name, ns in self._ns.items()}
+
+    def to_dict(self) -> dict[str, Any]:
+        """profile.json payload: flat phase table plus the derived tree."""
+        wall_ns = self.wall_ns
+        tree = build_profile_tree(self.phases(), wall_ns)
+        tracked_ns = sum(node["_ns"] for node in tree)
+        return {
+            "version": PROFILE_VERSION,
+            "meta": self.meta,
+            "wall_seconds": round(wall_ns / 1e9, 6),
+            "untracked_seconds": round(max(wall_ns - tracked_ns, 0) / 1e9, 6),
+            "phases": {
+                name: {
+                    "seconds": round(ns / 1e9, 6),
+                    "calls": calls,
+                    "mean_us": round(ns / calls / 1e3, 3),
+                }
+                for name, (ns, calls) in sorted(self.phases().items())
+            },
+            "tree": [_strip_ns(node) for node in tree],
+            **({"alloc": self._alloc.to_dict(self._calls)} if self._alloc is not None else {}),
+        }
+
+
+@contextmanager
+def profiling(enabled: bool = True, alloc: bool = False, **meta: Any) -> Iterator[PhaseProfiler | None]:
+    """
+    Install a fresh PhaseProfiler for the duration of the block.
+
+    Yields None (and installs nothing) when enabled is False. alloc=True
+    adds tracemalloc / GC accounting (see module docstring). The previous
+    profiler, if any, is restored on exit.
+    """
+    global _active
+    if not enabled:
+        yield None
+        return
+    previous = _active
+    profiler = PhaseProfiler(alloc=alloc, **meta)
+    _active = profiler
+    try:
+        yield profiler
+    finally:
+        profiler.stop()
+        _active = previous
+
+
+def profile_span(phase: str) -> ContextManager[None]:
+    """Span on the active profiler, or a no-op context when profiling is off."""
+    profiler = _active
+    if profiler is None:
+        return nullcontext()
+    return profiler.span(phase)
+
+
+# =============================================================================
+# Tree and summary
+# =============================================================================
+
+
+def build_profile_tree(
+    phases: dict[str, tuple[int, int]],
+    wall_ns: int,
+) -> list[dict[str, Any]]:
+    """
+    Nest dotted phase paths into a tree sorted by time (descending).
+
+    Nodes carry "seconds" (recorded total, else the sum of the children),
+    "self_seconds" (recorded total minus children; None when not recorded),
+    "pct" of wall time and "calls". "_ns" is kept for callers and removed
+    from the serialized form.
+    """
+    root: dict[str, Any] = {"children": {}}
+    for path in phases:
+        node = root
+        parts = path.split(".")
+        for i, part in enumerate(parts):
+            node = node["children"].setdefault(
+                part, {"name": part, "path": ".".join(parts[: i + 1]), "children": {}}
+            )
+
+    def _finish(node: dict[str, Any]) -> dict[str, Any]:
+        children = [_finish(child) for child in node["children"].values()]
+        children.sort(key=lambda c: -c["_ns"])
+        child_ns = sum(c["_ns"] for c in children)
+        recorded = phases.get(node["path"])
+        total_ns = recorded[0] if recorded is not None else child_ns
+        return {
+            "name": node["name"],
+            "path": node["path"],
+            "_ns": total_ns,
+            "seconds": round(total_ns / 1e9, 6),
+            "self_seconds": round(max(total_ns - child_ns, 0) / 1e9, 6) if recorded is not None else None,
+            "pct": round(total_ns / wall_ns * 100.0, 2) if wall_ns > 0 else 0.0,
+            "calls": recorded[1] if recorded is not None else None,
+            "children": children,
+        }
+
+    nodes = [_finish(child) for child in root["children"].values()]
+    nodes.sort(key=lambda n: -n["_ns"])
+    return nodes
+
+
+def _strip_ns(node: dict[str, Any]) -> dict[str, Any]:
+    out = {k: v for k, v in node.items() if k not in ("_ns", "children")}
+    out["children"] = [_strip_ns(child) for child in node["children"]]
+    return out
+
+
+def format_profile_summary(
+    profile: dict[str, Any],
+    min_pct: float = 0.5,
+    max_depth: int | None = None,
+    bar_width: int = 20,
+) -> list[str]:
+    """
+    Flame-style text summary of a profile dict (PhaseProfiler.to_dict() or
+    a loaded profile.json): one indented row per phase with a bar scaled to
+    wall time, total seconds, % of wall, call count and mean per call.
+
+    Args:
+        profile: Profile payload
+        min_pct: Hide phases below this share of wall time
+        max_depth: Hide phases nested deeper than this (None: all)
+        bar_width: Characters for a 100% bar
+
+    Returns:
+        Lines without trailing newlines
+    """
+    wall = profile.get("wall_seconds", 0.0)
+    lines = [
+        f"{'Phase':<40} {'':<{bar_width}} {'Seconds':>9} {'% wall':>7} {'Calls':>9} {'Mean us':>11}"
+    ]
+
+    def _row(label: str, seconds: float, pct: float, calls: int | None) -> str:
+        filled = int(round(pct / 100.0 * bar_width))
+        bar = "#" * min(filled, bar_width)
+        mean_us = seconds / calls * 1e6 if calls else None
+        mean = "-" if mean_us is None else f"{mean_us:,.1f}" if mean_us < 1000 else f"{mean_us:,.0f}"
+        calls_str = f"{calls:,}" if calls else "-"
+        return f"{label:<40.40} {bar:<{bar_width}} {seconds:>9.3f} {pct:>6.1f}% {calls_str:>9} {mean:>11}"
+
+    def _walk(node: dict[str, Any], depth: int) -> None:
+        if node["pct"] < min_pct:
+            return
+        lines.append(_row("  " * depth + node["name"], node["seconds"], node["pct"], node["calls"]))
+        if max_depth is not None and depth + 1 >= max_depth:
+            return
+        for child in node["children"]:
+            _walk(child, depth + 1)
+
+    for node in profile.get("tree", []):
+        _walk(node, 0)
+
+    untracked = profile.get("untracked_seconds", 0.0)
+    if wall > 0:
+        lines.append(_row("(untracked)", untracked, untracked / wall * 100.0, None))
+        lines.append(_row("wall", wall, 100.0, None))
+    return lines
+
+
+def format_alloc_summary(profile: dict[str, Any], top: int = 20) -> list[str]:
+    """
+    Text summary of the "alloc" section of a profile (empty if absent):
+    phases by churn, GC per generation and retained memory per component.
+    """
+    alloc = profile.get("alloc")
+    if not alloc:
+        return []
+    calls = {name: row["calls"] for name, row in profile.get("phases", {}).items()}
+
+    def _kib(n: float) -> str:
+        return f"{n / 1024:,.1f}"
+
+    lines = [f"{'Phase':<40} {'Churn KiB':>12} {'Net KiB':>10} {'Peak KiB':>10} {'Calls':>9} {'B/call':>9}"]
+    rows = sorted(alloc["phases"].items(), key=lambda kv: -kv[1]["churn_bytes"])
+    for name, row in rows[:top]:
+        n = calls.get(name, 0)
+        lines.append(
+            f"{name:<40.40} {_kib(row['churn_bytes']):>12} {_kib(row['net_bytes']):>10} "
+            f"{_kib(row['peak_bytes']):>10} {n:>9,} {row['churn_per_call']:>9,.0f}"
+        )
+    lines.append(f"traced peak: {_kib(alloc['traced_peak_bytes'])} KiB")
+    gc_parts = [
+        f"{gen} {row['collections']:,}x / {row['pause_seconds'] * 1e3:,.1f}ms"
+        for gen, row in alloc["gc"].items()
+    ]
+    lines.append("gc: " + ", ".join(gc_parts))
+    if alloc.get("retained_by_component"):
+        lines.append(f"{'Retained by component':<60} {'KiB':>10} {'Blocks':>9}")
+        for row in alloc["retained_by_component"]:
+            lines.append(
+                f"{row['component'][-60:]:<60} {_kib(row['retained_bytes']):>10} {row['retained_blocks']:>9,}"
+            )
+    return lines
+
+
+def write_profile(profiler: PhaseProfiler, path: Path | str) -> Path:
+    """Write profiler.to_dict() as indented JSON, creating parent dirs."""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(profiler.to_dict(), indent=2, default=str), encoding="utf-8")
+    return path
+
+
+def load_profile(path: Path | str) -> dict[str, Any]:
+    """Read a stored profile.json."""
+    path = Path(path)
+    if not path.exists():
+        raise ValueError(f"Profile not found: {path}")
+    data = json.loads(path.read_text(encoding="utf-8"))
+    if "tree" not in data:
+        raise ValueError(f"Not a profile (no 'tree'): {path}")
+    return data
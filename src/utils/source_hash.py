@@ -0,0 +1,251 @@
+"""
+Source-code fingerprints for caches keyed by "the code that produced this".
+
+Builds a static import graph over ``src/`` (AST scan, so lazy imports inside
+functions count) and hashes the transitive closure of a set of entry modules.
+Used by incremental validation (src/cli/validate_cache.py) and the backtest
+run-result cache (src/backtest/artifacts/result_cache.py).
+
+File hashes are memoized per process on (mtime_ns, size).
+persisted_source_version() adds an on-disk memo so a cold process can
+confirm an unchanged closure with stat calls instead of re-parsing it.
+"""
+
+from __future__ import annotations
+
+import ast
+import functools
+import hashlib
+import json
+import os
+import threading
+from collections.abc import Iterable
+from pathlib import Path
+
+from src.config.constants import PROJECT_ROOT
+from src.utils.helpers import atomic_write_text
+
+
+# ── Import graph ─────────────────────────────────────────────────────
+
+@functools.lru_cache(maxsize=None)
+def _module_file(module: str) -> Path | None:
+    """Resolve a dotted ``src.*`` module name to its file, or None (memoized)."""
+    parts = module.split(".")
+    if parts[0] != "src":
+        return None
+    base = PROJECT_ROOT.joinpath(*parts)
+    if base.with_suffix(".py").is_file():
+        return base.with_suffix(".py")
+    if (base / "__init__.py").is_file():
+        return base / "__init__.py"
+    return None
+
+
+def _file_module(path: Path) -> str:
+    """Dotted module name of a file under PROJECT_ROOT."""
+    rel = path.relative_to(PROJECT_ROOT).with_suffix("")
+    parts = list(rel.parts)
+    if parts[-1] == "__init__":
+        parts.pop()
+    return ".".join(parts)
+
+
+# Statement-list fields: imports are statements, so only these are walked
+_BODY_FIELDS = ("body", "orelse", "finalbody", "handlers", "cases")
+
+
+def _import_nodes(tree: ast.Module) -> list[ast.Import | ast.ImportFrom]:
+    """Every import statement in a module, including function and class bodies."""
+    found: list[ast.Import | ast.ImportFrom] = []
+    stack: list[ast.AST] = list(tree.body)
+    while stack:
+        node = stack.pop()
+        if isinstance(node, (ast.Import, ast.ImportFrom)):
+            found.append(node)
+            continue
+        for name in _BODY_FIELDS:
+            children = getattr(node, name, None)
+            if children:
+                stack.extend(children)
+    return found
+
+
+def _imported_modules(path: Path) -> set[str]:
+    """All ``src.*`` modules imported anywhere in a file (including function bodies)."""
+    try:
+        tree = ast.parse(path.read_text(encoding="utf-8"), filename=str(path))
+    except (OSError, SyntaxError, UnicodeDecodeError):
+        return set()
+
+    module = _file_module(path)
+    package = module if path.name == "__init__.py" else module.rpartition(".")[0]
+    found: set[str] = set()
+
+    for node in _import_nodes(tree):
+        if isinstance(node, ast.Import):
+            found.update(alias.name for alias in node.names)
+        elif isinstance(node, ast.ImportFrom):
+            if node.level:
+                anchor = package.split(".")
+                anchor = anchor[: len(anchor) - (node.level - 1)]
+                base = ".".join(anchor + ([node.module] if node.module else []))
+            else:
+                base = node.module or ""
+            found.add(base)
+            # "from pkg import submodule" imports the submodule too
+            found.update(f"{base}.{alias.name}" for alias in node.names)
+
+    return {name for name in found if name == "src" or name.startswith("src.")}
+
+
+class _SourceGraph:
+    """Lazily built import graph over src/, memoized per process."""
+
+    def __init__(self) -> None:
+        self._edges: dict[Path, set[Path]] = {}
+        self._lock = threading.Lock()
+
+    def _deps(self, path: Path) -> set[Path]:
+        if path not in self._edges:
+            deps: set[Path] = set()
+            for name in _imported_modules(path):
+                parts = name.split(".")
+                # Importing a.b.c executes a/__init__ and a/b/__init__ first
+                for i in range(1, len(parts) + 1):
+                    dep = _module_file(".".join(parts[:i]))
+                    if dep is not None:
+                        deps.add(dep)
+            self._edges[path] = deps
+        return self._edges[path]
+
+    def closure(self, modules: Iterable[str]) -> list[Path]:
+        """Files of the given modules plus everything they (transitively) import."""
+        with self._lock:
+            pending: list[Path] = []
+            for name in modules:
+                parts = name.split(".")
+                for i in range(1, len(parts) + 1):
+                    path = _module_file(".".join(parts[:i]))
+                    if path is not None:
+                        pending.append(path)
+            seen: set[Path] = set()
+            while pending:
+                path = pending.pop()
+                if path in seen:
+                    continue
+                seen.add(path)
+                pending.extend(self._deps(path) - seen)
+            return sorted(seen)
+
+
+_SOURCE_GRAPH = _SourceGraph()
+
+
+def source_closure(modules: Iterable[str]) -> list[Path]:
+    """Sorted source files of ``modules`` and their transitive ``src.*`` imports."""
+    return _SOURCE_GRAPH.closure(modules)
+
+
+# ── Hashing ──────────────────────────────────────────────────────────
+
+_file_hashes: dict[Path, tuple[int, int, str]] = {}
+_file_hash_lock = threading.Lock()
+
+
+def hash_file(path: Path) -> str:
+    """sha256 of a file's bytes, memoized on (mtime_ns, size). "missing" if unreadable."""
+    try:
+        stat = path.stat()
+    except OSError:
+        return "missing"
+    with _file_hash_lock:
+        cached = _file_hashes.get(path)
+        if cached is not None and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+            return cached[2]
+    digest = hashlib.sha256(path.read_bytes()).hexdigest()
+    with _file_hash_lock:
+        _file_hashes[path] = (stat.st_mtime_ns, stat.st_size, digest)
+    return digest
+
+
+def source_hashes(modules: Iterable[str]) -> dict[str, str]:
+    """Project-relative path -> sha256 for the import closure of ``modules``."""
+    return {
+        str(p.relative_to(PROJECT_ROOT)): hash_file(p)
+        for p in source_closure(modules)
+    }
+
+
+def source_version(modules: Iterable[str]) -> str:
+    """Single sha256 over the import closure of ``modules`` (paths + contents)."""
+    digest = hashlib.sha256()
+    for rel, file_hash in source_hashes(modules).items():
+        digest.update(rel.encode("utf-8"))
+        digest.update(file_hash.encode("ascii"))
+    return digest.hexdigest()
+
+
+# ── Persisted version memo ───────────────────────────────────────────
+
+
+def _closure_stats(files: Iterable[Path]) -> dict[str, list[int]]:
+    """(mtime_ns, size) per closure file and per directory holding one.
+
+    Directory entries catch files created next to the closure (a module an
+    existing import could now resolve to) without re-parsing anything.
+    """
+    paths = set(files)
+    paths.update(p.parent for p in list(paths))
+    stats: dict[str, list[int]] = {}
+    for path in sorted(paths):
+        try:
+            st = path.stat()
+        except OSError:
+            continue
+        stats[str(path.relative_to(PROJECT_ROOT))] = [st.st_mtime_ns, st.st_size]
+    return stats
+
+
+def _memo_hit(memo: dict, modules: list[str]) -> str | None:
+    """The memoized version if every recorded path still has the same (mtime_ns, size)."""
+    if memo.get("modules") != modules:
+        return None
+    for rel, (mtime_ns, size) in memo.get("stats", {}).items():
+        try:
+            st = os.stat(PROJECT_ROOT / rel)
+        except OSError:
+            return None
+        if st.st_mtime_ns != mtime_ns or st.st_size != size:
+            return None
+    version = memo.get("version")
+    return version if isinstance(version, str) else None
+
+
+def persisted_source_version(modules: Iterable[str], memo_path: Path) -> str:
+    """
+    source_version() backed by a JSON memo at ``memo_path``.
+
+    The memo records the version plus (mtime_ns, size) of every closure file
+    and its directory. When none changed, the version is returned after one
+    stat per path; otherwise the closure is rebuilt, hashed and the memo
+    rewritten. Memo read/write failures fall back to the full computation.
+    """
+    names = sorted(modules)
+    try:
+        memo = json.loads(memo_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        memo = {}
+    if isinstance(memo, dict):
+        version = _memo_hit(memo, names)
+        if version is not None:
+            return version
+
+    files = source_closure(names)
+    stats = _closure_stats(files)
+    version = source_version(names)
+    try:
+        atomic_write_text(memo_path, json.dumps({"modules": names, "version": version, "stats": stats}))
+    except OSError:
+        pass
+    return version
@@ -9,6 +9,7 @@ Usage:
   python trade_cli.py validate quick|standard|full|pre-live|exchange
   python trade_cli.py backtest run --play X
   python trade_cli.py debug math-parity|snapshot-plumbing|determinism|metrics
+  python trade_cli.py bench [--quick] [--save-baseline]
   python trade_cli.py play run --play X --mode live --confirm
 
 Verbosity:
@@ -44,10 +45,18 @@ from src.cli.subcommands import (
     handle_backtest_list,
     handle_backtest_normalize,
     handle_backtest_normalize_batch,
+    handle_backtest_robustness,
+    handle_backtest_portfolio,
     handle_debug_math_parity,
     handle_debug_snapshot_plumbing,
+    handle_debug_rule_compiler,
+    handle_debug_alignment,
+    handle_debug_prearm_replay,
+    handle_debug_checkpoint_restore,
+    handle_debug_streaming_parity,
     handle_debug_determinism,
     handle_debug_metrics,
+    handle_bench,
     handle_play_run,
     handle_play_status,
     handle_play_stop,
@@ -84,6 +93,8 @@ from src.cli.subcommands import (
     handle_data_summary,
     handle_data_query,
     handle_data_heal,
+    handle_data_audit_derived,
+    handle_data_serve,
     handle_data_vacuum,
     handle_data_delete,
     handle_market_price,
@@ -140,8 +151,12 @@ def main():
             sys.exit(handle_backtest_normalize(args))
         elif args.backtest_command == "play-normalize-batch":
             sys.exit(handle_backtest_normalize_batch(args))
+        elif args.backtest_command == "robustness":
+            sys.exit(handle_backtest_robustness(args))
+        elif args.backtest_command == "portfolio":
+            sys.exit(handle_backtest_portfolio(args))
         else:
-            console.print("[yellow]Usage: trade_cli.py backtest {run|preflight|indicators|data-fix|list|play-normalize|play-normalize-batch} --help[/]")
+            console.print("[yellow]Usage: trade_cli.py backtest {run|preflight|indicators|data-fix|list|play-normalize|play-normalize-batch|robustness|portfolio} --help[/]")
             sys.exit(1)
 
     # ===== DEBUG =====
@@ -150,12 +165,22 @@ def main():
             sys.exit(handle_debug_math_parity(args))
         elif args.debug_command == "snapshot-plumbing":
             sys.exit(handle_debug_snapshot_plumbing(args))
+        elif args.debug_command == "rule-compiler":
+            sys.exit(handle_debug_rule_compiler(args))
+        elif args.debug_command == "alignment":
+            sys.exit(handle_debug_alignment(args))
+        elif args.debug_command == "prearm-replay":
+            sys.exit(handle_debug_prearm_replay(args))
+        elif args.debug_command == "checkpoint-restore":
+            sys.exit(handle_debug_checkpoint_restore(args))
+        elif args.debug_command == "streaming-parity":
+            sys.exit(handle_debug_streaming_parity(args))
         elif args.debug_command == "determinism":
             sys.exit(handle_debug_determinism(args))
         elif args.debug_command == "metrics":
             sys.exit(handle_debug_metrics(args))
         else:
-            console.print("[yellow]Usage: trade_cli.py debug {math-parity|snapshot-plumbing|determinism|metrics} --help[/]")
+            console.print("[yellow]Usage: trade_cli.py debug {math-parity|snapshot-plumbing|rule-compiler|alignment|prearm-replay|checkpoint-restore|streaming-parity|determinism|metrics} --help[/]")
             sys.exit(1)
 
     # ===== PLAY =====
@@ -196,8 +221,13 @@ def main():
             play_timeout=getattr(args, "timeout", 120),
             gate_timeout=getattr(args, "gate_timeout", 300),
             confirm=getattr(args, "confirm", False),
+            incremental=getattr(args, "incremental", False),
         ))
 
+    # ===== BENCH =====
+    elif args.command == "bench":
+        sys.exit(handle_bench(args))
+
     # ===== SHADOW =====
     elif args.command == "shadow":
         from src.cli.subcommands.shadow import handle_shadow
@@ -274,6 +304,10 @@ def main():
             sys.exit(handle_data_query(args))
         elif args.data_command == "heal":
             sys.exit(handle_data_heal(args))
+        elif args.data_command == "audit-derived":
+            sys.exit(handle_data_audit_derived(args))
+        elif args.data_command == "serve":
+            sys.exit(handle_data_serve(args))
         elif args.data_command == "vacuum":
             sys.exit(handle_data_vacuum(args))
         elif args.data_command == "delete":